@@ -0,0 +1,199 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmark: Feste Kosten je Datei. Gemessen wird die Ver- und Entschlüsselung vieler 1-Byte-Dateien (Default 100000),
+bei denen der Durchsatz keine Rolle spielt und allein der Aufwand je Datei (Öffnen, Header, Schlüsselverwaltung,
+Diagnosen, Protokoll) zählt. Zur Einordnung werden die Debug-Diagnosen der Schlüsselverwaltung einzeln gemessen: die
+frühere Form (Prüfung auf Nullbytes per re.match(...) und Verkettung von Schlüsselmaterial für
+loggeMitLoglevelDebugWennNichtPaketiert(...) auch bei abgeschaltetem Debug-Logging) im Vergleich zur aktuellen Form
+(Loggingwerkzeuge.istDebugAktiv() bzw. Loggingwerkzeuge.loggeFallsNullbytefolge(...)).
+
+Zusätzlich wird ein Verzeichnisbaum aus ebenso vielen 1-Byte-Dateien wie im Programm über den Funktionsausfuehrer
+verschlüsselt (Statusmeldungen, Verlaufsprotokoll, Journalprüfung und Vernichtung der Originale inklusive). Erreicht
+diese Messung nicht mindestens --ziel Dateien/s (Default: C_ZIEL_DATEIEN_PRO_SEKUNDE, bezogen auf tmpfs bzw. eine SSD),
+endet der Benchmark mit Exit-Code 1. Zum Vergleich wird derselbe Baum als Archiv (LiSKrypto.QArchiv, ebenfalls mit
+Vernichtung der Originale) verschlüsselt und anschließend wieder entpackt.
+
+Das Log-Level entspricht LiSKonstanten.C_LOGGING_LEVEL (mit --debug: logging.DEBUG, Ausgabe verworfen).
+
+Aufruf: python benchmarks/bench_dateifixkosten.py [--anzahl 100000] [--verzeichnis V] [--debug] [--ziel 750]
+"""
+
+import argparse
+import logging
+import os
+import re
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from bench_ende_zu_ende import Benchmark
+
+from Modell import LiSKonstanten
+from Sonstiges import LiSWerkzeuge
+
+C_UNTERVERZEICHNISSE = 256
+C_ZIEL_DATEIEN_PRO_SEKUNDE = 750
+
+def missDiagnosen(pAnzahlInteger):
+	"""
+	Misst je Variante pAnzahlInteger Durchläufe der Diagnosen, die je verschlüsselter Datei anfallen (eine Prüfung auf
+	Nullbytes und drei Testausgaben mit Schlüsselmaterial), und gibt die Dauer je Durchlauf aus.
+	"""
+	lSchluesselBytes = os.urandom(32)
+	lSaltBytes = os.urandom(32)
+	lNonceBytes = os.urandom(12)
+
+	def lFrueher():
+		if re.match(b'\x00+', lSchluesselBytes) is not None:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'Schluessel ist Nullbytefolge!')
+		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'Schluessel:' + lSchluesselBytes)
+		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'Scrypt Salt:' + lSaltBytes)
+		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'Nonce:' + lNonceBytes)
+
+	def lAktuell():
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(lSchluesselBytes, b'Schluessel ist Nullbytefolge!')
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'Schluessel:' + lSchluesselBytes)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'Scrypt Salt:' + lSaltBytes)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'Nonce:' + lNonceBytes)
+
+	for lBezeichnungString, lFunktion in (('Diagnosen frueher', lFrueher), ('Diagnosen aktuell', lAktuell)):
+		lStartFloat = time.perf_counter()
+		for lZaehlerInteger in range(pAnzahlInteger):
+			lFunktion()
+		lSekundenFloat = time.perf_counter() - lStartFloat
+		print('{:<30} {:>9.3f} s {:>10.3f} µs/Durchlauf'.format(lBezeichnungString, lSekundenFloat, lSekundenFloat / pAnzahlInteger * 1e6), flush=True)
+
+def missDateien(pBenchmark, pAnzahlInteger):
+	"""
+	Erstellt pAnzahlInteger 1-Byte-Dateien (verteilt auf C_UNTERVERZEICHNISSE Verzeichnisse), verschlüsselt und
+	entschlüsselt sie nacheinander und gibt zusätzlich die Dauer je Datei aus.
+	"""
+	lQuelleString = os.path.join(pBenchmark.sVerzeichnisString, 'quelle')
+	lQuellpfadeList = [os.path.join(lQuelleString, 'v{:03d}'.format(lIndexInteger % C_UNTERVERZEICHNISSE), 'd{:06d}.txt'.format(lIndexInteger)) for lIndexInteger in range(pAnzahlInteger)]
+	lVerschluesseltList = [lQuellpfadString.replace('.txt', '-txt' + LiSKonstanten.C_DATEIENDUNG) for lQuellpfadString in lQuellpfadeList]
+	try:
+		for lIndexInteger in range(C_UNTERVERZEICHNISSE):
+			os.makedirs(os.path.join(lQuelleString, 'v{:03d}'.format(lIndexInteger)), exist_ok=True)
+		for lQuellpfadString in lQuellpfadeList:
+			with open(lQuellpfadString, 'wb') as lDatei:
+				lDatei.write(os.urandom(1))
+
+		def lVerschluesseleAlle():
+			for lQuellpfadString, lVerschluesseltString in zip(lQuellpfadeList, lVerschluesseltList):
+				pBenchmark.verschluessele(lQuellpfadString, lVerschluesseltString)
+
+		def lEntschluesseleAlle():
+			for lVerschluesseltString in lVerschluesseltList:
+				pBenchmark.entschluessele(lVerschluesseltString)
+
+		lSzenarioString = '{} Dateien zu 1 Byte'.format(pAnzahlInteger)
+		# Vor der Entschlüsselung werden die Originale entfernt, da sie sonst (nicht-interaktiv) nicht überschrieben würden:
+		for lOperationString, lFunktion, lVorbereitungFunktion in (('verschluesseln', lVerschluesseleAlle, lambda: pBenchmark.entferne(*lVerschluesseltList)),
+																  ('entschluesseln', lEntschluesseleAlle, lambda: pBenchmark.entferne(*lQuellpfadeList))):
+			if not pBenchmark.miss(lSzenarioString, lOperationString, lFunktion, pAnzahlInteger, pAnzahlInteger, lVorbereitungFunktion):
+				break
+			print('{:<30} {:<16} {:>9.1f} µs/Datei'.format('', '', pBenchmark.sErgebnisseList[-1]['Sekunden'] / pAnzahlInteger * 1e6), flush=True)
+	finally:
+		pBenchmark.entferne(lQuelleString)
+
+def missBaum(pBenchmark, pAnzahlInteger):
+	"""
+	Verschlüsselt einen Baum aus pAnzahlInteger 1-Byte-Dateien über Funktionsausfuehrer._verschluessle(...) mit
+	Vernichtung der Originale und returniert die erreichten Dateien pro Sekunde (bzw. 0 bei einem Fehler).
+	"""
+	lQuelleString = os.path.join(pBenchmark.sVerzeichnisString, 'baum')
+	try:
+		for lIndexInteger in range(pAnzahlInteger):
+			lVerzeichnisString = os.path.join(lQuelleString, 'v{:03d}'.format(lIndexInteger % C_UNTERVERZEICHNISSE))
+			if lIndexInteger < C_UNTERVERZEICHNISSE:
+				os.makedirs(lVerzeichnisString, exist_ok=True)
+			with open(os.path.join(lVerzeichnisString, 'd{:06d}.txt'.format(lIndexInteger)), 'wb') as lDatei:
+				lDatei.write(os.urandom(1))
+
+		pBenchmark.sVerschluesseler.sOriginaleVernichtenStatusBoolean = True
+		if not pBenchmark.miss('Baum {} Dateien'.format(pAnzahlInteger), 'verschl.+vern.',
+							   lambda: pBenchmark.sVerschluesseler._verschluessle(lQuelleString, pBenchmark.sSHA512HashwertBytes), pAnzahlInteger, pAnzahlInteger):
+			return 0
+		print('{:<30} {:<16} {:>9.1f} µs/Datei'.format('', '', pBenchmark.sErgebnisseList[-1]['Sekunden'] / pAnzahlInteger * 1e6), flush=True)
+		return pBenchmark.sErgebnisseList[-1]['DateienProSekunde']
+	finally:
+		pBenchmark.sVerschluesseler.sOriginaleVernichtenStatusBoolean = False
+		pBenchmark.entferne(lQuelleString)
+
+def missArchiv(pBenchmark, pAnzahlInteger, pBaumDateienProSekundeFloat):
+	"""
+	Verschlüsselt einen Baum aus pAnzahlInteger 1-Byte-Dateien über Funktionsausfuehrer._verschluessle(...) als Archiv mit
+	Vernichtung der Originale, entpackt das Archiv anschließend und gibt die Beschleunigung gegenüber
+	pBaumDateienProSekundeFloat (siehe missBaum(...)) aus.
+	"""
+	lQuelleString = os.path.join(pBenchmark.sVerzeichnisString, 'archiv')
+	lArchivString = lQuelleString + LiSKonstanten.C_DATEIENDUNG
+
+	def lErstelleBaum():
+		pBenchmark.entferne(lQuelleString, lArchivString)
+		for lIndexInteger in range(pAnzahlInteger):
+			lVerzeichnisString = os.path.join(lQuelleString, 'v{:03d}'.format(lIndexInteger % C_UNTERVERZEICHNISSE))
+			if lIndexInteger < C_UNTERVERZEICHNISSE:
+				os.makedirs(lVerzeichnisString, exist_ok=True)
+			with open(os.path.join(lVerzeichnisString, 'd{:06d}.txt'.format(lIndexInteger)), 'wb') as lDatei:
+				lDatei.write(os.urandom(1))
+
+	try:
+		lSzenarioString = 'Archiv {} Dateien'.format(pAnzahlInteger)
+		pBenchmark.sVerschluesseler.sOriginaleVernichtenStatusBoolean = True
+		pBenchmark.sVerschluesseler.sArchivBoolean = True
+		if not pBenchmark.miss(lSzenarioString, 'verschl.+vern.', lambda: pBenchmark.sVerschluesseler._verschluessle(lQuelleString, pBenchmark.sSHA512HashwertBytes),
+							   pAnzahlInteger, pAnzahlInteger, lErstelleBaum):
+			return
+		lDateienProSekundeFloat = pBenchmark.sErgebnisseList[-1]['DateienProSekunde']
+		print('{:<30} {:<16} {:>9.1f} µs/Datei {:>8.1f}x ggü. Baum'.format('', '', pBenchmark.sErgebnisseList[-1]['Sekunden'] / pAnzahlInteger * 1e6,
+																		  lDateienProSekundeFloat / max(pBaumDateienProSekundeFloat, 1e-9)), flush=True)
+		if pBenchmark.miss(lSzenarioString, 'entpacken', lambda: pBenchmark.sEntschluesseler._entschluessleArchiv(lArchivString, pBenchmark.sSHA512HashwertBytes),
+						   pAnzahlInteger, pAnzahlInteger, lambda: pBenchmark.entferne(lQuelleString)):
+			print('{:<30} {:<16} {:>9.1f} µs/Datei'.format('', '', pBenchmark.sErgebnisseList[-1]['Sekunden'] / pAnzahlInteger * 1e6), flush=True)
+	finally:
+		pBenchmark.sVerschluesseler.sOriginaleVernichtenStatusBoolean = False
+		pBenchmark.sVerschluesseler.sArchivBoolean = False
+		pBenchmark.entferne(lQuelleString, lArchivString)
+
+if __name__ == '__main__':
+	lParser = argparse.ArgumentParser(description='Benchmark der festen Kosten je Datei.')
+	lParser.add_argument('--anzahl', type=int, default=100000, help='Anzahl der 1-Byte-Dateien (Default: 100000)')
+	lParser.add_argument('--verzeichnis', default=None, help='Verzeichnis für Testdateien (Default: Verzeichnis für temporäre Dateien)')
+	lParser.add_argument('--debug', action='store_true', help='Log-Level DEBUG (Ausgabe verworfen) statt LiSKonstanten.C_LOGGING_LEVEL')
+	lParser.add_argument('--ziel', type=float, default=C_ZIEL_DATEIEN_PRO_SEKUNDE, help='Mindestens zu erreichende Dateien/s beim Baum (Default: {})'.format(C_ZIEL_DATEIEN_PRO_SEKUNDE))
+	lArgumente = lParser.parse_args()
+
+	logging.basicConfig(level=logging.DEBUG if lArgumente.debug else LiSKonstanten.C_LOGGING_LEVEL, handlers=[logging.NullHandler()])
+
+	missDiagnosen(lArgumente.anzahl)
+	with tempfile.TemporaryDirectory(prefix='liscrypt-benchmark-', dir=lArgumente.verzeichnis) as lVerzeichnisString:
+		lBenchmark = Benchmark(lVerzeichnisString, 1, 1024)
+		missDateien(lBenchmark, lArgumente.anzahl)
+		lDateienProSekundeFloat = missBaum(lBenchmark, lArgumente.anzahl)
+		missArchiv(lBenchmark, lArgumente.anzahl, lDateienProSekundeFloat)
+
+	if lDateienProSekundeFloat < lArgumente.ziel:
+		print('\nZiel verfehlt: {:.1f} Dateien/s < {:g} Dateien/s'.format(lDateienProSekundeFloat, lArgumente.ziel))
+		sys.exit(1)
+	print('\nZiel erreicht: {:.1f} Dateien/s >= {:g} Dateien/s'.format(lDateienProSekundeFloat, lArgumente.ziel))
@@ -0,0 +1,147 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmark: Verschlüsselung einer Datei (V4) mit streng sequentiellem Lesen, Verschlüsseln und Schreiben im Vergleich
+zur Segmentpipeline (Lese-Thread, Verarbeitungs-Threads und Schreiber überlappend, wiederverwendete Eingabepuffer) mit
+fester und mit dateigrößenabhängiger Segmentgröße (Segmentwerkzeuge.gibSegmentgroesse(...)). Zur Einordnung werden
+reiner AES-GCM-Durchsatz (ohne Datei-E/A) und reiner Kopierdurchsatz (ohne Verschlüsselung) ausgegeben; die Pipeline
+sollte sich dem kleineren der beiden Werte annähern.
+
+Aufruf: python benchmarks/bench_dateipipeline.py [Größe in MiB] [Verzeichnis] [Drosselung in MB/s]
+
+Ohne Angabe wird in /dev/shm (tmpfs) gemessen. Ein gedrosselter Datenträger kann entweder als Verzeichnis angegeben
+werden (z.B. ein per losetup eingebundenes Dateisystem, dessen Durchsatz per cgroup io.max begrenzt ist) oder - bei
+Angabe einer Drosselung - simuliert werden: Lesen und Schreiben teilen sich dann die angegebene Rate.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from Modell.LiSKrypto import Segmentwerkzeuge
+
+class Datentraeger:
+	"""
+	Simuliert einen Datenträger mit dem Durchsatz pBytesProSekundeFloat: Zugriffe werden nacheinander bedient und
+	belegen den Datenträger entsprechend ihrer Größe (die Wartezeit gibt den GIL frei wie echte E/A).
+	"""
+	def __init__(self, pBytesProSekundeFloat):
+		self.sBytesProSekundeFloat = pBytesProSekundeFloat
+		self.sFreiAbFloat = time.perf_counter()
+		self.sLock = threading.Lock()
+
+	def warte(self, pAnzahlBytesInteger):
+		with self.sLock:
+			self.sFreiAbFloat = max(self.sFreiAbFloat, time.perf_counter()) + pAnzahlBytesInteger / self.sBytesProSekundeFloat
+			lFreiAbFloat = self.sFreiAbFloat
+		time.sleep(max(0.0, lFreiAbFloat - time.perf_counter()))
+
+class GedrosselteDatei:
+	"""
+	Reicht read()/readinto()/write() an eine Datei weiter und verzögert sie gemäß pDatentraeger.
+	"""
+	def __init__(self, pDatei, pDatentraeger):
+		self.sDatei = pDatei
+		self.sDatentraeger = pDatentraeger
+
+	def _warte(self, pAnzahlBytesInteger):
+		self.sDatentraeger.warte(pAnzahlBytesInteger)
+
+	def read(self, pLaengeInteger):
+		lBytes = self.sDatei.read(pLaengeInteger)
+		self._warte(len(lBytes))
+		return lBytes
+
+	def readinto(self, pPuffer):
+		lAnzahlInteger = self.sDatei.readinto(pPuffer)
+		self._warte(lAnzahlInteger)
+		return lAnzahlInteger
+
+	def write(self, pBytes):
+		self._warte(len(pBytes))
+		return self.sDatei.write(pBytes)
+
+def oeffne(pPfadString, pModusString, pDatentraeger):
+	lDatei = open(pPfadString, pModusString)
+	return lDatei, (GedrosselteDatei(lDatei, pDatentraeger) if pDatentraeger is not None else lDatei)
+
+def verschluesseleSequentiell(pQuellpfadString, pZielpfadString, pSchluesselBytes, pNonceBytes, pSegmentgroesseInteger, pDatentraeger):
+	"""
+	Bisheriges Verfahren bei einem Prozessorkern: Lesen, Verschlüsseln und Schreiben nacheinander in einem Thread.
+	"""
+	lOriginalgroesseInteger = os.path.getsize(pQuellpfadString)
+	lAnzahlInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(lOriginalgroesseInteger, pSegmentgroesseInteger)
+	lQuelldatei, lQuelle = oeffne(pQuellpfadString, 'rb', pDatentraeger)
+	lZieldatei, lZiel = oeffne(pZielpfadString, 'wb', pDatentraeger)
+	with lQuelldatei, lZieldatei:
+		for lSegmentIndexInteger in range(1, lAnzahlInteger + 1):
+			lZiel.write(Segmentwerkzeuge.verschluesseleSegment(pSchluesselBytes, pNonceBytes, lSegmentIndexInteger, lSegmentIndexInteger == lAnzahlInteger, b'',
+															   lQuelle.read(pSegmentgroesseInteger)))
+
+def verschluessele(pQuellpfadString, pZielpfadString, pSchluesselBytes, pNonceBytes, pSegmentgroesseInteger, pDatentraeger):
+	lOriginalgroesseInteger = os.path.getsize(pQuellpfadString)
+	lQuelldatei, lQuelle = oeffne(pQuellpfadString, 'rb', pDatentraeger)
+	lZieldatei, lZiel = oeffne(pZielpfadString, 'wb', pDatentraeger)
+	with lQuelldatei, lZieldatei:
+		Segmentwerkzeuge.verschluesseleDatensegmente(lQuelle, lZiel, pSchluesselBytes, pNonceBytes, b'', lOriginalgroesseInteger, pSegmentgroesseInteger, lambda: True)
+
+def kopiere(pQuellpfadString, pZielpfadString, pDatentraeger):
+	lQuelldatei, lQuelle = oeffne(pQuellpfadString, 'rb', pDatentraeger)
+	lZieldatei, lZiel = oeffne(pZielpfadString, 'wb', pDatentraeger)
+	with lQuelldatei, lZieldatei:
+		for lBlock in iter(lambda: lQuelle.read(1024 * 1024), b''):
+			lZiel.write(lBlock)
+
+def verschluesseleImSpeicher(pSchluesselBytes, pNonceBytes, pGroesseInteger):
+	lBlockBytes = bytes(1024 * 1024)
+	for lSegmentIndexInteger in range(1, -(-pGroesseInteger // len(lBlockBytes)) + 1):
+		Segmentwerkzeuge.verschluesseleSegment(pSchluesselBytes, pNonceBytes, lSegmentIndexInteger, False, b'', lBlockBytes)
+
+def miss(pBezeichnungString, pFunktion, pGroesseInteger):
+	lStartFloat = time.perf_counter()
+	pFunktion()
+	lDauerFloat = time.perf_counter() - lStartFloat
+	print('{:<36} {:>10.1f} MB/s'.format(pBezeichnungString, pGroesseInteger / lDauerFloat / 1e6))
+
+if __name__ == '__main__':
+	lGroesseInteger = int(sys.argv[1] if len(sys.argv) > 1 else 256) * 1024 * 1024
+	lBasisverzeichnisString = sys.argv[2] if len(sys.argv) > 2 else ('/dev/shm' if os.path.isdir('/dev/shm') else None)
+	lDrosselungFloat = float(sys.argv[3]) if len(sys.argv) > 3 else None
+	lDatentraeger = Datentraeger(lDrosselungFloat * 1e6) if lDrosselungFloat else None
+	lSchluesselBytes = os.urandom(32)
+	lNonceBytes = os.urandom(12)
+	lAdaptiveSegmentgroesseInteger = Segmentwerkzeuge.gibSegmentgroesse(lGroesseInteger)
+	print('Verzeichnis: {}, Drosselung: {}'.format(lBasisverzeichnisString or tempfile.gettempdir(), '{} MB/s'.format(lDrosselungFloat) if lDrosselungFloat else 'keine'))
+	with tempfile.TemporaryDirectory(dir=lBasisverzeichnisString) as lVerzeichnisString:
+		lQuellpfadString = os.path.join(lVerzeichnisString, 'quelle.bin')
+		lZielpfadString = os.path.join(lVerzeichnisString, 'ziel.bin')
+		with open(lQuellpfadString, 'wb') as lQuelldatei:
+			for lZaehlerInteger in range(lGroesseInteger // (16 * 1024 * 1024)):
+				lQuelldatei.write(os.urandom(16 * 1024 * 1024))
+			lQuelldatei.write(os.urandom(lGroesseInteger % (16 * 1024 * 1024)))
+		miss('AES-GCM ohne Datei-E/A', lambda: verschluesseleImSpeicher(lSchluesselBytes, lNonceBytes, lGroesseInteger), lGroesseInteger)
+		miss('Kopieren ohne Verschlüsselung', lambda: kopiere(lQuellpfadString, lZielpfadString, lDatentraeger), lGroesseInteger)
+		miss('Sequentiell (1024 KiB)', lambda: verschluesseleSequentiell(lQuellpfadString, lZielpfadString, lSchluesselBytes, lNonceBytes, 1024 * 1024, lDatentraeger), lGroesseInteger)
+		miss('Pipeline (1024 KiB)', lambda: verschluessele(lQuellpfadString, lZielpfadString, lSchluesselBytes, lNonceBytes, 1024 * 1024, lDatentraeger), lGroesseInteger)
+		miss('Pipeline ({} KiB, adaptiv)'.format(lAdaptiveSegmentgroesseInteger // 1024),
+			 lambda: verschluessele(lQuellpfadString, lZielpfadString, lSchluesselBytes, lNonceBytes, lAdaptiveSegmentgroesseInteger, lDatentraeger), lGroesseInteger)
@@ -0,0 +1,513 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmark: Ende-zu-Ende-Messung von Verschlüsselung (LiSKrypto.QDatei.verschluesseln), Entschlüsselung
+(LiSKrypto.QDatei.entschluesseln) und Vernichtung (LiSVernichtung.QVerzeichniseintrag.vernichten). Anstelle von
+QControllerWorkerThread wird ein Funktionsausfuehrer ohne GUI (Stellvertreter) übergeben, der das Verlaufsprotokoll
+sammelt; die Schlüsselableitung erfolgt vor der Messung.
+
+Szenarien:
+- groessen: Einzeldateien von 1 KiB bis 1 GiB (mit --voll zusätzlich 10 GiB und eine dünn besetzte Datei knapp
+  oberhalb von LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIGROESSE, sofern genügend Speicherplatz frei ist)
+- baeume: Verzeichnisbaum mit vielen kleinen Dateien sowie eine tiefe Verzeichniskette (eine Datei je Ebene)
+- verfahren: Entschlüsselung je Verfahren des Altbestands (AES-GCM V1-V3, ChaCha20 V1-V3_1) im Vergleich zu V4. Die
+  Testdateien werden im jeweiligen Format erzeugt; der Scrypt-Aufwandsfaktor im Header ist reduziert (--scrypt-n),
+  da die Schlüsselableitung dieser Verfahren bei jeder Entschlüsselung in die Messung eingeht.
+
+Je Messung werden Dauer, Prozessorzeit, Durchsatz, Lese- und Schreib-Systemaufrufe sowie tatsächlich vom Datenträger
+gelesene und auf ihn geschriebene Bytes (/proc/self/io) und der Spitzenwert des residenten Speichers (VmHWM nach
+Zurücksetzen über /proc/self/clear_refs, ersatzweise ru_maxrss ohne Zurücksetzen) erfasst. Die Ergebnisse werden als
+JSON geschrieben (--ausgabe). Mit --vergleich wird gegen eine frühere Ergebnisdatei verglichen: Verlängert sich eine
+Dauer oder steigen Systemaufrufe bzw. Speicherbedarf um mehr als --toleranz, oder schlägt eine zuvor erfolgreiche
+Messung fehl, endet der Benchmark mit Exit-Code 1.
+
+Aufruf: python benchmarks/bench_ende_zu_ende.py [--szenarien groessen,baeume,verfahren] [--voll] [--verzeichnis V]
+		[--ausgabe ergebnis.json] [--vergleich basis.json] [--toleranz 0.25] [--wiederholungen N] [--scrypt-n N]
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import os
+import platform
+import resource
+import shutil
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from Modell import LiSBlockgroesse, LiSKonstanten, LiSKrypto, LiSVernichtung
+from Steuerung import LiSFunktionsausfuehrung
+
+from cryptography.hazmat.backends import default_backend
+from cryptography.hazmat.primitives import hashes, hmac
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+C_KIB = 1024
+C_MIB = 1024 * 1024
+C_GIB = 1024 * 1024 * 1024
+
+C_PASSWORT_BYTES = b'Benchmark-Passwort'
+
+C_ALTVERFAHREN_DICTIONARY = {'AES-GCM V1': LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V1,
+							 'AES-GCM V2': LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V2,
+							 'AES-GCM V3': LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V3,
+							 'ChaCha20 V1': LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V1,
+							 'ChaCha20 V2': LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V2,
+							 'ChaCha20 V3': LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3,
+							 'ChaCha20 V3_1': LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3_1}
+
+# Absolute Zuschläge, unterhalb derer Abweichungen beim Vergleich nicht als Regression gelten (Messrauschen):
+C_ZUSCHLAG_SEKUNDEN = 0.05
+C_ZUSCHLAG_SYSCALLS = 64
+C_ZUSCHLAG_RSS_BYTES = 16 * C_MIB
+
+class Stellvertreter(LiSFunktionsausfuehrung.Funktionsausfuehrer):
+	"""
+	Funktionsausfuehrer ohne GUI, der an Stelle von QControllerWorkerThread an QDatei- und QVerzeichniseintrag-Instanzen
+	übergeben wird. Die Programmfunktion ist dauerhaft aktiv, Rückfragen werden nicht-interaktiv beantwortet und das
+	Verlaufsprotokoll wird gesammelt (Fehlermeldungen führen zum Abbruch der Messung).
+	"""
+	def __init__(self):
+		super().__init__([], LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL, False, LiSKonstanten.C_SCHLUESSELART_PASSWORT_LITERAL, None)
+		self.sFunktionsprozessAktivBoolean = True
+		self.sBerichtList = []
+
+	def ergaenzeBerichtAusgabe(self, pZeileString, pToolTipString=None):
+		self.sBerichtList.append(pZeileString)
+
+class Ressourcenmessung:
+	"""
+	Misst Dauer, Prozessorzeit, Systemaufrufe, Datenträgerzugriffe und Spitzenwert des residenten Speichers zwischen
+	starte() und beende() für den gesamten Prozess (inkl. Pipeline-Threads).
+	"""
+	def __init__(self):
+		self.sIOStartDictionary = None
+		self.sStartFloat = None
+		self.sCPUStartFloat = None
+
+	@staticmethod
+	def _liesIO():
+		try:
+			with open('/proc/self/io') as lDatei:
+				return {lZeileString.split(':')[0]: int(lZeileString.split(':')[1]) for lZeileString in lDatei if ':' in lZeileString}
+		except OSError:
+			return dict()
+
+	@staticmethod
+	def _setzeSpitzenwertZurueck():
+		try:
+			with open('/proc/self/clear_refs', 'w') as lDatei:
+				lDatei.write('5')
+		except OSError:
+			pass
+
+	@staticmethod
+	def _liesSpitzenwert():
+		try:
+			with open('/proc/self/status') as lDatei:
+				for lZeileString in lDatei:
+					if lZeileString.startswith('VmHWM:'):
+						return int(lZeileString.split()[1]) * 1024
+		except OSError:
+			pass
+		return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+
+	def starte(self):
+		self._setzeSpitzenwertZurueck()
+		self.sIOStartDictionary = self._liesIO()
+		lTimes = os.times()
+		self.sCPUStartFloat = lTimes.user + lTimes.system
+		self.sStartFloat = time.perf_counter()
+
+	def beende(self):
+		lSekundenFloat = time.perf_counter() - self.sStartFloat
+		lTimes = os.times()
+		lIOEndeDictionary = self._liesIO()
+		lErgebnisDictionary = {'Sekunden': lSekundenFloat,
+							   'CPUSekunden': lTimes.user + lTimes.system - self.sCPUStartFloat,
+							   'SpitzenRSSBytes': self._liesSpitzenwert()}
+		for lSchluesselString, lNameString in (('syscr', 'LeseSyscalls'), ('syscw', 'SchreibSyscalls'),
+											   ('read_bytes', 'DatentraegerGelesenBytes'), ('write_bytes', 'DatentraegerGeschriebenBytes')):
+			if lSchluesselString in lIOEndeDictionary and lSchluesselString in self.sIOStartDictionary:
+				lErgebnisDictionary[lNameString] = lIOEndeDictionary[lSchluesselString] - self.sIOStartDictionary[lSchluesselString]
+		return lErgebnisDictionary
+
+class Benchmark:
+	"""
+	Führt die Szenarien aus und sammelt die Messergebnisse.
+	"""
+	def __init__(self, pVerzeichnisString, pWiederholungenInteger, pScryptAufwandsfaktorInteger):
+		self.sVerzeichnisString = pVerzeichnisString
+		self.sWiederholungenInteger = max(1, pWiederholungenInteger)
+		self.sScryptAufwandsfaktorInteger = pScryptAufwandsfaktorInteger
+		self.sSHA256HashwertBytes = hashlib.sha256(C_PASSWORT_BYTES).digest()
+		self.sSHA512HashwertBytes = hashlib.sha512(C_PASSWORT_BYTES).digest()
+		self.sErgebnisseList = []
+
+		# Masterschlüssel einmalig vorab ableiten (Verschlüsselung und Entschlüsselung mit getrennten Stellvertretern,
+		# da ein aus einer vorhandenen Datei abgeleiteter Masterschlüssel nicht für neue Verschlüsselungen verwendet wird):
+		self.sVerschluesseler = Stellvertreter()
+		lSchluesselDictionary = self.sVerschluesseler.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=self.sSHA512HashwertBytes)
+		self.sEntschluesseler = Stellvertreter()
+		self.sEntschluesseler.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=self.sSHA512HashwertBytes, pInitialesScryptSaltBytes=lSchluesselDictionary['InitialesScryptSalt'])
+		LiSBlockgroesse.Blockgroessenrichtlinie.gibBlockgroesse(self.sVerzeichnisString)
+
+	## --- Messung
+
+	def miss(self, pSzenarioString, pOperationString, pFunktion, pBytesInteger, pDateienInteger, pVorbereitungFunktion=None):
+		"""
+		Führt pFunktion sWiederholungenInteger-mal aus (jeweils nach pVorbereitungFunktion, die nicht gemessen wird) und
+		vermerkt den schnellsten Durchlauf. Exceptions werden als Fehler der Messung vermerkt.
+		"""
+		lBesteMessungDictionary = None
+		lFehlerString = None
+		for lZaehlerInteger in range(self.sWiederholungenInteger):
+			try:
+				if pVorbereitungFunktion is not None:
+					pVorbereitungFunktion()
+				lMessung = Ressourcenmessung()
+				lMessung.starte()
+				pFunktion()
+				lMessungDictionary = lMessung.beende()
+			except Exception as lException:
+				lFehlerString = '{}: {}'.format(type(lException).__name__, lException)
+				if lException.__cause__ is not None:
+					lFehlerString += ' ({}: {})'.format(type(lException.__cause__).__name__, lException.__cause__)
+				break
+			if lBesteMessungDictionary is None or lMessungDictionary['Sekunden'] < lBesteMessungDictionary['Sekunden']:
+				lBesteMessungDictionary = lMessungDictionary
+
+		lErgebnisDictionary = {'Szenario': pSzenarioString, 'Operation': pOperationString, 'Bytes': pBytesInteger, 'Dateien': pDateienInteger}
+		if lFehlerString is None:
+			lErgebnisDictionary.update(lBesteMessungDictionary)
+			lSekundenFloat = max(lBesteMessungDictionary['Sekunden'], 1e-9)
+			lErgebnisDictionary['MBProSekunde'] = pBytesInteger / lSekundenFloat / 1e6
+			lErgebnisDictionary['DateienProSekunde'] = pDateienInteger / lSekundenFloat
+			print('{:<30} {:<16} {:>9.3f} s {:>10.1f} MB/s {:>10.1f} Dateien/s {:>9} Syscalls {:>8.1f} MiB RSS'.format(
+				pSzenarioString, pOperationString, lErgebnisDictionary['Sekunden'], lErgebnisDictionary['MBProSekunde'],
+				lErgebnisDictionary['DateienProSekunde'], lErgebnisDictionary.get('LeseSyscalls', 0) + lErgebnisDictionary.get('SchreibSyscalls', 0),
+				lErgebnisDictionary['SpitzenRSSBytes'] / C_MIB), flush=True)
+		else:
+			lErgebnisDictionary['Fehler'] = lFehlerString
+			print('{:<30} {:<16} FEHLER: {}'.format(pSzenarioString, pOperationString, lFehlerString), flush=True)
+		self.sErgebnisseList.append(lErgebnisDictionary)
+		return lFehlerString is None
+
+	## --- Hilfsmethoden für Ver- und Entschlüsselung
+
+	def verschluessele(self, pQuellpfadString, pZielpfadString):
+		LiSKrypto.QDatei(self.sVerschluesseler, pQuellpfadString).verschluesseln(self.sSHA512HashwertBytes, pZielpfadString)
+
+	def entschluessele(self, pQuellpfadString, pAusfuehrer=None):
+		lZielpfadString = os.path.join(os.path.dirname(pQuellpfadString), 'benchmark.tmp')
+		return LiSKrypto.QDatei(pAusfuehrer or self.sEntschluesseler, pQuellpfadString).entschluesseln(self.sSHA256HashwertBytes, self.sSHA512HashwertBytes, lZielpfadString)
+
+	@staticmethod
+	def vernichte(pPfadString):
+		LiSVernichtung.QVerzeichniseintrag(Stellvertreter(), pPfadString).vernichten(pIgnoriereFunktionsprozessAktivBoolean=False)
+
+	@staticmethod
+	def entferne(*pPfadeTuple):
+		for lPfadString in pPfadeTuple:
+			if os.path.isdir(lPfadString):
+				shutil.rmtree(lPfadString)
+			elif os.path.lexists(lPfadString):
+				os.remove(lPfadString)
+
+	@staticmethod
+	def erstelleDatei(pPfadString, pGroesseInteger, pDuennBoolean=False):
+		"""
+		Erstellt eine Datei der Größe pGroesseInteger mit Zufallsdaten (ein wiederholter Block von höchstens 16 MiB)
+		bzw. eine dünn besetzte Datei ohne Inhalt.
+		"""
+		with open(pPfadString, 'wb') as lDatei:
+			if pDuennBoolean is True:
+				lDatei.truncate(pGroesseInteger)
+			else:
+				lBlockBytes = os.urandom(min(pGroesseInteger, 16 * C_MIB))
+				lVerbleibendInteger = pGroesseInteger
+				while lVerbleibendInteger > 0:
+					lVerbleibendInteger -= lDatei.write(lBlockBytes[:lVerbleibendInteger])
+
+	## --- Szenarien
+
+	def miss_groessen(self, pGroessenList, pDuenneGroessenList):
+		for lGroesseInteger, lDuennBoolean in [(lGroesseInteger, False) for lGroesseInteger in pGroessenList] + [(lGroesseInteger, True) for lGroesseInteger in pDuenneGroessenList]:
+			lSzenarioString = '{} {}'.format('duenn' if lDuennBoolean else 'groesse', gibGroessenbezeichnung(lGroesseInteger))
+			lBenoetigtInteger = (1 if lDuennBoolean else 3) * lGroesseInteger + lGroesseInteger // 50 + 64 * C_MIB
+			if shutil.disk_usage(self.sVerzeichnisString).free < lBenoetigtInteger:
+				self.sErgebnisseList.append({'Szenario': lSzenarioString, 'Uebersprungen': 'Zu wenig Speicherplatz ({} benötigt)'.format(gibGroessenbezeichnung(lBenoetigtInteger))})
+				print('{:<30} übersprungen (zu wenig Speicherplatz)'.format(lSzenarioString), flush=True)
+				continue
+			lQuelleString = os.path.join(self.sVerzeichnisString, 'quelle')
+			lZielString = os.path.join(self.sVerzeichnisString, 'ziel')
+			os.mkdir(lQuelleString)
+			os.mkdir(lZielString)
+			try:
+				lQuellpfadString = os.path.join(lQuelleString, 'daten.bin')
+				lVerschluesseltString = os.path.join(lZielString, 'daten-bin' + LiSKonstanten.C_DATEIENDUNG)
+				lEntschluesseltString = os.path.join(lZielString, 'daten.bin')
+				self.erstelleDatei(lQuellpfadString, lGroesseInteger, lDuennBoolean)
+				if not self.miss(lSzenarioString, 'verschluesseln', lambda: self.verschluessele(lQuellpfadString, lVerschluesseltString),
+								 lGroesseInteger, 1, lambda: self.entferne(lVerschluesseltString)):
+					continue
+				if lDuennBoolean is True:
+					# Die dünn besetzte Quelle wird nicht mehr benötigt; Platz für die (nicht dünn besetzte) Entschlüsselung schaffen:
+					self.entferne(lQuellpfadString)
+					if shutil.disk_usage(self.sVerzeichnisString).free < lGroesseInteger + 64 * C_MIB:
+						continue
+				if not self.miss(lSzenarioString, 'entschluesseln', lambda: self.pruefeGroesse(self.entschluessele(lVerschluesseltString), lGroesseInteger),
+								 lGroesseInteger, 1, lambda: self.entferne(lEntschluesseltString)):
+					continue
+				self.entferne(lVerschluesseltString)
+				self.miss(lSzenarioString, 'vernichten', lambda: self.vernichte(lEntschluesseltString), lGroesseInteger, 1,
+						  lambda: None if os.path.exists(lEntschluesseltString) else shutil.copyfile(lQuellpfadString, lEntschluesseltString))
+			finally:
+				self.entferne(lQuelleString, lZielString)
+
+	def miss_baeume(self, pAnzahlDateienInteger, pTiefeInteger):
+		lDateigroesseInteger = 4 * C_KIB
+		for lSzenarioString, lRelativePfadeList in (('baum {} Dateien'.format(pAnzahlDateienInteger), [os.path.join('v{:03d}'.format(lIndexInteger % 32), 'd{:06d}.txt'.format(lIndexInteger)) for lIndexInteger in range(pAnzahlDateienInteger)]),
+													('tiefe {} Ebenen'.format(pTiefeInteger), [os.path.join(*(['e'] * lEbeneInteger + ['d{:04d}.txt'.format(lEbeneInteger)])) for lEbeneInteger in range(pTiefeInteger)])):
+			lQuelleString = os.path.join(self.sVerzeichnisString, 'quelle')
+			lZielString = os.path.join(self.sVerzeichnisString, 'ziel')
+			try:
+				for lRelativerPfadString in lRelativePfadeList:
+					os.makedirs(os.path.join(lQuelleString, os.path.dirname(lRelativerPfadString)), exist_ok=True)
+					os.makedirs(os.path.join(lZielString, os.path.dirname(lRelativerPfadString)), exist_ok=True)
+					self.erstelleDatei(os.path.join(lQuelleString, lRelativerPfadString), lDateigroesseInteger)
+				lBytesInteger = len(lRelativePfadeList) * lDateigroesseInteger
+				lVerschluesseltList = [os.path.join(lZielString, os.path.dirname(lRelativerPfadString), os.path.basename(lRelativerPfadString).replace('.', '-') + LiSKonstanten.C_DATEIENDUNG)
+									   for lRelativerPfadString in lRelativePfadeList]
+
+				def lVerschluesseleBaum():
+					for lRelativerPfadString, lVerschluesseltString in zip(lRelativePfadeList, lVerschluesseltList):
+						self.verschluessele(os.path.join(lQuelleString, lRelativerPfadString), lVerschluesseltString)
+
+				def lEntschluesseleBaum():
+					for lVerschluesseltString in lVerschluesseltList:
+						self.entschluessele(lVerschluesseltString)
+
+				if self.miss(lSzenarioString, 'verschluesseln', lVerschluesseleBaum, lBytesInteger, len(lRelativePfadeList),
+							 lambda: self.entferne(*lVerschluesseltList)) \
+						and self.miss(lSzenarioString, 'entschluesseln', lEntschluesseleBaum, lBytesInteger, len(lRelativePfadeList),
+									  lambda: self.entferne(*[os.path.join(lZielString, lRelativerPfadString) for lRelativerPfadString in lRelativePfadeList])):
+					self.entferne(*lVerschluesseltList)
+					# Vernichtung des gesamten Baums (Dateien und Verzeichnisse) über den Stellvertreter:
+					self.miss(lSzenarioString, 'vernichten', lambda: Stellvertreter().vernichte(lZielString), lBytesInteger, len(lRelativePfadeList),
+							  lambda: None if os.path.exists(lZielString) else shutil.copytree(lQuelleString, lZielString))
+			finally:
+				self.entferne(lQuelleString, lZielString)
+
+	def miss_verfahren(self, pGroesseInteger):
+		lQuellpfadString = os.path.join(self.sVerzeichnisString, 'daten.bin')
+		lZielString = os.path.join(self.sVerzeichnisString, 'ziel')
+		os.mkdir(lZielString)
+		try:
+			self.erstelleDatei(lQuellpfadString, pGroesseInteger)
+			lVerfahrenList = list(C_ALTVERFAHREN_DICTIONARY.items()) + [('AES-GCM V4', LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4)]
+			for lBezeichnungString, lKennungInteger in lVerfahrenList:
+				lVerschluesseltString = os.path.join(lZielString, 'daten-bin' + LiSKonstanten.C_DATEIENDUNG)
+				lEntschluesseltString = os.path.join(lZielString, 'daten.bin')
+				if lKennungInteger == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4:
+					self.verschluessele(lQuellpfadString, lVerschluesseltString)
+					lAusfuehrerFunktion = lambda: self.sEntschluesseler
+				else:
+					erstelleAltdatei(lKennungInteger, lQuellpfadString, lVerschluesseltString, self.sSHA256HashwertBytes, self.sSHA512HashwertBytes, self.sScryptAufwandsfaktorInteger)
+					lAusfuehrerFunktion = Stellvertreter
+				lAusfuehrerList = []
+				self.miss('verfahren ' + lBezeichnungString, 'entschluesseln',
+						  lambda: self.pruefeGroesse(self.entschluessele(lVerschluesseltString, lAusfuehrerList[-1]), pGroesseInteger), pGroesseInteger, 1,
+						  lambda: (self.entferne(lEntschluesseltString), lAusfuehrerList.append(lAusfuehrerFunktion())))
+				self.entferne(lVerschluesseltString, lEntschluesseltString)
+		finally:
+			self.entferne(lQuellpfadString, lZielString)
+
+	@staticmethod
+	def pruefeGroesse(pPfadString, pGroesseInteger):
+		if os.path.getsize(pPfadString) != pGroesseInteger:
+			raise ValueError('Entschlüsselte Datei hat {} statt {} Bytes.'.format(os.path.getsize(pPfadString), pGroesseInteger))
+
+def erstelleAltdatei(pKennungInteger, pQuellpfadString, pZielpfadString, pSHA256HashwertBytes, pSHA512HashwertBytes, pScryptAufwandsfaktorInteger):
+	"""
+	Verschlüsselt pQuellpfadString als pZielpfadString im Format des Verfahrens pKennungInteger (AES-GCM V1-V3,
+	ChaCha20 V1-V3_1) entsprechend LiSKrypto.QDatei._liesHeaderAusDatei(...) und der Entschlüsselung in
+	LiSKrypto.QDatei._entschluesseln(...). Die Schlüssel werden mit den Methoden des Funktionsausfuehrers abgeleitet.
+	"""
+	lAusfuehrer = Stellvertreter()
+	lQuelldateiStat = os.stat(pQuellpfadString)
+	lNameBytes = os.path.basename(pQuellpfadString).encode()
+	lVersionBytes = LiSKonstanten.C_ERFORDERLICHE_LISCRYPT_VERSION.encode()
+	lScryptList = [struct.pack('>Q', pScryptAufwandsfaktorInteger), struct.pack('>I', LiSKonstanten.C_SCRYPT_BLOCK_GROESSE), struct.pack('>I', LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT)]
+	lDateiList = [struct.pack('>Q', lQuelldateiStat.st_mtime_ns), struct.pack('>Q', lQuelldateiStat.st_atime_ns), struct.pack('>Q', lQuelldateiStat.st_size), struct.pack('>Q', len(lNameBytes))]
+	lKlartextvorspannList = [lNameBytes, lVersionBytes]
+	lHMAC = None
+
+	if pKennungInteger == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V1:
+		lSaltBytes = os.urandom(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+		lNonceBytes = os.urandom(LiSKonstanten.C_AES_GCM_NONCE_LAENGE)
+		lSchluesselBytes = lAusfuehrer.ermittleAESGCM_V1Schluessel(pSHA256HashwertBytes=pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger, pScryptSaltBytes=lSaltBytes)['AESGCMV1Schluessel']
+		lFelderList = [struct.pack('>Q', LiSKonstanten.C_DATEI_BLOCKGROESSE)] + lScryptList + [struct.pack('>I', len(lSaltBytes)), lSaltBytes, struct.pack('>I', len(lNonceBytes)), lNonceBytes] + lDateiList
+		lVerschluesseler = Cipher(algorithms.AES(lSchluesselBytes), modes.GCM(lNonceBytes), backend=default_backend()).encryptor()
+		lKlartextvorspannList = [lNameBytes]
+	elif pKennungInteger == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V2:
+		lSchluesselDictionary = lAusfuehrer.ermittleAESGCM_V2Schluessel(pSHA256HashwertBytes=pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger)
+		lNonceBytes = os.urandom(LiSKonstanten.C_AES_GCM_NONCE_LAENGE)
+		lFelderList = lScryptList + [struct.pack('>I', len(lSchluesselDictionary['InitialesScryptSalt'])), lSchluesselDictionary['InitialesScryptSalt'],
+									 struct.pack('>I', len(lSchluesselDictionary['HKDFSaltFuerAESGCMV2'])), lSchluesselDictionary['HKDFSaltFuerAESGCMV2'],
+									 struct.pack('>I', len(lNonceBytes)), lNonceBytes] + lDateiList + [struct.pack('>H', len(lVersionBytes))]
+		lVerschluesseler = Cipher(algorithms.AES(lSchluesselDictionary['AESGCMV2Schluessel']), modes.GCM(lNonceBytes), backend=default_backend()).encryptor()
+	elif pKennungInteger == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V3:
+		lSchluesselDictionary = lAusfuehrer.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=pSHA512HashwertBytes, pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger)
+		lNonceBytes = lAusfuehrer.gibNeueAESGCMNoncePerHKDF()
+		lFelderList = lScryptList + [struct.pack('>I', len(lSchluesselDictionary['InitialesScryptSalt'])), lSchluesselDictionary['InitialesScryptSalt'],
+									 struct.pack('>I', len(lNonceBytes)), lNonceBytes] + lDateiList + [struct.pack('>H', len(lVersionBytes))]
+		lVerschluesseler = Cipher(algorithms.AES(lSchluesselDictionary['AESGCMV3Schluessel']), modes.GCM(lNonceBytes), backend=default_backend()).encryptor()
+		lKlartextvorspannList = [bytes(5), lNameBytes, lVersionBytes]
+	elif pKennungInteger == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V1:
+		lSaltBytes = os.urandom(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+		lHMACSaltBytes = os.urandom(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+		lNonceBytes = os.urandom(LiSKonstanten.C_CHACHA20_NONCE_LAENGE)
+		lSchluesselBytes = lAusfuehrer.ermittleChaCha20_V1Schluessel(pSHA256HashwertBytes=pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger, pScryptSaltBytes=lSaltBytes)['ChaCha20V1Schluessel']
+		lHMAC = hmac.HMAC(lAusfuehrer.ermittleHMACSchluesselFuerChaCha20_V1(pSHA256HashwertBytes=pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger, pScryptSaltBytes=lHMACSaltBytes)['HMACSchluessel'],
+						  hashes.SHA256(), backend=default_backend())
+		lFelderList = [struct.pack('>Q', LiSKonstanten.C_DATEI_BLOCKGROESSE)] + lScryptList + [struct.pack('>I', len(lSaltBytes)), lSaltBytes, struct.pack('>I', len(lNonceBytes)), lNonceBytes,
+																						 struct.pack('>I', len(lHMACSaltBytes)), lHMACSaltBytes] + lDateiList
+		lVerschluesseler = Cipher(algorithms.ChaCha20(lSchluesselBytes, lNonceBytes), mode=None, backend=default_backend()).encryptor()
+		lKlartextvorspannList = [lNameBytes]
+	elif pKennungInteger == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V2:
+		lSchluesselDictionary = lAusfuehrer.ermittleChaCha20_V2Schluessel(pSHA256HashwertBytes=pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger)
+		lNonceBytes = os.urandom(LiSKonstanten.C_CHACHA20_NONCE_LAENGE)
+		lHMAC = hmac.HMAC(lAusfuehrer.ermittleHMACSchluesselFuerChaCha20_V2(pHKDFSaltBytes=lSchluesselDictionary['HKDFSaltFuerChaCha20V2'])['HMACSchluessel'], hashes.SHA256(), backend=default_backend())
+		lFelderList = lScryptList + [struct.pack('>I', len(lSchluesselDictionary['InitialesScryptSalt'])), lSchluesselDictionary['InitialesScryptSalt'],
+									 struct.pack('>I', len(lNonceBytes)), lNonceBytes,
+									 struct.pack('>I', len(lSchluesselDictionary['HKDFSaltFuerChaCha20V2'])), lSchluesselDictionary['HKDFSaltFuerChaCha20V2']] + lDateiList + [struct.pack('>H', len(lVersionBytes))]
+		lVerschluesseler = Cipher(algorithms.ChaCha20(lSchluesselDictionary['ChaCha20V2Schluessel'], lNonceBytes), mode=None, backend=default_backend()).encryptor()
+	elif pKennungInteger in (LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3, LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3_1):
+		lSchluesselDictionary = lAusfuehrer.ermittleChaCha20_V3Schluessel(pSHA512HashwertBytes=pSHA512HashwertBytes, pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger)
+		lNonceBytes = lAusfuehrer.gibNeueChaCha20NoncePerHKDF()
+		if pKennungInteger == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3:
+			lHMACSchluesselBytes = lAusfuehrer.ermittleHMACSchluesselFuerChaCha20_V3()['HMACSchluessel']
+		else:
+			lHMACSchluesselBytes = lAusfuehrer.ermittleHMACSchluesselFuerChaCha20_V3_1()['HMACSchluessel']
+		lHMAC = hmac.HMAC(lHMACSchluesselBytes, hashes.SHA512(), backend=default_backend())
+		lFelderList = lScryptList + [struct.pack('>I', len(lSchluesselDictionary['InitialesScryptSalt'])), lSchluesselDictionary['InitialesScryptSalt'],
+									 struct.pack('>I', len(lNonceBytes)), lNonceBytes] + lDateiList + [struct.pack('>H', len(lVersionBytes))]
+		lVerschluesseler = Cipher(algorithms.ChaCha20(lSchluesselDictionary['ChaCha20V3Schluessel'], lNonceBytes), mode=None, backend=default_backend()).encryptor()
+		lKlartextvorspannList = [bytes(5), lNameBytes, lVersionBytes]
+	else:
+		raise ValueError('Unbekanntes Verfahren: {}'.format(pKennungInteger))
+
+	lHeaderBytes = b''.join([b'LiSX', struct.pack('>H', pKennungInteger)] + lFelderList)
+	if lHMAC is None:
+		lVerschluesseler.authenticate_additional_data(lHeaderBytes)
+	else:
+		lHMAC.update(lHeaderBytes)
+	with open(pQuellpfadString, 'rb') as lQuelldatei, open(pZielpfadString, 'wb') as lZieldatei:
+		lZieldatei.write(lHeaderBytes)
+		for lKlartextBytes in lKlartextvorspannList + [lBlockBytes for lBlockBytes in iter(lambda: lQuelldatei.read(C_MIB), b'')]:
+			lChiffratBytes = lVerschluesseler.update(lKlartextBytes)
+			lZieldatei.write(lChiffratBytes)
+			if lHMAC is not None:
+				lHMAC.update(lChiffratBytes)
+		lVerschluesseler.finalize()
+		lTagBytes = lVerschluesseler.tag if lHMAC is None else lHMAC.finalize()
+		lZieldatei.write(struct.pack('>I', len(lTagBytes)) + lTagBytes)
+
+def gibGroessenbezeichnung(pGroesseInteger):
+	for lEinheitString, lFaktorInteger in (('GiB', C_GIB), ('MiB', C_MIB), ('KiB', C_KIB)):
+		if pGroesseInteger >= lFaktorInteger:
+			return '{:g} {}'.format(round(pGroesseInteger / lFaktorInteger, 2), lEinheitString)
+	return '{} B'.format(pGroesseInteger)
+
+def vergleiche(pErgebnisseList, pBasisErgebnisseList, pToleranzFloat):
+	"""
+	Vergleicht die Ergebnisse mit denen einer früheren Ergebnisdatei und returniert die Liste der Regressionen.
+	Messungen, die nur in einer der beiden Dateien vorkommen oder bereits zuvor fehlgeschlagen sind, werden ignoriert.
+	"""
+	lBasisDictionary = {(lErgebnisDictionary['Szenario'], lErgebnisDictionary.get('Operation')): lErgebnisDictionary for lErgebnisDictionary in pBasisErgebnisseList}
+	lRegressionenList = []
+	for lErgebnisDictionary in pErgebnisseList:
+		lBasisErgebnisDictionary = lBasisDictionary.get((lErgebnisDictionary['Szenario'], lErgebnisDictionary.get('Operation')))
+		if lBasisErgebnisDictionary is None or 'Uebersprungen' in lErgebnisDictionary or 'Fehler' in lBasisErgebnisDictionary or 'Uebersprungen' in lBasisErgebnisDictionary:
+			continue
+		lBezeichnungString = '{} / {}'.format(lErgebnisDictionary['Szenario'], lErgebnisDictionary['Operation'])
+		if 'Fehler' in lErgebnisDictionary:
+			lRegressionenList.append('{}: fehlgeschlagen ({})'.format(lBezeichnungString, lErgebnisDictionary['Fehler']))
+			continue
+		for lSchluesselString, lZuschlagFloat in (('Sekunden', C_ZUSCHLAG_SEKUNDEN), ('LeseSyscalls', C_ZUSCHLAG_SYSCALLS),
+												  ('SchreibSyscalls', C_ZUSCHLAG_SYSCALLS), ('SpitzenRSSBytes', C_ZUSCHLAG_RSS_BYTES)):
+			if lSchluesselString in lErgebnisDictionary and lSchluesselString in lBasisErgebnisDictionary:
+				lAltFloat = lBasisErgebnisDictionary[lSchluesselString]
+				lNeuFloat = lErgebnisDictionary[lSchluesselString]
+				if lNeuFloat > lAltFloat * (1 + pToleranzFloat) + lZuschlagFloat:
+					lRegressionenList.append('{}: {} {:g} -> {:g} (+{:.0%})'.format(lBezeichnungString, lSchluesselString, lAltFloat, lNeuFloat, lNeuFloat / lAltFloat - 1 if lAltFloat else float('inf')))
+	return lRegressionenList
+
+if __name__ == '__main__':
+	lParser = argparse.ArgumentParser(description='Ende-zu-Ende-Benchmark für Verschlüsselung, Entschlüsselung und Vernichtung.')
+	lParser.add_argument('--szenarien', default='groessen,baeume,verfahren', help='Kommagetrennte Auswahl aus groessen, baeume, verfahren')
+	lParser.add_argument('--voll', action='store_true', help='Zusätzlich 10 GiB, dünn besetzte Datei oberhalb von C_AES_GCM_MAXIMALE_DATEIGROESSE, größere Bäume')
+	lParser.add_argument('--verzeichnis', default=None, help='Verzeichnis für Testdateien (Default: Verzeichnis für temporäre Dateien)')
+	lParser.add_argument('--ausgabe', default=None, help='JSON-Datei für die Ergebnisse')
+	lParser.add_argument('--vergleich', default=None, help='Frühere JSON-Ergebnisdatei, gegen die auf Regressionen geprüft wird')
+	lParser.add_argument('--toleranz', type=float, default=0.25, help='Zulässige relative Verschlechterung beim Vergleich (Default: 0.25)')
+	lParser.add_argument('--wiederholungen', type=int, default=1, help='Anzahl Durchläufe je Messung, der schnellste zählt (Default: 1)')
+	lParser.add_argument('--scrypt-n', dest='scryptn', type=int, default=2 ** 14, help='Scrypt-Aufwandsfaktor in den Headern der Altverfahren (Default: 2^14)')
+	lArgumente = lParser.parse_args()
+	lSzenarienList = [lSzenarioString.strip() for lSzenarioString in lArgumente.szenarien.split(',') if lSzenarioString.strip() != '']
+
+	lGroessenList = [C_KIB, 64 * C_KIB, C_MIB, 16 * C_MIB, 256 * C_MIB, C_GIB] + ([10 * C_GIB] if lArgumente.voll else [])
+	lDuenneGroessenList = [int(LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIGROESSE) + 1 + C_MIB] if lArgumente.voll else []
+
+	with tempfile.TemporaryDirectory(prefix='liscrypt-benchmark-', dir=lArgumente.verzeichnis) as lVerzeichnisString:
+		lBenchmark = Benchmark(lVerzeichnisString, lArgumente.wiederholungen, lArgumente.scryptn)
+		if 'groessen' in lSzenarienList:
+			lBenchmark.miss_groessen(lGroessenList, lDuenneGroessenList)
+		if 'baeume' in lSzenarienList:
+			lBenchmark.miss_baeume(10000 if lArgumente.voll else 1000, 256 if lArgumente.voll else 64)
+		if 'verfahren' in lSzenarienList:
+			lBenchmark.miss_verfahren(C_GIB if lArgumente.voll else 64 * C_MIB)
+
+	lErgebnisDictionary = {'LiSCryptVersion': LiSKonstanten.__version__,
+						   'Zeitpunkt': datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+						   'Python': platform.python_version(),
+						   'Plattform': platform.platform(),
+						   'AnzahlProzessoren': os.cpu_count(),
+						   'Verzeichnis': lArgumente.verzeichnis or tempfile.gettempdir(),
+						   'Wiederholungen': lArgumente.wiederholungen,
+						   'Ergebnisse': lBenchmark.sErgebnisseList}
+	if lArgumente.ausgabe is not None:
+		with open(lArgumente.ausgabe, 'w', encoding='utf-8') as lAusgabedatei:
+			json.dump(lErgebnisDictionary, lAusgabedatei, ensure_ascii=False, indent=1)
+
+	if lArgumente.vergleich is not None:
+		with open(lArgumente.vergleich, encoding='utf-8') as lBasisdatei:
+			lRegressionenList = vergleiche(lBenchmark.sErgebnisseList, json.load(lBasisdatei)['Ergebnisse'], lArgumente.toleranz)
+		if len(lRegressionenList) > 0:
+			print('\nRegressionen gegenüber {}:'.format(lArgumente.vergleich))
+			for lRegressionString in lRegressionenList:
+				print(' - ' + lRegressionString)
+			sys.exit(1)
+		print('\nKeine Regressionen gegenüber {}.'.format(lArgumente.vergleich))
@@ -0,0 +1,52 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Benchmark: Importzeit der Module, die beim Programmstart (auch bei Weitergabe der Aufrufparameter an eine bereits
+laufende Instanz) geladen werden. Jeder Import erfolgt in einem eigenen Interpreter mit 'python -X importtime';
+ausgegeben wird der Median der kumulierten Importzeit über alle Durchläufe.
+
+Aufruf: python benchmarks/bench_importzeit.py [Anzahl Durchläufe]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+C_MODULE = ['Modell.LiSKonstanten', 'Modell.LiSKonfiguration', 'Steuerung.LiSCrypt']
+C_SRC_PFAD = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+def messeImportzeit(pModulString):
+	"""
+	Returniert die kumulierte Importzeit von pModulString in Millisekunden (ein Durchlauf in neuem Interpreter).
+	"""
+	lErgebnis = subprocess.run([sys.executable, '-X', 'importtime', '-c', 'import ' + pModulString],
+							   cwd=C_SRC_PFAD, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True, check=True)
+	for lZeileString in lErgebnis.stderr.splitlines():
+		lSpaltenList = lZeileString.split('|')
+		if len(lSpaltenList) == 3 and lSpaltenList[2].strip() == pModulString:
+			return int(lSpaltenList[1]) / 1000
+	raise ValueError('Keine Importzeit für ' + pModulString + ' gefunden.')
+
+if __name__ == '__main__':
+	lAnzahlDurchlaeufeInteger = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+	for lModulString in C_MODULE:
+		lZeitenList = [messeImportzeit(lModulString) for lZaehlerInteger in range(lAnzahlDurchlaeufeInteger)]
+		print('{:<28} {:>8.1f} ms (Median, min. {:.1f} ms)'.format(lModulString, statistics.median(lZeitenList), min(lZeitenList)))
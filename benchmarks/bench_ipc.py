@@ -0,0 +1,98 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""
+Benchmark: Weitergabe großer Aufrufparameterlisten zwischen zwei LiSCrypt-Instanzen (LiSSingleton). Gemessen wird
+der Empfang einer Nachricht mit dem bisherigen Einzelbyte-Verfahren (recv(1)) und mit Nachrichtenprotokoll
+(recv_into in einen vorab angelegten Puffer) sowie die YAML-Serialisierung der Liste mit reinem Python und mit LibYAML.
+
+Aufruf: python benchmarks/bench_ipc.py [Anzahl Pfade]
+"""
+
+import os
+import socket
+import struct
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from Modell import LiSKonstanten
+from Modell.LiSSingleton import C_YAML_DUMPER, C_YAML_LOADER, Nachrichtenprotokoll
+
+import yaml
+
+def empfangeEinzelbyteweise(pSocket, pIstAktivFunktion):
+	"""
+	Bisheriges Empfangsverfahren (zum Vergleich).
+	"""
+	lLaengeDerNachrichtBytes = b''
+	while len(lLaengeDerNachrichtBytes) < 8 and pIstAktivFunktion() is True:
+		lLaengeDerNachrichtBytes += pSocket.recv(1)
+	lLaengeDerNachrichtInteger = struct.unpack('>Q', lLaengeDerNachrichtBytes)[0]
+	lNachrichtBytes = b''
+	while len(lNachrichtBytes) < lLaengeDerNachrichtInteger and pIstAktivFunktion() is True:
+		lNachrichtBytes += pSocket.recv(1)
+	return lNachrichtBytes
+
+def messeEmpfang(pEmpfangsFunktion, pNachrichtBytes):
+	"""
+	Returniert die Dauer (in Sekunden) für Senden und Empfangen von pNachrichtBytes über ein verbundenes Socketpaar.
+	"""
+	lSenderSocket, lEmpfaengerSocket = socket.socketpair()
+	lSenderThread = threading.Thread(target=Nachrichtenprotokoll.sendeNachricht, args=(lSenderSocket, pNachrichtBytes))
+	lStartFloat = time.perf_counter()
+	lSenderThread.start()
+	lEmpfangenBytes = pEmpfangsFunktion(lEmpfaengerSocket, lambda: True)
+	lDauerFloat = time.perf_counter() - lStartFloat
+	lSenderThread.join()
+	lSenderSocket.close()
+	lEmpfaengerSocket.close()
+	assert lEmpfangenBytes == pNachrichtBytes
+	return lDauerFloat
+
+def messe(pFunktion, *pArgumente):
+	"""
+	Returniert die Dauer (in Sekunden) eines Aufrufs von pFunktion(*pArgumente) sowie dessen Ergebnis.
+	"""
+	lStartFloat = time.perf_counter()
+	lErgebnis = pFunktion(*pArgumente)
+	return time.perf_counter() - lStartFloat, lErgebnis
+
+if __name__ == '__main__':
+	lAnzahlPfadeInteger = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+	lAufrufparameterList = ['screen', 'encrypt', 'keeporiginals', 'password']
+	lAufrufparameterList.extend(os.path.join(os.sep, 'home', 'benutzer', 'Dokumente', 'Ordner{:04d}'.format(lZaehlerInteger % 1000), 'Datei{:06d}.pdf'.format(lZaehlerInteger))
+								for lZaehlerInteger in range(lAnzahlPfadeInteger))
+
+	lDauerDumpFloat, lNachrichtBytes = messe(lambda: yaml.dump(lAufrufparameterList).encode())
+	lDauerCDumpFloat, lNachrichtCBytes = messe(lambda: yaml.dump(lAufrufparameterList, Dumper=C_YAML_DUMPER).encode())
+	lDauerLoadFloat, lGeladenList = messe(lambda: yaml.load(lNachrichtBytes, Loader=yaml.SafeLoader))
+	lDauerCLoadFloat, lGeladenCList = messe(lambda: yaml.load(lNachrichtCBytes, Loader=C_YAML_LOADER))
+	assert lGeladenList == lGeladenCList == lAufrufparameterList
+
+	print('{} Pfade, Nachricht {:.2f} MiB (max. {} MiB)'.format(lAnzahlPfadeInteger, len(lNachrichtBytes) / 2**20, LiSKonstanten.C_IPC_MAXIMALE_NACHRICHTENLAENGE // 2**20))
+	print('{:<32} {:>9.3f} s'.format('Empfang recv(1)', messeEmpfang(empfangeEinzelbyteweise, lNachrichtBytes)))
+	print('{:<32} {:>9.3f} s'.format('Empfang recv_into', messeEmpfang(Nachrichtenprotokoll.empfangeNachricht, lNachrichtBytes)))
+	print('{:<32} {:>9.3f} s'.format('yaml.dump (Python)', lDauerDumpFloat))
+	print('{:<32} {:>9.3f} s'.format('yaml.dump (' + C_YAML_DUMPER.__name__ + ')', lDauerCDumpFloat))
+	print('{:<32} {:>9.3f} s'.format('yaml.load (SafeLoader)', lDauerLoadFloat))
+	print('{:<32} {:>9.3f} s'.format('yaml.load (' + C_YAML_LOADER.__name__ + ')', lDauerCLoadFloat))
@@ -0,0 +1,80 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Benchmark: Durchsatz der segmentierten AES-GCM-Verschlüsselung (V4) mit 1..n Verarbeitungs-Threads im Vergleich zur
+Datenstrom-Verschlüsselung des Verfahrens V3 (ein AES-GCM-Datenstrom, Blöcke à C_DATEI_BLOCKGROESSE).
+
+Aufruf: python benchmarks/bench_segmentpipeline.py [Größe in MiB]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from Modell import LiSKonstanten
+from Modell.LiSKrypto import Segmentwerkzeuge
+from Modell.LiSPipeline import Segmentpipeline
+
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+def verschluesseleV3(pQuellpfadString, pZielpfadString, pSchluesselBytes, pNonceBytes):
+	lVerschluesseler = Cipher(algorithms.AES(pSchluesselBytes), modes.GCM(pNonceBytes)).encryptor()
+	with open(pQuellpfadString, 'rb') as lQuelldatei, open(pZielpfadString, 'wb') as lZieldatei:
+		for lBlock in iter(lambda: lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE), b''):
+			lZieldatei.write(lVerschluesseler.update(lBlock))
+		lZieldatei.write(lVerschluesseler.finalize() + lVerschluesseler.tag)
+
+def verschluesseleV4(pQuellpfadString, pZielpfadString, pSchluesselBytes, pNonceBytes, pAnzahlThreadsInteger):
+	lOriginalgroesseInteger = os.path.getsize(pQuellpfadString)
+	lSegmentgroesseInteger = LiSKonstanten.C_AES_GCM_SEGMENTGROESSE
+	lAnzahlInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(lOriginalgroesseInteger, lSegmentgroesseInteger)
+	with open(pQuellpfadString, 'rb') as lQuelldatei, open(pZielpfadString, 'wb') as lZieldatei:
+		Segmentpipeline(pAnzahlThreadsInteger).verarbeite(
+			lambda pIndexInteger: lQuelldatei.read(lSegmentgroesseInteger),
+			lambda pIndexInteger, pBytes: Segmentwerkzeuge.verschluesseleSegment(pSchluesselBytes, pNonceBytes, pIndexInteger, pIndexInteger == lAnzahlInteger, b'', pBytes),
+			lambda pIndexInteger, pBytes: lZieldatei.write(pBytes),
+			lAnzahlInteger, lambda: True)
+
+def miss(pBezeichnungString, pFunktion, pGroesseInteger):
+	lStartFloat = time.perf_counter()
+	pFunktion()
+	lDauerFloat = time.perf_counter() - lStartFloat
+	print('{:<24} {:>10.1f} MB/s'.format(pBezeichnungString, pGroesseInteger / lDauerFloat / 1e6))
+
+if __name__ == '__main__':
+	lGroesseInteger = int(sys.argv[1] if len(sys.argv) > 1 else 256) * 1024 * 1024
+	lSchluesselBytes = os.urandom(32)
+	lNonceBytes = os.urandom(12)
+	with tempfile.TemporaryDirectory() as lVerzeichnisString:
+		lQuellpfadString = os.path.join(lVerzeichnisString, 'quelle.bin')
+		lZielpfadString = os.path.join(lVerzeichnisString, 'ziel.bin')
+		with open(lQuellpfadString, 'wb') as lQuelldatei:
+			for lZaehlerInteger in range(lGroesseInteger // (16 * 1024 * 1024)):
+				lQuelldatei.write(os.urandom(16 * 1024 * 1024))
+			lQuelldatei.write(os.urandom(lGroesseInteger % (16 * 1024 * 1024)))
+		miss('V3 (Datenstrom)', lambda: verschluesseleV3(lQuellpfadString, lZielpfadString, lSchluesselBytes, lNonceBytes), lGroesseInteger)
+		lAnzahlThreadsInteger = 1
+		while True:
+			miss('V4 ({} Threads)'.format(lAnzahlThreadsInteger), lambda: verschluesseleV4(lQuellpfadString, lZielpfadString, lSchluesselBytes, lNonceBytes, lAnzahlThreadsInteger), lGroesseInteger)
+			if lAnzahlThreadsInteger >= (os.cpu_count() or 1):
+				break
+			lAnzahlThreadsInteger = min(2 * lAnzahlThreadsInteger, os.cpu_count() or 1)
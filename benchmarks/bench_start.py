@@ -0,0 +1,86 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+
+
+"""
+Benchmark: Dauer der Übergabe von Aufrufparametern durch eine weitere Instanz an eine laufende Master-Instanz
+("Öffnen mit" im Dateimanager). Der Benchmark startet selbst einen QServer als Master-Instanz (ohne GUI) und misst
+jeweils den Median der Gesamtlaufzeit neuer Interpreterprozesse für den Schnellstart (Steuerung.LiSStarter) und den
+vollständigen Start (Steuerung.LiSCrypt) sowie die Dauer der reinen Übergabe im laufenden Prozess.
+
+Es darf keine andere LiSCrypt-Instanz laufen. Nur unter POSIX-Systemen (Unix-Domain-Socket) aussagekräftig.
+
+Aufruf: python benchmarks/bench_start.py [Anzahl Durchläufe]
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+C_SRC_PFAD = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+sys.path.insert(0, C_SRC_PFAD)
+
+from Modell import LiSKonfiguration, LiSSingleton
+from Steuerung.LiSStarter import Schnellstart
+
+from PyQt5 import QtCore
+
+def messeProzess(pModulString, pArgumenteList):
+	"""
+	Returniert die Laufzeit (in Millisekunden) von 'python -m pModulString pArgumenteList' in einem neuen Interpreter.
+	"""
+	lStartFloat = time.perf_counter()
+	subprocess.run([sys.executable, '-m', pModulString] + pArgumenteList, cwd=C_SRC_PFAD, check=True,
+				   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, env=dict(os.environ, QT_QPA_PLATFORM='offscreen'))
+	return (time.perf_counter() - lStartFloat) * 1000
+
+if __name__ == '__main__':
+	lAnzahlDurchlaeufeInteger = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+	if LiSSingleton.Nachrichtenprotokoll.nutztUnixSocket() is False:
+		sys.exit('Kein Unix-Domain-Socket verfügbar: Schnellstart nicht möglich.')
+	sys.argv = sys.argv[:1]
+	LiSKonfiguration.Konfiguration.parseAufrufparameter()
+	lAnwendung = QtCore.QCoreApplication(sys.argv)
+	lEmpfangeneListenList = []
+	lServerQServer = LiSSingleton.QServer()
+	lServerQServer.C_LISTENEMPFANG_SIGNAL.connect(lEmpfangeneListenList.append, QtCore.Qt.DirectConnection)
+	lServerQServer.start()
+	try:
+		lArgumenteList = ['-d', os.path.join(os.sep, 'tmp', 'Datei.lisx')]
+		lProzessmessungenDictionary = {
+			'Schnellstart (LiSStarter)': [messeProzess('Steuerung.LiSStarter', lArgumenteList) for lZaehlerInteger in range(lAnzahlDurchlaeufeInteger)],
+			'Vollständiger Start (LiSCrypt)': [messeProzess('Steuerung.LiSCrypt', lArgumenteList) for lZaehlerInteger in range(lAnzahlDurchlaeufeInteger)],
+			'Interpreter ohne Import': [messeProzess('site', []) for lZaehlerInteger in range(lAnzahlDurchlaeufeInteger)]
+		}
+		lUebergabenList = []
+		for lZaehlerInteger in range(lAnzahlDurchlaeufeInteger):
+			lStartFloat = time.perf_counter()
+			if Schnellstart.uebergibArgumenteAnMaster(lArgumenteList) is False:
+				raise RuntimeError('Übergabe an Master-Instanz fehlgeschlagen.')
+			lUebergabenList.append((time.perf_counter() - lStartFloat) * 1000)
+	finally:
+		lServerQServer.stop()
+		lServerQServer.wait()
+	for lBezeichnungString, lZeitenList in lProzessmessungenDictionary.items():
+		print('{:<34} {:>8.1f} ms (Median, min. {:.1f} ms)'.format(lBezeichnungString, statistics.median(lZeitenList), min(lZeitenList)))
+	print('{:<34} {:>8.2f} ms (Median, min. {:.2f} ms)'.format('Übergabe im Prozess', statistics.median(lUebergabenList), min(lUebergabenList)))
+	if len(lEmpfangeneListenList) != 3 * lAnzahlDurchlaeufeInteger:
+		print('Warnung: ' + str(len(lEmpfangeneListenList)) + ' von ' + str(3 * lAnzahlDurchlaeufeInteger) + ' Übergaben empfangen.')
@@ -0,0 +1,122 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält die Auftragswarteschlange der Master-Instanz, in der per Aufrufparameter übergebene Aufträge (auch
+von weiteren LiSCrypt-Instanzen) bis zu ihrer Ausführung verbleiben.
+"""
+
+import collections
+
+class Auftrag:
+	"""
+	Modelliert einen Auftrag, d.h. eine Programmfunktion mit Optionen und den Einträgen, auf denen sie ausgeführt
+	werden soll.
+	"""
+	def __init__(self, pAufrufparameterList):
+		"""
+		Initialisiert ein Objekt der Klasse Auftrag.
+
+		:param pAufrufparameterList: Aufrufparameter in der Ordnung von LiSKonfiguration.Konfiguration.gibAurufparameterAlsGeordneteListe()
+		:type pAufrufparameterList: Liste von Strings
+		"""
+		self.sLoggingString = pAufrufparameterList[0]
+		self.sFunktionString = pAufrufparameterList[1]
+		self.sOriginaleString = pAufrufparameterList[2]
+		self.sSchluesselartString = pAufrufparameterList[3]
+		self.sEintraegeDictionary = dict.fromkeys(pAufrufparameterList[4:]) # Geordnet und ohne Duplikate
+
+	def istKombinierbarMit(self, pAuftrag):
+		"""
+		Returniert, ob pAuftrag in diesem Auftrag aufgehen kann (gleiche Programmfunktion, Originalbehandlung und
+		Schlüsselart), so dass beide mit einer einzigen Schlüsselabfrage ausgeführt werden können.
+
+		:param pAuftrag: Nachfolgender Auftrag
+		:type pAuftrag: Auftrag
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return self.sFunktionString == pAuftrag.sFunktionString \
+			and self.sOriginaleString == pAuftrag.sOriginaleString \
+			and self.sSchluesselartString == pAuftrag.sSchluesselartString
+
+	def uebernehmeEintraege(self, pAuftrag):
+		"""
+		Ergänzt die Einträge dieses Auftrags um die (noch nicht enthaltenen) Einträge von pAuftrag.
+
+		:param pAuftrag: Kombinierbarer Auftrag
+		:type pAuftrag: Auftrag
+		"""
+		self.sEintraegeDictionary.update(pAuftrag.sEintraegeDictionary)
+
+	def gibEintraege(self):
+		"""
+		Returniert die (ggf. reduzierten) Pfadangaben der Einträge des Auftrags.
+
+		:return: Pfadangaben
+		:rtype: Liste von Strings
+		"""
+		return list(self.sEintraegeDictionary)
+
+class Auftragswarteschlange:
+	"""
+	FIFO-Warteschlange von Aufträgen. Ein neuer Auftrag, der mit dem zuletzt eingereihten Auftrag kombinierbar ist,
+	geht in diesem auf. Die Warteschlange wird ausschließlich im GUI-Thread verwendet und ist daher nicht synchronisiert.
+	"""
+	def __init__(self):
+		"""
+		Initialisiert ein Objekt der Klasse Auftragswarteschlange.
+		"""
+		self.sAuftraegeDeque = collections.deque()
+
+	def fuegeHinzu(self, pAufrufparameterList):
+		"""
+		Reiht einen Auftrag mit den Aufrufparametern pAufrufparameterList ein.
+
+		:param pAufrufparameterList: Aufrufparameter in der Ordnung von LiSKonfiguration.Konfiguration.gibAurufparameterAlsGeordneteListe()
+		:type pAufrufparameterList: Liste von Strings
+		:return: True, wenn der Auftrag mit dem zuletzt eingereihten Auftrag kombiniert wurde, sonst False
+		:rtype: Boolean
+		"""
+		lAuftrag = Auftrag(pAufrufparameterList)
+		if self.sAuftraegeDeque and self.sAuftraegeDeque[-1].istKombinierbarMit(lAuftrag):
+			self.sAuftraegeDeque[-1].uebernehmeEintraege(lAuftrag)
+			return True
+		self.sAuftraegeDeque.append(lAuftrag)
+		return False
+
+	def entnimm(self):
+		"""
+		Entnimmt den ältesten Auftrag.
+
+		:return: Ältester Auftrag
+		:rtype: Auftrag
+		"""
+		return self.sAuftraegeDeque.popleft()
+
+	def istLeer(self):
+		"""
+		Returniert, ob die Warteschlange leer ist.
+
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return not self.sAuftraegeDeque
+
+	def __len__(self):
+		return len(self.sAuftraegeDeque)
@@ -0,0 +1,54 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält programmglobale Konstanten, die bereits ohne Import von LiSKonstanten (und damit ausschließlich
+mit Modulen der Standardbibliothek) verfügbar sein müssen, insb. für die Übergabe von Aufrufparametern an eine bereits
+laufende Instanz (LiSUebergabe). Alle Konstanten werden von LiSKonstanten übernommen und sollten dort verwendet werden.
+"""
+
+import os
+import sys
+
+# Konstanten für IQB-Variante von LiSCrypt
+C_IQB_VERSION = False
+
+# Konstanten für Plattform und Betriebssystem:
+C_PLATTFORM = str.lower(os.name)
+C_BETRIEBSSYSTEM = str.lower(sys.platform)
+
+# Konstante für die Ver- und Entschlüsselung von Datenströmen (Standardein- und -ausgabe, nur ohne GUI):
+C_DATENSTROM_PFADANGABE = '-'
+"""Pfadangabe, die anstelle einer Datei die Standardeingabe als Quelle und die Standardausgabe als Ziel festlegt (String)"""
+
+# Konstanten für die Kommunikation zwischen LiSCrypt-Instanzen (LiSUebergabe, LiSSingleton):
+C_IPC_MAXIMALE_NACHRICHTENLAENGE = 256 * 1024 * 1024 # Anzahl Bytes
+"""Maximal zulässige Länge einer Nachricht zwischen zwei LiSCrypt-Instanzen in Bytes (int)"""
+C_IPC_EMPFANGSPUFFER_GROESSE = 256 * 1024 # Anzahl Bytes
+"""Maximale Anzahl von Bytes, die je Aufruf von recv_into empfangen werden (int)"""
+if C_BETRIEBSSYSTEM.startswith('linux'):
+	C_IPC_SOCKET_ADRESSE = '\0liscrypt' + ('IQB' if C_IQB_VERSION is True else '') + '-' + str(os.getuid()) # Abstrakter Namensraum
+elif C_BETRIEBSSYSTEM == 'darwin' and len(os.fsencode(os.path.join(os.path.abspath(os.path.expandvars(r'$HOME')), '.liscrypt' + ('IQB' if C_IQB_VERSION is True else ''), 'liscrypt.sock'))) < 100:
+	C_IPC_SOCKET_ADRESSE = os.path.join(os.path.abspath(os.path.expandvars(r'$HOME')), '.liscrypt' + ('IQB' if C_IQB_VERSION is True else ''), 'liscrypt.sock') # Im Konfigurationsverzeichnis
+else:
+	C_IPC_SOCKET_ADRESSE = None
+"""Adresse des Unix-Domain-Sockets der Master-Instanz (String; None: TCP mit Port aus der Konfigurationsdatei)"""
+C_IPC_ZEITLIMIT = 5.0 # Sekunden
+"""Zeitlimit für Verbindungsaufbau, Senden und Empfangen zwischen zwei LiSCrypt-Instanzen (float)"""
+C_IPC_SERVER_PRUEFINTERVALL = 0.5 # Sekunden
+"""Maximale Wartezeit der Ereignisschleife von QServer, bevor ein angeforderter Stopp geprüft wird (float)"""
@@ -0,0 +1,135 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält die Richtlinie, nach der die Chunkgröße für das Lesen und Schreiben von Dateien je Datenträger
+bestimmt wird.
+"""
+
+from Modell import LiSAusnahmen, LiSKonstanten
+from Sonstiges import LiSWerkzeuge
+
+import os
+import stat
+import threading
+import time
+
+class Blockgroessenrichtlinie:
+	"""
+	Stellt statische Methoden zur Ermittlung der Chunkgröße für Datei-E/A zur Verfügung. Die Chunkgröße wird einmalig je
+	Datenträger (st_dev) ermittelt und zwischengespeichert:
+
+	1. Netzwerkdateisysteme (LiSKonstanten.C_BLOCKGROESSE_NETZWERKDATEISYSTEME bzw. UNC-Pfade unter Windows) erhalten
+	   LiSKonstanten.C_BLOCKGROESSE_NETZWERK, um die Anzahl der Round-Trips gering zu halten.
+	2. Andernfalls wird LiSKonstanten.C_BLOCKGROESSE_LOKAL verwendet, mindestens jedoch die von st_blksize empfohlene
+	   Größe.
+	3. Ist die übergebene Datei groß genug, wird zusätzlich deren Anfang in Schritten von LiSKonstanten.C_DATEI_BLOCKGROESSE
+	   gelesen. Dauert ein Lesezugriff im Mittel länger als LiSKonstanten.C_BLOCKGROESSE_PROBE_SCHWELLE (z.B. USB-Sticks oder
+	   nicht erkannte Netzwerkdateisysteme), wird LiSKonstanten.C_BLOCKGROESSE_NETZWERK verwendet.
+
+	Das Ergebnis liegt stets zwischen LiSKonstanten.C_DATEI_BLOCKGROESSE und LiSKonstanten.C_BLOCKGROESSE_MAXIMUM und ist
+	ein Vielfaches von LiSKonstanten.C_DATEI_BLOCKGROESSE. Fehler bei der Ermittlung führen nie zum Abbruch, sondern zu
+	LiSKonstanten.C_DATEI_BLOCKGROESSE.
+	"""
+	_sBlockgroessenDictionary = dict()
+	_sLock = threading.Lock()
+
+	def __init__(self):
+		if type(self) is Blockgroessenrichtlinie:
+			raise LiSAusnahmen.QAbstractClassError('Blockgroessenrichtlinie kann nicht instanziiert werden.')
+
+	@staticmethod
+	def gibBlockgroesse(pErweiterterPfadString):
+		"""
+		Returniert die Chunkgröße für das Lesen oder Schreiben der Datei pErweiterterPfadString. Existiert die Datei
+		(noch) nicht, wird der Datenträger des übergeordneten Verzeichnisses herangezogen.
+
+		:param pErweiterterPfadString: Erweiterte Pfadangabe zur Datei
+		:type pErweiterterPfadString: String
+		:return: Chunkgröße in Bytes
+		:rtype: int
+		"""
+		try:
+			lPfadString = pErweiterterPfadString if os.path.exists(pErweiterterPfadString) else os.path.dirname(pErweiterterPfadString)
+			lStat = os.stat(lPfadString)
+		except OSError:
+			return LiSKonstanten.C_DATEI_BLOCKGROESSE
+		with Blockgroessenrichtlinie._sLock:
+			lBlockgroesseInteger = Blockgroessenrichtlinie._sBlockgroessenDictionary.get(lStat.st_dev)
+			if lBlockgroesseInteger is None:
+				lBlockgroesseInteger = Blockgroessenrichtlinie._ermittleBlockgroesse(lPfadString, lStat)
+				Blockgroessenrichtlinie._sBlockgroessenDictionary[lStat.st_dev] = lBlockgroesseInteger
+		return lBlockgroesseInteger
+
+	@staticmethod
+	def leereZwischenspeicher():
+		"""
+		Verwirft alle zwischengespeicherten Chunkgrößen (z.B. nach Einbinden anderer Datenträger).
+		"""
+		with Blockgroessenrichtlinie._sLock:
+			Blockgroessenrichtlinie._sBlockgroessenDictionary.clear()
+
+	## --- Interne Methoden
+
+	@staticmethod
+	def _ermittleBlockgroesse(pPfadString, pStat):
+		"""
+		Interne Methode. Ermittelt die Chunkgröße für den Datenträger zu pPfadString (siehe Klassenbeschreibung).
+		"""
+		try:
+			if Blockgroessenrichtlinie._istNetzwerkdateisystem(pPfadString) is True:
+				lBlockgroesseInteger = LiSKonstanten.C_BLOCKGROESSE_NETZWERK
+			else:
+				lBlockgroesseInteger = max(LiSKonstanten.C_BLOCKGROESSE_LOKAL, getattr(pStat, 'st_blksize', 0))
+				if stat.S_ISREG(pStat.st_mode) and pStat.st_size >= LiSKonstanten.C_BLOCKGROESSE_PROBE_GROESSE \
+						and Blockgroessenrichtlinie._messeMittlereLesedauer(pPfadString) > LiSKonstanten.C_BLOCKGROESSE_PROBE_SCHWELLE:
+					lBlockgroesseInteger = max(lBlockgroesseInteger, LiSKonstanten.C_BLOCKGROESSE_NETZWERK)
+		except Exception: # Exception-Handling notwendig, da die Chunkgröße nur die Geschwindigkeit beeinflusst
+			return LiSKonstanten.C_DATEI_BLOCKGROESSE
+		lBlockgroesseInteger = min(lBlockgroesseInteger, LiSKonstanten.C_BLOCKGROESSE_MAXIMUM)
+		return max(LiSKonstanten.C_DATEI_BLOCKGROESSE, lBlockgroesseInteger - lBlockgroesseInteger % LiSKonstanten.C_DATEI_BLOCKGROESSE)
+
+	@staticmethod
+	def _istNetzwerkdateisystem(pPfadString):
+		"""
+		Interne Methode. Returniert True, falls pPfadString auf einem Netzwerkdateisystem liegt.
+		"""
+		if LiSKonstanten.C_PLATTFORM == 'nt' and str.lower(pPfadString).startswith('\\\\?\\unc\\'):
+			return True
+		return LiSWerkzeuge.Dateisystemwerkzeuge.ermittleDateisystemVonPfad(LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(pPfadString)) \
+			in LiSKonstanten.C_BLOCKGROESSE_NETZWERKDATEISYSTEME
+
+	@staticmethod
+	def _messeMittlereLesedauer(pPfadString):
+		"""
+		Interne Methode. Liest die ersten LiSKonstanten.C_BLOCKGROESSE_PROBE_GROESSE Bytes von pPfadString in Schritten von
+		LiSKonstanten.C_DATEI_BLOCKGROESSE und returniert die mittlere Dauer eines Lesezugriffs in Sekunden. Befindet sich
+		die Datei bereits im Cache des Betriebssystems, ist die Dauer entsprechend gering. Der Puffer wird anschließend
+		überschrieben, da es sich z.B. um eine Schlüsseldatei handeln kann.
+		"""
+		lAnzahlZugriffeInteger = LiSKonstanten.C_BLOCKGROESSE_PROBE_GROESSE // LiSKonstanten.C_DATEI_BLOCKGROESSE
+		lPufferBytearray_LOESCHEN = bytearray(LiSKonstanten.C_DATEI_BLOCKGROESSE)
+		try:
+			with open(pPfadString, 'rb', buffering=0) as lDatei:
+				lStartFloat = time.perf_counter()
+				for lZaehlerInteger in range(lAnzahlZugriffeInteger):
+					if not lDatei.readinto(lPufferBytearray_LOESCHEN):
+						break
+				return (time.perf_counter() - lStartFloat) / lAnzahlZugriffeInteger
+		finally:
+			lPufferBytearray_LOESCHEN[:] = bytes(len(lPufferBytearray_LOESCHEN))
@@ -0,0 +1,246 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält die Fortschrittsermittlung einer Programmfunktion (verarbeitete Bytes und Dateien, geglätteter
+Durchsatz und geschätzte Restzeit) für Statusleiste und Kommandozeile.
+"""
+
+from Modell import LiSKonstanten
+
+import logging
+import os
+import stat
+import threading
+import time
+
+class Fortschritt:
+	"""
+	Modelliert den Fortschritt einer Programmfunktion. Der Gesamtumfang (Bytes und Dateien) wird nebenläufig zur
+	Programmfunktion ermittelt (Vorabermittlung), so dass diese ohne Verzögerung beginnt; bis zu deren Abschluss ist keine
+	Restzeit verfügbar. Die Verarbeitungsschleifen melden die jeweils verarbeiteten Bytes über vermerkeBytes(...) und
+	abgeschlossene Dateien über vermerkeDatei(). Ein Stand wird höchstens alle LiSKonstanten.C_FORTSCHRITT_INTERVALL
+	Sekunden returniert (sonst None), der Durchsatz wird dabei exponentiell geglättet.
+
+	Werden Originale nach der Ver- oder Entschlüsselung vernichtet, zählen deren Bytes doppelt (Verarbeitung und
+	Überschreiben); dies entfällt bei der Verschlüsselung am Ort.
+	"""
+
+	def __init__(self, pFunktionString, pOriginaleVernichtenStatusBoolean, pVerschluesselungAmOrtBoolean=False):
+		"""
+		Initialisiert ein Objekt der Klasse Fortschritt.
+
+		:param pFunktionString: Programmfunktion (LiSKonstanten.C_PROGRAMMFUNKTION_..._LITERAL)
+		:type pFunktionString: String
+		:param pOriginaleVernichtenStatusBoolean: Angabe, ob die Originaldateien vernichtet werden (true: ja, false: nein)
+		:type pOriginaleVernichtenStatusBoolean: Boolean
+		:param pVerschluesselungAmOrtBoolean: Angabe, ob die Verschlüsselung am Ort aktiviert ist (true: ja, false: nein)
+		:type pVerschluesselungAmOrtBoolean: Boolean
+		"""
+		self.sFunktionString = pFunktionString
+		self.sOriginaleVernichtenStatusBoolean = pOriginaleVernichtenStatusBoolean
+		self.sVerschluesselungAmOrtBoolean = pVerschluesselungAmOrtBoolean
+		self._sVorabermittlungBeendetEvent = threading.Event()
+		self._setzeZurueck()
+
+	def beginne(self, pErweitertePfadeList):
+		"""
+		Setzt den Fortschritt zurück und startet die Vorabermittlung des Gesamtumfangs zu pErweitertePfadeList.
+
+		:param pErweitertePfadeList: Erweiterte Pfadangaben der zu verarbeitenden Dateien und Verzeichnisse
+		:type pErweitertePfadeList: Liste von Strings
+		"""
+		self.beende()
+		self._setzeZurueck()
+		self._sVorabermittlungBeendetEvent = threading.Event()
+		threading.Thread(target=self._ermittleGesamtumfang, args=(list(pErweitertePfadeList), self._sVorabermittlungBeendetEvent), daemon=True).start()
+
+	def beende(self):
+		"""
+		Beendet eine ggf. noch laufende Vorabermittlung.
+		"""
+		self._sVorabermittlungBeendetEvent.set()
+
+	def vermerkeBytes(self, pAnzahlBytesInteger):
+		"""
+		Vermerkt pAnzahlBytesInteger verarbeitete Bytes.
+
+		:param pAnzahlBytesInteger: Anzahl verarbeiteter Bytes
+		:type pAnzahlBytesInteger: Integer
+		:return: Aktueller Stand (siehe gibStand()), falls eine Meldung fällig ist, sonst None
+		:rtype: Dictionary
+		"""
+		self.sBytesInteger += pAnzahlBytesInteger
+		return self._gibStandFallsFaellig()
+
+	def vermerkeDatei(self):
+		"""
+		Vermerkt eine abgeschlossene Datei.
+
+		:return: Aktueller Stand (siehe gibStand()), falls eine Meldung fällig ist, sonst None
+		:rtype: Dictionary
+		"""
+		self.sDateienInteger += 1
+		return self._gibStandFallsFaellig()
+
+	def gibStand(self):
+		"""
+		Returniert den aktuellen Stand: verarbeitete Bytes und Dateien, Gesamtumfang (None während der Vorabermittlung),
+		geglätteter Durchsatz in MB/s und Dateien/s sowie die geschätzte Restzeit in Sekunden (None, solange Gesamtumfang
+		oder Durchsatz unbekannt sind).
+
+		:return: Stand
+		:rtype: Dictionary
+		"""
+		lRestSekundenFloat = None
+		if self.sGesamtbytesInteger is not None and self.sBytesProSekundeFloat:
+			lRestSekundenFloat = max(0, self.sGesamtbytesInteger - self.sBytesInteger) / self.sBytesProSekundeFloat
+		return {'Bytes': self.sBytesInteger,
+				'Gesamtbytes': self.sGesamtbytesInteger,
+				'Dateien': self.sDateienInteger,
+				'Gesamtdateien': self.sGesamtdateienInteger,
+				'MBProSekunde': round(self.sBytesProSekundeFloat / 1e6, 1) if self.sBytesProSekundeFloat is not None else None,
+				'DateienProSekunde': round(self.sDateienProSekundeFloat, 1) if self.sDateienProSekundeFloat is not None else None,
+				'RestSekunden': round(lRestSekundenFloat) if lRestSekundenFloat is not None else None}
+
+	@staticmethod
+	def formatiere(pStandDictionary):
+		"""
+		Returniert den Stand pStandDictionary als Text für die Statusleiste (z.B. '45 % - 120,3 MB/s - 2,5 Dateien/s - noch 3 min').
+
+		:param pStandDictionary: Stand (siehe gibStand())
+		:type pStandDictionary: Dictionary
+		:return: Text
+		:rtype: String
+		"""
+		lTeileList = []
+		if pStandDictionary['Gesamtbytes']:
+			lTeileList.append(str(min(100, pStandDictionary['Bytes'] * 100 // pStandDictionary['Gesamtbytes'])) + ' %')
+		if pStandDictionary['MBProSekunde'] is not None:
+			lTeileList.append(('%.1f' % pStandDictionary['MBProSekunde']).replace('.', ',') + ' MB/s')
+		if pStandDictionary['DateienProSekunde']:
+			lTeileList.append(('%.1f' % pStandDictionary['DateienProSekunde']).replace('.', ',') + ' Dateien/s')
+		if pStandDictionary['RestSekunden'] is not None:
+			lMinutenInteger, lSekundenInteger = divmod(pStandDictionary['RestSekunden'], 60)
+			lStundenInteger, lMinutenInteger = divmod(lMinutenInteger, 60)
+			if lStundenInteger > 0:
+				lTeileList.append('noch ' + str(lStundenInteger) + ' h ' + str(lMinutenInteger) + ' min')
+			elif lMinutenInteger > 0:
+				lTeileList.append('noch ' + str(lMinutenInteger) + ' min ' + str(lSekundenInteger) + ' s')
+			else:
+				lTeileList.append('noch ' + str(lSekundenInteger) + ' s')
+		return ' - '.join(lTeileList)
+
+	## --- Interne Methoden
+
+	def _setzeZurueck(self):
+		"""
+		Interne Methode. Setzt Zähler, Gesamtumfang und Durchsatz zurück.
+		"""
+		self.sGesamtbytesInteger = None # None, solange die Vorabermittlung läuft
+		self.sGesamtdateienInteger = None
+		self.sBytesInteger = 0
+		self.sDateienInteger = 0
+		self.sBytesProSekundeFloat = None
+		self.sDateienProSekundeFloat = None
+		self._sLetzteMeldungFloat = None
+		self._sBytesBeiLetzterMeldungInteger = 0
+		self._sDateienBeiLetzterMeldungInteger = 0
+
+	def _gibStandFallsFaellig(self):
+		"""
+		Interne Methode. Aktualisiert den geglätteten Durchsatz und returniert den Stand, falls seit der letzten Meldung
+		mindestens LiSKonstanten.C_FORTSCHRITT_INTERVALL Sekunden vergangen sind, sonst None. Die Messung beginnt mit
+		der ersten Vermerkung (d.h. nach der Schlüsselableitung).
+		"""
+		lJetztFloat = time.monotonic()
+		if self._sLetzteMeldungFloat is None:
+			self._sLetzteMeldungFloat = lJetztFloat
+			return None
+		lDauerFloat = lJetztFloat - self._sLetzteMeldungFloat
+		if lDauerFloat < LiSKonstanten.C_FORTSCHRITT_INTERVALL:
+			return None
+		self.sBytesProSekundeFloat = self._glaette(self.sBytesProSekundeFloat, (self.sBytesInteger - self._sBytesBeiLetzterMeldungInteger) / lDauerFloat)
+		self.sDateienProSekundeFloat = self._glaette(self.sDateienProSekundeFloat, (self.sDateienInteger - self._sDateienBeiLetzterMeldungInteger) / lDauerFloat)
+		self._sLetzteMeldungFloat = lJetztFloat
+		self._sBytesBeiLetzterMeldungInteger = self.sBytesInteger
+		self._sDateienBeiLetzterMeldungInteger = self.sDateienInteger
+		return self.gibStand()
+
+	@staticmethod
+	def _glaette(pBisherFloat, pAktuellFloat):
+		"""
+		Interne Methode. Returniert den exponentiell geglätteten Wert.
+		"""
+		if pBisherFloat is None:
+			return pAktuellFloat
+		return LiSKonstanten.C_FORTSCHRITT_GLAETTUNGSFAKTOR * pAktuellFloat + (1 - LiSKonstanten.C_FORTSCHRITT_GLAETTUNGSFAKTOR) * pBisherFloat
+
+	def _ermittleGesamtumfang(self, pErweitertePfadeList, pBeendetEvent):
+		"""
+		Interne Methode (Thread der Vorabermittlung). Ermittelt Anzahl und Gesamtgröße der zu verarbeitenden Dateien
+		nach denselben Regeln wie der Funktionsausfuehrer (keine Verweise und FIFOs, Dateiendung je Programmfunktion).
+		"""
+		lGesamtbytesInteger = 0
+		lGesamtdateienInteger = 0
+		try:
+			for lErweiterterPfadString in pErweitertePfadeList:
+				if lErweiterterPfadString == LiSKonstanten.C_DATENSTROM_PFADANGABE: # Umfang eines Datenstroms ist unbekannt
+					continue
+				if os.path.isdir(lErweiterterPfadString) and not os.path.islink(lErweiterterPfadString):
+					for lWurzel, lVerzeichnisse, lDateien in os.walk(lErweiterterPfadString):
+						for lDateiname in lDateien:
+							if pBeendetEvent.is_set():
+								return
+							lGroesseInteger = self._gibZuVerarbeitendeBytes(os.path.join(lWurzel, lDateiname))
+							if lGroesseInteger is not None:
+								lGesamtbytesInteger += lGroesseInteger
+								lGesamtdateienInteger += 1
+				else:
+					lGroesseInteger = self._gibZuVerarbeitendeBytes(lErweiterterPfadString)
+					if lGroesseInteger is not None:
+						lGesamtbytesInteger += lGroesseInteger
+						lGesamtdateienInteger += 1
+		except OSError:
+			logging.exception('Fehler bei der Vorabermittlung des Gesamtumfangs')
+			return
+		if not pBeendetEvent.is_set():
+			self.sGesamtdateienInteger = lGesamtdateienInteger
+			self.sGesamtbytesInteger = lGesamtbytesInteger
+
+	def _gibZuVerarbeitendeBytes(self, pErweiterterPfadString):
+		"""
+		Interne Methode. Returniert die für die Datei pErweiterterPfadString zu verarbeitenden Bytes oder None, falls sie
+		von der Programmfunktion nicht verarbeitet wird.
+		"""
+		try:
+			lStat = os.lstat(pErweiterterPfadString)
+		except OSError:
+			return None
+		if not stat.S_ISREG(lStat.st_mode):
+			return None
+		lVerschluesseltBoolean = str.lower(pErweiterterPfadString).endswith(LiSKonstanten.C_DATEIENDUNG)
+		if self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL:
+			return lStat.st_size
+		if (self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL) is lVerschluesseltBoolean:
+			return None
+		if self.sOriginaleVernichtenStatusBoolean is True \
+				and not (self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL and self.sVerschluesselungAmOrtBoolean is True
+						 and lStat.st_size >= LiSKonstanten.C_AM_ORT_MINDESTGROESSE):
+			return 2 * lStat.st_size
+		return lStat.st_size
@@ -0,0 +1,230 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält eine Klasse zur schlüssellosen Inspektion der Header verschlüsselter Dateien.
+"""
+
+from Modell import LiSAusnahmen, LiSKonstanten, LiSKrypto
+from Sonstiges import LiSWerkzeuge
+
+import concurrent.futures
+import datetime
+import json
+import os
+import struct
+import sys
+
+class Headerinspektion:
+	"""
+	Stellt statische Methoden zur Verfügung, um die Header verschlüsselter Dateien ohne Schlüssel auszulesen
+	(Verfahren, Originalgröße, Zeitstempel, Scrypt-Parameter) und daraus eine Bestandsübersicht zu erstellen.
+	Es wird ausschließlich der Header gelesen, d.h. die Laufzeit ist unabhängig von der Dateigröße.
+	"""
+	def __init__(self):
+		if type(self) is Headerinspektion:
+			raise LiSAusnahmen.QAbstractClassError('Headerinspektion kann nicht instanziiert werden.')
+
+	@staticmethod
+	def inspiziereDatei(pErweiterterPfadZuDateiString):
+		"""
+		Liest den Header der Datei pErweiterterPfadZuDateiString aus und returniert die enthaltenen (nicht geheimen)
+		Angaben als JSON-serialisierbares Dictionary. Kann der Header nicht gelesen werden, enthält das Dictionary
+		den Eintrag 'Fehler'.
+
+		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zur Datei
+		:type pErweiterterPfadZuDateiString: String
+		:return: Headerangaben zur Datei
+		:rtype: Dictionary
+		"""
+		lErgebnisDictionary = {'Pfad': LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)}
+		try:
+			with open(pErweiterterPfadZuDateiString, 'rb') as lQuelldatei:
+				lDateigroesseInteger = os.fstat(lQuelldatei.fileno()).st_size
+				if lQuelldatei.read(4) != b'LiSX':
+					lErgebnisDictionary['Fehler'] = 'Keine LiSCrypt-Datei'
+					return lErgebnisDictionary
+				lHeaderDictionary = LiSKrypto.QDatei._liesHeaderAusDatei(lQuelldatei)
+				lHeaderlaengeInteger = lQuelldatei.tell()
+		except struct.error:
+			lErgebnisDictionary['Fehler'] = 'Header unvollständig'
+			return lErgebnisDictionary
+		except ValueError:
+			lErgebnisDictionary['Fehler'] = 'Header ungültig'
+			return lErgebnisDictionary
+		except OSError as lException:
+			lErgebnisDictionary['Fehler'] = 'Nicht lesbar (' + lException.__class__.__name__ + ')'
+			return lErgebnisDictionary
+
+		if lHeaderDictionary is None:
+			lErgebnisDictionary['Fehler'] = 'Unbekanntes Verfahren'
+			return lErgebnisDictionary
+
+		lVerfahrenKennungInteger = lHeaderDictionary['VerfahrenKennungInteger']
+		lErgebnisDictionary['Verfahrenskennung'] = lVerfahrenKennungInteger
+		lErgebnisDictionary['Verfahren'] = LiSKonstanten.C_VERFAHREN_BEZEICHNUNGEN.get(lVerfahrenKennungInteger, str(lVerfahrenKennungInteger))
+		lErgebnisDictionary['Dateigroesse'] = lDateigroesseInteger
+		if lVerfahrenKennungInteger == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM: # Originalgröße steht erst im (verschlüsselten) Trailersegment
+			try:
+				lErgebnisDictionary['Originalgroesse'] = LiSKrypto.Segmentwerkzeuge.gibOriginalgroesseVonDatenstrom(lHeaderDictionary, lHeaderlaengeInteger, lDateigroesseInteger)
+			except ValueError:
+				lErgebnisDictionary['Fehler'] = 'Datei unvollständig'
+				return lErgebnisDictionary
+		elif lVerfahrenKennungInteger == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV: # Länge von Inhalt und Inhaltsverzeichnis (unverschlüsselt nicht getrennt)
+			try:
+				lErgebnisDictionary['Originalgroesse'] = LiSKrypto.Segmentwerkzeuge.gibOriginalgroesseVonDatenstrom(lHeaderDictionary, lHeaderlaengeInteger, lDateigroesseInteger,
+																													 LiSKrypto.QArchiv.C_TRAILER_STRUCT.size)
+			except ValueError:
+				lErgebnisDictionary['Fehler'] = 'Datei unvollständig'
+				return lErgebnisDictionary
+		else:
+			lErgebnisDictionary['Originalgroesse'] = lHeaderDictionary['DateiOriginalgroesse']
+		lErgebnisDictionary['OriginalAenderungsdatum'] = Headerinspektion._formatiereZeitstempel(lHeaderDictionary['DateiOriginalAenderungsdatumInteger'])
+		lErgebnisDictionary['OriginalZugriffsdatum'] = Headerinspektion._formatiereZeitstempel(lHeaderDictionary['DateiOriginalZugriffsdatumInteger'])
+		lErgebnisDictionary['ScryptN'] = lHeaderDictionary['ScryptAufwandsfaktorInteger']
+		lErgebnisDictionary['ScryptR'] = lHeaderDictionary['ScryptBlockgroesseInteger']
+		lErgebnisDictionary['ScryptP'] = lHeaderDictionary['ScryptParallelisierungInteger']
+		lErgebnisDictionary['ScryptSaltlaenge'] = lHeaderDictionary['ScryptSaltlaengeInteger']
+		if 'SegmentgroesseInteger' in lHeaderDictionary:
+			lErgebnisDictionary['Segmentgroesse'] = lHeaderDictionary['SegmentgroesseInteger']
+		return lErgebnisDictionary
+
+	@staticmethod
+	def inspiziereEintraege(pErweitertePfadeList, pAnzahlThreadsInteger=LiSKonstanten.C_INSPEKTION_ANZAHL_THREADS):
+		"""
+		Inspiziert alle Dateien zu den Pfadangaben in pErweitertePfadeList parallel mit pAnzahlThreadsInteger Threads.
+		Verzeichnisse werden rekursiv nach Dateien mit der Endung LiSKonstanten.C_DATEIENDUNG durchsucht. Die
+		Ergebnisse werden in der Reihenfolge der Eingabe (Generator) returniert.
+
+		:param pErweitertePfadeList: Erweiterte Pfadangaben zu Dateien und Verzeichnissen
+		:type pErweitertePfadeList: Liste von Strings
+		:param pAnzahlThreadsInteger: Anzahl paralleler Threads
+		:type pAnzahlThreadsInteger: int
+		:return: Headerangaben je Datei (siehe inspiziereDatei)
+		:rtype: Generator von Dictionaries
+		"""
+		with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, pAnzahlThreadsInteger)) as lExecutor:
+			yield from lExecutor.map(Headerinspektion.inspiziereDatei, Headerinspektion._ermittleDateien(pErweitertePfadeList))
+
+	@staticmethod
+	def ermittleBestandsuebersicht(pErgebnisseIterable):
+		"""
+		Fasst die Ergebnisse von inspiziereDatei zu einer Bestandsübersicht zusammen (Anzahl Dateien, Summe der
+		Original- und Dateigrößen, Verteilung der Verfahren und der Scrypt-Parameter).
+
+		:param pErgebnisseIterable: Ergebnisse von inspiziereDatei
+		:type pErgebnisseIterable: Iterable von Dictionaries
+		:return: Bestandsübersicht
+		:rtype: Dictionary
+		"""
+		lUebersichtDictionary = {'AnzahlDateien': 0,
+								 'AnzahlFehler': 0,
+								 'SummeOriginalgroesse': 0,
+								 'SummeDateigroesse': 0,
+								 'Verfahren': dict(),
+								 'ScryptParameter': dict()}
+		for lErgebnisDictionary in pErgebnisseIterable:
+			lUebersichtDictionary['AnzahlDateien'] += 1
+			if 'Fehler' in lErgebnisDictionary:
+				lUebersichtDictionary['AnzahlFehler'] += 1
+				continue
+			lUebersichtDictionary['SummeOriginalgroesse'] += lErgebnisDictionary['Originalgroesse']
+			lUebersichtDictionary['SummeDateigroesse'] += lErgebnisDictionary['Dateigroesse']
+			lVerfahrenString = lErgebnisDictionary['Verfahren']
+			lUebersichtDictionary['Verfahren'][lVerfahrenString] = lUebersichtDictionary['Verfahren'].get(lVerfahrenString, 0) + 1
+			lParameterString = 'N={},r={},p={}'.format(lErgebnisDictionary['ScryptN'], lErgebnisDictionary['ScryptR'], lErgebnisDictionary['ScryptP'])
+			lUebersichtDictionary['ScryptParameter'][lParameterString] = lUebersichtDictionary['ScryptParameter'].get(lParameterString, 0) + 1
+		return lUebersichtDictionary
+
+	@staticmethod
+	def gibJSONZeilenAus(pErweitertePfadeList, pAnzahlThreadsInteger=LiSKonstanten.C_INSPEKTION_ANZAHL_THREADS, pAusgabeFile=sys.stdout):
+		"""
+		Gibt die Headerangaben zu allen Dateien aus pErweitertePfadeList als JSON-Zeilen (eine Zeile pro Datei) und
+		abschließend die Bestandsübersicht als eigene JSON-Zeile aus.
+
+		:param pErweitertePfadeList: Erweiterte Pfadangaben zu Dateien und Verzeichnissen
+		:type pErweitertePfadeList: Liste von Strings
+		:param pAnzahlThreadsInteger: Anzahl paralleler Threads
+		:type pAnzahlThreadsInteger: int
+		:param pAusgabeFile: Zum Schreiben geöffnete Textdatei (Default: Standardausgabe)
+		:type pAusgabeFile: File-Objekt
+		:return: Anzahl der Dateien, deren Header nicht gelesen werden konnte
+		:rtype: int
+		"""
+		lErgebnisseList = []
+		try:
+			for lErgebnisDictionary in Headerinspektion.inspiziereEintraege(pErweitertePfadeList, pAnzahlThreadsInteger):
+				pAusgabeFile.write(json.dumps(lErgebnisDictionary, ensure_ascii=False) + '\n')
+				lErgebnisseList.append(lErgebnisDictionary)
+			lUebersichtDictionary = Headerinspektion.ermittleBestandsuebersicht(lErgebnisseList)
+			pAusgabeFile.write(json.dumps({'Bestandsuebersicht': lUebersichtDictionary}, ensure_ascii=False) + '\n')
+			pAusgabeFile.flush()
+		except BrokenPipeError:
+			# Leser hat die Ausgabe vorzeitig geschlossen (z.B. ... | head -1): Ausgabe ohne Traceback beenden und die
+			# restliche gepufferte Ausgabe ins Leere umleiten, damit auch das Schließen beim Programmende nicht scheitert:
+			if pAusgabeFile is sys.stdout:
+				lNullDeskriptorInteger = os.open(os.devnull, os.O_WRONLY)
+				os.dup2(lNullDeskriptorInteger, sys.stdout.fileno())
+				os.close(lNullDeskriptorInteger)
+			return Headerinspektion.ermittleBestandsuebersicht(lErgebnisseList)['AnzahlFehler']
+		return lUebersichtDictionary['AnzahlFehler']
+
+	## --- Interne Hilfsmethoden
+
+	@staticmethod
+	def _ermittleDateien(pErweitertePfadeList):
+		"""
+		Interne Methode. Returniert die erweiterten Pfade aller zu inspizierenden Dateien. Explizit angegebene Dateien
+		werden unabhängig von ihrer Endung berücksichtigt, Verzeichnisse werden rekursiv nach Dateien mit der Endung
+		LiSKonstanten.C_DATEIENDUNG durchsucht. Verknüpfungen werden ignoriert.
+
+		:param pErweitertePfadeList: Erweiterte Pfadangaben zu Dateien und Verzeichnissen
+		:type pErweitertePfadeList: Liste von Strings
+		:return: Erweiterte Pfadangaben zu Dateien
+		:rtype: Generator von Strings
+		"""
+		for lErweiterterPfadString in pErweitertePfadeList:
+			if os.path.islink(lErweiterterPfadString):
+				continue
+			if os.path.isdir(lErweiterterPfadString):
+				for lWurzelString, lVerzeichnisseList, lDateienList in os.walk(lErweiterterPfadString):
+					lDateienList.sort(key=str.lower)
+					lVerzeichnisseList.sort(key=str.lower)
+					for lDateinameString in lDateienList:
+						if str.lower(lDateinameString).endswith(LiSKonstanten.C_DATEIENDUNG):
+							lErweiterterPfadZuDateiString = os.path.join(lWurzelString, lDateinameString)
+							if not os.path.islink(lErweiterterPfadZuDateiString):
+								yield lErweiterterPfadZuDateiString
+			else:
+				yield lErweiterterPfadString
+
+	@staticmethod
+	def _formatiereZeitstempel(pZeitstempelNanosekundenInteger):
+		"""
+		Interne Methode. Returniert den Zeitstempel pZeitstempelNanosekundenInteger (Nanosekunden seit Epoch) im
+		ISO-8601-Format (lokale Zeit).
+
+		:param pZeitstempelNanosekundenInteger: Zeitstempel in Nanosekunden
+		:type pZeitstempelNanosekundenInteger: int
+		:return: Zeitstempel im ISO-8601-Format (oder None, falls nicht darstellbar)
+		:rtype: String
+		"""
+		try:
+			return datetime.datetime.fromtimestamp(pZeitstempelNanosekundenInteger / 1e9).isoformat(timespec='seconds')
+		except (OverflowError, OSError, ValueError):
+			return None
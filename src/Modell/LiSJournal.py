@@ -0,0 +1,238 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält das Journal, mit dem unterbrochene Ver- und Entschlüsselungen im segmentierten Verfahren
+fortgesetzt werden können.
+"""
+
+from Modell import LiSKonstanten
+
+import hashlib
+import os
+import struct
+
+class Segmentjournal:
+	"""
+	Modelliert das Journal zu einer Ver- oder Entschlüsselung im Verfahren LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4.
+	Das Journal vermerkt die Zieldatei, den Header samt Hashwert und die Anzahl der vollständig geschriebenen
+	Datensegmente. Es wird erst geschrieben, nachdem die Zieldatei bis einschließlich dieser Segmente auf den Datenträger
+	übertragen wurde (fsync), und atomar ersetzt, so dass es nach einem Absturz nie mehr Segmente vermerkt, als
+	tatsächlich vorhanden sind.
+
+	Aufbau: 'LiSJ' | Version (>H) | SHA256-Hashwert des Headers (32 Bytes) | Anzahl Datensegmente (>Q) |
+	Länge des Zieldateipfads (>I) | Zieldateipfad (UTF-8) | Länge des Headers (>I) | Header
+
+	Der Header selbst wird benötigt, wenn er bei einer Unterbrechung noch nicht in der Zieldatei steht (Verschlüsselung am
+	Ort, dort zählen die abgeschlossenen Datensegmente vom Dateiende her). Er enthält keine geheimen Daten.
+
+	Die Journale liegen in LiSKonstanten.C_JOURNAL_PFAD; der Dateiname ergibt sich aus Programmfunktion und Quelldatei.
+	"""
+	C_JOURNAL_KENNUNG_BYTES = b'LiSJ'
+	C_JOURNAL_VERSION_INTEGER = 1
+
+	def __init__(self, pProgrammfunktionString, pErweiterterPfadZuQuelldateiString):
+		"""
+		Initialisiert ein Objekt der Klasse Segmentjournal.
+
+		:param pProgrammfunktionString: LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL oder LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL
+		:type pProgrammfunktionString: String
+		:param pErweiterterPfadZuQuelldateiString: Erweiterte Pfadangabe zur Quelldatei
+		:type pErweiterterPfadZuQuelldateiString: String
+		"""
+		lSchluesselBytes = (pProgrammfunktionString + '\x00' + os.path.normcase(os.path.abspath(pErweiterterPfadZuQuelldateiString))).encode('utf-8', 'surrogateescape')
+		self.sErweiterterPfadZuJournalString = os.path.join(LiSKonstanten.C_JOURNAL_PFAD, hashlib.sha256(lSchluesselBytes).hexdigest() + LiSKonstanten.C_JOURNAL_ENDUNG)
+		self.sErweiterterPfadZuZieldateiString = None
+		self.sHeaderHashBytes = None
+		self.sHeaderBytes = b''
+		self.sAbgeschlosseneSegmenteInteger = 0
+		self.sGesichertesSegmentInteger = 0
+
+	def lies(self):
+		"""
+		Liest das Journal und returniert dessen Inhalt oder None, falls kein (gültiges) Journal vorhanden ist.
+
+		:return: Zieldatei ('Zieldatei'), Header-Hashwert ('HeaderHashBytes'), Header ('HeaderBytes') und Anzahl abgeschlossener Datensegmente ('AbgeschlosseneSegmenteInteger')
+		:rtype: Dictionary
+		"""
+		try:
+			with open(self.sErweiterterPfadZuJournalString, 'rb') as lJournaldatei:
+				lJournalBytes = lJournaldatei.read()
+			lPositionInteger = len(Segmentjournal.C_JOURNAL_KENNUNG_BYTES)
+			if lJournalBytes[:lPositionInteger] != Segmentjournal.C_JOURNAL_KENNUNG_BYTES:
+				return None
+			if struct.unpack_from('>H', lJournalBytes, lPositionInteger)[0] != Segmentjournal.C_JOURNAL_VERSION_INTEGER:
+				return None
+			lPositionInteger += struct.calcsize('>H')
+			lHeaderHashBytes = lJournalBytes[lPositionInteger:lPositionInteger + 32]
+			lPositionInteger += 32
+			lAbgeschlosseneSegmenteInteger, lPfadlaengeInteger = struct.unpack_from('>QI', lJournalBytes, lPositionInteger)
+			lPositionInteger += struct.calcsize('>QI')
+			lZieldateiBytes = lJournalBytes[lPositionInteger:lPositionInteger + lPfadlaengeInteger]
+			lPositionInteger += lPfadlaengeInteger
+			lHeaderlaengeInteger = struct.unpack_from('>I', lJournalBytes, lPositionInteger)[0]
+			lPositionInteger += struct.calcsize('>I')
+			lHeaderBytes = lJournalBytes[lPositionInteger:lPositionInteger + lHeaderlaengeInteger]
+			lPositionInteger += lHeaderlaengeInteger
+			if len(lHeaderHashBytes) != 32 or len(lZieldateiBytes) != lPfadlaengeInteger or lPositionInteger != len(lJournalBytes) \
+					or hashlib.sha256(lHeaderBytes).digest() != lHeaderHashBytes:
+				return None
+			return {'Zieldatei': lZieldateiBytes.decode('utf-8', 'surrogateescape'),
+					'HeaderHashBytes': lHeaderHashBytes,
+					'HeaderBytes': lHeaderBytes,
+					'AbgeschlosseneSegmenteInteger': lAbgeschlosseneSegmenteInteger}
+		except (OSError, struct.error, UnicodeDecodeError):
+			return None
+
+	def gibFortsetzbareZieldatei(self):
+		"""
+		Returniert die im Journal vermerkte Zieldatei, falls diese (als reguläre Datei) noch existiert, sonst None.
+
+		:return: Erweiterte Pfadangabe zur Zieldatei oder None
+		:rtype: String
+		"""
+		lJournalDictionary = self.lies()
+		if lJournalDictionary is not None and lJournalDictionary['AbgeschlosseneSegmenteInteger'] > 0 \
+				and os.path.isfile(lJournalDictionary['Zieldatei']) and not os.path.islink(lJournalDictionary['Zieldatei']):
+			return lJournalDictionary['Zieldatei']
+		return None
+
+	def istAktiv(self):
+		"""
+		Returniert True, wenn das Journal zur aktuellen Verarbeitung mittels beginne(...) angelegt wurde.
+
+		:rtype: Boolean
+		"""
+		return self.sErweiterterPfadZuZieldateiString is not None
+
+	def beginne(self, pErweiterterPfadZuZieldateiString, pHeaderBytes, pAbgeschlosseneSegmenteInteger=0):
+		"""
+		Legt das Journal für die Verarbeitung in pErweiterterPfadZuZieldateiString an (bzw. setzt es fort).
+
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zur Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		:param pHeaderBytes: Vollständiger Header der verschlüsselten Datei
+		:type pHeaderBytes: Bytesequenz
+		:param pAbgeschlosseneSegmenteInteger: Anzahl bereits vollständig in der Zieldatei vorhandener Datensegmente
+		:type pAbgeschlosseneSegmenteInteger: int
+		"""
+		self.sErweiterterPfadZuZieldateiString = pErweiterterPfadZuZieldateiString
+		self.sHeaderHashBytes = hashlib.sha256(pHeaderBytes).digest()
+		self.sHeaderBytes = pHeaderBytes
+		self.sAbgeschlosseneSegmenteInteger = pAbgeschlosseneSegmenteInteger
+		self._schreibe(pAbgeschlosseneSegmenteInteger)
+
+	def vermerkeSegment(self, pZieldateiFile, pSegmentIndexInteger):
+		"""
+		Vermerkt, dass das Datensegment pSegmentIndexInteger (und damit alle vorherigen) in pZieldateiFile geschrieben
+		wurde. Alle LiSKonstanten.C_JOURNAL_INTERVALL_SEGMENTE Segmente wird die Zieldatei auf den Datenträger übertragen
+		und das Journal aktualisiert.
+
+		:param pZieldateiFile: Zum Schreiben geöffnete Zieldatei
+		:type pZieldateiFile: File-Objekt
+		:param pSegmentIndexInteger: Index des zuletzt geschriebenen Datensegments
+		:type pSegmentIndexInteger: int
+		"""
+		self.sAbgeschlosseneSegmenteInteger = pSegmentIndexInteger
+		if pSegmentIndexInteger - self.sGesichertesSegmentInteger >= LiSKonstanten.C_JOURNAL_INTERVALL_SEGMENTE:
+			pZieldateiFile.flush()
+			os.fsync(pZieldateiFile.fileno())
+			self._schreibe(pSegmentIndexInteger)
+
+	def sichereSegmente(self, pZieldateiFile, pAbgeschlosseneSegmenteInteger):
+		"""
+		Überträgt pZieldateiFile auf den Datenträger und vermerkt anschließend pAbgeschlosseneSegmenteInteger
+		abgeschlossene Datensegmente im Journal (unabhängig von LiSKonstanten.C_JOURNAL_INTERVALL_SEGMENTE).
+
+		:param pZieldateiFile: Zum Schreiben geöffnete Zieldatei
+		:type pZieldateiFile: File-Objekt
+		:param pAbgeschlosseneSegmenteInteger: Anzahl abgeschlossener Datensegmente
+		:type pAbgeschlosseneSegmenteInteger: int
+		"""
+		pZieldateiFile.flush()
+		os.fsync(pZieldateiFile.fileno())
+		self.sAbgeschlosseneSegmenteInteger = pAbgeschlosseneSegmenteInteger
+		self._schreibe(pAbgeschlosseneSegmenteInteger)
+
+	def sichere(self):
+		"""
+		Überträgt die (bereits geschlossene) Zieldatei auf den Datenträger und vermerkt alle bisher geschriebenen
+		Datensegmente im Journal (z.B. nach Abbruch durch den Nutzer). Wurde das Journal noch nicht mittels beginne(...)
+		übernommen (z.B. Abbruch während der Prüfung einer Fortsetzung), bleibt ein vorhandenes Journal unverändert.
+
+		:return: True, wenn eine Fortsetzung möglich ist, sonst False
+		:rtype: Boolean
+		"""
+		if self.istAktiv() is False:
+			return self.gibFortsetzbareZieldatei() is not None
+		if self.sAbgeschlosseneSegmenteInteger == 0:
+			return False
+		with open(self.sErweiterterPfadZuZieldateiString, 'rb+') as lZieldatei:
+			os.fsync(lZieldatei.fileno())
+		self._schreibe(self.sAbgeschlosseneSegmenteInteger)
+		return True
+
+	def stimmtUeberein(self, pJournalDictionary, pErweiterterPfadZuZieldateiString, pHeaderBytes):
+		"""
+		Prüft, ob der mittels lies() ermittelte Journalinhalt zu Zieldatei und Header gehört.
+
+		:param pJournalDictionary: Journalinhalt (vgl. lies())
+		:type pJournalDictionary: Dictionary
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zur Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		:param pHeaderBytes: Vollständiger Header der verschlüsselten Datei
+		:type pHeaderBytes: Bytesequenz
+		:rtype: Boolean
+		"""
+		return pJournalDictionary is not None \
+			and pJournalDictionary['Zieldatei'] == pErweiterterPfadZuZieldateiString \
+			and pJournalDictionary['HeaderHashBytes'] == hashlib.sha256(pHeaderBytes).digest()
+
+	def entferne(self):
+		"""
+		Entfernt das Journal (nach Abschluss oder Verwerfen der Verarbeitung). Das Journal enthält keine geheimen Daten
+		und wird daher nicht vernichtet, sondern gelöscht.
+		"""
+		self.sErweiterterPfadZuZieldateiString = None
+		try:
+			os.remove(self.sErweiterterPfadZuJournalString)
+		except FileNotFoundError:
+			pass
+
+	## --- Interne Methoden
+
+	def _schreibe(self, pAbgeschlosseneSegmenteInteger):
+		"""
+		Interne Methode. Ersetzt das Journal atomar durch den aktuellen Stand.
+		"""
+		lZieldateiBytes = self.sErweiterterPfadZuZieldateiString.encode('utf-8', 'surrogateescape')
+		lJournalBytes = b''.join([Segmentjournal.C_JOURNAL_KENNUNG_BYTES,
+								  struct.pack('>H', Segmentjournal.C_JOURNAL_VERSION_INTEGER),
+								  self.sHeaderHashBytes,
+								  struct.pack('>QI', pAbgeschlosseneSegmenteInteger, len(lZieldateiBytes)),
+								  lZieldateiBytes,
+								  struct.pack('>I', len(self.sHeaderBytes)),
+								  self.sHeaderBytes])
+		os.makedirs(LiSKonstanten.C_JOURNAL_PFAD, exist_ok=True)
+		lTemporaererPfadString = self.sErweiterterPfadZuJournalString + '.tmp'
+		with open(lTemporaererPfadString, 'wb') as lJournaldatei:
+			lJournaldatei.write(lJournalBytes)
+			lJournaldatei.flush()
+			os.fsync(lJournaldatei.fileno())
+		os.replace(lTemporaererPfadString, self.sErweiterterPfadZuJournalString)
+		self.sGesichertesSegmentInteger = pAbgeschlosseneSegmenteInteger
@@ -44,6 +44,10 @@ class Konfiguration:
 	G_DATEIDIALOG_VERZEICHNIS = LiSKonstanten.C_HOME_PFAD
 	G_SERVER_PORT = None
 
+	# Angabe, ob liesKonfigurationEin() bereits ausgeführt wurde (weitere Instanzen benötigen die Konfigurationsdatei
+	# bei Verwendung eines Unix-Domain-Sockets nicht):
+	G_KONFIGURATION_EINGELESEN = False
+
 	@classmethod
 	def liesKonfigurationEin(klass):
 		"""
@@ -76,6 +80,7 @@ class Konfiguration:
 						os.mkdir(LiSKonstanten.C_KONFIG_UND_LOG_PFAD)
 					except OSError: # Konfigurations- und Logverzeichnis existiert nicht. Kann es auch nicht anlegen.
 						raise
+		klass.G_KONFIGURATION_EINGELESEN = True
 		klass.parseAufrufparameter()
 
 	@classmethod
@@ -129,6 +134,35 @@ class Konfiguration:
 		"""
 		Wertet die Aufrufparameter aus und legt den Ergebnis-Namespace global ab.
 		"""
+		klass.G_AUFRUF_PARAMETER = klass._erzeugeArgumentParser().parse_args()
+
+	@classmethod
+	def ermittleAufrufparameterAusArgumenten(klass, pArgumenteList):
+		"""
+		Wertet die (von einer weiteren Instanz übergebenen) Kommandozeilenargumente pArgumenteList aus, ohne die eigenen
+		Aufrufparameter zu verändern, und returniert sie in der Ordnung von gibAurufparameterAlsGeordneteListe().
+
+		:param pArgumenteList: Kommandozeilenargumente (ohne Programmname)
+		:type pArgumenteList: Liste von Strings
+		:return: Geordnete Liste der Aufrufparameter oder None, falls die Argumente unzulässig sind
+		:rtype: Liste von Strings
+		"""
+		try:
+			lAufrufparameterNamespace = klass._erzeugeArgumentParser().parse_args(pArgumenteList)
+		except SystemExit: # argparse beendet bei unzulässigen Argumenten (und -h) den Prozess
+			return None
+		lAufrufparameterList = [lAufrufparameterNamespace.logging, lAufrufparameterNamespace.action, lAufrufparameterNamespace.originals, lAufrufparameterNamespace.keytype]
+		lAufrufparameterList.extend(lAufrufparameterNamespace.items)
+		return lAufrufparameterList
+
+	@classmethod
+	def _erzeugeArgumentParser(klass):
+		"""
+		Interne Methode. Erzeugt den Parser für die Aufrufparameter.
+
+		:return: Parser
+		:rtype: argparse.ArgumentParser
+		"""
 		lParserArgumentParser = argparse.ArgumentParser()
 		lParserArgumentParser.add_argument_group('group')
 		lParserArgumentParser.add_argument('-f', '--logfile', action='store_const', help='log exceptions to file', dest='logging', const='file')
@@ -138,6 +172,29 @@ class Konfiguration:
 										   help='set program action: encryption', dest='action', const='encrypt')
 		lFunktionsgruppeGroup.add_argument('-d', '--decrypt', action='store_const', help='set program action: decryption (default)',
 										   dest='action', const='decrypt')
+		lFunktionsgruppeGroup.add_argument('-i', '--inspect', action='store_const',
+										   help='set program action: print header data of encrypted files as JSON lines without key (no GUI)',
+										   dest='action', const='inspect')
+		lParserArgumentParser.add_argument('-j', '--jobs', type=int, default=LiSKonstanten.C_INSPEKTION_ANZAHL_THREADS, metavar='N',
+										   help='number of parallel threads for program action inspect (default: %(default)s)', dest='jobs')
+		lParserArgumentParser.add_argument('--profile', nargs='?', choices=['cpu', 'memory'], const='cpu', metavar='{cpu,memory}',
+										   help='profile each program action with cProfile (memory: additionally trace allocations) and write LiSCrypt.pstats and LiSCrypt_Speicher.txt next to the log file', dest='profile')
+		lParserArgumentParser.add_argument('--trace', metavar='PATH', help='record per-phase timings (key derivation, read, cipher, HMAC, write, fsync, rename, wipe) and write them as Chrome trace JSON to PATH', dest='trace')
+
+		lOhneGUIGroup = lParserArgumentParser.add_argument_group('headless', 'run program action without GUI, print progress as JSON lines')
+		lOhneGUIGroup.add_argument('--headless', action='store_true', help='run program action without GUI and without master/slave communication', dest='headless')
+		lSchluesselquelleGroup = lOhneGUIGroup.add_mutually_exclusive_group()
+		lSchluesselquelleGroup.add_argument('--key-fd', type=int, metavar='FD', help='read password (first line) from file descriptor FD (e.g. 0 for stdin)', dest='keyfd')
+		if LiSKonstanten.C_IQB_VERSION is False:
+			lSchluesselquelleGroup.add_argument('--key-file', metavar='PATH', help='use key file PATH', dest='keyfilepath')
+		lOhneGUIGroup.add_argument('--overwrite', choices=sorted(LiSKonstanten.C_UEBERSCHREIBENKOMMANDOZEILE_ANTWORTEN), default='skip',
+								   help='policy for existing target files (default: %(default)s)', dest='overwrite')
+		lOhneGUIGroup.add_argument('--in-place', action='store_true', dest='inplace',
+								   help='encrypt large files in place and rename them instead of writing a copy and wiping the original (only with -o)')
+		lOhneGUIGroup.add_argument('--archive', action='store_true', dest='archive',
+								   help='encrypt each directory as a single archive next to it instead of one encrypted file per file (only with -e)')
+		lOhneGUIGroup.add_argument('--select', action='append', metavar='PATTERN', dest='select',
+								   help='decrypt only archive entries whose relative path matches PATTERN (fnmatch, e.g. "docs/*.txt"; repeatable, only with -d)')
 		if LiSKonstanten.C_IQB_VERSION is False:
 			lFunktionsgruppeGroup.add_argument('-w', '--wipe', action='store_const',
 											   help='set program action: wipe', dest='action', const='wipe')
@@ -159,5 +216,5 @@ class Konfiguration:
 			lParserArgumentParser.set_defaults(logging='screen', action='decrypt', originals='wipeoriginals', keytype='password') # 'decrypt' wg. Doppelklick auf .lisx-Dateien
 
 		lParserArgumentParser.add_argument('items', metavar='file|directory', nargs='*',
-										   help='file or directory to be processed')
-		klass.G_AUFRUF_PARAMETER = lParserArgumentParser.parse_args()
\ No newline at end of file
+										   help='file or directory to be processed (' + LiSKonstanten.C_DATENSTROM_PFADANGABE + ': encrypt/decrypt stdin to stdout without GUI)')
+		return lParserArgumentParser
\ No newline at end of file
@@ -21,10 +21,11 @@
 Dieses Modul enthält programmglobale Konstanten.
 """
 
+from Modell.LiSBasiskonstanten import C_IQB_VERSION, C_PLATTFORM, C_BETRIEBSSYSTEM, \
+	C_IPC_MAXIMALE_NACHRICHTENLAENGE, C_IPC_EMPFANGSPUFFER_GROESSE, C_IPC_SOCKET_ADRESSE, C_IPC_ZEITLIMIT, C_IPC_SERVER_PRUEFINTERVALL, \
+	C_DATENSTROM_PFADANGABE
 from Sonstiges import LiSWerkzeuge
 
-from PyQt5 import QtWidgets
-
 import base64
 import logging
 import os
@@ -34,7 +35,7 @@ import tempfile
 # Allgemeine Konstanten:
 __author__ = 'Qualitäts- und UnterstützungsAgentur - Landesinstitut für Schule Nordrhein-Westfalen (QUA-LiS NRW)'
 __license__ = 'GNU General Public License Version 3 (GNU GPL v3)'
-__version__ = '1.0.10'
+__version__ = '1.1.0'
 __year__ = '2022'
 __maintainer__ = 'Martin Weise'
 __email__ = 'martin.weise@qua-lis.nrw.de'
@@ -50,8 +51,10 @@ C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL = 'Vernichten'
 C_SCHLUESSELART_PASSWORT_LITERAL = 'Passwort'
 C_SCHLUESSELART_SCHLUESSELDATEI_LITERAL = 'Schlüsseldatei'
 
-# Konstanten für IQB-Variante von LiSCrypt
-C_IQB_VERSION = False
+# Antworten auf die Rückfrage, ob eine bestehende Zieldatei überschrieben werden soll:
+C_UEBERSCHREIBEN_NEIN = 0
+C_UEBERSCHREIBEN_JA = 1
+C_UEBERSCHREIBEN_ABBRECHEN = 2
 
 # Konstanten für Programmname
 C_PROGRAMMNAME = 'LiSCrypt' + (' IQB' if C_IQB_VERSION is True else '')
@@ -60,11 +63,8 @@ C_PROGRAMMNAME = 'LiSCrypt' + (' IQB' if C_IQB_VERSION is True else '')
 C_DATEIENDUNG = '.lisx' if C_IQB_VERSION is False else '.lisq'
 
 # Konstanten für die (zur Entschlüsselung) erforderlliche LiSCrypt-Version
-C_ERFORDERLICHE_LISCRYPT_VERSION = '1.0.9'
-
-# Konstanten für Plattform und Betriebssystem:
-C_PLATTFORM = str.lower(os.name)
-C_BETRIEBSSYSTEM = str.lower(sys.platform)
+C_ERFORDERLICHE_LISCRYPT_VERSION = '1.1.0'
+"""Erste LiSCrypt-Version, die die Verfahren C_VERFAHREN_AES_GCM_KENNUNG_V4 (inkl. Datenstrom, am Ort und Archiv) entschlüsseln kann"""
 
 # Konstanten für Arbeitsverzeichnis
 if C_BETRIEBSSYSTEM.startswith('linux') or C_BETRIEBSSYSTEM == 'darwin':
@@ -98,8 +98,35 @@ C_LOG_DATEINAME = os.path.join(C_KONFIG_UND_LOG_PFAD, 'LiSCrypt.log')
 C_LOGGING_LEVEL = logging.ERROR
 """Logging-Level (Integer)"""
 
-# Konstanten für Sicherheitskontrolle auf 0-Byte-Folgen:
-C_REGEX_NULLBYTES = b'\x00+'
+# Konstanten für die Profilierung (--profile):
+C_PROFIL_DATEINAME = os.path.join(C_KONFIG_UND_LOG_PFAD, 'LiSCrypt.pstats')
+"""Erweiterte Pfadangabe zur Profildatei im pstats-Format (String)"""
+C_PROFIL_SPEICHER_DATEINAME = os.path.join(C_KONFIG_UND_LOG_PFAD, 'LiSCrypt_Speicher.txt')
+"""Erweiterte Pfadangabe zum Bericht über die größten Speicherallokationen (String)"""
+C_PROFIL_ANZAHL_ALLOKATIONSSTELLEN = 30
+"""Anzahl der Programmstellen mit den größten Speicherallokationen im Bericht (int)"""
+C_PROFIL_TRACEMALLOC_RAHMEN = 5
+"""Anzahl der von tracemalloc je Allokation gespeicherten Aufrufrahmen (int)"""
+
+# Konstanten für Journale unterbrochener Ver- und Entschlüsselungen:
+C_JOURNAL_PFAD = os.path.join(C_KONFIG_UND_LOG_PFAD, 'journal')
+"""Erweiterte Pfadangabe zum Verzeichnis der Journale (String)"""
+C_JOURNAL_ENDUNG = '.lisj'
+"""Dateiendung der Journale (String)"""
+
+# Konstanten für die Instanzsperre der Master-Instanz (LiSSingleton):
+C_INSTANZSPERRE_DATEINAME = os.path.join(C_KONFIG_UND_LOG_PFAD, 'LiSCrypt.lock')
+"""Erweiterte Pfadangabe zur Sperrdatei der Master-Instanz (String)"""
+C_INSTANZSPERRE_WARTEZEIT = 10.0 # Sekunden
+"""Maximale Wartezeit auf die Master-Instanz, wenn ein anderer Prozess die Instanzsperre hält (float)"""
+C_INSTANZSPERRE_PRUEFINTERVALL = 0.05 # Sekunden
+"""Intervall der Verbindungsversuche während C_INSTANZSPERRE_WARTEZEIT (float)"""
+
+# Konstanten für die Auftragswarteschlange der Master-Instanz (LiSAuftraege):
+C_AUFTRAGSWARTESCHLANGE_SAMMELZEIT = 300 # Millisekunden
+"""Wartezeit nach Eingang eines Auftrags, in der weitere (kombinierbare) Aufträge gesammelt werden (int)"""
+C_AUFTRAGSWARTESCHLANGE_PRUEFINTERVALL = 250 # Millisekunden
+"""Intervall, in dem bei beschäftigtem LiSCrypt geprüft wird, ob der nächste Auftrag gestartet werden kann (int)"""
 
 # Konstanten für AES_GCM-Verschlüsselung::
 C_VERFAHREN_AES_GCM_KENNUNG_V1 = 1 #Wert (AES_GCM mit SCRYPT (randomisiertes Salt) als KDF und SHA256 als Passwort- und Schlüsseldatei-Hashfunktion)
@@ -108,6 +135,23 @@ C_VERFAHREN_AES_GCM_KENNUNG_V2 = 10 #Wert (AES_GCM mit SCRYPT und HKDF)
 """Verfahrenskennung für für AEC-GCM-256 mit SCRYPT und HKDF"""
 C_VERFAHREN_AES_GCM_KENNUNG_V3 = 12 #Wert (AES_GCM mit SCRYPT, HKDF und vorangestellter Nullbytefolge)
 """Verfahrenskennung für für AEC-GCM-256 mit SCRYPT, saltlosem HKDF-Expand und vorangestellter Nullbytefolge"""
+C_VERFAHREN_AES_GCM_KENNUNG_V4 = 14 #Wert (AES_GCM mit SCRYPT, HKDF, segmentweiser Authentifizierung und vorangestellter Nullbytefolge)
+"""Verfahrenskennung für AEC-GCM-256 mit SCRYPT, saltlosem HKDF-Expand, segmentweiser Verschlüsselung/Authentifizierung
+(eigene Nonce und eigenes MAC-Tag je Segment) und vorangestellter Nullbytefolge"""
+C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM = 15 #Wert (wie V4, Klartextlänge jedoch im abschließenden Trailersegment statt im Header)
+"""Verfahrenskennung für AEC-GCM-256 wie C_VERFAHREN_AES_GCM_KENNUNG_V4, jedoch für Datenströme unbekannter Länge: Die
+Originalgröße im Header ist 0, alle Datensegmente außer dem letzten sind vollständig und die Klartextlänge wird in einem
+abschließenden, als letztes Segment markierten Trailersegment authentifiziert"""
+C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT = 16 #Wert (wie V4, Metadatensegment jedoch um eine im Header angegebene Nullbytefolge verlängert)
+"""Verfahrenskennung für AEC-GCM-256 wie C_VERFAHREN_AES_GCM_KENNUNG_V4 bei Verschlüsselung am Ort: Der Header enthält
+zusätzlich die Länge einer Nullbytefolge (Fuellmenge, '>Q'), die im Metadatensegment auf die erforderliche
+LiSCrypt-Version folgt. Header und Metadatensegment sind dadurch mindestens C_AM_ORT_PUFFERSEGMENTE Datensegmente lang,
+so dass ein Datensegment beim Schreiben nie Klartext überschreibt, dessen Chiffrat noch nicht gesichert ist"""
+C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV = 17 #Wert (wie V4_DATENSTROM, Klartext jedoch Inhalte mehrerer Dateien mit anschließendem Inhaltsverzeichnis)
+"""Verfahrenskennung für AEC-GCM-256 wie C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM für ein Archiv aus vielen Dateien
+eines Verzeichnisbaums: Der Klartext besteht aus den aneinandergehängten Dateiinhalten und einem Inhaltsverzeichnis
+(relative Pfade, Positionen, Längen und Zeitstempel), das Metadatensegment enthält den Verzeichnisnamen und das
+Trailersegment die Längen von Inhalt und Inhaltsverzeichnis (siehe LiSKrypto.QArchiv)"""
 
 C_AES_GCM_NONCE_LAENGE = 12 #Bytes (= 96 Bits)
 """Nonce-Länge für AEC-GCM-256 in Bytes (int)"""
@@ -119,6 +163,42 @@ C_AES_GCM_MAXIMALE_DATEIGROESSE = (2 ** 39 - 256) / 8 - 1 #Bytes(!) passend zu N
 """Maximale Dateigröße, die mit AES-GCM-256 verschlüsselt werden darf (int)"""
 C_AES_GCM_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL = 2 ** 32 #Anzahl Dateien gemäß NIST SP 800-38D section 8.3
 """Maximale Dateianzahl, die bei AES-GCM-256 mit identischem Schlüssel verschlüsselt werden darf (int)"""
+C_AES_GCM_TAG_LAENGE = 16 #Anzahl Bytes (= 128 Bits)
+"""Länge des MAC-Tags bei AES-GCM-256 in Bytes (int)"""
+C_UPDATE_INTO_ZUSATZBYTES = 15 #Anzahl Bytes (= AES-Blockgröße - 1)
+"""Zusätzlicher Platz, den update_into(...) der Cipher-Kontexte im Ausgabepuffer über die Eingabelänge hinaus benötigt (int)"""
+C_AES_GCM_SEGMENTGROESSE = 1024 * 1024 #Anzahl Bytes Klartext pro Segment bei C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM
+"""Klartextgröße eines Datensegments bei AES-GCM-256 mit segmentweiser Authentifizierung in Bytes, sofern die
+Originalgröße vorab nicht bekannt ist (int). Der tatsächlich verwendete Wert wird im Header jeder Datei abgelegt."""
+C_AES_GCM_MINIMALE_SEGMENTGROESSE = 64 * 1024 #Anzahl Bytes Klartext pro Segment bei C_VERFAHREN_AES_GCM_KENNUNG_V4
+"""Kleinste Klartextgröße eines Datensegments bei Dateien mit bekannter Originalgröße in Bytes (int)"""
+C_AES_GCM_MAXIMALE_SEGMENTGROESSE = 4 * 1024 * 1024 #Anzahl Bytes Klartext pro Segment bei C_VERFAHREN_AES_GCM_KENNUNG_V4
+"""Größte Klartextgröße eines Datensegments bei Dateien mit bekannter Originalgröße in Bytes (int)"""
+C_AES_GCM_ZIELANZAHL_DATENSEGMENTE = 256
+"""Anzahl an Datensegmenten, ab der die Segmentgröße einer Datei (bis C_AES_GCM_MAXIMALE_SEGMENTGROESSE) verdoppelt wird (int)"""
+C_AES_GCM_TRAILER_KLARTEXT_LAENGE = 8 #Anzahl Bytes (Klartextlänge als '>Q')
+"""Klartextlänge des Trailersegments bei C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM in Bytes (int)"""
+C_DATENSTROM_ORIGINALDATEINAME = 'Datenstrom'
+"""Im Metadatensegment abgelegter Dateiname bei Verschlüsselung eines Datenstroms (String)"""
+C_SEGMENTPIPELINE_ANZAHL_THREADS = max(1, os.cpu_count() or 1)
+"""Anzahl paralleler Threads zur Ver- und Entschlüsselung der Segmente einer Datei (int)"""
+C_SEGMENTPIPELINE_MINDESTANZAHL_SEGMENTE = 4
+"""Mindestanzahl an Datensegmenten, ab der Lesen, Ver- bzw. Entschlüsselung und Schreiben einer Datei in getrennten
+Threads überlappend erfolgen (int). Pro Verarbeitungs-Thread werden mindestens so viele Datensegmente vorausgesetzt."""
+C_JOURNAL_INTERVALL_SEGMENTE = 64
+"""Anzahl an Datensegmenten, nach der der Fortschritt einer Ver- oder Entschlüsselung im Journal gesichert wird (int).
+Dateien mit höchstens dieser Anzahl an Datensegmenten werden ohne Journal verarbeitet."""
+C_AM_ORT_PUFFERSEGMENTE = 4
+"""Anzahl an Datensegmenten, die bei Verschlüsselung am Ort zwischen zwei Sicherungen (fsync und Journal) geschrieben
+werden (int). Bestimmt zugleich die Mindestlänge von Header und Metadatensegment (siehe C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT)."""
+C_AM_ORT_MINDESTGROESSE = 256 * 1024 * 1024 #Bytes
+"""Mindestgröße einer Datei, ab der sie bei aktivierter Verschlüsselung am Ort nicht kopiert, sondern am Ort
+verschlüsselt wird (int). Kleinere Dateien werden wie bisher verschlüsselt und anschließend vernichtet, da die
+Nullbytefolge im Metadatensegment dort ins Gewicht fiele. Sie umfasst C_AM_ORT_PUFFERSEGMENTE Datensegmente, deren
+Größe am Ort unabhängig von der Chunkgröße des Datenträgers gewählt wird und ab dieser Größe höchstens 1/128 der
+Originalgröße beträgt (unmittelbar nach einer Verdopplung der Segmentgröße), also höchstens ca. 3,1 % der Originalgröße."""
+C_AM_ORT_JOURNAL_LITERAL = 'VerschlüsselnAmOrt'
+"""Programmfunktion, unter der das Journal einer Verschlüsselung am Ort abgelegt wird (String)"""
 
 # Konstanten für Verschlüsselung mit ChaCha20
 C_VERFAHREN_CHACHA20_KENNUNG_V1 = 2 #Wert (Chacha20+HMAC mit SCRYPT (randomisiertes Salt) als KDF und SHA256 als Passwort- und Schlüsseldatei-Hashgunktion)
@@ -145,9 +225,49 @@ C_HMAC_SCHLUESSEL_LAENGE = 32 #Anzahl Bytes
 C_HMAC_SHA512_SCHLUESSEL_LAENGE = 64 #Anzahl Bytes
 """HMAC-Schlüssellänge ab Dateiversion C_VERFAHREN_CHACHA20_KENNUNG_V3_1"""
 
+# Konstanten für die Headerinspektion verschlüsselter Dateien:
+C_VERFAHREN_BEZEICHNUNGEN = {C_VERFAHREN_AES_GCM_KENNUNG_V1: 'AES-GCM-256 (V1)',
+							 C_VERFAHREN_AES_GCM_KENNUNG_V2: 'AES-GCM-256 (V2)',
+							 C_VERFAHREN_AES_GCM_KENNUNG_V3: 'AES-GCM-256 (V3)',
+							 C_VERFAHREN_AES_GCM_KENNUNG_V4: 'AES-GCM-256 segmentiert (V4)',
+							 C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM: 'AES-GCM-256 segmentiert, Datenstrom (V4)',
+							 C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT: 'AES-GCM-256 segmentiert, am Ort (V4)',
+							 C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV: 'AES-GCM-256 segmentiert, Archiv (V4)',
+							 C_VERFAHREN_CHACHA20_KENNUNG_V1: 'ChaCha20+HMAC (V1)',
+							 C_VERFAHREN_CHACHA20_KENNUNG_V2: 'ChaCha20+HMAC (V2)',
+							 C_VERFAHREN_CHACHA20_KENNUNG_V3: 'ChaCha20+HMAC (V3)',
+							 C_VERFAHREN_CHACHA20_KENNUNG_V3_1: 'ChaCha20+HMAC-SHA512 (V3_1)'}
+"""Zuordnung von Verfahrenskennungen zu lesbaren Verfahrensbezeichnungen (Dictionary)"""
+C_INSPEKTION_ANZAHL_THREADS = 16
+"""Standardanzahl paralleler Threads zum Einlesen von Headern bei der Headerinspektion (int)"""
+
 # Konstanten für Dateioperationen:
 C_DATEI_BLOCKGROESSE = 64 * 1024 #Anzahl Bytes (Chunkgröße von zu ver- und entschlüsselnden Daten - wird auch für SHA256-Bildung von Dateien verwendet)
-""""Chunkgröße zur Datei-Verarbeitung"""
+""""Kleinste Chunkgröße zur Datei-Verarbeitung (die tatsächliche Chunkgröße ermittelt LiSBlockgroesse.Blockgroessenrichtlinie je Datenträger)"""
+C_BLOCKGROESSE_LOKAL = 1024 * 1024 #Anzahl Bytes
+"""Chunkgröße für Dateien auf lokalen Datenträgern, sofern st_blksize keine größere Chunkgröße nahelegt (int)"""
+C_BLOCKGROESSE_NETZWERK = 4 * 1024 * 1024 #Anzahl Bytes
+"""Chunkgröße für Dateien auf Netzwerkdateisystemen und Datenträgern mit hoher Latenz je Lesezugriff (int)"""
+C_BLOCKGROESSE_MAXIMUM = 16 * 1024 * 1024 #Anzahl Bytes
+"""Größte verwendete Chunkgröße zur Datei-Verarbeitung (int)"""
+C_BLOCKGROESSE_NETZWERKDATEISYSTEME = ('nfs', 'nfs4', 'cifs', 'smbfs', 'smb2', 'smb3', 'afpfs', '9p', 'ncpfs', 'ceph', 'glusterfs', 'lustre',
+									  'davfs', 'webdav', 'fuse.sshfs', 'fuse.davfs2', 'fuse.glusterfs', 'fuse.rclone')
+"""Dateisystemtypen (wie von psutil.disk_partitions() geliefert, in Kleinschreibung), die als Netzwerkdateisystem gelten (Tupel)"""
+C_BLOCKGROESSE_PROBE_GROESSE = 1024 * 1024 #Anzahl Bytes
+"""Anzahl Bytes, die zur einmaligen Durchsatzmessung je Datenträger in Schritten von C_DATEI_BLOCKGROESSE gelesen werden (int)"""
+C_BLOCKGROESSE_PROBE_SCHWELLE = 0.002 #Sekunden
+"""Mittlere Dauer eines Lesezugriffs der Durchsatzmessung, ab der C_BLOCKGROESSE_NETZWERK verwendet wird (float)"""
+
+# Konstanten für die Zeitmessung (--trace):
+C_ZEITMESSUNG_MAXIMALE_TRACE_EREIGNISSE = 500000
+"""Höchstanzahl an Einzelereignissen, die je Programmfunktionsdurchlauf für den Trace-Export gesammelt werden (int).
+Weitere Abschnitte gehen nur noch in die Zusammenfassung ein."""
+
+# Konstanten für die Fortschrittsanzeige (Durchsatz und Restzeit):
+C_FORTSCHRITT_INTERVALL = 1.0 #Sekunden
+"""Mindestabstand zwischen zwei Fortschrittsmeldungen an Statusleiste bzw. Kommandozeile (float)"""
+C_FORTSCHRITT_GLAETTUNGSFAKTOR = 0.3
+"""Gewicht des jeweils letzten Intervalls im exponentiell geglätteten Durchsatz (float)"""
 
 # Folgende Werte gemaeß sind angenähert an Colin Percivals Empfehlung für die Verwendung
 # von Scrypt für interkative Logins (https://www.tarsnap.com/scrypt.html), der N-Wert
@@ -199,10 +319,6 @@ C_GENERIERTE_SCHLUESSELDATEI_MAXLAENGE = 512 #Anzahl Bytes
 C_PASSWORT_SCHLUESSELDATEI_MINLAENGE = 8 # Anzahl Bytes
 
 # Konstanten für die GUI und Kommandozeile:
-C_SCHLUESSELARTMESSAGEBOX_SCHLUESSELARTEN = {'Passwort': QtWidgets.QMessageBox.ActionRole,
-											 'Schlüsseldatei': QtWidgets.QMessageBox.ActionRole,
-											 'Abbrechen': QtWidgets.QMessageBox.RejectRole}
-"""Zuordnung von Schlüsselarten zu PyQt-ButtonRoles (Abbrechen zusätzlich)"""
 C_SCHLUESSELARTKOMMANDOZEILE_SCHLUESSELARTEN = {'Passwort': 'password',
 												'Schlüsseldatei': 'keyfile',
 												'Abbrechen': 'cancel'}
@@ -212,3578 +328,51 @@ C_AUFRUFPARAMETER_WHITELISTS = {'logging':['screen', 'file'],
 								'originals': ['wipeoriginals', 'keeporiginals'] if C_IQB_VERSION is False else ['wipeoriginals'],
 								'keytype':['password', 'keyfile', 'choose'] if C_IQB_VERSION is False else ['password']}
 
-# LiSCrypt-Logo:
-lLiScryptLogoBase64String = \
-	"""iVBORw0KGgoAAAANSUhEUgAAAGQAAABkCAYAAABw4pVUAAAKSWlDQ1BzUkdCIElFQzYxOTY2LTIu
-	MQAAeNqdU3dYk/cWPt/3ZQ9WQtjwsZdsgQAiI6wIyBBZohCSAGGEEBJAxYWIClYUFRGcSFXEgtUK
-	SJ2I4qAouGdBiohai1VcOO4f3Ke1fXrv7e371/u855zn/M55zw+AERImkeaiagA5UoU8Otgfj09I
-	xMm9gAIVSOAEIBDmy8JnBcUAAPADeXh+dLA//AGvbwACAHDVLiQSx+H/g7pQJlcAIJEA4CIS5wsB
-	kFIAyC5UyBQAyBgAsFOzZAoAlAAAbHl8QiIAqg0A7PRJPgUA2KmT3BcA2KIcqQgAjQEAmShHJAJA
-	uwBgVYFSLALAwgCgrEAiLgTArgGAWbYyRwKAvQUAdo5YkA9AYACAmUIszAAgOAIAQx4TzQMgTAOg
-	MNK/4KlfcIW4SAEAwMuVzZdL0jMUuJXQGnfy8ODiIeLCbLFCYRcpEGYJ5CKcl5sjE0jnA0zODAAA
-	GvnRwf44P5Dn5uTh5mbnbO/0xaL+a/BvIj4h8d/+vIwCBAAQTs/v2l/l5dYDcMcBsHW/a6lbANpW
-	AGjf+V0z2wmgWgrQevmLeTj8QB6eoVDIPB0cCgsL7SViob0w44s+/zPhb+CLfvb8QB7+23rwAHGa
-	QJmtwKOD/XFhbnauUo7nywRCMW735yP+x4V//Y4p0eI0sVwsFYrxWIm4UCJNx3m5UpFEIcmV4hLp
-	fzLxH5b9CZN3DQCshk/ATrYHtctswH7uAQKLDljSdgBAfvMtjBoLkQAQZzQyefcAAJO/+Y9AKwEA
-	zZek4wAAvOgYXKiUF0zGCAAARKCBKrBBBwzBFKzADpzBHbzAFwJhBkRADCTAPBBCBuSAHAqhGJZB
-	GVTAOtgEtbADGqARmuEQtMExOA3n4BJcgetwFwZgGJ7CGLyGCQRByAgTYSE6iBFijtgizggXmY4E
-	ImFINJKApCDpiBRRIsXIcqQCqUJqkV1II/ItchQ5jVxA+pDbyCAyivyKvEcxlIGyUQPUAnVAuagf
-	GorGoHPRdDQPXYCWomvRGrQePYC2oqfRS+h1dAB9io5jgNExDmaM2WFcjIdFYIlYGibHFmPlWDVW
-	jzVjHVg3dhUbwJ5h7wgkAouAE+wIXoQQwmyCkJBHWExYQ6gl7CO0EroIVwmDhDHCJyKTqE+0JXoS
-	+cR4YjqxkFhGrCbuIR4hniVeJw4TX5NIJA7JkuROCiElkDJJC0lrSNtILaRTpD7SEGmcTCbrkG3J
-	3uQIsoCsIJeRt5APkE+S+8nD5LcUOsWI4kwJoiRSpJQSSjVlP+UEpZ8yQpmgqlHNqZ7UCKqIOp9a
-	SW2gdlAvU4epEzR1miXNmxZDy6Qto9XQmmlnafdoL+l0ugndgx5Fl9CX0mvoB+nn6YP0dwwNhg2D
-	x0hiKBlrGXsZpxi3GS+ZTKYF05eZyFQw1zIbmWeYD5hvVVgq9ip8FZHKEpU6lVaVfpXnqlRVc1U/
-	1XmqC1SrVQ+rXlZ9pkZVs1DjqQnUFqvVqR1Vu6k2rs5Sd1KPUM9RX6O+X/2C+mMNsoaFRqCGSKNU
-	Y7fGGY0hFsYyZfFYQtZyVgPrLGuYTWJbsvnsTHYF+xt2L3tMU0NzqmasZpFmneZxzQEOxrHg8DnZ
-	nErOIc4NznstAy0/LbHWaq1mrX6tN9p62r7aYu1y7Rbt69rvdXCdQJ0snfU6bTr3dQm6NrpRuoW6
-	23XP6j7TY+t56Qn1yvUO6d3RR/Vt9KP1F+rv1u/RHzcwNAg2kBlsMThj8MyQY+hrmGm40fCE4agR
-	y2i6kcRoo9FJoye4Ju6HZ+M1eBc+ZqxvHGKsNN5l3Gs8YWJpMtukxKTF5L4pzZRrmma60bTTdMzM
-	yCzcrNisyeyOOdWca55hvtm82/yNhaVFnMVKizaLx5balnzLBZZNlvesmFY+VnlW9VbXrEnWXOss
-	623WV2xQG1ebDJs6m8u2qK2brcR2m23fFOIUjynSKfVTbtox7PzsCuya7AbtOfZh9iX2bfbPHcwc
-	Eh3WO3Q7fHJ0dcx2bHC866ThNMOpxKnD6VdnG2ehc53zNRemS5DLEpd2lxdTbaeKp26fesuV5Rru
-	utK10/Wjm7ub3K3ZbdTdzD3Ffav7TS6bG8ldwz3vQfTw91jicczjnaebp8LzkOcvXnZeWV77vR5P
-	s5wmntYwbcjbxFvgvct7YDo+PWX6zukDPsY+Ap96n4e+pr4i3z2+I37Wfpl+B/ye+zv6y/2P+L/h
-	efIW8U4FYAHBAeUBvYEagbMDawMfBJkEpQc1BY0FuwYvDD4VQgwJDVkfcpNvwBfyG/ljM9xnLJrR
-	FcoInRVaG/owzCZMHtYRjobPCN8Qfm+m+UzpzLYIiOBHbIi4H2kZmRf5fRQpKjKqLupRtFN0cXT3
-	LNas5Fn7Z72O8Y+pjLk722q2cnZnrGpsUmxj7Ju4gLiquIF4h/hF8ZcSdBMkCe2J5MTYxD2J43MC
-	52yaM5zkmlSWdGOu5dyiuRfm6c7Lnnc8WTVZkHw4hZgSl7I/5YMgQlAvGE/lp25NHRPyhJuFT0W+
-	oo2iUbG3uEo8kuadVpX2ON07fUP6aIZPRnXGMwlPUit5kRmSuSPzTVZE1t6sz9lx2S05lJyUnKNS
-	DWmWtCvXMLcot09mKyuTDeR55m3KG5OHyvfkI/lz89sVbIVM0aO0Uq5QDhZML6greFsYW3i4SL1I
-	WtQz32b+6vkjC4IWfL2QsFC4sLPYuHhZ8eAiv0W7FiOLUxd3LjFdUrpkeGnw0n3LaMuylv1Q4lhS
-	VfJqedzyjlKD0qWlQyuCVzSVqZTJy26u9Fq5YxVhlWRV72qX1VtWfyoXlV+scKyorviwRrjm4ldO
-	X9V89Xlt2treSrfK7etI66Trbqz3Wb+vSr1qQdXQhvANrRvxjeUbX21K3nShemr1js20zcrNAzVh
-	Ne1bzLas2/KhNqP2ep1/XctW/a2rt77ZJtrWv913e/MOgx0VO97vlOy8tSt4V2u9RX31btLugt2P
-	GmIbur/mft24R3dPxZ6Pe6V7B/ZF7+tqdG9s3K+/v7IJbVI2jR5IOnDlm4Bv2pvtmne1cFoqDsJB
-	5cEn36Z8e+NQ6KHOw9zDzd+Zf7f1COtIeSvSOr91rC2jbaA9ob3v6IyjnR1eHUe+t/9+7zHjY3XH
-	NY9XnqCdKD3x+eSCk+OnZKeenU4/PdSZ3Hn3TPyZa11RXb1nQ8+ePxd07ky3X/fJ897nj13wvHD0
-	Ivdi2yW3S609rj1HfnD94UivW2/rZffL7Vc8rnT0Tes70e/Tf/pqwNVz1/jXLl2feb3vxuwbt24m
-	3Ry4Jbr1+Hb27Rd3Cu5M3F16j3iv/L7a/eoH+g/qf7T+sWXAbeD4YMBgz8NZD+8OCYee/pT/04fh
-	0kfMR9UjRiONj50fHxsNGr3yZM6T4aeypxPPyn5W/3nrc6vn3/3i+0vPWPzY8Av5i8+/rnmp83Lv
-	q6mvOscjxx+8znk98ab8rc7bfe+477rfx70fmSj8QP5Q89H6Y8en0E/3Pud8/vwv94Tz+0/JIZ8A
-	AAAGYktHRAD/AP8A/6C9p5MAAAAJcEhZcwAADsMAAA7DAcdvqGQAAAAHdElNRQfiBBgILBDd4OPr
-	AAAIOklEQVR42u2d7Y9UVx3HP79zZ5bdhQIl0FaFtrYrzSqQUlOpKY1taWxKQl9QE5GYkJA09TH6
-	piSa9JWJ+A8YjQ+JT0lpFK2N2sQnAq1ilAYqIIRiSlKidk3lYWFnd2bO+fli7nZ3Z+/snJ25d+YO
-	c77JebGzv7nnzvme3+M5515RVZpBVRERAlpH/TirKiaK5smJDyEB2RCURIoJQ9MdiAgigq1WAyF5
-	IsUYQ7VS8TNZIjICPA1sbUCeSZlU04VJ4uKW9fUc8CpwQFWP15svay2FYhFKpRLOuXdt2nQD9gJl
-	QENLtZWBvfXj7ZyjVCqBtTaJjN1h4DJvu+vH3VqLOOfmhLQisgK4CCwLVj5TXAPWquqVOaFwguCX
-	AhkdwbJ4rOegkCD4UMJnl4EDbTjEtB1nN+AbcDSS2wWsbDbWhYQMfHnCxX6iql8Mk7qtELcKfGGh
-	sRaRhqFsPWwY0rZhfcbaN+YP9ZUUqiW+dnGedgVCOkaI+Dj1niJERKJZ92w1v9XSlgnJs2O8A3gC
-	2ALcC9wOrJolMiUibwH/BP4G/AX4o6qWeuU35l5DRGQgDhk/D9zf4P6msQQYidvj0wmYiPwa+A5w
-	qIsa5KUhufUhUsMu4BzwQ+AjTchYKAH7JPAH4HUR2dlrhOTBNN0G/Ap4HrgjxUtvBA6KyEsicmte
-	s89caYiIbAFOANsz7GYHcExENgWTtTAZjwKHgE7M3rXAIRH5cDBZyWRsAn4BDHWw21XAb+LoLZis
-	WWSsAA6SXEfLGrcAL4rIkqAhM/hWHKouFlPAm8BJ4CzwH1qru90LPBc0pKYd24FPLeIr/wa+BtwH
-	LFXVu1R1k6qOqup7gOH4f89RW2jzxT4RuafbGpK0fHuS+cuN++vl0mjxDR3Hb8nTAvuB4UVcfwnw
-	9fi7Pn38NIvfGd/L/oT+TtbLdVtDHovNhY9p2qmqX1HVCe8pqTqlql+ltkeg6vGVpzLUkp7wIZ/1
-	lHtaVX/Z8kiovuDZlwCf60sfIiKr4wStGZ5X1R+3PT1Vvxdn/s2wW0QK/aghT9K82jwJ7Euxz32x
-	+VsIq4FH+jHK+riHzAFVvZjaFK1d62ceoo/3o4Zs8ZD5UQb9HvSQ2ZonDelEmWQVcGcTsavAKxl0
-	/3uab0naFK9E9o3J8snK/6qq1dTthuo4tRXFhTAErOsnk3WXh8zpDPs/5yFze9+YLOaugzfChQz7
-	/5eHzC15Nllpw6eq+98M+7+U0j227U5b1ZC0fYhPqTvLnSLXPWTS3nDe8ka5vCDL7atlD5nhfvIh
-	3YbPTvy+Cnu7De3CZM31zsUXgNeb5SEZ9v8i8EYTmbPdGJiuEKKqZ7v1g+P+3/AghBuSkEGREQt3
-	a8SQ7dFTJvHDFqas5S3gnKqWe46QSOQbCNsVLMIatQw3OCCUe1iLE5gQGDOCLYh8+6aVHLx0SS/n
-	mhARGQScEY45WIfGZ+p02lT0dBRwM/A+W/sN+8evsCfeJzyuqlNp9ZP2jF1phBNO2cj8A443EtZY
-	5SEjHEm7smFS1I6bI+Elp4z2TTKjjEbCkXg5IV+EGOGwVe7vtwzTKhtMbYtPRxPDZtrxYIMtRf2A
-	IRW2ikgr5fpsEkNj2OMcH0gnOmuogYuaKVYbp8su7eBCuTsyPAu0fZa/kEaZRJQNQDGN33ZyGyfe
-	O0glq+n83QusfvYU7085AluiysfSKKe0bWZEpOCUITqzjpLryFhE2h7PNOx+eD7mzGyP8kAIQTt6
-	oHSSJiYs5rXLDC+LausYm5czkTSVTo0zVLFIRWG8SrRtDeOBkAzw9iSFHUdnEs6xJzg2kOAQdx5l
-	/ViZAYDR5UxsW5PpzpVMEJ5KGggJ6CmT9eRR7ilGc81RxS4+aHjzGoMfPcKH6j+/Us63mfZNDDsW
-	RZ2/ns6x6EmHOXO1OztHFhGJpp8YBgQfEggJiV/nkmfj6UMCskHwIcGHBLRNSFfD3j7zIZr7xDAr
-	/PwBzq5fyuTsz8YmKTz6JzaETL0LuHWAytqhuSuRJod6H0xWyNRznAQEDekMRpZSWr+MqV7QkJ7x
-	Ib99kNObV9TOHRZNcvJ6+jH+DlAFuXC9tlAFcOcw5YLpjYS30CsasnqAarHJoE7/vwg6etPciKrf
-	fEgot+TIh9iQ8b8L13UNUVXX7ywIqMCEqrZ9RiwdHyK8jDJChme7HzjMxgHP6aNAxTX3e2nZWYUK
-	wqncRFnG8LIqO1T5YFaElB2mnFNdFOG8dfwgN3lIpaKHDYzR+6/Ga9VkVVX1z1lFWS2FvVb5hAiv
-	9RsZkXDMKQ/nrnSiqu+o8rARzvRNiCqcscoOVb2U2jVTTgydUx6JhMPA/25YEyVcM8I/nHIftbeg
-	Zlo6aZkQVZ0EJkXkKWPYJcoepxSB25Bc7ZFqBRMob4tQNMLvKla/nEWmnkktS1XfAb4pIt8HRqOI
-	ddYyGPUoExaIYMLCeec000eCZFrLijXmeNxC/tjJKCugs1FWICQbQryirKTkLgrj2X7K4jPWBVWt
-	P7V5NeGLn27wxoDwgnt/uV0Jn12t87mJTv0Vai9amY2VwGfCJE8dR+bZNefcHA2J35h2kfQfkxow
-	F9eAtap6ZbaGmPp39cYCz4TxyhzPzCZjmhBKpRLOuaSXWO2l9nxbDS3VVgb21o+3c45SqYQoUCmX
-	KRQK8x7JICKbY2e0tYGj8nV0aTvONJF2wNHoeg54ldpLao7Xa4a1lkKxWCMEoFqpEEVReE5GhzGb
-	DGCGEABbrWKMCaR0kAznHFFhJtiV+tzdWYuIBFI6QIaqYqK5+aIkFa6mSanzJ2EU2ySg/u96MgD+
-	D+BY3WYmzancAAAAAElFTkSuQmCC
+C_UEBERSCHREIBENKOMMANDOZEILE_ANTWORTEN = {'skip': C_UEBERSCHREIBEN_NEIN,
+											'replace': C_UEBERSCHREIBEN_JA,
+											'abort': C_UEBERSCHREIBEN_ABBRECHEN}
+"""Zuordnung der Aufrufparameter für --overwrite zu den Antworten auf die Überschreiben-Rückfrage (ohne GUI)"""
+
+# Rückgabewerte (Exit-Codes) der Programmfunktionen ohne GUI (--headless):
+C_KOMMANDOZEILE_RUECKGABEWERT_OK = 0
+"""Alle Einträge erfolgreich verarbeitet (bzw. auf Wunsch übersprungen)"""
+C_KOMMANDOZEILE_RUECKGABEWERT_PROBLEME = 1
+"""Mindestens ein Eintrag konnte nicht verarbeitet werden"""
+C_KOMMANDOZEILE_RUECKGABEWERT_AUFRUFFEHLER = 2
+"""Unzulässige Aufrufparameter bzw. fehlender oder unzulässiger Schlüssel (wie bei argparse)"""
+C_KOMMANDOZEILE_RUECKGABEWERT_ABBRUCH = 3
+"""Programmfunktion abgebrochen (z.B. durch --overwrite abort oder Signal)"""
+C_KOMMANDOZEILE_RUECKGABEWERT_FEHLER = 4
+"""Schwerer Fehler während der Programmfunktion"""
+
+# Erst bei Bedarf bereitgestellte Konstanten (Qt-Objekte und eingebettete Ressourcen aus LiSRessourcen):
+C_VERZOEGERTE_RESSOURCEN = {'C_LISCRYPT_LOGO': 'C_LISCRYPT_LOGO_BASE64',
+							'C_QUALIS_LOGO': 'C_QUALIS_LOGO_BASE64',
+							'C_LISCRYPT_ICON16X16': 'C_LISCRYPT_ICON16X16_BASE64',
+							'C_LISCRYPT_DEQMDATEI': 'C_LISCRYPT_DEQMDATEI_BASE64'}
+"""Zuordnung der Ressourcen-Konstanten (Bytes) zu den Base64-Strings in LiSRessourcen"""
+
+def __getattr__(pNameString):
 	"""
+	Stellt Konstanten bereit, deren Berechnung beim Import dieses Moduls zu aufwändig wäre (PEP 562), und merkt sie
+	sich für weitere Zugriffe:
 
-C_LISCRYPT_LOGO = base64.b64decode(lLiScryptLogoBase64String)
-"""Bilddaten zum LiSCrypt-Logo (Über-Dialog) als Bytes aus:
-LiSCrypt_16_100_HintergrundTransparent.png"""
-
-lQUALiSLogoBase64String = \
-	"""iVBORw0KGgoAAAANSUhEUgAAAMgAAAA2CAYAAACCwNb3AAAABmJLR0QA/wD/AP+gvaeTAAAACXBI
-	WXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH4gQDChM0PaEp9gAAH6xJREFUeNrtnXmcVNWZ97/Pubeq
-	q3qhAdmRTUFZRET2ptlRoybRLJqMWSbLJJNkkpnEMZkkijTgFjfeTIyJvkkmZmJiNBmNe5R9b0Fl
-	F0FlVVmFbuiu9Z5n/ji3uquhW1oF4c1bz+dzPnXr1r11T53z/J79nBI+IK2fAufNbXpu9VjwLXgG
-	jHXnVAAFK5C1kPZg+NLGe3b1hd39YfiTTb/r3iIiHX1KfDjyiTqyufPzYzApSYEKdFJJ3u+N6ybD
-	4Hl5QBkHXgopGQqH1lPuWfp7hr5i6QSUIKgqdVbYk1W2ZA2bhy6hZv1oROPo+QtCII2Gl6IwbBHc
-	H4OvJ+GZOL2LlIGRCMvHHeZg7pnL4lCRKExigU4jgKy4FLq8A72r3fvNYyBbjtEj9DKWK4xwqYFB
-	AhGnM9BmnikWUgrrrfBU4PHE3hHs7DEH7bfaXbRhAgxaCM/G4SMJWFBGeSTDtwJ4JgPrpiQJAJbF
-	oKKgSQp0OgBkwxQYlGdOrZmKH81wngn4rlGmCngi2GZA0fLzFWOFlBX+loWf7fbYMGWBu1/7wdpe
-	ULMcxtfBXENRSZSfqvCswjMVCVIAy+MwpqBJCnQqAbJ+MpyXZ1JtmEg3z/I9T/mcOEDYD9gXT5VM
-	IPwu6/Hz8xawuwGIk+DwUqhMw8MdifQ+zH8HsFDhdxVJ6gogKdApBcgrU2HAnND3uBg/kmassdxu
-	oBeQPsF9illhfSDcsKMjyy95xGmTDZPhQLXTJM/4tOvg83ggPKcwe0yCIwBL4lBZAEmBPkyAbLwI
-	Bj7vjtdOIRZVrogot4tgToDWaIl8C0ey8B81ylOj5pMBWHMRHFoIE9KwJE5FXPlNVvhFFu4fmyAB
-	sDAOEwogKdCHAZBNV0D/v4Ym1UUU+ZZPecpd4rSGnuS+GRUCC9fVWR4fmgPJFyD9OIyogeUxbozA
-	VzPCdzLw9PhEYxi4QAU6IUz4bh/mwLH+EnxfmezBT4yQFCEQwZ7kljUgHtxa7DHh6Y87MLdbD0dq
-	XL/ejHGnwi5fudNXzv1bsbtmaawwsQU6yQDZeKl7nXsnRIVzfLjdGLIYLAb9kFoghiLPUNU3zQCA
-	ni9Du4+AfgM+fYj6jPCgAePD7eWWMoCxSZhbXJjcAp0kE0urQKrc8auX0M7AT31h4klwyFtHSnFW
-	+FMAN/d/lv0ADwNXA08UU9LVMlegdxpmZeH+cUlnjhWoQCdFgyzN+R2X4Ythgm+4CCGFoKekGeo8
-	4SojXDjvEtfn/h+F3wAfq6cuC08BR3z4NxG6PlXi+j+noEUKdDIAUvmye417lHvCvyDUnTJwhE2E
-	rCf8Yw+PTgDnPwnnD3P9TAl/BpIGSiPKN9oFRACm1hcmuEAnGCA6PdQel+NlleFi6E+j73EqW1IM
-	4zGc/dBlzjQc/qLr64QErwSwE0gb+GwgdH72fWqPh1s4/nukDYNad64AkDz6/gz3GvMp8gyfCKNW
-	ejo0I2SM8JELjXPGX/5UY78tLAIyBop85Zpy637bglZEtFa2azy+muaP/9IeNuS9Xx5t/rtsGfw0
-	PF4UafmZS8vc69PAxvKWr3uhlRG5NRe3/NmmcceeWz8ZerQ/9vzAdrBssjteW9mKsTsfdl511Mkq
-	YObUlm+aNdq93jKqxUtKOhe1monviLb82fJieKktPNjC5yvisKwYNkXeg5MOsPXTdNAM80xj0eHp
-	QJ4Kbyp8/qzHeCvfWV9SxJS48HMgbmFvGsaPTfKuKcOnga7lMLSm8dziGEURIYJiDNg0ZPcpqU+k
-	3BjkJyKXRRDP4HuCUYVACUanm+ZinjNIuwi+EYwCgSGoLyY7af9RjFaCLwFeblasoh5khiXR1pb2
-	L74CyusgniIqxs1aRgkGLHaFnc2CpxLPQLkR/EyWugHLXenOlonQb4G7pno0UuoT9Q2egFiLBpCt
-	KyYz8jl03QgYvLI5IIz1QP1wsQNAgNgsN1Qr0ypg1jLHWTdVFIGK40abQW3AtJWcUYrUpjBGEXFj
-	IhEDaUV9g02kGhPVc4ohrnhFih8OoSY9smPrGq95sRRjAyKioIJmIKhINI5NdTGeKL7nlmVo1iPr
-	Nzdoqz+JSQWcEzOUAqdTXjor0CcQzgAHkJyUrxM2xMPMvoFuFkYuiLFoYrJ5cD8M9GsH/cLi+eUl
-	xI3lTKtMMHCeCOUoR3zY3EVYvCrGluFJ6iYkGuu+VCgXGAP0EscCq4EVTVS0oRhhPK4sR0RZJRlW
-	w1GRNmUC0DsUWiKgGXgEqGntupfSDPiWCHAljlGsOMW3roXoIExggCi3AB2MxyPAbHDgeGUiIpYS
-	tfQTGC5KdxF8EY54sLVNilWbp7LtnDktANBmhmDMaJBiNy26HSvPAjXMWtYoomfZfwA5w10jf8V4
-	rwE2kaET0BkoBTzAC7k9o5aDbaLsrguoCwJSqgjQA7g8jLamjVINbAKYMwDsdvoIXAYkgayBNcBL
-	DdpCOU+Usc4gYbcqy5oFSKnBMzDAKBlOXjnJ+6VAoO+6T7Fp8F8ameySJLtXxciEospGhUuAxS1p
-	v3PbNIJjaZxOxvJlo3zTh1Lc71ZADPgKCSv8eXGMu8cl2dVQFGnoCHxF4CO4i+8+GiC+oVzgS8Dl
-	4ibhFpPiFSCzChgOzAKDch0wCsiK63HMwran4sy7PNG6OeiQhExAUQDXiqUYISPK/S0BZM044iKM
-	MtAfOOIJY9ZV8OTgZWwBEEtvo/yzES4Tx8pZ1HExQrG1LE+nuDXHhMeKs/R4otFZiCnNm4XLGHzN
-	M6z7Qx5QdRqGs9w1sgvjvQHYTMA4gXMV0PD+wIK45RIklawRVpsYiy5KUL88RhvgJ6FQrxfLvbm+
-	yTZiVrnEh7sVDokSGPhdDiDPx4iJcqXADUAC5YkgkJeajWJ5ToJ1Q7CnOnrVTLNi6FZkOMZqtHAw
-	ZGwryriMNh+lW1IMQ2pDsyROBx9meMoPjWOCWmA3sCN8rRXAUz4bg58uK6Z7noGqQAqoD9sx+Rej
-	aCjR6hquMY4VhofXTCpilChtBOoFDjuFSL0njG8PxQBzSv3jAsRKgyRMIiRzkrKl6yVOWgzbFPYq
-	1CrszAp7ADZW0tUo3/LgSnEMVwPsA/YA+1FqUF7LpHm7xQ6JyYJJOpaWnG78Dldt7dH0Okk1WPtK
-	kEODKtlw7DLhOB8MW0343goM1SyXhcponwprxP3uQKBv7hExpQw4FzgobnyzBtp9u9SZZMVCR4Qz
-	RagJeWDTt9FdzWfSPQSPcjwsHnqaNStCmWkmwCBwJASIGugdCB3nxpsJY4fh36XFRH34vKd8Vtyg
-	ZwJYUQ/fPejxmSRcF8DSUItmBYb7yvffp+aTlvy+qGEM0BbQLLyqbvKzokwQdQCZeuTElpntuQDO
-	f57gsM+iFFybVu5OCHcMXUotgK+cb5SpwGGFdAALE5aqOvhRVrg9qzwewEsXVFPz3oZAL0UYx8xx
-	/nscuEMq/NET/ojwJMrb4UeBgR7G58zeQq11JqUHeB50bRBUQpkI5+QJMQHOuCrrBJ6Bjig9UQJ1
-	v3nbmiS22U6Kc5c8lOA0NLGsgGekWZM6yBtUjcAQn6YSLlclcE8UDHTx4dviJIYGsG5bhC9dfbih
-	YmD7smLWqmW2D1MEAqNcuDzOpDEJ5p+wX6QMBcrDnM7vipXvACUG+mdFevxXu9i+Lx9MnNBASefV
-	sKECiQQUmygHgL0Ri7dyMn46jSB0FSjBCZ3X08pvz1vqTK9c/AHg7Qp4y3dLpI9D+4E2CFFnTmar
-	gddbNzwu3pDJcDDk7oNRj1rgm6GGMUZo11nYvc2yEvhkCITSBTF6TUyy3UBbo/TCrWRNCLQH2vrQ
-	DdjuKR0FujgFzI4svNYY5v3+hUcHf1UMKTEg7vi0ahjSKsf6FkIYBcopeOUsT5tK7FwJzbA4PsoU
-	o7QJPzqchQeuPkx6SRzWdHYnK+rZh/ArdRLHAt2MUnmiGHV+nH4GzhSIBLDHKIusC0BYATWqE89J
-	JGIAT5zgIswgS9SmudKmWGxTPG8z/Gc2TZe1h8nihE1OQHaICoM3Tib2h/6N47nmYkjWtwIcqqA8
-	h7XbQi0yFLiC6RVFIQLesxAOtKF/ACpKRurJqvJyOFcClEaFXqHZ2RE408L+jPAyEAXKfRcYIQwG
-	dA5/787AsM1B4XtDDHe8BA9fle8FqxXewaBqsKdZU+tzMIgeO6gKbfJMGCVPxR5j1kSIeM4pTocX
-	1+2DBeAWXQ3Z0+TytzRU3eIke89cNPaDMmlcqQjNKwOsNJZaCy+qs/utESZ6QgzgY8eJZr3XzngG
-	PCHtCTWeUGOEI0aw31yDKmy1Tuoj0NXAv3lpfnBhB4ZvruSMNRV4Q56DPqthzfHEhdvRph6rf0X1
-	gPNH9DqM7fMeui6RCEURj6JohDa+MCQv4ldng9BSMOxT5z8agZhA76ucU9839IQOYHlRHX+0FRdd
-	BOgqzt/LANvH1bvvM0QjHQBY8Eq+BrFi2GEMeAY9nZoxYIRdqk0d4hluQNrn2/iinCEtGCbpWjyU
-	7rkol0LqiiSH8q95snfD9NWHYWWDC+oX/6kNxSciP2Scr97OiUFeXFxGnQpLxTn1gVGGBkpnLj7+
-	d71e/36su6Otazd+dcJ6qzwcOvkqUOwLn/aF+xBujhnGbx5DHGDIklY9qQwv+iDYLeFTu4Jcw/SK
-	OOhxi2CNUIILqVcCH1WhEsiIUIuwKlDnC1ml1gobXXyEImM551+LKRIYmHP01bAJOCAQF+j0dLHp
-	FIaIswo1FrYCzI2DIer3Zda4CPeub+hMUggCwyZrwBr0dGrqkbERtp37exedCS0mxsc42zQ1sVSE
-	YmkhFeo5RijK45EswMa8az66LdSoPqpCNh98Rcqx2NPjMuDR5lUH4yRbTCGlwqaKgEitsN46gCDg
-	e0LlksVEAaJFROI+HaM+nZo0j/ZTl58Id8jRhYs4lBEeyMJv1flxSeciEXgwxhNuUY/Prx3ntNva
-	ScdVAHGs7ER5BKUWETB8A0P3kHH1OFZaqSjjRKjA+RIZgbQVVqQyvFgSa1BWSZSXgKhAxAi9RCkz
-	Ql8gZV0kbjPC3tAiaNfG2kHirA1V2BUImwGmJMDHp5RMZgCwNteZQb9Dt3+VrWo5GKqd0yaTboXX
-	POEdgHVfg8H/N2RYGJKT8HmavcVKAWuwRqhDQwPAgYWBzZsI0dCJzpkCySsPU7e0CJBG86C551nP
-	ASnc2EIAa8M+xpxEbBfa0rWeZbyXYlCsMTQbhJM40RceCs3BDhauOcrfAheefeBEDfSr4+HcRdQC
-	v1w3jjlFwhVGGRYyUolAkSd8NuZq4J49f/5xzSwfycbJxO/DS34GT0Yi2hHhY1ibxRjL0b+pKWXC
-	MLPBmdIRBd9Y2rUpw9QedvNwsIhUuwwv+RYv1IjlgXK2QA+Fw1bYIk5L7PRgUOiH9BPoFM7vrpSw
-	vVHDi1F8+YiroRnHq19vmOwUhoVi8E4jB93DsDgwTrrmwBFqhJHNDHCLJRZJJVDljVygwkBsQZz+
-	AAujsKg0T70HlAuc5TQ4GQt7w8RgNswRSDhmMcKCiRXtG/oVz9NUYqHuzdA89Jx5dUYYQi4z8O9G
-	uc0odxnol2MMo4yxzk/BBligXpW6hua0zQndHezcPMd78GJeO2cRdx2O8M0AHg2fFwh0FOg/dyqR
-	1kVrxWPmwjqU36B6MLSDv4orZwqOE+Y9mLE8lA54VBoTn57CsEyac3LXXl6DNZad4RwZoE0EzsNF
-	qA5ZeCVpqUN5DfBDwdcfZ56nFLZNqmdPXrwqSCFc7gCymHPvD210IW2Fv4lpWF4bnOJmxZDAsPiO
-	Ng4gOfOKu8A4hzs/bC0WDttm6ugAoh4ZFZbk3VMWhyvAbQox/og7+Ww7IgIjwhChAnsCZSVAQqlV
-	lzjzQ+nTfWExZwKMfid8DvSWMDqikEXY+7kEmYcgKspAcWUUEibr1imsUXhZnR2cK50pxjJ6Qxw/
-	FqMmY3leledyzWZ5TpXlrXMzWkc/b8bxHjqPmpTlYXUlGjnQl7ZNUNIqgNiQ14Ouv8bqalRAGITn
-	nf1u2iMM81q11KMcIMv8MKHqNiG0nNdEa7t52RgCqL0Rxoamdk1G2TopRcLC62G0q9wIAwXKFQ6G
-	484zocnmg9kPjKFqbAeqlu6naiLVWxbQ91fYt7/F6kzAulAVndINEQSiAcw3wtZf3AVbvg59H4Oq
-	vbB4GiNMGMPOZwgV9tACQCrqCZbFWGxhu3Gx8LinXL20iGXqsTqrpHwlFklSYZR/CjPhKKzfZ5gH
-	MCVJTXWMLQppcRJ1SMxy8eIS/pixBHGhzLNMDeuwUNiKshPgzBgj89S6n4ZfJoSVuVIZUcrLYHZ4
-	jXow6bDy1JEjJIDXjgn7BHD3oGaFb/nGsXQWbZTyCpo11EmGFt36idBx4zjO8oW3gzBZGIrsvuK0
-	Xq4LtTUBrQsP5Ly2WY9lmT7iHoRBiOmEuDU+raWMh/UdIw8BVJVO4kyuTDjv9RbWeDDWuNKh0UCd
-	wv4JIQCMsBtXctLeKOWhkNsZiCtNuTSZA4jaXYjxEPtF4G5MkpFhd+stqYjhAYFbQgSeKl/EoNQJ
-	/HmvddGKfvfnhWyVz4QSqEn/1LKj2Q6PAqqhBA7VC3dGlJsEigU6RoVfWOVPUWU7cLYoHwsBlLCw
-	OQt/+HiCQyvKYPRhsLBWYJUHwwW6eMq3igL6RGGbKKMNjA9NCBSezeCSbRFhOC42TwD7fJg/JeGS
-	Uzl6IcZrnmNGDIxLQxnvUjz6qa4QNC12MUaYbIQBNJbdiEIWw7KB1TyweWzzGicCI0S5GdjoOWm8
-	HygTGJ1nbu63sGHyivexFHvGyv9hxsgvovoxRMx7ubVIUKvsVOHCEKjRiE+3dNb5DklIlsCLYa7D
-	GChRZz7tIixetco7ArsEekhjvuettLCtKeNVVdei7MTo15kxNsaNK5D+w9hyDZz9S4JICdXWMB+D
-	jwmtug+/eYHH40GEjRfeh27/BiwO1wAsKqKzgck5JmwiVD1eDbxjQa3VMMeDIUmyqWL+koVfaWiz
-	GmjvK9d6cI8H/2KgI5C0sDMD941JMgccOADuaMtaKzxgXd1WINDNg2/5cLcHV+JMqHQAi7LCI5VJ
-	t/m2gaGhJC4CVgahhmrST2Fx6Jx6BroiXDAv/i6ObLZBRHhhixg408BoI4wM2whPGO5Z+jRGmvFC
-	CWpQeHwSRoXOIrQxcJ4H13jwXQ++EvpGVp09/+d6QzXAnCnNqn3TaMJqY79nhlVo4s0G3d1CSU7u
-	OMcFkpfDUt9nV8jYxslIGuq7piTJiuENKxwJ+cIHkkH+kh7hHRXeDMffVxc82T6xngP5nfGZNUaA
-	akSuRoLPAb9ma5S+VwJ/gK53ktr+r9xn4GygN/ohb4ggRBTWWeFPvX7qdlDc8EtXsxxGr75mXCHa
-	0WIwWe/z6uFIWCJ41KjP7wGrd8AFBwiA25cVsSUifDYXpXH1a5TlIk+q7PMM3gsxJlh4c1PAG1/K
-	YP9nN/qPZ/Jo5wNkUD4flivExEnqDC5ysjptuL+yzmmPBcX0EEsSeBW3/9fitDTWNOXWuKSVhT5M
-	DR1Jz1fO8oQFLTm02RSoh0XY6oJk7wIlE27tajiE02oJYBeWTJ80nhr2q1uEVoYLNHjhc5PA/izM
-	qQl4ctRiEhvHw8C5zc2dOQC8AtIddJur4AduXOU+v3H5QmaOehxhXEMFoFATFoEiQm0YuRKRxhzV
-	uATMhzr12Rw615bGiohcpv2AgTk0JgJ3a15Vc1Y5GIUXcNZBEjii4j5/phgurc/xyszRAN/EyL2o
-	boZgFNNWHmLGWLbuX0qfn8Er05DSw4zwlR8LdFA+FJBIiOy3AsMtPWazGmDLtVD7axhWA0tinF0E
-	DxvocJR5JQGsLc/w8XODls3C+4DhMRgW2pvfK8H7dMBIX+gpSm+BCwV6hX5AKUKxVRIBPDA6yXUA
-	S0thbOjQPxGntNwyNCp0NkIksFKbtmyakNHXc7aLANUltPWydBUlikHSHtuuu4xDSx85ylEGGR1h
-	AEIE978qRyxsHZNpPvO8+EooT+AVp+ln3m3PM0EDqOk3j7e2TOWMiKWbBauGxIGAXSPnO5Np7kSK
-	Omfp7ymdFOIIKYW9tR6vjlnoxM6GShjUUqLwtqld0GRX0ChqDoJs48eLnDlWNQaqlsOtEzsg2Z6o
-	9RAR1LxGxDvIdQvU92lrvBDoSiad5kAbXOEcA6DodcpViKOgATYTLNlLWAX0QhxPlZ6+8y9UhWQd
-	bJuQdBuePxvDtIdOPnTFYq2QTHi8Na6ew02HanoFCOfg66vOPbS3cmP1j50zVcGOA8vo+X9g4w+Q
-	Nlmm+vANHMNkTjI4POBtK/zscEeWnvtDdNv3YMcvYHwSnmqP3yHBvb4ypZkIiJ8RZgOzR7diLcUz
-	cbi0Gcv+j0XEesMUT5hiXKl0d4WIhV+MSnLPvBhMTsJfi+Hj9e++TeW8IpicgupiGNWCSzu/DUwK
-	y/AXRWB8CyO8Igqjj7L611wMQ557b4N8YCycsfTY86snwgULjpNQ7Atze8HU5jRHVRUUPQY/Wn3s
-	ZzdXwvVLjj0+Osx852Beva7pMpZoFNJpKIpAKtN8yZfIQKrjGxnVgqe2LOacjcoWguJHb4Lu5nT2
-	7cKRR9cgDEY1gZUrmb78Ob7aG87pzs7dS+kxG249CJ+/hSkR5csIPVBsfqLsRCUDw8jE9gDuf8Zj
-	2dd+Arv+Hbrf1ciEK4r5gm+ZJs6UsEeZV5IUrrDImvEJfc+BheYAs6CYXnFloipd1PDEmPomSfcC
-	/Z2S47dZowS87yJ6dwjFLQT6UaqqN3PneNh9iJ2ylh53uJt2/IDzI8KXjNIfoTi0TfUE9MUDjlhl
-	fQYe6Hk7r4ADx5l35TFrjIEl8Hvj8gtHyxITwMY3k+0v/wTvBOnuEH3z/Xeqpc2wt/rQp7AT8N89
-	OTs1K4rVR3C1/yDSD8M9zBzVnesWQfc6epRMZMd17qaet7M2I9ykHo9heANDRjw88ZD3kR2X8N4U
-	hi0qPJL1uC0Hjq0/aAqOUMV0E1irLvToH2Vi+QH8d/f4Owrw2JvtPtAA5YPj5x0bj59uV2Ce/z80
-	yIwxMH053DcQ9rb5GSLfbjDoVB8iCH7AjFU7XXiukq11S+jzk8Yv2PlDBvnCFGM4F+iCc4pMg7Uj
-	Tf6GTRq0lquBCnAr+d62sDEjzO15sysU03+AHb2h161NA/Rz48jUBPpsOeXt0nzSUy4ChogrxbAW
-	9tUqF63KcuA/gsIEF+hEmFgAMypAtC/CKsStbgtB8ghKFdOrnc39w0rok2Dn1hfpcVseUG6gjw8X
-	GuUchA64grJiEYryJHxWIYVSj1IL7FXh1YzwUo9ZLsMMsP166BW5ALz2MC3vb62uq4R+CZZc+yKV
-	YdZgXoxOxXCVBxMFhmaUe+LwnxeksHOLYEqqMMkF+qAAmTkGblwObw2GX5fORJjWJDQAy7D2Rura
-	L+T2Z53lfeNomLmCnddDj5ubfum2Krr4ShejnGGENhJWyiKkAqUmUA6klLf7znJFfw3AuAF6+VXg
-	3QvTwo+qRpUSRNLMWtIYt7lpFNxQzdKY28kdYG6M3iVwVcrw23rDvkuPFCa3QCdSgwDc3B9s2w4g
-	ixD3dwONQLFvoXIrQeZRZrzY6PbePBGuX8Cq+2DYH0EWvLcO7JgGPWcBVRMhkoDrq/PChSP6IvIZ
-	XCJoEYaV3PhCI1BmjaRq7gtcs4DGcs6QFsVhfOGfpgp0wgAyazRMWwE/mgTx5BUIDyFHZWPVgtUH
-	UR7ARl9g5pKmO1rcMBJueqH1T6+qAqryynJz5ys6I5lKxHwFCZPmygZUHwR9Ds28TNXqxtDuHZPh
-	+/MKs1mgk6xBpo+AGSth9lXC4V13Yrj2mDucX7IH5PeonYPajVSt2vGuT7nqKhi0Eao2tHzNz6YL
-	+5/qjcgFGHM56NUYU9aki9YCrAQeROV5pq9ozEXMGA3TVxRmtEAnESB3XAzfD9OxM8a1xWQfQPh4
-	s3eqBWUv6HyUZWiwEfW3QdmbzJjTOuOmanwpNtEdQ29EBrqaHLkIkVLkXfLSDqRzEPkLyqNY9lK1
-	QgvTWaCTCxCAGZUwPUz/z6rsDcED4d6yLTMrCqrbQdaiug7Yhup+gsxBApsEk3UBXo0gpgTPb4eY
-	TkBv0IGIDAG6uy0DWvvX7QqWPcAlZGUtM5cXAFKgDwEgDhgwLQeSsYMh+Dki41rHtA18uh+176DU
-	kct2u7XdZYjpQLhRGkZo5d+1Hw3M3WB+At4vmbY4yc3d4Pq3CjNaoA8BIA4YMC2sZLupYjDY2yFc
-	u36qSfU1rNzG9OW/BuDWYZAqg6oFhRkt0AmllhffzN8JN1XAvJ0wb+deJvRagti2CH1BoqcQHIuw
-	VDF9xUMOvMNg/1lw29OF2SzQh6hBcjRzLNwYapKqsW3w9J9R+wVEBr8fy+gD0H5U/wrMZtoKFw4r
-	RK4KdMoBAlA1GqryGLFqzCSMfhHhYkS6nVyNQQZ0CSoPEZg/MGOpy5Hn8jYFKtApBwhAlQJnQ9Ub
-	7v30MaX4XAF6OVAJ0qNhi7QTgApU6oFVbtNj/kLV8sY/aZlRAdOXFWavQKcRQHJ04yiYWZ3vzLdH
-	7WTQ8QjDCHerO2pP9XcHQyMFKFtQXgapRmUe05c1LisrmFQFOu0BkqObKuCGPCn+w7E+xToE7AWg
-	A0DOArojdEGkParFqJqGravEZBBqUN3j/gxFtyFsRmUNgXmZGcv2NQIjLMkvUIH+nwFIjqaNhllH
-	SfVLvyyM2NQTQ1cMXRHOwNoSrPVDgCjGS2PMIVR3Y3mLNDu5ZfnhpmZdBVQVTKkCnTr6X4ofZG0W
-	3PyYAAAAAElFTkSuQmCC"""
-
-C_QUALIS_LOGO = base64.b64decode(lQUALiSLogoBase64String)
-"""Bilddaten zum QUA-LiS-Logo als Bytes aus:
-QUA-LiS-Logo-farb_200px.png"""
+	- C_LISCRYPT_LOGO, C_QUALIS_LOGO, C_LISCRYPT_ICON16X16 und C_LISCRYPT_DEQMDATEI (dekodierte Ressourcen als Bytes)
+	- C_SCHLUESSELARTMESSAGEBOX_SCHLUESSELARTEN (Zuordnung von Schlüsselarten zu PyQt-ButtonRoles, Abbrechen zusätzlich)
 
-lLiScryptIcon16x16Base64String = \
-	"""iVBORw0KGgoAAAANSUhEUgAAABAAAAAQCAYAAAAf8/9hAAAABmJLR0QA/wD/AP+gvaeTAAAACXBI
-	WXMAAAsTAAALEwEAmpwYAAAAB3RJTUUH4gULDgEZ/1es0wAAAcFJREFUOMulk81rE1EUxX9vMuaj
-	QVIJuglZuHEpuNYyk2xMcRHwT8gskuxctukgQSgBV0WK4D5ZCAETRJpZSCYtErpz50Jqq6UKoiIm
-	k9ikyXOVkulMQPHu3n3nnXvveeeK6XS60Wq1Hg6Hw0tSSv4mhBBEIpFxJpN5pFqWZZbL5aCu6y6A
-	X8wXsG07KIQwVcdxQqlUis1KxQXetW2azSaBQIBsNsvtlRXX/cb6Oo7jhBQppafik60t0uk0jUaD
-	er2Opmk83d72jCGlRPFr2TRNisUiB4eHfDg6olAoUCqVPAQAykXh3uztMRgMyOfz57lcLke/32e/
-	2/VoolwUKh6PYxgGiUTiPJdMJjEMg1gs5hFWnT/cW12l0+kgpaRarXrAtVoNTdN4tbPjT2BZFgA3
-	ry7x7O51hBD8Ppvy9qvDg9cfXZhZKH7//W14xuP9LzjjCZvdE+xPvYWm8iX43B/x4v0PAE56I3aP
-	fxEM+JtLWeS6K2GV5bDKneRlGvdvcOta1NfSyrxF58mWVIXn776zHFJ5efCT497IhZm9UWeOAhhP
-	JgtnrfjshRACNRqNnrbb7XBpbe1flwld10/F/67zHy06vgSHkYRPAAAAAElFTkSuQmCC"""
-
-C_LISCRYPT_ICON16X16 = base64.b64decode(lLiScryptIcon16x16Base64String)
-"""Bilddaten zum kleinen Windowsfenster-LiSCrypt-Icon als Bytes aus:
-LiSCrypt_16x16.ico"""
-
-lLiSCryptDeQMDateiBase64String = \
-	"""PLhkGMrvnJXNIRy/YKG93UIAADKQAAAAKgACglUAAAArAAHpwgAABEAAASA0AAAEQQABIFgAAARC
-	AAEgowAABEMAASDHAAAERAABISEAAARFAAEh5AAABEYAASI+AAAERwABImIAAARIAAEihgAABEkA
-	ASKqAAAEUAABJJkAAARRAAEkvQAABFIAASUIAAAEUwABJSwAAARUAAElUAAABFUAASV0AAAEVgAB
-	Jc4AAARXAAEl8gAABFgAASYWAAAEWQABJjoAAARdAAAuCQAABHMAARerAAAEdAAB7x0AAASEAAEY
-	aQAABN8AAfhEAAAFOwAALeEAAAU7AAAu7wAABTsAAT8iAAAFOwABSeYAAAVNAAAuMwAABU8AABA4
-	AAAFTwACDS8AAAXAAAIeEgAABn0AAC5dAAAG/gABHpsAAAc9AAEfEAAAB20AAC6HAAAHdAABHzsA
-	AAevAAFdKQAAKDUAAVBqAAArOwAAP0MAACs7AABz4QAAK08AATzvAAAxDgABXY0AAERAAAEgfAAA
-	RUAAASThAABINAAB6pIAAEhZAABeggAASIEAAfbuAABJQwAB9AQAAEq8AAH0KwAASsQAABNcAABK
-	xAAB88sAAExEAAH11gAATJMAAfYsAABQUwAB/p8AAFFSAAAiWAAAUn8AAGOPAABUxwACDNAAAFW9
-	AAINVwAAWLQAAhKGAABacgACGhcAAFtgAAHfygAAXMcAAh+KAABdeAABHSkAAF/DAAAQtQAAX8MA
-	AiD6AAB5ZwACOnMAATG6AABAhQAB1EUAAEK2AAKYNwACnAkAAr/DAAE9HwAEh5sAAFBsAASHmwAB
-	7JoABI2JAAHsaAAEk7UAAe5dAASWJAAAX5UABJZbAAHuwAAEmCwAAe93AASmeQAAEyUABKZ5AAHz
-	bwAEp9QAALJmAASn1AACg+cABKuMAAHzoQAErDkAAGABAAS2RQACiw4ABLbeAAH09AAExHoAACHL
-	AATPBAAAE5oABM8EAAH2ugAE0CUAAFPoAATQRAAB94MABNMAAAH3sQAE1o0AARjXAATWjQABVxgA
-	BNaNAAFZjwAE1o0AAV23AATYNQAB+BgABOwwAADIoQAE7DAAAT5vAATsMAAB/CcABOwwAAKLaQAE
-	9jUAAf12AAT2NQACZf4ABQTPAAH+ZwAFDB8AAGTaAAUgRAAAL2EABSBEAABddgAFK9QAAgYbAAU8
-	VQAAyVAABTxVAAIJggAFPKEAAgoYAAVINQAAL4kABUg1AABd7wAFTOMAAgz3AAVWRQAAI9EABVZF
-	AAFaWgAFVqUAATqEAAVmvgAAWDEABWa+AAE/SwAFZr4AAg6AAAVn1QABV1cABWzAAAIQMgAFcokA
-	AhDRAAWLrwACEq0ABYuvAAJ38gAFi68AAnk4AAWMBAAAFIgABZjFAAFATwAFmMUAAhTyAAWcRAAC
-	FnwABZ9gAAIXHQAFoQUAAC+zAAWhBQAAXiAABatgAAIY0wAFrnkAAGe6AAWu/gAAZ/gABbA1AAIa
-	sgAFubUAABrRAAXAZQAAL98ABcBlAABeUwAFxK8AAh3cAAXErwACeIEABcSvAAJ5xwAFzMIAAiCk
-	AAXPxwACHmcABhZdAAIhnQAGnCwAAi8CAAavfAACMa8ABtaNAAIzHwAG6QAAAjPYAAcwSwACNkcA
-	BzCkAAI2ggAHVqUAAjeSAAes9AACPasAB7i1AAI+/wAPaqEAATl2ABB+kQACRG8AEV6RAAJD1gAS
-	kfIAALUZABLICwABlFsAE9vlAAEF3gAcmccAAVQaACqmeQAAsX0AKqZ5AAKCdAAq1lQAAGkMACrs
-	MAACibIAK0bFAADHdgArTPQAAonfACtmvgAATNUAK4t6AAAXzwAri68AALHoACuLrwACgvEAK5h6
-	AAAX/wArmMUAAE1FACuYxQAAdAoAK6EFAABpRwAroQUAAMgBACvErwAAsi0AK8SvAAKDPwArx/oA
-	ABg7ADePkwAB5m0AOMgOAAIsRAA7Eq4AAqhTAD273gACGAUAQNETAAFhXABDOp4AAOXyAEZuNAAA
-	9NcARm40AAD5lwBHlpQAAT1MAEeWxAAAEnkASC+DAABOWwBIdzkAAT2GAEknmwAAX2AASXnlAAJk
-	ewBKK4IAAfFyAEo2lQAAPdgASjaVAADIaABKNpUAAT35AEo2lQAB8ekASmNiAAFX0gBLkMUAAFOz
-	AEwLpAAB9aEATFrCAAH1/wBMg5UAABoWAEz7gQAAYKoATQLDAABUjgBNNYQAAD51AE1lswACZb4A
-	Tou7AABhkgBOi74AAfhqAE6/pQAB+JUAT3yKAAAZmwBQRkUAAMm/AFGFCQAB/3MAUfPCAABjIgBS
-	iv4AAGPEAFKxAwABR0QAUr18AAE5CgBS/fQAAGP/AFM4XgABHlEAVMnzAAIMaQBUyfMAAmZ+AFU/
-	XgACrAkAVd59AABlgQBWMbwAAVvAAFaGwgABG98AVoqlAAAUDQBWiqUAAg+WAFaMlQACD8kAVpDx
-	AABlsgBW9kUAAhBuAFeMowAACikAV5BUAAFL6QBXkFQAAVPfAFeQVAACEdgAWMc5AAITZABYycQA
-	AT9+AFjLmQABQBEAWP30AAITyQBZxPMAAGXjAFnLwAAAFUgAWeelAADKlABZ79QAAhbqAFn2kAAA
-	WdMAWivAAAIXRwBaZ5UAAheAAFqD/AAAZxkAW2YzAAIbgwBcBooAAV8oAFxdNAAA4NMAXF00AAIm
-	xABc+r8AAh46AF7fDgABy2MAYXQeAAKf+gBnYwUAAVE2AGnolAACLzkAajWbAAIvuQBtiDUAAjNc
-	AG5efgAAODUAb8qZAAJHDQByeLwAAjWcAHUVlQABcT8Adio4AAEupAB2hLwAAjh6AHgRdQAAsHEA
-	emeVAAI8WAB6bEQAAjwGAHp5JQACPW8AfAReAADmwgB8BF4AAd/4AIL8xQACUQQAg8XJAAFmxwCE
-	do8AAC6xAIR2jwACgg4Ah9SxAAH8vACIEdkAAWrIAIsyYwABuKAAi2YRAABwMwCMKUMAAiAiAI40
-	TAABQ4YAjjWuAAFD1gCQNkMAAF/DAJUf6QABv6YAnOPkAAFtCwClW7MAAT++ALBJtAACCI0At3F0
-	AAIIzQDBjCMAAalJAMTaJQACDBUAxRhFAAIhHwDJtW4AACfBAMm1bgAAg5UAybVuAACMMgDJtW4A
-	AL10AMm1bgABAAIAybVuAAEHfwDJtW4AAc7rAMm1bgAB03IAyxvUAAADPwDLG9QAAHWpAMuSTQAB
-	SRIA0AtCAADfZADT+lQAAnQ7ANljSQAArOIA3ikDAAAgKgDjL7EAASNeAOMvsgABI50A4y+zAAEj
-	3ADjL7QAASQbAOMvtQABJFoA447eAAISBQDk/XUAADyuAOYoBAAAPqQA6k26AAEcFQDuinUAAdaj
-	APLOYQABZDgBB9uUAAHsHAEZamUAAA7CARsLTgACOioBG8mkAAC0uwEc8hAAAhrcAR085AACl1YB
-	Htc1AADe5gEgfCMAAktMASRgcAABTNMBJVVUAADjaQEmPRUAAY7aASjFjgAAWuwBKuQ0AAEKyQEr
-	l9UAAYiMAS1jdAACa+kBLu+eAAAdtQE8Z3QAAjgWAT8UdAAAeKcBRNMxAABuPQFIpZQAAHn6AUpN
-	9AABnI0BV1JkAAJy1AFfS7wAAKqyAWBBQQABOcEBYVI/AABNfgFl9J4AAiHTAWX2ngABVbgBbIeH
-	AAHX/wFsnjIAAkB4AWyeMgACSW0BbKAyAAGsfwFtWskAACNoAW3prgAAQ6oBcYeXAAG2SAFzjcgA
-	AazEAXaO7AABOkIBd7ZeAADaXgF4uckAAdVQAYVH8QAAYusBjMCFAAFQFQGZalMAAW91AZugIAAA
-	GkUBoc9XAAJ+iQGoMhAAAMrNAatN5QABsEABrYVnAACY4AGt60QAADevAbW0LgAAP24BtlLeAAKg
-	eQG2YtUAAYLCAbZs1QABgZIBtm3VAAGA+gG2btUAAYBiAbZz1QABgioBt9kIAAFlbwG5PMQAAXKL
-	Ab/j5AAANN4BwD0CAAHv5wHDDGQAApCVAcn/FQABWPABzumPAABPyQHmgUEAAJMUAe6yxAAAf5AB
-	83VyAACOGwH3h4QAAh2RAffc+QAB2bUB/WqEAAAzcQIDSL4AAYzZAgNRngAA9YcCCbjkAAECrwIf
-	EscAAY5HAiJsrgACmMICJSXMAAH7MAIpHB4AAAdxAim+qQAAnLgCLcCkAABxTwIvPU4AAh0lAjHY
-	JAAA3iQCPG2pAAG0WAI9h7UAAZCqAj+XMgAA8oQCP7tOAAKLkwJg6hUAACqaAmDqFQABDg8CbGcV
-	AAEVhgJseXoAAJdGAmyU0wAAVuwCcX7kAAI/vgJylTQAAN/dAnZ0eQAAHyACdnR5AAHkLQJ8OaIA
-	AYcKAo8x/QAAZDIClCK+AAKe6wKUVZQAATN7ApZh4AABMhYClmHhAAEyXgKWYeIAATKmApZh5AAB
-	Mu4CmVeRAAEu8gKZV5IAAS+FAplXkwABL80CmVeUAAEwFQKZV5UAATBdAplXlgABMKUCmVeXAAEw
-	7QKZV5gAATE1AplXmQABMX0CmYH6AABUFgKiiqUAASwRAqMGHgACqaECo18UAAAMnQKlsikAAJAx
-	Aqo2lQAAc6cCqjaVAADHOgKtkfoAABcxAq/agwABoVgCtF6hAABw5gK0g4oAAV1aAraKpQAAsbIC
-	toqlAAKCsgK3Up4AAR9mAreQVAABRCQCuveeAAFcoAK8fi4AAqE0Ar0fvgAACr8CvoK0AAALHwK+
-	grQAAm63Ar6c+wACFXECvx++AAHeQQK/ReUAAd6RAsCCtAAB3tsCxHuOAAJ5BgLHPbEAAOujAtsb
-	QQAAbzcC28MZAAIjuALewA4AAb8TAuJMtAABBnEC5KQBAAJBuwLmag8AAajIAvOCpAAAKx4C84Kk
-	AADCogLzgqQAAQVSAvOCpAABDpgC84KkAAHQewLzgqQAAddwAvXYbQAAyDQC9e2hAACuuwL18E0A
-	AMb9AwU2ZQACB94DBYVjAAG6CQMR2uEAAmIrAxSe4QACKCQDGvwSAAIgWAMbcbQAAWm0Ax4GdAAA
-	YRcDIOqCAAHjygMhz2UAAoGeAya4ngACo30DKLg5AAEcYQMp1R4AAh7TAyooTAABLSgDKiiUAAEp
-	mwMqKJUAASnaAyoolgABKhkDKiigAAEqWAMqKKEAASqXAyooogABKtYDKiijAAErFQMqKKQAAStU
-	AyoopQABK5MDKiimAAEr0gMqKKcAASxTAyovZQACHxQDK4sJAAFEWwMrng4AAP0gAyxOtAACTYED
-	OwiEAADbcQM9HaQAADciAz+GNAACTk4DRB3dAAG5UgNGFm8AAYmuA0tphAAAnSIDT6sOAAESlgNY
-	lKIAAdo5A1v7xQAACFwDXGMUAAInbQNcqJUAALASA1z3lAAB/zcDYOATAADGCANj1oMAAghNA2Tl
-	9QAAksUDZuPEAAKk3wNtdBQAAkzsA3AvVAAATyQDcR8BAAJFCAN033UAAiYAA3UotQAB/d8DfWth
-	AAIrJQOA3l4AADitA4G99QAAZhQDiOADAAEZygOJxhIAAYZTA4sd7gABSlUDi1HeAAG7FAON034A
-	Ap3sA5EDCAACMMIDlw3CAAIv7QOX+NEAAG2NA57o1AACdM4DpUFkAAFtowOmDQ4AAoVwA6nf0gAA
-	s5kDr8kkAACbGAOvySQAAWklA6/JJAAClLwDsIK1AAKPrAO04OQAAGAvA7nuZwAAnZEDvLAXAAIJ
-	TwO8/6cAAL7ZA8AEAwABYNUDwQw2AAIb8APDKKAAAh9LA8V1EgACCawDyvRyAADzMQPODl4AApVH
-	A9aKwgAAGdMD1/FVAAJnIQPimscAApuQA+MKbgABFA0D4/XJAADBdwPkLNQAAIbJA+cfZwABi+MD
-	69X/AAFB3gPsP6QAAan9A/QSyQABlwcEAPlBAAJFuwQFCxUAAW4MBAeeugABXigEDgluAAD3nwQY
-	EOAAAgBCBBrtlQABjTYEJkiEAACGCAQrmwkAAUTKBC4IjgACmo8EL6XEAACFcQQ03CEAAfpMBDWE
-	GwAB/v4EPzUpAAE0MwRDcgQAAJenBEl4UwAAFcwETBrZAAHyXgRS5T4AAqrUBFlN4QAAa+QEWdp1
-	AAJ78wRfb7UAAZriBGN7QwABIs4EY3tEAAEi/gRje0UAASMuBGTUbgACZ4gEZXODAAEhewRmayoA
-	AD/kBGtEPgAAHUwEbP1EAAF+BQRuqwQAAk9pBIC70QAAbEEEg3DAAABPlwSIePMAAF6vBIyHFQAB
-	A0EEjtuKAAAYwQSWtE4AAHStBJa7XQAB3E4El8zFAAFaEgSYSbwAAT2+BJhJvAABZMIEmEm8AAHw
-	IwSYSbwAAop4BJkosgAAVFcEm4F+AAHKuASbsd4AAcoFBJ8DSQACAxoEnwNZAAIDWASfA2kAAgOW
-	BJ8DeQACA9QEnwOJAAICIgSfA5kAAgJgBJ8DqQACAp4EnwO5AAIC3ASfA+kAAgGmBJ8D+QACAeQE
-	nwRJAAIFSASfBIkAAgRQBJ8EmQACBI4EnwSpAAIEzASfBLkAAgUKBJ8E+QACBBIEoXVEAABvwQSh
-	dUQAAHkBBKI/kgAAmbgEot2+AAAP2ASmRAQAAoqsBKZM9wAAEuIEpm/DAAFYTwSovZUAAAk5BKws
-	pQAAUr8ErCylAACyogSsLKUAAfRUBKwspQAChCwErKtdAAEYHASsq10AASZeBK7lnAAByMgEtOmE
-	AABBUQS5yuUAARmIBLnK5QABUdEEugnkAACT9AS6CeQAAJavBMGVzgAA/EAEyZhlAAH2UwTRZlIA
-	AFflBNYqwgAAVWME4ILUAAG7sQThGA4AAIBEBOXNOQAB668E6E68AAH4ygToTsAAAfvABOmVGQAA
-	WGEE65jHAABiQQTsUX4AAfxTBO5UUAABNqwE7lRRAAE23ATuVFIAATc/BO5UUwABN28E7lRUAAE3
-	nwTuVFUAATfPBO5UVgABN/8E7lRXAAE4LwTuVFgAAThfBO5UWQABOI8E+FPSAABkowT7UHEAAHLs
-	BP5WhQABPqAE/2ZSAABMhgUChkIAAJqnBQWclAAB/soFBrCxAAJhhAUKClUAAaC6BQqC8wAAYnsF
-	E6zlAAH9oAUaFVEAAnB3BRq8ggAAjxUFG/rUAACB0AUfpLUAAlqyBR+2kwABhHYFIIVsAAIBVgUj
-	j1MAAK2vBSQW4wAAAMQFJot+AABjUwUpyDIAAKKaBS6neQABrXYFNeXGAAIGhAU4kcQAAgb4BTiq
-	/wACByYFOLzRAAJxAQU7sL0AAGRvBT4xpQAAJXEFPyKjAADAYwVGz8MAAmZLBUj4TwABhYAFSw5O
-	AAJtlAVM/8EAASDrBU3uBAAB7YgFTr6pAAA8CwVPe0AAAfEuBVaTfAAAZQgFWO5HAAGdLQVdNIoA
-	ACBtBV2/ngAAgmIFXb+eAACLEAVlNPsAATquBWU2OwABOuEFZ7BeAAIO6AVrtt4AAg/2BW5NjAAC
-	Yw4FckjaAAAkWAV3eX0AAjdKBX6btAABGpsFi4mvAAE7jQWMNXQAAhMuBYxGxQAAWRAFjLyOAAIT
-	mQWTCOUAAGU8BZY4CQACE/gFmEclAABqNgWZ2LUAAQDlBZuImAACFhYFm6jEAAAlPAWcK6QAAhZG
-	BZ4e5AAAJrgFozbEAAFiuAWkYIAAAUiBBaTOWQAAn6oFqol6AAAmAgWsO+UAAGdSBaw+5AACMiEF
-	rErlAAC2ywWueEEAAGeGBbA5XAAAZq8FsIjBAAIZnwWwj3MAAGbjBbXeJQAADyEFtojVAAJcDwW4
-	jLwAAhz3Bb1DLQABaMUFwjXLAAIN3gXGQ14AAHl0BchrxAABsyAFy77kAACLpAXUGWkAAkg9Bdpa
-	PgACqPYF22l9AAIf8gXbeosAAESOBd+6ugABHhgF4wPEAABBwAXjgrUAAeGaBeSPpQAAD2oF52aV
-	AADo/AXql3QAAkjNBeuhpQACUrMF7SshAAH88gXv0qkAAcIPBfwzZwACIM4F/iGeAAEaVQYBLWQA
-	AnJcBgXl8QACQAsGDMkOAAKZ+QYQ+iQAAMTXBhN+YgAAV6AGE35iAABdpQYV8C4AAmN7BhczuQAA
-	lgwGF4TpAAHMIwYeTRIAAKFaBh6B6QABn5YGIeu/AACJKgYlP+UAAhu4BinyEgACOvIGK5t5AAFF
-	AAYrsgMAAVZBBivvMwAB0QsGLCTlAAG8PwYv9IUAAVwMBjJ+ZAABpnoGNBx+AAD4EwY2zVAAAA1s
-	BjbPCwACFcQGOC3HAAE7FAY8G4UAAl1TBjwdbgAAn0gGQBs3AAKbTwZBo5UAAVgKBke+8QAAa1QG
-	R85iAABcjgZIOScAAKMzBkwb9AAAkm4GTEFVAAJuMAZM/8EAASFFBk+BcgACIwgGUNGnAAB0QwZS
-	kyAAAcV5BlLMQwAB/hoGU2ZnAAGaYgZTxW4AAUERBlSDpQAArUoGVQL0AACQ3gZVAvQAAOMMBlXe
-	VAAAgPcGVihjAAFKDQZZxLsAAetUBlo0bAABIa4GWsvRAAHylwZay9IAAfLNBlrL0wAB8wMGWsvU
-	AAHzOQZbARUAAoreBl1rKgAAV2QGXm8yAAI+cwZefrAAAj7ABl7jbgACkxIGX1DUAAIiDAZfcNQA
-	AVX7BmZn2QABGJQGaqY3AAKbxwZrUb4AAqpsBm4kNAACPeAGb9tOAAKiVAZw8eUAAi0SBnHoIgAA
-	mEMGewYDAAAT0wZ7BgMAAVqPBn11kAACD1cGfXeQAAHdsgZ9tqgAAVGCBn7O5wABjZMGgYWwAAF7
-	bAaG0h4AAqeJBoj0ogACO4MGiuqCAAKQLQaONIoAAEDRBpBysAAB4e4GkOf1AACVjgaXEEIAAAAA
-	BphcgwACLrkGm3ajAAFecgabg3QAARzoBpuDdAABU04Goa4zAABDOwalUOgAAWT+BqY8PgACMDkG
-	qLyZAAEzwwaqnfQAATtVBqx67gACnm4GrJpiAAIxbAavg1cAAjHmBrVEhAACjy0GtVm0AAC1eAa3
-	3XQAAAI/BrfddAAAeFEGt910AADcigbAXwwAAg6uBsJhsQABY0QGwt3OAAD5HwbJRrEAAMMwBsoW
-	mQAAIWAGyqLkAAAsNgbKouQAARDLBsrGtAABEDUGyudkAAAtVwbK52QAAMOxBsrnZAABBu0Gyudk
-	AAESAwbK52QAARcYBsw1OQAAiBAGzEDuAAAMPgbQMsIAAjKlBtGN5wABX1YG1mrCAAIy4AbYKxkA
-	AHy3Btj/6QAAoNkG2k5TAAERYwbai6QAAXRbBtzKJQABkVsG3VdEAABu0wbf28cAAZeoBuO1vgAA
-	R4QG5THEAAJlgwbra5gAAiJIBut0/gACOd4G7GH+AAJkwwbsea4AAPsMBuy7VQAA6ikG7OxSAAI6
-	qQbtKScAAnbaBu5kgQAA7CAG/q9CAAKWnAb+4WgAAQ8lBwBwyAACPJYHAXeuAAEBVAcCkiQAAZhT
-	BwSWvQAApI4HBNteAADMPgcItcQAAE9cBxIsJQACEYAHEjEiAAFwXwcZvcIAATxcBx1q9QABjz0H
-	IIWRAACIjwcwvWIAAjzbBzLsGgAAQDkHNpLRAABxlQc3NX0AAndqBzozqQAAJLwHPtEqAAEa4wc/
-	O94AAR+vB0OYVQACGy4HRB3YAAKWHwdKMJ4AAR7KB0tQJwABw1IHTP/BAAEiCAdM/9EAASWYB1V8
-	GwAB8FkHXKwQAAFSqgddL3QAAfUmB2FyxQAB0ZcHZjESAAAXZAds8mQAAfIeB2445QACVvMHda4H
-	AAGw4wd8rBAAAVL8B313WgABG0EHfZokAAHdXQeBhkAAAXxIB4SUXgABhRkHiU/nAAGkhQeMAxUA
-	AJlNB4zPlwABXroHkFqSAAFe8geQWpIAAhJTB52WFAABf5kHn7FEAAB7zAei+sIAAjvHB6P4JAAA
-	nkQHsEftAAAeZAewYAoAAByUB7ETPAAAEGwHtEs8AAE+3Qe0vHwAABDmB7pGbgAAMQIHwreDAAHh
-	PAfCt4MAAmuIB8UCFAABZkoHxlxkAAFzbQfG17MAAVrPB9NOpAAAMY4H1UPEAAIt/AfVZkMAAe+j
-	B9d9EgACN80H2J4RAAAeIAfaZZMAAeo5B+OTdAACGFEH4/u1AAFJowfru0UAAGnzB+/6hAABvcUH
-	8MQUAAGSCwf52FUAAfViB/5k1QABcKcIAiU1AABdGQgDqQMAAKHvCAw7IwABxn4IEZLOAAH/1ggV
-	Dj4AAPYuCBbsYgAAUmAII3+yAADtTQglkr4AAqLDCCfVAQAA8GcIK5tpAAFFNggruCkAAUSRCC73
-	jgACpYIIMFuUAABg2Qg00AUAAEsUCDVrRQABZ20IPYPiAAHpWgg9g+IAAm0pCD4xLgAAngoIP4Pi
-	AAC0VAg/g+IAALrnCEBKwgAB8aMIQ3RJAABgaghFZsQAAl5fCEb6hQABLWcISe/8AAAY9AhOulAA
-	AguQCE7jowABqE4IUGm5AAGtHQhWJe4AAHTqCFYl7gAAdnUIWFUKAABUwQheTRMAASySCF5NFAAB
-	LN0IX46TAAGh+whg5eUAAeNyCGIGRAACGc8IYl4FAAI1SQhoSZUAAGKvCGnqJAABBJgIbTUAAAIK
-	7Qh4MQsAAfCcCHoqMgAB7VMIfv7oAAI4sgiBhkAAAXm0CIKoZAABCjUIilWAAAHt9wiLrNkAAe4o
-	CJUBegAAQRcIlWMuAAB6UwibrzQAAQjmCKNtlQAAsRwIprWEAAGbjgioE1EAAf+gCKqdGQAAH50I
-	qp0ZAAHniQisYvQAATu9CLiqngACMmIIuhBtAABrCQi7EtEAAng1CLsS0QACeXsIvCVCAACaNQi8
-	rdQAADkTCL2MyAACEu8IwGLRAAABcQjE2GkAAF8jCMdDvAABQIgIyQZVAAH8gwjKtDUAAMe1CMq2
-	1QAAyf0IzMnFAAFcXgjPoSQAAlnmCNNeCQAAft0I2tSEAAKN8AjblCMAAVTkCN1EhAACjW0I4txk
-	AAKSQwjjQY4AAPt2CPBGNQAAyRII8rtZAAEWlgjzcMkAAH1LCPmlMQACY+UI+iWYAAG1CAj6JkQA
-	Aeq5CPz5SQAAVREI/T2pAAGq9AkE5NEAACzJCQV9JAAAxXkJCHFlAAB26gkJ2qQAANq3CQnapQAB
-	WcwJCfRkAAIqBwkL/OUAAK4QCRPtRQAAwPgJE+1FAAEEGwkcQWMAAFoKCRza9AACJSkJImtuAAHb
-	rwkjI08AAZkACSvilAABa4AJM5o1AADplQk8S/4AAF7nCUft7gACq7oJWn5FAAGyVQlbPpkAARfW
-	CV2mpAABwH0JYgDFAAFc4AlikGIAAnrFCWK8YAAAC+IJYr5gAAHffglnVfIAALhACWi+aQABNJoJ
-	bGH0AAASqQlsYfQAANnPCWxm8QAAADsJcXqMAAIelwlzLZQAAD4PCXTtTgAA/gsJdoyUAAF2DAl2
-	nJQAAXV6CXa8lAABdp4Jd2yUAAF06Al4cR4AAp01CYGGQAABepAJgnzFAADlSwmKt0oAAV3sCYx0
-	0wAAWUQJjNb0AAJQOQmOCS4AAqGoCZV5YAABLzoJlumCAAHu6gmahDkAAYpWCZ+l3gAASLgJn9rU
-	AAIxCgmis8QAAAKfCaKzxAAA3YAJpf1kAAA5kAmmhIQAAijnCad/sgAA4IIJqdKJAAFMdwmsr4UA
-	AgETCa0+8wAB1hIJuObJAACNkQm45skAAMIWCbpuAgAAuVkJurAuAAI7QQnClDkAAb5ACcQk6QAA
-	keMJxbBlAAJm5wnKWSsAAegTCcuwFwAAFQgJ1Q0SAAEuDgnVDRMAAS5ZCdfMNQAACMcJ2wKnAAGW
-	KAndANUAAnziCe2MpAAA+kQJ7YykAAD6qgnuRcQAAezICfElJwACe1YJ97u8AAIFhgn6uNIAAFp0
-	CftDBgACAKoJ/XdEAAG9RAn/xMkAAJ6zCgTocQAAZngKBW3+AACpqgoGDEQAAWHpCgb8rgABEykK
-	B320AAEdtwoJb7QAAEJACgrQ9AACLM4KEyjnAAGPoAoU7RwAACKWCicowwAABdcKJyjDAAC7Tgop
-	ZhkAATM2Cim1ngABTB0KKi/lAAHtGgoqxY4AAR/0Ci4+pAAAud0KLuG8AAG3RAoyp+UAADQbCjd1
-	8wAClPwKO43ZAAClfAo9GOQAAGpsCj+x1AAADQMKQ3rpAAHHAApICRUAAmANCkqJIgAA77UKUe0V
-	AAJ/JgpR9KkAAYs6ClLbrgACmVkKVHkJAAEaAgpU/l4AAe3EClVqNAAAs/IKWUhZAAAnQgpcdJ4A
-	ABzVCl2RngAA6xsKXibEAAIGtApgsQUAAIL2CmCxBQABzbQKYLEFAAHSPQpiBNUAALZ0CmMo5QAB
-	V5AKY7dFAAFQ7gpkaHQAADYiCmWcxwAAVrkKZah7AAHoxgpmjjEAAG0fCmb8KgABWJ4KZzVVAAFS
-	Fgpneb0AAja5CmfubgAClD8KdDxUAAB8Pgp1ajQAAeV7CnVqNAACbMMKeJrEAADh+Qp+85QAAIp8
-	CoStJAAAJckKkVvEAACcXgqXQPcAAaMJCphJnAAAc2wKm200AAAgzgqcHgIAAgnfCpysFAAAxEUK
-	nKwUAAHYiAqfZrUAAEwUCp9q8QACTCIKoEuxAAH4/AqmS7EAAfmACqhKyQACGKAKqTMYAAGl7Qqq
-	fyQAAB6oCqp/JAAB4v0KrCVwAAAHJgqsLIUAAExPCrLmJAAB+3oKuT5yAAGxNQq5RSEAAJtjCr1u
-	cgACFHQKvW/CAAIUswq/YAQAAHrSCsPUAgAA9rMKxA7jAAH0uwrEDuMAAmVFCsYTQgAB70EKxsQR
-	AAE79grGxBIAATwpCsd2xAACGUEKyisgAAJlDQrKbBQAAhlwCssXTgABq8UKy5QFAABpeArQULgA
-	Aol3CtJX1AAANYUK3jY4AAFl1wrkk+cAAmifCuWrSQACaD0K5dUzAAB7cArnxRUAAa+yCui8OgAA
-	Fv0K60YJAABO1wrrZgkAAE6KCu+x5QAACX4K9zSNAACHdgr4yi4AAGgmCvn7IgACNQUK/YdzAABT
-	LAsEQUEAAHInCwWXOQABHKILCZjEAAE+MwsJ9zkAAMbACwohaQAAJjkLCnLJAAH0hgsLHBUAAVVS
-	CwuPSQABwrYLC+LUAAC8SgsS3aEAAfrpCyMtdAAA53cLJxOCAAI+Kwsrq2kAAUVsCzCGTgAAESoL
-	PUAhAAJn7wtAseUAAAgBC0Gb+QACQyoLQ/NVAABoxgtLrhQAAXHmC0yLTgAAG6QLTPYeAAKKDgtN
-	Y1wAAUDRC1PQDwAAieULVtcVAACPmgtaD4MAAgyWC11xdAAAOtwLXeIkAAAqEwtjwjMAAUXiC2Y9
-	pgABUJsLaW8+AAKYFwtsFCMAAhQoC2yWdQACHMQLc+BwAAHIRQt3cT0AAj80C3lDmQABNcYLfVGl
-	AAIhUguBhkAAAXjYC4sIpAABs9YLiz40AAGm5wuMSBUAAE0IC43cDAAABtYLkNChAAH6BQuRJP4A
-	AFFuC5IuQAACHVwLlKkOAAGDvgubEIUAAhkHC50CiAACL3cLo9wMAAAUvQuj3AwAALLUC6PcDAAC
-	hGcLpXpkAACgZwul0RIAAkpmC6i8NQAAB74Lq4TfAAH5xAuscTcAAaKIC6/ZSgAAU3ELtBqOAAKf
-	Ygu7JyEAAK9zC790LgABDE4LwmvUAAALfwvCa9QAAm8EC8LCAgACPSYLxxLJAABGOgvKTj4AAKP0
-	C8svmAAB7ocLzLfqAAEbiAvMuvMAAGm+C9MnkgABtW4L1C1EAABqvwvW2C4AAKdCC9gcJAABajQL
-	2bflAAAKawvaJbMAAA4WC9tHFQAAsMcL27flAAFTkgvcNgIAAjkrC+Jr1AAB3ysL5gHFAAIr7gvq
-	KXkAAa6ZC+xUPgACC98L85/jAAHk/wvzn+MAAmxEC/TEOQABNScL9TDLAAINjgwAJHIAAhUmDAKn
-	6QABGUYMBDX5AAEnhAwF9wkAASgADAZJqQABJqQMBrWZAAEnFAwIjEkAAGHNDAuoqQABKHAMC7qZ
-	AAEo4AwNgiUAAGhhDA8FFAACWAEMEvYbAAIOLQwWg/IAALqJDBe4YwABOgMMHvQUAACqZgwgrt4A
-	AAEaDCELNQACOYYMIk4lAAI48AwuyeMAABZUDDXOIQABPKoMN0a0AAKTtgw6hjkAAZVTDD7P8gAA
-	PYAMPs/yAAByogw+z/IAAHVaDD7P8gAAd0sMPs/yAACRlAw+z/IAAJOiDD7P8gAAll0MPs/yAACn
-	7gw+z/IAAOrCDD7P8gABQYsMPs/yAAJivgw+z/IAAms1DEDTigAAGvsMQeAOAAIRBQxFZp4AApw0
-	DEsS0QACeLgMSxLRAAJ5/gxLkr0AAU1kDE1i4gACF7UMT5zFAAI12gxSVo4AAFqzDFJWrgACP3wM
-	U0f5AADxtwxTwI0AAVt5DFR3xAABupsMV2+yAAI3BQxZ5/UAAMspDFuVmwACf6IMXsRVAAGlbQxm
-	zhkAAZ3fDGjbrgAAYVYMajdvAABLSwxwocMAABaaDHXw8QAB+pwMhJIOAAGDWgyIvqIAAjB0DIzR
-	QgAAjRcMjV9TAAANxwyO6AUAApbxDJC9VAAAKKAMkL1UAAC+VQyQvVQAAQhjDJC9VAABFQMMkpui
-	AACOmQyT6MQAACumDJPoxAABD6AMlAHcAAIafAyUxQkAAGIHDJaN7gABLbgMmOuzAAHJSwybY5kA
-	ACH8DJz8UwAAAbUMnSlkAADoMAyfp1QAALjEDKmJBwACfXwMrMEuAAApIgyswS4AAIR6DKzBLgAA
-	v3AMrMEuAAEBugyswS4AAQtYDKzBLgABz9IMrMEuAAHUWAys4qIAAm/xDLCG1AACKqgMuGEEAADk
-	2Qy4f1UAAZBNDLkCZQAB2RsMuwFzAAIWqgzGnbEAAJSLDMz0ZQAB6eMMzdwlAAAURQzSgu4AAqDc
-	DNf2gQAARCgM4RnZAAAkAgzjPpUAAlUdDOhZlAABRiIM66zlAAH2gwzzfPQAAeSnDQIRdAABaGkN
-	AwJhAAJHtQ0EhNUAAfdODQeIBQACUdoNDTj0AAFuzA0NmKMAAmQ2DQ8gaQABeAQNFvGUAAHgpQ0Y
-	HCQAAeKkDSM9lwABYBUNKEkkAAIieA0rProAABh5DS50hQACQMUNMNJFAAKRWw00fr4AAgqbDTYT
-	NAAB5d4NOKaUAAEpUA06s24AAi1wDTvJvgACg4ENRmcRAADsgQ1L1zkAAO5UDVB0tQAAyX4NU+ws
-	AAIaPg1m6GUAAdx7DWlGQwAB9xUNadjEAABVnw1p2MQAAffjDWrTrgABTfUNbTnkAABWCQ1upO4A
-	AqaBDXUArgACDxgNdcoKAAFbLw11/MEAAkZnDXYmpQABHVUNdwCuAAHcuQ13faQAAd0LDXxBsgAB
-	mZoNfFuuAAKtUg2BdZAAAh+7DYPI9AAAbNENg8j0AAB4Ag2E/zwAAWcZDY5KqQAAffYNk5opAAF+
-	8A2Xw14AANoFDZpL5AACNJwNnFt+AACrWA2jvFkAAKwlDar0UgACgR8NryU3AAJpVA22BbIAAO8t
-	DcF51AACQpANxCKmAAIRQw3H0lUAALYDDcyalAABoAYNz8rUAAGn2A3b+Z4AAqb4Dd9iHgAAy2gN
-	4MRZAABWOQ3kJt4AAqzJDed41AACTuIN67zzAABYxQ3s1SsAAecfDfB0NQAAyNEN+B2+AADKRg34
-	ytIAAgZHDf8gaQABdzAOANWOAAKEtg4Gd6QAAWPcDg8HRwABzPQOEJ1UAAAE1A4Uh9sAAos6DhaH
-	2wAAVdYOF8w9AAHHrA4bZ1QAAAVLDh5G8QABOTcOHx9lAAG8uQ4f82UAAKg8DiPjjAAAIRsOKoer
-	AAKKQw4qpvIAAbGxDi6GdAAAm9YOL8dFAAADuQ4vx0UAAOF8DjN+/gAAG0AON/HSAAA8/Q44G/4A
-	AEUaDji6/gAAHCIOSuIlAAIccQ5O3rUAAJiRDk9PlAAAt6AOVjXjAAFFog5X4v4AAbezDlhSdQAC
-	gBUOW58JAAKMuQ5bsGQAAJU6DmDvyQABNk4OYS7FAAAVhA5nYxQAAiRwDnkIJAABaWgOeT8uAAD4
-	jQ6BJQUAADSBDoElBQAAdhwOhRhlAAH79A6IbpMAAjOWDpOqNAAA89QOlHaIAAFsXA6W4okAAcPi
-	DprR9AACB1YOn2riAAE4vw6f2pUAAn4HDqL6NQAARxIOryg+AAI0UQ6ziGQAAnXFDrT3UwAAkTEO
-	t7AnAAI0Dw66pAQAAflADrtOngACCz0Ou65eAAFCqg6/3zoAARkQDsKdpQAAMGMOyubCAAKArw7O
-	BAUAAORXDtjTJAAAMAcO3HK1AACzGg7dlv4AAUeJDuNyFQACCkIO5R5UAAFGsw7lRQAAATcMDuYD
-	tAACc2UO8Iz4AAHBOQ76csEAAAB6DvtGFQAAUJwPCDcSAABFjQ8J3v4AAP7XDwq22QAB/UMPC+3S
-	AABSAw8UbEQAAWJYDxeopwABxhwPGksyAADj9A8flv4AAqMbDyIjCAAB1ZIPJbo0AAAvGg8lujQA
-	AFzLDywtpAACW1MPLXabAAJ8bw8waSkAAggRDzCSwAACCR0PMZ1jAADioA8xtaUAAcUADzJ3VAAC
-	B6YPPBDOAAIcMg89fBoAACMADz2yhQACekwPPmsBAAFnxg9GNzQAAkmqD0uh8gACKX0PTCQuAAKO
-	hw9VCnQAAX0mD1ttNAAAJv8PYjRyAAJxng9jNQUAAd4AD2UzFQAACdcPZzMVAAFSXw9pQ7wAAAH0
-	D2mvVAAAWYkPbD/FAAAOcQ9w/sUAARYBD3S5YgAA3O4PejOeAAHw3g97YAQAAl9xD3t+YQACBccP
-	gSbyAADtxg+BJvIAAPEgD4FEyQAAd58PhsOTAAGSng+IJHQAAesFD5C49AACWL8PoVv0AAKcrg+q
-	zyQAADo9D6vNowACEJ8Pq82jAAJmsA+uFP4AAqQiD68FtwAAUvMPtI3cAAExxQ++AE4AAEn3D8Eg
-	OAABo+IPw9l0AAA2sQ/EmzQAAU7zD8iMtAAAMvEPyKy0AAAycQ/JctQAAAQyD8ly1AACb1QPydy0
-	AAFPhA/MLTEAAmDrD9btVQAAUQYP6BcTAAFUaQ/pQvcAAVlBD+qgfQABlMoP7QpXAAGlDA/w2X4A
-	AiyID/XRAwABVrMP9dMHAAJqGg/3NnEAAKr5D/h0MgAAEfcP+U3ZAAGeuQ/7vh4AALzkD/u+HgAA
-	/3AP+74eAAHOVQ/7vh4AAdLdD/3iBAABk1xpAAKuGgMAAAASAFMAYwBoAGwAaQBlAN8AZQBuCAAA
-	AAAGAAAACUNsb3NlIFRhYgcAAAALQ2xvc2VCdXR0b24BAwAAAA4A3ABiAGUAcgAgACUAMQgAAAAA
-	BgAAAAhBYm91dCAlMQcAAAAUTUFDX0FQUExJQ0FUSU9OX01FTlUBAwAAABoAJQAxACAAYQB1AHMA
-	YgBsAGUAbgBkAGUAbggAAAAABgAAAAdIaWRlICUxBwAAABRNQUNfQVBQTElDQVRJT05fTUVOVQED
-	AAAAIgBBAG4AZABlAHIAZQAgAGEAdQBzAGIAbABlAG4AZABlAG4IAAAAAAYAAAALSGlkZSBPdGhl
-	cnMHAAAAFE1BQ19BUFBMSUNBVElPTl9NRU5VAQMAAAAgAEUAaQBuAHMAdABlAGwAbAB1AG4AZwBl
-	AG4ALgAuAC4IAAAAAAYAAAAOUHJlZmVyZW5jZXMuLi4HAAAAFE1BQ19BUFBMSUNBVElPTl9NRU5V
-	AQMAAAAUACUAMQAgAGIAZQBlAG4AZABlAG4IAAAAAAYAAAAHUXVpdCAlMQcAAAAUTUFDX0FQUExJ
-	Q0FUSU9OX01FTlUBAwAAAA4ARABpAGUAbgBzAHQAZQgAAAAABgAAAAhTZXJ2aWNlcwcAAAAUTUFD
-	X0FQUExJQ0FUSU9OX01FTlUBAwAAABoAQQBsAGwAZQAgAGEAbgB6AGUAaQBnAGUAbggAAAAABgAA
-	AAhTaG93IEFsbAcAAAAUTUFDX0FQUExJQ0FUSU9OX01FTlUBAwAAACoAVgBlAHIAYgBpAG4AZAB1
-	AG4AZwAgAHYAZQByAHcAZQBpAGcAZQByAHQIAAAAAAYAAAASQ29ubmVjdGlvbiByZWZ1c2VkBwAA
-	AA9RQWJzdHJhY3RTb2NrZXQBAwAAAGgARABhAHMAIABaAGUAaQB0AGwAaQBtAGkAdAAgAGYA/ABy
-	ACAAZABpAGUAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAdwB1AHIAZABlACAA/ABiAGUAcgBzAGMA
-	aAByAGkAdAB0AGUAbggAAAAABgAAABRDb25uZWN0aW9uIHRpbWVkIG91dAcAAAAPUUFic3RyYWN0
-	U29ja2V0AQMAAABIAFIAZQBjAGgAbgBlAHIAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcA
-	ZQBmAHUAbgBkAGUAbgAgAHcAZQByAGQAZQBuCAAAAAAGAAAADkhvc3Qgbm90IGZvdW5kBwAAAA9R
-	QWJzdHJhY3RTb2NrZXQBAwAAAEIARABhAHMAIABOAGUAdAB6AHcAZQByAGsAIABpAHMAdAAgAG4A
-	aQBjAGgAdAAgAGUAcgByAGUAaQBjAGgAYgBhAHIIAAAAAAYAAAATTmV0d29yayB1bnJlYWNoYWJs
-	ZQcAAAAPUUFic3RyYWN0U29ja2V0AQMAAABaAEQAaQBlAHMAZQAgAFMAbwBjAGsAZQB0AC0ATwBw
-	AGUAcgBhAHQAaQBvAG4AIAB3AGkAcgBkACAAbgBpAGMAaAB0ACAAdQBuAHQAZQByAHMAdAD8AHQA
-	egB0CAAAAAAGAAAAJE9wZXJhdGlvbiBvbiBzb2NrZXQgaXMgbm90IHN1cHBvcnRlZAcAAAAPUUFi
-	c3RyYWN0U29ja2V0AQMAAAA8AEQAZQByACAAUwBvAGMAawBlAHQAIABpAHMAdAAgAG4AaQBjAGgA
-	dAAgAHYAZQByAGIAdQBuAGQAZQBuCAAAAAAGAAAAF1NvY2tldCBpcyBub3QgY29ubmVjdGVkBwAA
-	AA9RQWJzdHJhY3RTb2NrZXQBAwAAAE4AWgBlAGkAdAD8AGIAZQByAHMAYwBoAHIAZQBpAHQAdQBu
-	AGcAIABiAGUAaQAgAFMAbwBjAGsAZQB0AC0ATwBwAGUAcgBhAHQAaQBvAG4IAAAAAAYAAAAaU29j
-	a2V0IG9wZXJhdGlvbiB0aW1lZCBvdXQHAAAAD1FBYnN0cmFjdFNvY2tldAEDAAAAqgBWAGUAcgBz
-	AHUAYwBoACAAZABlAHIAIABWAGUAcgBiAGkAbgBkAHUAbgBnAHMAYQB1AGYAbgBhAGgAbQBlACAA
-	dwDkAGgAcgBlAG4AZAAgAGIAZQByAGUAaQB0AHMAIABlAGkAbgBlACAAYQBuAGQAZQByAGUAIABW
-	AGUAcgBiAGkAbgBkAHUAbgBnAHMAYQB1AGYAbgBhAGgAbQBlACAAbADkAHUAZgB0CAAAAAAGAAAA
-	MVRyeWluZyB0byBjb25uZWN0IHdoaWxlIGNvbm5lY3Rpb24gaXMgaW4gcHJvZ3Jlc3MHAAAAD1FB
-	YnN0cmFjdFNvY2tldAEDAAAAIAAmAEEAbABsAGUAcwAgAGEAdQBzAHcA5ABoAGwAZQBuCAAAAAAG
-	AAAACyZTZWxlY3QgQWxsBwAAABBRQWJzdHJhY3RTcGluQm94AQMAAAAeACYASQBuAGsAcgBlAG0A
-	ZQBuAHQAaQBlAHIAZQBuCAAAAAAGAAAACCZTdGVwIHVwBwAAABBRQWJzdHJhY3RTcGluQm94AQMA
-	AAAeACYARABlAGsAcgBlAG0AZQBuAHQAaQBlAHIAZQBuCAAAAAAGAAAAClN0ZXAgJmRvd24HAAAA
-	EFFBYnN0cmFjdFNwaW5Cb3gBAwAAAAwAUwBlAG4AawBlAG4IAAAAAAYAAAAIRGVjcmVhc2UHAAAA
-	GlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAaAFcAZQByAHQAIABhAGIAcwBlAG4AawBl
-	AG4IAAAAAAYAAAASRGVjcmVhc2UgdGhlIHZhbHVlBwAAABpRQWNjZXNzaWJsZUFjdGlvbkludGVy
-	ZmFjZQEDAAAALABHAGUAaAB0ACAAegB1AHIAIAB2AG8AcgBpAGcAZQBuACAAUwBlAGkAdABlCAAA
-	AAAGAAAAEEdvZXMgYmFjayBhIHBhZ2UHAAAAGlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMA
-	AAAuAEcAZQBoAHQAIAB6AHUAcgAgAG4A5ABjAGgAcwB0AGUAbgAgAFMAZQBpAHQAZQgAAAAABgAA
-	ABVHb2VzIHRvIHRoZSBuZXh0IHBhZ2UHAAAAGlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMA
-	AAAOAEUAcgBoAPYAaABlAG4IAAAAAAYAAAAISW5jcmVhc2UHAAAAGlFBY2Nlc3NpYmxlQWN0aW9u
-	SW50ZXJmYWNlAQMAAAAYAFcAZQByAHQAIABlAHIAaAD2AGgAZQBuCAAAAAAGAAAAEkluY3JlYXNl
-	IHRoZSB2YWx1ZQcAAAAaUUFjY2Vzc2libGVBY3Rpb25JbnRlcmZhY2UBAwAAABoATgDkAGMAaABz
-	AHQAZQAgAFMAZQBpAHQAZQgAAAAABgAAAAlOZXh0IFBhZ2UHAAAAGlFBY2Nlc3NpYmxlQWN0aW9u
-	SW50ZXJmYWNlAQMAAAAOAEQAcgD8AGMAawBlAG4IAAAAAAYAAAAFUHJlc3MHAAAAGlFBY2Nlc3Np
-	YmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAYAFYAbwByAGkAZwBlACAAUwBlAGkAdABlCAAAAAAGAAAA
-	DVByZXZpb3VzIFBhZ2UHAAAAGlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAmAE4AYQBj
-	AGgAIAB1AG4AdABlAG4AIABzAGMAcgBvAGwAbABlAG4IAAAAAAYAAAALU2Nyb2xsIERvd24HAAAA
-	GlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAmAE4AYQBjAGgAIABsAGkAbgBrAHMAIABz
-	AGMAcgBvAGwAbABlAG4IAAAAAAYAAAALU2Nyb2xsIExlZnQHAAAAGlFBY2Nlc3NpYmxlQWN0aW9u
-	SW50ZXJmYWNlAQMAAAAoAE4AYQBjAGgAIAByAGUAYwBoAHQAcwAgAHMAYwByAG8AbABsAGUAbggA
-	AAAABgAAAAxTY3JvbGwgUmlnaHQHAAAAGlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAk
-	AE4AYQBjAGgAIABvAGIAZQBuACAAcwBjAHIAbwBsAGwAZQBuCAAAAAAGAAAACVNjcm9sbCBVcAcA
-	AAAaUUFjY2Vzc2libGVBY3Rpb25JbnRlcmZhY2UBAwAAACQAUwBjAHIAbwBsAGwAdAAgAG4AYQBj
-	AGgAIAB1AG4AdABlAG4IAAAAAAYAAAAMU2Nyb2xscyBkb3duBwAAABpRQWNjZXNzaWJsZUFjdGlv
-	bkludGVyZmFjZQEDAAAAJABTAGMAcgBvAGwAbAB0ACAAbgBhAGMAaAAgAGwAaQBuAGsAcwgAAAAA
-	BgAAABNTY3JvbGxzIHRvIHRoZSBsZWZ0BwAAABpRQWNjZXNzaWJsZUFjdGlvbkludGVyZmFjZQED
-	AAAAJgBTAGMAcgBvAGwAbAB0ACAAbgBhAGMAaAAgAHIAZQBjAGgAdABzCAAAAAAGAAAAFFNjcm9s
-	bHMgdG8gdGhlIHJpZ2h0BwAAABpRQWNjZXNzaWJsZUFjdGlvbkludGVyZmFjZQEDAAAAIgBTAGMA
-	cgBvAGwAbAB0ACAAbgBhAGMAaAAgAG8AYgBlAG4IAAAAAAYAAAAKU2Nyb2xscyB1cAcAAAAaUUFj
-	Y2Vzc2libGVBY3Rpb25JbnRlcmZhY2UBAwAAABgARgBvAGsAdQBzACAAcwBlAHQAegBlAG4IAAAA
-	AAYAAAAIU2V0Rm9jdXMHAAAAGlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAeAFMAZQB0
-	AHoAdAAgAGQAZQBuACAARgBvAGsAdQBzCAAAAAAGAAAADlNldHMgdGhlIGZvY3VzBwAAABpRQWNj
-	ZXNzaWJsZUFjdGlvbkludGVyZmFjZQEDAAAAGgBNAGUAbgD8ACAAYQBuAHoAZQBpAGcAZQBuCAAA
-	AAAGAAAACFNob3dNZW51BwAAABpRQWNjZXNzaWJsZUFjdGlvbkludGVyZmFjZQEDAAAAIgBaAGUA
-	aQBnAHQAIABkAGEAcwAgAE0AZQBuAPwAIABhAG4IAAAAAAYAAAAOU2hvd3MgdGhlIG1lbnUHAAAA
-	GlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAUAFUAbQBzAGMAaABhAGwAdABlAG4IAAAA
-	AAYAAAAGVG9nZ2xlBwAAABpRQWNjZXNzaWJsZUFjdGlvbkludGVyZmFjZQEDAAAALgBTAGMAaABh
-	AGwAdABlAHQAIABkAGUAbgAgAFoAdQBzAHQAYQBuAGQAIAB1AG0IAAAAAAYAAAARVG9nZ2xlcyB0
-	aGUgc3RhdGUHAAAAGlFBY2Nlc3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAeAEEAawB0AGkAbwBu
-	ACAAYQB1AHMAbAD2AHMAZQBuCAAAAAAGAAAAE1RyaWdnZXJzIHRoZSBhY3Rpb24HAAAAGlFBY2Nl
-	c3NpYmxlQWN0aW9uSW50ZXJmYWNlAQMAAAAIAE4AZQBpAG4IAAAAAAYAAAACTm8HAAAAFVFBbmRy
-	b2lkUGxhdGZvcm1UaGVtZQEDAAAAFgBOAGUAaQBuACwAIABrAGUAaQBuAGUIAAAAAAYAAAAJTm8g
-	dG8gQWxsBwAAABVRQW5kcm9pZFBsYXRmb3JtVGhlbWUBAwAAAAQASgBhCAAAAAAGAAAAA1llcwcA
-	AAAVUUFuZHJvaWRQbGF0Zm9ybVRoZW1lAQMAAAAQAEoAYQAsACAAYQBsAGwAZQgAAAAABgAAAApZ
-	ZXMgdG8gQWxsBwAAABVRQW5kcm9pZFBsYXRmb3JtVGhlbWUBAwAAAIAARABpAGUAIABBAG4AdwBl
-	AG4AZAB1AG4AZwAgACcAJQAxACcAIABiAGUAbgD2AHQAaQBnAHQAIABRAHQAIAAlADIAOwAgAGUA
-	cwAgAHcAdQByAGQAZQAgAGEAYgBlAHIAIABRAHQAIAAlADMAIABnAGUAZgB1AG4AZABlAG4ALggA
-	AAAABgAAACxFeGVjdXRhYmxlICclMScgcmVxdWlyZXMgUXQgJTIsIGZvdW5kIFF0ICUzLgcAAAAM
-	UUFwcGxpY2F0aW9uAQMAAABEAEQAaQBlACAAUQB0AC0AQgBpAGIAbABpAG8AdABoAGUAawAgAGkA
-	cwB0ACAAaQBuAGsAbwBtAHAAYQB0AGkAYgBlAGwIAAAAAAYAAAAdSW5jb21wYXRpYmxlIFF0IExp
-	YnJhcnkgRXJyb3IHAAAADFFBcHBsaWNhdGlvbgEDAAAACADcAGIAZQByCAAAAAAGAAAABUFib3V0
-	BwAAAA5RQ29jb2FNZW51SXRlbQEDAAAADgDcAGIAZQByACAAUQB0CAAAAAAGAAAACEFib3V0IFF0
-	BwAAAA5RQ29jb2FNZW51SXRlbQEDAAAAGgBLAG8AbgBmAGkAZwB1AHIAYQB0AGkAbwBuCAAAAAAG
-	AAAABkNvbmZpZwcAAAAOUUNvY29hTWVudUl0ZW0BAwAAABAASwBvAHAAaQBlAHIAZQBuCAAAAAAG
-	AAAABENvcHkHAAAADlFDb2NvYU1lbnVJdGVtAQMAAAAYAEEAdQBzAHMAYwBoAG4AZQBpAGQAZQBu
-	CAAAAAAGAAAAA0N1dAcAAAAOUUNvY29hTWVudUl0ZW0BAwAAABIAVgBlAHIAbABhAHMAcwBlAG4I
-	AAAAAAYAAAAERXhpdAcAAAAOUUNvY29hTWVudUl0ZW0BAwAAABAATwBwAHQAaQBvAG4AZQBuCAAA
-	AAAGAAAAB09wdGlvbnMHAAAADlFDb2NvYU1lbnVJdGVtAQMAAAAQAEUAaQBuAGYA/ABnAGUAbggA
-	AAAABgAAAAVQYXN0ZQcAAAAOUUNvY29hTWVudUl0ZW0BAwAAABYARQBpAG4AcwB0AGUAbABsAHUA
-	bgBnCAAAAAAGAAAAClByZWZlcmVuY2UHAAAADlFDb2NvYU1lbnVJdGVtAQMAAAAOAEIAZQBlAG4A
-	ZABlAG4IAAAAAAYAAAAEUXVpdAcAAAAOUUNvY29hTWVudUl0ZW0BAwAAAB4AQQBsAGwAZQBzACAA
-	YQB1AHMAdwDkAGgAbABlAG4IAAAAAAYAAAAKU2VsZWN0IEFsbAcAAAAOUUNvY29hTWVudUl0ZW0B
-	AwAAABYARQBpAG4AcwB0AGUAbABsAHUAbgBnCAAAAAAGAAAAB1NldHRpbmcHAAAADlFDb2NvYU1l
-	bnVJdGVtAQMAAAAUAEUAaQBuAHIAaQBjAGgAdABlAG4IAAAAAAYAAAAFU2V0dXAHAAAADlFDb2Nv
-	YU1lbnVJdGVtAQMAAAAeAE4AaQBjAGgAdAAgAHMAcABlAGkAYwBoAGUAcgBuCAAAAAAGAAAACkRv
-	bid0IFNhdmUHAAAAC1FDb2NvYVRoZW1lAQMAAABSAFoAdQAgAGIAZQBuAHUAdAB6AGUAcgBkAGUA
-	ZgBpAG4AaQBlAHIAdABlAG4AIABGAGEAcgBiAGUAbgAgACYAaABpAG4AegB1AGYA/ABnAGUAbggA
-	AAAABgAAABUmQWRkIHRvIEN1c3RvbSBDb2xvcnMHAAAADFFDb2xvckRpYWxvZwEDAAAAGABHAHIA
-	dQBuAGQAZgBhAHIAJgBiAGUAbggAAAAABgAAAA0mQmFzaWMgY29sb3JzBwAAAAxRQ29sb3JEaWFs
-	b2cBAwAAADQAJgBCAGUAbgB1AHQAegBlAHIAZABlAGYAaQBuAGkAZQByAHQAZQAgAEYAYQByAGIA
-	ZQBuCAAAAAAGAAAADiZDdXN0b20gY29sb3JzBwAAAAxRQ29sb3JEaWFsb2cBAwAAAAwAJgBHAHIA
-	/ABuADoIAAAAAAYAAAAHJkdyZWVuOgcAAAAMUUNvbG9yRGlhbG9nAQMAAAAMACYASABUAE0ATAA6
-	CAAAAAAGAAAABiZIVE1MOgcAAAAMUUNvbG9yRGlhbG9nAQMAAAA4ACYARgBhAHIAYgBlACAAdgBv
-	AG0AIABCAGkAbABkAHMAYwBoAGkAcgBtACAAdwDkAGgAbABlAG4IAAAAAAYAAAASJlBpY2sgU2Ny
-	ZWVuIENvbG9yBwAAAAxRQ29sb3JEaWFsb2cBAwAAAAoAJgBSAG8AdAA6CAAAAAAGAAAABSZSZWQ6
-	BwAAAAxRQ29sb3JEaWFsb2cBAwAAABYAJgBTAOQAdAB0AGkAZwB1AG4AZwA6CAAAAAAGAAAABSZT
-	YXQ6BwAAAAxRQ29sb3JEaWFsb2cBAwAAABgAJgBIAGUAbABsAGkAZwBrAGUAaQB0ADoIAAAAAAYA
-	AAAFJlZhbDoHAAAADFFDb2xvckRpYWxvZwEDAAAAGABBACYAbABwAGgAYQBrAGEAbgBhAGwAOggA
-	AAAABgAAAA9BJmxwaGEgY2hhbm5lbDoHAAAADFFDb2xvckRpYWxvZwEDAAAADABCAGwAYQAmAHUA
-	OggAAAAABgAAAAZCbCZ1ZToHAAAADFFDb2xvckRpYWxvZwEDAAAAYgBDAHUAcgBzAG8AcgAgAGIA
-	ZQBpACAAJQAxACwAIAAlADIACgBEAHIA/ABjAGsAZQBuACAAUwBpAGUAIABFAFMAQwAsACAAdQBt
-	ACAAYQBiAHoAdQBiAHIAZQBjAGgAZQBuCAAAAAAGAAAAJEN1cnNvciBhdCAlMSwgJTIKUHJlc3Mg
-	RVNDIHRvIGNhbmNlbAcAAAAMUUNvbG9yRGlhbG9nAQMAAAASAEYAYQByAGIAJgB0AG8AbgA6CAAA
-	AAAGAAAABUh1JmU6BwAAAAxRQ29sb3JEaWFsb2cBAwAAABYARgBhAHIAYgBhAHUAcwB3AGEAaABs
-	CAAAAAAGAAAADFNlbGVjdCBDb2xvcgcAAAAMUUNvbG9yRGlhbG9nAQMAAAAMAEYAYQBsAHMAYwBo
-	CAAAAAAGAAAABUZhbHNlBwAAAAlRQ29tYm9Cb3gBAwAAAEwA1gBmAGYAbgBlAHQAIABkAGEAcwAg
-	AEEAdQBzAHcAYQBoAGwAZgBlAG4AcwB0AGUAcgAgAGQAZQByACAAQwBvAG0AYgBvAGIAbwB4CAAA
-	AAAGAAAAIk9wZW4gdGhlIGNvbWJvIGJveCBzZWxlY3Rpb24gcG9wdXAHAAAACVFDb21ib0JveAED
-	AAAACABXAGEAaAByCAAAAAAGAAAABFRydWUHAAAACVFDb21ib0JveAEDAAAAFABBAHIAZwB1AG0A
-	ZQBuAHQAZQA6CAAAAAAGAAAACkFyZ3VtZW50czoHAAAAElFDb21tYW5kTGluZVBhcnNlcgEDAAAA
-	KgBaAGUAaQBnAHQAIABkAGkAZQBzAGUAIABIAGkAbABmAGUAIABhAG4ALggAAAAABgAAABNEaXNw
-	bGF5cyB0aGlzIGhlbHAuBwAAABJRQ29tbWFuZExpbmVQYXJzZXIBAwAAADoAWgBlAGkAZwB0ACAA
-	VgBlAHIAcwBpAG8AbgBzAGkAbgBmAG8AcgBtAGEAdABpAG8AbgAgAGEAbgAuCAAAAAAGAAAAHURp
-	c3BsYXlzIHZlcnNpb24gaW5mb3JtYXRpb24uBwAAABJRQ29tbWFuZExpbmVQYXJzZXIBAwAAADIA
-	TgBhAGMAaAAgACcAJQAxACcAIABmAGUAaABsAHQAIABkAGUAcgAgAFcAZQByAHQALggAAAAABgAA
-	ABlNaXNzaW5nIHZhbHVlIGFmdGVyICclMScuBwAAABJRQ29tbWFuZExpbmVQYXJzZXIBAwAAABIA
-	TwBwAHQAaQBvAG4AZQBuADoIAAAAAAYAAAAIT3B0aW9uczoHAAAAElFDb21tYW5kTGluZVBhcnNl
-	cgEDAAAANABXAGUAcgB0ACAAdQBuAGUAcgB3AGEAcgB0AGUAdAAgAG4AYQBjAGgAIAAnACUAMQAn
-	AC4IAAAAAAYAAAAcVW5leHBlY3RlZCB2YWx1ZSBhZnRlciAnJTEnLgcAAAASUUNvbW1hbmRMaW5l
-	UGFyc2VyAQMAAAAuAFUAbgBiAGUAawBhAG4AbgB0AGUAIABPAHAAdABpAG8AbgAgACcAJQAxACcA
-	LggAAAAABgAAABRVbmtub3duIG9wdGlvbiAnJTEnLgcAAAASUUNvbW1hbmRMaW5lUGFyc2VyAQMA
-	AAAwAFUAbgBiAGUAawBhAG4AbgB0AGUAIABPAHAAdABpAG8AbgBlAG4AOgAgACUAMQAuCAAAAAAG
-	AAAAFFVua25vd24gb3B0aW9uczogJTEuBwAAABJRQ29tbWFuZExpbmVQYXJzZXIBAwAAABQAQQB1
-	AGYAcgB1AGYAOgAgACUAMQgAAAAABgAAAAlVc2FnZTogJTEHAAAAElFDb21tYW5kTGluZVBhcnNl
-	cgEDAAAAFABbAE8AcAB0AGkAbwBuAGUAbgBdCAAAAAAGAAAACVtvcHRpb25zXQcAAAASUUNvbW1h
-	bmRMaW5lUGFyc2VyAQMAAABEACUAMQA6ACAAZgB0AG8AawAtAEEAdQBmAHIAdQBmACAAaQBzAHQA
-	IABmAGUAaABsAGcAZQBzAGMAaABsAGEAZwBlAG4IAAAAAAYAAAAPJTE6IGZ0b2sgZmFpbGVkBwAA
-	ABBRQ29yZUFwcGxpY2F0aW9uAQMAAABIACUAMQA6ACAAVQBuAGcA/ABsAHQAaQBnAGUAIABTAGMA
-	aABsAPwAcwBzAGUAbABhAG4AZwBhAGIAZQAgACgAbABlAGUAcgApCAAAAAAGAAAAECUxOiBrZXkg
-	aXMgZW1wdHkHAAAAEFFDb3JlQXBwbGljYXRpb24BAwAAAFIAJQAxADoAIABFAHMAIABrAGEAbgBu
-	ACAAawBlAGkAbgAgAFMAYwBoAGwA/ABzAHMAZQBsACAAZQByAHoAZQB1AGcAdAAgAHcAZQByAGQA
-	ZQBuCAAAAAAGAAAAFiUxOiB1bmFibGUgdG8gbWFrZSBrZXkHAAAAEFFDb3JlQXBwbGljYXRpb24B
-	AwAAABQASwBvAHAAZgBzAGUAaQB0AGUAbggAAAAABgAAAAxCYW5uZXIgUGFnZXMHAAAADlFDdXBz
-	Sm9iV2lkZ2V0AQMAAAAqAFIAZQBjAGgAbgB1AG4AZwBzAGkAbgBmAG8AcgBtAGEAdABpAG8AbgA6
-	CAAAAAAGAAAAFEJpbGxpbmcgaW5mb3JtYXRpb246BwAAAA5RQ3Vwc0pvYldpZGdldAEDAAAAIABO
-	AGkAYwBoAHQAIAD2AGYAZgBlAG4AdABsAGkAYwBoCAAAAAAGAAAACkNsYXNzaWZpZWQHAAAADlFD
-	dXBzSm9iV2lkZ2V0AQMAAAAWAFYAZQByAHQAcgBhAHUAbABpAGMAaAgAAAAABgAAAAxDb25maWRl
-	bnRpYWwHAAAADlFDdXBzSm9iV2lkZ2V0AQMAAAA0AFQAYQBnAHMA/ABiAGUAcgAgACgAMAA2ADoA
-	MAAwACAAYgBpAHMAIAAxADcAOgA1ADkAKQgAAAAABgAAABREYXkgKDA2OjAwIHRvIDE3OjU5KQcA
-	AAAOUUN1cHNKb2JXaWRnZXQBAwAAAAoARQBuAGQAZQA6CAAAAAAGAAAABEVuZDoHAAAADlFDdXBz
-	Sm9iV2lkZ2V0AQMAAAAoAFUAbgBiAGUAZwByAGUAbgB6AHQAIAB2AG8AcgBoAGEAbAB0AGUAbggA
-	AAAABgAAABFIb2xkIEluZGVmaW5pdGVseQcAAAAOUUN1cHNKb2JXaWRnZXQBAwAAABgARAByAHUA
-	YwBrAGEAdQBmAHQAcgBhAGcIAAAAAAYAAAADSm9iBwAAAA5RQ3Vwc0pvYldpZGdldAEDAAAAPABF
-	AGkAbgBzAHQAZQBsAGwAdQBuAGcAZQBuACAAegB1AG0AIABEAHIAdQBjAGsAYQB1AGYAdAByAGEA
-	ZwgAAAAABgAAAAtKb2IgQ29udHJvbAcAAAAOUUN1cHNKb2JXaWRnZXQBAwAAADgAUAByAGkAbwBy
-	AGkAdADkAHQAIABkAGUAcwAgAEQAcgB1AGMAawBhAHUAZgB0AHIAYQBnAHMAOggAAAAABgAAAA1K
-	b2IgcHJpb3JpdHk6BwAAAA5RQ3Vwc0pvYldpZGdldAEDAAAAMABOAGEAYwBoAHQAcwAgACgAMQA4
-	ADoAMAAwACAAYgBpAHMAIAAwADUAOgA1ADkAKQgAAAAABgAAABZOaWdodCAoMTg6MDAgdG8gMDU6
-	NTkpBwAAAA5RQ3Vwc0pvYldpZGdldAEDAAAACgBLAGUAaQBuAGUIAAAAAAYAAAAETm9uZQcAAAAO
-	UUN1cHNKb2JXaWRnZXQBAwAAACIAUwBvAGYAbwByAHQAIABhAHUAcwBkAHIAdQBjAGsAZQBuCAAA
-	AAAGAAAAEVByaW50IEltbWVkaWF0ZWx5BwAAAA5RQ3Vwc0pvYldpZGdldAEDAAAALgBaAHUAbQAg
-	AEQAcgB1AGMAawBlAG4AIAB2AG8AcgBnAGUAcwBlAGgAZQBuADoIAAAAAAYAAAATU2NoZWR1bGVk
-	IHByaW50aW5nOgcAAAAOUUN1cHNKb2JXaWRnZXQBAwAAAEAAWgB3AGUAaQB0AGUAIABTAGMAaABp
-	AGMAaAB0ACAAKAAxADYAOgAwADAAIABiAGkAcwAgADIAMwA6ADUAOQApCAAAAAAGAAAAHVNlY29u
-	ZCBTaGlmdCAoMTY6MDAgdG8gMjM6NTkpBwAAAA5RQ3Vwc0pvYldpZGdldAEDAAAADABHAGUAaABl
-	AGkAbQgAAAAABgAAAAZTZWNyZXQHAAAADlFDdXBzSm9iV2lkZ2V0AQMAAAAoAFoAdQAgAGYAZQBz
-	AHQAZwBlAGwAZQBnAHQAZQByACAAWgBlAGkAdAgAAAAABgAAAA1TcGVjaWZpYyBUaW1lBwAAAA5R
-	Q3Vwc0pvYldpZGdldAEDAAAADgBWAG8AcgBnAGEAYgBlCAAAAAAGAAAACFN0YW5kYXJkBwAAAA5R
-	Q3Vwc0pvYldpZGdldAEDAAAADgBBAG4AZgBhAG4AZwA6CAAAAAAGAAAABlN0YXJ0OgcAAAAOUUN1
-	cHNKb2JXaWRnZXQBAwAAAEAARAByAGkAdAB0AGUAIABTAGMAaABpAGMAaAB0ACAAKAAwADAAOgAw
-	ADAAIABiAGkAcwAgADAANwA6ADUAOQApCAAAAAAGAAAAHFRoaXJkIFNoaWZ0ICgwMDowMCB0byAw
-	Nzo1OSkHAAAADlFDdXBzSm9iV2lkZ2V0AQMAAAAaAFMAdAByAGUAbgBnACAAZwBlAGgAZQBpAG0I
-	AAAAAAYAAAAKVG9wIFNlY3JldAcAAAAOUUN1cHNKb2JXaWRnZXQBAwAAABQA1gBmAGYAZQBuAHQA
-	bABpAGMAaAgAAAAABgAAAAxVbmNsYXNzaWZpZWQHAAAADlFDdXBzSm9iV2lkZ2V0AQMAAABAAFcA
-	bwBjAGgAZQBuAGUAbgBkAGUAIAAoAFMAYQBtAHMAdABhAGcAIABiAGkAcwAgAFMAbwBuAG4AdABh
-	AGcAKQgAAAAABgAAABxXZWVrZW5kIChTYXR1cmRheSB0byBTdW5kYXkpBwAAAA5RQ3Vwc0pvYldp
-	ZGdldAEDAAAApABEAGkAZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAgAGsAYQBuAG4AIABuAGkA
-	YwBoAHQAIABkAHUAcgBjAGgAZwBlAGYA/ABoAHIAdAAgAHcAZQByAGQAZQBuACAAKABPAHAAZQBy
-	AGEAdABpAG8AbgAgACcAYwBvAG0AbQBpAHQAJwAgAGYAZQBoAGwAZwBlAHMAYwBoAGwAYQBnAGUA
-	bgApCAAAAAAGAAAAHFVuYWJsZSB0byBjb21taXQgdHJhbnNhY3Rpb24HAAAAClFEQjJEcml2ZXIB
-	AwAAAFIARQBzACAAawBhAG4AbgAgAGsAZQBpAG4AZQAgAFYAZQByAGIAaQBuAGQAdQBuAGcAIABh
-	AHUAZgBnAGUAYgBhAHUAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAEVVuYWJsZSB0byBjb25uZWN0
-	BwAAAApRREIyRHJpdmVyAQMAAAC0AEQAaQBlACAAVAByAGEAbgBzAGEAawB0AGkAbwBuACAAawBh
-	AG4AbgAgAG4AaQBjAGgAdAAgAHIA/ABjAGsAZwDkAG4AZwBpAGcAIABnAGUAbQBhAGMAaAB0ACAA
-	dwBlAHIAZABlAG4AIAAoAE8AcABlAHIAYQB0AGkAbwBuACAAJwByAG8AbABsAGIAYQBjAGsAJwAg
-	AGYAZQBoAGwAZwBlAHMAYwBoAGwAYQBnAGUAbgApCAAAAAAGAAAAHlVuYWJsZSB0byByb2xsYmFj
-	ayB0cmFuc2FjdGlvbgcAAAAKUURCMkRyaXZlcgEDAAAAUAAnAGEAdQB0AG8AYwBvAG0AbQBpAHQA
-	JwAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIABhAGsAdABpAHYAaQBlAHIAdAAgAHcAZQByAGQAZQBu
-	CAAAAAAGAAAAGFVuYWJsZSB0byBzZXQgYXV0b2NvbW1pdAcAAAAKUURCMkRyaXZlcgEDAAAATgBE
-	AGkAZQAgAFYAYQByAGkAYQBiAGwAZQAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIABnAGUAYgB1AG4A
-	ZABlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAABdVbmFibGUgdG8gYmluZCB2YXJpYWJsZQcAAAAK
-	UURCMlJlc3VsdAEDAAAATgBEAGUAcgAgAEIAZQBmAGUAaABsACAAawBhAG4AbgAgAG4AaQBjAGgA
-	dAAgAGEAdQBzAGcAZQBmAPwAaAByAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABtVbmFibGUgdG8g
-	ZXhlY3V0ZSBzdGF0ZW1lbnQHAAAAClFEQjJSZXN1bHQBAwAAAFwARABlAHIAIABlAHIAcwB0AGUA
-	IABEAGEAdABlAG4AcwBhAHQAegAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIABhAGIAZwBlAGgAbwBs
-	AHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABVVbmFibGUgdG8gZmV0Y2ggZmlyc3QHAAAAClFEQjJS
-	ZXN1bHQBAwAAAGAARABlAHIAIABuAOQAYwBoAHMAdABlACAARABhAHQAZQBuAHMAYQB0AHoAIABr
-	AGEAbgBuACAAbgBpAGMAaAB0ACAAYQBiAGcAZQBoAG8AbAB0ACAAdwBlAHIAZABlAG4IAAAAAAYA
-	AAAUVW5hYmxlIHRvIGZldGNoIG5leHQHAAAAClFEQjJSZXN1bHQBAwAAAFYARABlAHIAIABEAGEA
-	dABlAG4AcwBhAHQAegAgACUAMQAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIABhAGIAZwBlAGgAbwBs
-	AHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABlVbmFibGUgdG8gZmV0Y2ggcmVjb3JkICUxBwAAAApR
-	REIyUmVzdWx0AQMAAABQAEQAZQByACAAQgBlAGYAZQBoAGwAIABrAGEAbgBuACAAbgBpAGMAaAB0
-	ACAAdgBvAHIAYgBlAHIAZQBpAHQAZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbVW5hYmxlIHRv
-	IHByZXBhcmUgc3RhdGVtZW50BwAAAApRREIyUmVzdWx0AQMAAAAEAE8ASwgAAAAABgAAAAJPSwcA
-	AAANUURCdXNUcmF5SWNvbgEDAAAABABBAE0IAAAAAAYAAAACQU0HAAAAD1FEYXRlVGltZVBhcnNl
-	cgEDAAAABABQAE0IAAAAAAYAAAACUE0HAAAAD1FEYXRlVGltZVBhcnNlcgEDAAAABABhAG0IAAAA
-	AAYAAAACYW0HAAAAD1FEYXRlVGltZVBhcnNlcgEDAAAABABwAG0IAAAAAAYAAAACcG0HAAAAD1FE
-	YXRlVGltZVBhcnNlcgEDAAAAFgBEAGkAcgBlAGsAdABoAGkAbABmAGUIAAAAAAYAAAAMV2hhdCdz
-	IFRoaXM/BwAAAAdRRGlhbG9nAQMAAAAEAE8ASwgAAAAABgAAAAJPSwcAAAAQUURpYWxvZ0J1dHRv
-	bkJveAEDAAAAHADEAG4AZABlAHIAdQBuAGcAcwBkAGEAdAB1AG0IAAAAAAYAAAANRGF0ZSBNb2Rp
-	ZmllZAcAAAAJUURpck1vZGVsAQMAAAAGAEEAcgB0CAAAAAAGAAAABEtpbmQHAAAACVFEaXJNb2Rl
-	bAEDAAAACABOAGEAbQBlCAAAAAAGAAAABE5hbWUHAAAACVFEaXJNb2RlbAEDAAAACgBHAHIA9gDf
-	AGUIAAAAAAYAAAAEU2l6ZQcAAAAJUURpck1vZGVsAQMAAAAGAFQAeQBwCAAAAAAGAAAABFR5cGUH
-	AAAACVFEaXJNb2RlbAEDAAAAKgBPAHAAZQByAGEAdABpAG8AbgAgAGEAYgBnAGUAYgByAG8AYwBo
-	AGUAbggAAAAABgAAABNPcGVyYXRpb24gY2FuY2VsbGVkBwAAAApRRG5zTG9va3VwAQMAAABcAEQA
-	ZQByACAARABvAG0AYQBpAG4ALQBOAGEAbQBlACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABl
-	AHgAcABhAG4AZABpAGUAcgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAcQ291bGQgbm90IGV4cGFu
-	ZCBkb21haW4gbmFtZQcAAAASUURuc0xvb2t1cFJ1bm5hYmxlAQMAAABKAEgAbwBzAHQAIAAlADEA
-	IABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcAZQBmAHUAbgBkAGUAbgAgAHcAZQByAGQAZQBu
-	AC4IAAAAAAYAAAAbSG9zdCAlMSBjb3VsZCBub3QgYmUgZm91bmQuBwAAABJRRG5zTG9va3VwUnVu
-	bmFibGUBAwAAAIIASQBQAHYANgAtAEEAZAByAGUAcwBzAGUAbgAgAGYA/AByACAARABOAFMALQBT
-	AGUAcgB2AGUAcgAgAHcAZQByAGQAZQBuACAAZwBlAGcAZQBuAHcA5AByAHQAaQBnACAAbgBpAGMA
-	aAB0ACAAdQBuAHQAZQByAHMAdAD8AHQAegB0CAAAAAAGAAAAOklQdjYgYWRkcmVzc2VzIGZvciBu
-	YW1lc2VydmVycyBhcmUgY3VycmVudGx5IG5vdCBzdXBwb3J0ZWQHAAAAElFEbnNMb29rdXBSdW5u
-	YWJsZQEDAAAAPgBVAG4AZwD8AGwAdABpAGcAZQByACAASQBQAHYANAAtAEEAZAByAGUAcwBzAGQA
-	YQB0AGUAbgBzAGEAdAB6CAAAAAAGAAAAG0ludmFsaWQgSVB2NCBhZGRyZXNzIHJlY29yZAcAAAAS
-	UURuc0xvb2t1cFJ1bm5hYmxlAQMAAAA+AFUAbgBnAPwAbAB0AGkAZwBlAHIAIABJAFAAdgA2AC0A
-	QQBkAHIAZQBzAHMAZABhAHQAZQBuAHMAYQB0AHoIAAAAAAYAAAAbSW52YWxpZCBJUHY2IGFkZHJl
-	c3MgcmVjb3JkBwAAABJRRG5zTG9va3VwUnVubmFibGUBAwAAAGYAVQBuAGcA/ABsAHQAaQBnAGUA
-	bgAgAEQAYQB0AGUAbgBzAGEAdAB6ACAAZgD8AHIAIABrAGEAbgBvAG4AaQBzAGMAaABlAG4AIABO
-	AGEAbQBlAG4AIABlAHIAaABhAGwAdABlAG4IAAAAAAYAAAAdSW52YWxpZCBjYW5vbmljYWwgbmFt
-	ZSByZWNvcmQHAAAAElFEbnNMb29rdXBSdW5uYWJsZQEDAAAALABVAG4AZwD8AGwAdABpAGcAZQBy
-	ACAARABvAG0AYQBpAG4ALQBOAGEAbQBlCAAAAAAGAAAAE0ludmFsaWQgZG9tYWluIG5hbWUHAAAA
-	ElFEbnNMb29rdXBSdW5uYWJsZQEDAAAAJgBVAG4AZwD8AGwAdABpAGcAZQByACAASABvAHMAdABu
-	AGEAbQBlCAAAAAAGAAAAEEludmFsaWQgaG9zdG5hbWUHAAAAElFEbnNMb29rdXBSdW5uYWJsZQED
-	AAAAZABVAG4AZwD8AGwAdABpAGcAZQBuACAARABhAHQAZQBuAHMAYQB0AHoAIABmAPwAcgAgAEUA
-	LQBNAGEAaQBsAC0AQQB1AHMAdABhAHUAcwBjAGgAIABlAHIAaABhAGwAdABlAG4IAAAAAAYAAAAc
-	SW52YWxpZCBtYWlsIGV4Y2hhbmdlIHJlY29yZAcAAAASUURuc0xvb2t1cFJ1bm5hYmxlAQMAAABc
-	AFUAbgBnAPwAbAB0AGkAZwBlAG4AIABEAGEAdABlAG4AcwBhAHQAegAgAGQAZQBzACAATgBhAG0A
-	ZQAtAFMAZQByAHYAZQByAHMAIABlAHIAaABhAGwAdABlAG4IAAAAAAYAAAAaSW52YWxpZCBuYW1l
-	IHNlcnZlciByZWNvcmQHAAAAElFEbnNMb29rdXBSdW5uYWJsZQEDAAAAUgBVAG4AZwD8AGwAdABp
-	AGcAZQBuACAARABhAHQAZQBuAHMAYQB0AHoAIABmAPwAcgAgAFYAZQByAHcAZQBpAHMAIABlAHIA
-	aABhAGwAdABlAG4IAAAAAAYAAAAWSW52YWxpZCBwb2ludGVyIHJlY29yZAcAAAASUURuc0xvb2t1
-	cFJ1bm5hYmxlAQMAAAA0AFUAbgBnAPwAbAB0AGkAZwBlACAAQQBuAHQAdwBvAHIAdAAgAGUAcgBo
-	AGEAbAB0AGUAbggAAAAABgAAABZJbnZhbGlkIHJlcGx5IHJlY2VpdmVkBwAAABJRRG5zTG9va3Vw
-	UnVubmFibGUBAwAAAFAAVQBuAGcA/ABsAHQAaQBnAGUAbgAgAEQAYQB0AGUAbgBzAGEAdAB6ACAA
-	ZgD8AHIAIABEAGkAZQBuAHMAdAAgAGUAcgBoAGEAbAB0AGUAbggAAAAABgAAABZJbnZhbGlkIHNl
-	cnZpY2UgcmVjb3JkBwAAABJRRG5zTG9va3VwUnVubmFibGUBAwAAAEwAVQBuAGcA/ABsAHQAaQBn
-	AGUAbgAgAEQAYQB0AGUAbgBzAGEAdAB6ACAAZgD8AHIAIABUAGUAeAB0ACAAZQByAGgAYQBsAHQA
-	ZQBuCAAAAAAGAAAAE0ludmFsaWQgdGV4dCByZWNvcmQHAAAAElFEbnNMb29rdXBSdW5uYWJsZQED
-	AAAAQABFAHMAIAB3AHUAcgBkAGUAIABrAGUAaQBuACAASABvAHMAdABuAGEAbQBlACAAYQBuAGcA
-	ZQBnAGUAYgBlAG4IAAAAAAYAAAARTm8gaG9zdG5hbWUgZ2l2ZW4HAAAAElFEbnNMb29rdXBSdW5u
-	YWJsZQEDAAAALABEAG8AbQBhAGkAbgAgAGUAeABpAHMAdABpAGUAcgB0ACAAbgBpAGMAaAB0CAAA
-	AAAGAAAAE05vbiBleGlzdGVudCBkb21haW4HAAAAElFEbnNMb29rdXBSdW5uYWJsZQEDAAAAOgBO
-	AGkAYwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQAIABhAHUAZgAgAEEAbgBkAHIAbwBpAGQI
-	AAAAAAYAAAAcTm90IHlldCBzdXBwb3J0ZWQgb24gQW5kcm9pZAcAAAASUURuc0xvb2t1cFJ1bm5h
-	YmxlAQMAAABqAEQAaQBlACAAUgBlAHMAbwBsAHYAZQByAC0ARgB1AG4AawB0AGkAbwBuAGUAbgAg
-	AGsAbwBuAG4AdABlAG4AIABuAGkAYwBoAHQAIABnAGUAZgB1AG4AZABlAG4AIAB3AGUAcgBkAGUA
-	bggAAAAABgAAABxSZXNvbHZlciBmdW5jdGlvbnMgbm90IGZvdW5kBwAAABJRRG5zTG9va3VwUnVu
-	bmFibGUBAwAAAFoARABpAGUAIABJAG4AaQB0AGkAYQBsAGkAcwBpAGUAcgB1AG4AZwAgAGQAZQBz
-	ACAAUgBlAHMAbwBsAHYAZQByAHMAIABzAGMAaABsAHUAZwAgAGYAZQBoAGwIAAAAAAYAAAAeUmVz
-	b2x2ZXIgaW5pdGlhbGl6YXRpb24gZmFpbGVkBwAAABJRRG5zTG9va3VwUnVubmFibGUBAwAAAMQA
-	RABpAGUAIABSAGUAcwBvAGwAdgBlAHIALQBCAGkAYgBsAGkAbwB0AGgAZQBrACAAawBvAG4AbgB0
-	AGUAIABuAGkAYwBoAHQAIABnAGUAbABhAGQAZQBuACAAdwBlAHIAZABlAG4ALgAgAEQAYQBzACAA
-	TABhAGQAZQBuACAAegB1AHIAIABMAGEAdQBmAHoAZQBpAHQAIAB3AGkAcgBkACAAbgBpAGMAaAB0
-	ACAAdQBuAHQAZQByAHMAdAD8AHQAegB0CAAAAAAGAAAARFJlc29sdmVyIGxpYnJhcnkgY2FuJ3Qg
-	YmUgbG9hZGVkOiBObyBydW50aW1lIGxpYnJhcnkgbG9hZGluZyBzdXBwb3J0BwAAABJRRG5zTG9v
-	a3VwUnVubmFibGUBAwAAAF4ARABlAHIAIABTAGUAcgB2AGUAcgAgAGsAbwBuAG4AdABlACAAZABp
-	AGUAIABBAG4AZgByAGEAZwBlACAAbgBpAGMAaAB0ACAAdgBlAHIAYQByAGIAZQBpAHQAZQBuCAAA
-	AAAGAAAAHlNlcnZlciBjb3VsZCBub3QgcHJvY2VzcyBxdWVyeQcAAAASUURuc0xvb2t1cFJ1bm5h
-	YmxlAQMAAAAaAFMAZQByAHYAZQByAGEAdQBzAGYAYQBsAGwIAAAAAAYAAAAOU2VydmVyIGZhaWx1
-	cmUHAAAAElFEbnNMb29rdXBSdW5uYWJsZQEDAAAARABEAGUAcgAgAFMAZQByAHYAZQByACAAdgBl
-	AHIAdwBlAGkAZwBlAHIAdABlACAAZABpAGUAIABBAG4AdAB3AG8AcgB0CAAAAAAGAAAAGFNlcnZl
-	ciByZWZ1c2VkIHRvIGFuc3dlcgcAAAASUURuc0xvb2t1cFJ1bm5hYmxlAQMAAAAkAFUAbgBiAGUA
-	awBhAG4AbgB0AGUAcgAgAEYAZQBoAGwAZQByCAAAAAAGAAAADVVua25vd24gZXJyb3IHAAAAElFE
-	bnNMb29rdXBSdW5uYWJsZQEDAAAAEgBTAGMAaABsAGkAZQDfAGUAbggAAAAABgAAAAVDbG9zZQcA
-	AAALUURvY2tXaWRnZXQBAwAAADAAUwBjAGgAbABpAGUA3wB0ACAAZABhAHMAIABEAG8AYwBrAC0A
-	VwBpAGQAZwBlAHQIAAAAAAYAAAAWQ2xvc2VzIHRoZSBkb2NrIHdpZGdldAcAAAALUURvY2tXaWRn
-	ZXQBAwAAAAoATAD2AHMAZQBuCAAAAAAGAAAABUZsb2F0BwAAAAtRRG9ja1dpZGdldAEDAAAAWABM
-	APYAcwB0ACAAZABhAHMAIABEAG8AYwBrAC0AVwBpAGQAZwBlAHQAIAB1AG4AZAAgAHYAZQByAGEA
-	bgBrAGUAcgB0ACAAZQBzACAAdwBpAGUAZABlAHIIAAAAAAYAAAAnVW5kb2NrcyBhbmQgcmUtYXR0
-	YWNoZXMgdGhlIGRvY2sgd2lkZ2V0BwAAAAtRRG9ja1dpZGdldAEDAAAABgAmAE8ASwgAAAAABgAA
-	AAMmT0sHAAAADVFFcnJvck1lc3NhZ2UBAwAAADwARABpAGUAcwBlACAATQBlAGwAZAB1AG4AZwAg
-	AHcAaQBlAGQAZQByACAAYQBuACYAegBlAGkAZwBlAG4IAAAAAAYAAAAYJlNob3cgdGhpcyBtZXNz
-	YWdlIGFnYWluBwAAAA1RRXJyb3JNZXNzYWdlAQMAAAAkAEsAcgBpAHQAaQBzAGMAaABlAHIAIABG
-	AGUAaABsAGUAcgA6CAAAAAAGAAAAD0NyaXRpY2FsIEVycm9yOgcAAAANUUVycm9yTWVzc2FnZQED
-	AAAAHABEAGUAYgB1AGcALQBBAHUAcwBnAGEAYgBlADoIAAAAAAYAAAAORGVidWcgTWVzc2FnZToH
-	AAAADVFFcnJvck1lc3NhZ2UBAwAAAB4ARgBhAHQAYQBsAGUAcgAgAEYAZQBoAGwAZQByADoIAAAA
-	AAYAAAAMRmF0YWwgRXJyb3I6BwAAAA1RRXJyb3JNZXNzYWdlAQMAAAAYAEkAbgBmAG8AcgBtAGEA
-	dABpAG8AbgA6CAAAAAAGAAAADEluZm9ybWF0aW9uOgcAAAANUUVycm9yTWVzc2FnZQEDAAAAEABX
-	AGEAcgBuAHUAbgBnADoIAAAAAAYAAAAIV2FybmluZzoHAAAADVFFcnJvck1lc3NhZ2UBAwAAADoA
-	JQAxACAAawBhAG4AbgAgAG4AaQBjAGgAdAAgAGUAcgBzAHQAZQBsAGwAdAAgAHcAZQByAGQAZQBu
-	CAAAAAAGAAAAG0Nhbm5vdCBjcmVhdGUgJTEgZm9yIG91dHB1dAcAAAAFUUZpbGUBAwAAAE4AJQAx
-	ACAAawBhAG4AbgAgAG4AaQBjAGgAdAAgAHoAdQBtACAATABlAHMAZQBuACAAZwBlAPYAZgBmAG4A
-	ZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAYQ2Fubm90IG9wZW4gJTEgZm9yIGlucHV0BwAAAAVR
-	RmlsZQEDAAAARgDWAGYAZgBuAGUAbgAgAHoAdQBtACAAUwBjAGgAcgBlAGkAYgBlAG4AIABmAGUA
-	aABsAGcAZQBzAGMAaABsAGEAZwBlAG4IAAAAAAYAAAAWQ2Fubm90IG9wZW4gZm9yIG91dHB1dAcA
-	AAAFUUZpbGUBAwAAAFIARABpAGUAIABRAHUAZQBsAGwAZABhAHQAZQBpACAAawBhAG4AbgAgAG4A
-	aQBjAGgAdAAgAGUAbgB0AGYAZQByAG4AdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAGUNhbm5vdCBy
-	ZW1vdmUgc291cmNlIGZpbGUHAAAABVFGaWxlAQMAAAA+AEQAaQBlACAAWgBpAGUAbABkAGEAdABl
-	AGkAIABlAHgAaQBzAHQAaQBlAHIAdAAgAGIAZQByAGUAaQB0AHMIAAAAAAYAAAAXRGVzdGluYXRp
-	b24gZmlsZSBleGlzdHMHAAAABVFGaWxlAQMAAABCAEQAaQBlACAAWgBpAGUAbABkAGEAdABlAGkA
-	IABpAHMAdAAgAGQAaQBlAHMAZQBsAGIAZQAgAEQAYQB0AGUAaQAuCAAAAAAGAAAAIkRlc3RpbmF0
-	aW9uIGZpbGUgaXMgdGhlIHNhbWUgZmlsZS4HAAAABVFGaWxlAQMAAAA0AEYAZQBoAGwAZQByACAA
-	YgBlAGkAbQAgAFUAbQBiAGUAbgBlAG4AbgBlAG4AOgAgACUAMQgAAAAABgAAABhFcnJvciB3aGls
-	ZSByZW5hbWluZzogJTEHAAAABVFGaWxlAQMAAABcAEQAZQByACAARABhAHQAZQBuAGIAbABvAGMA
-	awAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZwBlAHMAYwBoAHIAaQBlAGIAZQBuACAAdwBl
-	AHIAZABlAG4IAAAAAAYAAAAWRmFpbHVyZSB0byB3cml0ZSBibG9jawcAAAAFUUZpbGUBAwAAAD4A
-	RABpAGUAIABRAHUAZQBsAGwAZABhAHQAZQBpACAAZQB4AGkAcwB0AGkAZQByAHQAIABuAGkAYwBo
-	AHQALggAAAAABgAAABtTb3VyY2UgZmlsZSBkb2VzIG5vdCBleGlzdC4HAAAABVFGaWxlAQMAAAB2
-	AEQAaQBlACAARABhAHQAZQBpACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIAB2AG8AbgAgACUA
-	MQAgAHcAaQBlAGQAZQByACAAaABlAHIAZwBlAHMAdABlAGwAbAB0ACAAdwBlAHIAZABlAG4AOgAg
-	ACUAMggAAAAABgAAAB1VbmFibGUgdG8gcmVzdG9yZSBmcm9tICUxOiAlMgcAAAAFUUZpbGUBAwAA
-	AI4ARQBpAG4AZQAgAHMAZQBxAHUAZQBuAHQAaQBlAGwAbABlACAARABhAHQAZQBpACAAdwBpAHIA
-	ZAAgAG4AaQBjAGgAdAAgAGQAdQByAGMAaAAgAGIAbABvAGMAawB3AGUAaQBzAGUAcwAgAEsAbwBw
-	AGkAZQByAGUAbgAgAHUAbQBiAGUAbgBhAG4AbgB0CAAAAAAGAAAAMFdpbGwgbm90IHJlbmFtZSBz
-	ZXF1ZW50aWFsIGZpbGUgdXNpbmcgYmxvY2sgY29weQcAAAAFUUZpbGUBAwAAADoARQBzACAAaQBz
-	AHQAIABrAGUAaQBuACAAQgBhAGMAawBlAG4AZAAgAHYAZQByAGYA/ABnAGIAYQByCAAAAAAGAAAA
-	GE5vIGZpbGUgZW5naW5lIGF2YWlsYWJsZQcAAAALUUZpbGVEZXZpY2UBAwAAANIARQBzACAAaQBz
-	AHQAIABrAGUAaQBuACAAQgBhAGMAawBlAG4AZAAgAHYAZQByAGYA/ABnAGIAYQByACAAbwBkAGUA
-	cgAgAGQAYQBzACAAZwBlAGcAZQBuAHcA5AByAHQAaQBnACAAYQBrAHQAaQB2AGUAIABCAGEAYwBr
-	AGUAbgBkACAAdQBuAHQAZQByAHMAdAD8AHQAegB0ACAAZABpAGUAIABVAG4ATQBhAHAALQBFAHIA
-	dwBlAGkAdABlAHIAdQBuAGcAIABuAGkAYwBoAHQIAAAAAAYAAABCTm8gZmlsZSBlbmdpbmUgYXZh
-	aWxhYmxlIG9yIGVuZ2luZSBkb2VzIG5vdCBzdXBwb3J0IFVuTWFwRXh0ZW5zaW9uBwAAAAtRRmls
-	ZURldmljZQEDAAAA1AAlADEACgBEAGEAcwAgAFYAZQByAHoAZQBpAGMAaABuAGkAcwAgAGsAbwBu
-	AG4AdABlACAAbgBpAGMAaAB0ACAAZwBlAGYAdQBuAGQAZQBuACAAdwBlAHIAZABlAG4ALgAKAFMA
-	dABlAGwAbABlAG4AIABTAGkAZQAgAHMAaQBjAGgAZQByACwAIABkAGEAcwBzACAAZABlAHIAIABW
-	AGUAcgB6AGUAaQBjAGgAbgBpAHMAbgBhAG0AZQAgAHIAaQBjAGgAdABpAGcAIABpAHMAdAAuCAAA
-	AAAGAAAASyUxCkRpcmVjdG9yeSBub3QgZm91bmQuClBsZWFzZSB2ZXJpZnkgdGhlIGNvcnJlY3Qg
-	ZGlyZWN0b3J5IG5hbWUgd2FzIGdpdmVuLgcAAAALUUZpbGVEaWFsb2cBAwAAALwAJQAxAAoARABp
-	AGUAIABEAGEAdABlAGkAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcAZQBmAHUAbgBkAGUA
-	bgAgAHcAZQByAGQAZQBuAC4ACgBTAHQAZQBsAGwAZQBuACAAUwBpAGUAIABzAGkAYwBoAGUAcgAs
-	ACAAZABhAHMAcwAgAGQAZQByACAARABhAHQAZQBpAG4AYQBtAGUAIAByAGkAYwBoAHQAaQBnACAA
-	aQBzAHQALggAAAAABgAAAEElMQpGaWxlIG5vdCBmb3VuZC4KUGxlYXNlIHZlcmlmeSB0aGUgY29y
-	cmVjdCBmaWxlIG5hbWUgd2FzIGdpdmVuLgcAAAALUUZpbGVEaWFsb2cBAwAAABAAJQAxAC0ARABh
-	AHQAZQBpCAAAAAAGAAAAByUxIEZpbGUHAAAAC1FGaWxlRGlhbG9nAQMAAAB8AEQAaQBlACAARABh
-	AHQAZQBpACAAJQAxACAAZQB4AGkAcwB0AGkAZQByAHQAIABiAGUAcgBlAGkAdABzAC4ACgBTAG8A
-	bABsACAAcwBpAGUAIAD8AGIAZQByAHMAYwBoAHIAaQBlAGIAZQBuACAAdwBlAHIAZABlAG4APwgA
-	AAAABgAAAC0lMSBhbHJlYWR5IGV4aXN0cy4KRG8geW91IHdhbnQgdG8gcmVwbGFjZSBpdD8HAAAA
-	C1FGaWxlRGlhbG9nAQMAAAAUACYAQQB1AHMAdwDkAGgAbABlAG4IAAAAAAYAAAAHJkNob29zZQcA
-	AAALUUZpbGVEaWFsb2cBAwAAABAAJgBMAPYAcwBjAGgAZQBuCAAAAAAGAAAAByZEZWxldGUHAAAA
-	C1FGaWxlRGlhbG9nAQMAAAAkACYATgBlAHUAZQBzACAAVgBlAHIAegBlAGkAYwBoAG4AaQBzCAAA
-	AAAGAAAACyZOZXcgRm9sZGVyBwAAAAtRRmlsZURpYWxvZwEDAAAADgAmANYAZgBmAG4AZQBuCAAA
-	AAAGAAAABSZPcGVuBwAAAAtRRmlsZURpYWxvZwEDAAAAFgAmAFUAbQBiAGUAbgBlAG4AbgBlAG4I
-	AAAAAAYAAAAHJlJlbmFtZQcAAAALUUZpbGVEaWFsb2cBAwAAABQAUwAmAHAAZQBpAGMAaABlAHIA
-	bggAAAAABgAAAAUmU2F2ZQcAAAALUUZpbGVEaWFsb2cBAwAAAIQAJwAlADEAJwAgAGkAcwB0ACAA
-	cwBjAGgAcgBlAGkAYgBnAGUAcwBjAGgA/AB0AHoAdAAuAAoATQD2AGMAaAB0AGUAbgAgAFMAaQBl
-	ACAAZABpAGUAIABEAGEAdABlAGkAIAB0AHIAbwB0AHoAZABlAG0AIABsAPYAcwBjAGgAZQBuAD8I
-	AAAAAAYAAAA5JyUxJyBpcyB3cml0ZSBwcm90ZWN0ZWQuCkRvIHlvdSB3YW50IHRvIGRlbGV0ZSBp
-	dCBhbnl3YXk/BwAAAAtRRmlsZURpYWxvZwEDAAAACgBBAGwAaQBhAHMIAAAAAAYAAAAFQWxpYXMH
-	AAAAC1FGaWxlRGlhbG9nAQMAAAAgAEEAbABsAGUAIABEAGEAdABlAGkAZQBuACAAKAAqACkIAAAA
-	AAYAAAANQWxsIEZpbGVzICgqKQcAAAALUUZpbGVEaWFsb2cBAwAAACAAQQBsAGwAZQAgAEQAYQB0
-	AGUAaQBlAG4AIAAoACoAKQgAAAAABgAAAA1BbGwgZmlsZXMgKCopBwAAAAtRRmlsZURpYWxvZwED
-	AAAAEABBAGwAdAArAEwAZQBmAHQIAAAAAAYAAAAIQWx0K0xlZnQHAAAAC1FGaWxlRGlhbG9nAQMA
-	AAASAEEAbAB0ACsAUgBpAGcAaAB0CAAAAAAGAAAACUFsdCtSaWdodAcAAAALUUZpbGVEaWFsb2cB
-	AwAAAAwAQQBsAHQAKwBVAHAIAAAAAAYAAAAGQWx0K1VwBwAAAAtRRmlsZURpYWxvZwEDAAAAXgBT
-	AGkAbgBkACAAUwBpAGUAIABzAGkAYwBoAGUAcgAsACAAZABhAHMAcwAgAFMAaQBlACAAJwAlADEA
-	JwAgAGwA9gBzAGMAaABlAG4AIABtAPYAYwBoAHQAZQBuAD8IAAAAAAYAAAAlQXJlIHlvdSBzdXJl
-	IHlvdSB3YW50IHRvIGRlbGV0ZSAnJTEnPwcAAAALUUZpbGVEaWFsb2cBAwAAAAwAWgB1AHIA/ABj
-	AGsIAAAAAAYAAAAEQmFjawcAAAALUUZpbGVEaWFsb2cBAwAAADAAVwBlAGMAaABzAGwAZQAgAHoA
-	dQAgAEQAZQB0AGEAaQBsAGEAbgBzAGkAYwBoAHQIAAAAAAYAAAAaQ2hhbmdlIHRvIGRldGFpbCB2
-	aWV3IG1vZGUHAAAAC1FGaWxlRGlhbG9nAQMAAAAwAFcAZQBjAGgAcwBsAGUAIAB6AHUAIABMAGkA
-	cwB0AGUAbgBhAG4AcwBpAGMAaAB0CAAAAAAGAAAAGENoYW5nZSB0byBsaXN0IHZpZXcgbW9kZQcA
-	AAALUUZpbGVEaWFsb2cBAwAAAFoARABhAHMAIABWAGUAcgB6AGUAaQBjAGgAbgBpAHMAIABrAG8A
-	bgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcAZQBsAPYAcwBjAGgAdAAgAHcAZQByAGQAZQBuAC4IAAAA
-	AAYAAAAbQ291bGQgbm90IGRlbGV0ZSBkaXJlY3RvcnkuBwAAAAtRRmlsZURpYWxvZwEDAAAALABO
-	AGUAdQBlAG4AIABPAHIAZABuAGUAcgAgAGUAcgBzAHQAZQBsAGwAZQBuCAAAAAAGAAAAEUNyZWF0
-	ZSBOZXcgRm9sZGVyBwAAAAtRRmlsZURpYWxvZwEDAAAALABOAGUAdQBlAG4AIABPAHIAZABuAGUA
-	cgAgAGUAcgBzAHQAZQBsAGwAZQBuCAAAAAAGAAAAE0NyZWF0ZSBhIE5ldyBGb2xkZXIHAAAAC1FG
-	aWxlRGlhbG9nAQMAAAAOAEwA9gBzAGMAaABlAG4IAAAAAAYAAAAGRGVsZXRlBwAAAAtRRmlsZURp
-	YWxvZwEDAAAADgBEAGUAdABhAGkAbABzCAAAAAAGAAAAC0RldGFpbCBWaWV3BwAAAAtRRmlsZURp
-	YWxvZwEDAAAAGgBWAGUAcgB6AGUAaQBjAGgAbgBpAHMAcwBlCAAAAAAGAAAAC0RpcmVjdG9yaWVz
-	BwAAAAtRRmlsZURpYWxvZwEDAAAAGABWAGUAcgB6AGUAaQBjAGgAbgBpAHMAOggAAAAABgAAAApE
-	aXJlY3Rvcnk6BwAAAAtRRmlsZURpYWxvZwEDAAAAEABMAGEAdQBmAHcAZQByAGsIAAAAAAYAAAAF
-	RHJpdmUHAAAAC1FGaWxlRGlhbG9nAQMAAAAKAEQAYQB0AGUAaQgAAAAABgAAAARGaWxlBwAAAAtR
-	RmlsZURpYWxvZwEDAAAAFgBEAGEAdABlAGkAJgBuAGEAbQBlADoIAAAAAAYAAAALRmlsZSAmbmFt
-	ZToHAAAAC1FGaWxlRGlhbG9nAQMAAAAMAE8AcgBkAG4AZQByCAAAAAAGAAAAC0ZpbGUgRm9sZGVy
-	BwAAAAtRRmlsZURpYWxvZwEDAAAADgBEAGEAdABlAGkAZQBuCAAAAAAGAAAABUZpbGVzBwAAAAtR
-	RmlsZURpYWxvZwEDAAAAIgBEAGEAdABlAGkAZQBuACAAZABlAHMAIABUAHkAcABzADoIAAAAAAYA
-	AAAORmlsZXMgb2YgdHlwZToHAAAAC1FGaWxlRGlhbG9nAQMAAAAkAFYAZQByAHoAZQBpAGMAaABu
-	AGkAcwAgAHMAdQBjAGgAZQBuCAAAAAAGAAAADkZpbmQgRGlyZWN0b3J5BwAAAAtRRmlsZURpYWxv
-	ZwEDAAAAFgBWAGUAcgB6AGUAaQBjAGgAbgBpAHMIAAAAAAYAAAAGRm9sZGVyBwAAAAtRRmlsZURp
-	YWxvZwEDAAAAEABWAG8AcgB3AOQAcgB0AHMIAAAAAAYAAAAHRm9yd2FyZAcAAAALUUZpbGVEaWFs
-	b2cBAwAAAAwAWgB1AHIA/ABjAGsIAAAAAAYAAAAHR28gYmFjawcAAAALUUZpbGVEaWFsb2cBAwAA
-	AAYAVgBvAHIIAAAAAAYAAAAKR28gZm9yd2FyZAcAAAALUUZpbGVEaWFsb2cBAwAAAEYARwBlAGgA
-	ZQAgAHoAdQBtACAA/ABiAGUAcgBnAGUAbwByAGQAbgBlAHQAZQBuACAAVgBlAHIAegBlAGkAYwBo
-	AG4AaQBzCAAAAAAGAAAAGkdvIHRvIHRoZSBwYXJlbnQgZGlyZWN0b3J5BwAAAAtRRmlsZURpYWxv
-	ZwEDAAAACgBMAGkAcwB0AGUIAAAAAAYAAAAJTGlzdCBWaWV3BwAAAAtRRmlsZURpYWxvZwEDAAAA
-	PABMAGkAcwB0AGUAIABkAGUAcgAgAE8AcgB0AGUAIAB1AG4AZAAgAEwAZQBzAGUAegBlAGkAYwBo
-	AGUAbggAAAAABgAAABxMaXN0IG9mIHBsYWNlcyBhbmQgYm9va21hcmtzBwAAAAtRRmlsZURpYWxv
-	ZwEDAAAAFABTAHUAYwBoAGUAbgAgAGkAbgA6CAAAAAAGAAAACExvb2sgaW46BwAAAAtRRmlsZURp
-	YWxvZwEDAAAAGgBNAGUAaQBuACAAQwBvAG0AcAB1AHQAZQByCAAAAAAGAAAAC015IENvbXB1dGVy
-	BwAAAAtRRmlsZURpYWxvZwEDAAAAIgBOAGUAdQBlAHMAIABWAGUAcgB6AGUAaQBjAGgAbgBpAHMI
-	AAAAAAYAAAAKTmV3IEZvbGRlcgcAAAALUUZpbGVEaWFsb2cBAwAAAAwA1gBmAGYAbgBlAG4IAAAA
-	AAYAAAAET3BlbgcAAAALUUZpbGVEaWFsb2cBAwAAADQA3ABiAGUAcgBnAGUAbwByAGQAbgBlAHQA
-	ZQBzACAAVgBlAHIAegBlAGkAYwBoAG4AaQBzCAAAAAAGAAAAEFBhcmVudCBEaXJlY3RvcnkHAAAA
-	C1FGaWxlRGlhbG9nAQMAAAAeAFoAdQBsAGUAdAB6AHQAIABiAGUAcwB1AGMAaAB0CAAAAAAGAAAA
-	DVJlY2VudCBQbGFjZXMHAAAAC1FGaWxlRGlhbG9nAQMAAAAOAEwA9gBzAGMAaABlAG4IAAAAAAYA
-	AAAGUmVtb3ZlBwAAAAtRRmlsZURpYWxvZwEDAAAAHgBTAHAAZQBpAGMAaABlAHIAbgAgAHUAbgB0
-	AGUAcggAAAAABgAAAAdTYXZlIEFzBwAAAAtRRmlsZURpYWxvZwEDAAAAIgBTAHkAbQBiAG8AbABp
-	AHMAYwBoAGUAcgAgAEwAaQBuAGsIAAAAAAYAAAAIU2hvcnRjdXQHAAAAC1FGaWxlRGlhbG9nAQMA
-	AAASAEEAbgB6AGUAaQBnAGUAbgAgCAAAAAAGAAAABVNob3cgBwAAAAtRRmlsZURpYWxvZwEDAAAA
-	OAAmAFYAZQByAHMAdABlAGMAawB0AGUAIABEAGEAdABlAGkAZQBuACAAYQBuAHoAZQBpAGcAZQBu
-	CAAAAAAGAAAAElNob3cgJmhpZGRlbiBmaWxlcwcAAAALUUZpbGVEaWFsb2cBAwAAABgAUwBlAGkA
-	dABlAG4AbABlAGkAcwB0AGUIAAAAAAYAAAAHU2lkZWJhcgcAAAALUUZpbGVEaWFsb2cBAwAAABIA
-	VQBuAGIAZQBrAGEAbgBuAHQIAAAAAAYAAAAHVW5rbm93bgcAAAALUUZpbGVEaWFsb2cBAwAAAQ4A
-	PABiAD4ARABlAHIAIABOAGEAbQBlACAAIgAlADEAIgAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIAB2
-	AGUAcgB3AGUAbgBkAGUAdAAgAHcAZQByAGQAZQBuAC4APAAvAGIAPgA8AHAAPgBWAGUAcgBzAHUA
-	YwBoAGUAbgAgAFMAaQBlACwAIABkAGkAZQAgAFMAYQB0AHoAegBlAGkAYwBoAGUAbgAgAHoAdQAg
-	AGUAbgB0AGYAZQByAG4AZQBuACAAbwBkAGUAcgAgAGUAaQBuAGUAbgAgAGsA/AByAHoAZQByAGUA
-	bgAgAE4AYQBtAGUAbgAgAHoAdQAgAHYAZQByAHcAZQBuAGQAZQBuAC4IAAAAAAYAAABvPGI+VGhl
-	IG5hbWUgIiUxIiBjYW4gbm90IGJlIHVzZWQuPC9iPjxwPlRyeSB1c2luZyBhbm90aGVyIG5hbWUs
-	IHdpdGggZmV3ZXIgY2hhcmFjdGVycyBvciBubyBwdW5jdHVhdGlvbnMgbWFya3MuBwAAABBRRmls
-	ZVN5c3RlbU1vZGVsAQMAAAAQAEMAbwBtAHAAdQB0AGUAcggAAAAABgAAAAhDb21wdXRlcgcAAAAQ
-	UUZpbGVTeXN0ZW1Nb2RlbAEDAAAAHADEAG4AZABlAHIAdQBuAGcAcwBkAGEAdAB1AG0IAAAAAAYA
-	AAANRGF0ZSBNb2RpZmllZAcAAAAQUUZpbGVTeXN0ZW1Nb2RlbAEDAAAAKABVAG4AZwD8AGwAdABp
-	AGcAZQByACAARABhAHQAZQBpAG4AYQBtAGUIAAAAAAYAAAAQSW52YWxpZCBmaWxlbmFtZQcAAAAQ
-	UUZpbGVTeXN0ZW1Nb2RlbAEDAAAABgBBAHIAdAgAAAAABgAAAARLaW5kBwAAABBRRmlsZVN5c3Rl
-	bU1vZGVsAQMAAAAaAE0AZQBpAG4AIABDAG8AbQBwAHUAdABlAHIIAAAAAAYAAAALTXkgQ29tcHV0
-	ZXIHAAAAEFFGaWxlU3lzdGVtTW9kZWwBAwAAAAgATgBhAG0AZQgAAAAABgAAAAROYW1lBwAAABBR
-	RmlsZVN5c3RlbU1vZGVsAQMAAAAKAEcAcgD2AN8AZQgAAAAABgAAAARTaXplBwAAABBRRmlsZVN5
-	c3RlbU1vZGVsAQMAAAAGAFQAeQBwCAAAAAAGAAAABFR5cGUHAAAAEFFGaWxlU3lzdGVtTW9kZWwB
-	AwAAAAgAQQBsAGwAZQgAAAAABgAAAANBbnkHAAAADVFGb250RGF0YWJhc2UBAwAAABAAQQByAGEA
-	YgBpAHMAYwBoCAAAAAAGAAAABkFyYWJpYwcAAAANUUZvbnREYXRhYmFzZQEDAAAAEgBBAHIAbQBl
-	AG4AaQBzAGMAaAgAAAAABgAAAAhBcm1lbmlhbgcAAAANUUZvbnREYXRhYmFzZQEDAAAAFABCAGUA
-	bgBnAGEAbABpAHMAYwBoCAAAAAAGAAAAB0JlbmdhbGkHAAAADVFGb250RGF0YWJhc2UBAwAAAA4A
-	UwBjAGgAdwBhAHIAeggAAAAABgAAAAVCbGFjawcAAAANUUZvbnREYXRhYmFzZQEDAAAACABGAGUA
-	dAB0CAAAAAAGAAAABEJvbGQHAAAADVFGb250RGF0YWJhc2UBAwAAABQASwB5AHIAaQBsAGwAaQBz
-	AGMAaAgAAAAABgAAAAhDeXJpbGxpYwcAAAANUUZvbnREYXRhYmFzZQEDAAAACABIAGEAbABiCAAA
-	AAAGAAAABERlbWkHAAAADVFGb250RGF0YWJhc2UBAwAAABAASABhAGwAYgBmAGUAdAB0CAAAAAAG
-	AAAACURlbWkgQm9sZAcAAAANUUZvbnREYXRhYmFzZQEDAAAAFABEAGUAdgBhAG4AYQBnAGEAcgBp
-	CAAAAAAGAAAACkRldmFuYWdhcmkHAAAADVFGb250RGF0YWJhc2UBAwAAAAgAUwBlAGgAcggAAAAA
-	BgAAAAVFeHRyYQcAAAANUUZvbnREYXRhYmFzZQEDAAAAEgBTAGUAaAByACAAZgBlAHQAdAgAAAAA
-	BgAAAApFeHRyYSBCb2xkBwAAAA1RRm9udERhdGFiYXNlAQMAAAASAFMAZQBoAHIAIABkAPwAbgBu
-	CAAAAAAGAAAAC0V4dHJhIExpZ2h0BwAAAA1RRm9udERhdGFiYXNlAQMAAAASAEcAZQBvAHIAZwBp
-	AHMAYwBoCAAAAAAGAAAACEdlb3JnaWFuBwAAAA1RRm9udERhdGFiYXNlAQMAAAAUAEcAcgBpAGUA
-	YwBoAGkAcwBjAGgIAAAAAAYAAAAFR3JlZWsHAAAADVFGb250RGF0YWJhc2UBAwAAABAARwB1AGoA
-	YQByAGEAdABpCAAAAAAGAAAACEd1amFyYXRpBwAAAA1RRm9udERhdGFiYXNlAQMAAAAQAEcAdQBy
-	AG0AdQBrAGgAaQgAAAAABgAAAAhHdXJtdWtoaQcAAAANUUZvbnREYXRhYmFzZQEDAAAAEgBIAGUA
-	YgByAOQAaQBzAGMAaAgAAAAABgAAAAZIZWJyZXcHAAAADVFGb250RGF0YWJhc2UBAwAAAAwASwB1
-	AHIAcwBpAHYIAAAAAAYAAAAGSXRhbGljBwAAAA1RRm9udERhdGFiYXNlAQMAAAASAEoAYQBwAGEA
-	bgBpAHMAYwBoCAAAAAAGAAAACEphcGFuZXNlBwAAAA1RRm9udERhdGFiYXNlAQMAAAAOAEsAYQBu
-	AG4AYQBkAGEIAAAAAAYAAAAHS2FubmFkYQcAAAANUUZvbnREYXRhYmFzZQEDAAAACgBLAGgAbQBl
-	AHIIAAAAAAYAAAAFS2htZXIHAAAADVFGb250RGF0YWJhc2UBAwAAABQASwBvAHIAZQBhAG4AaQBz
-	AGMAaAgAAAAABgAAAAZLb3JlYW4HAAAADVFGb250RGF0YWJhc2UBAwAAABAATABhAG8AdABpAHMA
-	YwBoCAAAAAAGAAAAA0xhbwcAAAANUUZvbnREYXRhYmFzZQEDAAAAFABMAGEAdABlAGkAbgBpAHMA
-	YwBoCAAAAAAGAAAABUxhdGluBwAAAA1RRm9udERhdGFiYXNlAQMAAAAMAEwAZQBpAGMAaAB0CAAA
-	AAAGAAAABUxpZ2h0BwAAAA1RRm9udERhdGFiYXNlAQMAAAASAE0AYQBsAGEAeQBhAGwAYQBtCAAA
-	AAAGAAAACU1hbGF5YWxhbQcAAAANUUZvbnREYXRhYmFzZQEDAAAADABNAGkAdAB0AGUAbAgAAAAA
-	BgAAAAZNZWRpdW0HAAAADVFGb250RGF0YWJhc2UBAwAAAA4ATQB5AGEAbgBtAGEAcggAAAAABgAA
-	AAdNeWFubWFyBwAAAA1RRm9udERhdGFiYXNlAQMAAAAIAE4AJwBLAG8IAAAAAAYAAAAETidLbwcA
-	AAANUUZvbnREYXRhYmFzZQEDAAAADABOAG8AcgBtAGEAbAgAAAAABgAAAAZOb3JtYWwHAAAADVFG
-	b250RGF0YWJhc2UBAwAAABwAUwBjAGgAcgDkAGcAZwBlAHMAdABlAGwAbAB0CAAAAAAGAAAAB09i
-	bGlxdWUHAAAADVFGb250RGF0YWJhc2UBAwAAAAoATwBnAGgAYQBtCAAAAAAGAAAABU9naGFtBwAA
-	AA1RRm9udERhdGFiYXNlAQMAAAAKAE8AcgBpAHkAYQgAAAAABgAAAAVPcml5YQcAAAANUUZvbnRE
-	YXRhYmFzZQEDAAAACgBSAHUAbgBlAG4IAAAAAAYAAAAFUnVuaWMHAAAADVFGb250RGF0YWJhc2UB
-	AwAAADAAQwBoAGkAbgBlAHMAaQBzAGMAaAAgACgASwB1AHIAegB6AGUAaQBjAGgAZQBuACkIAAAA
-	AAYAAAASU2ltcGxpZmllZCBDaGluZXNlBwAAAA1RRm9udERhdGFiYXNlAQMAAAAOAFMAaQBuAGgA
-	YQBsAGEIAAAAAAYAAAAHU2luaGFsYQcAAAANUUZvbnREYXRhYmFzZQEDAAAADABTAHkAbQBiAG8A
-	bAgAAAAABgAAAAZTeW1ib2wHAAAADVFGb250RGF0YWJhc2UBAwAAAA4AUwB5AHIAaQBzAGMAaAgA
-	AAAABgAAAAZTeXJpYWMHAAAADVFGb250RGF0YWJhc2UBAwAAABIAVABhAG0AaQBsAGkAcwBjAGgI
-	AAAAAAYAAAAFVGFtaWwHAAAADVFGb250RGF0YWJhc2UBAwAAAAwAVABlAGwAdQBnAHUIAAAAAAYA
-	AAAGVGVsdWd1BwAAAA1RRm9udERhdGFiYXNlAQMAAAAMAFQAaABhAGEAbgBhCAAAAAAGAAAABlRo
-	YWFuYQcAAAANUUZvbnREYXRhYmFzZQEDAAAAGABUAGgAYQBpAGwA5ABuAGQAaQBzAGMAaAgAAAAA
-	BgAAAARUaGFpBwAAAA1RRm9udERhdGFiYXNlAQMAAAAIAEQA/ABuAG4IAAAAAAYAAAAEVGhpbgcA
-	AAANUUZvbnREYXRhYmFzZQEDAAAAEgBUAGkAYgBlAHQAaQBzAGMAaAgAAAAABgAAAAdUaWJldGFu
-	BwAAAA1RRm9udERhdGFiYXNlAQMAAAAwAEMAaABpAG4AZQBzAGkAcwBjAGgAIAAoAEwAYQBuAGcA
-	egBlAGkAYwBoAGUAbgApCAAAAAAGAAAAE1RyYWRpdGlvbmFsIENoaW5lc2UHAAAADVFGb250RGF0
-	YWJhc2UBAwAAABoAVgBpAGUAdABuAGEAbQBlAHMAaQBzAGMAaAgAAAAABgAAAApWaWV0bmFtZXNl
-	BwAAAA1RRm9udERhdGFiYXNlAQMAAAAWACYAUwBjAGgAcgBpAGYAdABhAHIAdAgAAAAABgAAAAUm
-	Rm9udAcAAAALUUZvbnREaWFsb2cBAwAAAAwAJgBHAHIA9gDfAGUIAAAAAAYAAAAFJlNpemUHAAAA
-	C1FGb250RGlhbG9nAQMAAAAcACYAVQBuAHQAZQByAHMAdAByAGkAYwBoAGUAbggAAAAABgAAAAom
-	VW5kZXJsaW5lBwAAAAtRRm9udERpYWxvZwEDAAAADgBFAGYAZgBlAGsAdABlCAAAAAAGAAAAB0Vm
-	ZmVjdHMHAAAAC1FGb250RGlhbG9nAQMAAAAYAFMAYwBoAHIAaQBmAHQAcwAmAHQAaQBsCAAAAAAG
-	AAAAC0ZvbnQgc3QmeWxlBwAAAAtRRm9udERpYWxvZwEDAAAAEABCAGUAaQBzAHAAaQBlAGwIAAAA
-	AAYAAAAGU2FtcGxlBwAAAAtRRm9udERpYWxvZwEDAAAAKABTAGMAaAByAGkAZgB0AGEAcgB0ACAA
-	YQB1AHMAdwDkAGgAbABlAG4IAAAAAAYAAAALU2VsZWN0IEZvbnQHAAAAC1FGb250RGlhbG9nAQMA
-	AAAgAEQAdQByAGMAaAAmAGcAZQBzAHQAcgBpAGMAaABlAG4IAAAAAAYAAAAKU3RyaSZrZW91dAcA
-	AAALUUZvbnREaWFsb2cBAwAAABwAJgBTAGMAaAByAGkAZgB0AHMAeQBzAHQAZQBtCAAAAAAGAAAA
-	D1dyJml0aW5nIFN5c3RlbQcAAAALUUZvbnREaWFsb2cBAwAAAFoARABhAHMAIADEAG4AZABlAHIA
-	bgAgAGQAZQBzACAAVgBlAHIAegBlAGkAYwBoAG4AaQBzAHMAZQBzACAAcwBjAGgAbAB1AGcAIABm
-	AGUAaABsADoACgAlADEIAAAAAAYAAAAdQ2hhbmdpbmcgZGlyZWN0b3J5IGZhaWxlZDoKJTEHAAAA
-	BFFGdHABAwAAADAAVgBlAHIAYgB1AG4AZABlAG4AIABtAGkAdAAgAFIAZQBjAGgAbgBlAHIAIAAl
-	ADEIAAAAAAYAAAAUQ29ubmVjdGVkIHRvIGhvc3QgJTEHAAAABFFGdHABAwAAAFoAVgBlAHIAYgBp
-	AG4AZAB1AG4AZwAgAG0AaQB0ACAAUgBlAGMAaABuAGUAcgAgAGkAcwB0ACAAZgBlAGgAbABnAGUA
-	cwBjAGgAbABhAGcAZQBuADoACgAlADEIAAAAAAYAAAAdQ29ubmVjdGluZyB0byBob3N0IGZhaWxl
-	ZDoKJTEHAAAABFFGdHABAwAAACQAVgBlAHIAYgBpAG4AZAB1AG4AZwAgAGIAZQBlAG4AZABlAHQI
-	AAAAAAYAAAARQ29ubmVjdGlvbiBjbG9zZWQHAAAABFFGdHABAwAAADgAVgBlAHIAYgBpAG4AZAB1
-	AG4AZwAgAG0AaQB0ACAAJQAxACAAdgBlAHIAdwBlAGkAZwBlAHIAdAgAAAAABgAAAB1Db25uZWN0
-	aW9uIHJlZnVzZWQgdG8gaG9zdCAlMQcAAAAEUUZ0cAEDAAAAeABEAGEAcwAgAFoAZQBpAHQAbABp
-	AG0AaQB0ACAAZgD8AHIAIABkAGkAZQAgAFYAZQByAGIAaQBuAGQAdQBuAGcAIAB6AHUAIAAnACUA
-	MQAnACAAdwB1AHIAZABlACAA/ABiAGUAcgBzAGMAaAByAGkAdAB0AGUAbggAAAAABgAAAB9Db25u
-	ZWN0aW9uIHRpbWVkIG91dCB0byBob3N0ICUxBwAAAARRRnRwAQMAAABgAEQAYQBzACAARQByAHMA
-	dABlAGwAbABlAG4AIABkAGUAcwAgAFYAZQByAHoAZQBpAGMAaABuAGkAcwBzAGUAcwAgAHMAYwBo
-	AGwAdQBnACAAZgBlAGgAbAA6AAoAJQAxCAAAAAAGAAAAHUNyZWF0aW5nIGRpcmVjdG9yeSBmYWls
-	ZWQ6CiUxBwAAAARRRnRwAQMAAAA0AEQAYQB0AGUAbgB2AGUAcgBiAGkAbgBkAHUAbgBnACAAdgBl
-	AHIAdwBlAGkAZwBlAHIAdAgAAAAABgAAABdEYXRhIENvbm5lY3Rpb24gcmVmdXNlZAcAAAAEUUZ0
-	cAEDAAAAVgBEAGEAcwAgAEgAZQByAHUAbgB0AGUAcgBsAGEAZABlAG4AIABkAGUAcgAgAEQAYQB0
-	AGUAaQAgAHMAYwBoAGwAdQBnACAAZgBlAGgAbAA6AAoAJQAxCAAAAAAGAAAAG0Rvd25sb2FkaW5n
-	IGZpbGUgZmFpbGVkOgolMQcAAAAEUUZ0cAEDAAAASABIAG8AcwB0ACAAJQAxACAAawBvAG4AbgB0
-	AGUAIABuAGkAYwBoAHQAIABnAGUAZgB1AG4AZABlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAABFI
-	b3N0ICUxIG5vdCBmb3VuZAcAAAAEUUZ0cAEDAAAAfgBEAGUAcgAgAEkAbgBoAGEAbAB0ACAAZABl
-	AHMAIABWAGUAcgB6AGUAaQBjAGgAbgBpAHMAcwBlAHMAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgA
-	dAAgAGEAbgBnAGUAegBlAGkAZwB0ACAAdwBlAHIAZABlAG4AOgAKACUAMQgAAAAABgAAABxMaXN0
-	aW5nIGRpcmVjdG9yeSBmYWlsZWQ6CiUxBwAAAARRRnRwAQMAAABAAEEAbgBtAGUAbABkAHUAbgBn
-	ACAAaQBzAHQAIABmAGUAaABsAGcAZQBzAGMAaABsAGEAZwBlAG4AOgAKACUAMQgAAAAABgAAABBM
-	b2dpbiBmYWlsZWQ6CiUxBwAAAARRRnRwAQMAAAAgAEsAZQBpAG4AZQAgAFYAZQByAGIAaQBuAGQA
-	dQBuAGcIAAAAAAYAAAANTm90IGNvbm5lY3RlZAcAAAAEUUZ0cAEDAAAAXABEAGEAcwAgAEwA9gBz
-	AGMAaABlAG4AIABkAGUAcwAgAFYAZQByAHoAZQBpAGMAaABuAGkAcwBzAGUAcwAgAHMAYwBoAGwA
-	dQBnACAAZgBlAGgAbAA6AAoAJQAxCAAAAAAGAAAAHVJlbW92aW5nIGRpcmVjdG9yeSBmYWlsZWQ6
-	CiUxBwAAAARRRnRwAQMAAABKAEQAYQBzACAATAD2AHMAYwBoAGUAbgAgAGQAZQByACAARABhAHQA
-	ZQBpACAAcwBjAGgAbAB1AGcAIABmAGUAaABsADoACgAlADEIAAAAAAYAAAAYUmVtb3ZpbmcgZmls
-	ZSBmYWlsZWQ6CiUxBwAAAARRRnRwAQMAAAAkAFUAbgBiAGUAawBhAG4AbgB0AGUAcgAgAEYAZQBo
-	AGwAZQByCAAAAAAGAAAADVVua25vd24gZXJyb3IHAAAABFFGdHABAwAAAE4ARABhAHMAIABIAG8A
-	YwBoAGwAYQBkAGUAbgAgAGQAZQByACAARABhAHQAZQBpACAAcwBjAGgAbAB1AGcAIABmAGUAaABs
-	ADoACgAlADEIAAAAAAYAAAAZVXBsb2FkaW5nIGZpbGUgZmFpbGVkOgolMQcAAAAEUUZ0cAEDAAAA
-	FAAmAEEAYgBiAHIAZQBjAGgAZQBuCAAAAAAGAAAAByZDYW5jZWwHAAAAC1FHbm9tZVRoZW1lAQMA
-	AAAUAFMAYwBoAGwAJgBpAGUA3wBlAG4IAAAAAAYAAAAGJkNsb3NlBwAAAAtRR25vbWVUaGVtZQED
-	AAAABgAmAE8ASwgAAAAABgAAAAMmT0sHAAAAC1FHbm9tZVRoZW1lAQMAAAAUAFMAJgBwAGUAaQBj
-	AGgAZQByAG4IAAAAAAYAAAAFJlNhdmUHAAAAC1FHbm9tZVRoZW1lAQMAAAA2AFMAYwBoAGwAaQBl
-	AN8AZQBuACAAbwBoAG4AZQAgAHoAdQAgAFMAcABlAGkAYwBoAGUAcgBuCAAAAAAGAAAAFENsb3Nl
-	IHdpdGhvdXQgU2F2aW5nBwAAAAtRR25vbWVUaGVtZQEDAAAABgBMAFQAUggAAAAABgAAABNRVF9M
-	QVlPVVRfRElSRUNUSU9OBwAAAA9RR3VpQXBwbGljYXRpb24BAwAAAEAARQBzACAAdwB1AHIAZABl
-	ACAAawBlAGkAbgAgAEgAbwBzAHQAbgBhAG0AZQAgAGEAbgBnAGUAZwBlAGIAZQBuCAAAAAAGAAAA
-	Ek5vIGhvc3QgbmFtZSBnaXZlbgcAAAAJUUhvc3RJbmZvAQMAAAAkAFUAbgBiAGUAawBhAG4AbgB0
-	AGUAcgAgAEYAZQBoAGwAZQByCAAAAAAGAAAADVVua25vd24gZXJyb3IHAAAACVFIb3N0SW5mbwED
-	AAAAQgBIAG8AcwB0ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAZgB1AG4AZABlAG4A
-	IAB3AGUAcgBkAGUAbggAAAAABgAAAA5Ib3N0IG5vdCBmb3VuZAcAAAAOUUhvc3RJbmZvQWdlbnQB
-	AwAAACYAVQBuAGcA/ABsAHQAaQBnAGUAcgAgAEgAbwBzAHQAbgBhAG0AZQgAAAAABgAAABBJbnZh
-	bGlkIGhvc3RuYW1lBwAAAA5RSG9zdEluZm9BZ2VudAEDAAAAQABFAHMAIAB3AHUAcgBkAGUAIABr
-	AGUAaQBuACAASABvAHMAdABuAGEAbQBlACAAYQBuAGcAZQBnAGUAYgBlAG4IAAAAAAYAAAASTm8g
-	aG9zdCBuYW1lIGdpdmVuBwAAAA5RSG9zdEluZm9BZ2VudAEDAAAAKgBVAG4AYgBlAGsAYQBuAG4A
-	dABlAHIAIABBAGQAcgBlAHMAcwB0AHkAcAgAAAAABgAAABRVbmtub3duIGFkZHJlc3MgdHlwZQcA
-	AAAOUUhvc3RJbmZvQWdlbnQBAwAAACQAVQBuAGIAZQBrAGEAbgBuAHQAZQByACAARgBlAGgAbABl
-	AHIIAAAAAAYAAAANVW5rbm93biBlcnJvcgcAAAAOUUhvc3RJbmZvQWdlbnQBAwAAAC4AVQBuAGIA
-	ZQBrAGEAbgBuAHQAZQByACAARgBlAGgAbABlAHIAIAAoACUAMQApCAAAAAAGAAAAElVua25vd24g
-	ZXJyb3IgKCUxKQcAAAAOUUhvc3RJbmZvQWdlbnQBAwAAACQAVgBlAHIAYgBpAG4AZAB1AG4AZwAg
-	AGIAZQBlAG4AZABlAHQIAAAAAAYAAAARQ29ubmVjdGlvbiBjbG9zZWQHAAAABVFIdHRwAQMAAAAq
-	AFYAZQByAGIAaQBuAGQAdQBuAGcAIAB2AGUAcgB3AGUAaQBnAGUAcgB0CAAAAAAGAAAAEkNvbm5l
-	Y3Rpb24gcmVmdXNlZAcAAAAFUUh0dHABAwAAADIARABpAGUAIABEAGEAdABlAG4AIABzAGkAbgBk
-	ACAAdgBlAHIAZgDkAGwAcwBjAGgAdAgAAAAABgAAAA5EYXRhIGNvcnJ1cHRlZAcAAAAFUUh0dHAB
-	AwAAAEgASABvAHMAdAAgACUAMQAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZwBlAGYAdQBu
-	AGQAZQBuACAAdwBlAHIAZABlAG4IAAAAAAYAAAARSG9zdCAlMSBub3QgZm91bmQHAAAABVFIdHRw
-	AQMAAABQAEQAZQByACAASABvAHMAdAAgAHYAZQByAGwAYQBuAGcAdAAgAGUAaQBuAGUAIABBAHUA
-	dABoAGUAbgB0AGkAZgBpAHoAaQBlAHIAdQBuAGcIAAAAAAYAAAAcSG9zdCByZXF1aXJlcyBhdXRo
-	ZW50aWNhdGlvbgcAAAAFUUh0dHABAwAAAC4AVQBuAHMAaQBjAGgAZQByAGUAIABXAGUAaQB0AGUA
-	cgBsAGUAaQB0AHUAbgBnCAAAAAAGAAAAEUluc2VjdXJlIHJlZGlyZWN0BwAAAAVRSHR0cAEDAAAA
-	SABQAHIAbwB4AHkALQBBAHUAdABoAGUAbgB0AGkAZgBpAHoAaQBlAHIAdQBuAGcAIABlAHIAZgBv
-	AHIAZABlAHIAbABpAGMAaAgAAAAABgAAAB1Qcm94eSByZXF1aXJlcyBhdXRoZW50aWNhdGlvbgcA
-	AAAFUUh0dHABAwAAAHAASQBtACAAQQBiAGwAYQB1AGYAIABkAGUAcwAgAFMAUwBMAC0AUAByAG8A
-	dABvAGsAbwBsAGwAcwAgAGkAcwB0ACAAZQBpAG4AIABGAGUAaABsAGUAcgAgAGEAdQBmAGcAZQB0
-	AHIAZQB0AGUAbgAuCAAAAAAGAAAAFFNTTCBoYW5kc2hha2UgZmFpbGVkBwAAAAVRSHR0cAEDAAAA
-	MABaAHUAIAB2AGkAZQBsAGUAIABXAGUAaQB0AGUAcgBsAGUAaQB0AHUAbgBnAGUAbggAAAAABgAA
-	ABJUb28gbWFueSByZWRpcmVjdHMHAAAABVFIdHRwAQMAAAA+AFUAbgBiAGUAawBhAG4AbgB0AGUA
-	cwAgAFAAcgBvAHQAbwBrAG8AbABsACAAYQBuAGcAZQBnAGUAYgBlAG4IAAAAAAYAAAAaVW5rbm93
-	biBwcm90b2NvbCBzcGVjaWZpZWQHAAAABVFIdHRwAQMAAAA8AEEAdQB0AGgAZQBuAHQAaQBmAGkA
-	egBpAGUAcgB1AG4AZwAgAGUAcgBmAG8AcgBkAGUAcgBsAGkAYwBoCAAAAAAGAAAAF0F1dGhlbnRp
-	Y2F0aW9uIHJlcXVpcmVkBwAAABFRSHR0cFNvY2tldEVuZ2luZQEDAAAARgBLAGUAaQBuAGUAIABI
-	AFQAVABQAC0AQQBuAHQAdwBvAHIAdAAgAHYAbwBtACAAUAByAG8AeAB5AC0AUwBlAHIAdgBlAHII
-	AAAAAAYAAAAoRGlkIG5vdCByZWNlaXZlIEhUVFAgcmVzcG9uc2UgZnJvbSBwcm94eQcAAAARUUh0
-	dHBTb2NrZXRFbmdpbmUBAwAAAGIARgBlAGgAbABlAHIAIABiAGUAaQAgAGQAZQByACAASwBvAG0A
-	bQB1AG4AaQBrAGEAdABpAG8AbgAgAG0AaQB0ACAAZABlAG0AIABQAHIAbwB4AHkALQBTAGUAcgB2
-	AGUAcggAAAAABgAAACNFcnJvciBjb21tdW5pY2F0aW5nIHdpdGggSFRUUCBwcm94eQcAAAARUUh0
-	dHBTb2NrZXRFbmdpbmUBAwAAAJIARgBlAGgAbABlAHIAIABiAGUAaQBtACAAQQB1AHMAdwBlAHIA
-	dABlAG4AIABkAGUAcgAgAEEAdQB0AGgAZQBuAHQAaQBmAGkAegBpAGUAcgB1AG4AZwBzAGEAbgBm
-	AG8AcgBkAGUAcgB1AG4AZwAgAGQAZQBzACAAUAByAG8AeAB5AC0AUwBlAHIAdgBlAHIAcwgAAAAA
-	BgAAAC9FcnJvciBwYXJzaW5nIGF1dGhlbnRpY2F0aW9uIHJlcXVlc3QgZnJvbSBwcm94eQcAAAAR
-	UUh0dHBTb2NrZXRFbmdpbmUBAwAAAGoARABlAHIAIABQAHIAbwB4AHkALQBTAGUAcgB2AGUAcgAg
-	AGgAYQB0ACAAZABpAGUAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAdgBvAHIAegBlAGkAdABpAGcA
-	IABiAGUAZQBuAGQAZQB0CAAAAAAGAAAAI1Byb3h5IGNvbm5lY3Rpb24gY2xvc2VkIHByZW1hdHVy
-	ZWx5BwAAABFRSHR0cFNvY2tldEVuZ2luZQEDAAAAdgBEAGUAcgAgAFAAcgBvAHgAeQAtAFMAZQBy
-	AHYAZQByACAAaABhAHQAIABkAGUAbgAgAEEAdQBmAGIAYQB1ACAAZQBpAG4AZQByACAAVgBlAHIA
-	YgBpAG4AZAB1AG4AZwAgAHYAZQByAHcAZQBpAGcAZQByAHQIAAAAAAYAAAAYUHJveHkgY29ubmVj
-	dGlvbiByZWZ1c2VkBwAAABFRSHR0cFNvY2tldEVuZ2luZQEDAAAAdgBEAGUAcgAgAFAAcgBvAHgA
-	eQAtAFMAZQByAHYAZQByACAAaABhAHQAIABkAGUAbgAgAEEAdQBmAGIAYQB1ACAAZQBpAG4AZQBy
-	ACAAVgBlAHIAYgBpAG4AZAB1AG4AZwAgAHYAZQByAHcAZQBpAGcAZQByAHQIAAAAAAYAAAAXUHJv
-	eHkgZGVuaWVkIGNvbm5lY3Rpb24HAAAAEVFIdHRwU29ja2V0RW5naW5lAQMAAACSAEIAZQBpACAA
-	ZABlAHIAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAbQBpAHQAIABkAGUAbQAgAFAAcgBvAHgAeQAt
-	AFMAZQByAHYAZQByACAAdwB1AHIAZABlACAAZQBpAG4AIABaAGUAaQB0AGwAaQBtAGkAdAAgAPwA
-	YgBlAHIAcwBjAGgAcgBpAHQAdABlAG4IAAAAAAYAAAAhUHJveHkgc2VydmVyIGNvbm5lY3Rpb24g
-	dGltZWQgb3V0BwAAABFRSHR0cFNvY2tldEVuZ2luZQEDAAAAVgBFAHMAIABrAG8AbgBuAHQAZQAg
-	AGsAZQBpAG4AIABQAHIAbwB4AHkALQBTAGUAcgB2AGUAcgAgAGcAZQBmAHUAbgBkAGUAbgAgAHcA
-	ZQByAGQAZQBuCAAAAAAGAAAAFlByb3h5IHNlcnZlciBub3QgZm91bmQHAAAAEVFIdHRwU29ja2V0
-	RW5naW5lAQMAAABYAEUAcwAgAGsAbwBuAG4AdABlACAAawBlAGkAbgBlACAAVAByAGEAbgBzAGEA
-	awB0AGkAbwBuACAAZwBlAHMAdABhAHIAdABlAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABtDb3Vs
-	ZCBub3Qgc3RhcnQgdHJhbnNhY3Rpb24HAAAADFFJQmFzZURyaXZlcgEDAAAAaABEAGkAZQAgAEQA
-	YQB0AGUAbgBiAGEAbgBrAHYAZQByAGIAaQBuAGQAdQBuAGcAIABrAG8AbgBuAHQAZQAgAG4AaQBj
-	AGgAdAAgAGcAZQD2AGYAZgBuAGUAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAFkVycm9yIG9wZW5p
-	bmcgZGF0YWJhc2UHAAAADFFJQmFzZURyaXZlcgEDAAAAqABEAGkAZQAgAFQAcgBhAG4AcwBhAGsA
-	dABpAG8AbgAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZAB1AHIAYwBoAGcAZQBmAPwAaABy
-	AHQAIAB3AGUAcgBkAGUAbgAgACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAGMAbwBtAG0AaQB0ACcA
-	IABmAGUAaABsAGcAZQBzAGMAaABsAGEAZwBlAG4AKQgAAAAABgAAABxVbmFibGUgdG8gY29tbWl0
-	IHRyYW5zYWN0aW9uBwAAAAxRSUJhc2VEcml2ZXIBAwAAALgARABpAGUAIABUAHIAYQBuAHMAYQBr
-	AHQAaQBvAG4AIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAHIA/ABjAGsAZwDkAG4AZwBpAGcA
-	IABnAGUAbQBhAGMAaAB0ACAAdwBlAHIAZABlAG4AIAAoAE8AcABlAHIAYQB0AGkAbwBuACAAJwBy
-	AG8AbABsAGIAYQBjAGsAJwAgAGYAZQBoAGwAZwBlAHMAYwBoAGwAYQBnAGUAbgApCAAAAAAGAAAA
-	HlVuYWJsZSB0byByb2xsYmFjayB0cmFuc2FjdGlvbgcAAAAMUUlCYXNlRHJpdmVyAQMAAABaAEQA
-	aQBlACAAQQBsAGwAbwBrAGEAdABpAG8AbgAgAGQAZQBzACAAQgBlAGYAZQBoAGwAcwAgAGkAcwB0
-	ACAAZgBlAGgAbABnAGUAcwBjAGgAbABhAGcAZQBuCAAAAAAGAAAAHENvdWxkIG5vdCBhbGxvY2F0
-	ZSBzdGF0ZW1lbnQHAAAADFFJQmFzZVJlc3VsdAEDAAAAfgBFAHMAIABrAG8AbgBuAHQAZQAgAGsA
-	ZQBpAG4AZQAgAEIAZQBzAGMAaAByAGUAaQBiAHUAbgBnACAAZABlAHMAIABFAGkAbgBnAGEAYgBl
-	AGIAZQBmAGUAaABsAHMAIABlAHIAaABhAGwAdABlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAACJD
-	b3VsZCBub3QgZGVzY3JpYmUgaW5wdXQgc3RhdGVtZW50BwAAAAxRSUJhc2VSZXN1bHQBAwAAAHAA
-	RQBzACAAawBvAG4AbgB0AGUAIABrAGUAaQBuAGUAIABCAGUAcwBjAGgAcgBlAGkAYgB1AG4AZwAg
-	AGQAZQBzACAAQgBlAGYAZQBoAGwAcwAgAGUAcgBoAGEAbAB0AGUAbgAgAHcAZQByAGQAZQBuCAAA
-	AAAGAAAAHENvdWxkIG5vdCBkZXNjcmliZSBzdGF0ZW1lbnQHAAAADFFJQmFzZVJlc3VsdAEDAAAA
-	YABEAGEAcwAgAG4A5ABjAGgAcwB0AGUAIABFAGwAZQBtAGUAbgB0ACAAawBvAG4AbgB0AGUAIABu
-	AGkAYwBoAHQAIABhAGIAZwBlAGgAbwBsAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABlDb3VsZCBu
-	b3QgZmV0Y2ggbmV4dCBpdGVtBwAAAAxRSUJhc2VSZXN1bHQBAwAAAEoARABhAHMAIABGAGUAbABk
-	ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAZgB1AG4AZABlAG4AIAB3AGUAcgBkAGUA
-	bggAAAAABgAAABRDb3VsZCBub3QgZmluZCBhcnJheQcAAAAMUUlCYXNlUmVzdWx0AQMAAABiAEQA
-	aQBlACAARABhAHQAZQBuACAAZABlAHMAIABGAGUAbABkAGUAcwAgAGsAbwBuAG4AdABlAG4AIABu
-	AGkAYwBoAHQAIABnAGUAbABlAHMAZQBuACAAdwBlAHIAZABlAG4IAAAAAAYAAAAYQ291bGQgbm90
-	IGdldCBhcnJheSBkYXRhBwAAAAxRSUJhc2VSZXN1bHQBAwAAAIIARABpAGUAIABlAHIAZgBvAHIA
-	ZABlAHIAbABpAGMAaABlAG4AIABJAG4AZgBvAHIAbQBhAHQAaQBvAG4AZQBuACAAegB1AHIAIABB
-	AGIAZgByAGEAZwBlACAAcwBpAG4AZAAgAG4AaQBjAGgAdAAgAHYAZQByAGYA/ABnAGIAYQByCAAA
-	AAAGAAAAGENvdWxkIG5vdCBnZXQgcXVlcnkgaW5mbwcAAAAMUUlCYXNlUmVzdWx0AQMAAABaAEUA
-	cwAgAGkAcwB0ACAAawBlAGkAbgBlACAASQBuAGYAbwByAG0AYQB0AGkAbwBuACAAegB1AG0AIABC
-	AGUAZgBlAGgAbAAgAHYAZQByAGYA/ABnAGIAYQByCAAAAAAGAAAAHENvdWxkIG5vdCBnZXQgc3Rh
-	dGVtZW50IGluZm8HAAAADFFJQmFzZVJlc3VsdAEDAAAAWABEAGUAcgAgAEIAZQBmAGUAaABsACAA
-	awBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABpAG4AaQB0AGkAYQBsAGkAcwBpAGUAcgB0ACAAdwBl
-	AHIAZABlAG4IAAAAAAYAAAAbQ291bGQgbm90IHByZXBhcmUgc3RhdGVtZW50BwAAAAxRSUJhc2VS
-	ZXN1bHQBAwAAAFgARQBzACAAawBvAG4AbgB0AGUAIABrAGUAaQBuAGUAIABUAHIAYQBuAHMAYQBr
-	AHQAaQBvAG4AIABnAGUAcwB0AGEAcgB0AGUAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAG0NvdWxk
-	IG5vdCBzdGFydCB0cmFuc2FjdGlvbgcAAAAMUUlCYXNlUmVzdWx0AQMAAABUAEQAZQByACAAQgBl
-	AGYAZQBoAGwAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcAZQBzAGMAaABsAG8AcwBzAGUA
-	bgAgAHcAZQByAGQAZQBuCAAAAAAGAAAAGVVuYWJsZSB0byBjbG9zZSBzdGF0ZW1lbnQHAAAADFFJ
-	QmFzZVJlc3VsdAEDAAAAqABEAGkAZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAgAGsAbwBuAG4A
-	dABlACAAbgBpAGMAaAB0ACAAZAB1AHIAYwBoAGcAZQBmAPwAaAByAHQAIAB3AGUAcgBkAGUAbgAg
-	ACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAGMAbwBtAG0AaQB0ACcAIABmAGUAaABsAGcAZQBzAGMA
-	aABsAGEAZwBlAG4AKQgAAAAABgAAABxVbmFibGUgdG8gY29tbWl0IHRyYW5zYWN0aW9uBwAAAAxR
-	SUJhc2VSZXN1bHQBAwAAAEQARQBzACAAawBvAG4AbgB0AGUAIABrAGUAaQBuACAAQgBMAE8AQgAg
-	AGUAcgB6AGUAdQBnAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABVVbmFibGUgdG8gY3JlYXRlIEJM
-	T0IHAAAADFFJQmFzZVJlc3VsdAEDAAAAUgBEAGUAcgAgAEIAZQBmAGUAaABsACAAawBvAG4AbgB0
-	AGUAIABuAGkAYwBoAHQAIABhAHUAcwBnAGUAZgD8AGgAcgB0ACAAdwBlAHIAZABlAG4IAAAAAAYA
-	AAAXVW5hYmxlIHRvIGV4ZWN1dGUgcXVlcnkHAAAADFFJQmFzZVJlc3VsdAEDAAAASgBEAGUAcgAg
-	AEIATABPAEIAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcAZQD2AGYAZgBuAGUAdAAgAHcA
-	ZQByAGQAZQBuCAAAAAAGAAAAE1VuYWJsZSB0byBvcGVuIEJMT0IHAAAADFFJQmFzZVJlc3VsdAED
-	AAAASABEAGUAcgAgAEIATABPAEIAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcAZQBsAGUA
-	cwBlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAABNVbmFibGUgdG8gcmVhZCBCTE9CBwAAAAxRSUJh
-	c2VSZXN1bHQBAwAAAFAARABlAHIAIABCAEwATwBCACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQA
-	IABnAGUAcwBjAGgAcgBpAGUAYgBlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAABRVbmFibGUgdG8g
-	d3JpdGUgQkxPQgcAAAAMUUlCYXNlUmVzdWx0AQMAAABiAEsAZQBpAG4AIABmAHIAZQBpAGUAcgAg
-	AFMAcABlAGkAYwBoAGUAcgBwAGwAYQB0AHoAIABhAHUAZgAgAGQAZQBtACAARwBlAHIA5AB0ACAA
-	dgBvAHIAaABhAG4AZABlAG4IAAAAAAYAAAAXTm8gc3BhY2UgbGVmdCBvbiBkZXZpY2UHAAAACVFJ
-	T0RldmljZQEDAAAAdgBEAGkAZQAgAEQAYQB0AGUAaQAgAG8AZABlAHIAIABkAGEAcwAgAFYAZQBy
-	AHoAZQBpAGMAaABuAGkAcwAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZwBlAGYAdQBuAGQA
-	ZQBuACAAdwBlAHIAZABlAG4IAAAAAAYAAAAZTm8gc3VjaCBmaWxlIG9yIGRpcmVjdG9yeQcAAAAJ
-	UUlPRGV2aWNlAQMAAAAkAFoAdQBnAHIAaQBmAGYAIAB2AGUAcgB3AGUAaQBnAGUAcgB0CAAAAAAG
-	AAAAEVBlcm1pc3Npb24gZGVuaWVkBwAAAAlRSU9EZXZpY2UBAwAAADIAWgB1ACAAdgBpAGUAbABl
-	ACAARABhAHQAZQBpAGUAbgAgAGcAZQD2AGYAZgBuAGUAdAgAAAAABgAAABNUb28gbWFueSBvcGVu
-	IGZpbGVzBwAAAAlRSU9EZXZpY2UBAwAAACQAVQBuAGIAZQBrAGEAbgBuAHQAZQByACAARgBlAGgA
-	bABlAHIIAAAAAAYAAAANVW5rbm93biBlcnJvcgcAAAAJUUlPRGV2aWNlAQMAAABSAGQAaQBlACAA
-	egB1ACAA9gBmAGYAbgBlAG4AZABlACAARABhAHQAZQBpACAAaQBzAHQAIABlAGkAbgAgAFYAZQBy
-	AHoAZQBpAGMAaABuAGkAcwgAAAAABgAAABtmaWxlIHRvIG9wZW4gaXMgYSBkaXJlY3RvcnkHAAAA
-	CVFJT0RldmljZQEDAAAAKABEAGEAdABlAGkAIABuAGkAYwBoAHQAIABnAGUAZgB1AG4AZABlAG4I
-	AAAAAAYAAAAORmlsZSBub3QgZm91bmQHAAAADFFJbWFnZVJlYWRlcgEDAAAAIABVAG4AZwD8AGwA
-	dABpAGcAZQBzACAARwBlAHIA5AB0CAAAAAAGAAAADkludmFsaWQgZGV2aWNlBwAAAAxRSW1hZ2VS
-	ZWFkZXIBAwAAAFQARABpAGUAIABCAGkAbABkAGQAYQB0AGUAbgAgAGsAbwBuAG4AdABlAG4AIABu
-	AGkAYwBoAHQAIABnAGUAbABlAHMAZQBuACAAdwBlAHIAZABlAG4IAAAAAAYAAAAZVW5hYmxlIHRv
-	IHJlYWQgaW1hZ2UgZGF0YQcAAAAMUUltYWdlUmVhZGVyAQMAAAAkAFUAbgBiAGUAawBhAG4AbgB0
-	AGUAcgAgAEYAZQBoAGwAZQByCAAAAAAGAAAADVVua25vd24gZXJyb3IHAAAADFFJbWFnZVJlYWRl
-	cgEDAAAAXgBEAGkAZQBzAGUAcgAgAFQAeQBwACAAdgBvAG4AIABCAGkAbABkAGQAYQB0AGUAbgAg
-	AHcAaQByAGQAIABuAGkAYwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQIAAAAAAYAAAAYVW5z
-	dXBwb3J0ZWQgaW1hZ2UgZm9ybWF0BwAAAAxRSW1hZ2VSZWFkZXIBAwAAAGwARABhAHMAIABHAGUA
-	cgDkAHQAIABrAGEAbgBuACAAbgBpAGMAaAB0ACAAegB1AG0AIABTAGMAaAByAGUAaQBiAGUAbgAg
-	AGcAZQD2AGYAZgBuAGUAdAAgAHcAZQByAGQAZQBuADoAIAAlADEIAAAAAAYAAAAiQ2Fubm90IG9w
-	ZW4gZGV2aWNlIGZvciB3cml0aW5nOiAlMQcAAAAMUUltYWdlV3JpdGVyAQMAAAAiAEsAZQBpAG4A
-	IABBAHUAcwBnAGEAYgBlAGcAZQByAOQAdAgAAAAABgAAABFEZXZpY2UgaXMgbm90IHNldAcAAAAM
-	UUltYWdlV3JpdGVyAQMAAABKAEsAYQBuAG4AIABuAGkAYwBoAHQAIABhAHUAZgAgAEEAdQBzAGcA
-	YQBiAGUAZwBlAHIA5AB0ACAAcwBjAGgAcgBlAGkAYgBlAG4IAAAAAAYAAAATRGV2aWNlIG5vdCB3
-	cml0YWJsZQcAAAAMUUltYWdlV3JpdGVyAQMAAAAiAEQAYQBzACAAQgBpAGwAZAAgAGkAcwB0ACAA
-	bABlAGUAcggAAAAABgAAAA5JbWFnZSBpcyBlbXB0eQcAAAAMUUltYWdlV3JpdGVyAQMAAAAkAFUA
-	bgBiAGUAawBhAG4AbgB0AGUAcgAgAEYAZQBoAGwAZQByCAAAAAAGAAAADVVua25vd24gZXJyb3IH
-	AAAADFFJbWFnZVdyaXRlcgEDAAAAXgBEAGkAZQBzAGUAcgAgAFQAeQBwACAAdgBvAG4AIABCAGkA
-	bABkAGQAYQB0AGUAbgAgAHcAaQByAGQAIABuAGkAYwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6
-	AHQIAAAAAAYAAAAYVW5zdXBwb3J0ZWQgaW1hZ2UgZm9ybWF0BwAAAAxRSW1hZ2VXcml0ZXIBAwAA
-	ADIARwBlAGIAZQBuACAAUwBpAGUAIABlAGkAbgBlAG4AIABXAGUAcgB0ACAAZQBpAG4AOggAAAAA
-	BgAAAA5FbnRlciBhIHZhbHVlOgcAAAAMUUlucHV0RGlhbG9nAQMAAABWANwAYgBlAHIAegDkAGgA
-	bABpAGcAZQByACAASQBuAGgAYQBsAHQAIABuAGEAYwBoACAARQBuAGQAZQAgAGQAZQBzACAARABv
-	AGsAdQBtAGUAbgB0AHMIAAAAAAYAAAAiZ2FyYmFnZSBhdCB0aGUgZW5kIG9mIHRoZSBkb2N1bWVu
-	dAcAAAAPUUpzb25QYXJzZUVycm9yAQMAAAAcAFUAbgBnAPwAbAB0AGkAZwBlACAAWgBhAGgAbAgA
-	AAAABgAAAA5pbGxlZ2FsIG51bWJlcgcAAAAPUUpzb25QYXJzZUVycm9yAQMAAAAeAFUAbgBnAPwA
-	bAB0AGkAZwBlAHIAIABXAGUAcgB0CAAAAAAGAAAADWlsbGVnYWwgdmFsdWUHAAAAD1FKc29uUGFy
-	c2VFcnJvcgEDAAAANgBVAG4AZwD8AGwAdABpAGcAZQAgAFUAVABGADgALQBaAGUAaQBjAGgAZQBu
-	AGsAZQB0AHQAZQgAAAAABgAAABNpbnZhbGlkIFVURjggc3RyaW5nBwAAAA9RSnNvblBhcnNlRXJy
-	b3IBAwAAADAAVQBuAGcA/ABsAHQAaQBnAGUAIABFAHMAYwBhAHAAZQAtAFMAZQBxAHUAZQBuAHoI
-	AAAAAAYAAAAXaW52YWxpZCBlc2NhcGUgc2VxdWVuY2UHAAAAD1FKc29uUGFyc2VFcnJvcgEDAAAA
-	PABVAG4AZwD8AGwAdABpAGcAZQByACAAQQBiAHMAYwBoAGwAdQDfACAAZAB1AHIAYwBoACAAWgBh
-	AGgAbAgAAAAABgAAAB1pbnZhbGlkIHRlcm1pbmF0aW9uIGJ5IG51bWJlcgcAAAAPUUpzb25QYXJz
-	ZUVycm9yAQMAAAA4AFQAcgBlAG4AbgB6AGUAaQBjAGgAZQBuACAAZgD8AHIAIABOAGEAbQBlAG4A
-	IABmAGUAaABsAHQIAAAAAAYAAAAWbWlzc2luZyBuYW1lIHNlcGFyYXRvcgcAAAAPUUpzb25QYXJz
-	ZUVycm9yAQMAAAA2AFQAcgBlAG4AbgB6AGUAaQBjAGgAZQBuACAAZgD8AHIAIABXAGUAcgB0ACAA
-	ZgBlAGgAbAB0CAAAAAAGAAAAF21pc3NpbmcgdmFsdWUgc2VwYXJhdG9yBwAAAA9RSnNvblBhcnNl
-	RXJyb3IBAwAAABYAawBlAGkAbgAgAEYAZQBoAGwAZQByCAAAAAAGAAAAEW5vIGVycm9yIG9jY3Vy
-	cmVkBwAAAA9RSnNvblBhcnNlRXJyb3IBAwAAADAATwBiAGoAZQBrAHQAIABmAGUAaABsAHQAIABu
-	AGEAYwBoACAASwBvAG0AbQBhACAIAAAAAAYAAAAfb2JqZWN0IGlzIG1pc3NpbmcgYWZ0ZXIgYSBj
-	b21tYQcAAAAPUUpzb25QYXJzZUVycm9yAQMAAABKAEQAYQBzACAARABvAGsAdQBtAGUAbgB0ACAA
-	aQBzAHQAIAB6AHUAIAB0AGkAZQBmACAAZwBlAHMAYwBoAGEAYwBoAHQAZQBsAHQIAAAAAAYAAAAa
-	dG9vIGRlZXBseSBuZXN0ZWQgZG9jdW1lbnQHAAAAD1FKc29uUGFyc2VFcnJvcgEDAAAAJAB6AHUA
-	IABnAHIAbwDfAGUAcwAgAEQAbwBrAHUAbQBlAG4AdAgAAAAABgAAABJ0b28gbGFyZ2UgZG9jdW1l
-	bnQHAAAAD1FKc29uUGFyc2VFcnJvcgEDAAAANABOAGkAYwBoAHQAIABhAGIAZwBlAHMAYwBoAGwA
-	bwBzAHMAZQBuAGUAcwAgAEYAZQBsAGQIAAAAAAYAAAASdW50ZXJtaW5hdGVkIGFycmF5BwAAAA9R
-	SnNvblBhcnNlRXJyb3IBAwAAADgATgBpAGMAaAB0ACAAYQBiAGcAZQBzAGMAaABsAG8AcwBzAGUA
-	bgBlAHMAIABPAGIAagBlAGsAdAgAAAAABgAAABN1bnRlcm1pbmF0ZWQgb2JqZWN0BwAAAA9RSnNv
-	blBhcnNlRXJyb3IBAwAAAEIATgBpAGMAaAB0ACAAYQBiAGcAZQBzAGMAaABsAG8AcwBzAGUAbgBl
-	ACAAWgBlAGkAYwBoAGUAbgBrAGUAdAB0AGUIAAAAAAYAAAATdW50ZXJtaW5hdGVkIHN0cmluZwcA
-	AAAPUUpzb25QYXJzZUVycm9yAQMAAAAOACUAMQAsACAALgAuAC4IAAAAAAYAAAAHJTEsIC4uLgcA
-	AAAQUUtleVNlcXVlbmNlRWRpdAEDAAAAPABHAGUAYgBlAG4AIABTAGkAZQAgAGUAaQBuACAAVABh
-	AHMAdABlAG4AawD8AHIAegBlAGwAIABlAGkAbggAAAAABgAAAA5QcmVzcyBzaG9ydGN1dAcAAAAQ
-	UUtleVNlcXVlbmNlRWRpdAEDAAAAVgAnACUAMQAnACAAaQBzAHQAIABrAGUAaQBuAGUAIABnAPwA
-	bAB0AGkAZwBlACAARQBMAEYALQBPAGIAagBlAGsAdABkAGEAdABlAGkAIAAoACUAMgApCAAAAAAG
-	AAAAIiclMScgaXMgYW4gaW52YWxpZCBFTEYgb2JqZWN0ICglMikHAAAACFFMaWJyYXJ5AQMAAAAu
-	ACcAJQAxACcAIABpAHMAdAAgAGsAZQBpAG4AIABRAHQALQBQAGwAdQBnAGkAbggAAAAABgAAABcn
-	JTEnIGlzIG5vdCBhIFF0IHBsdWdpbgcAAAAIUUxpYnJhcnkBAwAAAHoAJwAlADEAJwAgAGkAcwB0
-	ACAAawBlAGkAbgBlACAAZwD8AGwAdABpAGcAZQAgAGEAdQBzAGYA/ABoAHIAYgBhAHIAZQAgAEQA
-	YQB0AGUAaQAgAGQAZQBzACAAVAB5AHAAcwAgAE0AYQBjAGgALQBPACAAKAAlADIAKQgAAAAABgAA
-	ACYnJTEnIGlzIG5vdCBhIHZhbGlkIE1hY2gtTyBiaW5hcnkgKCUyKQcAAAAIUUxpYnJhcnkBAwAA
-	ADwAJwAlADEAJwAgAGkAcwB0ACAAawBlAGkAbgBlACAARQBMAEYALQBPAGIAagBlAGsAdABkAGEA
-	dABlAGkIAAAAAAYAAAAZJyUxJyBpcyBub3QgYW4gRUxGIG9iamVjdAcAAAAIUUxpYnJhcnkBAwAA
-	AEYAJwAlADEAJwAgAGkAcwB0ACAAawBlAGkAbgBlACAARQBMAEYALQBPAGIAagBlAGsAdABkAGEA
-	dABlAGkAIAAoACUAMgApCAAAAAAGAAAAHiclMScgaXMgbm90IGFuIEVMRiBvYmplY3QgKCUyKQcA
-	AAAIUUxpYnJhcnkBAwAAAF4ARABpAGUAIABCAGkAYgBsAGkAbwB0AGgAZQBrACAAJQAxACAAawBh
-	AG4AbgAgAG4AaQBjAGgAdAAgAGcAZQBsAGEAZABlAG4AIAB3AGUAcgBkAGUAbgA6ACAAJQAyCAAA
-	AAAGAAAAGkNhbm5vdCBsb2FkIGxpYnJhcnkgJTE6ICUyBwAAAAhRTGlicmFyeQEDAAAAagBEAGEA
-	cwAgAFMAeQBtAGIAbwBsACAAIgAlADEAIgAgAGsAYQBuAG4AIABpAG4AIAAlADIAIABuAGkAYwBo
-	AHQAIABhAHUAZgBnAGUAbAD2AHMAdAAgAHcAZQByAGQAZQBuADoAIAAlADMIAAAAAAYAAAAkQ2Fu
-	bm90IHJlc29sdmUgc3ltYm9sICIlMSIgaW4gJTI6ICUzBwAAAAhRTGlicmFyeQEDAAAAYABEAGkA
-	ZQAgAEIAaQBiAGwAaQBvAHQAaABlAGsAIAAlADEAIABrAGEAbgBuACAAbgBpAGMAaAB0ACAAZQBu
-	AHQAbABhAGQAZQBuACAAdwBlAHIAZABlAG4AOgAgACUAMggAAAAABgAAABxDYW5ub3QgdW5sb2Fk
-	IGxpYnJhcnkgJTE6ICUyBwAAAAhRTGlicmFyeQEDAAAAeABEAGkAZQAgAE0AZQB0AGEAZABhAHQA
-	ZQBuACAAZABlAHMAIABQAGwAdQBnAGkAbgBzACAAJwAlADEAJwAgAGsAbwBuAG4AdABlAG4AIABu
-	AGkAYwBoAHQAIABiAGUAcwB0AGkAbQBtAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAACxGYWlsZWQg
-	dG8gZXh0cmFjdCBwbHVnaW4gbWV0YSBkYXRhIGZyb20gJyUxJwcAAAAIUUxpYnJhcnkBAwAAAFYA
-	RABpAGUAIABEAGEAdABlAGkAIAAnACUAMQAnACAAaQBzAHQAIABrAGUAaQBuACAAZwD8AGwAdABp
-	AGcAZQBzACAAUQB0AC0AUABsAHUAZwBpAG4ALggAAAAABgAAACdUaGUgZmlsZSAnJTEnIGlzIG5v
-	dCBhIHZhbGlkIFF0IHBsdWdpbi4HAAAACFFMaWJyYXJ5AQMAAACUAEQAYQBzACAAUABsAHUAZwBp
-	AG4AIAAnACUAMQAnACAAdgBlAHIAdwBlAG4AZABlAHQAIABlAGkAbgBlACAAaQBuAGsAbwBtAHAA
-	YQB0AGkAYgBsAGUAIABRAHQALQBCAGkAYgBsAGkAbwB0AGgAZQBrAC4AIAAoACUAMgAuACUAMwAu
-	ACUANAApACAAWwAlADUAXQgAAAAABgAAAD1UaGUgcGx1Z2luICclMScgdXNlcyBpbmNvbXBhdGli
-	bGUgUXQgbGlicmFyeS4gKCUyLiUzLiU0KSBbJTVdBwAAAAhRTGlicmFyeQEDAAABUgBEAGEAcwAg
-	AFAAbAB1AGcAaQBuACAAJwAlADEAJwAgAHYAZQByAHcAZQBuAGQAZQB0ACAAZQBpAG4AZQAgAGkA
-	bgBrAG8AbQBwAGEAdABpAGIAbABlACAAUQB0AC0AQgBpAGIAbABpAG8AdABoAGUAawAuACAAKABJ
-	AG0AIABEAGUAYgB1AGcALQBNAG8AZAB1AHMAIABlAHIAcwB0AGUAbABsAHQAZQAgAHUAbgBkACAA
-	aQBtACAAUgBlAGwAZQBhAHMAZQAtAE0AbwBkAHUAcwAgAGUAcgBzAHQAZQBsAGwAdABlACAAQgBp
-	AGIAbABpAG8AdABoAGUAawBlAG4AIABrAPYAbgBuAGUAbgAgAG4AaQBjAGgAdAAgAHoAdQBzAGEA
-	bQBtAGUAbgAgAHYAZQByAHcAZQBuAGQAZQB0ACAAdwBlAHIAZABlAG4ALgApCAAAAAAGAAAAV1Ro
-	ZSBwbHVnaW4gJyUxJyB1c2VzIGluY29tcGF0aWJsZSBRdCBsaWJyYXJ5LiAoQ2Fubm90IG1peCBk
-	ZWJ1ZyBhbmQgcmVsZWFzZSBsaWJyYXJpZXMuKQcAAAAIUUxpYnJhcnkBAwAAAG4ARABpAGUAIABk
-	AHkAbgBhAG0AaQBzAGMAaABlACAAQgBpAGIAbABpAG8AdABoAGUAawAgAGsAbwBuAG4AdABlACAA
-	bgBpAGMAaAB0ACAAZwBlAGYAdQBuAGQAZQBuACAAdwBlAHIAZABlAG4ALggAAAAABgAAACFUaGUg
-	c2hhcmVkIGxpYnJhcnkgd2FzIG5vdCBmb3VuZC4HAAAACFFMaWJyYXJ5AQMAAAAkAFUAbgBiAGUA
-	awBhAG4AbgB0AGUAcgAgAEYAZQBoAGwAZQByCAAAAAAGAAAADVVua25vd24gZXJyb3IHAAAACFFM
-	aWJyYXJ5AQMAAAB+AEQAaQBlACAAYQBuAGcAZQBrAPwAbgBkAGkAZwB0AGUAIABTAGUAawB0AGkA
-	bwBuACAAKAAlADEAIABCAHkAdABlACkAIAD8AGIAZQByAHMAYwBoAHIAZQBpAHQAZQB0ACAAZABp
-	AGUAIABEAGEAdABlAGkAZwByAPYA3wBlAwAAAJQARABpAGUAIABhAG4AZwBlAGsA/ABuAGQAaQBn
-	AHQAZQBuACAAJQBuACAAUwBlAGsAdABpAG8AbgBlAG4AIAAoAGoAZQBkAGUAIAAlADEAIABCAHkA
-	dABlACkAIAD8AGIAZQByAHMAYwBoAHIAZQBpAHQAZQBuACAAZABpAGUAIABEAGEAdABlAGkAZwBy
-	APYA3wBlCAAAAAAGAAAAOmFubm91bmNlZCAlbiBzZWN0aW9uKHMpLCBlYWNoICUxIGJ5dGUocyks
-	IGV4Y2VlZCBmaWxlIHNpemUHAAAACFFMaWJyYXJ5AQMAAACCAEwAZQBlAHIAZQByACAALgByAG8A
-	ZABhAHQAYQAuAC0AQQBiAHMAYwBoAG4AaQB0AHQAOwAgAGQAaQBlAHMAIABzAGMAaABlAGkAbgB0
-	ACAAawBlAGkAbgBlACAAQgBpAGIAbABpAG8AdABoAGUAawAgAHoAdQAgAHMAZQBpAG4ALggAAAAA
-	BgAAAB1lbXB0eSAucm9kYXRhLiBub3QgYSBsaWJyYXJ5LgcAAAAIUUxpYnJhcnkBAwAAACAARABh
-	AHQAZQBpACAAYgBlAHMAYwBoAOQAZABpAGcAdAgAAAAABgAAAA9maWxlIGlzIGNvcnJ1cHQHAAAA
-	CFFMaWJyYXJ5AQMAAAAcAEQAYQB0AGUAaQAgAHoAdQAgAGsAbABlAGkAbggAAAAABgAAAA5maWxl
-	IHRvbyBzbWFsbAcAAAAIUUxpYnJhcnkBAwAAADIAVQBuAGcA/ABsAHQAaQBnAGUAcgAgAE0AYQBn
-	AGkAYwAtAEMAbwBkAGUAOgAgACUAMQgAAAAABgAAABBpbnZhbGlkIG1hZ2ljICUxBwAAAAhRTGli
-	cmFyeQEDAAAAhABGAGUAaABsAGUAbgBkAGUAIABEAGEAdABlAG4AIABkAGUAcgAgAFMAZQBrAHQA
-	aQBvAG4AOwAgAGQAaQBlAHMAIABzAGMAaABlAGkAbgB0ACAAawBlAGkAbgBlACAAQgBpAGIAbABp
-	AG8AdABoAGUAawAgAHoAdQAgAHMAZQBpAG4ALggAAAAABgAAACxtaXNzaW5nIHNlY3Rpb24gZGF0
-	YS4gVGhpcyBpcyBub3QgYSBsaWJyYXJ5LgcAAAAIUUxpYnJhcnkBAwAAAHoASwBlAGkAbgBlACAA
-	cABhAHMAcwBlAG4AZABlACAAQQByAGMAaABpAHQAZQBrAHQAdQByACAAaQBuACAAYQB1AHMAZgD8
-	AGgAcgBiAGEAcgBlAHIAIABEAGEAdABlAGkAIAAoAGYAYQB0ACAAYgBpAG4AYQByAHkAKQgAAAAA
-	BgAAACZubyBzdWl0YWJsZSBhcmNoaXRlY3R1cmUgaW4gZmF0IGJpbmFyeQcAAAAIUUxpYnJhcnkB
-	AwAAADYASwBlAGkAbgBlACAAZAB5AG4AYQBtAGkAcwBjAGgAZQAgAEIAaQBiAGwAaQBvAHQAaABl
-	AGsIAAAAAAYAAAAVbm90IGEgZHluYW1pYyBsaWJyYXJ5BwAAAAhRTGlicmFyeQEDAAAANABVAG4A
-	YgBlAGsAYQBuAG4AdABlACAAQwBQAFUALQBBAHIAYwBoAGkAdABlAGsAdAB1AHIIAAAAAAYAAAAU
-	b2RkIGNwdSBhcmNoaXRlY3R1cmUHAAAACFFMaWJyYXJ5AQMAAAA2AFUAbgBiAGUAawBhAG4AbgB0
-	AGUAIABCAHkAdABlAC0AUgBlAGkAaABlAG4AZgBvAGwAZwBlCAAAAAAGAAAADm9kZCBlbmRpYW5u
-	ZXNzBwAAAAhRTGlicmFyeQEDAAAAZgBEAGUAcgAgAFMAZQBrAHQAaQBvAG4AcwBuAGEAbQBlACAA
-	JQAxACAAdgBvAG4AIAAlADIAIABpAHMAdAAgAGgAaQBuAHQAZQByACAAZABlAG0AIABEAGEAdABl
-	AGkAZQBuAGQAZQgAAAAABgAAAChzZWN0aW9uIG5hbWUgJTEgb2YgJTIgYmVoaW5kIGVuZCBvZiBm
-	aWxlBwAAAAhRTGlicmFyeQEDAAAAcgBEAGUAcgAgAEIAZQBnAGkAbgBuACAAZABlAHIAIABzAGgA
-	cwB0AHIAdABhAGIALQBTAGUAawB0AGkAbwBuACAAaQBzAHQAIAB3AGEAaAByAHMAYwBoAGUAaQBu
-	AGwAaQBjAGgAIABiAGUAaQAgACUAMQgAAAAABgAAAClzaHN0cnRhYiBzZWN0aW9uIGhlYWRlciBz
-	ZWVtcyB0byBiZSBhdCAlMQcAAAAIUUxpYnJhcnkBAwAAAGQARABpAGUAIABaAGUAaQBjAGgAZQBu
-	AGsAZQB0AHQAZQBuAHQAYQBiAGUAbABsAGUAIABpAHMAdAAgAHcAYQBoAHIAcwBjAGgAZQBpAG4A
-	bABpAGMAaAAgAGIAZQBpACAAJQAxCAAAAAAGAAAAHnN0cmluZyB0YWJsZSBzZWVtcyB0byBiZSBh
-	dCAlMQcAAAAIUUxpYnJhcnkBAwAAACwAZQBfAHMAaABlAG4AdABzAGkAegBlACAAdQBuAGUAcgB3
-	AGEAcgB0AGUAdAgAAAAABgAAABZ1bmV4cGVjdGVkIGVfc2hlbnRzaXplBwAAAAhRTGlicmFyeQED
-	AAAAJgBlAF8AcwBoAHMAaQB6AGUAIAB1AG4AZQByAHcAYQByAHQAZQB0CAAAAAAGAAAAE3VuZXhw
-	ZWN0ZWQgZV9zaHNpemUHAAAACFFMaWJyYXJ5AQMAAAAmAEYAYQBsAHMAYwBoAGUAIABBAHIAYwBo
-	AGkAdABlAGsAdAB1AHIIAAAAAAYAAAASd3JvbmcgYXJjaGl0ZWN0dXJlBwAAAAhRTGlicmFyeQED
-	AAAALgBGAGEAbABzAGMAaABlACAAQwBQAFUALQBBAHIAYwBoAGkAdABlAGsAdAB1AHIIAAAAAAYA
-	AAAWd3JvbmcgY3B1IGFyY2hpdGVjdHVyZQcAAAAIUUxpYnJhcnkBAwAAABIAJgBLAG8AcABpAGUA
-	cgBlAG4IAAAAAAYAAAAFJkNvcHkHAAAACVFMaW5lRWRpdAEDAAAAEgBFAGkAbgBmACYA/ABnAGUA
-	bggAAAAABgAAAAYmUGFzdGUHAAAACVFMaW5lRWRpdAEDAAAAIgBXAGkAZQBkAGUAcgAmAGgAZQBy
-	AHMAdABlAGwAbABlAG4IAAAAAAYAAAAFJlJlZG8HAAAACVFMaW5lRWRpdAEDAAAAFgAmAFIA/ABj
-	AGsAZwDkAG4AZwBpAGcIAAAAAAYAAAAFJlVuZG8HAAAACVFMaW5lRWRpdAEDAAAAGgAmAEEAdQBz
-	AHMAYwBoAG4AZQBpAGQAZQBuCAAAAAAGAAAABEN1JnQHAAAACVFMaW5lRWRpdAEDAAAADgBMAPYA
-	cwBjAGgAZQBuCAAAAAAGAAAABkRlbGV0ZQcAAAAJUUxpbmVFZGl0AQMAAAAeAEEAbABsAGUAcwAg
-	AGEAdQBzAHcA5ABoAGwAZQBuCAAAAAAGAAAAClNlbGVjdCBBbGwHAAAACVFMaW5lRWRpdAEDAAAA
-	TAAlADEAOgAgAEQAaQBlACAAQQBkAHIAZQBzAHMAZQAgAHcAaQByAGQAIABiAGUAcgBlAGkAdABz
-	ACAAdgBlAHIAdwBlAG4AZABlAHQIAAAAAAYAAAASJTE6IEFkZHJlc3MgaW4gdXNlBwAAAAxRTG9j
-	YWxTZXJ2ZXIBAwAAACoAJQAxADoAIABGAGUAaABsAGUAcgBoAGEAZgB0AGUAcgAgAE4AYQBtAGUI
-	AAAAAAYAAAAOJTE6IE5hbWUgZXJyb3IHAAAADFFMb2NhbFNlcnZlcgEDAAAALAAlADEAOgAgAFoA
-	dQBnAHIAaQBmAGYAIAB2AGUAcgB3AGUAaQBnAGUAcgB0CAAAAAAGAAAAFSUxOiBQZXJtaXNzaW9u
-	IGRlbmllZAcAAAAMUUxvY2FsU2VydmVyAQMAAAAyACUAMQA6ACAAVQBuAGIAZQBrAGEAbgBuAHQA
-	ZQByACAARgBlAGgAbABlAHIAIAAlADIIAAAAAAYAAAAUJTE6IFVua25vd24gZXJyb3IgJTIHAAAA
-	DFFMb2NhbFNlcnZlcgEDAAAALAAlADEAOgAgAFoAdQBnAHIAaQBmAGYAIAB2AGUAcgB3AGUAaQBn
-	AGUAcgB0CAAAAAAGAAAAESUxOiBBY2Nlc3MgZGVuaWVkBwAAAAxRTG9jYWxTb2NrZXQBAwAAACoA
-	JQAxADoAIABWAGUAcgBiAGkAbgBkAHUAbgBnAHMAZgBlAGgAbABlAHIIAAAAAAYAAAAUJTE6IENv
-	bm5lY3Rpb24gZXJyb3IHAAAADFFMb2NhbFNvY2tldAEDAAAAVAAlADEAOgAgAEQAZQByACAAVgBl
-	AHIAYgBpAG4AZAB1AG4AZwBzAGEAdQBmAGIAYQB1ACAAdwB1AHIAZABlACAAdgBlAHIAdwBlAGkA
-	ZwBlAHIAdAgAAAAABgAAABYlMTogQ29ubmVjdGlvbiByZWZ1c2VkBwAAAAxRTG9jYWxTb2NrZXQB
-	AwAAADoAJQAxADoAIABEAGEAcwAgAEQAYQB0AGEAZwByAGEAbQBtACAAaQBzAHQAIAB6AHUAIABn
-	AHIAbwDfCAAAAAAGAAAAFiUxOiBEYXRhZ3JhbSB0b28gbGFyZ2UHAAAADFFMb2NhbFNvY2tldAED
-	AAAAJgAlADEAOgAgAFUAbgBnAPwAbAB0AGkAZwBlAHIAIABOAGEAbQBlCAAAAAAGAAAAECUxOiBJ
-	bnZhbGlkIG5hbWUHAAAADFFMb2NhbFNvY2tldAEDAAAAfAAlADEAOgAgAEQAaQBlAHMAZQAgAE8A
-	cABlAHIAYQB0AGkAbwBuACAAaQBzAHQAIABpAG4AIABkAGkAZQBzAGUAbQAgAFMAbwBjAGsAZQB0
-	AC0AUwB0AGEAdAB1AHMAIABuAGkAYwBoAHQAIAB6AHUAbADkAHMAcwBpAGcIAAAAAAYAAAA4JTE6
-	IE9wZXJhdGlvbiBub3QgcGVybWl0dGVkIHdoZW4gc29ja2V0IGlzIGluIHRoaXMgc3RhdGUHAAAA
-	DFFMb2NhbFNvY2tldAEDAAAAbgAlADEAOgAgAEQAaQBlACAAVgBlAHIAYgBpAG4AZAB1AG4AZwAg
-	AHcAdQByAGQAZQAgAHYAbwBuACAAZABlAHIAIABHAGUAZwBlAG4AcwBlAGkAdABlACAAZwBlAHMA
-	YwBoAGwAbwBzAHMAZQBuCAAAAAAGAAAAESUxOiBSZW1vdGUgY2xvc2VkBwAAAAxRTG9jYWxTb2Nr
-	ZXQBAwAAAEwAJQAxADoAIABGAGUAaABsAGUAcgAgAGIAZQBpAG0AIABaAHUAZwByAGkAZgBmACAA
-	YQB1AGYAIABkAGUAbgAgAFMAbwBjAGsAZQB0CAAAAAAGAAAAFyUxOiBTb2NrZXQgYWNjZXNzIGVy
-	cm9yBwAAAAxRTG9jYWxTb2NrZXQBAwAAAFYAJQAxADoAIABaAGUAaQB0APwAYgBlAHIAcwBjAGgA
-	cgBlAGkAdAB1AG4AZwAgAGIAZQBpACAAUwBvAGMAawBlAHQALQBPAHAAZQByAGEAdABpAG8AbggA
-	AAAABgAAAB4lMTogU29ja2V0IG9wZXJhdGlvbiB0aW1lZCBvdXQHAAAADFFMb2NhbFNvY2tldAED
-	AAAASgAlADEAOgAgAFMAbwBjAGsAZQB0AC0ARgBlAGgAbABlAHIAIAAoAFIAZQBzAHMAbwB1AHIA
-	YwBlAG4AcAByAG8AYgBsAGUAbQApCAAAAAAGAAAAGSUxOiBTb2NrZXQgcmVzb3VyY2UgZXJyb3IH
-	AAAADFFMb2NhbFNvY2tldAEDAAAAYgAlADEAOgAgAEQAaQBlAHMAZQAgAFMAbwBjAGsAZQB0AC0A
-	TwBwAGUAcgBhAHQAaQBvAG4AIAB3AGkAcgBkACAAbgBpAGMAaAB0ACAAdQBuAHQAZQByAHMAdAD8
-	AHQAegB0CAAAAAAGAAAAKSUxOiBUaGUgc29ja2V0IG9wZXJhdGlvbiBpcyBub3Qgc3VwcG9ydGVk
-	BwAAAAxRTG9jYWxTb2NrZXQBAwAAACwAJQAxADoAIABVAG4AYgBlAGsAYQBuAG4AdABlAHIAIABG
-	AGUAaABsAGUAcggAAAAABgAAABElMTogVW5rbm93biBlcnJvcgcAAAAMUUxvY2FsU29ja2V0AQMA
-	AAAyACUAMQA6ACAAVQBuAGIAZQBrAGEAbgBuAHQAZQByACAARgBlAGgAbABlAHIAIAAlADIIAAAA
-	AAYAAAAUJTE6IFVua25vd24gZXJyb3IgJTIHAAAADFFMb2NhbFNvY2tldAEDAAAAqgBWAGUAcgBz
-	AHUAYwBoACAAZABlAHIAIABWAGUAcgBiAGkAbgBkAHUAbgBnAHMAYQB1AGYAbgBhAGgAbQBlACAA
-	dwDkAGgAcgBlAG4AZAAgAGIAZQByAGUAaQB0AHMAIABlAGkAbgBlACAAYQBuAGQAZQByAGUAIABW
-	AGUAcgBiAGkAbgBkAHUAbgBnAHMAYQB1AGYAbgBhAGgAbQBlACAAbADkAHUAZgB0CAAAAAAGAAAA
-	MVRyeWluZyB0byBjb25uZWN0IHdoaWxlIGNvbm5lY3Rpb24gaXMgaW4gcHJvZ3Jlc3MHAAAADFFM
-	b2NhbFNvY2tldAEDAAAAWABFAHMAIABrAG8AbgBuAHQAZQAgAGsAZQBpAG4AIAAgAE0AWQBTAFEA
-	TAAtAE8AYgBqAGUAawB0ACAAZQByAHMAdABlAGwAbAB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAh
-	VW5hYmxlIHRvIGFsbG9jYXRlIGEgTVlTUUwgb2JqZWN0BwAAAAxRTVlTUUxEcml2ZXIBAwAAAFQA
-	RQBzACAAawBhAG4AbgAgAGsAZQBpAG4AZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAgAGcAZQBz
-	AHQAYQByAHQAZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbVW5hYmxlIHRvIGJlZ2luIHRyYW5z
-	YWN0aW9uBwAAAAxRTVlTUUxEcml2ZXIBAwAAAKQARABpAGUAIABUAHIAYQBuAHMAYQBrAHQAaQBv
-	AG4AIABrAGEAbgBuACAAbgBpAGMAaAB0ACAAZAB1AHIAYwBoAGcAZQBmAPwAaAByAHQAIAB3AGUA
-	cgBkAGUAbgAgACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAGMAbwBtAG0AaQB0ACcAIABmAGUAaABs
-	AGcAZQBzAGMAaABsAGEAZwBlAG4AKQgAAAAABgAAABxVbmFibGUgdG8gY29tbWl0IHRyYW5zYWN0
-	aW9uBwAAAAxRTVlTUUxEcml2ZXIBAwAAAFIARQBzACAAawBhAG4AbgAgAGsAZQBpAG4AZQAgAFYA
-	ZQByAGIAaQBuAGQAdQBuAGcAIABhAHUAZgBnAGUAYgBhAHUAdAAgAHcAZQByAGQAZQBuCAAAAAAG
-	AAAAEVVuYWJsZSB0byBjb25uZWN0BwAAAAxRTVlTUUxEcml2ZXIBAwAAAFoARABpAGUAIABEAGEA
-	dABlAG4AYgBhAG4AawAgACcAJQAxACcAIABrAGEAbgBuACAAbgBpAGMAaAB0ACAAZwBlAPYAZgBm
-	AG4AZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAcVW5hYmxlIHRvIG9wZW4gZGF0YWJhc2UgJyUx
-	JwcAAAAMUU1ZU1FMRHJpdmVyAQMAAAC0AEQAaQBlACAAVAByAGEAbgBzAGEAawB0AGkAbwBuACAA
-	awBhAG4AbgAgAG4AaQBjAGgAdAAgAHIA/ABjAGsAZwDkAG4AZwBpAGcAIABnAGUAbQBhAGMAaAB0
-	ACAAdwBlAHIAZABlAG4AIAAoAE8AcABlAHIAYQB0AGkAbwBuACAAJwByAG8AbABsAGIAYQBjAGsA
-	JwAgAGYAZQBoAGwAZwBlAHMAYwBoAGwAYQBnAGUAbgApCAAAAAAGAAAAHlVuYWJsZSB0byByb2xs
-	YmFjayB0cmFuc2FjdGlvbgcAAAAMUU1ZU1FMRHJpdmVyAQMAAABcAEQAaQBlACAAQQB1AHMAZwBh
-	AGIAZQB3AGUAcgB0AGUAIABrAG8AbgBuAHQAZQBuACAAbgBpAGMAaAB0ACAAZwBlAGIAdQBuAGQA
-	ZQBuACAAdwBlAHIAZABlAG4IAAAAAAYAAAAYVW5hYmxlIHRvIGJpbmQgb3V0dmFsdWVzBwAAAAxR
-	TVlTUUxSZXN1bHQBAwAAAEoARABlAHIAIABXAGUAcgB0ACAAawBvAG4AbgB0AGUAIABuAGkAYwBo
-	AHQAIABnAGUAYgB1AG4AZABlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAABRVbmFibGUgdG8gYmlu
-	ZCB2YWx1ZQcAAAAMUU1ZU1FMUmVzdWx0AQMAAABiAEQAaQBlACAAZgBvAGwAZwBlAG4AZABlACAA
-	QQBiAGYAcgBhAGcAZQAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIABhAHUAcwBnAGUAZgD8AGgAcgB0
-	ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAcVW5hYmxlIHRvIGV4ZWN1dGUgbmV4dCBxdWVyeQcAAAAM
-	UU1ZU1FMUmVzdWx0AQMAAABUAEQAaQBlACAAQQBiAGYAcgBhAGcAZQAgAGsAbwBuAG4AdABlACAA
-	bgBpAGMAaAB0ACAAYQB1AHMAZwBlAGYA/ABoAHIAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAF1Vu
-	YWJsZSB0byBleGVjdXRlIHF1ZXJ5BwAAAAxRTVlTUUxSZXN1bHQBAwAAAFIARABlAHIAIABCAGUA
-	ZgBlAGgAbAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQB1AHMAZwBlAGYA/ABoAHIAdAAg
-	AHcAZQByAGQAZQBuCAAAAAAGAAAAG1VuYWJsZSB0byBleGVjdXRlIHN0YXRlbWVudAcAAAAMUU1Z
-	U1FMUmVzdWx0AQMAAABMAEUAcwAgAGsAbwBuAG4AdABlAG4AIABrAGUAaQBuAGUAIABEAGEAdABl
-	AG4AIABhAGIAZwBlAGgAbwBsAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABRVbmFibGUgdG8gZmV0
-	Y2ggZGF0YQcAAAAMUU1ZU1FMUmVzdWx0AQMAAABYAEQAZQByACAAQgBlAGYAZQBoAGwAIABrAG8A
-	bgBuAHQAZQAgAG4AaQBjAGgAdAAgAGkAbgBpAHQAaQBhAGwAaQBzAGkAZQByAHQAIAB3AGUAcgBk
-	AGUAbggAAAAABgAAABtVbmFibGUgdG8gcHJlcGFyZSBzdGF0ZW1lbnQHAAAADFFNWVNRTFJlc3Vs
-	dAEDAAAAWABEAGUAcgAgAEIAZQBmAGUAaABsACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIAB6
-	AHUAcgD8AGMAawBnAGUAcwBlAHQAegB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAZVW5hYmxlIHRv
-	IHJlc2V0IHN0YXRlbWVudAcAAAAMUU1ZU1FMUmVzdWx0AQMAAABmAEQAYQBzACAAZgBvAGwAZwBl
-	AG4AZABlACAARQByAGcAZQBiAG4AaQBzACAAawBhAG4AbgAgAG4AaQBjAGgAdAAgAGcAZQBzAHAA
-	ZQBpAGMAaABlAHIAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAG1VuYWJsZSB0byBzdG9yZSBuZXh0
-	IHJlc3VsdAcAAAAMUU1ZU1FMUmVzdWx0AQMAAABYAEQAYQBzACAARQByAGcAZQBiAG4AaQBzACAA
-	awBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAcwBwAGUAaQBjAGgAZQByAHQAIAB3AGUAcgBk
-	AGUAbggAAAAABgAAABZVbmFibGUgdG8gc3RvcmUgcmVzdWx0BwAAAAxRTVlTUUxSZXN1bHQBAwAA
-	AHYARABpAGUAIABFAHIAZwBlAGIAbgBpAHMAcwBlACAAZABlAHMAIABCAGUAZgBlAGgAbABzACAA
-	awBvAG4AbgB0AGUAbgAgAG4AaQBjAGgAdAAgAGcAZQBzAHAAZQBpAGMAaABlAHIAdAAgAHcAZQBy
-	AGQAZQBuCAAAAAAGAAAAIVVuYWJsZSB0byBzdG9yZSBzdGF0ZW1lbnQgcmVzdWx0cwcAAAAMUU1Z
-	U1FMUmVzdWx0AQMAAAAWACgAVQBuAGIAZQBuAGEAbgBuAHQAKQgAAAAABgAAAAooVW50aXRsZWQp
-	BwAAAAhRTWRpQXJlYQEDAAAAEgAlADEAIAAtACAAWwAlADIAXQgAAAAABgAAAAklMSAtIFslMl0H
-	AAAADVFNZGlTdWJXaW5kb3cBAwAAABQAUwBjAGgAbAAmAGkAZQDfAGUAbggAAAAABgAAAAYmQ2xv
-	c2UHAAAADVFNZGlTdWJXaW5kb3cBAwAAABgAVgBlAHIAJgBzAGMAaABpAGUAYgBlAG4IAAAAAAYA
-	AAAFJk1vdmUHAAAADVFNZGlTdWJXaW5kb3cBAwAAACIAVwBpAGUAZABlAHIAJgBoAGUAcgBzAHQA
-	ZQBsAGwAZQBuCAAAAAAGAAAACCZSZXN0b3JlBwAAAA1RTWRpU3ViV2luZG93AQMAAAAMACYARwBy
-	APYA3wBlCAAAAAAGAAAABSZTaXplBwAAAA1RTWRpU3ViV2luZG93AQMAAAAMAC0AIABbACUAMQBd
-	CAAAAAAGAAAABi0gWyUxXQcAAAANUU1kaVN1YldpbmRvdwEDAAAAEgBTAGMAaABsAGkAZQDfAGUA
-	bggAAAAABgAAAAVDbG9zZQcAAAANUU1kaVN1YldpbmRvdwEDAAAACgBIAGkAbABmAGUIAAAAAAYA
-	AAAESGVscAcAAAANUU1kaVN1YldpbmRvdwEDAAAAFgBNAGEAJgB4AGkAbQBpAGUAcgBlAG4IAAAA
-	AAYAAAAJTWEmeGltaXplBwAAAA1RTWRpU3ViV2luZG93AQMAAAAUAE0AYQB4AGkAbQBpAGUAcgBl
-	AG4IAAAAAAYAAAAITWF4aW1pemUHAAAADVFNZGlTdWJXaW5kb3cBAwAAAAgATQBlAG4A/AgAAAAA
-	BgAAAARNZW51BwAAAA1RTWRpU3ViV2luZG93AQMAAAAWAE0AJgBpAG4AaQBtAGkAZQByAGUAbggA
-	AAAABgAAAAlNaSZuaW1pemUHAAAADVFNZGlTdWJXaW5kb3cBAwAAABQATQBpAG4AaQBtAGkAZQBy
-	AGUAbggAAAAABgAAAAhNaW5pbWl6ZQcAAAANUU1kaVN1YldpbmRvdwEDAAAAIABXAGkAZQBkAGUA
-	cgBoAGUAcgBzAHQAZQBsAGwAZQBuCAAAAAAGAAAAB1Jlc3RvcmUHAAAADVFNZGlTdWJXaW5kb3cB
-	AwAAACAAVwBpAGUAZABlAHIAaABlAHIAcwB0AGUAbABsAGUAbggAAAAABgAAAAxSZXN0b3JlIERv
-	d24HAAAADVFNZGlTdWJXaW5kb3cBAwAAABIAQQB1AGYAcgBvAGwAbABlAG4IAAAAAAYAAAAFU2hh
-	ZGUHAAAADVFNZGlTdWJXaW5kb3cBAwAAAC4ASQBtACAAJgBWAG8AcgBkAGUAcgBnAHIAdQBuAGQA
-	IABiAGwAZQBpAGIAZQBuCAAAAAAGAAAADFN0YXkgb24gJlRvcAcAAAANUU1kaVN1YldpbmRvdwED
-	AAAAFgBIAGUAcgBhAGIAcgBvAGwAbABlAG4IAAAAAAYAAAAHVW5zaGFkZQcAAAANUU1kaVN1Yldp
-	bmRvdwEDAAAAfgA8AGgAMwA+ANwAYgBlAHIAIABRAHQAPAAvAGgAMwA+ADwAcAA+AEQAaQBlAHMA
-	ZQBzACAAUAByAG8AZwByAGEAbQBtACAAdgBlAHIAdwBlAG4AZABlAHQAIABRAHQAIABWAGUAcgBz
-	AGkAbwBuACAAJQAxAC4APAAvAHAAPggAAAAABgAAADg8aDM+QWJvdXQgUXQ8L2gzPjxwPlRoaXMg
-	cHJvZ3JhbSB1c2VzIFF0IHZlcnNpb24gJTEuPC9wPgcAAAALUU1lc3NhZ2VCb3gBAwAACPYAPABw
-	AD4AUQB0ACAAaQBzACAAYQAgAEMAKwArACAAdABvAG8AbABrAGkAdAAgAGYAbwByACAAYwByAG8A
-	cwBzAC0AcABsAGEAdABmAG8AcgBtACAAYQBwAHAAbABpAGMAYQB0AGkAbwBuACAAZABlAHYAZQBs
-	AG8AcABtAGUAbgB0AC4APAAvAHAAPgA8AHAAPgBRAHQAIABwAHIAbwB2AGkAZABlAHMAIABzAGkA
-	bgBnAGwAZQAtAHMAbwB1AHIAYwBlACAAcABvAHIAdABhAGIAaQBsAGkAdAB5ACAAYQBjAHIAbwBz
-	AHMAIABhAGwAbAAgAG0AYQBqAG8AcgAgAGQAZQBzAGsAdABvAHAAIABvAHAAZQByAGEAdABpAG4A
-	ZwAgAHMAeQBzAHQAZQBtAHMALgAgAEkAdAAgAGkAcwAgAGEAbABzAG8AIABhAHYAYQBpAGwAYQBi
-	AGwAZQAgAGYAbwByACAAZQBtAGIAZQBkAGQAZQBkACAATABpAG4AdQB4ACAAYQBuAGQAIABvAHQA
-	aABlAHIAIABlAG0AYgBlAGQAZABlAGQAIABhAG4AZAAgAG0AbwBiAGkAbABlACAAbwBwAGUAcgBh
-	AHQAaQBuAGcAIABzAHkAcwB0AGUAbQBzAC4APAAvAHAAPgA8AHAAPgBRAHQAIABpAHMAIABhAHYA
-	YQBpAGwAYQBiAGwAZQAgAHUAbgBkAGUAcgAgAHQAaAByAGUAZQAgAGQAaQBmAGYAZQByAGUAbgB0
-	ACAAbABpAGMAZQBuAHMAaQBuAGcAIABvAHAAdABpAG8AbgBzACAAZABlAHMAaQBnAG4AZQBkACAA
-	dABvACAAYQBjAGMAbwBtAG0AbwBkAGEAdABlACAAdABoAGUAIABuAGUAZQBkAHMAIABvAGYAIABv
-	AHUAcgAgAHYAYQByAGkAbwB1AHMAIAB1AHMAZQByAHMALgA8AC8AcAA+ADwAcAA+AFEAdAAgAGwA
-	aQBjAGUAbgBzAGUAZAAgAHUAbgBkAGUAcgAgAG8AdQByACAAYwBvAG0AbQBlAHIAYwBpAGEAbAAg
-	AGwAaQBjAGUAbgBzAGUAIABhAGcAcgBlAGUAbQBlAG4AdAAgAGkAcwAgAGEAcABwAHIAbwBwAHIA
-	aQBhAHQAZQAgAGYAbwByACAAZABlAHYAZQBsAG8AcABtAGUAbgB0ACAAbwBmACAAcAByAG8AcABy
-	AGkAZQB0AGEAcgB5AC8AYwBvAG0AbQBlAHIAYwBpAGEAbAAgAHMAbwBmAHQAdwBhAHIAZQAgAHcA
-	aABlAHIAZQAgAHkAbwB1ACAAZABvACAAbgBvAHQAIAB3AGEAbgB0ACAAdABvACAAcwBoAGEAcgBl
-	ACAAYQBuAHkAIABzAG8AdQByAGMAZQAgAGMAbwBkAGUAIAB3AGkAdABoACAAdABoAGkAcgBkACAA
-	cABhAHIAdABpAGUAcwAgAG8AcgAgAG8AdABoAGUAcgB3AGkAcwBlACAAYwBhAG4AbgBvAHQAIABj
-	AG8AbQBwAGwAeQAgAHcAaQB0AGgAIAB0AGgAZQAgAHQAZQByAG0AcwAgAG8AZgAgAHQAaABlACAA
-	RwBOAFUAIABMAEcAUABMACAAdgBlAHIAcwBpAG8AbgAgADMALgA8AC8AcAA+ADwAcAA+AFEAdAAg
-	AGwAaQBjAGUAbgBzAGUAZAAgAHUAbgBkAGUAcgAgAHQAaABlACAARwBOAFUAIABMAEcAUABMACAA
-	dgBlAHIAcwBpAG8AbgAgADMAIABpAHMAIABhAHAAcAByAG8AcAByAGkAYQB0AGUAIABmAG8AcgAg
-	AHQAaABlACAAZABlAHYAZQBsAG8AcABtAGUAbgB0ACAAbwBmACAAUQB0ACYAbgBiAHMAcAA7AGEA
-	cABwAGwAaQBjAGEAdABpAG8AbgBzACAAcAByAG8AdgBpAGQAZQBkACAAeQBvAHUAIABjAGEAbgAg
-	AGMAbwBtAHAAbAB5ACAAdwBpAHQAaAAgAHQAaABlACAAdABlAHIAbQBzACAAYQBuAGQAIABjAG8A
-	bgBkAGkAdABpAG8AbgBzACAAbwBmACAAdABoAGUAIABHAE4AVQAgAEwARwBQAEwAIAB2AGUAcgBz
-	AGkAbwBuACAAMwAuADwALwBwAD4APABwAD4AUABsAGUAYQBzAGUAIABzAGUAZQAgADwAYQAgAGgA
-	cgBlAGYAPQAiAGgAdAB0AHAAOgAvAC8AJQAyAC8AIgA+ACUAMgA8AC8AYQA+ACAAZgBvAHIAIABh
-	AG4AIABvAHYAZQByAHYAaQBlAHcAIABvAGYAIABRAHQAIABsAGkAYwBlAG4AcwBpAG4AZwAuADwA
-	LwBwAD4APABwAD4AQwBvAHAAeQByAGkAZwBoAHQAIAAoAEMAKQAgACUAMQAgAFQAaABlACAAUQB0
-	ACAAQwBvAG0AcABhAG4AeQAgAEwAdABkACAAYQBuAGQAIABvAHQAaABlAHIAIABjAG8AbgB0AHIA
-	aQBiAHUAdABvAHIAcwAuADwALwBwAD4APABwAD4AUQB0ACAAYQBuAGQAIAB0AGgAZQAgAFEAdAAg
-	AGwAbwBnAG8AIABhAHIAZQAgAHQAcgBhAGQAZQBtAGEAcgBrAHMAIABvAGYAIABUAGgAZQAgAFEA
-	dAAgAEMAbwBtAHAAYQBuAHkAIABMAHQAZAAuADwALwBwAD4APABwAD4AUQB0ACAAaQBzACAAVABo
-	AGUAIABRAHQAIABDAG8AbQBwAGEAbgB5ACAATAB0AGQAIABwAHIAbwBkAHUAYwB0ACAAZABlAHYA
-	ZQBsAG8AcABlAGQAIABhAHMAIABhAG4AIABvAHAAZQBuACAAcwBvAHUAcgBjAGUAIABwAHIAbwBq
-	AGUAYwB0AC4AIABTAGUAZQAgADwAYQAgAGgAcgBlAGYAPQAiAGgAdAB0AHAAOgAvAC8AJQAzAC8A
-	IgA+ACUAMwA8AC8AYQA+ACAAZgBvAHIAIABtAG8AcgBlACAAaQBuAGYAbwByAG0AYQB0AGkAbwBu
-	AC4APAAvAHAAPggAAAAABgAABHs8cD5RdCBpcyBhIEMrKyB0b29sa2l0IGZvciBjcm9zcy1wbGF0
-	Zm9ybSBhcHBsaWNhdGlvbiBkZXZlbG9wbWVudC48L3A+PHA+UXQgcHJvdmlkZXMgc2luZ2xlLXNv
-	dXJjZSBwb3J0YWJpbGl0eSBhY3Jvc3MgYWxsIG1ham9yIGRlc2t0b3Agb3BlcmF0aW5nIHN5c3Rl
-	bXMuIEl0IGlzIGFsc28gYXZhaWxhYmxlIGZvciBlbWJlZGRlZCBMaW51eCBhbmQgb3RoZXIgZW1i
-	ZWRkZWQgYW5kIG1vYmlsZSBvcGVyYXRpbmcgc3lzdGVtcy48L3A+PHA+UXQgaXMgYXZhaWxhYmxl
-	IHVuZGVyIHRocmVlIGRpZmZlcmVudCBsaWNlbnNpbmcgb3B0aW9ucyBkZXNpZ25lZCB0byBhY2Nv
-	bW1vZGF0ZSB0aGUgbmVlZHMgb2Ygb3VyIHZhcmlvdXMgdXNlcnMuPC9wPjxwPlF0IGxpY2Vuc2Vk
-	IHVuZGVyIG91ciBjb21tZXJjaWFsIGxpY2Vuc2UgYWdyZWVtZW50IGlzIGFwcHJvcHJpYXRlIGZv
-	ciBkZXZlbG9wbWVudCBvZiBwcm9wcmlldGFyeS9jb21tZXJjaWFsIHNvZnR3YXJlIHdoZXJlIHlv
-	dSBkbyBub3Qgd2FudCB0byBzaGFyZSBhbnkgc291cmNlIGNvZGUgd2l0aCB0aGlyZCBwYXJ0aWVz
-	IG9yIG90aGVyd2lzZSBjYW5ub3QgY29tcGx5IHdpdGggdGhlIHRlcm1zIG9mIHRoZSBHTlUgTEdQ
-	TCB2ZXJzaW9uIDMuPC9wPjxwPlF0IGxpY2Vuc2VkIHVuZGVyIHRoZSBHTlUgTEdQTCB2ZXJzaW9u
-	IDMgaXMgYXBwcm9wcmlhdGUgZm9yIHRoZSBkZXZlbG9wbWVudCBvZiBRdCZuYnNwO2FwcGxpY2F0
-	aW9ucyBwcm92aWRlZCB5b3UgY2FuIGNvbXBseSB3aXRoIHRoZSB0ZXJtcyBhbmQgY29uZGl0aW9u
-	cyBvZiB0aGUgR05VIExHUEwgdmVyc2lvbiAzLjwvcD48cD5QbGVhc2Ugc2VlIDxhIGhyZWY9Imh0
-	dHA6Ly8lMi8iPiUyPC9hPiBmb3IgYW4gb3ZlcnZpZXcgb2YgUXQgbGljZW5zaW5nLjwvcD48cD5D
-	b3B5cmlnaHQgKEMpICUxIFRoZSBRdCBDb21wYW55IEx0ZCBhbmQgb3RoZXIgY29udHJpYnV0b3Jz
-	LjwvcD48cD5RdCBhbmQgdGhlIFF0IGxvZ28gYXJlIHRyYWRlbWFya3Mgb2YgVGhlIFF0IENvbXBh
-	bnkgTHRkLjwvcD48cD5RdCBpcyBUaGUgUXQgQ29tcGFueSBMdGQgcHJvZHVjdCBkZXZlbG9wZWQg
-	YXMgYW4gb3BlbiBzb3VyY2UgcHJvamVjdC4gU2VlIDxhIGhyZWY9Imh0dHA6Ly8lMy8iPiUzPC9h
-	PiBmb3IgbW9yZSBpbmZvcm1hdGlvbi48L3A+BwAAAAtRTWVzc2FnZUJveAEDAAAADgDcAGIAZQBy
-	ACAAUQB0CAAAAAAGAAAACEFib3V0IFF0BwAAAAtRTWVzc2FnZUJveAEDAAAAKgBEAGUAdABhAGkA
-	bABzACAAYQB1AHMAYgBsAGUAbgBkAGUAbgAuAC4ALggAAAAABgAAAA9IaWRlIERldGFpbHMuLi4H
-	AAAAC1FNZXNzYWdlQm94AQMAAAAqAEQAZQB0AGEAaQBsAHMAIABlAGkAbgBiAGwAZQBuAGQAZQBu
-	AC4ALgAuCAAAAAAGAAAAD1Nob3cgRGV0YWlscy4uLgcAAAALUU1lc3NhZ2VCb3gBAwAAAF4AQQB1
-	AGYAIABkAGkAZQBzAGUAbQAgAFAAbwByAHQAIABoAPYAcgB0ACAAYgBlAHIAZQBpAHQAcwAgAGUA
-	aQBuACAAYQBuAGQAZQByAGUAcgAgAFMAbwBjAGsAZQB0CAAAAAAGAAAANEFub3RoZXIgc29ja2V0
-	IGlzIGFscmVhZHkgbGlzdGVuaW5nIG9uIHRoZSBzYW1lIHBvcnQHAAAAE1FOYXRpdmVTb2NrZXRF
-	bmdpbmUBAwAAALQARQBzACAAdwB1AHIAZABlACAAdgBlAHIAcwB1AGMAaAB0ACwAIABlAGkAbgBl
-	AG4AIABJAFAAdgA2AC0AUwBvAGMAawBlAHQAIABhAHUAZgAgAGUAaQBuAGUAbQAgAFMAeQBzAHQA
-	ZQBtACAAbwBoAG4AZQAgAEkAUAB2ADYALQBVAG4AdABlAHIAcwB0APwAdAB6AHUAbgBnACAAegB1
-	ACAAdgBlAHIAdwBlAG4AZABlAG4IAAAAAAYAAAA9QXR0ZW1wdCB0byB1c2UgSVB2NiBzb2NrZXQg
-	b24gYSBwbGF0Zm9ybSB3aXRoIG5vIElQdjYgc3VwcG9ydAcAAAATUU5hdGl2ZVNvY2tldEVuZ2lu
-	ZQEDAAAAKgBWAGUAcgBiAGkAbgBkAHUAbgBnACAAdgBlAHIAdwBlAGkAZwBlAHIAdAgAAAAABgAA
-	ABJDb25uZWN0aW9uIHJlZnVzZWQHAAAAE1FOYXRpdmVTb2NrZXRFbmdpbmUBAwAAAFIAVgBlAHIA
-	YgBpAG4AZAB1AG4AZwAgAGQAdQByAGMAaAAgAEcAZQBnAGUAbgBzAGUAaQB0AGUAIAB6AHUAcgD8
-	AGMAawBnAGUAcwBlAHQAegB0CAAAAAAGAAAAGENvbm5lY3Rpb24gcmVzZXQgYnkgcGVlcgcAAAAT
-	UU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAAaABEAGEAcwAgAFoAZQBpAHQAbABpAG0AaQB0ACAAZgD8
-	AHIAIABkAGkAZQAgAFYAZQByAGIAaQBuAGQAdQBuAGcAIAB3AHUAcgBkAGUAIAD8AGIAZQByAHMA
-	YwBoAHIAaQB0AHQAZQBuCAAAAAAGAAAAFENvbm5lY3Rpb24gdGltZWQgb3V0BwAAABNRTmF0aXZl
-	U29ja2V0RW5naW5lAQMAAAB8AEQAYQBzACAARABhAHQAYQBnAHIAYQBtACAAawBvAG4AbgB0AGUA
-	IABuAGkAYwBoAHQAIABnAGUAcwBlAG4AZABlAHQAIAB3AGUAcgBkAGUAbgAsACAAdwBlAGkAbAAg
-	AGUAcwAgAHoAdQAgAGcAcgBvAN8AIABpAHMAdAgAAAAABgAAAB5EYXRhZ3JhbSB3YXMgdG9vIGxh
-	cmdlIHRvIHNlbmQHAAAAE1FOYXRpdmVTb2NrZXRFbmdpbmUBAwAAAEYARABlAHIAIABIAG8AcwB0
-	ACAAawBhAG4AbgAgAG4AaQBjAGgAdAAgAGUAcgByAGUAaQBjAGgAdAAgAHcAZQByAGQAZQBuCAAA
-	AAAGAAAAEEhvc3QgdW5yZWFjaGFibGUHAAAAE1FOYXRpdmVTb2NrZXRFbmdpbmUBAwAAADgAVQBu
-	AGcA/ABsAHQAaQBnAGUAcgAgAFMAbwBjAGsAZQB0AC0ARABlAHMAawByAGkAcAB0AG8AcggAAAAA
-	BgAAABlJbnZhbGlkIHNvY2tldCBkZXNjcmlwdG9yBwAAABNRTmF0aXZlU29ja2V0RW5naW5lAQMA
-	AABaAEIAZQBpAG0AIABSAPwAYwBrAHMAZQB0AHoAZQBuACAAdwB1AHIAZABlACAAZABpAGUAIABW
-	AGUAcgBiAGkAbgBkAHUAbgBnACAAZwBlAHQAcgBlAG4AbgB0CAAAAAAGAAAAI05ldHdvcmsgZHJv
-	cHBlZCBjb25uZWN0aW9uIG9uIHJlc2V0BwAAABNRTmF0aXZlU29ja2V0RW5naW5lAQMAAAAcAE4A
-	ZQB0AHoAdwBlAHIAawBmAGUAaABsAGUAcggAAAAABgAAAA1OZXR3b3JrIGVycm9yBwAAABNRTmF0
-	aXZlU29ja2V0RW5naW5lAQMAAABmAEQAYQBzACAAWgBlAGkAdABsAGkAbQBpAHQAIABmAPwAcgAg
-	AGQAaQBlACAATwBwAGUAcgBhAHQAaQBvAG4AIAB3AHUAcgBkAGUAIAD8AGIAZQByAHMAYwBoAHIA
-	aQB0AHQAZQBuCAAAAAAGAAAAG05ldHdvcmsgb3BlcmF0aW9uIHRpbWVkIG91dAcAAAATUU5hdGl2
-	ZVNvY2tldEVuZ2luZQEDAAAAQgBEAGEAcwAgAE4AZQB0AHoAdwBlAHIAawAgAGkAcwB0ACAAbgBp
-	AGMAaAB0ACAAZQByAHIAZQBpAGMAaABiAGEAcggAAAAABgAAABNOZXR3b3JrIHVucmVhY2hhYmxl
-	BwAAABNRTmF0aXZlU29ja2V0RW5naW5lAQMAAABoAE8AcABlAHIAYQB0AGkAbwBuACAAawBhAG4A
-	bgAgAG4AdQByACAAYQB1AGYAIABlAGkAbgBlAG4AIABTAG8AYwBrAGUAdAAgAGEAbgBnAGUAdwBh
-	AG4AZAB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAXT3BlcmF0aW9uIG9uIG5vbi1zb2NrZXQHAAAA
-	E1FOYXRpdmVTb2NrZXRFbmdpbmUBAwAAADQASwBlAGkAbgBlACAAUgBlAHMAcwBvAHUAcgBjAGUA
-	bgAgAHYAZQByAGYA/ABnAGIAYQByCAAAAAAGAAAAEE91dCBvZiByZXNvdXJjZXMHAAAAE1FOYXRp
-	dmVTb2NrZXRFbmdpbmUBAwAAACQAWgB1AGcAcgBpAGYAZgAgAHYAZQByAHcAZQBpAGcAZQByAHQI
-	AAAAAAYAAAARUGVybWlzc2lvbiBkZW5pZWQHAAAAE1FOYXRpdmVTb2NrZXRFbmdpbmUBAwAAAEgA
-	RABhAHMAIABQAHIAbwB0AG8AawBvAGwAbAAgAHcAaQByAGQAIABuAGkAYwBoAHQAIAB1AG4AdABl
-	AHIAcwB0APwAdAB6AHQIAAAAAAYAAAAbUHJvdG9jb2wgdHlwZSBub3Qgc3VwcG9ydGVkBwAAABNR
-	TmF0aXZlU29ja2V0RW5naW5lAQMAAAAsAFYAbwByAPwAYgBlAHIAZwBlAGgAZQBuAGQAZQByACAA
-	RgBlAGgAbABlAHIIAAAAAAYAAAAPVGVtcG9yYXJ5IGVycm9yBwAAABNRTmF0aXZlU29ja2V0RW5n
-	aW5lAQMAAAA+AEQAaQBlACAAQQBkAHIAZQBzAHMAZQAgAGkAcwB0ACAAbgBpAGMAaAB0ACAAdgBl
-	AHIAZgD8AGcAYgBhAHIIAAAAAAYAAAAcVGhlIGFkZHJlc3MgaXMgbm90IGF2YWlsYWJsZQcAAAAT
-	UU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAAMgBEAGkAZQAgAEEAZAByAGUAcwBzAGUAIABpAHMAdAAg
-	AGcAZQBzAGMAaAD8AHQAegB0CAAAAAAGAAAAGFRoZSBhZGRyZXNzIGlzIHByb3RlY3RlZAcAAAAT
-	UU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAAXABEAGkAZQAgAGEAbgBnAGUAZwBlAGIAZQBuAGUAIABB
-	AGQAcgBlAHMAcwBlACAAaQBzAHQAIABiAGUAcgBlAGkAdABzACAAaQBuACAARwBlAGIAcgBhAHUA
-	YwBoCAAAAAAGAAAAI1RoZSBib3VuZCBhZGRyZXNzIGlzIGFscmVhZHkgaW4gdXNlBwAAABNRTmF0
-	aXZlU29ja2V0RW5naW5lAQMAAAB8AEQAaQBlACAATwBwAGUAcgBhAHQAaQBvAG4AIABrAGEAbgBu
-	ACAAbQBpAHQAIABkAGUAbQAgAFAAcgBvAHgAeQAtAFQAeQBwACAAbgBpAGMAaAB0ACAAZAB1AHIA
-	YwBoAGcAZQBmAPwAaAByAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAACxUaGUgcHJveHkgdHlwZSBp
-	cyBpbnZhbGlkIGZvciB0aGlzIG9wZXJhdGlvbgcAAAATUU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAA
-	aABEAGUAcgAgAGUAbgB0AGYAZQByAG4AdABlACAAUgBlAGMAaABuAGUAcgAgAGgAYQB0ACAAZABp
-	AGUAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAZwBlAHMAYwBoAGwAbwBzAHMAZQBuCAAAAAAGAAAA
-	JVRoZSByZW1vdGUgaG9zdCBjbG9zZWQgdGhlIGNvbm5lY3Rpb24HAAAAE1FOYXRpdmVTb2NrZXRF
-	bmdpbmUBAwAAAGwARABlAHIAIABCAHIAbwBhAGQAYwBhAHMAdAAtAFMAbwBjAGsAZQB0ACAAawBv
-	AG4AbgB0AGUAIABuAGkAYwBoAHQAIABpAG4AaQB0AGkAYQBsAGkAcwBpAGUAcgB0ACAAdwBlAHIA
-	ZABlAG4IAAAAAAYAAAAlVW5hYmxlIHRvIGluaXRpYWxpemUgYnJvYWRjYXN0IHNvY2tldAcAAAAT
-	UU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAAfABEAGUAcgAgAG4AaQBjAGgAdABiAGwAbwBjAGsAaQBl
-	AHIAZQBuAGQAZQAgAFMAbwBjAGsAZQB0ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABpAG4A
-	aQB0AGkAYQBsAGkAcwBpAGUAcgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAoVW5hYmxlIHRvIGlu
-	aXRpYWxpemUgbm9uLWJsb2NraW5nIHNvY2tldAcAAAATUU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAA
-	VgBEAGkAZQAgAE4AYQBjAGgAcgBpAGMAaAB0ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABl
-	AG0AcABmAGEAbgBnAGUAbgAgAHcAZQByAGQAZQBuCAAAAAAGAAAAG1VuYWJsZSB0byByZWNlaXZl
-	IGEgbWVzc2FnZQcAAAATUU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAAVABEAGkAZQAgAE4AYQBjAGgA
-	cgBpAGMAaAB0ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAcwBlAG4AZABlAHQAIAB3
-	AGUAcgBkAGUAbggAAAAABgAAABhVbmFibGUgdG8gc2VuZCBhIG1lc3NhZ2UHAAAAE1FOYXRpdmVT
-	b2NrZXRFbmdpbmUBAwAAAGIARABlAHIAIABTAGMAaAByAGUAaQBiAHYAbwByAGcAYQBuAGcAIABr
-	AG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGEAdQBzAGcAZQBmAPwAaAByAHQAIAB3AGUAcgBkAGUA
-	bggAAAAABgAAAA9VbmFibGUgdG8gd3JpdGUHAAAAE1FOYXRpdmVTb2NrZXRFbmdpbmUBAwAAACQA
-	VQBuAGIAZQBrAGEAbgBuAHQAZQByACAARgBlAGgAbABlAHIIAAAAAAYAAAANVW5rbm93biBlcnJv
-	cgcAAAATUU5hdGl2ZVNvY2tldEVuZ2luZQEDAAAARABTAG8AYwBrAGUAdAAtAE8AcABlAHIAYQB0
-	AGkAbwBuACAAbgBpAGMAaAB0ACAAdQBuAHQAZQByAHMAdAD8AHQAegB0CAAAAAAGAAAAHFVuc3Vw
-	cG9ydGVkIHNvY2tldCBvcGVyYXRpb24HAAAAE1FOYXRpdmVTb2NrZXRFbmdpbmUBAwAAAD4AJQAx
-	ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUA9gBmAGYAbgBlAHQAIAB3AGUAcgBkAGUA
-	bggAAAAABgAAABBFcnJvciBvcGVuaW5nICUxBwAAABpRTmV0d29ya0FjY2Vzc0NhY2hlQmFja2Vu
-	ZAEDAAAAJABVAG4AZwD8AGwAdABpAGcAZQByACAAVQBSAEkAOgAgACUAMQgAAAAABgAAAA9JbnZh
-	bGlkIFVSSTogJTEHAAAAGVFOZXR3b3JrQWNjZXNzRGF0YUJhY2tlbmQBAwAAAGYARABlAHIAIABI
-	AG8AcwB0ACAAaABhAHQAIABkAGkAZQAgAFYAZQByAGIAaQBuAGQAdQBuAGcAIAB6AHUAIAAlADEA
-	IAB2AG8AcgB6AGUAaQB0AGkAZwAgAGIAZQBlAG4AZABlAHQIAAAAAAYAAAAzUmVtb3RlIGhvc3Qg
-	Y2xvc2VkIHRoZSBjb25uZWN0aW9uIHByZW1hdHVyZWx5IG9uICUxBwAAAB5RTmV0d29ya0FjY2Vz
-	c0RlYnVnUGlwZUJhY2tlbmQBAwAAADAAUwBvAGMAawBlAHQALQBGAGUAaABsAGUAcgAgAGIAZQBp
-	ACAAJQAxADoAIAAlADIIAAAAAAYAAAAWU29ja2V0IGVycm9yIG9uICUxOiAlMgcAAAAeUU5ldHdv
-	cmtBY2Nlc3NEZWJ1Z1BpcGVCYWNrZW5kAQMAAAA+AEYAZQBoAGwAZQByACAAYgBlAGkAbQAgAFMA
-	YwBoAHIAZQBpAGIAZQBuACAAegB1ACAAJQAxADoAIAAlADIIAAAAAAYAAAAdV3JpdGUgZXJyb3Ig
-	d3JpdGluZyB0byAlMTogJTIHAAAAHlFOZXR3b3JrQWNjZXNzRGVidWdQaXBlQmFja2VuZAEDAAAA
-	iAAlADEAIABrAGEAbgBuACAAbgBpAGMAaAB0ACAAZwBlAPYAZgBmAG4AZQB0ACAAdwBlAHIAZABl
-	AG4AOgAgAEQAZQByACAAUABmAGEAZAAgAHMAcABlAHoAaQBmAGkAegBpAGUAcgB0ACAAZQBpAG4A
-	IABWAGUAcgB6AGUAaQBjAGgAbgBpAHMIAAAAAAYAAAAjQ2Fubm90IG9wZW4gJTE6IFBhdGggaXMg
-	YSBkaXJlY3RvcnkHAAAAGVFOZXR3b3JrQWNjZXNzRmlsZUJhY2tlbmQBAwAAAEYAJQAxACAAawBv
-	AG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUA9gBmAGYAbgBlAHQAIAB3AGUAcgBkAGUAbgA6ACAA
-	JQAyCAAAAAAGAAAAFEVycm9yIG9wZW5pbmcgJTE6ICUyBwAAABlRTmV0d29ya0FjY2Vzc0ZpbGVC
-	YWNrZW5kAQMAAABmAEIAZQBpAG0AIABMAGUAcwBlAG4AIAB2AG8AbgAgAGQAZQByACAARABhAHQA
-	ZQBpACAAJQAxACAAdAByAGEAdAAgAGUAaQBuACAARgBlAGgAbABlAHIAIABhAHUAZgA6ACAAJQAy
-	CAAAAAAGAAAAHlJlYWQgZXJyb3IgcmVhZGluZyBmcm9tICUxOiAlMgcAAAAZUU5ldHdvcmtBY2Nl
-	c3NGaWxlQmFja2VuZAEDAAAAZgBBAG4AZgBvAHIAZABlAHIAdQBuAGcAIAB6AHUAbQAgANYAZgBm
-	AG4AZQBuACAAZQBpAG4AZQByACAARABhAHQAZQBpACAA/ABiAGUAcgAgAE4AZQB0AHoAdwBlAHIA
-	awAgACUAMQgAAAAABgAAACVSZXF1ZXN0IGZvciBvcGVuaW5nIG5vbi1sb2NhbCBmaWxlICUxBwAA
-	ABlRTmV0d29ya0FjY2Vzc0ZpbGVCYWNrZW5kAQMAAABMAEYAZQBoAGwAZQByACAAYgBlAGkAbQAg
-	AFMAYwBoAHIAZQBpAGIAZQBuACAAegB1AHIAIABEAGEAdABlAGkAIAAlADEAOgAgACUAMggAAAAA
-	BgAAAB1Xcml0ZSBlcnJvciB3cml0aW5nIHRvICUxOiAlMgcAAAAZUU5ldHdvcmtBY2Nlc3NGaWxl
-	QmFja2VuZAEDAAAAggAlADEAIABrAGEAbgBuACAAbgBpAGMAaAB0ACAAZwBlAPYAZgBmAG4AZQB0
-	ACAAdwBlAHIAZABlAG4AOgAgAEUAcwAgAGgAYQBuAGQAZQBsAHQAIABzAGkAYwBoACAAdQBtACAA
-	ZQBpAG4AIABWAGUAcgB6AGUAaQBjAGgAbgBpAHMIAAAAAAYAAAAeQ2Fubm90IG9wZW4gJTE6IGlz
-	IGEgZGlyZWN0b3J5BwAAABhRTmV0d29ya0FjY2Vzc0Z0cEJhY2tlbmQBAwAAAGIAQgBlAGkAbQAg
-	AEgAZQByAHUAbgB0AGUAcgBsAGEAZABlAG4AIAB2AG8AbgAgACUAMQAgAHQAcgBhAHQAIABlAGkA
-	bgAgAEYAZQBoAGwAZQByACAAYQB1AGYAOgAgACUAMggAAAAABgAAAB5FcnJvciB3aGlsZSBkb3du
-	bG9hZGluZyAlMTogJTIHAAAAGFFOZXR3b3JrQWNjZXNzRnRwQmFja2VuZAEDAAAAWgBCAGUAaQBt
-	ACAASABvAGMAaABsAGEAZABlAG4AIAB2AG8AbgAgACUAMQAgAHQAcgBhAHQAIABlAGkAbgAgAEYA
-	ZQBoAGwAZQByACAAYQB1AGYAOgAgACUAMggAAAAABgAAABxFcnJvciB3aGlsZSB1cGxvYWRpbmcg
-	JTE6ICUyBwAAABhRTmV0d29ya0FjY2Vzc0Z0cEJhY2tlbmQBAwAAAKYARABpAGUAIABBAG4AbQBl
-	AGwAZAB1AG4AZwAgAGIAZQBpACAAJQAxACAAaQBzAHQAIABmAGUAaABsAGcAZQBzAGMAaABsAGEA
-	ZwBlAG4AOgAgAEUAcwAgAGkAcwB0ACAAZQBpAG4AZQAgAEEAdQB0AGgAZQBuAHQAaQBmAGkAegBp
-	AGUAcgB1AG4AZwAgAGUAcgBmAG8AcgBkAGUAcgBsAGkAYwBoCAAAAAAGAAAAMExvZ2dpbmcgaW4g
-	dG8gJTEgZmFpbGVkOiBhdXRoZW50aWNhdGlvbiByZXF1aXJlZAcAAAAYUU5ldHdvcmtBY2Nlc3NG
-	dHBCYWNrZW5kAQMAAABsAEUAcwAgAGsAbwBuAG4AdABlACAAawBlAGkAbgAgAGcAZQBlAGkAZwBu
-	AGUAdABlAHIAIABQAHIAbwB4AHkALQBTAGUAcgB2AGUAcgAgAGcAZQBmAHUAbgBkAGUAbgAgAHcA
-	ZQByAGQAZQBuCAAAAAAGAAAAF05vIHN1aXRhYmxlIHByb3h5IGZvdW5kBwAAABhRTmV0d29ya0Fj
-	Y2Vzc0Z0cEJhY2tlbmQBAwAAAGIARABlAHIAIABaAHUAZwByAGkAZgBmACAAYQB1AGYAIABkAGEA
-	cwAgAE4AZQB0AHoAdwBlAHIAawAgAGkAcwB0ACAAbgBpAGMAaAB0ACAAZwBlAHMAdABhAHQAdABl
-	AHQALggAAAAABgAAABtOZXR3b3JrIGFjY2VzcyBpcyBkaXNhYmxlZC4HAAAAFVFOZXR3b3JrQWNj
-	ZXNzTWFuYWdlcgEDAAAARABIAGkAbgB0AGUAcgBnAHIAdQBuAGQAYQBiAGYAcgBhAGcAZQAgAG4A
-	aQBjAGgAdAAgAHoAdQBsAOQAcwBzAGkAZwAuCAAAAAAGAAAAH0JhY2tncm91bmQgcmVxdWVzdCBu
-	b3QgYWxsb3dlZC4HAAAADVFOZXR3b3JrUmVwbHkBAwAAAKAAQgBlAGkAIABkAGUAcgAgANwAYgBl
-	AHIAdAByAGEAZwB1AG4AZwAgAHYAbwBuACAAJQAxACAAdAByAGEAdAAgAGUAaQBuACAARgBlAGgA
-	bABlAHIAIABhAHUAZgAgAC0AIABEAGkAZQAgAEEAbgB0AHcAbwByAHQAIABkAGUAcwAgAFMAZQBy
-	AHYAZQByAHMAIABpAHMAdAA6ACAAJQAyCAAAAAAGAAAAKkVycm9yIHRyYW5zZmVycmluZyAlMSAt
-	IHNlcnZlciByZXBsaWVkOiAlMgcAAAANUU5ldHdvcmtSZXBseQEDAAAAPABGAGUAaABsAGUAcgAg
-	AGIAZQBpACAATgBlAHQAegB3AGUAcgBrAHYAZQByAGIAaQBuAGQAdQBuAGcALggAAAAABgAAABZO
-	ZXR3b3JrIHNlc3Npb24gZXJyb3IuBwAAAA1RTmV0d29ya1JlcGx5AQMAAABAAEQAYQBzACAAUABy
-	AG8AdABvAGsAbwBsAGwAIAAiACUAMQAiACAAaQBzAHQAIAB1AG4AYgBlAGsAYQBuAG4AdAgAAAAA
-	BgAAABhQcm90b2NvbCAiJTEiIGlzIHVua25vd24HAAAADVFOZXR3b3JrUmVwbHkBAwAAAFYARABh
-	AHMAIABOAGUAdAB6AHcAZQByAGsAIABpAHMAdAAgAHYAbwByAPwAYgBlAHIAZwBlAGgAZQBuAGQA
-	IABhAHUAcwBnAGUAZgBhAGwAbABlAG4ALggAAAAABgAAABpUZW1wb3JhcnkgbmV0d29yayBmYWls
-	dXJlLgcAAAANUU5ldHdvcmtSZXBseQEDAAAAQgBGAGUAaABsAGUAcgAgAGIAZQBpAG0AIABTAHQA
-	YQByAHQAZQBuACAAZABlAHMAIABCAGEAYwBrAGUAbgBkAHMALggAAAAABgAAABRiYWNrZW5kIHN0
-	YXJ0IGVycm9yLgcAAAANUU5ldHdvcmtSZXBseQEDAAAAbABFAHMAIABrAG8AbgBuAHQAZQAgAGsA
-	ZQBpAG4AIABnAGUAZQBpAGcAbgBlAHQAZQByACAAUAByAG8AeAB5AC0AUwBlAHIAdgBlAHIAIABn
-	AGUAZgB1AG4AZABlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAABdObyBzdWl0YWJsZSBwcm94eSBm
-	b3VuZAcAAAAVUU5ldHdvcmtSZXBseUh0dHBJbXBsAQMAAAAqAE8AcABlAHIAYQB0AGkAbwBuACAA
-	YQBiAGcAZQBiAHIAbwBjAGgAZQBuCAAAAAAGAAAAEk9wZXJhdGlvbiBjYW5jZWxlZAcAAAAVUU5l
-	dHdvcmtSZXBseUh0dHBJbXBsAQMAAAAqAE8AcABlAHIAYQB0AGkAbwBuACAAYQBiAGcAZQBiAHIA
-	bwBjAGgAZQBuCAAAAAAGAAAAEk9wZXJhdGlvbiBjYW5jZWxlZAcAAAARUU5ldHdvcmtSZXBseUlt
-	cGwBAwAAADAAVQBuAGcA/ABsAHQAaQBnAGUAIABLAG8AbgBmAGkAZwB1AHIAYQB0AGkAbwBuAC4I
-	AAAAAAYAAAAWSW52YWxpZCBjb25maWd1cmF0aW9uLgcAAAAPUU5ldHdvcmtTZXNzaW9uAQMAAAB0
-	AEQAYQBzACAAUgBvAGEAbQBpAG4AZwAgAHcAdQByAGQAZQAgAGEAYgBnAGUAYgByAG8AYwBoAGUA
-	bgAgAG8AZABlAHIAIABpAHMAdAAgAGgAaQBlAHIAIABuAGkAYwBoAHQAIABtAPYAZwBsAGkAYwBo
-	AC4IAAAAAAYAAAAnUm9hbWluZyB3YXMgYWJvcnRlZCBvciBpcyBub3QgcG9zc2libGUuBwAAABpR
-	TmV0d29ya1Nlc3Npb25Qcml2YXRlSW1wbAEDAAAAegBEAGkAZQAgAGEAbgBnAGUAZgBvAHIAZABl
-	AHIAdABlACAATwBwAGUAcgBhAHQAaQBvAG4AIAB3AGkAcgBkACAAdgBvAG0AIABTAHkAcwB0AGUA
-	bQAgAG4AaQBjAGgAdAAgAHUAbgB0AGUAcgBzAHQA/AB0AHoAdAAuCAAAAAAGAAAAN1RoZSByZXF1
-	ZXN0ZWQgb3BlcmF0aW9uIGlzIG5vdCBzdXBwb3J0ZWQgYnkgdGhlIHN5c3RlbS4HAAAAGlFOZXR3
-	b3JrU2Vzc2lvblByaXZhdGVJbXBsAQMAAACOAEQAaQBlACAAVgBlAHIAYgBpAG4AZAB1AG4AZwAg
-	AHcAdQByAGQAZQAgAHYAbwBtACAAQgBlAG4AdQB0AHoAZQByACAAbwBkAGUAcgAgAHYAbwBtACAA
-	QgBlAHQAcgBpAGUAYgBzAHMAeQBzAHQAZQBtACAAdQBuAHQAZQByAGIAcgBvAGMAaABlAG4ALggA
-	AAAABgAAAC5UaGUgc2Vzc2lvbiB3YXMgYWJvcnRlZCBieSB0aGUgdXNlciBvciBzeXN0ZW0uBwAA
-	ABpRTmV0d29ya1Nlc3Npb25Qcml2YXRlSW1wbAEDAAAAcgBEAGkAZQAgAGEAbgBnAGUAZwBlAGIA
-	ZQBuAGUAIABLAG8AbgBmAGkAZwB1AHIAYQB0AGkAbwBuACAAawBhAG4AbgAgAG4AaQBjAGgAdAAg
-	AHYAZQByAHcAZQBuAGQAZQB0ACAAdwBlAHIAZABlAG4ALggAAAAABgAAACtUaGUgc3BlY2lmaWVk
-	IGNvbmZpZ3VyYXRpb24gY2Fubm90IGJlIHVzZWQuBwAAABpRTmV0d29ya1Nlc3Npb25Qcml2YXRl
-	SW1wbAEDAAAAVABVAG4AYgBlAGsAYQBuAG4AdABlAHIAIABGAGUAaABsAGUAcgAgAGIAZQBpACAA
-	TgBlAHQAegB3AGUAcgBrAHYAZQByAGIAaQBuAGQAdQBuAGcALggAAAAABgAAABZVbmtub3duIHNl
-	c3Npb24gZXJyb3IuBwAAABpRTmV0d29ya1Nlc3Npb25Qcml2YXRlSW1wbAEDAAAAWABFAHMAIABr
-	AG8AbgBuAHQAZQAgAGsAZQBpAG4AZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAgAGcAZQBzAHQA
-	YQByAHQAZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbVW5hYmxlIHRvIGJlZ2luIHRyYW5zYWN0
-	aW9uBwAAAApRT0NJRHJpdmVyAQMAAACoAEQAaQBlACAAVAByAGEAbgBzAGEAawB0AGkAbwBuACAA
-	awBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABkAHUAcgBjAGgAZwBlAGYA/ABoAHIAdAAgAHcAZQBy
-	AGQAZQBuACAAKABPAHAAZQByAGEAdABpAG8AbgAgACcAYwBvAG0AbQBpAHQAJwAgAGYAZQBoAGwA
-	ZwBlAHMAYwBoAGwAYQBnAGUAbgApCAAAAAAGAAAAHFVuYWJsZSB0byBjb21taXQgdHJhbnNhY3Rp
-	b24HAAAAClFPQ0lEcml2ZXIBAwAAADwASQBuAGkAdABpAGEAbABpAHMAaQBlAHIAdQBuAGcAIABm
-	AGUAaABsAGcAZQBzAGMAaABsAGEAZwBlAG4IAAAAAAYAAAAUVW5hYmxlIHRvIGluaXRpYWxpemUH
-	AAAAClFPQ0lEcml2ZXIBAwAAADgATABvAGcAbwBuAC0AVgBvAHIAZwBhAG4AZwAgAGYAZQBoAGwA
-	ZwBlAHMAYwBoAGwAYQBnAGUAbggAAAAABgAAAA9VbmFibGUgdG8gbG9nb24HAAAAClFPQ0lEcml2
-	ZXIBAwAAALgARABpAGUAIABUAHIAYQBuAHMAYQBrAHQAaQBvAG4AIABrAG8AbgBuAHQAZQAgAG4A
-	aQBjAGgAdAAgAHIA/ABjAGsAZwDkAG4AZwBpAGcAIABnAGUAbQBhAGMAaAB0ACAAdwBlAHIAZABl
-	AG4AIAAoAE8AcABlAHIAYQB0AGkAbwBuACAAJwByAG8AbABsAGIAYQBjAGsAJwAgAGYAZQBoAGwA
-	ZwBlAHMAYwBoAGwAYQBnAGUAbgApCAAAAAAGAAAAHlVuYWJsZSB0byByb2xsYmFjayB0cmFuc2Fj
-	dGlvbgcAAAAKUU9DSURyaXZlcgEDAAAAWgBEAGkAZQAgAEEAbABsAG8AawBhAHQAaQBvAG4AIABk
-	AGUAcwAgAEIAZQBmAGUAaABsAHMAIABpAHMAdAAgAGYAZQBoAGwAZwBlAHMAYwBoAGwAYQBnAGUA
-	bggAAAAABgAAABlVbmFibGUgdG8gYWxsb2Mgc3RhdGVtZW50BwAAAApRT0NJUmVzdWx0AQMAAACU
-	AEQAaQBlACAAUwBwAGEAbAB0AGUAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGYA/AByACAA
-	ZABlAG4AIABTAHQAYQBwAGUAbAB2AGUAcgBhAHIAYgBlAGkAdAB1AG4AZwBzAC0AQgBlAGYAZQBo
-	AGwAIABnAGUAYgB1AG4AZABlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAACdVbmFibGUgdG8gYmlu
-	ZCBjb2x1bW4gZm9yIGJhdGNoIGV4ZWN1dGUHAAAAClFPQ0lSZXN1bHQBAwAAAEoARABlAHIAIABX
-	AGUAcgB0ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAYgB1AG4AZABlAG4AIAB3AGUA
-	cgBkAGUAbggAAAAABgAAABRVbmFibGUgdG8gYmluZCB2YWx1ZQcAAAAKUU9DSVJlc3VsdAEDAAAA
-	egBEAGUAcgAgAFMAdABhAHAAZQBsAHYAZQByAGEAcgBiAGUAaQB0AHUAbgBnAHMALQBCAGUAZgBl
-	AGgAbAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQB1AHMAZwBlAGYA/ABoAHIAdAAgAHcA
-	ZQByAGQAZQBuCAAAAAAGAAAAIVVuYWJsZSB0byBleGVjdXRlIGJhdGNoIHN0YXRlbWVudAcAAAAK
-	UU9DSVJlc3VsdAEDAAAAUgBEAGUAcgAgAEIAZQBmAGUAaABsACAAawBvAG4AbgB0AGUAIABuAGkA
-	YwBoAHQAIABhAHUAcwBnAGUAZgD8AGgAcgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbVW5hYmxl
-	IHRvIGV4ZWN1dGUgc3RhdGVtZW50BwAAAApRT0NJUmVzdWx0AQMAAABYAEQAZQByACAAQQBuAHcA
-	ZQBpAHMAdQBuAGcAcwB0AHkAcAAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIABiAGUAcwB0AGkAbQBt
-	AHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABxVbmFibGUgdG8gZ2V0IHN0YXRlbWVudCB0eXBlBwAA
-	AApRT0NJUmVzdWx0AQMAAABKAEsAYQBuAG4AIABuAGkAYwBoAHQAIAB6AHUAbQAgAG4A5ABjAGgA
-	cwB0AGUAbgAgAEUAbABlAG0AZQBuAHQAIABnAGUAaABlAG4IAAAAAAYAAAATVW5hYmxlIHRvIGdv
-	dG8gbmV4dAcAAAAKUU9DSVJlc3VsdAEDAAAAWABEAGUAcgAgAEIAZQBmAGUAaABsACAAawBvAG4A
-	bgB0AGUAIABuAGkAYwBoAHQAIABpAG4AaQB0AGkAYQBsAGkAcwBpAGUAcgB0ACAAdwBlAHIAZABl
-	AG4IAAAAAAYAAAAbVW5hYmxlIHRvIHByZXBhcmUgc3RhdGVtZW50BwAAAApRT0NJUmVzdWx0AQMA
-	AACoAEQAaQBlACAAVAByAGEAbgBzAGEAawB0AGkAbwBuACAAawBvAG4AbgB0AGUAIABuAGkAYwBo
-	AHQAIABkAHUAcgBjAGgAZwBlAGYA/ABoAHIAdAAgAHcAZQByAGQAZQBuACAAKABPAHAAZQByAGEA
-	dABpAG8AbgAgACcAYwBvAG0AbQBpAHQAJwAgAGYAZQBoAGwAZwBlAHMAYwBoAGwAYQBnAGUAbgAp
-	CAAAAAAGAAAAHFVuYWJsZSB0byBjb21taXQgdHJhbnNhY3Rpb24HAAAAC1FPREJDRHJpdmVyAQMA
-	AABSAEUAcwAgAGsAYQBuAG4AIABrAGUAaQBuAGUAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAYQB1
-	AGYAZwBlAGIAYQB1AHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABFVbmFibGUgdG8gY29ubmVjdAcA
-	AAALUU9EQkNEcml2ZXIBAwAAAOoARQBzACAAawBhAG4AbgAgAGsAZQBpAG4AZQAgAFYAZQByAGIA
-	aQBuAGQAdQBuAGcAIABhAHUAZgBnAGUAYgBhAHUAdAAgAHcAZQByAGQAZQBuACAAdwBlAGkAbAAg
-	AGQAZQByACAAVAByAGUAaQBiAGUAcgAgAGQAaQBlACAAYgBlAG4A9gB0AGkAZwB0AGUAIABGAHUA
-	bgBrAHQAaQBvAG4AYQBsAGkAdADkAHQAIABuAGkAYwBoAHQAIAB2AG8AbABsAHMAdADkAG4AZABp
-	AGcAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQIAAAAAAYAAABFVW5hYmxlIHRvIGNvbm5lY3QgLSBE
-	cml2ZXIgZG9lc24ndCBzdXBwb3J0IGFsbCBmdW5jdGlvbmFsaXR5IHJlcXVpcmVkBwAAAAtRT0RC
-	Q0RyaXZlcgEDAAAAWAAnAGEAdQB0AG8AYwBvAG0AbQBpAHQAJwAgAGsAbwBuAG4AdABlACAAbgBp
-	AGMAaAB0ACAAZABlAGEAawB0AGkAdgBpAGUAcgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAcVW5h
-	YmxlIHRvIGRpc2FibGUgYXV0b2NvbW1pdAcAAAALUU9EQkNEcml2ZXIBAwAAAFQAJwBhAHUAdABv
-	AGMAbwBtAG0AaQB0ACcAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGEAawB0AGkAdgBpAGUA
-	cgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbVW5hYmxlIHRvIGVuYWJsZSBhdXRvY29tbWl0BwAA
-	AAtRT0RCQ0RyaXZlcgEDAAAAuABEAGkAZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAgAGsAbwBu
-	AG4AdABlACAAbgBpAGMAaAB0ACAAcgD8AGMAawBnAOQAbgBnAGkAZwAgAGcAZQBtAGEAYwBoAHQA
-	IAB3AGUAcgBkAGUAbgAgACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAHIAbwBsAGwAYgBhAGMAawAn
-	ACAAZgBlAGgAbABnAGUAcwBjAGgAbABhAGcAZQBuACkIAAAAAAYAAAAeVW5hYmxlIHRvIHJvbGxi
-	YWNrIHRyYW5zYWN0aW9uBwAAAAtRT0RCQ0RyaXZlcgEDAAABKABRAE8ARABCAEMAUgBlAHMAdQBs
-	AHQAOgA6AHIAZQBzAGUAdAA6ACAAJwBTAFEATABfAEMAVQBSAFMATwBSAF8AUwBUAEEAVABJAEMA
-	JwAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQBsAHMAIABBAHQAdAByAGkAYgB1AHQAIABk
-	AGUAcwAgAEIAZQBmAGUAaABsAHMAIABnAGUAcwBlAHQAegB0ACAAdwBlAHIAZABlAG4ALgAgAEIA
-	aQB0AHQAZQAgAHAAcgD8AGYAZQBuACAAUwBpAGUAIABkAGkAZQAgAEsAbwBuAGYAaQBnAHUAcgBh
-	AHQAaQBvAG4AIABJAGgAcgBlAHMAIABPAEQAQgBDAC0AVAByAGUAaQBiAGUAcgBzCAAAAAAGAAAA
-	eVFPREJDUmVzdWx0OjpyZXNldDogVW5hYmxlIHRvIHNldCAnU1FMX0NVUlNPUl9TVEFUSUMnIGFz
-	IHN0YXRlbWVudCBhdHRyaWJ1dGUuIFBsZWFzZSBjaGVjayB5b3VyIE9EQkMgZHJpdmVyIGNvbmZp
-	Z3VyYXRpb24HAAAAC1FPREJDUmVzdWx0AQMAAABSAEQAaQBlACAAVgBhAHIAaQBhAGIAbABlACAA
-	awBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAYgB1AG4AZABlAG4AIAB3AGUAcgBkAGUAbggA
-	AAAABgAAABdVbmFibGUgdG8gYmluZCB2YXJpYWJsZQcAAAALUU9EQkNSZXN1bHQBAwAAAFIARABl
-	AHIAIABCAGUAZgBlAGgAbAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQB1AHMAZwBlAGYA
-	/ABoAHIAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAG1VuYWJsZSB0byBleGVjdXRlIHN0YXRlbWVu
-	dAcAAAALUU9EQkNSZXN1bHQBAwAAAEwARQBzACAAawBvAG4AbgB0AGUAbgAgAGsAZQBpAG4AZQAg
-	AEQAYQB0AGUAbgAgAGEAYgBnAGUAaABvAGwAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAD1VuYWJs
-	ZSB0byBmZXRjaAcAAAALUU9EQkNSZXN1bHQBAwAAAGAARABlAHIAIABlAHIAcwB0AGUAIABEAGEA
-	dABlAG4AcwBhAHQAegAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQBiAGcAZQBoAG8AbAB0
-	ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAVVW5hYmxlIHRvIGZldGNoIGZpcnN0BwAAAAtRT0RCQ1Jl
-	c3VsdAEDAAAAYgBEAGUAcgAgAGwAZQB0AHoAdABlACAARABhAHQAZQBuAHMAYQB0AHoAIABrAG8A
-	bgBuAHQAZQAgAG4AaQBjAGgAdAAgAGEAYgBnAGUAaABvAGwAdAAgAHcAZQByAGQAZQBuCAAAAAAG
-	AAAAFFVuYWJsZSB0byBmZXRjaCBsYXN0BwAAAAtRT0RCQ1Jlc3VsdAEDAAAAZABEAGUAcgAgAG4A
-	5ABjAGgAcwB0AGUAIABEAGEAdABlAG4AcwBhAHQAegAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0
-	ACAAYQBiAGcAZQBoAG8AbAB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAUVW5hYmxlIHRvIGZldGNo
-	IG5leHQHAAAAC1FPREJDUmVzdWx0AQMAAABoAEQAZQByACAAdgBvAHIAaABlAHIAaQBnAGUAIABE
-	AGEAdABlAG4AcwBhAHQAegAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQBiAGcAZQBoAG8A
-	bAB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAYVW5hYmxlIHRvIGZldGNoIHByZXZpb3VzBwAAAAtR
-	T0RCQ1Jlc3VsdAEDAAAAWABEAGUAcgAgAEIAZQBmAGUAaABsACAAawBvAG4AbgB0AGUAIABuAGkA
-	YwBoAHQAIABpAG4AaQB0AGkAYQBsAGkAcwBpAGUAcgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAb
-	VW5hYmxlIHRvIHByZXBhcmUgc3RhdGVtZW50BwAAAAtRT0RCQ1Jlc3VsdAEDAAAAWABFAHMAIABr
-	AG8AbgBuAHQAZQAgAGsAZQBpAG4AZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAgAGcAZQBzAHQA
-	YQByAHQAZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbQ291bGQgbm90IGJlZ2luIHRyYW5zYWN0
-	aW9uBwAAAAtRUFNRTERyaXZlcgEDAAAAqABEAGkAZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAg
-	AGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZAB1AHIAYwBoAGcAZQBmAPwAaAByAHQAIAB3AGUA
-	cgBkAGUAbgAgACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAGMAbwBtAG0AaQB0ACcAIABmAGUAaABs
-	AGcAZQBzAGMAaABsAGEAZwBlAG4AKQgAAAAABgAAABxDb3VsZCBub3QgY29tbWl0IHRyYW5zYWN0
-	aW9uBwAAAAtRUFNRTERyaXZlcgEDAAAAuABEAGkAZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAg
-	AGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAcgD8AGMAawBnAOQAbgBnAGkAZwAgAGcAZQBtAGEA
-	YwBoAHQAIAB3AGUAcgBkAGUAbgAgACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAHIAbwBsAGwAYgBh
-	AGMAawAnACAAZgBlAGgAbABnAGUAcwBjAGgAbABhAGcAZQBuACkIAAAAAAYAAAAeQ291bGQgbm90
-	IHJvbGxiYWNrIHRyYW5zYWN0aW9uBwAAAAtRUFNRTERyaXZlcgEDAAAAUgBFAHMAIABrAGEAbgBu
-	ACAAawBlAGkAbgBlACAAVgBlAHIAYgBpAG4AZAB1AG4AZwAgAGEAdQBmAGcAZQBiAGEAdQB0ACAA
-	dwBlAHIAZABlAG4IAAAAAAYAAAARVW5hYmxlIHRvIGNvbm5lY3QHAAAAC1FQU1FMRHJpdmVyAQMA
-	AABIAEQAaQBlACAAUgBlAGcAaQBzAHQAcgBpAGUAcgB1AG4AZwAgAGkAcwB0ACAAZgBlAGgAbABn
-	AGUAcwBjAGgAbABhAGcAZQBuCAAAAAAGAAAAE1VuYWJsZSB0byBzdWJzY3JpYmUHAAAAC1FQU1FM
-	RHJpdmVyAQMAAABgAEQAaQBlACAAUgBlAGcAaQBzAHQAcgBpAGUAcgB1AG4AZwAgAGsAbwBuAG4A
-	dABlACAAbgBpAGMAaAB0ACAAYQB1AGYAZwBlAGgAbwBiAGUAbgAgAHcAZQByAGQAZQBuCAAAAAAG
-	AAAAFVVuYWJsZSB0byB1bnN1YnNjcmliZQcAAAALUVBTUUxEcml2ZXIBAwAAAEwARQBzACAAawBv
-	AG4AbgB0AGUAIABrAGUAaQBuAGUAIABBAGIAZgByAGEAZwBlACAAZQByAHoAZQB1AGcAdAAgAHcA
-	ZQByAGQAZQBuCAAAAAAGAAAAFlVuYWJsZSB0byBjcmVhdGUgcXVlcnkHAAAAC1FQU1FMUmVzdWx0
-	AQMAAABYAEQAZQByACAAQgBlAGYAZQBoAGwAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGkA
-	bgBpAHQAaQBhAGwAaQBzAGkAZQByAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABtVbmFibGUgdG8g
-	cHJlcGFyZSBzdGF0ZW1lbnQHAAAAC1FQU1FMUmVzdWx0AQMAAAAEAEMAQwgAAAAABgAAAAJDQwcA
-	AAAQUVBhZ2VTZXR1cFdpZGdldAEDAAAAFgBDAGkAYwBlAHIAbwAgACgAQwBDACkIAAAAAAYAAAAL
-	Q2ljZXJvIChDQykHAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAAACIAQgBlAG4AdQB0AHoAZQByAGQA
-	ZQBmAGkAbgBpAGUAcgB0CAAAAAAGAAAABkN1c3RvbQcAAAAQUVBhZ2VTZXR1cFdpZGdldAEDAAAA
-	BABEAEQIAAAAAAYAAAACREQHAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAAABQARABpAGQAbwB0ACAA
-	KABEAEQAKQgAAAAABgAAAApEaWRvdCAoREQpBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAQAEYA
-	bwByAG0AdQBsAGEAcggAAAAABgAAAARGb3JtBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAKAEgA
-	9gBoAGUAOggAAAAABgAAAAdIZWlnaHQ6BwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAASAFoAbwBs
-	AGwAIAAoAGkAbgApCAAAAAAGAAAAC0luY2hlcyAoaW4pBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMA
-	AAAUAFEAdQBlAHIAZgBvAHIAbQBhAHQIAAAAAAYAAAAJTGFuZHNjYXBlBwAAABBRUGFnZVNldHVw
-	V2lkZ2V0AQMAAAAMAFIA5ABuAGQAZQByCAAAAAAGAAAAB01hcmdpbnMHAAAAEFFQYWdlU2V0dXBX
-	aWRnZXQBAwAAAB4ATQBpAGwAbABpAG0AZQB0AGUAcgAgACgAbQBtACkIAAAAAAYAAAAQTWlsbGlt
-	ZXRlcnMgKG1tKQcAAAAQUVBhZ2VTZXR1cFdpZGdldAEDAAAAFgBBAHUAcwByAGkAYwBoAHQAdQBu
-	AGcIAAAAAAYAAAALT3JpZW50YXRpb24HAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAAABgAUwBlAGkA
-	dABlAG4AYQB1AGYAYgBhAHUIAAAAAAYAAAALUGFnZSBMYXlvdXQHAAAAEFFQYWdlU2V0dXBXaWRn
-	ZXQBAwAAAC4AUgBlAGkAaABlAG4AZgBvAGwAZwBlACAAZABlAHIAIABTAGUAaQB0AGUAbgA6CAAA
-	AAAGAAAAC1BhZ2Ugb3JkZXI6BwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAYAFMAZQBpAHQAZQBu
-	AGcAcgD2AN8AZQA6CAAAAAAGAAAAClBhZ2Ugc2l6ZToHAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAA
-	ACIAUwBlAGkAdABlAG4AIABwAHIAbwAgAEIAbABhAHQAdAA6CAAAAAAGAAAAEFBhZ2VzIHBlciBz
-	aGVldDoHAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAAAAwAUABhAHAAaQBlAHIIAAAAAAYAAAAFUGFw
-	ZXIHAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAAABoAUABhAHAAaQBlAHIAcQB1AGUAbABsAGUAOggA
-	AAAABgAAAA1QYXBlciBzb3VyY2U6BwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAASAFAAaQBjAGEA
-	IAAoAFADOAApCAAAAAAGAAAAClBpY2EgKFDMuCkHAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAAABYA
-	UAB1AG4AawB0AGUAIAAoAHAAdAApCAAAAAAGAAAAC1BvaW50cyAocHQpBwAAABBRUGFnZVNldHVw
-	V2lkZ2V0AQMAAAAUAEgAbwBjAGgAZgBvAHIAbQBhAHQIAAAAAAYAAAAIUG9ydHJhaXQHAAAAEFFQ
-	YWdlU2V0dXBXaWRnZXQBAwAAAAQAUAM4CAAAAAAGAAAAA1DMuAcAAAAQUVBhZ2VTZXR1cFdpZGdl
-	dAEDAAAALABVAG0AZwBlAGsAZQBoAHIAdABlAHMAIABRAHUAZQByAGYAbwByAG0AYQB0CAAAAAAG
-	AAAAEVJldmVyc2UgbGFuZHNjYXBlBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAsAFUAbQBnAGUA
-	awBlAGgAcgB0AGUAcwAgAEgAbwBjAGgAZgBvAHIAbQBhAHQIAAAAAAYAAAAQUmV2ZXJzZSBwb3J0
-	cmFpdAcAAAAQUVBhZ2VTZXR1cFdpZGdldAEDAAAADgBCAHIAZQBpAHQAZQA6CAAAAAAGAAAABldp
-	ZHRoOgcAAAAQUVBhZ2VTZXR1cFdpZGdldAEDAAAAGABVAG4AdABlAHIAZQByACAAUgBhAG4AZAgA
-	AAAABgAAAA1ib3R0b20gbWFyZ2luBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAIAFoAbwBsAGwI
-	AAAAAAYAAAACaW4HAAAAEFFQYWdlU2V0dXBXaWRnZXQBAwAAABYATABpAG4AawBlAHIAIABSAGEA
-	bgBkCAAAAAAGAAAAC2xlZnQgbWFyZ2luBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAEAG0AbQgA
-	AAAABgAAAAJtbQcAAAAQUVBhZ2VTZXR1cFdpZGdldAEDAAAABABwAHQIAAAAAAYAAAACcHQHAAAA
-	EFFQYWdlU2V0dXBXaWRnZXQBAwAAABgAUgBlAGMAaAB0AGUAcgAgAFIAYQBuAGQIAAAAAAYAAAAM
-	cmlnaHQgbWFyZ2luBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAWAE8AYgBlAHIAZQByACAAUgBh
-	AG4AZAgAAAAABgAAAAp0b3AgbWFyZ2luBwAAABBRUGFnZVNldHVwV2lkZ2V0AQMAAAAYACUAMQAg
-	AHgAIAAlADIAIABaAG8AbABsCAAAAAAGAAAACiUxIHggJTIgaW4HAAAACVFQYWdlU2l6ZQEDAAAA
-	BABBADAIAAAAAAYAAAACQTAHAAAACVFQYWdlU2l6ZQEDAAAABABBADEIAAAAAAYAAAACQTEHAAAA
-	CVFQYWdlU2l6ZQEDAAAABgBBADEAMAgAAAAABgAAAANBMTAHAAAACVFQYWdlU2l6ZQEDAAAABABB
-	ADIIAAAAAAYAAAACQTIHAAAACVFQYWdlU2l6ZQEDAAAABABBADMIAAAAAAYAAAACQTMHAAAACVFQ
-	YWdlU2l6ZQEDAAAAEABBADMAIABFAHgAdAByAGEIAAAAAAYAAAAIQTMgRXh0cmEHAAAACVFQYWdl
-	U2l6ZQEDAAAABABBADQIAAAAAAYAAAACQTQHAAAACVFQYWdlU2l6ZQEDAAAAEABBADQAIABFAHgA
-	dAByAGEIAAAAAAYAAAAIQTQgRXh0cmEHAAAACVFQYWdlU2l6ZQEDAAAADgBBADQAIABQAGwAdQBz
-	CAAAAAAGAAAAB0E0IFBsdXMHAAAACVFQYWdlU2l6ZQEDAAAAEABBADQAIABLAGwAZQBpAG4IAAAA
-	AAYAAAAIQTQgU21hbGwHAAAACVFQYWdlU2l6ZQEDAAAABABBADUIAAAAAAYAAAACQTUHAAAACVFQ
-	YWdlU2l6ZQEDAAAAEABBADUAIABFAHgAdAByAGEIAAAAAAYAAAAIQTUgRXh0cmEHAAAACVFQYWdl
-	U2l6ZQEDAAAABABBADYIAAAAAAYAAAACQTYHAAAACVFQYWdlU2l6ZQEDAAAABABBADcIAAAAAAYA
-	AAACQTcHAAAACVFQYWdlU2l6ZQEDAAAABABBADgIAAAAAAYAAAACQTgHAAAACVFQYWdlU2l6ZQED
-	AAAABABBADkIAAAAAAYAAAACQTkHAAAACVFQYWdlU2l6ZQEDAAAADABBAE4AUwBJACAAQwgAAAAA
-	BgAAAAZBTlNJIEMHAAAACVFQYWdlU2l6ZQEDAAAADABBAE4AUwBJACAARAgAAAAABgAAAAZBTlNJ
-	IEQHAAAACVFQYWdlU2l6ZQEDAAAADABBAE4AUwBJACAARQgAAAAABgAAAAZBTlNJIEUHAAAACVFQ
-	YWdlU2l6ZQEDAAAAFgBBAHIAYwBoAGkAdABlAGMAdAAgAEEIAAAAAAYAAAALQXJjaGl0ZWN0IEEH
-	AAAACVFQYWdlU2l6ZQEDAAAAFgBBAHIAYwBoAGkAdABlAGMAdAAgAEIIAAAAAAYAAAALQXJjaGl0
-	ZWN0IEIHAAAACVFQYWdlU2l6ZQEDAAAAFgBBAHIAYwBoAGkAdABlAGMAdAAgAEMIAAAAAAYAAAAL
-	QXJjaGl0ZWN0IEMHAAAACVFQYWdlU2l6ZQEDAAAAFgBBAHIAYwBoAGkAdABlAGMAdAAgAEQIAAAA
-	AAYAAAALQXJjaGl0ZWN0IEQHAAAACVFQYWdlU2l6ZQEDAAAAFgBBAHIAYwBoAGkAdABlAGMAdAAg
-	AEUIAAAAAAYAAAALQXJjaGl0ZWN0IEUHAAAACVFQYWdlU2l6ZQEDAAAABABCADAIAAAAAAYAAAAC
-	QjAHAAAACVFQYWdlU2l6ZQEDAAAABABCADEIAAAAAAYAAAACQjEHAAAACVFQYWdlU2l6ZQEDAAAA
-	BgBCADEAMAgAAAAABgAAAANCMTAHAAAACVFQYWdlU2l6ZQEDAAAABABCADIIAAAAAAYAAAACQjIH
-	AAAACVFQYWdlU2l6ZQEDAAAABABCADMIAAAAAAYAAAACQjMHAAAACVFQYWdlU2l6ZQEDAAAABABC
-	ADQIAAAAAAYAAAACQjQHAAAACVFQYWdlU2l6ZQEDAAAABABCADUIAAAAAAYAAAACQjUHAAAACVFQ
-	YWdlU2l6ZQEDAAAAEABCADUAIABFAHgAdAByAGEIAAAAAAYAAAAIQjUgRXh0cmEHAAAACVFQYWdl
-	U2l6ZQEDAAAABABCADYIAAAAAAYAAAACQjYHAAAACVFQYWdlU2l6ZQEDAAAABABCADcIAAAAAAYA
-	AAACQjcHAAAACVFQYWdlU2l6ZQEDAAAABABCADgIAAAAAAYAAAACQjgHAAAACVFQYWdlU2l6ZQED
-	AAAABABCADkIAAAAAAYAAAACQjkHAAAACVFQYWdlU2l6ZQEDAAAAIgBCAGUAbgB1AHQAegBlAHIA
-	ZABlAGYAaQBuAGkAZQByAHQIAAAAAAYAAAAGQ3VzdG9tBwAAAAlRUGFnZVNpemUBAwAAAD4AQgBl
-	AG4AdQB0AHoAZQByAGQAZQBmAGkAbgBpAGUAcgB0ACAAKAAlADEAQwBDACAAeAAgACUAMgBDAEMA
-	KQgAAAAABgAAABRDdXN0b20gKCUxQ0MgeCAlMkNDKQcAAAAJUVBhZ2VTaXplAQMAAAA+AEIAZQBu
-	AHUAdAB6AGUAcgBkAGUAZgBpAG4AaQBlAHIAdAAgACgAJQAxAEQARAAgAHgAIAAlADIARABEACkI
-	AAAAAAYAAAAUQ3VzdG9tICglMUREIHggJTJERCkHAAAACVFQYWdlU2l6ZQEDAAAASgBCAGUAbgB1
-	AHQAegBlAHIAZABlAGYAaQBuAGkAZQByAHQAIAAoACUAMQAgAFoAbwBsAGwAIAB4ACAAJQAyACAA
-	WgBvAGwAbAApCAAAAAAGAAAAFEN1c3RvbSAoJTFpbiB4ICUyaW4pBwAAAAlRUGFnZVNpemUBAwAA
-	AD4AQgBlAG4AdQB0AHoAZQByAGQAZQBmAGkAbgBpAGUAcgB0ACAAKAAlADEAbQBtACAAeAAgACUA
-	MgBtAG0AKQgAAAAABgAAABRDdXN0b20gKCUxbW0geCAlMm1tKQcAAAAJUVBhZ2VTaXplAQMAAAA+
-	AEIAZQBuAHUAdAB6AGUAcgBkAGUAZgBpAG4AaQBlAHIAdAAgACgAJQAxAHAAYwAgAHgAIAAlADIA
-	cABjACkIAAAAAAYAAAAUQ3VzdG9tICglMXBjIHggJTJwYykHAAAACVFQYWdlU2l6ZQEDAAAAPgBC
-	AGUAbgB1AHQAegBlAHIAZABlAGYAaQBuAGkAZQByAHQAIAAoACUAMQBwAHQAIAB4ACAAJQAyAHAA
-	dAApCAAAAAAGAAAAFEN1c3RvbSAoJTFwdCB4ICUycHQpBwAAAAlRUGFnZVNpemUBAwAAAB4ARABv
-	AHAAcABlAGwAcABvAHMAdABrAGEAcgB0AGUIAAAAAAYAAAAPRG91YmxlIFBvc3RjYXJkBwAAAAlR
-	UGFnZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAAQgA0CAAAAAAGAAAAC0VudmVsb3BlIEI0
-	BwAAAAlRUGFnZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAAQgA1CAAAAAAGAAAAC0VudmVs
-	b3BlIEI1BwAAAAlRUGFnZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAAQgA2CAAAAAAGAAAA
-	C0VudmVsb3BlIEI2BwAAAAlRUGFnZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAAQwAwCAAA
-	AAAGAAAAC0VudmVsb3BlIEMwBwAAAAlRUGFnZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAA
-	QwAxCAAAAAAGAAAAC0VudmVsb3BlIEMxBwAAAAlRUGFnZVNpemUBAwAAABYAVQBtAHMAYwBoAGwA
-	YQBnACAAQwAyCAAAAAAGAAAAC0VudmVsb3BlIEMyBwAAAAlRUGFnZVNpemUBAwAAABYAVQBtAHMA
-	YwBoAGwAYQBnACAAQwAzCAAAAAAGAAAAC0VudmVsb3BlIEMzBwAAAAlRUGFnZVNpemUBAwAAABYA
-	VQBtAHMAYwBoAGwAYQBnACAAQwA0CAAAAAAGAAAAC0VudmVsb3BlIEM0BwAAAAlRUGFnZVNpemUB
-	AwAAABYAVQBtAHMAYwBoAGwAYQBnACAAQwA1CAAAAAAGAAAAC0VudmVsb3BlIEM1BwAAAAlRUGFn
-	ZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAAQwA2CAAAAAAGAAAAC0VudmVsb3BlIEM2BwAA
-	AAlRUGFnZVNpemUBAwAAABgAVQBtAHMAYwBoAGwAYQBnACAAQwA2ADUIAAAAAAYAAAAMRW52ZWxv
-	cGUgQzY1BwAAAAlRUGFnZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAAQwA3CAAAAAAGAAAA
-	C0VudmVsb3BlIEM3BwAAAAlRUGFnZVNpemUBAwAAAB4AVQBtAHMAYwBoAGwAYQBnACAAQwBoAG8A
-	dQAgADMIAAAAAAYAAAAPRW52ZWxvcGUgQ2hvdSAzBwAAAAlRUGFnZVNpemUBAwAAAB4AVQBtAHMA
-	YwBoAGwAYQBnACAAQwBoAG8AdQAgADQIAAAAAAYAAAAPRW52ZWxvcGUgQ2hvdSA0BwAAAAlRUGFn
-	ZVNpemUBAwAAABYAVQBtAHMAYwBoAGwAYQBnACAARABMCAAAAAAGAAAAC0VudmVsb3BlIERMBwAA
-	AAlRUGFnZVNpemUBAwAAACQAVQBtAHMAYwBoAGwAYQBnACAARQBpAG4AbABhAGQAdQBuAGcIAAAA
-	AAYAAAAPRW52ZWxvcGUgSW52aXRlBwAAAAlRUGFnZVNpemUBAwAAACgAVQBtAHMAYwBoAGwAYQBn
-	ACAASQB0AGEAbABpAGUAbgBpAHMAYwBoCAAAAAAGAAAAEEVudmVsb3BlIEl0YWxpYW4HAAAACVFQ
-	YWdlU2l6ZQEDAAAAHgBVAG0AcwBjAGgAbABhAGcAIABLAGEAawB1ACAAMggAAAAABgAAAA9FbnZl
-	bG9wZSBLYWt1IDIHAAAACVFQYWdlU2l6ZQEDAAAAHgBVAG0AcwBjAGgAbABhAGcAIABLAGEAawB1
-	ACAAMwgAAAAABgAAAA9FbnZlbG9wZSBLYWt1IDMHAAAACVFQYWdlU2l6ZQEDAAAAIABVAG0AcwBj
-	AGgAbABhAGcAIABNAG8AbgBhAHIAYwBoCAAAAAAGAAAAEEVudmVsb3BlIE1vbmFyY2gHAAAACVFQ
-	YWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABQAFIAQwAgADEIAAAAAAYAAAAORW52ZWxv
-	cGUgUFJDIDEHAAAACVFQYWdlU2l6ZQEDAAAAHgBVAG0AcwBjAGgAbABhAGcAIABQAFIAQwAgADEA
-	MAgAAAAABgAAAA9FbnZlbG9wZSBQUkMgMTAHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgA
-	bABhAGcAIABQAFIAQwAgADIIAAAAAAYAAAAORW52ZWxvcGUgUFJDIDIHAAAACVFQYWdlU2l6ZQED
-	AAAAHABVAG0AcwBjAGgAbABhAGcAIABQAFIAQwAgADMIAAAAAAYAAAAORW52ZWxvcGUgUFJDIDMH
-	AAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABQAFIAQwAgADQIAAAAAAYAAAAO
-	RW52ZWxvcGUgUFJDIDQHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABQAFIA
-	QwAgADUIAAAAAAYAAAAORW52ZWxvcGUgUFJDIDUHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBj
-	AGgAbABhAGcAIABQAFIAQwAgADYIAAAAAAYAAAAORW52ZWxvcGUgUFJDIDYHAAAACVFQYWdlU2l6
-	ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABQAFIAQwAgADcIAAAAAAYAAAAORW52ZWxvcGUgUFJD
-	IDcHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABQAFIAQwAgADgIAAAAAAYA
-	AAAORW52ZWxvcGUgUFJDIDgHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABQ
-	AFIAQwAgADkIAAAAAAYAAAAORW52ZWxvcGUgUFJDIDkHAAAACVFQYWdlU2l6ZQEDAAAAIgBVAG0A
-	cwBjAGgAbABhAGcAIABQAGUAcgBzAG8AbgBhAGwIAAAAAAYAAAARRW52ZWxvcGUgUGVyc29uYWwH
-	AAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABVAFMAIAAxADAIAAAAAAYAAAAO
-	RW52ZWxvcGUgVVMgMTAHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABVAFMA
-	IAAxADEIAAAAAAYAAAAORW52ZWxvcGUgVVMgMTEHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBj
-	AGgAbABhAGcAIABVAFMAIAAxADIIAAAAAAYAAAAORW52ZWxvcGUgVVMgMTIHAAAACVFQYWdlU2l6
-	ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABVAFMAIAAxADQIAAAAAAYAAAAORW52ZWxvcGUgVVMg
-	MTQHAAAACVFQYWdlU2l6ZQEDAAAAGgBVAG0AcwBjAGgAbABhAGcAIABVAFMAIAA5CAAAAAAGAAAA
-	DUVudmVsb3BlIFVTIDkHAAAACVFQYWdlU2l6ZQEDAAAAHABVAG0AcwBjAGgAbABhAGcAIABZAG8A
-	dQAgADQIAAAAAAYAAAAORW52ZWxvcGUgWW91IDQHAAAACVFQYWdlU2l6ZQEDAAAAOABFAHgAZQBj
-	AHUAdABpAHYAZQAgACgANwAsADIANQAgAHgAIAAxADAALAA1ACAAWgBvAGwAbAApCAAAAAAGAAAA
-	GkV4ZWN1dGl2ZSAoNy4yNSB4IDEwLjUgaW4pBwAAAAlRUGFnZVNpemUBAwAAADIARQB4AGUAYwB1
-	AHQAaQB2AGUAIAAoADcALAA1ACAAeAAgADEAMAAgAFoAbwBsAGwAKQgAAAAABgAAABdFeGVjdXRp
-	dmUgKDcuNSB4IDEwIGluKQcAAAAJUVBhZ2VTaXplAQMAAABSAEUAbgBkAGwAbwBzAGQAcgB1AGMA
-	awBwAGEAcABpAGUAcgAgAEQAZQB1AHQAcwBjAGgAIAAoADgALAA1ACAAeAAgADEAMgAgAFoAbwBs
-	AGwAKQgAAAAABgAAAB1GYW4tZm9sZCBHZXJtYW4gKDguNSB4IDEyIGluKQcAAAAJUVBhZ2VTaXpl
-	AQMAAABeAEUAbgBkAGwAbwBzAGQAcgB1AGMAawBwAGEAcABpAGUAcgAgAEQAZQB1AHQAcwBjAGgA
-	IABMAGUAZwBhAGwAIAAoADgALAA1ACAAeAAgADEAMwAgAFoAbwBsAGwAKQgAAAAABgAAACNGYW4t
-	Zm9sZCBHZXJtYW4gTGVnYWwgKDguNSB4IDEzIGluKQcAAAAJUVBhZ2VTaXplAQMAAABOAEUAbgBk
-	AGwAbwBzAGQAcgB1AGMAawBwAGEAcABpAGUAcgAgAFUAUwAgACgAMQA0ACwAOAA3ADUAIAB4ACAA
-	MQAxACAAWgBvAGwAbAApCAAAAAAGAAAAHEZhbi1mb2xkIFVTICgxNC44NzUgeCAxMSBpbikHAAAA
-	CVFQYWdlU2l6ZQEDAAAALABGAG8AbABpAG8AIAAoADgALAAyADcAIAB4ACAAMQAzACAAWgBvAGwA
-	bAApCAAAAAAGAAAAFEZvbGlvICg4LjI3IHggMTMgaW4pBwAAAAlRUGFnZVNpemUBAwAAAAwASgBJ
-	AFMAIABCADAIAAAAAAYAAAAGSklTIEIwBwAAAAlRUGFnZVNpemUBAwAAAAwASgBJAFMAIABCADEI
-	AAAAAAYAAAAGSklTIEIxBwAAAAlRUGFnZVNpemUBAwAAAA4ASgBJAFMAIABCADEAMAgAAAAABgAA
-	AAdKSVMgQjEwBwAAAAlRUGFnZVNpemUBAwAAAAwASgBJAFMAIABCADIIAAAAAAYAAAAGSklTIEIy
-	BwAAAAlRUGFnZVNpemUBAwAAAAwASgBJAFMAIABCADMIAAAAAAYAAAAGSklTIEIzBwAAAAlRUGFn
-	ZVNpemUBAwAAAAwASgBJAFMAIABCADQIAAAAAAYAAAAGSklTIEI0BwAAAAlRUGFnZVNpemUBAwAA
-	AAwASgBJAFMAIABCADUIAAAAAAYAAAAGSklTIEI1BwAAAAlRUGFnZVNpemUBAwAAAAwASgBJAFMA
-	IABCADYIAAAAAAYAAAAGSklTIEI2BwAAAAlRUGFnZVNpemUBAwAAAAwASgBJAFMAIABCADcIAAAA
-	AAYAAAAGSklTIEI3BwAAAAlRUGFnZVNpemUBAwAAAAwASgBJAFMAIABCADgIAAAAAAYAAAAGSklT
-	IEI4BwAAAAlRUGFnZVNpemUBAwAAAAwASgBJAFMAIABCADkIAAAAAAYAAAAGSklTIEI5BwAAAAlR
-	UGFnZVNpemUBAwAAAB4ATABlAGQAZwBlAHIAIAAvACAAQQBOAFMASQAgAEIIAAAAAAYAAAAPTGVk
-	Z2VyIC8gQU5TSSBCBwAAAAlRUGFnZVNpemUBAwAAAAoATABlAGcAYQBsCAAAAAAGAAAABUxlZ2Fs
-	BwAAAAlRUGFnZVNpemUBAwAAABYATABlAGcAYQBsACAARQB4AHQAcgBhCAAAAAAGAAAAC0xlZ2Fs
-	IEV4dHJhBwAAAAlRUGFnZVNpemUBAwAAAB4ATABlAHQAdABlAHIAIAAvACAAQQBOAFMASQAgAEEI
-	AAAAAAYAAAAPTGV0dGVyIC8gQU5TSSBBBwAAAAlRUGFnZVNpemUBAwAAABgATABlAHQAdABlAHIA
-	IABFAHgAdAByAGEIAAAAAAYAAAAMTGV0dGVyIEV4dHJhBwAAAAlRUGFnZVNpemUBAwAAABYATABl
-	AHQAdABlAHIAIABQAGwAdQBzCAAAAAAGAAAAC0xldHRlciBQbHVzBwAAAAlRUGFnZVNpemUBAwAA
-	ABgATABlAHQAdABlAHIAIABLAGwAZQBpAG4IAAAAAAYAAAAMTGV0dGVyIFNtYWxsBwAAAAlRUGFn
-	ZVNpemUBAwAAAAgATgBvAHQAZQgAAAAABgAAAAROb3RlBwAAAAlRUGFnZVNpemUBAwAAAA4AUABS
-	AEMAIAAxADYASwgAAAAABgAAAAdQUkMgMTZLBwAAAAlRUGFnZVNpemUBAwAAAA4AUABSAEMAIAAz
-	ADIASwgAAAAABgAAAAdQUkMgMzJLBwAAAAlRUGFnZVNpemUBAwAAABgAUABSAEMAIAAzADIASwAg
-	AEcAcgBvAN8IAAAAAAYAAAALUFJDIDMySyBCaWcHAAAACVFQYWdlU2l6ZQEDAAAAEgBQAG8AcwB0
-	AGsAYQByAHQAZQgAAAAABgAAAAhQb3N0Y2FyZAcAAAAJUVBhZ2VTaXplAQMAAAAMAFEAdQBhAHIA
-	dABvCAAAAAAGAAAABlF1YXJ0bwcAAAAJUVBhZ2VTaXplAQMAAAASAFMAdABhAHQAZQBtAGUAbgB0
-	CAAAAAAGAAAACVN0YXRlbWVudAcAAAAJUVBhZ2VTaXplAQMAAAAOAFMAdQBwAGUAcgAgAEEIAAAA
-	AAYAAAAHU3VwZXIgQQcAAAAJUVBhZ2VTaXplAQMAAAAOAFMAdQBwAGUAcgAgAEIIAAAAAAYAAAAH
-	U3VwZXIgQgcAAAAJUVBhZ2VTaXplAQMAAAAgAFQAYQBiAGwAbwBpAGQAIAAvACAAQQBOAFMASQAg
-	AEIIAAAAAAYAAAAQVGFibG9pZCAvIEFOU0kgQgcAAAAJUVBhZ2VTaXplAQMAAAAaAFQAYQBiAGwA
-	bwBpAGQAIABFAHgAdAByAGEIAAAAAAYAAAANVGFibG9pZCBFeHRyYQcAAAAJUVBhZ2VTaXplAQMA
-	AAAKACYATgBlAGkAbggAAAAABgAAAAMmTm8HAAAADlFQbGF0Zm9ybVRoZW1lAQMAAAAGACYASgBh
-	CAAAAAAGAAAABCZZZXMHAAAADlFQbGF0Zm9ybVRoZW1lAQMAAAASAEEAYgBiAHIAZQBjAGgAZQBu
-	CAAAAAAGAAAABUFib3J0BwAAAA5RUGxhdGZvcm1UaGVtZQEDAAAAEABBAG4AdwBlAG4AZABlAG4I
-	AAAAAAYAAAAFQXBwbHkHAAAADlFQbGF0Zm9ybVRoZW1lAQMAAAASAEEAYgBiAHIAZQBjAGgAZQBu
-	CAAAAAAGAAAABkNhbmNlbAcAAAAOUVBsYXRmb3JtVGhlbWUBAwAAABIAUwBjAGgAbABpAGUA3wBl
-	AG4IAAAAAAYAAAAFQ2xvc2UHAAAADlFQbGF0Zm9ybVRoZW1lAQMAAAASAFYAZQByAHcAZQByAGYA
-	ZQBuCAAAAAAGAAAAB0Rpc2NhcmQHAAAADlFQbGF0Zm9ybVRoZW1lAQMAAAAKAEgAaQBsAGYAZQgA
-	AAAABgAAAARIZWxwBwAAAA5RUGxhdGZvcm1UaGVtZQEDAAAAFABJAGcAbgBvAHIAaQBlAHIAZQBu
-	CAAAAAAGAAAABklnbm9yZQcAAAAOUVBsYXRmb3JtVGhlbWUBAwAAABgATgAmAGUAaQBuACwAIABr
-	AGUAaQBuAGUIAAAAAAYAAAAKTiZvIHRvIEFsbAcAAAAOUVBsYXRmb3JtVGhlbWUBAwAAAAQATwBL
-	CAAAAAAGAAAAAk9LBwAAAA5RUGxhdGZvcm1UaGVtZQEDAAAADADWAGYAZgBuAGUAbggAAAAABgAA
-	AARPcGVuBwAAAA5RUGxhdGZvcm1UaGVtZQEDAAAAGABaAHUAcgD8AGMAawBzAGUAdAB6AGUAbggA
-	AAAABgAAAAVSZXNldAcAAAAOUVBsYXRmb3JtVGhlbWUBAwAAACAAVgBvAHIAZQBpAG4AcwB0AGUA
-	bABsAHUAbgBnAGUAbggAAAAABgAAABBSZXN0b3JlIERlZmF1bHRzBwAAAA5RUGxhdGZvcm1UaGVt
-	ZQEDAAAAFgBXAGkAZQBkAGUAcgBoAG8AbABlAG4IAAAAAAYAAAAFUmV0cnkHAAAADlFQbGF0Zm9y
-	bVRoZW1lAQMAAAASAFMAcABlAGkAYwBoAGUAcgBuCAAAAAAGAAAABFNhdmUHAAAADlFQbGF0Zm9y
-	bVRoZW1lAQMAAAAeAEEAbABsAGUAcwAgAHMAcABlAGkAYwBoAGUAcgBuCAAAAAAGAAAACFNhdmUg
-	QWxsBwAAAA5RUGxhdGZvcm1UaGVtZQEDAAAAEgBKAGEALAAgACYAYQBsAGwAZQgAAAAABgAAAAtZ
-	ZXMgdG8gJkFsbAcAAAAOUVBsYXRmb3JtVGhlbWUBAwAAAD4ARABhAHMAIABQAGwAdQBnAGkAbgAg
-	AHcAdQByAGQAZQAgAG4AaQBjAGgAdAAgAGcAZQBsAGEAZABlAG4ALggAAAAABgAAABpUaGUgcGx1
-	Z2luIHdhcyBub3QgbG9hZGVkLgcAAAANUVBsdWdpbkxvYWRlcgEDAAAAJABVAG4AYgBlAGsAYQBu
-	AG4AdABlAHIAIABGAGUAaABsAGUAcggAAAAABgAAAA1Vbmtub3duIGVycm9yBwAAAA1RUGx1Z2lu
-	TG9hZGVyAQMAAAB8AEQAaQBlACAARABhAHQAZQBpACAAJQAxACAAZQB4AGkAcwB0AGkAZQByAHQA
-	IABiAGUAcgBlAGkAdABzAC4ACgBTAG8AbABsACAAcwBpAGUAIAD8AGIAZQByAHMAYwBoAHIAaQBl
-	AGIAZQBuACAAdwBlAHIAZABlAG4APwgAAAAABgAAAC8lMSBhbHJlYWR5IGV4aXN0cy4KRG8geW91
-	IHdhbnQgdG8gb3ZlcndyaXRlIGl0PwcAAAAMUVByaW50RGlhbG9nAQMAAACEACUAMQAgAGkAcwB0
-	ACAAZQBpAG4AIABWAGUAcgB6AGUAaQBjAGgAbgBpAHMALgAKAEIAaQB0AHQAZQAgAHcA5ABoAGwA
-	ZQBuACAAUwBpAGUAIABlAGkAbgBlAG4AIABhAG4AZABlAHIAZQBuACAARABhAHQAZQBpAG4AYQBt
-	AGUAbgAuCAAAAAAGAAAANyUxIGlzIGEgZGlyZWN0b3J5LgpQbGVhc2UgY2hvb3NlIGEgZGlmZmVy
-	ZW50IGZpbGUgbmFtZS4HAAAADFFQcmludERpYWxvZwEDAAAAJAAmAEUAaQBuAHMAdABlAGwAbAB1
-	AG4AZwBlAG4AIAA8ADwAIAgAAAAABgAAAAsmT3B0aW9ucyA8PAcAAAAMUVByaW50RGlhbG9nAQMA
-	AAAiACYARQBpAG4AcwB0AGUAbABsAHUAbgBnAGUAbgAgAD4APggAAAAABgAAAAsmT3B0aW9ucyA+
-	PgcAAAAMUVByaW50RGlhbG9nAQMAAAAQACYARAByAHUAYwBrAGUAbggAAAAABgAAAAYmUHJpbnQH
-	AAAADFFQcmludERpYWxvZwEDAAAADgAxACAAKAAxAHgAMQApCAAAAAAGAAAABzEgKDF4MSkHAAAA
-	DFFQcmludERpYWxvZwEDAAAAEAAxADYAIAAoADQAeAA0ACkIAAAAAAYAAAAIMTYgKDR4NCkHAAAA
-	DFFQcmludERpYWxvZwEDAAAADgAyACAAKAAyAHgAMQApCAAAAAAGAAAABzIgKDJ4MSkHAAAADFFQ
-	cmludERpYWxvZwEDAAAADgA0ACAAKAAyAHgAMgApCAAAAAAGAAAABzQgKDJ4MikHAAAADFFQcmlu
-	dERpYWxvZwEDAAAADgA2ACAAKAAyAHgAMwApCAAAAAAGAAAABzYgKDJ4MykHAAAADFFQcmludERp
-	YWxvZwEDAAAADgA5ACAAKAAzAHgAMwApCAAAAAAGAAAABzkgKDN4MykHAAAADFFQcmludERpYWxv
-	ZwEDAAAAFgBBAGwAbABlACAAUwBlAGkAdABlAG4IAAAAAAYAAAAJQWxsIFBhZ2VzBwAAAAxRUHJp
-	bnREaWFsb2cBAwAAABYAQQB1AHQAbwBtAGEAdABpAHMAYwBoCAAAAAAGAAAACUF1dG9tYXRpYwcA
-	AAAMUVByaW50RGlhbG9nAQMAAABUAFYAbwBuACAAdQBuAHQAZQBuACAAbgBhAGMAaAAgAG8AYgBl
-	AG4ALAAgAHYAbwBuACAAbABpAG4AawBzACAAbgBhAGMAaAAgAHIAZQBjAGgAdABzCAAAAAAGAAAA
-	HEJvdHRvbSB0byBUb3AsIExlZnQgdG8gUmlnaHQHAAAADFFQcmludERpYWxvZwEDAAAAVABWAG8A
-	bgAgAHUAbgB0AGUAbgAgAG4AYQBjAGgAIABvAGIAZQBuACwAIAB2AG8AbgAgAHIAZQBjAGgAdABz
-	ACAAbgBhAGMAaAAgAGwAaQBuAGsAcwgAAAAABgAAABxCb3R0b20gdG8gVG9wLCBSaWdodCB0byBM
-	ZWZ0BwAAAAxRUHJpbnREaWFsb2cBAwAAABoARwBlAHIAYQBkAGUAIABTAGUAaQB0AGUAbggAAAAA
-	BgAAAApFdmVuIFBhZ2VzBwAAAAxRUHJpbnREaWFsb2cBAwAAAJoARABpAGUAIABEAGEAdABlAGkA
-	IAAlADEAIABpAHMAdAAgAHMAYwBoAHIAZQBpAGIAZwBlAHMAYwBoAPwAdAB6AHQALgAKAEIAaQB0
-	AHQAZQAgAHcA5ABoAGwAZQBuACAAUwBpAGUAIABlAGkAbgBlAG4AIABhAG4AZABlAHIAZQBuACAA
-	RABhAHQAZQBpAG4AYQBtAGUAbgAuCAAAAAAGAAAAPUZpbGUgJTEgaXMgbm90IHdyaXRhYmxlLgpQ
-	bGVhc2UgY2hvb3NlIGEgZGlmZmVyZW50IGZpbGUgbmFtZS4HAAAADFFQcmludERpYWxvZwEDAAAA
-	VABWAG8AbgAgAGwAaQBuAGsAcwAgAG4AYQBjAGgAIAByAGUAYwBoAHQAcwAsACAAdgBvAG4AIAB1
-	AG4AdABlAG4AIABuAGEAYwBoACAAbwBiAGUAbggAAAAABgAAABxMZWZ0IHRvIFJpZ2h0LCBCb3R0
-	b20gdG8gVG9wBwAAAAxRUHJpbnREaWFsb2cBAwAAAFQAVgBvAG4AIABsAGkAbgBrAHMAIABuAGEA
-	YwBoACAAcgBlAGMAaAB0AHMALAAgAHYAbwBuACAAbwBiAGUAbgAgAG4AYQBjAGgAIAB1AG4AdABl
-	AG4IAAAAAAYAAAAcTGVmdCB0byBSaWdodCwgVG9wIHRvIEJvdHRvbQcAAAAMUVByaW50RGlhbG9n
-	AQMAAAAYAEwAbwBrAGEAbABlACAARABhAHQAZQBpCAAAAAAGAAAACkxvY2FsIGZpbGUHAAAADFFQ
-	cmludERpYWxvZwEDAAAABABPAEsIAAAAAAYAAAACT0sHAAAADFFQcmludERpYWxvZwEDAAAAHgBV
-	AG4AZwBlAHIAYQBkAGUAIABTAGUAaQB0AGUAbggAAAAABgAAAAlPZGQgUGFnZXMHAAAADFFQcmlu
-	dERpYWxvZwEDAAABDABEAGkAZQAgAEUAaQBuAHMAdABlAGwAbAB1AG4AZwBlAG4AIAAiAFMAZQBp
-	AHQAZQBuACAAcAByAG8AIABCAGwAYQB0AHQAIgAgAHUAbgBkACAAIgBTAGUAaQB0AGUAbgAtAFMA
-	YQB0AHoAIgAgAGsA9gBuAG4AZQBuACAAbgBpAGMAaAB0ACAAegB1AHMAYQBtAG0AZQBuACAAdgBl
-	AHIAdwBlAG4AZABlAHQAIAB3AGUAcgBkAGUAbgAuAAoAQgBpAHQAdABlACAAZABlAGEAawB0AGkA
-	dgBpAGUAcgBlAG4AIABTAGkAZQAgAGUAaQBuAGUAIABkAGUAcgAgAGIAZQBpAGQAZQBuAC4IAAAA
-	AAYAAABnT3B0aW9ucyAnUGFnZXMgUGVyIFNoZWV0JyBhbmQgJ1BhZ2UgU2V0JyBjYW5ub3QgYmUg
-	dXNlZCB0b2dldGhlci4KUGxlYXNlIHR1cm4gb25lIG9mIHRob3NlIG9wdGlvbnMgb2ZmLgcAAAAM
-	UVByaW50RGlhbG9nAQMAAAAOAEQAcgB1AGMAawBlAG4IAAAAAAYAAAAFUHJpbnQHAAAADFFQcmlu
-	dERpYWxvZwEDAAAAKABJAG4AIABEAGEAdABlAGkAIABkAHIAdQBjAGsAZQBuACAALgAuAC4IAAAA
-	AAYAAAARUHJpbnQgVG8gRmlsZSAuLi4HAAAADFFQcmludERpYWxvZwEDAAAAKABJAG4AIABQAEQA
-	RgAtAEQAYQB0AGUAaQAgAGQAcgB1AGMAawBlAG4IAAAAAAYAAAATUHJpbnQgdG8gRmlsZSAoUERG
-	KQcAAAAMUVByaW50RGlhbG9nAQMAAABUAFYAbwBuACAAcgBlAGMAaAB0AHMAIABuAGEAYwBoACAA
-	bABpAG4AawBzACwAIAB2AG8AbgAgAHUAbgB0AGUAbgAgAG4AYQBjAGgAIABvAGIAZQBuCAAAAAAG
-	AAAAHFJpZ2h0IHRvIExlZnQsIEJvdHRvbSB0byBUb3AHAAAADFFQcmludERpYWxvZwEDAAAAVABW
-	AG8AbgAgAHIAZQBjAGgAdABzACAAbgBhAGMAaAAgAGwAaQBuAGsAcwAsACAAdgBvAG4AIABvAGIA
-	ZQBuACAAbgBhAGMAaAAgAHUAbgB0AGUAbggAAAAABgAAABxSaWdodCB0byBMZWZ0LCBUb3AgdG8g
-	Qm90dG9tBwAAAAxRUHJpbnREaWFsb2cBAwAAAKYARABpAGUAIABBAG4AZwBhAGIAZQAgAGYA/ABy
-	ACAAZABpAGUAIABlAHIAcwB0AGUAIABTAGUAaQB0AGUAIABkAGEAcgBmACAAbgBpAGMAaAB0ACAA
-	ZwByAPYA3wBlAHIAIABzAGUAaQBuACAAYQBsAHMAIABkAGkAZQAgAGYA/AByACAAZABpAGUAIABs
-	AGUAdAB6AHQAZQAgAFMAZQBpAHQAZQAuCAAAAAAGAAAAN1RoZSAnRnJvbScgdmFsdWUgY2Fubm90
-	IGJlIGdyZWF0ZXIgdGhhbiB0aGUgJ1RvJyB2YWx1ZS4HAAAADFFQcmludERpYWxvZwEDAAAAVABW
-	AG8AbgAgAG8AYgBlAG4AIABuAGEAYwBoACAAdQBuAHQAZQBuACwAIAB2AG8AbgAgAGwAaQBuAGsA
-	cwAgAG4AYQBjAGgAIAByAGUAYwBoAHQAcwgAAAAABgAAABxUb3AgdG8gQm90dG9tLCBMZWZ0IHRv
-	IFJpZ2h0BwAAAAxRUHJpbnREaWFsb2cBAwAAAFQAVgBvAG4AIABvAGIAZQBuACAAbgBhAGMAaAAg
-	AHUAbgB0AGUAbgAsACAAdgBvAG4AIAByAGUAYwBoAHQAcwAgAG4AYQBjAGgAIABsAGkAbgBrAHMI
-	AAAAAAYAAAAcVG9wIHRvIEJvdHRvbSwgUmlnaHQgdG8gTGVmdAcAAAAMUVByaW50RGlhbG9nAQMA
-	AAAmAFAARABGAC0ARABhAHQAZQBpACAAcwBjAGgAcgBlAGkAYgBlAG4IAAAAAAYAAAAOV3JpdGUg
-	UERGIGZpbGUHAAAADFFQcmludERpYWxvZwEDAAAABgAlADEAJQgAAAAABgAAAAMlMSUHAAAAE1FQ
-	cmludFByZXZpZXdEaWFsb2cBAwAAAB4AUABEAEYAIABlAHgAcABvAHIAdABpAGUAcgBlAG4IAAAA
-	AAYAAAANRXhwb3J0IHRvIFBERgcAAAATUVByaW50UHJldmlld0RpYWxvZwEDAAAAFgBFAHIAcwB0
-	AGUAIABTAGUAaQB0AGUIAAAAAAYAAAAKRmlyc3QgcGFnZQcAAAATUVByaW50UHJldmlld0RpYWxv
-	ZwEDAAAAHABTAGUAaQB0AGUAIABhAG4AcABhAHMAcwBlAG4IAAAAAAYAAAAIRml0IHBhZ2UHAAAA
-	E1FQcmludFByZXZpZXdEaWFsb2cBAwAAAB4AQgByAGUAaQB0AGUAIABhAG4AcABhAHMAcwBlAG4I
-	AAAAAAYAAAAJRml0IHdpZHRoBwAAABNRUHJpbnRQcmV2aWV3RGlhbG9nAQMAAAAUAFEAdQBlAHIA
-	ZgBvAHIAbQBhAHQIAAAAAAYAAAAJTGFuZHNjYXBlBwAAABNRUHJpbnRQcmV2aWV3RGlhbG9nAQMA
-	AAAYAEwAZQB0AHoAdABlACAAUwBlAGkAdABlCAAAAAAGAAAACUxhc3QgcGFnZQcAAAATUVByaW50
-	UHJldmlld0RpYWxvZwEDAAAAGgBOAOQAYwBoAHMAdABlACAAUwBlAGkAdABlCAAAAAAGAAAACU5l
-	eHQgcGFnZQcAAAATUVByaW50UHJldmlld0RpYWxvZwEDAAAAIABTAGUAaQB0AGUAIABlAGkAbgBy
-	AGkAYwBoAHQAZQBuCAAAAAAGAAAAClBhZ2UgU2V0dXAHAAAAE1FQcmludFByZXZpZXdEaWFsb2cB
-	AwAAACAAUwBlAGkAdABlACAAZQBpAG4AcgBpAGMAaAB0AGUAbggAAAAABgAAAApQYWdlIHNldHVw
-	BwAAABNRUHJpbnRQcmV2aWV3RGlhbG9nAQMAAAAUAEgAbwBjAGgAZgBvAHIAbQBhAHQIAAAAAAYA
-	AAAIUG9ydHJhaXQHAAAAE1FQcmludFByZXZpZXdEaWFsb2cBAwAAABgAVgBvAHIAaQBnAGUAIABT
-	AGUAaQB0AGUIAAAAAAYAAAANUHJldmlvdXMgcGFnZQcAAAATUVByaW50UHJldmlld0RpYWxvZwED
-	AAAADgBEAHIAdQBjAGsAZQBuCAAAAAAGAAAABVByaW50BwAAABNRUHJpbnRQcmV2aWV3RGlhbG9n
-	AQMAAAAaAEQAcgB1AGMAawB2AG8AcgBzAGMAaABhAHUIAAAAAAYAAAANUHJpbnQgUHJldmlldwcA
-	AAATUVByaW50UHJldmlld0RpYWxvZwEDAAAAQgBHAGUAZwBlAG4A/ABiAGUAcgBsAGkAZQBnAGUA
-	bgBkAGUAIABTAGUAaQB0AGUAbgAgAGEAbgB6AGUAaQBnAGUAbggAAAAABgAAABFTaG93IGZhY2lu
-	ZyBwYWdlcwcAAAATUVByaW50UHJldmlld0RpYWxvZwEDAAAALADcAGIAZQByAHMAaQBjAGgAdAAg
-	AGEAbABsAGUAcgAgAFMAZQBpAHQAZQBuCAAAAAAGAAAAGlNob3cgb3ZlcnZpZXcgb2YgYWxsIHBh
-	Z2VzBwAAABNRUHJpbnRQcmV2aWV3RGlhbG9nAQMAAAAuAEUAaQBuAHoAZQBsAG4AZQAgAFMAZQBp
-	AHQAZQAgAGEAbgB6AGUAaQBnAGUAbggAAAAABgAAABBTaG93IHNpbmdsZSBwYWdlBwAAABNRUHJp
-	bnRQcmV2aWV3RGlhbG9nAQMAAAAUAFYAZQByAGcAcgD2AN8AZQByAG4IAAAAAAYAAAAHWm9vbSBp
-	bgcAAAATUVByaW50UHJldmlld0RpYWxvZwEDAAAAFgBWAGUAcgBrAGwAZQBpAG4AZQByAG4IAAAA
-	AAYAAAAIWm9vbSBvdXQHAAAAE1FQcmludFByZXZpZXdEaWFsb2cBAwAAADwARQBpAG4AcwB0AGUA
-	bABsAHUAbgBnAGUAbgAgAHoAdQBtACAARAByAHUAYwBrAGEAdQBmAHQAcgBhAGcIAAAAAAYAAAAL
-	Sm9iIE9wdGlvbnMHAAAAFlFQcmludFByb3BlcnRpZXNEaWFsb2cBAwAAACgARAByAHUAYwBrAGUA
-	cgBlAGkAZwBlAG4AcwBjAGgAYQBmAHQAZQBuCAAAAAAGAAAAElByaW50ZXIgUHJvcGVydGllcwcA
-	AAAWUVByaW50UHJvcGVydGllc0RpYWxvZwEDAAAAEABGAG8AcgBtAHUAbABhAHIIAAAAAAYAAAAE
-	Rm9ybQcAAAAWUVByaW50UHJvcGVydGllc1dpZGdldAEDAAAACgBTAGUAaQB0AGUIAAAAAAYAAAAE
-	UGFnZQcAAAAWUVByaW50UHJvcGVydGllc1dpZGdldAEDAAAAEgBTAG8AcgB0AGkAZQByAGUAbggA
-	AAAABgAAAAdDb2xsYXRlBwAAABRRUHJpbnRTZXR0aW5nc091dHB1dAEDAAAACgBGAGEAcgBiAGUI
-	AAAAAAYAAAAFQ29sb3IHAAAAFFFQcmludFNldHRpbmdzT3V0cHV0AQMAAAASAEYAYQByAGIAbQBv
-	AGQAdQBzCAAAAAAGAAAACkNvbG9yIE1vZGUHAAAAFFFQcmludFNldHRpbmdzT3V0cHV0AQMAAAAg
-	AEEAbgB6AGEAaABsACAARQB4AGUAbQBwAGwAYQByAGUIAAAAAAYAAAAGQ29waWVzBwAAABRRUHJp
-	bnRTZXR0aW5nc091dHB1dAEDAAAAIgBBAG4AegBhAGgAbAAgAEUAeABlAG0AcABsAGEAcgBlADoI
-	AAAAAAYAAAAHQ29waWVzOgcAAAAUUVByaW50U2V0dGluZ3NPdXRwdXQBAwAAABwAQQBrAHQAdQBl
-	AGwAbABlACAAUwBlAGkAdABlCAAAAAAGAAAADEN1cnJlbnQgUGFnZQcAAAAUUVByaW50U2V0dGlu
-	Z3NPdXRwdXQBAwAAABYARAB1AHAAbABlAHgAZAByAHUAYwBrCAAAAAAGAAAAD0R1cGxleCBQcmlu
-	dGluZwcAAAAUUVByaW50U2V0dGluZ3NPdXRwdXQBAwAAABAARgBvAHIAbQB1AGwAYQByCAAAAAAG
-	AAAABEZvcm0HAAAAFFFQcmludFNldHRpbmdzT3V0cHV0AQMAAAAUAEcAcgBhAHUAcwB0AHUAZgBl
-	AG4IAAAAAAYAAAAJR3JheXNjYWxlBwAAABRRUHJpbnRTZXR0aW5nc091dHB1dAEDAAAAFgBMAGEA
-	bgBnAGUAIABTAGUAaQB0AGUIAAAAAAYAAAAJTG9uZyBzaWRlBwAAABRRUHJpbnRTZXR0aW5nc091
-	dHB1dAEDAAAACABLAGUAaQBuCAAAAAAGAAAABE5vbmUHAAAAFFFQcmludFNldHRpbmdzT3V0cHV0
-	AQMAAAAQAE8AcAB0AGkAbwBuAGUAbggAAAAABgAAAAdPcHRpb25zBwAAABRRUHJpbnRTZXR0aW5n
-	c091dHB1dAEDAAAAKABBAHUAcwBnAGEAYgBlAGUAaQBuAHMAdABlAGwAbAB1AG4AZwBlAG4IAAAA
-	AAYAAAAPT3V0cHV0IFNldHRpbmdzBwAAABRRUHJpbnRTZXR0aW5nc091dHB1dAEDAAAAGABTAGUA
-	aQB0AGUAbgAtAFMAYQB0AHoAOggAAAAABgAAAAlQYWdlIFNldDoHAAAAFFFQcmludFNldHRpbmdz
-	T3V0cHV0AQMAAAAUAFMAZQBpAHQAZQBuACAAdgBvAG4IAAAAAAYAAAAKUGFnZXMgZnJvbQcAAAAU
-	UVByaW50U2V0dGluZ3NPdXRwdXQBAwAAABoAQQBsAGwAZQBzACAAZAByAHUAYwBrAGUAbggAAAAA
-	BgAAAAlQcmludCBhbGwHAAAAFFFQcmludFNldHRpbmdzT3V0cHV0AQMAAAAeAEIAZQByAGUAaQBj
-	AGgAIABkAHIAdQBjAGsAZQBuCAAAAAAGAAAAC1ByaW50IHJhbmdlBwAAABRRUHJpbnRTZXR0aW5n
-	c091dHB1dAEDAAAAEgBVAG0AZwBlAGsAZQBoAHIAdAgAAAAABgAAAAdSZXZlcnNlBwAAABRRUHJp
-	bnRTZXR0aW5nc091dHB1dAEDAAAADgBBAHUAcwB3AGEAaABsCAAAAAAGAAAACVNlbGVjdGlvbgcA
-	AAAUUVByaW50U2V0dGluZ3NPdXRwdXQBAwAAABYASwB1AHIAegBlACAAUwBlAGkAdABlCAAAAAAG
-	AAAAClNob3J0IHNpZGUHAAAAFFFQcmludFNldHRpbmdzT3V0cHV0AQMAAAAGAGIAaQBzCAAAAAAG
-	AAAAAnRvBwAAABRRUHJpbnRTZXR0aW5nc091dHB1dAEDAAAADAAmAE4AYQBtAGUAOggAAAAABgAA
-	AAYmTmFtZToHAAAADFFQcmludFdpZGdldAEDAAAABgAuAC4ALggAAAAABgAAAAMuLi4HAAAADFFQ
-	cmludFdpZGdldAEDAAAAEABGAG8AcgBtAHUAbABhAHIIAAAAAAYAAAAERm9ybQcAAAAMUVByaW50
-	V2lkZ2V0AQMAAAASAFMAdABhAG4AZABvAHIAdAA6CAAAAAAGAAAACUxvY2F0aW9uOgcAAAAMUVBy
-	aW50V2lkZ2V0AQMAAAAcAEEAdQBzAGcAYQBiAGUAJgBkAGEAdABlAGkAOggAAAAABgAAAA1PdXRw
-	dXQgJmZpbGU6BwAAAAxRUHJpbnRXaWRnZXQBAwAAABwAJgBFAGkAZwBlAG4AcwBjAGgAYQBmAHQA
-	ZQBuCAAAAAAGAAAAC1Amcm9wZXJ0aWVzBwAAAAxRUHJpbnRXaWRnZXQBAwAAABAAVgBvAHIAcwBj
-	AGgAYQB1CAAAAAAGAAAAB1ByZXZpZXcHAAAADFFQcmludFdpZGdldAEDAAAADgBEAHIAdQBjAGsA
-	ZQByCAAAAAAGAAAAB1ByaW50ZXIHAAAADFFQcmludFdpZGdldAEDAAAACABUAHkAcAA6CAAAAAAG
-	AAAABVR5cGU6BwAAAAxRUHJpbnRXaWRnZXQBAwAAAHYARABpAGUAIABFAGkAbgBnAGEAYgBlAHUA
-	bQBsAGUAaQB0AHUAbgBnACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIAB6AHUAbQAgAEwAZQBz
-	AGUAbgAgAGcAZQD2AGYAZgBuAGUAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAALENvdWxkIG5vdCBv
-	cGVuIGlucHV0IHJlZGlyZWN0aW9uIGZvciByZWFkaW5nBwAAAAhRUHJvY2VzcwEDAAAAdgBEAGkA
-	ZQAgAEEAdQBzAGcAYQBiAGUAdQBtAGwAZQBpAHQAdQBuAGcAIABrAG8AbgBuAHQAZQAgAG4AaQBj
-	AGgAdAAgAHoAdQBtACAATABlAHMAZQBuACAAZwBlAPYAZgBmAG4AZQB0ACAAdwBlAHIAZABlAG4I
-	AAAAAAYAAAAtQ291bGQgbm90IG9wZW4gb3V0cHV0IHJlZGlyZWN0aW9uIGZvciB3cml0aW5nBwAA
-	AAhRUHJvY2VzcwEDAAAAUABEAGEAcwAgAEwAZQBzAGUAbgAgAHYAbwBtACAAUAByAG8AegBlAHMA
-	cwAgAGkAcwB0ACAAZgBlAGgAbABnAGUAcwBjAGgAbABhAGcAZQBuCAAAAAAGAAAAGkVycm9yIHJl
-	YWRpbmcgZnJvbSBwcm9jZXNzBwAAAAhRUHJvY2VzcwEDAAAAWABEAGEAcwAgAFMAYwBoAHIAZQBp
-	AGIAZQBuACAAegB1AG0AIABQAHIAbwB6AGUAcwBzACAAaQBzAHQAIABmAGUAaABsAGcAZQBzAGMA
-	aABsAGEAZwBlAG4IAAAAAAYAAAAYRXJyb3Igd3JpdGluZyB0byBwcm9jZXNzBwAAAAhRUHJvY2Vz
-	cwEDAAAAQABFAHMAIAB3AHUAcgBkAGUAIABrAGUAaQBuACAAUAByAG8AZwByAGEAbQBtACAAYQBu
-	AGcAZQBnAGUAYgBlAG4IAAAAAAYAAAASTm8gcHJvZ3JhbSBkZWZpbmVkBwAAAAhRUHJvY2VzcwED
-	AAAANABEAGUAcgAgAFAAcgBvAHoAZQBzAHMAIABpAHMAdAAgAGEAYgBnAGUAcwB0APwAcgB6AHQI
-	AAAAAAYAAAAPUHJvY2VzcyBjcmFzaGVkBwAAAAhRUHJvY2VzcwEDAAAAWABEAGEAcwAgAFMAdABh
-	AHIAdABlAG4AIABkAGUAcwAgAFAAcgBvAHoAZQBzAHMAZQBzACAAaQBzAHQAIABmAGUAaABsAGcA
-	ZQBzAGMAaABsAGEAZwBlAG4IAAAAAAYAAAAXUHJvY2VzcyBmYWlsZWQgdG8gc3RhcnQHAAAACFFQ
-	cm9jZXNzAQMAAABgAEQAYQBzACAAUwB0AGEAcgB0AGUAbgAgAGQAZQBzACAAUAByAG8AegBlAHMA
-	cwBlAHMAIABpAHMAdAAgAGYAZQBoAGwAZwBlAHMAYwBoAGwAYQBnAGUAbgA6ACAAJQAxCAAAAAAG
-	AAAAG1Byb2Nlc3MgZmFpbGVkIHRvIHN0YXJ0OiAlMQcAAAAIUVByb2Nlc3MBAwAAACQAWgBlAGkA
-	dAD8AGIAZQByAHMAYwBoAHIAZQBpAHQAdQBuAGcIAAAAAAYAAAAbUHJvY2VzcyBvcGVyYXRpb24g
-	dGltZWQgb3V0BwAAAAhRUHJvY2VzcwEDAAAATABSAGUAcwBzAG8AdQByAGMAZQBuAHAAcgBvAGIA
-	bABlAG0AIAAoACIAZgBvAHIAawAgAGYAYQBpAGwAdQByAGUAIgApADoAIAAlADEIAAAAAAYAAAAh
-	UmVzb3VyY2UgZXJyb3IgKGZvcmsgZmFpbHVyZSk6ICUxBwAAAAhRUHJvY2VzcwEDAAAAEgBBAGIA
-	YgByAGUAYwBoAGUAbggAAAAABgAAAAZDYW5jZWwHAAAAD1FQcm9ncmVzc0RpYWxvZwEDAAAAQABm
-	AGEAbABzAGMAaABlACAAUwB5AG4AdABhAHgAIABmAPwAcgAgAFoAZQBpAGMAaABlAG4AawBsAGEA
-	cwBzAGUIAAAAAAYAAAAVYmFkIGNoYXIgY2xhc3Mgc3ludGF4BwAAAAdRUmVnRXhwAQMAAAA4AGYA
-	YQBsAHMAYwBoAGUAIABTAHkAbgB0AGEAeAAgAGYA/AByACAATABvAG8AawBhAGgAZQBhAGQIAAAA
-	AAYAAAAUYmFkIGxvb2thaGVhZCBzeW50YXgHAAAAB1FSZWdFeHABAwAAAEIAZgBhAGwAcwBjAGgA
-	ZQAgAFMAeQBuAHQAYQB4ACAAZgD8AHIAIABXAGkAZQBkAGUAcgBoAG8AbAB1AG4AZwBlAG4IAAAA
-	AAYAAAAVYmFkIHJlcGV0aXRpb24gc3ludGF4BwAAAAdRUmVnRXhwAQMAAABMAGQAZQBhAGsAdABp
-	AHYAaQBlAHIAdABlACAARQBpAGcAZQBuAHMAYwBoAGEAZgB0ACAAdwB1AHIAZABlACAAYgBlAG4A
-	dQB0AHoAdAgAAAAABgAAABVkaXNhYmxlZCBmZWF0dXJlIHVzZWQHAAAAB1FSZWdFeHABAwAAACYA
-	dQBuAGcA/ABsAHQAaQBnAGUAIABLAGEAdABlAGcAbwByAGkAZQgAAAAABgAAABBpbnZhbGlkIGNh
-	dGVnb3J5BwAAAAdRUmVnRXhwAQMAAAAoAHUAbgBnAPwAbAB0AGkAZwBlAHMAIABJAG4AdABlAHIA
-	dgBhAGwAbAgAAAAABgAAABBpbnZhbGlkIGludGVydmFsBwAAAAdRUmVnRXhwAQMAAAAqAHUAbgBn
-	APwAbAB0AGkAZwBlAHIAIABPAGsAdABhAGwALQBXAGUAcgB0CAAAAAAGAAAAE2ludmFsaWQgb2N0
-	YWwgdmFsdWUHAAAAB1FSZWdFeHABAwAAAF4AbABvAG8AawBiAGUAaABpAG4AZABzACAAbgBpAGMA
-	aAB0ACAAdQBuAHQAZQByAHMAdAD8AHQAegB0ACwAIABzAGkAZQBoAGUAIABRAFQAQgBVAEcALQAy
-	ADMANwAxCAAAAAAGAAAAKWxvb2tiZWhpbmRzIG5vdCBzdXBwb3J0ZWQsIHNlZSBRVEJVRy0yMzcx
-	BwAAAAdRUmVnRXhwAQMAAAAuAGkAbgB0AGUAcgBuAGUAcwAgAEwAaQBtAGkAdAAgAGUAcgByAGUA
-	aQBjAGgAdAgAAAAABgAAABJtZXQgaW50ZXJuYWwgbGltaXQHAAAAB1FSZWdFeHABAwAAADIAZgBl
-	AGgAbABlAG4AZABlACAAbABpAG4AawBlACAAQgBlAGcAcgBlAG4AegB1AG4AZwgAAAAABgAAABJt
-	aXNzaW5nIGxlZnQgZGVsaW0HAAAAB1FSZWdFeHABAwAAABYAawBlAGkAbgAgAEYAZQBoAGwAZQBy
-	CAAAAAAGAAAAEW5vIGVycm9yIG9jY3VycmVkBwAAAAdRUmVnRXhwAQMAAAAiAHUAbgBlAHIAdwBh
-	AHIAdABlAHQAZQBzACAARQBuAGQAZQgAAAAABgAAAA51bmV4cGVjdGVkIGVuZAcAAAAHUVJlZ0V4
-	cAEDAAAAPAAoACoATQBBAFIASwApACAAZQByAGYAbwByAGQAZQByAHQAIABlAGkAbgAgAEEAcgBn
-	AHUAbQBlAG4AdAgAAAAABgAAAB0oKk1BUkspIG11c3QgaGF2ZSBhbiBhcmd1bWVudAcAAAASUVJl
-	Z3VsYXJFeHByZXNzaW9uAQMAAABKACgAKgBWAEUAUgBCACkAIABuAGkAYwBoAHQAIABlAHIAawBh
-	AG4AbgB0ACAAbwBkAGUAcgAgAGYAZQBoAGwAZQByAGgAYQBmAHQIAAAAAAYAAAAjKCpWRVJCKSBu
-	b3QgcmVjb2duaXplZCBvciBtYWxmb3JtZWQHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAaAAo
-	AD8AUgAgAG8AZABlAHIAIAAoAD8AWwArAC0AXQBaAGkAZgBmAGUAcgBuACAAZQByAGYAbwByAGQA
-	ZQByAHQAIABzAGMAaABsAGkAZQDfAGUAbgBkAGUAIABLAGwAYQBtAG0AZQByCAAAAAAGAAAAKSg/
-	UiBvciAoP1srLV1kaWdpdHMgbXVzdCBiZSBmb2xsb3dlZCBieSApBwAAABJRUmVndWxhckV4cHJl
-	c3Npb24BAwAAAHwAKAA/AHwAIAB1AG4AZAAvAG8AZABlAHIAIAAoAD8ASgA6ACAAbwBkAGUAcgAg
-	ACgAPwB4ADoAIABLAGwAYQBtAG0AZQByAG4AIABzAGkAbgBkACAAegB1ACAAdABpAGUAZgAgAGcA
-	ZQBzAGMAaABhAGMAaAB0AGUAbAB0CAAAAAAGAAAAOSg/fCBhbmQvb3IgKD9KOiBvciAoP3g6IHBh
-	cmVudGhlc2VzIGFyZSB0b28gZGVlcGx5IG5lc3RlZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMA
-	AABeAEQARQBGAEkATgBFAC0ARwByAHUAcABwAGUAIABlAG4AdABoAOQAbAB0ACAAbQBlAGgAcgAg
-	AGEAbABzACAAZQBpAG4AZQAgAFYAZQByAHoAdwBlAGkAZwB1AG4AZwgAAAAABgAAACpERUZJTkUg
-	Z3JvdXAgY29udGFpbnMgbW9yZSB0aGFuIG9uZSBicmFuY2gHAAAAElFSZWd1bGFyRXhwcmVzc2lv
-	bgEDAAAAWgBvAGIAZQByAGUAIABHAHIAZQBuAHoAZQAgAGQAZQBzACAASgBJAFQALQBTAHQAYQBw
-	AGUAbABzAHAAZQBpAGMAaABlAHIAcwAgAGUAcgByAGUAaQBjAGgAdAgAAAAABgAAABdKSVQgc3Rh
-	Y2sgbGltaXQgcmVhY2hlZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAAuAE4AVQBMAEwALQBB
-	AHIAZwB1AG0AZQBuAHQAIAD8AGIAZQByAGcAZQBiAGUAbggAAAAABgAAABROVUxMIGFyZ3VtZW50
-	IHBhc3NlZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABoAFAAQwBSAEUAIAB1AG4AdABlAHIA
-	cwB0APwAdAB6AHQAIABcAEwALAAgAFwAbAAsACAAXABOAHsAbgBhAG0AZQB9ACwAIABcAFUALAAg
-	AG8AZABlAHIAIABcAHUAIABuAGkAYwBoAHQIAAAAAAYAAAAxUENSRSBkb2VzIG5vdCBzdXBwb3J0
-	IFxMLCBcbCwgXE57bmFtZX0sIFxVLCBvciBcdQcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABY
-	AFAATwBTAEkAWAAtAFMAbwByAHQAaQBlAHIAZgBvAGwAZwBlAG4AIAB3AGUAcgBkAGUAbgAgAG4A
-	aQBjAGgAdAAgAHUAbgB0AGUAcgBzAHQA/AB0AHoAdAgAAAAABgAAACpQT1NJWCBjb2xsYXRpbmcg
-	ZWxlbWVudHMgYXJlIG5vdCBzdXBwb3J0ZWQHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAjgBu
-	AGEAYwBoACAAUABPAFMASQBYACAAYgBlAG4AYQBuAG4AdABlACAASwBsAGEAcwBzAGUAbgAgAHMA
-	aQBuAGQAIABuAHUAcgAgAGkAbgBuAGUAcgBoAGEAbABiACAAZQBpAG4AZQByACAASwBsAGEAcwBz
-	AGUAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQIAAAAAAYAAAA1UE9TSVggbmFtZWQgY2xhc3NlcyBh
-	cmUgc3VwcG9ydGVkIG9ubHkgd2l0aGluIGEgY2xhc3MHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgED
-	AAAAFgBTAFAAQQBSAEUAIABFAFIAUgBPAFIIAAAAAAYAAAALU1BBUkUgRVJST1IHAAAAElFSZWd1
-	bGFyRXhwcmVzc2lvbgEDAAAATgBVAFQARgAtADEANgAtAEYAZQBoAGwAZQByADoAIABVAG4AZwD8
-	AGwAdABpAGcAZQBzACAAbABvAHcAIABzAHUAcgByAG8AZwBhAHQAZQgAAAAABgAAACNVVEYtMTYg
-	ZXJyb3I6IGludmFsaWQgbG93IHN1cnJvZ2F0ZQcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABc
-	AFUAVABGAC0AMQA2AC0ARgBlAGgAbABlAHIAOgAgAEUAaQBuAHoAZQBsAG4AIABzAHQAZQBoAGUA
-	bgBkAGUAcwAgAGwAbwB3ACAAcwB1AHIAcgBvAGcAYQB0AGUIAAAAAAYAAAAkVVRGLTE2IGVycm9y
-	OiBpc29sYXRlZCBsb3cgc3Vycm9nYXRlBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAFQAVQBU
-	AEYALQAxADYALQBGAGUAaABsAGUAcgA6ACAATABvAHcAIABzAHUAcgByAG8AZwBhAHQAZQAgAGYA
-	ZQBoAGwAdAAgAGEAbQAgAEUAbgBkAGUIAAAAAAYAAAAqVVRGLTE2IGVycm9yOiBtaXNzaW5nIGxv
-	dyBzdXJyb2dhdGUgYXQgZW5kBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAIQAVQBUAEYALQAz
-	ADIALQBGAGUAaABsAGUAcgA6ACAAWgBlAGkAYwBoAGUAbgBjAG8AZABlAHMAIAB2AG8AbgAgADAA
-	eABkADgAMAAwAC0AMAB4AGQAZgBmAGYAIABzAGkAbgBkACAAbgBpAGMAaAB0ACAAZABlAGYAaQBu
-	AGkAZQByAHQIAAAAAAYAAAA3VVRGLTMyIGVycm9yOiBjb2RlIHBvaW50cyAweGQ4MDAtMHhkZmZm
-	IGFyZSBub3QgZGVmaW5lZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAACIAFUAVABGAC0AMwAy
-	AC0ARgBlAGgAbABlAHIAOgAgAFoAZQBpAGMAaABlAG4AYwBvAGQAZQBzACAAZwByAPYA3wBlAHIA
-	IABhAGwAcwAgADAAeAAxADAAZgBmAGYAZgAgAHMAaQBuAGQAIABuAGkAYwBoAHQAIABkAGUAZgBp
-	AG4AaQBlAHIAdAgAAAAABgAAAD9VVEYtMzIgZXJyb3I6IGNvZGUgcG9pbnRzIGdyZWF0ZXIgdGhh
-	biAweDEwZmZmZiBhcmUgbm90IGRlZmluZWQHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAARABV
-	AFQARgAtADgALQBGAGUAaABsAGUAcgA6ACAAQQBtACAARQBuAGQAZQAgAGYAZQBoAGwAdAAgADEA
-	IABCAHkAdABlCAAAAAAGAAAAIlVURi04IGVycm9yOiAxIGJ5dGUgbWlzc2luZyBhdCBlbmQHAAAA
-	ElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAASABVAFQARgAtADgALQBGAGUAaABsAGUAcgA6ACAAQQBt
-	ACAARQBuAGQAZQAgAGYAZQBoAGwAZQBuACAAMgAgAEIAeQB0AGUAcwgAAAAABgAAACNVVEYtOCBl
-	cnJvcjogMiBieXRlcyBtaXNzaW5nIGF0IGVuZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABI
-	AFUAVABGAC0AOAAtAEYAZQBoAGwAZQByADoAIABBAG0AIABFAG4AZABlACAAZgBlAGgAbABlAG4A
-	IAAzACAAQgB5AHQAZQBzCAAAAAAGAAAAI1VURi04IGVycm9yOiAzIGJ5dGVzIG1pc3NpbmcgYXQg
-	ZW5kBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAEgAVQBUAEYALQA4AC0ARgBlAGgAbABlAHIA
-	OgAgAEEAbQAgAEUAbgBkAGUAIABmAGUAaABsAGUAbgAgADQAIABCAHkAdABlAHMIAAAAAAYAAAAj
-	VVRGLTggZXJyb3I6IDQgYnl0ZXMgbWlzc2luZyBhdCBlbmQHAAAAElFSZWd1bGFyRXhwcmVzc2lv
-	bgEDAAAASABVAFQARgAtADgALQBGAGUAaABsAGUAcgA6ACAAQQBtACAARQBuAGQAZQAgAGYAZQBo
-	AGwAZQBuACAANQAgAEIAeQB0AGUAcwgAAAAABgAAACNVVEYtOCBlcnJvcjogNSBieXRlcyBtaXNz
-	aW5nIGF0IGVuZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAB2AFUAVABGAC0AOAAtAEYAZQBo
-	AGwAZQByADoAIAA1AC0AQgB5AHQAZQAtAFoAZQBpAGMAaABlAG4AIABzAGkAbgBkACAAbgBpAGMA
-	aAB0ACAAegB1AGwA5ABzAHMAaQBnACAAKABSAEYAQwAgADMANgAyADkAKQgAAAAABgAAADdVVEYt
-	OCBlcnJvcjogNS1ieXRlIGNoYXJhY3RlciBpcyBub3QgYWxsb3dlZCAoUkZDIDM2MjkpBwAAABJR
-	UmVndWxhckV4cHJlc3Npb24BAwAAAHYAVQBUAEYALQA4AC0ARgBlAGgAbABlAHIAOgAgADYALQBC
-	AHkAdABlAC0AWgBlAGkAYwBoAGUAbgAgAHMAaQBuAGQAIABuAGkAYwBoAHQAIAB6AHUAbADkAHMA
-	cwBpAGcAIAAoAFIARgBDACAAMwA2ADIAOQApCAAAAAAGAAAAN1VURi04IGVycm9yOiA2LWJ5dGUg
-	Y2hhcmFjdGVyIGlzIG5vdCBhbGxvd2VkIChSRkMgMzYyOSkHAAAAElFSZWd1bGFyRXhwcmVzc2lv
-	bgEDAAAAkABVAFQARgAtADgALQBGAGUAaABsAGUAcgA6ACAARABpAGUAIABoAPYAYwBoAHMAdABl
-	AG4AIABCAGkAdABzACAAZABlAHMAIAB6AHcAZQBpAHQAZQBuACAAQgB5AHQAZQBzACAAZQBuAHQA
-	cwBwAHIAZQBjAGgAZQBuACAAbgBpAGMAaAB0ACAAMAB4ADgAMAgAAAAABgAAACVVVEYtOCBlcnJv
-	cjogYnl0ZSAyIHRvcCBiaXRzIG5vdCAweDgwBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAJAA
-	VQBUAEYALQA4AC0ARgBlAGgAbABlAHIAOgAgAEQAaQBlACAAaAD2AGMAaABzAHQAZQBuACAAQgBp
-	AHQAcwAgAGQAZQBzACAAZAByAGkAdAB0AGUAbgAgAEIAeQB0AGUAcwAgAGUAbgB0AHMAcAByAGUA
-	YwBoAGUAbgAgAG4AaQBjAGgAdAAgADAAeAA4ADAIAAAAAAYAAAAlVVRGLTggZXJyb3I6IGJ5dGUg
-	MyB0b3AgYml0cyBub3QgMHg4MAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAACQAFUAVABGAC0A
-	OAAtAEYAZQBoAGwAZQByADoAIABEAGkAZQAgAGgA9gBjAGgAcwB0AGUAbgAgAEIAaQB0AHMAIABk
-	AGUAcwAgAHYAaQBlAHIAdABlAG4AIABCAHkAdABlAHMAIABlAG4AdABzAHAAcgBlAGMAaABlAG4A
-	IABuAGkAYwBoAHQAIAAwAHgAOAAwCAAAAAAGAAAAJVVURi04IGVycm9yOiBieXRlIDQgdG9wIGJp
-	dHMgbm90IDB4ODAHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAkABVAFQARgAtADgALQBGAGUA
-	aABsAGUAcgA6ACAARABpAGUAIABoAPYAYwBoAHMAdABlAG4AIABCAGkAdABzACAAZABlAHMAIABm
-	APwAbgBmAHQAZQBuACAAQgB5AHQAZQBzACAAZQBuAHQAcwBwAHIAZQBjAGgAZQBuACAAbgBpAGMA
-	aAB0ACAAMAB4ADgAMAgAAAAABgAAACVVVEYtOCBlcnJvcjogYnl0ZSA1IHRvcCBiaXRzIG5vdCAw
-	eDgwBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAJIAVQBUAEYALQA4AC0ARgBlAGgAbABlAHIA
-	OgAgAEQAaQBlACAAaAD2AGMAaABzAHQAZQBuACAAQgBpAHQAcwAgAGQAZQBzACAAcwBlAGMAaABz
-	AHQAZQBuACAAQgB5AHQAZQBzACAAZQBuAHQAcwBwAHIAZQBjAGgAZQBuACAAbgBpAGMAaAB0ACAA
-	MAB4ADgAMAgAAAAABgAAACVVVEYtOCBlcnJvcjogYnl0ZSA2IHRvcCBiaXRzIG5vdCAweDgwBwAA
-	ABJRUmVndWxhckV4cHJlc3Npb24BAwAAAIIAVQBUAEYALQA4AC0ARgBlAGgAbABlAHIAOgAgAFoA
-	ZQBpAGMAaABlAG4AYwBvAGQAZQBzACAAdgBvAG4AIAAwAHgAZAA4ADAAMAAtADAAeABkAGYAZgBm
-	ACAAcwBpAG4AZAAgAG4AaQBjAGgAdAAgAGQAZQBmAGkAbgBpAGUAcgB0CAAAAAAGAAAANlVURi04
-	IGVycm9yOiBjb2RlIHBvaW50cyAweGQ4MDAtMHhkZmZmIGFyZSBub3QgZGVmaW5lZAcAAAASUVJl
-	Z3VsYXJFeHByZXNzaW9uAQMAAACGAFUAVABGAC0AOAAtAEYAZQBoAGwAZQByADoAIABaAGUAaQBj
-	AGgAZQBuAGMAbwBkAGUAcwAgAGcAcgD2AN8AZQByACAAYQBsAHMAIAAwAHgAMQAwAGYAZgBmAGYA
-	IABzAGkAbgBkACAAbgBpAGMAaAB0ACAAZABlAGYAaQBuAGkAZQByAHQIAAAAAAYAAAA+VVRGLTgg
-	ZXJyb3I6IGNvZGUgcG9pbnRzIGdyZWF0ZXIgdGhhbiAweDEwZmZmZiBhcmUgbm90IGRlZmluZWQH
-	AAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAWgBVAFQARgAtADgALQBGAGUAaABsAGUAcgA6ACAA
-	VQBuAHoAdQBsAOQAcwBzAGkAZwBlAHMAIABCAHkAdABlACAAKAB4AGYAZQAgAG8AcgAgADAAeABm
-	AGYAKQgAAAAABgAAAChVVEYtOCBlcnJvcjogaWxsZWdhbCBieXRlICgweGZlIG9yIDB4ZmYpBwAA
-	ABJRUmVndWxhckV4cHJlc3Npb24BAwAAAHYAVQBUAEYALQA4AC0ARgBlAGgAbABlAHIAOgAgAEUA
-	aQBuAHoAZQBsAG4AIABzAHQAZQBoAGUAbgBkAGUAcwAgAEIAeQB0AGUAIABtAGkAdAAgAGcAZQBz
-	AGUAdAB6AHQAZQBtACAAQgBpAHQAIAAwAHgAOAAwCAAAAAAGAAAALFVURi04IGVycm9yOiBpc29s
-	YXRlZCBieXRlIHdpdGggMHg4MCBiaXQgc2V0BwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAEwA
-	VQBUAEYALQA4AC0ARgBlAGgAbABlAHIAOgAgANwAYgBlAHIAbABhAG4AZwBlACAAMgAtAEIAeQB0
-	AGUALQBTAGUAcQB1AGUAbgB6CAAAAAAGAAAAJVVURi04IGVycm9yOiBvdmVybG9uZyAyLWJ5dGUg
-	c2VxdWVuY2UHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAATABVAFQARgAtADgALQBGAGUAaABs
-	AGUAcgA6ACAA3ABiAGUAcgBsAGEAbgBnAGUAIAAzAC0AQgB5AHQAZQAtAFMAZQBxAHUAZQBuAHoI
-	AAAAAAYAAAAlVVRGLTggZXJyb3I6IG92ZXJsb25nIDMtYnl0ZSBzZXF1ZW5jZQcAAAASUVJlZ3Vs
-	YXJFeHByZXNzaW9uAQMAAABMAFUAVABGAC0AOAAtAEYAZQBoAGwAZQByADoAIADcAGIAZQByAGwA
-	YQBuAGcAZQAgADQALQBCAHkAdABlAC0AUwBlAHEAdQBlAG4AeggAAAAABgAAACVVVEYtOCBlcnJv
-	cjogb3ZlcmxvbmcgNC1ieXRlIHNlcXVlbmNlBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAEwA
-	VQBUAEYALQA4AC0ARgBlAGgAbABlAHIAOgAgANwAYgBlAHIAbABhAG4AZwBlACAANQAtAEIAeQB0
-	AGUALQBTAGUAcQB1AGUAbgB6CAAAAAAGAAAAJVVURi04IGVycm9yOiBvdmVybG9uZyA1LWJ5dGUg
-	c2VxdWVuY2UHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAATABVAFQARgAtADgALQBGAGUAaABs
-	AGUAcgA6ACAA3ABiAGUAcgBsAGEAbgBnAGUAIAA2AC0AQgB5AHQAZQAtAFMAZQBxAHUAZQBuAHoI
-	AAAAAAYAAAAlVVRGLTggZXJyb3I6IG92ZXJsb25nIDYtYnl0ZSBzZXF1ZW5jZQcAAAASUVJlZ3Vs
-	YXJFeHByZXNzaW9uAQMAAAAqAFwAIABhAG0AIABFAG4AZABlACAAZABlAHMAIABNAHUAcwB0AGUA
-	cgBzCAAAAAAGAAAAE1wgYXQgZW5kIG9mIHBhdHRlcm4HAAAAElFSZWd1bGFyRXhwcmVzc2lvbgED
-	AAAAZgBcAEMAIABpAHMAdAAgAGkAbgAgAGUAaQBuAGUAcgAgAEwAbwBvAGsAYgBlAGgAaQBuAGQA
-	LQBCAGUAZABpAG4AZwB1AG4AZwAgAG4AaQBjAGgAdAAgAHoAdQBsAOQAcwBzAGkAZwgAAAAABgAA
-	ACtcQyBpcyBub3QgYWxsb3dlZCBpbiBhIGxvb2tiZWhpbmQgYXNzZXJ0aW9uBwAAABJRUmVndWxh
-	ckV4cHJlc3Npb24BAwAAAF4AXABOACAAaQBzAHQAIABpAG4AbgBlAHIAaABhAGwAYgAgAGUAaQBu
-	AGUAcgAgAEsAbABhAHMAcwBlACAAbgBpAGMAaAB0ACAAdQBuAHQAZQByAHMAdAD8AHQAegB0CAAA
-	AAAGAAAAHlxOIGlzIG5vdCBzdXBwb3J0ZWQgaW4gYSBjbGFzcwcAAAASUVJlZ3VsYXJFeHByZXNz
-	aW9uAQMAAAAsAFwAYwAgAGEAbQAgAEUAbgBkAGUAIABkAGUAcwAgAE0AdQBzAHQAZQByAHMIAAAA
-	AAYAAAAUXGMgYXQgZW5kIG9mIHBhdHRlcm4HAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAfABh
-	AHUAZgAgAFwAYwAgAG0AdQBzAHMAIABlAGkAbgAgAEIAdQBjAGgAcwB0AGEAYgBlACAAbwBkAGUA
-	cgAgAGUAaQBuAGUAcwAgAGQAZQByACAAWgBlAGkAYwBoAGUAbgAgAFsAXABdAF4AXwA/ACAAZgBv
-	AGwAZwBlAG4IAAAAAAYAAAAwXGMgbXVzdCBiZSBmb2xsb3dlZCBieSBhIGxldHRlciBvciBvbmUg
-	b2YgW1xdXl8/BwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAF4AYQB1AGYAIABcAGMAIABtAHUA
-	cwBzACAAZQBpAG4AIABkAHIAdQBjAGsAYgBhAHIAZQBzACAAQQBTAEMASQBJAC0AWgBlAGkAYwBo
-	AGUAbgAgAGYAbwBsAGcAZQBuCAAAAAAGAAAAMlxjIG11c3QgYmUgZm9sbG93ZWQgYnkgYSBwcmlu
-	dGFibGUgQVNDSUkgY2hhcmFjdGVyBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAQAAYQB1AGYA
-	IABcAGcAIABmAG8AbABnAHQAIAB3AGUAZABlAHIAIABpAG4AIABBAG4AZgD8AGgAcgB1AG4AZwBz
-	AHoAZQBpAGMAaABlAG4ALAAgAGcAZQBzAGMAaAB3AGUAaQBmAHQAZQAgAG8AZABlAHIAIABlAGMA
-	awBpAGcAZQAgAEsAbABhAG0AbQBlAHIAbgAgAGUAaQBuAGcAZQBzAGMAaABsAG8AcwBzAGUAbgBl
-	ACAAWgBhAGgAbAAgAG8AZABlAHIAIABOAGEAbQBlACAAbgBvAGMAaAAgAGUAaQBuAGUAIABlAGkA
-	bgBmAGEAYwBoAGUAIABaAGEAaABsCAAAAAAGAAAAW1xnIGlzIG5vdCBmb2xsb3dlZCBieSBhIGJy
-	YWNlZCwgYW5nbGUtYnJhY2tldGVkLCBvciBxdW90ZWQgbmFtZS9udW1iZXIgb3IgYnkgYSBwbGFp
-	biBudW1iZXIHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAvABhAHUAZgAgAFwAawAgAGYAbwBs
-	AGcAdAAgAGsAZQBpAG4AIABpAG4AIABBAG4AZgD8AGgAcgB1AG4AZwBzAHoAZQBpAGMAaABlAG4A
-	LAAgAGcAZQBzAGMAaAB3AGUAaQBmAHQAZQAgAG8AZABlAHIAIABlAGMAawBpAGcAZQAgAEsAbABh
-	AG0AbQBlAHIAbgAgAGUAaQBuAGcAZQBzAGMAaABsAG8AcwBzAGUAbgBlAHIAIABOAGEAbQBlCAAA
-	AAAGAAAAP1xrIGlzIG5vdCBmb2xsb3dlZCBieSBhIGJyYWNlZCwgYW5nbGUtYnJhY2tldGVkLCBv
-	ciBxdW90ZWQgbmFtZQcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABcAGUAaQBuAGUAIABuAHUA
-	bQBtAGUAcgBpAGUAcgB0AGUAIABSAGUAZgBlAHIAZQBuAHoAIABkAGEAcgBmACAAbgBpAGMAaAB0
-	ACAATgB1AGwAbAAgAHMAZQBpAG4IAAAAAAYAAAAlYSBudW1iZXJlZCByZWZlcmVuY2UgbXVzdCBu
-	b3QgYmUgemVybwcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAB+AEEAcgBnAHUAbQBlAG4AdABl
-	ACAAZgD8AHIAIAAoACoAQQBDAEMARQBQAFQAKQAsACAAKAAqAEYAQQBJAEwAKQAsACAAbwBkAGUA
-	cgAgACgAKgBDAE8ATQBNAEkAVAApACAAbgBpAGMAaAB0ACAAegB1AGwA5ABzAHMAaQBnCAAAAAAG
-	AAAAP2FuIGFyZ3VtZW50IGlzIG5vdCBhbGxvd2VkIGZvciAoKkFDQ0VQVCksICgqRkFJTCksIG9y
-	ICgqQ09NTUlUKQcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABcAGEAdQBmACAAKAA/ACgAIABv
-	AGQAZQByACAAKAA/ACgAPwBDACkAIABtAHUAcwBzACAAZQBpAG4AZQAgAEIAZQBkAGkAbgBnAHUA
-	bgBnACAAZgBvAGwAZwBlAG4IAAAAAAYAAAAmYXNzZXJ0aW9uIGV4cGVjdGVkIGFmdGVyICg/KCBv
-	ciAoPyg/QykHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAhABEAEYAQQAtAE0AYQB0AGMAaABp
-	AG4AZwAgAHUAbgB0AGUAcgBzAHQA/AB0AHoAdAAgAGsAZQBpAG4AZQAgAFIA/ABjAGsAcgBlAGYA
-	ZQByAGUAbgB6AGUAbgAgAG8AZABlAHIAIABSAGUAawB1AHIAcwBpAG8AbgBzAHQAZQBzAHQAcwgA
-	AAAABgAAAEtiYWNrcmVmZXJlbmNlIGNvbmRpdGlvbiBvciByZWN1cnNpb24gdGVzdCBpcyBub3Qg
-	c3VwcG9ydGVkIGZvciBERkEgbWF0Y2hpbmcHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAKAB1
-	AG4AZwD8AGwAdABpAGcAZQAgAEoASQBUAC0ATwBwAHQAaQBvAG4IAAAAAAYAAAAOYmFkIEpJVCBv
-	cHRpb24HAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAKAB1AG4AZwD8AGwAdABpAGcAZQByACAA
-	RABhAHQAZQBuAHcAZQByAHQIAAAAAAYAAAAOYmFkIGRhdGEgdmFsdWUHAAAAElFSZWd1bGFyRXhw
-	cmVzc2lvbgEDAAAAZAB1AG4AZwD8AGwAdABpAGcAZQAgAEUAcwBjAGEAcABlAC0AUwBlAHEAdQBl
-	AG4AegAgAGkAbgAgAEUAcgBzAGUAdAB6AHUAbgBnAHMAegBlAGkAYwBoAGUAbgBrAGUAdAB0AGUI
-	AAAAAAYAAAApYmFkIGVzY2FwZSBzZXF1ZW5jZSBpbiByZXBsYWNlbWVudCBzdHJpbmcHAAAAElFS
-	ZWd1bGFyRXhwcmVzc2lvbgEDAAAAUgB1AG4AZwD8AGwAdABpAGcAZQByACAATwBmAGYAcwBlAHQA
-	IABpAG4AIABkAGkAZQAgAFUAVABGAC0AWgBlAGkAYwBoAGUAbgBrAGUAdAB0AGUIAAAAAAYAAAAa
-	YmFkIG9mZnNldCBpbnRvIFVURiBzdHJpbmcHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAALAB1
-	AG4AZwD8AGwAdABpAGcAZQByACAATwBmAGYAcwBlAHQALQBXAGUAcgB0CAAAAAAGAAAAEGJhZCBv
-	ZmZzZXQgdmFsdWUHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAALAB1AG4AZwD8AGwAdABpAGcA
-	ZQByACAATwBwAHQAaQBvAG4AcwB3AGUAcgB0CAAAAAAGAAAAEGJhZCBvcHRpb24gdmFsdWUHAAAA
-	ElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAYAB1AG4AZwD8AGwAdABpAGcAZQAgAFMAdQBiAHMAdABp
-	AHQAdQB0AGkAbwBuACAAaQBuACAARQByAHMAZQB0AHoAdQBuAGcAcwB6AGUAaQBjAGgAZQBuAGsA
-	ZQB0AHQAZQgAAAAABgAAACZiYWQgc3Vic3RpdHV0aW9uIGluIHJlcGxhY2VtZW50IHN0cmluZwcA
-	AAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAAkAGMAYQBsAGwAbwB1AHQALQBGAGUAaABsAGUAcgBj
-	AG8AZABlCAAAAAAGAAAAEmNhbGxvdXQgZXJyb3IgY29kZQcAAAASUVJlZ3VsYXJFeHByZXNzaW9u
-	AQMAAABQAFoAZQBpAGMAaABlAG4AYwBvAGQAZQAgAGkAbgAgAFwAdQAuAC4ALgAtAFMAZQBxAHUA
-	ZQBuAHoAIABpAHMAdAAgAHoAdQAgAGcAcgBvAN8IAAAAAAYAAAA6Y2hhcmFjdGVyIGNvZGUgcG9p
-	bnQgdmFsdWUgaW4gXHUuLi4uIHNlcXVlbmNlIGlzIHRvbyBsYXJnZQcAAAASUVJlZ3VsYXJFeHBy
-	ZXNzaW9uAQMAAABSAFoAZQBpAGMAaABlAG4AYwBvAGQAZQAgAGkAbgAgAFwAeAB7AH0AIABvAGQA
-	ZQByACAAXABvAHsAfQAgAGkAcwB0ACAAegB1ACAAZwByAG8A3wgAAAAABgAAADdjaGFyYWN0ZXIg
-	Y29kZSBwb2ludCB2YWx1ZSBpbiBceHt9IG9yIFxve30gaXMgdG9vIGxhcmdlBwAAABJRUmVndWxh
-	ckV4cHJlc3Npb24BAwAAAEgAcwBjAGgAbABpAGUA3wBlAG4AZABlACAASwBsAGEAbQBtAGUAcgAg
-	AGYA/AByACAAKAA/AEMAIABlAHIAdwBhAHIAdABlAHQIAAAAAAYAAAAkY2xvc2luZyBwYXJlbnRo
-	ZXNpcyBmb3IgKD9DIGV4cGVjdGVkBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAGYAYgBlAGQA
-	aQBuAGcAdABlACAARwByAHUAcABwAGUAIABlAG4AdABoAOQAbAB0ACAAbQBlAGgAcgAgAGEAbABz
-	ACAAegB3AGUAaQAgAFYAZQByAHoAdwBlAGkAZwB1AG4AZwBlAG4IAAAAAAYAAAAxY29uZGl0aW9u
-	YWwgZ3JvdXAgY29udGFpbnMgbW9yZSB0aGFuIHR3byBicmFuY2hlcwcAAAASUVJlZ3VsYXJFeHBy
-	ZXNzaW9uAQMAAACWAHYAZQByAHMAYwBoAGkAZQBkAGUAbgBlACAATgBhAG0AZQBuACAAZgD8AHIA
-	IABVAG4AdABlAHIAbQB1AHMAdABlAHIAIABtAGkAdAAgAGQAZQByAHMAZQBsAGIAZQBuACAATgB1
-	AG0AbQBlAHIAIABzAGkAbgBkACAAbgBpAGMAaAB0ACAAegB1AGwA5ABzAHMAaQBnCAAAAAAGAAAA
-	QmRpZmZlcmVudCBuYW1lcyBmb3Igc3VicGF0dGVybnMgb2YgdGhlIHNhbWUgbnVtYmVyIGFyZSBu
-	b3QgYWxsb3dlZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAAwAFoAaQBmAGYAZQByACAAZQBy
-	AHcAYQByAHQAZQB0ACAAbgBhAGMAaAAgACgAPwArCAAAAAAGAAAAGGRpZ2l0IGV4cGVjdGVkIGFm
-	dGVyICg/KwcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABEAGYAZQBoAGwAZQBuAGQAZQAgAFoA
-	aQBmAGYAZQByAG4AIABpAG4AIABcAHgAewB9ACAAbwBkAGUAcgAgAFwAbwB7AH0IAAAAAAYAAAAe
-	ZGlnaXRzIG1pc3NpbmcgaW4gXHh7fSBvciBcb3t9BwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAA
-	AHgAbgBpAGMAaAB0ACAAegB1AGwA5ABzAHMAaQBnAGUAcgAgAFUAbgBpAGMAbwBkAGUALQBDAG8A
-	ZABlAC0AUABvAGkAbgB0ACAAKAA+AD0AIAAwAHgAZAA4ADAAMAAgACYAJgAgADwAPQAgADAAeABk
-	AGYAZgBmACkIAAAAAAYAAAA2ZGlzYWxsb3dlZCBVbmljb2RlIGNvZGUgcG9pbnQgKD49IDB4ZDgw
-	MCAmJiA8PSAweGRmZmYpBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAIQAcwBjAGgAbABpAGUA
-	3wBlAG4AZABlACAAZwBlAHMAYwBoAHcAZQBpAGYAdABlACAASwBsAGEAbQBtAGUAcgAgAGkAbgAg
-	AEUAcgBzAGUAdAB6AHUAbgBnAHMAegBlAGkAYwBoAGUAbgBrAGUAdAB0AGUAIABlAHIAdwBhAHIA
-	dABlAHQIAAAAAAYAAAA0ZXhwZWN0ZWQgY2xvc2luZyBjdXJseSBicmFja2V0IGluIHJlcGxhY2Vt
-	ZW50IHN0cmluZwcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABcAGUAcwAgAGsAbwBuAG4AdABl
-	ACAAawBlAGkAbgAgAEgAZQBhAHAALQBTAHAAZQBpAGMAaABlAHIAIABhAGwAbABvAHoAaQBpAGUA
-	cgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAeZmFpbGVkIHRvIGFsbG9jYXRlIGhlYXAgbWVtb3J5
-	BwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAFoARABGAEEALQBNAGEAdABjAGgAaQBuAGcAIAB1
-	AG4AdABlAHIAcwB0APwAdAB6AHQAIABkAGkAZQBzAGUAIABGAHUAbgBrAHQAaQBvAG4AIABuAGkA
-	YwBoAHQIAAAAAAYAAAAqZnVuY3Rpb24gaXMgbm90IHN1cHBvcnRlZCBmb3IgREZBIG1hdGNoaW5n
-	BwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAGAARwByAHUAcABwAGUAbgBuAGEAbQBlACAAZABh
-	AHIAZgAgAG4AaQBjAGgAdAAgAG0AaQB0ACAAZQBpAG4AZQByACAAWgBpAGYAZgBlAHIAIABiAGUA
-	ZwBpAG4AbgBlAG4IAAAAAAYAAAAmZ3JvdXAgbmFtZSBtdXN0IHN0YXJ0IHdpdGggYSBub24tZGln
-	aXQHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAATgBpAG4AdABlAHIAbgBlAHIAIABGAGUAaABs
-	AGUAcgAgAC0AIABNAHUAcwB0AGUAcgAgAPwAYgBlAHIAcwBjAGgAcgBpAGUAYgBlAG4APwgAAAAA
-	BgAAACVpbnRlcm5hbCBlcnJvciAtIHBhdHRlcm4gb3ZlcndyaXR0ZW4/BwAAABJRUmVndWxhckV4
-	cHJlc3Npb24BAwAAAHAAaQBuAHQAZQByAG4AZQByACAARgBlAGgAbABlAHIAIABpAG4AIABwAGMA
-	cgBlADIAXwBzAHQAdQBkAHkAKAApADoAIABTAG8AbABsAHQAZQAgAG4AaQBjAGgAdAAgAGEAdQBm
-	AHQAcgBlAHQAZQBuCAAAAAAGAAAAMWludGVybmFsIGVycm9yIGluIHBjcmUyX3N0dWR5KCk6IHNo
-	b3VsZCBub3Qgb2NjdXIHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAPABpAG4AdABlAHIAbgBl
-	AHIAIABGAGUAaABsAGUAcgA6ACAAQwBvAGQAZQAtANwAYgBlAHIAbABhAHUAZggAAAAABgAAAB1p
-	bnRlcm5hbCBlcnJvcjogY29kZSBvdmVyZmxvdwcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABa
-	AGkAbgB0AGUAcgBuAGUAcgAgAEYAZQBoAGwAZQByADoAIADcAGIAZQByAGwAYQB1AGYAIABpAG0A
-	IABLAG8AbQBwAGkAbABpAGUAcgBiAGUAcgBlAGkAYwBoCAAAAAAGAAAAK2ludGVybmFsIGVycm9y
-	OiBvdmVycmFuIGNvbXBpbGluZyB3b3Jrc3BhY2UHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAA
-	lgBpAG4AdABlAHIAbgBlAHIAIABGAGUAaABsAGUAcgA6ACAAYgBlAHIAZQBpAHQAcwAgAPwAYgBl
-	AHIAcAByAPwAZgB0AGUAIABSAGUAZgBlAHIAZQBuAHoAIABhAHUAZgAgAFUAbgB0AGUAcgBtAHUA
-	cwB0AGUAcgAgAG4AaQBjAGgAdAAgAGcAZQBmAHUAbgBkAGUAbggAAAAABgAAAEJpbnRlcm5hbCBl
-	cnJvcjogcHJldmlvdXNseS1jaGVja2VkIHJlZmVyZW5jZWQgc3VicGF0dGVybiBub3QgZm91bmQH
-	AAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAWABpAG4AdABlAHIAbgBlAHIAIABGAGUAaABsAGUA
-	cgA6ACAAVwBpAGUAZABlAHIAaABvAGwAdQBuAGcAIABuAGkAYwBoAHQAIABlAHIAdwBhAHIAdABl
-	AHQIAAAAAAYAAAAhaW50ZXJuYWwgZXJyb3I6IHVuZXhwZWN0ZWQgcmVwZWF0BwAAABJRUmVndWxh
-	ckV4cHJlc3Npb24BAwAAAGQAaQBuAHQAZQByAG4AZQByACAARgBlAGgAbABlAHIAOgAgAFUAbgBi
-	AGUAawBhAG4AbgB0AGUAIABaAGUAaQBsAGUAbgBlAG4AZABlAC0ARQBpAG4AcwB0AGUAbABsAHUA
-	bgBnCAAAAAAGAAAAJ2ludGVybmFsIGVycm9yOiB1bmtub3duIG5ld2xpbmUgc2V0dGluZwcAAAAS
-	UVJlZ3VsYXJFeHByZXNzaW9uAQMAAACAAGkAbgB0AGUAcgBuAGUAcgAgAEYAZQBoAGwAZQByADoA
-	IABVAG4AYgBlAGsAYQBuAG4AdABlAHIAIABPAHAAZQByAGEAdABpAG8AbgBzAGMAbwBkAGUAIABp
-	AG4AIABhAHUAdABvAF8AcABvAHMAcwBlAHMAcwBpAGYAeQAoACkIAAAAAAYAAAAzaW50ZXJuYWwg
-	ZXJyb3I6IHVua25vd24gb3Bjb2RlIGluIGF1dG9fcG9zc2Vzc2lmeSgpBwAAABJRUmVndWxhckV4
-	cHJlc3Npb24BAwAAAIIAaQBuAHQAZQByAG4AZQByACAARgBlAGgAbABlAHIAOgAgAFUAbgBiAGUA
-	awBhAG4AbgB0AGUAcgAgAE8AcABlAHIAYQB0AGkAbwBuAHMAYwBvAGQAZQAgAGkAbgAgAGYAaQBu
-	AGQAXwBmAGkAeABlAGQAbABlAG4AZwB0AGgAKAApCAAAAAAGAAAANGludGVybmFsIGVycm9yOiB1
-	bmtub3duIG9wY29kZSBpbiBmaW5kX2ZpeGVkbGVuZ3RoKCkHAAAAElFSZWd1bGFyRXhwcmVzc2lv
-	bgEDAAAAMgB1AG4AZwD8AGwAdABpAGcAZQAgAEIAZQBkAGkAbgBnAHUAbgBnACAAKAA/ACgAMAAp
-	CAAAAAAGAAAAF2ludmFsaWQgY29uZGl0aW9uICg/KDApBwAAABJRUmVndWxhckV4cHJlc3Npb24B
-	AwAAAGQAdQBuAGcA/ABsAHQAaQBnAGUAIABEAGEAdABlAG4AIABpAG0AIABBAHIAYgBlAGkAdABz
-	AGIAZQByAGUAaQBjAGgAIABmAPwAcgAgAEQARgBBAC0ATgBlAHUAcwB0AGEAcgB0CAAAAAAGAAAA
-	KWludmFsaWQgZGF0YSBpbiB3b3Jrc3BhY2UgZm9yIERGQSByZXN0YXJ0BwAAABJRUmVndWxhckV4
-	cHJlc3Npb24BAwAAAFAAdQBuAGcA/ABsAHQAaQBnAGUAIABFAHMAYwBhAHAAZQAtAFMAZQBxAHUA
-	ZQBuAHoAIABpAG4AIAAoACoAVgBFAFIAQgApAC0ATgBhAG0AZQgAAAAABgAAACdpbnZhbGlkIGVz
-	Y2FwZSBzZXF1ZW5jZSBpbiAoKlZFUkIpIG5hbWUHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAA
-	UgB1AG4AZwD8AGwAdABpAGcAZQAgAEUAcwBjAGEAcABlAC0AUwBlAHEAdQBlAG4AegAgAGkAbgAg
-	AFoAZQBpAGMAaABlAG4AawBsAGEAcwBzAGUIAAAAAAYAAAAqaW52YWxpZCBlc2NhcGUgc2VxdWVu
-	Y2UgaW4gY2hhcmFjdGVyIGNsYXNzBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAEYAdQBuAGcA
-	/ABsAHQAaQBnAGUAcgAgAEIAZQByAGUAaQBjAGgAIABpAG4AIABaAGUAaQBjAGgAZQBuAGsAbABh
-	AHMAcwBlCAAAAAAGAAAAIGludmFsaWQgcmFuZ2UgaW4gY2hhcmFjdGVyIGNsYXNzBwAAABJRUmVn
-	dWxhckV4cHJlc3Npb24BAwAAAEAAdQBuAGcA/ABsAHQAaQBnAGUAIABFAHIAcwBlAHQAegB1AG4A
-	ZwBzAHoAZQBpAGMAaABlAG4AawBlAHQAdABlCAAAAAAGAAAAGmludmFsaWQgcmVwbGFjZW1lbnQg
-	c3RyaW5nBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAIQAYQB1AGYAIAAoAD8APAAgAG8AZABl
-	AHIAIAAoAD8AJwAgAG0AdQBzAHMAIABlAGkAbgAgAEIAdQBjAGgAcwB0AGEAYgBlACAAbwBkAGUA
-	cgAgAFUAbgB0AGUAcgBzAHQAcgBpAGMAaAB6AGUAaQBjAGgAZQBuACAAZgBvAGwAZwBlAG4IAAAA
-	AAYAAAAubGV0dGVyIG9yIHVuZGVyc2NvcmUgZXhwZWN0ZWQgYWZ0ZXIgKD88IG9yICg/JwcAAAAS
-	UVJlZ3VsYXJFeHByZXNzaW9uAQMAAABUAGwAbwBvAGsAYgBlAGgAaQBuAGQAIABhAHMAcwBlAHIA
-	dABpAG8AbgAgAGgAYQB0ACAAawBlAGkAbgBlACAAZgBlAHMAdABlACAATADkAG4AZwBlCAAAAAAG
-	AAAAKGxvb2tiZWhpbmQgYXNzZXJ0aW9uIGlzIG5vdCBmaXhlZCBsZW5ndGgHAAAAElFSZWd1bGFy
-	RXhwcmVzc2lvbgEDAAAAQABsAG8AbwBrAGIAZQBoAGkAbgBkAC0AQgBlAGQAaQBuAGcAdQBuAGcA
-	IABpAHMAdAAgAHoAdQAgAGwAYQBuAGcIAAAAAAYAAAAgbG9va2JlaGluZCBhc3NlcnRpb24gaXMg
-	dG9vIGxvbmcHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAJgBtAGEAZwBpAHMAYwBoAGUAIABa
-	AGEAaABsACAAZgBlAGgAbAB0CAAAAAAGAAAAFG1hZ2ljIG51bWJlciBtaXNzaW5nBwAAABJRUmVn
-	dWxhckV4cHJlc3Npb24BAwAAAD4AZgBlAGgAbABlAHIAaABhAGYAdABlACAAXABQAC0AIABvAGQA
-	ZQByACAAXABwAC0AUwBlAHEAdQBlAG4AeggAAAAABgAAABttYWxmb3JtZWQgXFAgb3IgXHAgc2Vx
-	dWVuY2UHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAARABOAGEAbQBlACAAbwBkAGUAcgAgAE4A
-	dQBtAG0AZQByACAAbgBhAGMAaAAgACgAPwAoACAAdQBuAGcA/ABsAHQAaQBnCAAAAAAGAAAAIm1h
-	bGZvcm1lZCBudW1iZXIgb3IgbmFtZSBhZnRlciAoPygHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgED
-	AAAAMgBNAGEAdABjAGgALQBMAGkAbQBpAHQAIAD8AGIAZQByAHMAYwBoAHIAaQB0AHQAZQBuCAAA
-	AAAGAAAAFG1hdGNoIGxpbWl0IGV4Y2VlZGVkBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAJ4A
-	ZQBpAG4AIABNAGEAdABjAGgAIABtAGkAdAAgAGUAaQBuAGUAbQAgAHMAaQBjAGgAIAB2AG8AcgAg
-	AGQAZQBtACAAQQBuAGYAYQBuAGcAIABiAGUAZgBpAG4AZABlAG4AZABlAG4AIABFAG4AZABlACAA
-	dwBpAHIAZAAgAG4AaQBjAGgAdAAgAHUAbgB0AGUAcgBzAHQA/AB0AHoAdAgAAAAABgAAACxtYXRj
-	aCB3aXRoIGVuZCBiZWZvcmUgc3RhcnQgaXMgbm90IHN1cHBvcnRlZAcAAAASUVJlZ3VsYXJFeHBy
-	ZXNzaW9uAQMAAAA0ACkAIABmAGUAaABsAHQAIABuAGEAYwBoACAAKAA/ACMAIABLAG8AbQBtAGUA
-	bgB0AGEAcggAAAAABgAAABttaXNzaW5nICkgYWZ0ZXIgKD8jIGNvbW1lbnQHAAAAElFSZWd1bGFy
-	RXhwcmVzc2lvbgEDAAAAOABmAGUAaABsAGUAbgBkAGUAIABzAGMAaABsAGkAZQDfAGUAbgBkAGUA
-	IABLAGwAYQBtAG0AZQByCAAAAAAGAAAAG21pc3NpbmcgY2xvc2luZyBwYXJlbnRoZXNpcwcAAAAS
-	UVJlZ3VsYXJFeHByZXNzaW9uAQMAAAA8APYAZgBmAG4AZQBuAGQAZQAgAEsAbABhAG0AbQBlAHIA
-	IABmAGUAaABsAHQAIABuAGEAYwBoACAAXABvCAAAAAAGAAAAHm1pc3Npbmcgb3BlbmluZyBicmFj
-	ZSBhZnRlciBcbwcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABkAHMAYwBoAGwAaQBlAN8AZQBu
-	AGQAZQAgAGUAYwBrAGkAZwBlACAASwBsAGEAbQBtAGUAcgAgAGYAZQBoAGwAdAAgAGIAZQBpACAA
-	WgBlAGkAYwBoAGUAbgBrAGwAYQBzAHMAZQgAAAAABgAAACltaXNzaW5nIHRlcm1pbmF0aW5nIF0g
-	Zm9yIGNoYXJhY3RlciBjbGFzcwcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAACSAGYAZQBoAGwA
-	ZQBuAGQAZQByACAAYQBiAHMAYwBoAGwAaQBlAN8AZQBuAGQAZQByACAAQgBlAGcAcgBlAG4AegBl
-	AHIAIABmAPwAcgAgAGMAYQBsAGwAbwB1AHQAIABtAGkAdAAgAFoAZQBpAGMAaABlAG4AawBlAHQA
-	dABlAG4ALQBBAHIAZwB1AG0AZQBuAHQIAAAAAAYAAAA+bWlzc2luZyB0ZXJtaW5hdGluZyBkZWxp
-	bWl0ZXIgZm9yIGNhbGxvdXQgd2l0aCBzdHJpbmcgYXJndW1lbnQHAAAAElFSZWd1bGFyRXhwcmVz
-	c2lvbgEDAAAAcABOAGEAbQBlACAAegB1ACAAbABhAG4AZwAgAGkAbgAgACgAKgBNAEEAUgBLACkA
-	LAAgACgAKgBQAFIAVQBOAEUAKQAsACAAKAAqAFMASwBJAFAAKQAsACAAbwBkAGUAcgAgACgAKgBU
-	AEgARQBOACkIAAAAAAYAAAA6bmFtZSBpcyB0b28gbG9uZyBpbiAoKk1BUkspLCAoKlBSVU5FKSwg
-	KCpTS0lQKSwgb3IgKCpUSEVOKQcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABmAGcAZQBzAGMA
-	aABhAGMAaAB0AGUAbAB0AGUAIABSAGUAawB1AHIAcwBpAG8AbgAgAGEAbgAgAGcAbABlAGkAYwBo
-	AGUAcgAgAFMAdQBiAGoAZQBrAHQAcABvAHMAaQB0AGkAbwBuCAAAAAAGAAAALW5lc3RlZCByZWN1
-	cnNpb24gYXQgdGhlIHNhbWUgc3ViamVjdCBwb3NpdGlvbgcAAAASUVJlZ3VsYXJFeHByZXNzaW9u
-	AQMAAAAWAGsAZQBpAG4AIABGAGUAaABsAGUAcggAAAAABgAAAAhubyBlcnJvcgcAAAASUVJlZ3Vs
-	YXJFeHByZXNzaW9uAQMAAAAqAGsAZQBpAG4AZQAgANwAYgBlAHIAZQBpAG4AcwB0AGkAbQBtAHUA
-	bgBnCAAAAAAGAAAACG5vIG1hdGNoBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAACQAawBlAGkA
-	bgAgAFMAcABlAGkAYwBoAGUAcgAgAG0AZQBoAHIIAAAAAAYAAAAObm8gbW9yZSBtZW1vcnkHAAAA
-	ElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAygBcAHgAewB9ACAAZQBuAHQAaADkAGwAdAAgAGUAaQBu
-	ACAAWgBlAGkAYwBoAGUAbgAsACAAZABhAHMAIABrAGUAaQBuAGUAIABIAGUAeABhAGQAZQB6AGkA
-	bQBhAGwAegBpAGYAZgBlAHIAIABpAHMAdAAgACgAZgBlAGgAbAB0ACAAZQB2AGUAbgB0AHUAZQBs
-	AGwAIABlAGkAbgBlACAAcwBjAGgAbABpAGUA3wBlAG4AZABlACAASwBsAGEAbQBtAGUAcgA/ACkI
-	AAAAAAYAAAAybm9uLWhleCBjaGFyYWN0ZXIgaW4gXHh7fSAoY2xvc2luZyBicmFjZSBtaXNzaW5n
-	PykHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAvgBcAG8AewB9ACAAZQBuAHQAaADkAGwAdAAg
-	AGUAaQBuACAAWgBlAGkAYwBoAGUAbgAsACAAZABhAHMAIABrAGUAaQBuAGUAIABPAGsAdABhAGwA
-	egBpAGYAZgBlAHIAIABpAHMAdAAgACgAZgBlAGgAbAB0ACAAZQB2AGUAbgB0AHUAZQBsAGwAIABl
-	AGkAbgBlACAAcwBjAGgAbABpAGUA3wBlAG4AZABlACAASwBsAGEAbQBtAGUAcgA/ACkIAAAAAAYA
-	AAA0bm9uLW9jdGFsIGNoYXJhY3RlciBpbiBcb3t9IChjbG9zaW5nIGJyYWNlIG1pc3Npbmc/KQcA
-	AAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABOAE4AYQBtAGUAIABkAGUAcwAgAFMAdQBiAHMAdABy
-	AGkAbgBnAHMAIABpAHMAdAAgAG4AaQBjAGgAdAAgAGUAaQBuAGQAZQB1AHQAaQBnCAAAAAAGAAAA
-	GW5vbi11bmlxdWUgc3Vic3RyaW5nIG5hbWUHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAWABk
-	AGkAZQAgAGEAdQBmACAAKAA/AEMAIABmAG8AbABnAGUAbgBkAGUAIABaAGEAaABsACAAaQBzAHQA
-	IABnAHIA9gDfAGUAcgAgAGEAbABzACAAMgA1ADUIAAAAAAYAAAAkbnVtYmVyIGFmdGVyICg/QyBp
-	cyBncmVhdGVyIHRoYW4gMjU1BwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAABoAegB1ACAAZwBy
-	AG8A3wBlACAAWgBhAGgAbAgAAAAABgAAABFudW1iZXIgaXMgdG9vIGJpZwcAAAASUVJlZ3VsYXJF
-	eHByZXNzaW9uAQMAAAA2AHoAdQAgAGcAcgBvAN8AZQAgAFoAYQBoAGwAIABiAGUAaQAgAHsAfQAt
-	AEEAbgBnAGEAYgBlCAAAAAAGAAAAH251bWJlciB0b28gYmlnIGluIHt9IHF1YW50aWZpZXIHAAAA
-	ElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAWABmAGEAbABzAGMAaABlACAAUgBlAGkAaABlAG4AZgBv
-	AGwAZwBlACAAZABlAHIAIABaAGEAaABsAGUAbgAgAGIAZQBpACAAewB9AC0AQQBuAGcAYQBiAGUI
-	AAAAAAYAAAAlbnVtYmVycyBvdXQgb2Ygb3JkZXIgaW4ge30gcXVhbnRpZmllcgcAAAASUVJlZ3Vs
-	YXJFeHByZXNzaW9uAQMAAABsAG8AawB0AGEAbABlAHIAIABXAGUAcgB0ACAAaQBzAHQAIABnAHIA
-	9gDfAGUAcgAgAGEAbABzACAAXAAzADcANwAgACgAbgBpAGMAaAB0ACAAaQBtACAAVQBUAEYAOAAt
-	AE0AbwBkAHUAcwApCAAAAAAGAAAAOG9jdGFsIHZhbHVlIGlzIGdyZWF0ZXIgdGhhbiBcMzc3IGlu
-	IDgtYml0IG5vbi1VVEYtOCBtb2RlBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAGAATwBmAGYA
-	cwBlAHQALQBMAGkAbQBpAHQAIABvAGgAbgBlACAAUABDAFIARQAyAF8AVQBTAEUAXwBPAEYARgBT
-	AEUAVABfAEwASQBNAEkAVAAgAGcAZQBzAGUAdAB6AHQIAAAAAAYAAAAvb2Zmc2V0IGxpbWl0IHNl
-	dCB3aXRob3V0IFBDUkUyX1VTRV9PRkZTRVRfTElNSVQHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgED
-	AAAAOgBLAGwAYQBtAG0AZQByAG4AIAB6AHUAIAB0AGkAZQBmACAAZwBlAHMAYwBoAGEAYwBoAHQA
-	ZQBsAHQIAAAAAAYAAAAhcGFyZW50aGVzZXMgYXJlIHRvbyBkZWVwbHkgbmVzdGVkBwAAABJRUmVn
-	dWxhckV4cHJlc3Npb24BAwAAAFoASwBsAGEAbQBtAGUAcgBuACAAegB1ACAAdABpAGUAZgAgAGcA
-	ZQBzAGMAaABhAGMAaAB0AGUAbAB0ACAAKABTAHQAYQBjAGsALQBQAHIA/ABmAHUAbgBnACkIAAAA
-	AAYAAAAvcGFyZW50aGVzZXMgYXJlIHRvbyBkZWVwbHkgbmVzdGVkIChzdGFjayBjaGVjaykHAAAA
-	ElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAMgB0AGUAaQBsAHcAZQBpAHMAZQAgANwAYgBlAHIAZQBp
-	AG4AcwB0AGkAbQBtAHUAbgBnCAAAAAAGAAAADXBhcnRpYWwgbWF0Y2gHAAAAElFSZWd1bGFyRXhw
-	cmVzc2lvbgEDAAAAggBkAGEAcwAgAE0AdQBzAHQAZQByACAAdwB1AHIAZABlACAAaQBtACAAZgBh
-	AGwAcwBjAGgAZQBuACAATQBvAGQAdQBzACAAawBvAG0AcABpAGwAaQBlAHIAdAA6ACAAOAAvADEA
-	NgAvADMAMgAtAEIAaQB0AC0ARgBlAGgAbABlAHIIAAAAAAYAAAAxcGF0dGVybiBjb21waWxlZCBp
-	biB3cm9uZyBtb2RlOiA4LzE2LzMyLWJpdCBlcnJvcgcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMA
-	AACWAGQAaQBlAHMAZQBzACAATQB1AHMAdABlAHIAIABlAG4AdABoAOQAbAB0ACAAZQBpAG4AIABJ
-	AHQAZQBtACwAIABkAGEAcwAgAHYAbwBuACAARABGAEEALQBNAGEAdABjAGgAaQBuAGcAIABuAGkA
-	YwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQAIAB3AGkAcgBkCAAAAAAGAAAAP3BhdHRlcm4g
-	Y29udGFpbnMgYW4gaXRlbSB0aGF0IGlzIG5vdCBzdXBwb3J0ZWQgZm9yIERGQSBtYXRjaGluZwcA
-	AAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAAyAE4AVQBMAEwAIABhAGwAcwAgAE0AdQBzAHQAZQBy
-	ACAA/ABiAGUAcgBnAGUAYgBlAG4IAAAAAAYAAAAWcGF0dGVybiBwYXNzZWQgYXMgTlVMTAcAAAAS
-	UVJlZ3VsYXJFeHByZXNzaW9uAQMAAACIAEwA5ABuAGcAZQAgAGQAZQBzACAATQB1AHMAdABlAHIA
-	cwAgAPwAYgBlAHIAcwBjAGgAcgBlAGkAdABlAHQAIABkAGEAcwAgAHYAbwBuACAAZABlAHIAIABB
-	AG4AdwBlAG4AZAB1AG4AZwAgAGcAZQBzAGUAdAB6AHQAZQAgAEwAaQBtAGkAdAgAAAAABgAAAD5w
-	YXR0ZXJuIHN0cmluZyBpcyBsb25nZXIgdGhhbiB0aGUgbGltaXQgc2V0IGJ5IHRoZSBhcHBsaWNh
-	dGlvbgcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABaAE0AdQBzAHQAZQByACAAdgBlAHIAdwBl
-	AG4AZABlAG4AIAB2AGUAcgBzAGMAaABpAGUAZABlAG4AZQAgAFoAZQBpAGMAaABlAG4AdABhAGIA
-	ZQBsAGwAZQBuCAAAAAAGAAAAMXBhdHRlcm5zIGRvIG5vdCBhbGwgdXNlIHRoZSBzYW1lIGNoYXJh
-	Y3RlciB0YWJsZXMHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAZABRAHUAYQBuAHQAaQBmAGkA
-	egBpAGUAcgBlAHIAIABmAG8AbABnAHQAIABhAHUAZgAgAG4AaQBjAGgAdAAtAHcAaQBlAGQAZQBy
-	AGgAbwBsAGIAYQByAGUAcwAgAEkAdABlAG0IAAAAAAYAAAAscXVhbnRpZmllciBkb2VzIG5vdCBm
-	b2xsb3cgYSByZXBlYXRhYmxlIGl0ZW0HAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAARgB1AG4A
-	ZwD8AGwAdABpAGcAZQByACAAQgBlAHIAZQBpAGMAaAAgAGkAbgAgAFoAZQBpAGMAaABlAG4AawBs
-	AGEAcwBzAGUIAAAAAAYAAAAlcmFuZ2Ugb3V0IG9mIG9yZGVyIGluIGNoYXJhY3RlciBjbGFzcwcA
-	AAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAA6AFIAZQBrAHUAcgBzAGkAbwBuAHMAbABpAG0AaQB0
-	ACAA/ABiAGUAcgBzAGMAaAByAGkAdAB0AGUAbggAAAAABgAAABhyZWN1cnNpb24gbGltaXQgZXhj
-	ZWVkZWQHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAUgBSAGUAZgBlAHIAZQBuAHoAIABhAHUA
-	ZgAgAG4AaQBjAGgAdAAgAGUAeABpAHMAdABlAG4AdABlAHMAIABVAG4AdABlAHIAbQB1AHMAdABl
-	AHIIAAAAAAYAAAAkcmVmZXJlbmNlIHRvIG5vbi1leGlzdGVudCBzdWJwYXR0ZXJuBwAAABJRUmVn
-	dWxhckV4cHJlc3Npb24BAwAAAEIAcgBlAGcAdQBsAOQAcgBlAHIAIABBAHUAcwBkAHIAdQBjAGsA
-	IAB6AHUAIABrAG8AbQBwAGwAaQB6AGkAZQByAHQIAAAAAAYAAAAlcmVndWxhciBleHByZXNzaW9u
-	IGlzIHRvbyBjb21wbGljYXRlZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAA0AHIAZQBnAHUA
-	bADkAHIAZQByACAAQQB1AHMAZAByAHUAYwBrACAAegB1ACAAZwByAG8A3wgAAAAABgAAAB9yZWd1
-	bGFyIGV4cHJlc3Npb24gaXMgdG9vIGxhcmdlBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAEQA
-	YQBuAGcAZQBmAG8AcgBkAGUAcgB0AGUAcgAgAFcAZQByAHQAIABuAGkAYwBoAHQAIAB2AGUAcgBm
-	APwAZwBiAGEAcggAAAAABgAAACByZXF1ZXN0ZWQgdmFsdWUgaXMgbm90IGF2YWlsYWJsZQcAAAAS
-	UVJlZ3VsYXJFeHByZXNzaW9uAQMAAABAAGEAbgBnAGUAZgBvAHIAZABlAHIAdABlAHIAIABXAGUA
-	cgB0ACAAbgBpAGMAaAB0ACAAZwBlAHMAZQB0AHoAdAgAAAAABgAAABpyZXF1ZXN0ZWQgdmFsdWUg
-	aXMgbm90IHNldAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAA8AE4AYQBtAGUAIABkAGUAcwAg
-	AFUAbgB0AGUAcgBtAHUAcwB0AGUAcgBzACAAZQByAHcAYQByAHQAZQB0CAAAAAAGAAAAGHN1YnBh
-	dHRlcm4gbmFtZSBleHBlY3RlZAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAB2AE4AYQBtAGUA
-	IABkAGUAcwAgAFUAbgB0AGUAcgBtAHUAcwB0AGUAcgBzACAAaQBzAHQAIAB6AHUAIABsAGEAbgBn
-	ACAAKABoAPYAYwBoAHMAdABlAG4AcwAgADEAMAAwADAAMAAgAFoAZQBpAGMAaABlAG4AKQgAAAAA
-	BgAAADZzdWJwYXR0ZXJuIG5hbWUgaXMgdG9vIGxvbmcgKG1heGltdW0gMTAwMDAgY2hhcmFjdGVy
-	cykHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAASABTAHkAbgB0AGEAeABmAGUAaABsAGUAcgAg
-	AGkAbgAgACgAPwAoAFYARQBSAFMASQBPAE4ALQBCAGUAZABpAG4AZwB1AG4AZwgAAAAABgAAACRz
-	eW50YXggZXJyb3IgaW4gKD8oVkVSU0lPTiBjb25kaXRpb24HAAAAElFSZWd1bGFyRXhwcmVzc2lv
-	bgEDAAAAfABTAHkAbgB0AGEAeABmAGUAaABsAGUAcgAgAGkAbgAgAE4AYQBtAGUAIABkAGUAcwAg
-	AFUAbgB0AGUAcgBtAHUAcwB0AGUAcgBzACAAKABmAGUAaABsAGUAbgBkAGUAcwAgAFQAcgBlAG4A
-	bgB6AGUAaQBjAGgAZQBuACkIAAAAAAYAAAA0c3ludGF4IGVycm9yIGluIHN1YnBhdHRlcm4gbmFt
-	ZSAobWlzc2luZyB0ZXJtaW5hdG9yKQcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABiAGQAaQBl
-	AHMAZQAgAFYAZQByAHMAaQBvAG4AIAB2AG8AbgAgAFAAQwBSAEUAMgAgAHUAbgB0AGUAcgBzAHQA
-	/AB0AHoAdAAgAFUAbgBpAGMAbwBkAGUAIABuAGkAYwBoAHQIAAAAAAYAAAAzdGhpcyB2ZXJzaW9u
-	IG9mIFBDUkUyIGRvZXMgbm90IGhhdmUgVW5pY29kZSBzdXBwb3J0BwAAABJRUmVndWxhckV4cHJl
-	c3Npb24BAwAAAHIAZABpAGUAcwBlACAAVgBlAHIAcwBpAG8AbgAgAHYAbwBuACAAUABDAFIARQAy
-	ACAAdQBuAHQAZQByAHMAdAD8AHQAegB0ACAAXABQACwAIABcAHAALAAgAG8AZABlAHIAIABcAFgA
-	IABuAGkAYwBoAHQIAAAAAAYAAAA9dGhpcyB2ZXJzaW9uIG9mIFBDUkUyIGRvZXMgbm90IGhhdmUg
-	c3VwcG9ydCBmb3IgXFAsIFxwLCBvciBcWAcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABYAHoA
-	dQB2AGkAZQBsAGUAIABiAGUAbgBhAG4AbgB0AGUAIABVAG4AdABlAHIAbQB1AHMAdABlAHIAIAAo
-	AGgA9gBjAGgAcwB0AGUAbgBzACAAMgA1ADYAKQgAAAAABgAAACh0b28gbWFueSBuYW1lZCBzdWJw
-	YXR0ZXJucyAobWF4aW11bSAyNTYpBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAEwAegB1AHYA
-	aQBlAGwAZQAgAEUAcgBzAGUAdAB6AHUAbgBnAGUAbgAgACgAbQBlAGgAcgAgAGEAbABzACAASQBO
-	AFQAXwBNAEEAWAApCAAAAAAGAAAAKXRvbyBtYW55IHJlcGxhY2VtZW50cyAobW9yZSB0aGFuIElO
-	VF9NQVgpBwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAEYAegB1ACAAdABpAGUAZgBlACAAUgBl
-	AGsAdQByAHMAaQBvAG4AIABmAPwAcgAgAEQARgBBAC0ATQBhAHQAYwBoAGkAbgBnCAAAAAAGAAAA
-	I3RvbyBtdWNoIHJlY3Vyc2lvbiBmb3IgREZBIG1hdGNoaW5nBwAAABJRUmVndWxhckV4cHJlc3Np
-	b24BAwAAALYAegB3AGUAaQAgAGIAZQBuAGEAbgBuAG4AdABlACAAVQBuAHQAZQByAG0AdQBzAHQA
-	ZQByACAAaABhAGIAZQBuACAAZQBpAG4AZQBuACAAaQBkAGUAbgB0AGkAcwBjAGgAZQBuACAATgBh
-	AG0AZQBuACAAKABQAEMAUgBFADIAXwBEAFUAUABOAEEATQBFAFMAIABpAHMAdAAgAG4AaQBjAGgA
-	dAAgAGcAZQBzAGUAdAB6AHQAKQgAAAAABgAAAEF0d28gbmFtZWQgc3VicGF0dGVybnMgaGF2ZSB0
-	aGUgc2FtZSBuYW1lIChQQ1JFMl9EVVBOQU1FUyBub3Qgc2V0KQcAAAASUVJlZ3VsYXJFeHByZXNz
-	aW9uAQMAAAA6AHUAbgBiAGUAawBhAG4AbgB0AGUAcgAgAFAATwBTAEkAWAAtAEsAbABhAHMAcwBl
-	AG4AbgBhAG0AZQgAAAAABgAAABh1bmtub3duIFBPU0lYIGNsYXNzIG5hbWUHAAAAElFSZWd1bGFy
-	RXhwcmVzc2lvbgEDAAAAWAB1AG4AYgBlAGsAYQBuAG4AdABlAHIAIABFAGkAZwBlAG4AcwBjAGgA
-	YQBmAHQAcwBuAGEAbQBlACAAbgBhAGMAaAAgAFwAUAAgAG8AZABlAHIAIABcAHAIAAAAAAYAAAAk
-	dW5rbm93biBwcm9wZXJ0eSBuYW1lIGFmdGVyIFxQIG9yIFxwBwAAABJRUmVndWxhckV4cHJlc3Np
-	b24BAwAAACoAdQBuAGIAZQBrAGEAbgBuAHQAZQByACAAUwB1AGIAcwB0AHIAaQBuAGcIAAAAAAYA
-	AAARdW5rbm93biBzdWJzdHJpbmcHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAPgD8AGIAZQBy
-	AHoA5ABoAGwAaQBnAGUAIABzAGMAaABsAGkAZQDfAGUAbgBkAGUAIABLAGwAYQBtAG0AZQByCAAA
-	AAAGAAAAHXVubWF0Y2hlZCBjbG9zaW5nIHBhcmVudGhlc2lzBwAAABJRUmVndWxhckV4cHJlc3Np
-	b24BAwAAAF4AdQBuAGIAZQBrAGEAbgBuAHQAZQAgAEIAaQB0AHMAIABiAGUAaQAgAEsAbwBtAHAA
-	aQBsAGkAZQByAHUAbgBnAHMAbwBwAHQAaQBvAG4AIABnAGUAcwBlAHQAegB0CAAAAAAGAAAAJ3Vu
-	cmVjb2duaXNlZCBjb21waWxlLXRpbWUgb3B0aW9uIGJpdChzKQcAAAASUVJlZ3VsYXJFeHByZXNz
-	aW9uAQMAAABMAFoAZQBpAGMAaABlAG4AIABuAGkAYwBoAHQAIABlAHIAawBhAG4AbgB0ACAAbgBh
-	AGMAaAAgACgAPwAgAG8AZABlAHIAIAAoAD8ALQgAAAAABgAAACZ1bnJlY29nbml6ZWQgY2hhcmFj
-	dGVyIGFmdGVyICg/IG9yICg/LQcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAA8AFoAZQBpAGMA
-	aABlAG4AIABuAGkAYwBoAHQAIABlAHIAawBhAG4AbgB0ACAAbgBhAGMAaAAgACgAPwBQCAAAAAAG
-	AAAAIHVucmVjb2duaXplZCBjaGFyYWN0ZXIgYWZ0ZXIgKD9QBwAAABJRUmVndWxhckV4cHJlc3Np
-	b24BAwAAADwATgBpAGMAaAB0ACAAZQByAGsAYQBuAG4AdABlAHMAIABaAGUAaQBjAGgAZQBuACAA
-	bgBhAGMAaAAgAFwIAAAAAAYAAAAgdW5yZWNvZ25pemVkIGNoYXJhY3RlciBmb2xsb3dzIFwHAAAA
-	ElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAagBhAHUAZgAgACgAPwBDACAAZgBvAGwAZwB0ACAAZQBp
-	AG4AIAB1AG4AYgBlAGsAYQBuAG4AdABlAHIAIABaAGUAaQBjAGgAZQBuAGsAZQB0AHQAZQBuAC0A
-	QgBlAGcAcgBlAG4AegBlAHIIAAAAAAYAAAApdW5yZWNvZ25pemVkIHN0cmluZyBkZWxpbWl0ZXIg
-	Zm9sbG93cyAoP0MHAAAAElFSZWd1bGFyRXhwcmVzc2lvbgEDAAAAZABVAEMAUAAtAFYAZQByAHcA
-	ZQBuAGQAdQBuAGcAIABpAHMAdAAgAGQAdQByAGMAaAAgAGQAaQBlACAAQQBuAHcAZQBuAGQAdQBu
-	AGcAIABkAGUAYQBrAHQAaQB2AGkAZQByAHQIAAAAAAYAAAAodXNpbmcgVUNQIGlzIGRpc2FibGVk
-	IGJ5IHRoZSBhcHBsaWNhdGlvbgcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAABcAFUAVABGAC0A
-	VgBlAHIAdwBlAG4AZAB1AG4AZwAgAGQAdQByAGMAaAAgAGQAaQBlACAAQQBuAHcAZQBuAGQAdQBu
-	AGcAIABkAGUAYQBrAHQAaQB2AGkAZQByAHQIAAAAAAYAAAAodXNpbmcgVVRGIGlzIGRpc2FibGVk
-	IGJ5IHRoZSBhcHBsaWNhdGlvbgcAAAASUVJlZ3VsYXJFeHByZXNzaW9uAQMAAAByAGQAaQBlACAA
-	VgBlAHIAdwBlAG4AZAB1AG4AZwAgAHYAbwBuACAAXABDACAAaQBzAHQAIABkAHUAcgBjAGgAIABk
-	AGkAZQAgAEEAbgB3AGUAbgBkAHUAbgBnACAAZABlAGEAawB0AGkAdgBpAGUAcgB0CAAAAAAGAAAA
-	J3VzaW5nIFxDIGlzIGRpc2FibGVkIGJ5IHRoZSBhcHBsaWNhdGlvbgcAAAASUVJlZ3VsYXJFeHBy
-	ZXNzaW9uAQMAAACAAGQAaQBlACAAVgBlAHIAdwBlAG4AZAB1AG4AZwAgAHYAbwBuACAAXABDACAA
-	aQBzAHQAIABpAG4AIABkAGkAZQBzAGUAcgAgAFAAQwBSAEUAMgAtAEIAaQBiAGwAaQBvAHQAaABl
-	AGsAIABkAGUAYQBrAHQAaQB2AGkAZQByAHQIAAAAAAYAAAAqdXNpbmcgXEMgaXMgZGlzYWJsZWQg
-	aW4gdGhpcyBQQ1JFMiBsaWJyYXJ5BwAAABJRUmVndWxhckV4cHJlc3Npb24BAwAAAHIARwByAPYA
-	3wBlACAAZABlAHMAIABBAHIAYgBlAGkAdABzAGIAZQByAGUAaQBjAGgAZQBzACAAYgBlAGkAIABE
-	AEYAQQAtAE0AYQB0AGMAaABpAG4AZwAgAPwAYgBlAHIAcwBjAGgAcgBpAHQAdABlAG4IAAAAAAYA
-	AAAnd29ya3NwYWNlIHNpemUgZXhjZWVkZWQgaW4gREZBIG1hdGNoaW5nBwAAABJRUmVndWxhckV4
-	cHJlc3Npb24BAwAAAGgARABpAGUAIABEAGEAdABlAG4AYgBhAG4AawB2AGUAcgBiAGkAbgBkAHUA
-	bgBnACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUA9gBmAGYAbgBlAHQAIAB3AGUAcgBk
-	AGUAbggAAAAABgAAABZFcnJvciBvcGVuaW5nIGRhdGFiYXNlBwAAAA5RU1FMaXRlMkRyaXZlcgED
-	AAAAWABFAHMAIABrAG8AbgBuAHQAZQAgAGsAZQBpAG4AZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8A
-	bgAgAGcAZQBzAHQAYQByAHQAZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbVW5hYmxlIHRvIGJl
-	Z2luIHRyYW5zYWN0aW9uBwAAAA5RU1FMaXRlMkRyaXZlcgEDAAAAqABEAGkAZQAgAFQAcgBhAG4A
-	cwBhAGsAdABpAG8AbgAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZAB1AHIAYwBoAGcAZQBm
-	APwAaAByAHQAIAB3AGUAcgBkAGUAbgAgACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAGMAbwBtAG0A
-	aQB0ACcAIABmAGUAaABsAGcAZQBzAGMAaABsAGEAZwBlAG4AKQgAAAAABgAAABxVbmFibGUgdG8g
-	Y29tbWl0IHRyYW5zYWN0aW9uBwAAAA5RU1FMaXRlMkRyaXZlcgEDAAAAaABEAGkAZQAgAFQAcgBh
-	AG4AcwBhAGsAdABpAG8AbgAgAGsAYQBuAG4AIABuAGkAYwBoAHQAIAByAPwAYwBrAGcA5ABuAGcA
-	aQBnACAAZwBlAG0AYQBjAGgAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAHlVuYWJsZSB0byByb2xs
-	YmFjayB0cmFuc2FjdGlvbgcAAAAOUVNRTGl0ZTJEcml2ZXIBAwAAAFIARABlAHIAIABCAGUAZgBl
-	AGgAbAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQB1AHMAZwBlAGYA/ABoAHIAdAAgAHcA
-	ZQByAGQAZQBuCAAAAAAGAAAAG1VuYWJsZSB0byBleGVjdXRlIHN0YXRlbWVudAcAAAAOUVNRTGl0
-	ZTJSZXN1bHQBAwAAAFIARABhAHMAIABFAHIAZwBlAGIAbgBpAHMAIABrAG8AbgBuAHQAZQAgAG4A
-	aQBjAGgAdAAgAGEAYgBnAGUAaABvAGwAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAF1VuYWJsZSB0
-	byBmZXRjaCByZXN1bHRzBwAAAA5RU1FMaXRlMlJlc3VsdAEDAAAAbgBEAGkAZQAgAEQAYQB0AGUA
-	bgBiAGEAbgBrAHYAZQByAGIAaQBuAGQAdQBuAGcAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAg
-	AGcAZQBzAGMAaABsAG8AcwBzAGUAbgAgAHcAZQByAGQAZQBuCAAAAAAGAAAAFkVycm9yIGNsb3Np
-	bmcgZGF0YWJhc2UHAAAADVFTUUxpdGVEcml2ZXIBAwAAAGgARABpAGUAIABEAGEAdABlAG4AYgBh
-	AG4AawB2AGUAcgBiAGkAbgBkAHUAbgBnACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUA
-	9gBmAGYAbgBlAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABZFcnJvciBvcGVuaW5nIGRhdGFiYXNl
-	BwAAAA1RU1FMaXRlRHJpdmVyAQMAAABYAEUAcwAgAGsAbwBuAG4AdABlACAAawBlAGkAbgBlACAA
-	VAByAGEAbgBzAGEAawB0AGkAbwBuACAAZwBlAHMAdABhAHIAdABlAHQAIAB3AGUAcgBkAGUAbggA
-	AAAABgAAABtVbmFibGUgdG8gYmVnaW4gdHJhbnNhY3Rpb24HAAAADVFTUUxpdGVEcml2ZXIBAwAA
-	AKgARABpAGUAIABUAHIAYQBuAHMAYQBrAHQAaQBvAG4AIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgA
-	dAAgAGQAdQByAGMAaABnAGUAZgD8AGgAcgB0ACAAdwBlAHIAZABlAG4AIAAoAE8AcABlAHIAYQB0
-	AGkAbwBuACAAJwBjAG8AbQBtAGkAdAAnACAAZgBlAGgAbABnAGUAcwBjAGgAbABhAGcAZQBuACkI
-	AAAAAAYAAAAcVW5hYmxlIHRvIGNvbW1pdCB0cmFuc2FjdGlvbgcAAAANUVNRTGl0ZURyaXZlcgED
-	AAAAuABEAGkAZQAgAFQAcgBhAG4AcwBhAGsAdABpAG8AbgAgAGsAbwBuAG4AdABlACAAbgBpAGMA
-	aAB0ACAAcgD8AGMAawBnAOQAbgBnAGkAZwAgAGcAZQBtAGEAYwBoAHQAIAB3AGUAcgBkAGUAbgAg
-	ACgATwBwAGUAcgBhAHQAaQBvAG4AIAAnAHIAbwBsAGwAYgBhAGMAawAnACAAZgBlAGgAbABnAGUA
-	cwBjAGgAbABhAGcAZQBuACkIAAAAAAYAAAAeVW5hYmxlIHRvIHJvbGxiYWNrIHRyYW5zYWN0aW9u
-	BwAAAA1RU1FMaXRlRHJpdmVyAQMAAAAYAEsAZQBpAG4AIABBAGIAZgByAGEAZwBlCAAAAAAGAAAA
-	CE5vIHF1ZXJ5BwAAAA1RU1FMaXRlUmVzdWx0AQMAAABGAEQAaQBlACAAQQBuAHoAYQBoAGwAIABk
-	AGUAcgAgAFAAYQByAGEAbQBlAHQAZQByACAAaQBzAHQAIABmAGEAbABzAGMAaAgAAAAABgAAABhQ
-	YXJhbWV0ZXIgY291bnQgbWlzbWF0Y2gHAAAADVFTUUxpdGVSZXN1bHQBAwAAAFYARABpAGUAIABQ
-	AGEAcgBhAG0AZQB0AGUAcgAgAGsAbwBuAG4AdABlAG4AIABuAGkAYwBoAHQAIABnAGUAYgB1AG4A
-	ZABlAG4AIAB3AGUAcgBkAGUAbggAAAAABgAAABlVbmFibGUgdG8gYmluZCBwYXJhbWV0ZXJzBwAA
-	AA1RU1FMaXRlUmVzdWx0AQMAAAB8AEUAcwAgAGsA9gBuAG4AZQBuACAAbgBpAGMAaAB0ACAAbQBl
-	AGgAcgBlAHIAZQAgAEIAZQBmAGUAaABsAGUAIABnAGwAZQBpAGMAaAB6AGUAaQB0AGkAZwAgAGEA
-	dQBzAGcAZQBmAPwAaAByAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAAC9VbmFibGUgdG8gZXhlY3V0
-	ZSBtdWx0aXBsZSBzdGF0ZW1lbnRzIGF0IGEgdGltZQcAAAANUVNRTGl0ZVJlc3VsdAEDAAAAUgBE
-	AGUAcgAgAEIAZQBmAGUAaABsACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABhAHUAcwBnAGUA
-	ZgD8AGgAcgB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAbVW5hYmxlIHRvIGV4ZWN1dGUgc3RhdGVt
-	ZW50BwAAAA1RU1FMaXRlUmVzdWx0AQMAAABUAEQAZQByACAARABhAHQAZQBuAHMAYQB0AHoAIABr
-	AG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGEAYgBnAGUAaABvAGwAdAAgAHcAZQByAGQAZQBuCAAA
-	AAAGAAAAE1VuYWJsZSB0byBmZXRjaCByb3cHAAAADVFTUUxpdGVSZXN1bHQBAwAAAFgARABlAHIA
-	IABCAGUAZgBlAGgAbAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAegB1AHIA/ABjAGsAZwBl
-	AHMAZQB0AHoAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAGVVuYWJsZSB0byByZXNldCBzdGF0ZW1l
-	bnQHAAAADVFTUUxpdGVSZXN1bHQBAwAAAFwARABpAGUAIABlAHgAaQBzAHQAaQBlAHIAZQBuAGQA
-	ZQAgAEQAYQB0AGUAaQAgACUAMQAgAGkAcwB0ACAAbgBpAGMAaAB0ACAAcwBjAGgAcgBlAGkAYgBi
-	AGEAcggAAAAABgAAACBFeGlzdGluZyBmaWxlICUxIGlzIG5vdCB3cml0YWJsZQcAAAAJUVNhdmVG
-	aWxlAQMAAABIAEQAYQB0AGUAaQBuAGEAbQBlACAAYgBlAHoAZQBpAGMAaABuAGUAdAAgAGUAaQBu
-	ACAAVgBlAHIAegBlAGkAYwBoAG4AaQBzCAAAAAAGAAAAHkZpbGVuYW1lIHJlZmVycyB0byBhIGRp
-	cmVjdG9yeQcAAAAJUVNhdmVGaWxlAQMAAADmAFEAUwBhAHYAZQBGAGkAbABlACAAawBhAG4AbgAg
-	ACcAJQAxACcAIABvAGgAbgBlACAAZABlAG4AIABEAGkAcgBlAGMAdAAtAFcAcgBpAHQAZQAtAEYA
-	YQBsAGwAYgBhAGMAawAgAG4AaQBjAGgAdAAgAPYAZgBmAG4AZQBuADsAIABkAGUAcgAgAFAAZgBh
-	AGQAIABlAG4AdABoAOQAbAB0ACAAZQBpAG4AZQAgAEEAbAB0AGUAcgBuAGEAdABlAC0ARABhAHQA
-	YQAtAFMAdAByAGUAYQBtAC0AQQBuAGcAYQBiAGUIAAAAAAYAAAByUVNhdmVGaWxlIGNhbm5vdCBv
-	cGVuICclMScgd2l0aG91dCBkaXJlY3Qgd3JpdGUgZmFsbGJhY2sgZW5hYmxlZDogcGF0aCBjb250
-	YWlucyBhbiBBbHRlcm5hdGUgRGF0YSBTdHJlYW0gc3BlY2lmaWVyBwAAAAlRU2F2ZUZpbGUBAwAA
-	AGIARABhAHMAIABTAGMAaAByAGUAaQBiAGUAbgAgAHcAdQByAGQAZQAgAHYAbwBuACAAZABlAHIA
-	IABBAG4AdwBlAG4AZAB1AG4AZwAgAGEAYgBnAGUAYgByAG8AYwBoAGUAbggAAAAABgAAAB9Xcml0
-	aW5nIGNhbmNlbGVkIGJ5IGFwcGxpY2F0aW9uBwAAAAlRU2F2ZUZpbGUBAwAAAAgARQBuAGQAZQgA
-	AAAABgAAAAZCb3R0b20HAAAAClFTY3JvbGxCYXIBAwAAABYATABpAG4AawBlAHIAIABSAGEAbgBk
-	CAAAAAAGAAAACUxlZnQgZWRnZQcAAAAKUVNjcm9sbEJhcgEDAAAAKgBFAGkAbgBlACAAUwBlAGkA
-	dABlACAAbgBhAGMAaAAgAHUAbgB0AGUAbggAAAAABgAAAAlQYWdlIGRvd24HAAAAClFTY3JvbGxC
-	YXIBAwAAACoARQBpAG4AZQAgAFMAZQBpAHQAZQAgAG4AYQBjAGgAIABsAGkAbgBrAHMIAAAAAAYA
-	AAAJUGFnZSBsZWZ0BwAAAApRU2Nyb2xsQmFyAQMAAAAsAEUAaQBuAGUAIABTAGUAaQB0AGUAIABu
-	AGEAYwBoACAAcgBlAGMAaAB0AHMIAAAAAAYAAAAKUGFnZSByaWdodAcAAAAKUVNjcm9sbEJhcgED
-	AAAAKABFAGkAbgBlACAAUwBlAGkAdABlACAAbgBhAGMAaAAgAG8AYgBlAG4IAAAAAAYAAAAHUGFn
-	ZSB1cAcAAAAKUVNjcm9sbEJhcgEDAAAAGABSAGUAYwBoAHQAZQByACAAUgBhAG4AZAgAAAAABgAA
-	AApSaWdodCBlZGdlBwAAAApRU2Nyb2xsQmFyAQMAAAAmAE4AYQBjAGgAIAB1AG4AdABlAG4AIABz
-	AGMAcgBvAGwAbABlAG4IAAAAAAYAAAALU2Nyb2xsIGRvd24HAAAAClFTY3JvbGxCYXIBAwAAACAA
-	SABpAGUAcgBoAGUAcgAgAHMAYwByAG8AbABsAGUAbggAAAAABgAAAAtTY3JvbGwgaGVyZQcAAAAK
-	UVNjcm9sbEJhcgEDAAAAJgBOAGEAYwBoACAAbABpAG4AawBzACAAcwBjAHIAbwBsAGwAZQBuCAAA
-	AAAGAAAAC1Njcm9sbCBsZWZ0BwAAAApRU2Nyb2xsQmFyAQMAAAAoAE4AYQBjAGgAIAByAGUAYwBo
-	AHQAcwAgAHMAYwByAG8AbABsAGUAbggAAAAABgAAAAxTY3JvbGwgcmlnaHQHAAAAClFTY3JvbGxC
-	YXIBAwAAACQATgBhAGMAaAAgAG8AYgBlAG4AIABzAGMAcgBvAGwAbABlAG4IAAAAAAYAAAAJU2Ny
-	b2xsIHVwBwAAAApRU2Nyb2xsQmFyAQMAAAAMAEEAbgBmAGEAbgBnCAAAAAAGAAAAA1RvcAcAAAAK
-	UVNjcm9sbEJhcgEDAAAAaABEAGUAcgAgAGUAbgB0AGYAZQByAG4AdABlACAAUgBlAGMAaABuAGUA
-	cgAgAGgAYQB0ACAAZABpAGUAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAZwBlAHMAYwBoAGwAbwBz
-	AHMAZQBuCAAAAAAGAAAAJVRoZSByZW1vdGUgaG9zdCBjbG9zZWQgdGhlIGNvbm5lY3Rpb24HAAAA
-	C1FTY3RwU29ja2V0AQMAAABWACUAMQA6ACAARABpAGUAIABVAG4AaQB4AC0AUwBjAGgAbAD8AHMA
-	cwBlAGwAZABhAHQAZQBpACAAZQB4AGkAcwB0AGkAZQByAHQAIABuAGkAYwBoAHQIAAAAAAYAAAAf
-	JTE6IFVOSVgga2V5IGZpbGUgZG9lc24ndCBleGlzdAcAAAANUVNoYXJlZE1lbW9yeQEDAAAAKgAl
-	ADEAOgAgAGUAeABpAHMAdABpAGUAcgB0ACAAYgBlAHIAZQBpAHQAcwgAAAAABgAAABIlMTogYWxy
-	ZWFkeSBleGlzdHMHAAAADVFTaGFyZWRNZW1vcnkBAwAAACYAJQAxADoAIABVAG4AZwD8AGwAdABp
-	AGcAZQByACAATgBhAG0AZQgAAAAABgAAAAwlMTogYmFkIG5hbWUHAAAADVFTaGFyZWRNZW1vcnkB
-	AwAAAHYAJQAxADoAIABEAGkAZQAgAEcAcgD2AN8AZQBuAGEAbgBnAGEAYgBlACAAZgD8AHIAIABk
-	AGkAZQAgAEUAcgB6AGUAdQBnAHUAbgBnACAAaQBzAHQAIABrAGwAZQBpAG4AZQByACAAYQBsAHMA
-	IABOAHUAbABsCAAAAAAGAAAAHiUxOiBjcmVhdGUgc2l6ZSBpcyBsZXNzIHRoZW4gMAcAAAANUVNo
-	YXJlZE1lbW9yeQEDAAAAJgAlADEAOgAgAGUAeABpAHMAdABpAGUAcgB0ACAAbgBpAGMAaAB0CAAA
-	AAAGAAAAESUxOiBkb2Vzbid0IGV4aXN0BwAAAA1RU2hhcmVkTWVtb3J5AQMAAABEACUAMQA6ACAA
-	ZgB0AG8AawAtAEEAdQBmAHIAdQBmACAAaQBzAHQAIABmAGUAaABsAGcAZQBzAGMAaABsAGEAZwBl
-	AG4IAAAAAAYAAAAPJTE6IGZ0b2sgZmFpbGVkBwAAAA1RU2hhcmVkTWVtb3J5AQMAAAAmACUAMQA6
-	ACAAVQBuAGcA/ABsAHQAaQBnAGUAIABHAHIA9gDfAGUIAAAAAAYAAAAQJTE6IGludmFsaWQgc2l6
-	ZQcAAAANUVNoYXJlZE1lbW9yeQEDAAAANAAlADEAOgAgAEYAZQBoAGwAZQByAGgAYQBmAHQAZQBy
-	ACAAUwBjAGgAbAD8AHMAcwBlAGwIAAAAAAYAAAANJTE6IGtleSBlcnJvcgcAAAANUVNoYXJlZE1l
-	bW9yeQEDAAAASAAlADEAOgAgAFUAbgBnAPwAbAB0AGkAZwBlACAAUwBjAGgAbAD8AHMAcwBlAGwA
-	YQBuAGcAYQBiAGUAIAAoAGwAZQBlAHIAKQgAAAAABgAAABAlMToga2V5IGlzIGVtcHR5BwAAAA1R
-	U2hhcmVkTWVtb3J5AQMAAAAmACUAMQA6ACAAbgBpAGMAaAB0ACAAdgBlAHIAYgB1AG4AZABlAG4I
-	AAAAAAYAAAAQJTE6IG5vdCBhdHRhY2hlZAcAAAANUVNoYXJlZE1lbW9yeQEDAAAARgAlADEAOgAg
-	AEsAZQBpAG4AZQAgAFIAZQBzAHMAbwB1AHIAYwBlAG4AIABtAGUAaAByACAAdgBlAHIAZgD8AGcA
-	YgBhAHIIAAAAAAYAAAAUJTE6IG91dCBvZiByZXNvdXJjZXMHAAAADVFTaGFyZWRNZW1vcnkBAwAA
-	ACwAJQAxADoAIABaAHUAZwByAGkAZgBmACAAdgBlAHIAdwBlAGkAZwBlAHIAdAgAAAAABgAAABUl
-	MTogcGVybWlzc2lvbiBkZW5pZWQHAAAADVFTaGFyZWRNZW1vcnkBAwAAAFgAJQAxADoAIABEAGkA
-	ZQAgAEEAYgBmAHIAYQBnAGUAIABkAGUAcgAgAEcAcgD2AN8AZQAgAGkAcwB0ACAAZgBlAGgAbABn
-	AGUAcwBjAGgAbABhAGcAZQBuCAAAAAAGAAAAFSUxOiBzaXplIHF1ZXJ5IGZhaWxlZAcAAAANUVNo
-	YXJlZE1lbW9yeQEDAAAAbAAlADEAOgAgAEUAaQBuACAAcwB5AHMAdABlAG0AYgBlAGQAaQBuAGcA
-	dABlAHMAIABMAGkAbQBpAHQAIABkAGUAcgAgAEcAcgD2AN8AZQAgAHcAdQByAGQAZQAgAGUAcgBy
-	AGUAaQBjAGgAdAgAAAAABgAAACQlMTogc3lzdGVtLWltcG9zZWQgc2l6ZSByZXN0cmljdGlvbnMH
-	AAAADVFTaGFyZWRNZW1vcnkBAwAAADYAJQAxADoAIABTAHAAZQByAHIAdQBuAGcAIABmAGUAaABs
-	AGcAZQBzAGMAaABsAGEAZwBlAG4IAAAAAAYAAAASJTE6IHVuYWJsZSB0byBsb2NrBwAAAA1RU2hh
-	cmVkTWVtb3J5AQMAAABSACUAMQA6ACAARQBzACAAawBhAG4AbgAgAGsAZQBpAG4AIABTAGMAaABs
-	APwAcwBzAGUAbAAgAGUAcgB6AGUAdQBnAHQAIAB3AGUAcgBkAGUAbggAAAAABgAAABYlMTogdW5h
-	YmxlIHRvIG1ha2Uga2V5BwAAAA1RU2hhcmVkTWVtb3J5AQMAAAB0ACUAMQA6ACAARQBzACAAawBh
-	AG4AbgAgAGsAZQBpAG4AIABTAGMAaABsAPwAcwBzAGUAbAAgAGYA/AByACAAZABpAGUAIABTAHAA
-	ZQByAHIAdQBuAGcAIABnAGUAcwBlAHQAegB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAdJTE6IHVu
-	YWJsZSB0byBzZXQga2V5IG9uIGxvY2sHAAAADVFTaGFyZWRNZW1vcnkBAwAAAF4AJQAxADoAIABE
-	AGkAZQAgAFMAcABlAHIAcgB1AG4AZwAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAYQB1AGYA
-	ZwBlAGgAbwBiAGUAbgAgAHcAZQByAGQAZQBuCAAAAAAGAAAAFCUxOiB1bmFibGUgdG8gdW5sb2Nr
-	BwAAAA1RU2hhcmVkTWVtb3J5AQMAAAAyACUAMQA6ACAAVQBuAGIAZQBrAGEAbgBuAHQAZQByACAA
-	RgBlAGgAbABlAHIAIAAlADIIAAAAAAYAAAAUJTE6IHVua25vd24gZXJyb3IgJTIHAAAADVFTaGFy
-	ZWRNZW1vcnkBAwAAAAIAKwgAAAAABgAAAAErBwAAAAlRU2hvcnRjdXQBAwAAACwATABlAHMAZQB6
-	AGUAaQBjAGgAZQBuACAAaABpAG4AegB1AGYA/ABnAGUAbggAAAAABgAAAAxBZGQgRmF2b3JpdGUH
-	AAAACVFTaG9ydGN1dAEDAAAAKgBIAGUAbABsAGkAZwBrAGUAaQB0ACAAZQBpAG4AcwB0AGUAbABs
-	AGUAbggAAAAABgAAABFBZGp1c3QgQnJpZ2h0bmVzcwcAAAAJUVNob3J0Y3V0AQMAAAAGAEEAbAB0
-	CAAAAAAGAAAAA0FsdAcAAAAJUVNob3J0Y3V0AQMAAAAeAEEAbgB3AGUAbgBkAHUAbgBnACAAbABp
-	AG4AawBzCAAAAAAGAAAAEEFwcGxpY2F0aW9uIExlZnQHAAAACVFTaG9ydGN1dAEDAAAAIABBAG4A
-	dwBlAG4AZAB1AG4AZwAgAHIAZQBjAGgAdABzCAAAAAAGAAAAEUFwcGxpY2F0aW9uIFJpZ2h0BwAA
-	AAlRU2hvcnRjdXQBAwAAACwAQQB1AGQAaQBvAHQAaQB0AGUAbAAgAHcAaQBlAGQAZQByAGgAbwBs
-	AGUAbggAAAAABgAAABFBdWRpbyBDeWNsZSBUcmFjawcAAAAJUVNob3J0Y3V0AQMAAAA+AEEAdQBk
-	AGkAbwAgAHoAdQBmAOQAbABsAGkAZwBlACAAQQB1AHMAdwBhAGgAbAAgAHMAcABpAGUAbABlAG4I
-	AAAAAAYAAAARQXVkaW8gUmFuZG9tIFBsYXkHAAAACVFTaG9ydGN1dAEDAAAAIgBBAHUAZABpAG8A
-	IAB3AGkAZQBkAGUAcgBoAG8AbABlAG4IAAAAAAYAAAAMQXVkaW8gUmVwZWF0BwAAAAlRU2hvcnRj
-	dXQBAwAAABAAQQBiAHcAZQBzAGUAbgBkCAAAAAAGAAAABEF3YXkHAAAACVFTaG9ydGN1dAEDAAAA
-	DABaAHUAcgD8AGMAawgAAAAABgAAAARCYWNrBwAAAAlRU2hvcnRjdXQBAwAAACgASABpAG4AdABl
-	AHIAcwB0AGUAcwAgAG4AYQBjAGgAIAB2AG8AcgBuCAAAAAAGAAAADEJhY2sgRm9yd2FyZAcAAAAJ
-	UVNob3J0Y3V0AQMAAAASAFIA/ABjAGsAdABhAHMAdABlCAAAAAAGAAAACUJhY2tzcGFjZQcAAAAJ
-	UVNob3J0Y3V0AQMAAAAQAFIA/ABjAGsALQBUAGEAYggAAAAABgAAAAdCYWNrdGFiBwAAAAlRU2hv
-	cnRjdXQBAwAAABQAQgBhAHMAcwAtAEIAbwBvAHMAdAgAAAAABgAAAApCYXNzIEJvb3N0BwAAAAlR
-	U2hvcnRjdXQBAwAAAAwAQgBhAHMAcwAgAC0IAAAAAAYAAAAJQmFzcyBEb3duBwAAAAlRU2hvcnRj
-	dXQBAwAAAAwAQgBhAHMAcwAgACsIAAAAAAYAAAAHQmFzcyBVcAcAAAAJUVNob3J0Y3V0AQMAAAAQ
-	AEIAYQB0AHQAZQByAGkAZQgAAAAABgAAAAdCYXR0ZXJ5BwAAAAlRU2hvcnRjdXQBAwAAAAgAQgBs
-	AGEAdQgAAAAABgAAAARCbHVlBwAAAAlRU2hvcnRjdXQBAwAAABIAQgBsAHUAZQB0AG8AbwB0AGgI
-	AAAAAAYAAAAJQmx1ZXRvb3RoBwAAAAlRU2hvcnRjdXQBAwAAAAgAQgB1AGMAaAgAAAAABgAAAARC
-	b29rBwAAAAlRU2hvcnRjdXQBAwAAAA4AQgByAG8AdwBzAGUAcggAAAAABgAAAAdCcm93c2VyBwAA
-	AAlRU2hvcnRjdXQBAwAAAAQAQwBECAAAAAAGAAAAAkNEBwAAAAlRU2hvcnRjdXQBAwAAAA4AUgBl
-	AGMAaABuAGUAcggAAAAABgAAAApDYWxjdWxhdG9yBwAAAAlRU2hvcnRjdXQBAwAAAAoAQQBuAHIA
-	dQBmCAAAAAAGAAAABENhbGwHAAAACVFTaG9ydGN1dAEDAAAAGgBTAGMAaABhAHIAZgBzAHQAZQBs
-	AGwAZQBuCAAAAAAGAAAADENhbWVyYSBGb2N1cwcAAAAJUVNob3J0Y3V0AQMAAAAQAEEAdQBzAGwA
-	9gBzAGUAcggAAAAABgAAAA5DYW1lcmEgU2h1dHRlcgcAAAAJUVNob3J0Y3V0AQMAAAASAEEAYgBi
-	AHIAZQBjAGgAZQBuCAAAAAAGAAAABkNhbmNlbAcAAAAJUVNob3J0Y3V0AQMAAAAcAEYAZQBzAHQA
-	cwB0AGUAbABsAHQAYQBzAHQAZQgAAAAABgAAAAlDYXBzIExvY2sHAAAACVFTaG9ydGN1dAEDAAAA
-	HABGAGUAcwB0AHMAdABlAGwAbAB0AGEAcwB0AGUIAAAAAAYAAAAIQ2Fwc0xvY2sHAAAACVFTaG9y
-	dGN1dAEDAAAAJgB2AG8AcgBhAG4AZwBlAGgAZQBuAGQAZQByACAASwBhAG4AYQBsCAAAAAAGAAAA
-	DENoYW5uZWwgRG93bgcAAAAJUVNob3J0Y3V0AQMAAAAcAG4A5ABjAGgAcwB0AGUAcgAgAEsAYQBu
-	AGEAbAgAAAAABgAAAApDaGFubmVsIFVwBwAAAAlRU2hvcnRjdXQBAwAAAA4ATAD2AHMAYwBoAGUA
-	bggAAAAABgAAAAVDbGVhcgcAAAAJUVNob3J0Y3V0AQMAAAAeAFoAdQBnAHIAaQBmAGYAIABsAPYA
-	cwBjAGgAZQBuCAAAAAAGAAAACkNsZWFyIEdyYWIHAAAACVFTaG9ydGN1dAEDAAAAEgBTAGMAaABs
-	AGkAZQDfAGUAbggAAAAABgAAAAVDbG9zZQcAAAAJUVNob3J0Y3V0AQMAAAAYAEMAbwBkAGUALQBF
-	AGkAbgBnAGEAYgBlCAAAAAAGAAAACkNvZGUgaW5wdXQHAAAACVFTaG9ydGN1dAEDAAAAEgBDAG8A
-	bQBtAHUAbgBpAHQAeQgAAAAABgAAAAlDb21tdW5pdHkHAAAACVFTaG9ydGN1dAEDAAAAEABLAG8A
-	bgB0AGUAeAB0ADEIAAAAAAYAAAAIQ29udGV4dDEHAAAACVFTaG9ydGN1dAEDAAAAEABLAG8AbgB0
-	AGUAeAB0ADIIAAAAAAYAAAAIQ29udGV4dDIHAAAACVFTaG9ydGN1dAEDAAAAEABLAG8AbgB0AGUA
-	eAB0ADMIAAAAAAYAAAAIQ29udGV4dDMHAAAACVFTaG9ydGN1dAEDAAAAEABLAG8AbgB0AGUAeAB0
-	ADQIAAAAAAYAAAAIQ29udGV4dDQHAAAACVFTaG9ydGN1dAEDAAAAEABLAG8AcABpAGUAcgBlAG4I
-	AAAAAAYAAAAEQ29weQcAAAAJUVNob3J0Y3V0AQMAAAAIAFMAdAByAGcIAAAAAAYAAAAEQ3RybAcA
-	AAAJUVNob3J0Y3V0AQMAAAAYAEEAdQBzAHMAYwBoAG4AZQBpAGQAZQBuCAAAAAAGAAAAA0N1dAcA
-	AAAJUVNob3J0Y3V0AQMAAAAGAEQATwBTCAAAAAAGAAAAA0RPUwcAAAAJUVNob3J0Y3V0AQMAAAAI
-	AEUAbgB0AGYIAAAAAAYAAAADRGVsBwAAAAlRU2hvcnRjdXQBAwAAAA4ATAD2AHMAYwBoAGUAbggA
-	AAAABgAAAAZEZWxldGUHAAAACVFTaG9ydGN1dAEDAAAAEABBAG4AegBlAGkAZwBlAG4IAAAAAAYA
-	AAAHRGlzcGxheQcAAAAJUVNob3J0Y3V0AQMAAAASAEQAbwBrAHUAbQBlAG4AdABlCAAAAAAGAAAA
-	CURvY3VtZW50cwcAAAAJUVNob3J0Y3V0AQMAAAAQAEgAZQByAHUAbgB0AGUAcggAAAAABgAAAARE
-	b3duBwAAAAlRU2hvcnRjdXQBAwAAABQARQBpAHMAdQAgAFMAaABpAGYAdAgAAAAABgAAAApFaXN1
-	IFNoaWZ0BwAAAAlRU2hvcnRjdXQBAwAAABYARQBpAHMAdQAgAHQAbwBnAGcAbABlCAAAAAAGAAAA
-	C0Vpc3UgdG9nZ2xlBwAAAAlRU2hvcnRjdXQBAwAAABIAQQB1AHMAdwBlAHIAZgBlAG4IAAAAAAYA
-	AAAFRWplY3QHAAAACVFTaG9ydGN1dAEDAAAACABFAG4AZABlCAAAAAAGAAAAA0VuZAcAAAAJUVNo
-	b3J0Y3V0AQMAAAAKAEUAbgB0AGUAcggAAAAABgAAAAVFbnRlcgcAAAAJUVNob3J0Y3V0AQMAAAAG
-	AEUAcwBjCAAAAAAGAAAAA0VzYwcAAAAJUVNob3J0Y3V0AQMAAAAMAEUAcwBjAGEAcABlCAAAAAAG
-	AAAABkVzY2FwZQcAAAAJUVNob3J0Y3V0AQMAAAASAEEAdQBzAGYA/ABoAHIAZQBuCAAAAAAGAAAA
-	B0V4ZWN1dGUHAAAACVFTaG9ydGN1dAEDAAAAEgBWAGUAcgBsAGEAcwBzAGUAbggAAAAABgAAAARF
-	eGl0BwAAAAlRU2hvcnRjdXQBAwAAAAYARgAlADEIAAAAAAYAAAADRiUxBwAAAAlRU2hvcnRjdXQB
-	AwAAABIARgBhAHYAbwByAGkAdABlAG4IAAAAAAYAAAAJRmF2b3JpdGVzBwAAAAlRU2hvcnRjdXQB
-	AwAAABAARgBpAG4AYQBuAHoAZQBuCAAAAAAGAAAAB0ZpbmFuY2UHAAAACVFTaG9ydGN1dAEDAAAA
-	DABTAHUAYwBoAGUAbggAAAAABgAAAARGaW5kBwAAAAlRU2hvcnRjdXQBAwAAABAAVQBtAGQAcgBl
-	AGgAZQBuCAAAAAAGAAAABEZsaXAHAAAACVFTaG9ydGN1dAEDAAAAEABWAG8AcgB3AOQAcgB0AHMI
-	AAAAAAYAAAAHRm9yd2FyZAcAAAAJUVNob3J0Y3V0AQMAAAAKAFMAcABpAGUAbAgAAAAABgAAAARH
-	YW1lBwAAAAlRU2hvcnRjdXQBAwAAAAYATABvAHMIAAAAAAYAAAACR28HAAAACVFTaG9ydGN1dAED
-	AAAACABHAHIA/ABuCAAAAAAGAAAABUdyZWVuBwAAAAlRU2hvcnRjdXQBAwAAABIAQQBuAGwAZQBp
-	AHQAdQBuAGcIAAAAAAYAAAAFR3VpZGUHAAAACVFTaG9ydGN1dAEDAAAADgBIAGEAbgBnAGUAdQBs
-	CAAAAAAGAAAABkhhbmd1bAcAAAAJUVNob3J0Y3V0AQMAAAAaAEgAYQBuAGcAZQB1AGwALQBCAGEA
-	bgBqAGEIAAAAAAYAAAAMSGFuZ3VsIEJhbmphBwAAAAlRU2hvcnRjdXQBAwAAABgASABhAG4AZwBl
-	AHUAbAAgAEUAbgBkAGUIAAAAAAYAAAAKSGFuZ3VsIEVuZAcAAAAJUVNob3J0Y3V0AQMAAAAaAEgA
-	YQBuAGcAZQB1AGwALQBIAGEAbgBqAGEIAAAAAAYAAAAMSGFuZ3VsIEhhbmphBwAAAAlRU2hvcnRj
-	dXQBAwAAABgASABhAG4AZwBlAHUAbAAtAEoAYQBtAG8IAAAAAAYAAAALSGFuZ3VsIEphbW8HAAAA
-	CVFTaG9ydGN1dAEDAAAAHABIAGEAbgBnAGUAdQBsAC0ASgBlAG8AbgBqAGEIAAAAAAYAAAANSGFu
-	Z3VsIEplb25qYQcAAAAJUVNob3J0Y3V0AQMAAAAiAEgAYQBuAGcAZQB1AGwALQBQAG8AcwB0AEgA
-	YQBuAGoAYQgAAAAABgAAABBIYW5ndWwgUG9zdEhhbmphBwAAAAlRU2hvcnRjdXQBAwAAACAASABh
-	AG4AZwBlAHUAbAAtAFAAcgBlAEgAYQBuAGoAYQgAAAAABgAAAA9IYW5ndWwgUHJlSGFuamEHAAAA
-	CVFTaG9ydGN1dAEDAAAAHABIAGEAbgBnAGUAdQBsAC0AUgBvAG0AYQBqAGEIAAAAAAYAAAANSGFu
-	Z3VsIFJvbWFqYQcAAAAJUVNob3J0Y3V0AQMAAAAeAEgAYQBuAGcAZQB1AGwAIABTAHAAZQBjAGkA
-	YQBsCAAAAAAGAAAADkhhbmd1bCBTcGVjaWFsBwAAAAlRU2hvcnRjdXQBAwAAABwASABhAG4AZwBl
-	AHUAbAAgAEEAbgBmAGEAbgBnCAAAAAAGAAAADEhhbmd1bCBTdGFydAcAAAAJUVNob3J0Y3V0AQMA
-	AAAQAEEAdQBmAGwAZQBnAGUAbggAAAAABgAAAAZIYW5ndXAHAAAACVFTaG9ydGN1dAEDAAAADgBI
-	AGEAbgBrAGEAawB1CAAAAAAGAAAAB0hhbmtha3UHAAAACVFTaG9ydGN1dAEDAAAACgBIAGkAbABm
-	AGUIAAAAAAYAAAAESGVscAcAAAAJUVNob3J0Y3V0AQMAAAAMAEgAZQBuAGsAYQBuCAAAAAAGAAAA
-	BkhlbmthbgcAAAAJUVNob3J0Y3V0AQMAAAASAEgAaQBiAGUAcgBuAGEAdABlCAAAAAAGAAAACUhp
-	YmVybmF0ZQcAAAAJUVNob3J0Y3V0AQMAAAAQAEgAaQByAGEAZwBhAG4AYQgAAAAABgAAAAhIaXJh
-	Z2FuYQcAAAAJUVNob3J0Y3V0AQMAAAAiAEgAaQByAGEAZwBhAG4AYQAgAEsAYQB0AGEAawBhAG4A
-	YQgAAAAABgAAABFIaXJhZ2FuYSBLYXRha2FuYQcAAAAJUVNob3J0Y3V0AQMAAAAOAFYAZQByAGwA
-	YQB1AGYIAAAAAAYAAAAHSGlzdG9yeQcAAAAJUVNob3J0Y3V0AQMAAAAIAFAAbwBzADEIAAAAAAYA
-	AAAESG9tZQcAAAAJUVNob3J0Y3V0AQMAAAAWAEgAbwBtAGUAIABPAGYAZgBpAGMAZQgAAAAABgAA
-	AAtIb21lIE9mZmljZQcAAAAJUVNob3J0Y3V0AQMAAAAUAFMAdABhAHIAdABzAGUAaQB0AGUIAAAA
-	AAYAAAAJSG9tZSBQYWdlBwAAAAlRU2hvcnRjdXQBAwAAACYARQBtAHAAZgBvAGgAbABlAG4AZQAg
-	AFYAZQByAHcAZQBpAHMAZQgAAAAABgAAAAlIb3QgTGlua3MHAAAACVFTaG9ydGN1dAEDAAAAFgBJ
-	AG4AZgBvAHIAbQBhAHQAaQBvAG4IAAAAAAYAAAAESW5mbwcAAAAJUVNob3J0Y3V0AQMAAAAKAEUA
-	aQBuAGYAZwgAAAAABgAAAANJbnMHAAAACVFTaG9ydGN1dAEDAAAAEABFAGkAbgBmAPwAZwBlAG4I
-	AAAAAAYAAAAGSW5zZXJ0BwAAAAlRU2hvcnRjdXQBAwAAABIASwBhAG4AYQAgAEwAbwBjAGsIAAAA
-	AAYAAAAJS2FuYSBMb2NrBwAAAAlRU2hvcnRjdXQBAwAAABQASwBhAG4AYQAgAFMAaABpAGYAdAgA
-	AAAABgAAAApLYW5hIFNoaWZ0BwAAAAlRU2hvcnRjdXQBAwAAAAoASwBhAG4AagBpCAAAAAAGAAAA
-	BUthbmppBwAAAAlRU2hvcnRjdXQBAwAAABAASwBhAHQAYQBrAGEAbgBhCAAAAAAGAAAACEthdGFr
-	YW5hBwAAAAlRU2hvcnRjdXQBAwAAADYAVABhAHMAdABhAHQAdQByAGIAZQBsAGUAdQBjAGgAdAB1
-	AG4AZwAgAGQAdQBuAGsAbABlAHIIAAAAAAYAAAAYS2V5Ym9hcmQgQnJpZ2h0bmVzcyBEb3duBwAA
-	AAlRU2hvcnRjdXQBAwAAADQAVABhAHMAdABhAHQAdQByAGIAZQBsAGUAdQBjAGgAdAB1AG4AZwAg
-	AGgAZQBsAGwAZQByCAAAAAAGAAAAFktleWJvYXJkIEJyaWdodG5lc3MgVXAHAAAACVFTaG9ydGN1
-	dAEDAAAANgBUAGEAcwB0AGEAdAB1AHIAYgBlAGwAZQB1AGMAaAB0AHUAbgBnACAARQBpAG4ALwBB
-	AHUAcwgAAAAABgAAABVLZXlib2FyZCBMaWdodCBPbi9PZmYHAAAACVFTaG9ydGN1dAEDAAAAGABU
-	AGEAcwB0AGEAdAB1AHIAbQBlAG4A/AgAAAAABgAAAA1LZXlib2FyZCBNZW51BwAAAAlRU2hvcnRj
-	dXQBAwAAACAAVwBhAGgAbAB3AGkAZQBkAGUAcgBoAG8AbAB1AG4AZwgAAAAABgAAABJMYXN0IE51
-	bWJlciBSZWRpYWwHAAAACVFTaG9ydGN1dAEDAAAAFgAoADAAKQAgAHMAdABhAHIAdABlAG4IAAAA
-	AAYAAAAKTGF1bmNoICgwKQcAAAAJUVNob3J0Y3V0AQMAAAAWACgAMQApACAAcwB0AGEAcgB0AGUA
-	bggAAAAABgAAAApMYXVuY2ggKDEpBwAAAAlRU2hvcnRjdXQBAwAAABYAKAAyACkAIABzAHQAYQBy
-	AHQAZQBuCAAAAAAGAAAACkxhdW5jaCAoMikHAAAACVFTaG9ydGN1dAEDAAAAFgAoADMAKQAgAHMA
-	dABhAHIAdABlAG4IAAAAAAYAAAAKTGF1bmNoICgzKQcAAAAJUVNob3J0Y3V0AQMAAAAWACgANAAp
-	ACAAcwB0AGEAcgB0AGUAbggAAAAABgAAAApMYXVuY2ggKDQpBwAAAAlRU2hvcnRjdXQBAwAAABYA
-	KAA1ACkAIABzAHQAYQByAHQAZQBuCAAAAAAGAAAACkxhdW5jaCAoNSkHAAAACVFTaG9ydGN1dAED
-	AAAAFgAoADYAKQAgAHMAdABhAHIAdABlAG4IAAAAAAYAAAAKTGF1bmNoICg2KQcAAAAJUVNob3J0
-	Y3V0AQMAAAAWACgANwApACAAcwB0AGEAcgB0AGUAbggAAAAABgAAAApMYXVuY2ggKDcpBwAAAAlR
-	U2hvcnRjdXQBAwAAABYAKAA4ACkAIABzAHQAYQByAHQAZQBuCAAAAAAGAAAACkxhdW5jaCAoOCkH
-	AAAACVFTaG9ydGN1dAEDAAAAFgAoADkAKQAgAHMAdABhAHIAdABlAG4IAAAAAAYAAAAKTGF1bmNo
-	ICg5KQcAAAAJUVNob3J0Y3V0AQMAAAAWACgAQQApACAAcwB0AGEAcgB0AGUAbggAAAAABgAAAApM
-	YXVuY2ggKEEpBwAAAAlRU2hvcnRjdXQBAwAAABYAKABCACkAIABzAHQAYQByAHQAZQBuCAAAAAAG
-	AAAACkxhdW5jaCAoQikHAAAACVFTaG9ydGN1dAEDAAAAFgAoAEMAKQAgAHMAdABhAHIAdABlAG4I
-	AAAAAAYAAAAKTGF1bmNoIChDKQcAAAAJUVNob3J0Y3V0AQMAAAAWACgARAApACAAcwB0AGEAcgB0
-	AGUAbggAAAAABgAAAApMYXVuY2ggKEQpBwAAAAlRU2hvcnRjdXQBAwAAABYAKABFACkAIABzAHQA
-	YQByAHQAZQBuCAAAAAAGAAAACkxhdW5jaCAoRSkHAAAACVFTaG9ydGN1dAEDAAAAFgAoAEYAKQAg
-	AHMAdABhAHIAdABlAG4IAAAAAAYAAAAKTGF1bmNoIChGKQcAAAAJUVNob3J0Y3V0AQMAAAAYAE0A
-	YQBpAGwAIABzAHQAYQByAHQAZQBuCAAAAAAGAAAAC0xhdW5jaCBNYWlsBwAAAAlRU2hvcnRjdXQB
-	AwAAACoATQBlAGQAaQBlAG4AcwBwAGkAZQBsAGUAcgAgAHMAdABhAHIAdABlAG4IAAAAAAYAAAAM
-	TGF1bmNoIE1lZGlhBwAAAAlRU2hvcnRjdXQBAwAAAAoATABpAG4AawBzCAAAAAAGAAAABExlZnQH
-	AAAACVFTaG9ydGN1dAEDAAAAFgBCAGUAbABlAHUAYwBoAHQAdQBuAGcIAAAAAAYAAAAJTGlnaHRC
-	dWxiBwAAAAlRU2hvcnRjdXQBAwAAAAwATABvAGcAbwBmAGYIAAAAAAYAAAAGTG9nb2ZmBwAAAAlR
-	U2hvcnRjdXQBAwAAABoAVwBlAGkAdABlAHIAbABlAGkAdAB1AG4AZwgAAAAABgAAAAxNYWlsIEZv
-	cndhcmQHAAAACVFTaG9ydGN1dAEDAAAACgBNAGEAcgBrAHQIAAAAAAYAAAAGTWFya2V0BwAAAAlR
-	U2hvcnRjdXQBAwAAAAwATQBhAHMAcwB5AG8IAAAAAAYAAAAGTWFzc3lvBwAAAAlRU2hvcnRjdXQB
-	AwAAACAATQBlAGQAaQB1AG0AIAB2AG8AcgBzAHAAdQBsAGUAbggAAAAABgAAABJNZWRpYSBGYXN0
-	IEZvcndhcmQHAAAACVFTaG9ydGN1dAEDAAAAEABOAOQAYwBoAHMAdABlAHIIAAAAAAYAAAAKTWVk
-	aWEgTmV4dAcAAAAJUVNob3J0Y3V0AQMAAAAKAFAAYQB1AHMAZQgAAAAABgAAAAtNZWRpYSBQYXVz
-	ZQcAAAAJUVNob3J0Y3V0AQMAAAAUAFcAaQBlAGQAZQByAGcAYQBiAGUIAAAAAAYAAAAKTWVkaWEg
-	UGxheQcAAAAJUVNob3J0Y3V0AQMAAAAUAFYAbwByAGgAZQByAGkAZwBlAHIIAAAAAAYAAAAOTWVk
-	aWEgUHJldmlvdXMHAAAACVFTaG9ydGN1dAEDAAAAFgBBAHUAZgB6AGUAaQBjAGgAbgBlAG4IAAAA
-	AAYAAAAMTWVkaWEgUmVjb3JkBwAAAAlRU2hvcnRjdXQBAwAAACYATQBlAGQAaQB1AG0AIAB6AHUA
-	cgD8AGMAawBzAHAAdQBsAGUAbggAAAAABgAAAAxNZWRpYSBSZXdpbmQHAAAACVFTaG9ydGN1dAED
-	AAAACgBTAHQAbwBwAHAIAAAAAAYAAAAKTWVkaWEgU3RvcAcAAAAJUVNob3J0Y3V0AQMAAAAOAE0A
-	ZQBlAHQAaQBuAGcIAAAAAAYAAAAHTWVldGluZwcAAAAJUVNob3J0Y3V0AQMAAAAIAE0AZQBuAPwI
-	AAAAAAYAAAAETWVudQcAAAAJUVNob3J0Y3V0AQMAAAAOAE0AZQBuAPwAIABQAEIIAAAAAAYAAAAH
-	TWVudSBQQgcAAAAJUVNob3J0Y3V0AQMAAAASAE0AZQBzAHMAZQBuAGcAZQByCAAAAAAGAAAACU1l
-	c3NlbmdlcgcAAAAJUVNob3J0Y3V0AQMAAAAIAE0AZQB0AGEIAAAAAAYAAAAETWV0YQcAAAAJUVNo
-	b3J0Y3V0AQMAAAAsAE0AaQBrAHIAbwBmAG8AbgAgAHMAdAB1AG0AbQBzAGMAaABhAGwAdABlAG4I
-	AAAAAAYAAAAPTWljcm9waG9uZSBNdXRlBwAAAAlRU2hvcnRjdXQBAwAAAB4ATQBpAGsAcgBvAGYA
-	bwBuACAAbABlAGkAcwBlAHIIAAAAAAYAAAAWTWljcm9waG9uZSBWb2x1bWUgRG93bgcAAAAJUVNo
-	b3J0Y3V0AQMAAAAeAE0AaQBrAHIAbwBmAG8AbgAgAGwAYQB1AHQAZQByCAAAAAAGAAAAFE1pY3Jv
-	cGhvbmUgVm9sdW1lIFVwBwAAAAlRU2hvcnRjdXQBAwAAAB4ATQBvAG4AaQB0AG8AcgAgAGQAdQBu
-	AGsAbABlAHIIAAAAAAYAAAAXTW9uaXRvciBCcmlnaHRuZXNzIERvd24HAAAACVFTaG9ydGN1dAED
-	AAAAHABNAG8AbgBpAHQAbwByACAAaABlAGwAbABlAHIIAAAAAAYAAAAVTW9uaXRvciBCcmlnaHRu
-	ZXNzIFVwBwAAAAlRU2hvcnRjdXQBAwAAABAATQB1AGgAZQBuAGsAYQBuCAAAAAAGAAAACE11aGVu
-	a2FuBwAAAAlRU2hvcnRjdXQBAwAAACQATQBlAGgAcgBlAHIAZQAgAFYAbwByAHMAYwBoAGwA5ABn
-	AGUIAAAAAAYAAAASTXVsdGlwbGUgQ2FuZGlkYXRlBwAAAAlRU2hvcnRjdXQBAwAAAAoATQB1AHMA
-	aQBrCAAAAAAGAAAABU11c2ljBwAAAAlRU2hvcnRjdXQBAwAAABQATQBlAGkAbgBlACAATwByAHQA
-	ZQgAAAAABgAAAAhNeSBTaXRlcwcAAAAJUVNob3J0Y3V0AQMAAAAGAE4AZQB1CAAAAAAGAAAAA05l
-	dwcAAAAJUVNob3J0Y3V0AQMAAAAWAE4AYQBjAGgAcgBpAGMAaAB0AGUAbggAAAAABgAAAAROZXdz
-	BwAAAAlRU2hvcnRjdXQBAwAAAAgATgBlAGkAbggAAAAABgAAAAJObwcAAAAJUVNob3J0Y3V0AQMA
-	AAAWAFoAYQBoAGwAZQBuAGIAbABvAGMAawgAAAAABgAAAANOdW0HAAAACVFTaG9ydGN1dAEDAAAA
-	KgBaAGEAaABsAGUAbgAtAEYAZQBzAHQAcwB0AGUAbABsAHQAYQBzAHQAZQgAAAAABgAAAAhOdW0g
-	TG9jawcAAAAJUVNob3J0Y3V0AQMAAAAqAFoAYQBoAGwAZQBuAC0ARgBlAHMAdABzAHQAZQBsAGwA
-	dABhAHMAdABlCAAAAAAGAAAAB051bUxvY2sHAAAACVFTaG9ydGN1dAEDAAAAKgBaAGEAaABsAGUA
-	bgAtAEYAZQBzAHQAcwB0AGUAbABsAHQAYQBzAHQAZQgAAAAABgAAAAtOdW1iZXIgTG9jawcAAAAJ
-	UVNob3J0Y3V0AQMAAAAMANYAZgBmAG4AZQBuCAAAAAAGAAAABE9wZW4HAAAACVFTaG9ydGN1dAED
-	AAAAFABVAFIATAAgAPYAZgBmAG4AZQBuCAAAAAAGAAAACE9wZW4gVVJMBwAAAAlRU2hvcnRjdXQB
-	AwAAAAwATwBwAHQAaQBvAG4IAAAAAAYAAAAGT3B0aW9uBwAAAAlRU2hvcnRjdXQBAwAAABgAQgBp
-	AGwAZAAgAGEAYgB3AOQAcgB0AHMIAAAAAAYAAAAJUGFnZSBEb3duBwAAAAlRU2hvcnRjdXQBAwAA
-	ABoAQgBpAGwAZAAgAGEAdQBmAHcA5AByAHQAcwgAAAAABgAAAAdQYWdlIFVwBwAAAAlRU2hvcnRj
-	dXQBAwAAABAARQBpAG4AZgD8AGcAZQBuCAAAAAAGAAAABVBhc3RlBwAAAAlRU2hvcnRjdXQBAwAA
-	AAoAUABhAHUAcwBlCAAAAAAGAAAABVBhdXNlBwAAAAlRU2hvcnRjdXQBAwAAABgAQgBpAGwAZAAg
-	AGEAYgB3AOQAcgB0AHMIAAAAAAYAAAAGUGdEb3duBwAAAAlRU2hvcnRjdXQBAwAAABoAQgBpAGwA
-	ZAAgAGEAdQBmAHcA5AByAHQAcwgAAAAABgAAAARQZ1VwBwAAAAlRU2hvcnRjdXQBAwAAAA4AVABl
-	AGwAZQBmAG8AbggAAAAABgAAAAVQaG9uZQcAAAAJUVNob3J0Y3V0AQMAAAAMAEIAaQBsAGQAZQBy
-	CAAAAAAGAAAACFBpY3R1cmVzBwAAAAlRU2hvcnRjdXQBAwAAABIAQQBiAHMAcABpAGUAbABlAG4I
-	AAAAAAYAAAAEUGxheQcAAAAJUVNob3J0Y3V0AQMAAAAWAEEAdQBzAHMAYwBoAGEAbAB0AGUAbggA
-	AAAABgAAAApQb3dlciBEb3duBwAAAAlRU2hvcnRjdXQBAwAAABYAQQB1AHMAcwBjAGgAYQBsAHQA
-	ZQBuCAAAAAAGAAAACVBvd2VyIE9mZgcAAAAJUVNob3J0Y3V0AQMAAAAoAFYAbwByAGgAZQByAGkA
-	ZwBlAHIAIABWAG8AcgBzAGMAaABsAGEAZwgAAAAABgAAABJQcmV2aW91cyBDYW5kaWRhdGUHAAAA
-	CVFTaG9ydGN1dAEDAAAACgBEAHIAdQBjAGsIAAAAAAYAAAAFUHJpbnQHAAAACVFTaG9ydGN1dAED
-	AAAAJABCAGkAbABkAHMAYwBoAGkAcgBtACAAZAByAHUAYwBrAGUAbggAAAAABgAAAAxQcmludCBT
-	Y3JlZW4HAAAACVFTaG9ydGN1dAEDAAAADgBEAHIAdQBjAGsAZQByCAAAAAAGAAAAB1ByaW50ZXIH
-	AAAACVFTaG9ydGN1dAEDAAAABgBSAG8AdAgAAAAABgAAAANSZWQHAAAACVFTaG9ydGN1dAEDAAAA
-	IABXAGkAZQBkAGUAcgBoAGUAcgBzAHQAZQBsAGwAZQBuCAAAAAAGAAAABFJlZG8HAAAACVFTaG9y
-	dGN1dAEDAAAAGgBBAGsAdAB1AGEAbABpAHMAaQBlAHIAZQBuCAAAAAAGAAAAB1JlZnJlc2gHAAAA
-	CVFTaG9ydGN1dAEDAAAAEgBOAGUAdQAgAGwAYQBkAGUAbggAAAAABgAAAAZSZWxvYWQHAAAACVFT
-	aG9ydGN1dAEDAAAAEgBBAG4AdAB3AG8AcgB0AGUAbggAAAAABgAAAAVSZXBseQcAAAAJUVNob3J0
-	Y3V0AQMAAAAMAFIAZQB0AHUAcgBuCAAAAAAGAAAABlJldHVybgcAAAAJUVNob3J0Y3V0AQMAAAAM
-	AFIAZQBjAGgAdABzCAAAAAAGAAAABVJpZ2h0BwAAAAlRU2hvcnRjdXQBAwAAAAwAUgBvAG0AYQBq
-	AGkIAAAAAAYAAAAGUm9tYWppBwAAAAlRU2hvcnRjdXQBAwAAACAARgBlAG4AcwB0AGUAcgAgAHIA
-	bwB0AGkAZQByAGUAbggAAAAABgAAAA5Sb3RhdGUgV2luZG93cwcAAAAJUVNob3J0Y3V0AQMAAAAW
-	AFIAbwB0AGEAdABpAG8AbgAgAEsAQggAAAAABgAAAAtSb3RhdGlvbiBLQgcAAAAJUVNob3J0Y3V0
-	AQMAAAAWAFIAbwB0AGEAdABpAG8AbgAgAFAAQggAAAAABgAAAAtSb3RhdGlvbiBQQgcAAAAJUVNo
-	b3J0Y3V0AQMAAAASAFMAcABlAGkAYwBoAGUAcgBuCAAAAAAGAAAABFNhdmUHAAAACVFTaG9ydGN1
-	dAEDAAAAIgBCAGkAbABkAHMAYwBoAGkAcgBtAHMAYwBoAG8AbgBlAHIIAAAAAAYAAAALU2NyZWVu
-	c2F2ZXIHAAAACVFTaG9ydGN1dAEDAAAAKgBSAG8AbABsAGUAbgAtAEYAZQBzAHQAcwB0AGUAbABs
-	AHQAYQBzAHQAZQgAAAAABgAAAAtTY3JvbGwgTG9jawcAAAAJUVNob3J0Y3V0AQMAAAAqAFIAbwBs
-	AGwAZQBuAC0ARgBlAHMAdABzAHQAZQBsAGwAdABhAHMAdABlCAAAAAAGAAAAClNjcm9sbExvY2sH
-	AAAACVFTaG9ydGN1dAEDAAAADABTAHUAYwBoAGUAbggAAAAABgAAAAZTZWFyY2gHAAAACVFTaG9y
-	dGN1dAEDAAAAEgBBAHUAcwB3AOQAaABsAGUAbggAAAAABgAAAAZTZWxlY3QHAAAACVFTaG9ydGN1
-	dAEDAAAADABTAGUAbgBkAGUAbggAAAAABgAAAARTZW5kBwAAAAlRU2hvcnRjdXQBAwAAABoARQBp
-	AG4AcwB0AGUAbABsAHUAbgBnAGUAbggAAAAABgAAAAhTZXR0aW5ncwcAAAAJUVNob3J0Y3V0AQMA
-	AAAQAFUAbQBzAGMAaABhAGwAdAgAAAAABgAAAAVTaGlmdAcAAAAJUVNob3J0Y3V0AQMAAAAIAFMA
-	aABvAHAIAAAAAAYAAAAEU2hvcAcAAAAJUVNob3J0Y3V0AQMAAAAWAFMAYwBoAGwAYQBmAG0AbwBk
-	AHUAcwgAAAAABgAAAAVTbGVlcAcAAAAJUVNob3J0Y3V0AQMAAAASAEwAZQBlAHIAdABhAHMAdABl
-	CAAAAAAGAAAABVNwYWNlBwAAAAlRU2hvcnRjdXQBAwAAACYAUgBlAGMAaAB0AHMAYwBoAHIAZQBp
-	AGIAcAByAPwAZgB1AG4AZwgAAAAABgAAAAxTcGVsbGNoZWNrZXIHAAAACVFTaG9ydGN1dAEDAAAA
-	IgBCAGkAbABkAHMAYwBoAGkAcgBtACAAdABlAGkAbABlAG4IAAAAAAYAAAAMU3BsaXQgU2NyZWVu
-	BwAAAAlRU2hvcnRjdXQBAwAAACYAVABhAGIAZQBsAGwAZQBuAGsAYQBsAGsAdQBsAGEAdABpAG8A
-	bggAAAAABgAAAAtTcHJlYWRzaGVldAcAAAAJUVNob3J0Y3V0AQMAAAAOAFMAdABhAG4AZABiAHkI
-	AAAAAAYAAAAHU3RhbmRieQcAAAAJUVNob3J0Y3V0AQMAAAASAEEAYgBiAHIAZQBjAGgAZQBuCAAA
-	AAAGAAAABFN0b3AHAAAACVFTaG9ydGN1dAEDAAAAFABVAG4AdABlAHIAdABpAHQAZQBsCAAAAAAG
-	AAAACFN1YnRpdGxlBwAAAAlRU2hvcnRjdXQBAwAAAAoASABpAGwAZgBlCAAAAAAGAAAAB1N1cHBv
-	cnQHAAAACVFTaG9ydGN1dAEDAAAACgBQAGEAdQBzAGUIAAAAAAYAAAAHU3VzcGVuZAcAAAAJUVNo
-	b3J0Y3V0AQMAAAAMAFMAeQBzAFIAZQBxCAAAAAAGAAAABlN5c1JlcQcAAAAJUVNob3J0Y3V0AQMA
-	AAAcAFMAeQBzAHQAZQBtACAAUgBlAHEAdQBlAHMAdAgAAAAABgAAAA5TeXN0ZW0gUmVxdWVzdAcA
-	AAAJUVNob3J0Y3V0AQMAAAAGAFQAYQBiCAAAAAAGAAAAA1RhYgcAAAAJUVNob3J0Y3V0AQMAAAAW
-	AFQAYQBzAGsALQBMAGUAaQBzAHQAZQgAAAAABgAAAApUYXNrIFBhbmVsBwAAAAlRU2hvcnRjdXQB
-	AwAAABAAVABlAHIAbQBpAG4AYQBsCAAAAAAGAAAACFRlcm1pbmFsBwAAAAlRU2hvcnRjdXQBAwAA
-	AAgAWgBlAGkAdAgAAAAABgAAAARUaW1lBwAAAAlRU2hvcnRjdXQBAwAAACIAQQBuAHIAdQBmAGUA
-	bgAvAEEAdQBmAGgA5ABuAGcAZQBuCAAAAAAGAAAAElRvZ2dsZSBDYWxsL0hhbmd1cAcAAAAJUVNo
-	b3J0Y3V0AQMAAAAgAFcAaQBlAGQAZQByAGcAYQBiAGUALwBQAGEAdQBzAGUIAAAAAAYAAAAXVG9n
-	Z2xlIE1lZGlhIFBsYXkvUGF1c2UHAAAACVFTaG9ydGN1dAEDAAAAEgBXAGUAcgBrAHoAZQB1AGcA
-	ZQgAAAAABgAAAAVUb29scwcAAAAJUVNob3J0Y3V0AQMAAAASAEgAYQB1AHAAdABtAGUAbgD8CAAA
-	AAAGAAAACFRvcCBNZW51BwAAAAlRU2hvcnRjdXQBAwAAABgAVABvAHUAYwBoAHAAYQBkACAAYQB1
-	AHMIAAAAAAYAAAAMVG91Y2hwYWQgT2ZmBwAAAAlRU2hvcnRjdXQBAwAAABYAVABvAHUAYwBoAHAA
-	YQBkACAAYQBuCAAAAAAGAAAAC1RvdWNocGFkIE9uBwAAAAlRU2hvcnRjdXQBAwAAACYAVABvAHUA
-	YwBoAHAAYQBkAC0AVQBtAHMAYwBoAGEAbAB0AGUAcggAAAAABgAAAA9Ub3VjaHBhZCBUb2dnbGUH
-	AAAACVFTaG9ydGN1dAEDAAAADgBUAG8AdQByAG8AawB1CAAAAAAGAAAAB1RvdXJva3UHAAAACVFT
-	aG9ydGN1dAEDAAAACgBSAGUAaQBzAGUIAAAAAAYAAAAGVHJhdmVsBwAAAAlRU2hvcnRjdXQBAwAA
-	AA4ASAD2AGgAZQBuACAALQgAAAAABgAAAAtUcmVibGUgRG93bgcAAAAJUVNob3J0Y3V0AQMAAAAO
-	AEgA9gBoAGUAbgAgACsIAAAAAAYAAAAJVHJlYmxlIFVwBwAAAAlRU2hvcnRjdXQBAwAAAB4AVQBs
-	AHQAcgBhACAAVwBpAGQAZQAgAEIAYQBuAGQIAAAAAAYAAAAPVWx0cmEgV2lkZSBCYW5kBwAAAAlR
-	U2hvcnRjdXQBAwAAABQAUgD8AGMAawBnAOQAbgBnAGkAZwgAAAAABgAAAARVbmRvBwAAAAlRU2hv
-	cnRjdXQBAwAAAAgASABvAGMAaAgAAAAABgAAAAJVcAcAAAAJUVNob3J0Y3V0AQMAAAAKAFYAaQBk
-	AGUAbwgAAAAABgAAAAVWaWRlbwcAAAAJUVNob3J0Y3V0AQMAAAAOAEEAbgBzAGkAYwBoAHQIAAAA
-	AAYAAAAEVmlldwcAAAAJUVNob3J0Y3V0AQMAAAAUAFMAcAByAGEAYwBoAHcAYQBoAGwIAAAAAAYA
-	AAAKVm9pY2UgRGlhbAcAAAAJUVNob3J0Y3V0AQMAAAAYAEwAYQB1AHQAcwB0AOQAcgBrAGUAIAAt
-	CAAAAAAGAAAAC1ZvbHVtZSBEb3duBwAAAAlRU2hvcnRjdXQBAwAAAA4AVABvAG4AIABhAHUAcwgA
-	AAAABgAAAAtWb2x1bWUgTXV0ZQcAAAAJUVNob3J0Y3V0AQMAAAAYAEwAYQB1AHQAcwB0AOQAcgBr
-	AGUAIAArCAAAAAAGAAAACVZvbHVtZSBVcAcAAAAJUVNob3J0Y3V0AQMAAAAQAEkAbgB0AGUAcgBu
-	AGUAdAgAAAAABgAAAANXV1cHAAAACVFTaG9ydGN1dAEDAAAAEgBBAHUAZgB3AGUAYwBrAGUAbggA
-	AAAABgAAAAdXYWtlIFVwBwAAAAlRU2hvcnRjdXQBAwAAAAwAVwBlAGIAQwBhAG0IAAAAAAYAAAAG
-	V2ViQ2FtBwAAAAlRU2hvcnRjdXQBAwAAABAARAByAGEAaAB0AGwAbwBzCAAAAAAGAAAACFdpcmVs
-	ZXNzBwAAAAlRU2hvcnRjdXQBAwAAACAAVABlAHgAdAB2AGUAcgBhAHIAYgBlAGkAdAB1AG4AZwgA
-	AAAABgAAAA5Xb3JkIFByb2Nlc3NvcgcAAAAJUVNob3J0Y3V0AQMAAAAIAFgARgBlAHIIAAAAAAYA
-	AAAEWEZlcgcAAAAJUVNob3J0Y3V0AQMAAAAIAEcAZQBsAGIIAAAAAAYAAAAGWWVsbG93BwAAAAlR
-	U2hvcnRjdXQBAwAAAAQASgBhCAAAAAAGAAAAA1llcwcAAAAJUVNob3J0Y3V0AQMAAAAOAFoAZQBu
-	AGsAYQBrAHUIAAAAAAYAAAAHWmVua2FrdQcAAAAJUVNob3J0Y3V0AQMAAAAeAFoAZQBuAGsAYQBr
-	AHUAIABIAGEAbgBrAGEAawB1CAAAAAAGAAAAD1plbmtha3UgSGFua2FrdQcAAAAJUVNob3J0Y3V0
-	AQMAAAAUAFYAZQByAGcAcgD2AN8AZQByAG4IAAAAAAYAAAAEWm9vbQcAAAAJUVNob3J0Y3V0AQMA
-	AAAUAFYAZQByAGcAcgD2AN8AZQByAG4IAAAAAAYAAAAHWm9vbSBJbgcAAAAJUVNob3J0Y3V0AQMA
-	AAAWAFYAZQByAGsAbABlAGkAbgBlAHIAbggAAAAABgAAAAhab29tIE91dAcAAAAJUVNob3J0Y3V0
-	AQMAAAAMAGkAVABvAHUAYwBoCAAAAAAGAAAABmlUb3VjaAcAAAAJUVNob3J0Y3V0AQMAAABOAEQA
-	aQBlAHMAZQByACAAQQBkAHIAZQBzAHMAdAB5AHAAIAB3AGkAcgBkACAAbgBpAGMAaAB0ACAAdQBu
-	AHQAZQByAHMAdAD8AHQAegB0CAAAAAAGAAAAGkFkZHJlc3MgdHlwZSBub3Qgc3VwcG9ydGVkBwAA
-	ABNRU29ja3M1U29ja2V0RW5naW5lAQMAAABgAEQAZQByACAAUwBPAEMASwBTAHYANQAtAFMAZQBy
-	AHYAZQByACAAaABhAHQAIABkAGkAZQAgAFYAZQByAGIAaQBuAGQAdQBuAGcAIAB2AGUAcgB3AGUA
-	aQBnAGUAcgB0CAAAAAAGAAAAKENvbm5lY3Rpb24gbm90IGFsbG93ZWQgYnkgU09DS1N2NSBzZXJ2
-	ZXIHAAAAE1FTb2NrczVTb2NrZXRFbmdpbmUBAwAAAGoARABlAHIAIABQAHIAbwB4AHkALQBTAGUA
-	cgB2AGUAcgAgAGgAYQB0ACAAZABpAGUAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAdgBvAHIAegBl
-	AGkAdABpAGcAIABiAGUAZQBuAGQAZQB0CAAAAAAGAAAAJkNvbm5lY3Rpb24gdG8gcHJveHkgY2xv
-	c2VkIHByZW1hdHVyZWx5BwAAABNRU29ja3M1U29ja2V0RW5naW5lAQMAAAB2AEQAZQByACAAUABy
-	AG8AeAB5AC0AUwBlAHIAdgBlAHIAIABoAGEAdAAgAGQAZQBuACAAQQB1AGYAYgBhAHUAIABlAGkA
-	bgBlAHIAIABWAGUAcgBiAGkAbgBkAHUAbgBnACAAdgBlAHIAdwBlAGkAZwBlAHIAdAgAAAAABgAA
-	ABtDb25uZWN0aW9uIHRvIHByb3h5IHJlZnVzZWQHAAAAE1FTb2NrczVTb2NrZXRFbmdpbmUBAwAA
-	AJIAQgBlAGkAIABkAGUAcgAgAFYAZQByAGIAaQBuAGQAdQBuAGcAIABtAGkAdAAgAGQAZQBtACAA
-	UAByAG8AeAB5AC0AUwBlAHIAdgBlAHIAIAB3AHUAcgBkAGUAIABlAGkAbgAgAFoAZQBpAHQAbABp
-	AG0AaQB0ACAA/ABiAGUAcgBzAGMAaAByAGkAdAB0AGUAbggAAAAABgAAAB1Db25uZWN0aW9uIHRv
-	IHByb3h5IHRpbWVkIG91dAcAAAATUVNvY2tzNVNvY2tldEVuZ2luZQEDAAAAfgBBAGwAbABnAGUA
-	bQBlAGkAbgBlAHIAIABGAGUAaABsAGUAcgAgAGIAZQBpACAAZABlAHIAIABLAG8AbQBtAHUAbgBp
-	AGsAYQB0AGkAbwBuACAAbQBpAHQAIABkAGUAbQAgAFMATwBDAEsAUwB2ADUALQBTAGUAcgB2AGUA
-	cggAAAAABgAAAB5HZW5lcmFsIFNPQ0tTdjUgc2VydmVyIGZhaWx1cmUHAAAAE1FTb2NrczVTb2Nr
-	ZXRFbmdpbmUBAwAAAGYARABhAHMAIABaAGUAaQB0AGwAaQBtAGkAdAAgAGYA/AByACAAZABpAGUA
-	IABPAHAAZQByAGEAdABpAG8AbgAgAHcAdQByAGQAZQAgAPwAYgBlAHIAcwBjAGgAcgBpAHQAdABl
-	AG4IAAAAAAYAAAAbTmV0d29yayBvcGVyYXRpb24gdGltZWQgb3V0BwAAABNRU29ja3M1U29ja2V0
-	RW5naW5lAQMAAAB0AEQAaQBlACAAQQB1AHQAaABlAG4AdABpAGYAaQB6AGkAZQByAHUAbgBnACAA
-	YgBlAGkAbQAgAFAAcgBvAHgAeQAtAFMAZQByAHYAZQByACAAaQBzAHQAIABmAGUAaABsAGcAZQBz
-	AGMAaABsAGEAZwBlAG4IAAAAAAYAAAAbUHJveHkgYXV0aGVudGljYXRpb24gZmFpbGVkBwAAABNR
-	U29ja3M1U29ja2V0RW5naW5lAQMAAAB8AEQAaQBlACAAQQB1AHQAaABlAG4AdABpAGYAaQB6AGkA
-	ZQByAHUAbgBnACAAYgBlAGkAbQAgAFAAcgBvAHgAeQAtAFMAZQByAHYAZQByACAAaQBzAHQAIABm
-	AGUAaABsAGcAZQBzAGMAaABsAGEAZwBlAG4AOgAgACUAMQgAAAAABgAAAB9Qcm94eSBhdXRoZW50
-	aWNhdGlvbiBmYWlsZWQ6ICUxBwAAABNRU29ja3M1U29ja2V0RW5naW5lAQMAAABaAEQAZQByACAA
-	UAByAG8AeAB5AC0AUwBlAHIAdgBlAHIAIABrAG8AbgBuAHQAZQAgAG4AaQBjAGgAdAAgAGcAZQBm
-	AHUAbgBkAGUAbgAgAHcAZQByAGQAZQBuCAAAAAAGAAAAFFByb3h5IGhvc3Qgbm90IGZvdW5kBwAA
-	ABNRU29ja3M1U29ja2V0RW5naW5lAQMAAABEAFAAcgBvAHQAbwBrAG8AbABsAC0ARgBlAGgAbABl
-	AHIAIAAoAFMATwBDAEsAUwAgAFYAZQByAHMAaQBvAG4AIAA1ACkIAAAAAAYAAAAeU09DS1MgdmVy
-	c2lvbiA1IHByb3RvY29sIGVycm9yBwAAABNRU29ja3M1U29ja2V0RW5naW5lAQMAAABcAEQAaQBl
-	AHMAZQBzACAAUwBPAEMASwBTAHYANQAtAEsAbwBtAG0AYQBuAGQAbwAgAHcAaQByAGQAIABuAGkA
-	YwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQIAAAAAAYAAAAdU09DS1N2NSBjb21tYW5kIG5v
-	dCBzdXBwb3J0ZWQHAAAAE1FTb2NrczVTb2NrZXRFbmdpbmUBAwAAAEoARABpAGUAIABMAGUAYgBl
-	AG4AcwBkAGEAdQBlAHIAIAAoAFQAVABMACkAIABpAHMAdAAgAHYAZQByAHMAdAByAGkAYwBoAGUA
-	bggAAAAABgAAAAtUVEwgZXhwaXJlZAcAAAATUVNvY2tzNVNvY2tldEVuZ2luZQEDAAAAfABVAG4A
-	YgBlAGsAYQBuAG4AdABlAG4AIABGAGUAaABsAGUAcgBjAG8AZABlACAAdgBvAG0AIABTAE8AQwBL
-	AFMAdgA1AC0AUAByAG8AeAB5AC0AUwBlAHIAdgBlAHIAIABlAHIAaABhAGwAdABlAG4AOgAgADAA
-	eAAlADEIAAAAAAYAAAAlVW5rbm93biBTT0NLU3Y1IHByb3h5IGVycm9yIGNvZGUgMHglMQcAAAAT
-	UVNvY2tzNVNvY2tldEVuZ2luZQEDAAAAIABCAGUAbgBhAGMAaAByAGkAYwBoAHQAaQBnAHUAbgBn
-	CAAAAAAGAAAADWFsZXJ0IG1lc3NhZ2UHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAASAEEA
-	bgBpAG0AYQB0AGkAbwBuCAAAAAAGAAAACWFuaW1hdGlvbgcAAAAUUVNwaUFjY2Vzc2libGVCcmlk
-	Z2UBAwAAABIAQQBuAHcAZQBuAGQAdQBuAGcIAAAAAAYAAAALYXBwbGljYXRpb24HAAAAFFFTcGlB
-	Y2Nlc3NpYmxlQnJpZGdlAQMAAAASAEEAcwBzAGkAcwB0AGUAbgB0CAAAAAAGAAAACWFzc2lzdGFu
-	dAcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAACoAUwBjAGgAYQBsAHQAZgBsAOQAYwBoAGUA
-	IABtAGkAdAAgAE0AZQBuAPwIAAAAAAYAAAALYnV0dG9uIG1lbnUHAAAAFFFTcGlBY2Nlc3NpYmxl
-	QnJpZGdlAQMAAABOAFMAYwBoAGEAbAB0AGYAbADkAGMAaABlACwAIABkAGkAZQAgAGUAaQBuACAA
-	RgBlAG4AcwB0AGUAcgAgAGEAdQBzAGsAbABhAHAAcAB0CAAAAAAGAAAAFWJ1dHRvbiB3aXRoIGRy
-	b3AgZG93bgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAAHoAUwBjAGgAYQBsAHQAZgBsAOQA
-	YwBoAGUALAAgAGQAaQBlACAAZQBpAG4AIABGAGUAbgBzAHQAZQByACAAYQB1AHMAawBsAGEAcABw
-	AHQALAAgAHcAYQBzACAAZQBpAG4AIABHAGkAdAB0AGUAcgAgAHoAZQBpAGcAdAgAAAAABgAAABpi
-	dXR0b24gd2l0aCBkcm9wIGRvd24gZ3JpZAcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABoA
-	WgBlAGkAYwBoAGUAbgBmAGwA5ABjAGgAZQgAAAAABgAAAAZjYW52YXMHAAAAFFFTcGlBY2Nlc3Np
-	YmxlQnJpZGdlAQMAAAAKAFoAZQBsAGwAZQgAAAAABgAAAARjZWxsBwAAABRRU3BpQWNjZXNzaWJs
-	ZUJyaWRnZQEDAAAAEABEAGkAYQBnAHIAYQBtAG0IAAAAAAYAAAAFY2hhcnQHAAAAFFFTcGlBY2Nl
-	c3NpYmxlQnJpZGdlAQMAAAAQAEMAaABlAGMAawBiAG8AeAgAAAAABgAAAAljaGVjayBib3gHAAAA
-	FFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAGAFUAaAByCAAAAAAGAAAABWNsb2NrBwAAABRRU3Bp
-	QWNjZXNzaWJsZUJyaWRnZQEDAAAAFgBGAGEAcgBiAGEAdQBzAHcAYQBoAGwIAAAAAAYAAAANY29s
-	b3IgY2hvb3NlcgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAAAwAUwBwAGEAbAB0AGUIAAAA
-	AAYAAAAGY29sdW1uBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAAGABTAHAAYQBsAHQAZQBu
-	AHQAaQB0AGUAbAgAAAAABgAAAA1jb2x1bW4gaGVhZGVyBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRn
-	ZQEDAAAAFgBBAHUAcwB3AGEAaABsAGYAZQBsAGQIAAAAAAYAAAAJY29tYm8gYm94BwAAABRRU3Bp
-	QWNjZXNzaWJsZUJyaWRnZQEDAAAAJABFAHIAZwDkAG4AegBlAG4AZABlAHIAIABJAG4AaABhAGwA
-	dAgAAAAABgAAABVjb21wbGVtZW50YXJ5IGNvbnRlbnQHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdl
-	AQMAAAAUAE0AYQB1AHMAegBlAGkAZwBlAHIIAAAAAAYAAAAGY3Vyc29yBwAAABRRU3BpQWNjZXNz
-	aWJsZUJyaWRnZQEDAAAACgBTAGsAYQBsAGEIAAAAAAYAAAAEZGlhbAcAAAAUUVNwaUFjY2Vzc2li
-	bGVCcmlkZ2UBAwAAAAwARABpAGEAbABvAGcIAAAAAAYAAAAGZGlhbG9nBwAAABRRU3BpQWNjZXNz
-	aWJsZUJyaWRnZQEDAAAAEABEAG8AawB1AG0AZQBuAHQIAAAAAAYAAAAIZG9jdW1lbnQHAAAAFFFT
-	cGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAASAEcAbABlAGkAYwBoAHUAbgBnCAAAAAAGAAAACGVxdWF0
-	aW9uBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAADABGAPwAbABsAGUAcggAAAAABgAAAAZm
-	aWxsZXIHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAQAEYAdQDfAHoAZQBpAGwAZQgAAAAA
-	BgAAAAZmb290ZXIHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAQAEYAbwByAG0AdQBsAGEA
-	cggAAAAABgAAAARmb3JtBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAADABSAGEAaABtAGUA
-	bggAAAAABgAAAAVmcmFtZQcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABIAZwByAGEAcABo
-	AGkAcwBjAGgIAAAAAAYAAAAHZ3JhcGhpYwcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAAAoA
-	RwByAGkAZgBmCAAAAAAGAAAABGdyaXAHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAASAEsA
-	bwBwAGYAegBlAGkAbABlCAAAAAAGAAAAB2hlYWRpbmcHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdl
-	AQMAAAAWAEIAYQBsAGwAbwBuAGgAaQBsAGYAZQgAAAAABgAAAAxoZWxwIGJhbGxvb24HAAAAFFFT
-	cGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAA0AEYAZQBsAGQAIABtAGkAdAAgAFQAYQBzAHQAZQBuAHYA
-	ZQByAGsAbgD8AHAAZgB1AG4AZwgAAAAABgAAAAxob3RrZXkgZmllbGQHAAAAFFFTcGlBY2Nlc3Np
-	YmxlQnJpZGdlAQMAAAASAEkAbgBkAGkAawBhAHQAbwByCAAAAAAGAAAACWluZGljYXRvcgcAAAAU
-	UVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAAB4AdQBuAGcA/ABsAHQAaQBnAGUAIABSAG8AbABsAGUI
-	AAAAAAYAAAAMaW52YWxpZCByb2xlBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAAEABUAGUA
-	eAB0AGYAZQBsAGQIAAAAAAYAAAAFbGFiZWwHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAA4
-	AFAAYQBuAGUAbAAgAG0AaQB0ACAAbQBlAGgAcgBlAHIAZQBuACAAUwBjAGgAaQBjAGgAdABlAG4I
-	AAAAAAYAAAAMbGF5ZXJlZCBwYW5lBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAADgBWAGUA
-	cgB3AGUAaQBzCAAAAAAGAAAABGxpbmsHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAKAEwA
-	aQBzAHQAZQgAAAAABgAAAARsaXN0BwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAAGgBMAGkA
-	cwB0AGUAbgBlAGwAZQBtAGUAbgB0CAAAAAAGAAAACWxpc3QgaXRlbQcAAAAUUVNwaUFjY2Vzc2li
-	bGVCcmlkZ2UBAwAAABQATQBlAG4A/ABsAGUAaQBzAHQAZQgAAAAABgAAAAhtZW51IGJhcgcAAAAU
-	UVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABYATQBlAG4A/ABlAGkAbgB0AHIAYQBnCAAAAAAGAAAA
-	CW1lbnUgaXRlbQcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAAA4ASABpAG4AdwBlAGkAcwgA
-	AAAABgAAAARub3RlBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAAGABTAGUAaQB0AGUAbgBy
-	AGUAaQB0AGUAcggAAAAABgAAAAhwYWdlIHRhYgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAA
-	AC4ATABpAHMAdABlACAAdgBvAG4AIABTAGUAaQB0AGUAbgByAGUAaQB0AGUAcgBuCAAAAAAGAAAA
-	DXBhZ2UgdGFiIGxpc3QHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAKAFAAYQBuAGUAbAgA
-	AAAABgAAAAVwYW5lbAcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAAAwAQQBiAHMAYQB0AHoI
-	AAAAAAYAAAAJcGFyYWdyYXBoBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAACABNAGUAbgD8
-	CAAAAAAGAAAACnBvcHVwIG1lbnUHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAmAEYAbwBy
-	AHQAcwBjAGgAcgBpAHQAdABzAGEAbgB6AGUAaQBnAGUIAAAAAAYAAAAMcHJvZ3Jlc3MgYmFyBwAA
-	ABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAAIgBFAGkAZwBlAG4AcwBjAGgAYQBmAHQAcwBzAGUA
-	aQB0AGUIAAAAAAYAAAANcHJvcGVydHkgcGFnZQcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAA
-	ABgAUwBjAGgAYQBsAHQAZgBsAOQAYwBoAGUIAAAAAAYAAAALcHVzaCBidXR0b24HAAAAFFFTcGlB
-	Y2Nlc3NpYmxlQnJpZGdlAQMAAAAUAFIAYQBkAGkAbwBrAG4AbwBwAGYIAAAAAAYAAAAMcmFkaW8g
-	YnV0dG9uBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAACgBaAGUAaQBsAGUIAAAAAAYAAAAD
-	cm93BwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAAFgBaAGUAaQBsAGUAbgB0AGkAdABlAGwI
-	AAAAAAYAAAAKcm93IGhlYWRlcgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABwAQgBpAGwA
-	ZABsAGEAdQBmAGwAZQBpAHMAdABlCAAAAAAGAAAACnNjcm9sbCBiYXIHAAAAFFFTcGlBY2Nlc3Np
-	YmxlQnJpZGdlAQMAAAASAEEAYgBzAGMAaABuAGkAdAB0CAAAAAAGAAAAB3NlY3Rpb24HAAAAFFFT
-	cGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAASAFMAZQBwAGEAcgBhAHQAbwByCAAAAAAGAAAACXNlcGFy
-	YXRvcgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABAAUwBjAGgAaQBlAGIAZQByCAAAAAAG
-	AAAABnNsaWRlcgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAACQAQQBrAHUAcwB0AGkAcwBj
-	AGgAZQBzACAAUwBpAGcAbgBhAGwIAAAAAAYAAAAFc291bmQHAAAAFFFTcGlBY2Nlc3NpYmxlQnJp
-	ZGdlAQMAAAAQAEwAZQBlAHIAcgBhAHUAbQgAAAAABgAAAAVzcGFjZQcAAAAUUVNwaUFjY2Vzc2li
-	bGVCcmlkZ2UBAwAAABQAWgBhAGgAbABlAG4AZgBlAGwAZAgAAAAABgAAAAhzcGluIGJveAcAAAAU
-	UVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABoARgBlAG4AcwB0AGUAcgB0AGUAaQBsAGUAcggAAAAA
-	BgAAAAhzcGxpdHRlcgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABYAUwB0AGEAdAB1AHMA
-	egBlAGkAbABlCAAAAAAGAAAACnN0YXR1cyBiYXIHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMA
-	AAAOAFQAYQBiAGUAbABsAGUIAAAAAAYAAAAFdGFibGUHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdl
-	AQMAAAAIAFQAZQB4AHQIAAAAAAYAAAAEdGV4dAcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAA
-	ABgARQBpAG4AZgD8AGcAZQBtAGEAcgBrAGUIAAAAAAYAAAAKdGV4dCBjYXJldAcAAAAUUVNwaUFj
-	Y2Vzc2libGVCcmlkZ2UBAwAAABYAVABpAHQAZQBsAGwAZQBpAHMAdABlCAAAAAAGAAAACXRpdGxl
-	IGJhcgcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAABwAVwBlAHIAawB6AGUAdQBnAGwAZQBp
-	AHMAdABlCAAAAAAGAAAACHRvb2wgYmFyBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQEDAAAADgBU
-	AG8AbwBsAHQAaQBwCAAAAAAGAAAACHRvb2wgdGlwBwAAABRRU3BpQWNjZXNzaWJsZUJyaWRnZQED
-	AAAACABCAGEAdQBtCAAAAAAGAAAABHRyZWUHAAAAFFFTcGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAW
-	AEIAYQB1AG0AZQBsAGUAbQBlAG4AdAgAAAAABgAAAAl0cmVlIGl0ZW0HAAAAFFFTcGlBY2Nlc3Np
-	YmxlQnJpZGdlAQMAAAASAHUAbgBiAGUAawBhAG4AbgB0CAAAAAAGAAAAB3Vua25vd24HAAAAFFFT
-	cGlBY2Nlc3NpYmxlQnJpZGdlAQMAAAAYAFcAZQBiAC0ARABvAGsAdQBtAGUAbgB0CAAAAAAGAAAA
-	DHdlYiBkb2N1bWVudAcAAAAUUVNwaUFjY2Vzc2libGVCcmlkZ2UBAwAAACwAVQBuAGcA/ABsAHQA
-	aQBnAGUAIABFAGkAbgBnAGEAYgBlAGQAYQB0AGUAbggAAAAABgAAABJJbnZhbGlkIGlucHV0IGRh
-	dGEHAAAAGlFTc2xEaWZmaWVIZWxsbWFuUGFyYW1ldGVyAQMAAAAWAEsAZQBpAG4AIABGAGUAaABs
-	AGUAcggAAAAABgAAAAhObyBlcnJvcgcAAAAaUVNzbERpZmZpZUhlbGxtYW5QYXJhbWV0ZXIBAwAA
-	AJIARABpAGUAIABhAG4AZwBlAGcAZQBiAGUAbgBlAG4AIABEAGkAZgBmAGkAZQAtAEgAZQBsAGwA
-	bQBhAG4ALQBQAGEAcgBhAG0AZQB0AGUAcgAgAHcAdQByAGQAZQBuACAAYQBsAHMAIAB1AG4AcwBp
-	AGMAaABlAHIAIABlAGkAbgBnAGUAcwBjAGgA5AB0AHoAdAgAAAAABgAAADVUaGUgZ2l2ZW4gRGlm
-	ZmllLUhlbGxtYW4gcGFyYW1ldGVycyBhcmUgZGVlbWVkIHVuc2FmZQcAAAAaUVNzbERpZmZpZUhl
-	bGxtYW5QYXJhbWV0ZXIBAwAAAIoATwBoAG4AZQAgAFMAYwBoAGwA/ABzAHMAZQBsACAAawBhAG4A
-	bgAgAGsAZQBpAG4AIABaAGUAcgB0AGkAZgBpAGsAYQB0ACAAegB1AHIAIABWAGUAcgBmAPwAZwB1
-	AG4AZwAgAGcAZQBzAHQAZQBsAGwAdAAgAHcAZQByAGQAZQBuACwAIAAlADEIAAAAAAYAAAAsQ2Fu
-	bm90IHByb3ZpZGUgYSBjZXJ0aWZpY2F0ZSB3aXRoIG5vIGtleSwgJTEHAAAAClFTc2xTb2NrZXQB
-	AwAAAFQARABpAGUAIABEAGkAZgBmAGkAZQAtAEgAZQBsAGwAbQBhAG4ALQBQAGEAcgBhAG0AZQB0
-	AGUAcgAgAHMAaQBuAGQAIAB1AG4AZwD8AGwAdABpAGcIAAAAAAYAAAAnRGlmZmllLUhlbGxtYW4g
-	cGFyYW1ldGVycyBhcmUgbm90IHZhbGlkBwAAAApRU3NsU29ja2V0AQMAAABuAEUAcwAgAGsAbwBu
-	AG4AdABlACAAawBlAGkAbgBlACAAUwBTAEwALQBLAG8AbgB0AGUAeAB0AHMAdAByAHUAawB0AHUA
-	cgAgAGUAcgB6AGUAdQBnAHQAIAB3AGUAcgBkAGUAbgAgACgAJQAxACkIAAAAAAYAAAAfRXJyb3Ig
-	Y3JlYXRpbmcgU1NMIGNvbnRleHQgKCUxKQcAAAAKUVNzbFNvY2tldAEDAAAAXABFAHMAIABrAG8A
-	bgBuAHQAZQAgAGsAZQBpAG4AZQAgAFMAUwBMAC0AUwBpAHQAegB1AG4AZwAgAGUAcgB6AGUAdQBn
-	AHQAIAB3AGUAcgBkAGUAbgAsACAAJQAxCAAAAAAGAAAAHkVycm9yIGNyZWF0aW5nIFNTTCBzZXNz
-	aW9uLCAlMQcAAAAKUVNzbFNvY2tldAEDAAAAXABFAHMAIABrAG8AbgBuAHQAZQAgAGsAZQBpAG4A
-	ZQAgAFMAUwBMAC0AUwBpAHQAegB1AG4AZwAgAGUAcgB6AGUAdQBnAHQAIAB3AGUAcgBkAGUAbgA6
-	ACAAJQAxCAAAAAAGAAAAHkVycm9yIGNyZWF0aW5nIFNTTCBzZXNzaW9uOiAlMQcAAAAKUVNzbFNv
-	Y2tldAEDAAAAdgBJAG0AIABBAGIAbABhAHUAZgAgAGQAZQBzACAAUwBTAEwALQBQAHIAbwB0AG8A
-	awBvAGwAbABzACAAaQBzAHQAIABlAGkAbgAgAEYAZQBoAGwAZQByACAAYQB1AGYAZwBlAHQAcgBl
-	AHQAZQBuADoAIAAlADEIAAAAAAYAAAAeRXJyb3IgZHVyaW5nIFNTTCBoYW5kc2hha2U6ICUxBwAA
-	AApRU3NsU29ja2V0AQMAAABqAEQAYQBzACAAbABvAGsAYQBsAGUAIABaAGUAcgB0AGkAZgBpAGsA
-	YQB0ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAbABhAGQAZQBuACAAdwBlAHIAZABl
-	AG4ALAAgACUAMQgAAAAABgAAACNFcnJvciBsb2FkaW5nIGxvY2FsIGNlcnRpZmljYXRlLCAlMQcA
-	AAAKUVNzbFNvY2tldAEDAAAAagBEAGUAcgAgAHAAcgBpAHYAYQB0AGUAIABTAGMAaABsAPwAcwBz
-	AGUAbAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZwBlAGwAYQBkAGUAbgAgAHcAZQByAGQA
-	ZQBuACwAIAAlADEIAAAAAAYAAAAdRXJyb3IgbG9hZGluZyBwcml2YXRlIGtleSwgJTEHAAAAClFT
-	c2xTb2NrZXQBAwAAAF4ARgBlAGgAbABlAHIAIABiAGUAaQBtACAAUwBlAHQAegBlAG4AIABkAGUA
-	cgAgAGUAbABsAGkAcAB0AGkAcwBjAGgAZQBuACAASwB1AHIAdgBlAG4AIAAoACUAMQApCAAAAAAG
-	AAAAK0Vycm9yIHdoZW4gc2V0dGluZyB0aGUgZWxsaXB0aWMgY3VydmVzICglMSkHAAAAClFTc2xT
-	b2NrZXQBAwAAAFIAQgBlAGkAbQAgAEwAZQBzAGUAbgAgAGkAcwB0ACAAZQBpAG4AIABGAGUAaABs
-	AGUAcgAgAGEAdQBmAGcAZQB0AHIAZQB0AGUAbgA6ACAAJQAxCAAAAAAGAAAAF0Vycm9yIHdoaWxl
-	IHJlYWRpbmc6ICUxBwAAAApRU3NsU29ja2V0AQMAAABQAFUAbgBnAPwAbAB0AGkAZwBlACAAbwBk
-	AGUAcgAgAGwAZQBlAHIAZQAgAFMAYwBoAGwA/ABzAHMAZQBsAGwAaQBzAHQAZQAgACgAJQAxACkI
-	AAAAAAYAAAAhSW52YWxpZCBvciBlbXB0eSBjaXBoZXIgbGlzdCAoJTEpBwAAAApRU3NsU29ja2V0
-	AQMAAABgAEsAZQBpAG4AZQBzACAAZABlAHIAIABaAGUAcgB0AGkAZgBpAGsAYQB0AGUAIABrAG8A
-	bgBuAHQAZQAgAHYAZQByAGkAZgBpAHoAaQBlAHIAdAAgAHcAZQByAGQAZQBuCAAAAAAGAAAAIU5v
-	IGNlcnRpZmljYXRlcyBjb3VsZCBiZSB2ZXJpZmllZAcAAAAKUVNzbFNvY2tldAEDAAAAFgBLAGUA
-	aQBuACAARgBlAGgAbABlAHIIAAAAAAYAAAAITm8gZXJyb3IHAAAAClFTc2xTb2NrZXQBAwAAAHgA
-	RQBpAG4AZQBzACAAZABlAHIAIABaAGUAcgB0AGkAZgBpAGsAYQB0AGUAIABkAGUAcgAgAFoAZQBy
-	AHQAaQBmAGkAegBpAGUAcgB1AG4AZwBzAHMAdABlAGwAbABlACAAaQBzAHQAIAB1AG4AZwD8AGwA
-	dABpAGcIAAAAAAYAAAAlT25lIG9mIHRoZSBDQSBjZXJ0aWZpY2F0ZXMgaXMgaW52YWxpZAcAAAAK
-	UVNzbFNvY2tldAEDAAAAmgBEAGkAZQAgAHYAZQByAHcAZQBuAGQAZQB0AGUAIABWAGUAcgBzAGkA
-	bwBuACAAdgBvAG4AIABPAHAAZQBuAFMAUwBMACAAaQBzAHQAIAB6AHUAIABhAGwAdAAsACAAZQBz
-	ACAAbQB1AHMAcwAgAHYAMQAuADAALgAyACAAbwBkAGUAcgAgAG4AZQB1AGUAcgAgAHMAZQBpAG4I
-	AAAAAAYAAAAtT3BlblNTTCB2ZXJzaW9uIHRvbyBvbGQsIG5lZWQgYXQgbGVhc3QgdjEuMC4yBwAA
-	AApRU3NsU29ja2V0AQMAAACKAEUAbABsAGkAcAB0AGkAcwBjAGgAZQAgAEsAdQByAHYAZQBuACAA
-	cwBpAG4AZAAgAGkAbgAgAGQAaQBlAHMAZQByACAAVgBlAHIAcwBpAG8AbgAgAHYAbwBuACAATwBw
-	AGUAbgBTAFMATAAgAG4AaQBjAGgAdAAgAHYAZQByAGYA/ABnAGIAYQByCAAAAAAGAAAALU9wZW5T
-	U0wgdmVyc2lvbiB3aXRoIGRpc2FibGVkIGVsbGlwdGljIGN1cnZlcwcAAAAKUVNzbFNvY2tldAED
-	AAAAgABEAGUAcgAgAHAAcgBpAHYAYQB0AGUAIABTAGMAaABsAPwAcwBzAGUAbAAgAHAAYQBzAHMA
-	dAAgAG4AaQBjAGgAdAAgAHoAdQBtACAA9gBmAGYAZQBuAHQAbABpAGMAaABlAG4AIABTAGMAaABs
-	APwAcwBzAGUAbAAsACAAJQAxCAAAAAAGAAAAK1ByaXZhdGUga2V5IGRvZXMgbm90IGNlcnRpZnkg
-	cHVibGljIGtleSwgJTEHAAAAClFTc2xTb2NrZXQBAwAAAFAARABpAGUAIABUAEwAUwAvAFMAUwBM
-	AC0AVgBlAHIAYgBpAG4AZAB1AG4AZwAgAHcAdQByAGQAZQAgAGcAZQBzAGMAaABsAG8AcwBzAGUA
-	bggAAAAABgAAACZUaGUgVExTL1NTTCBjb25uZWN0aW9uIGhhcyBiZWVuIGNsb3NlZAcAAAAKUVNz
-	bFNvY2tldAEDAAAAcgBEAGkAZQAgAEwA5ABuAGcAZQAgAGQAZQBzACAAYgBhAHMAaQBjAEMAbwBu
-	AHMAdAByAGEAaQBuAHQAcwAtAFAAZgBhAGQAZQBzACAAdwB1AHIAZABlACAA/ABiAGUAcgBzAGMA
-	aAByAGkAdAB0AGUAbggAAAAABgAAADxUaGUgYmFzaWNDb25zdHJhaW50cyBwYXRoIGxlbmd0aCBw
-	YXJhbWV0ZXIgaGFzIGJlZW4gZXhjZWVkZWQHAAAAClFTc2xTb2NrZXQBAwAAAFoARABpAGUAIABH
-	APwAbAB0AGkAZwBrAGUAaQB0ACAAZABlAHMAIABaAGUAcgB0AGkAZgBpAGsAYQB0AHMAIABpAHMA
-	dAAgAGEAYgBnAGUAbABhAHUAZgBlAG4IAAAAAAYAAAAbVGhlIGNlcnRpZmljYXRlIGhhcyBleHBp
-	cmVkBwAAAApRU3NsU29ja2V0AQMAAABIAEQAYQBzACAAWgBlAHIAdABpAGYAaQBrAGEAdAAgAGkA
-	cwB0ACAAbgBvAGMAaAAgAG4AaQBjAGgAdAAgAGcA/ABsAHQAaQBnCAAAAAAGAAAAIFRoZSBjZXJ0
-	aWZpY2F0ZSBpcyBub3QgeWV0IHZhbGlkBwAAAApRU3NsU29ja2V0AQMAAACEAEQAYQBzACAAWgBl
-	AHIAdABpAGYAaQBrAGEAdAAgAGkAcwB0ACAAcwBlAGwAYgBzAHQAcwBpAGcAbgBpAGUAcgB0ACAA
-	dQBuAGQAIABkAGEAaABlAHIAIABuAGkAYwBoAHQAIAB2AGUAcgB0AHIAYQB1AGUAbgBzAHcA/ABy
-	AGQAaQBnCAAAAAAGAAAALVRoZSBjZXJ0aWZpY2F0ZSBpcyBzZWxmLXNpZ25lZCwgYW5kIHVudHJ1
-	c3RlZAcAAAAKUVNzbFNvY2tldAEDAAAAfABEAGkAZQAgAFMAaQBnAG4AYQB0AHUAcgAgAGQAZQBz
-	ACAAWgBlAHIAdABpAGYAaQBrAGEAdABzACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABlAG4A
-	dABzAGMAaABsAPwAcwBzAGUAbAB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAwVGhlIGNlcnRpZmlj
-	YXRlIHNpZ25hdHVyZSBjb3VsZCBub3QgYmUgZGVjcnlwdGVkBwAAAApRU3NsU29ja2V0AQMAAAB+
-	AEQAYQBzACAARgBlAGwAZAAgACcAbgBvAHQAQQBmAHQAZQByACcAIABkAGUAcwAgAFoAZQByAHQA
-	aQBmAGkAawBhAHQAcwAgAGUAbgB0AGgA5ABsAHQAIABlAGkAbgBlACAAdQBuAGcA/ABsAHQAaQBn
-	AGUAIABaAGUAaQB0CAAAAAAGAAAAOVRoZSBjZXJ0aWZpY2F0ZSdzIG5vdEFmdGVyIGZpZWxkIGNv
-	bnRhaW5zIGFuIGludmFsaWQgdGltZQcAAAAKUVNzbFNvY2tldAEDAAAAgABEAGEAcwAgAEYAZQBs
-	AGQAIAAnAG4AbwB0AEIAZQBmAG8AcgBlACcAIABkAGUAcwAgAFoAZQByAHQAaQBmAGkAawBhAHQA
-	cwAgAGUAbgB0AGgA5ABsAHQAIABlAGkAbgBlACAAdQBuAGcA/ABsAHQAaQBnAGUAIABaAGUAaQB0
-	CAAAAAAGAAAAOlRoZSBjZXJ0aWZpY2F0ZSdzIG5vdEJlZm9yZSBmaWVsZCBjb250YWlucyBhbiBp
-	bnZhbGlkIHRpbWUHAAAAClFTc2xTb2NrZXQBAwAAAZYARABhAHMAIABaAGUAcgB0AGkAZgBpAGsA
-	YQB0ACAAZABlAHMAIABiAGUAdAByAGEAYwBoAHQAZQB0AGUAbgAgAEEAdQBzAHMAdABlAGwAbABl
-	AHIAcwAgAHcAdQByAGQAZQAgAHoAdQByAPwAYwBrAGcAZQB3AGkAZQBzAGUAbgAgAGQAYQAgAEEA
-	dQBzAHMAdABlAGwAbABlAHIAbgBhAG0AZQAgAHUAbgBkACAAUwBlAHIAaQBlAG4AbgB1AG0AbQBl
-	AHIAIAB2AG8AcgBoAGEAbgBkAGUAbgAgAHMAaQBuAGQAIAB1AG4AZAAgAG4AaQBjAGgAdAAgAGQA
-	ZQBtACAAQgBlAHoAZQBpAGMAaABuAGUAcgAgAGQAZQByACAAWgBlAHIAdABpAGYAaQB6AGkAZQBy
-	AHUAbgBnAHMAcwB0AGUAbABsAGUAIABkAGUAcwAgAGEAawB0AHUAZQBsAGwAZQBuACAAWgBlAHIA
-	dABpAGYAaQBrAGEAdABzACAAZQBuAHQAcwBwAHIAZQBjAGgAZQBuCAAAAAAGAAAAtVRoZSBjdXJy
-	ZW50IGNhbmRpZGF0ZSBpc3N1ZXIgY2VydGlmaWNhdGUgd2FzIHJlamVjdGVkIGJlY2F1c2UgaXRz
-	IGlzc3VlciBuYW1lIGFuZCBzZXJpYWwgbnVtYmVyIHdhcyBwcmVzZW50IGFuZCBkaWQgbm90IG1h
-	dGNoIHRoZSBhdXRob3JpdHkga2V5IGlkZW50aWZpZXIgb2YgdGhlIGN1cnJlbnQgY2VydGlmaWNh
-	dGUHAAAAClFTc2xTb2NrZXQBAwAAATAARABhAHMAIABaAGUAcgB0AGkAZgBpAGsAYQB0ACAAZABl
-	AHMAIABiAGUAdAByAGEAYwBoAHQAZQB0AGUAbgAgAEEAdQBzAHMAdABlAGwAbABlAHIAcwAgAHcA
-	dQByAGQAZQAgAHoAdQByAPwAYwBrAGcAZQB3AGkAZQBzAGUAbgAgAGQAYQAgAHMAZQBpAG4AIABT
-	AHUAYgBqAGUAawB0AG4AYQBtAGUAIABuAGkAYwBoAHQAIABkAGUAbQAgAE4AYQBtAGUAbgAgAGQA
-	ZQBzACAAQQB1AHMAdABlAGwAbABlAHIAcwAgAGQAZQBzACAAYQBrAHQAdQBlAGwAbABlAG4AIABa
-	AGUAcgB0AGkAZgBpAGsAYQB0AHMAIABlAG4AdABzAHAAcgBpAGMAaAB0CAAAAAAGAAAAh1RoZSBj
-	dXJyZW50IGNhbmRpZGF0ZSBpc3N1ZXIgY2VydGlmaWNhdGUgd2FzIHJlamVjdGVkIGJlY2F1c2Ug
-	aXRzIHN1YmplY3QgbmFtZSBkaWQgbm90IG1hdGNoIHRoZSBpc3N1ZXIgbmFtZSBvZiB0aGUgY3Vy
-	cmVudCBjZXJ0aWZpY2F0ZQcAAAAKUVNzbFNvY2tldAEDAAAAqABEAGUAcgAgAE4AYQBtAGUAIABk
-	AGUAcwAgAEgAbwBzAHQAcwAgAGkAcwB0ACAAawBlAGkAbgBlAHIAIABhAHUAcwAgAGQAZQByACAA
-	TABpAHMAdABlACAAZABlAHIAIABmAPwAcgAgAGQAaQBlAHMAZQBzACAAWgBlAHIAdABpAGYAaQBr
-	AGEAdAAgAGcA/ABsAHQAaQBnAGUAbgAgAEgAbwBzAHQAcwgAAAAABgAAAEdUaGUgaG9zdCBuYW1l
-	IGRpZCBub3QgbWF0Y2ggYW55IG9mIHRoZSB2YWxpZCBob3N0cyBmb3IgdGhpcyBjZXJ0aWZpY2F0
-	ZQcAAAAKUVNzbFNvY2tldAEDAAAAdgBEAGEAcwAgAFoAZQByAHQAaQBmAGkAawBhAHQAIABkAGUA
-	cwAgAEEAdQBzAHMAdABlAGwAbABlAHIAcwAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZwBl
-	AGYAdQBuAGQAZQBuACAAdwBlAHIAZABlAG4IAAAAAAYAAAApVGhlIGlzc3VlciBjZXJ0aWZpY2F0
-	ZSBjb3VsZCBub3QgYmUgZm91bmQHAAAAClFTc2xTb2NrZXQBAwAAALwARABhAHMAIABaAGUAcgB0
-	AGkAZgBpAGsAYQB0ACAAZABlAHMAIABBAHUAcwBzAHQAZQBsAGwAZQByAHMAIABlAGkAbgBlAHMA
-	IABsAG8AawBhAGwAIABnAGUAZgB1AG4AZABlAG4AZQBuACAAWgBlAHIAdABpAGYAaQBrAGEAdABz
-	ACAAawBvAG4AbgB0AGUAIABuAGkAYwBoAHQAIABnAGUAZgB1AG4AZABlAG4AIAB3AGUAcgBkAGUA
-	bggAAAAABgAAAExUaGUgaXNzdWVyIGNlcnRpZmljYXRlIG9mIGEgbG9jYWxseSBsb29rZWQgdXAg
-	Y2VydGlmaWNhdGUgY291bGQgbm90IGJlIGZvdW5kBwAAAApRU3NsU29ja2V0AQMAAACKAEQAYQBz
-	ACAAWgBlAHIAdABpAGYAaQBrAGEAdAAgAGQAZQByACAARwBlAGcAZQBuAHMAdABlAGwAbABlACAA
-	aQBzAHQAIABpAG4AIABlAGkAbgBlAHIAIABTAGMAaAB3AGEAcgB6AGUAbgAgAEwAaQBzAHQAZQAg
-	AGUAbgB0AGgAYQBsAHQAZQBuCAAAAAAGAAAAI1RoZSBwZWVyIGNlcnRpZmljYXRlIGlzIGJsYWNr
-	bGlzdGVkBwAAAApRU3NsU29ja2V0AQMAAABaAEQAaQBlACAARwBlAGcAZQBuAHMAdABlAGwAbABl
-	ACAAaABhAHQAIABrAGUAaQBuACAAWgBlAHIAdABpAGYAaQBrAGEAdAAgAGEAbgBnAGUAZwBlAGIA
-	ZQBuCAAAAAAGAAAAKFRoZSBwZWVyIGRpZCBub3QgcHJlc2VudCBhbnkgY2VydGlmaWNhdGUHAAAA
-	ClFTc2xTb2NrZXQBAwAAAGoARABlAHIAIAD2AGYAZgBlAG4AdABsAGkAYwBoAGUAIABTAGMAaABs
-	APwAcwBzAGUAbAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZwBlAGwAZQBzAGUAbgAgAHcA
-	ZQByAGQAZQBuCAAAAAAGAAAAM1RoZSBwdWJsaWMga2V5IGluIHRoZSBjZXJ0aWZpY2F0ZSBjb3Vs
-	ZCBub3QgYmUgcmVhZAcAAAAKUVNzbFNvY2tldAEDAAAA5ABEAGEAcwAgAG8AYgBlAHIAcwB0AGUA
-	IABaAGUAcgB0AGkAZgBpAGsAYQB0ACAAZABlAHIAIABaAGUAcgB0AGkAZgBpAHoAaQBlAHIAdQBu
-	AGcAcwBzAHQAZQBsAGwAZQAgAHcAZQBpAHMAdAAgAGQAaQBlAHMAZQBuACAARgBhAGwAbAAgAGEA
-	dQBmACAARwByAHUAbgBkACAAZQBpAG4AZQByACAAcwBwAGUAegBpAGUAbABsAGUAbgAgAEsAZQBu
-	AG4AegBlAGkAYwBoAG4AdQBuAGcAIAB6AHUAcgD8AGMAawgAAAAABgAAAEFUaGUgcm9vdCBDQSBj
-	ZXJ0aWZpY2F0ZSBpcyBtYXJrZWQgdG8gcmVqZWN0IHRoZSBzcGVjaWZpZWQgcHVycG9zZQcAAAAK
-	UVNzbFNvY2tldAEDAAAAtgBEAGEAcwAgAG8AYgBlAHIAcwB0AGUAIABaAGUAcgB0AGkAZgBpAGsA
-	YQB0ACAAZABlAHIAIABaAGUAcgB0AGkAZgBpAHoAaQBlAHIAdQBuAGcAcwBzAHQAZQBsAGwAZQAg
-	AGkAcwB0ACAAZgD8AHIAIABkAGkAZQBzAGUAbgAgAEYAYQBsAGwAIABuAGkAYwBoAHQAIAB2AGUA
-	cgB0AHIAYQB1AGUAbgBzAHcA/AByAGQAaQBnCAAAAAAGAAAAN1RoZSByb290IENBIGNlcnRpZmlj
-	YXRlIGlzIG5vdCB0cnVzdGVkIGZvciB0aGlzIHB1cnBvc2UHAAAAClFTc2xTb2NrZXQBAwAAAKgA
-	RABhAHMAIABvAGIAZQByAHMAdABlACAAWgBlAHIAdABpAGYAaQBrAGEAdAAgAGQAZQByACAASwBl
-	AHQAdABlACAAaQBzAHQAIABzAGUAbABiAHMAdABzAGkAZwBuAGkAZQByAHQAIAB1AG4AZAAgAGQA
-	YQBoAGUAcgAgAG4AaQBjAGgAdAAgAHYAZQByAHQAcgBhAHUAZQBuAHMAdwD8AHIAZABpAGcIAAAA
-	AAYAAABLVGhlIHJvb3QgY2VydGlmaWNhdGUgb2YgdGhlIGNlcnRpZmljYXRlIGNoYWluIGlzIHNl
-	bGYtc2lnbmVkLCBhbmQgdW50cnVzdGVkBwAAAApRU3NsU29ja2V0AQMAAABSAEQAaQBlACAAUwBp
-	AGcAbgBhAHQAdQByACAAZABlAHMAIABaAGUAcgB0AGkAZgBpAGsAYQB0AHMAIABpAHMAdAAgAHUA
-	bgBnAPwAbAB0AGkAZwgAAAAABgAAACtUaGUgc2lnbmF0dXJlIG9mIHRoZSBjZXJ0aWZpY2F0ZSBp
-	cyBpbnZhbGlkBwAAAApRU3NsU29ja2V0AQMAAACIAEQAYQBzACAAYQBuAGcAZQBnAGUAYgBlAG4A
-	ZQAgAFoAZQByAHQAaQBmAGkAawBhAHQAIABrAGEAbgBuACAAaQBuACAAZABpAGUAcwBlAG0AIABG
-	AGEAbABsACAAbgBpAGMAaAB0ACAAdgBlAHIAdwBlAG4AZABlAHQAIAB3AGUAcgBkAGUAbggAAAAA
-	BgAAADdUaGUgc3VwcGxpZWQgY2VydGlmaWNhdGUgaXMgdW5zdWl0YWJsZSBmb3IgdGhpcyBwdXJw
-	b3NlBwAAAApRU3NsU29ja2V0AQMAAABgAEQAaQBlACAARABhAHQAZQBuACAAawBvAG4AbgB0AGUA
-	bgAgAG4AaQBjAGgAdAAgAGUAbgB0AHMAYwBoAGwA/ABzAHMAZQBsAHQAIAB3AGUAcgBkAGUAbgA6
-	ACAAJQAxCAAAAAAGAAAAGlVuYWJsZSB0byBkZWNyeXB0IGRhdGE6ICUxBwAAAApRU3NsU29ja2V0
-	AQMAAABqAEQAZQByACAAUwBTAEwALQBLAG8AbgB0AGUAeAB0ACAAawBvAG4AbgB0AGUAIABuAGkA
-	YwBoAHQAIABpAG4AaQB0AGkAYQBsAGkAcwBpAGUAcgB0ACAAdwBlAHIAZABlAG4AOgAgACUAMQgA
-	AAAABgAAAB5VbmFibGUgdG8gaW5pdCBTU0wgQ29udGV4dDogJTEHAAAAClFTc2xTb2NrZXQBAwAA
-	AFwARABpAGUAIABEAGEAdABlAG4AIABrAG8AbgBuAHQAZQBuACAAbgBpAGMAaAB0ACAAZwBlAHMA
-	YwBoAHIAaQBlAGIAZQBuACAAdwBlAHIAZABlAG4AOgAgACUAMQgAAAAABgAAABhVbmFibGUgdG8g
-	d3JpdGUgZGF0YTogJTEHAAAAClFTc2xTb2NrZXQBAwAAACQAVQBuAGIAZQBrAGEAbgBuAHQAZQBy
-	ACAARgBlAGgAbABlAHIIAAAAAAYAAAANVW5rbm93biBlcnJvcgcAAAAKUVNzbFNvY2tldAEDAAAA
-	OgBOAGkAYwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQAZQBzACAAUAByAG8AdABvAGsAbwBs
-	AGwIAAAAAAYAAAAUdW5zdXBwb3J0ZWQgcHJvdG9jb2wHAAAAClFTc2xTb2NrZXQBAwAAAC4AQQBu
-	AHcAZQBuAGQAdQBuAGcAcwBrAG8AbgBmAGkAZwB1AHIAYQB0AGkAbwBuCAAAAAAGAAAAGUFwcGxp
-	Y2F0aW9uIENvbmZpZ3VyYXRpb24HAAAADlFTdGFuZGFyZFBhdGhzAQMAAAAeAEEAbgB3AGUAbgBk
-	AHUAbgBnAHMAZABhAHQAZQBuCAAAAAAGAAAAEEFwcGxpY2F0aW9uIERhdGEHAAAADlFTdGFuZGFy
-	ZFBhdGhzAQMAAAAWAEEAbgB3AGUAbgBkAHUAbgBnAGUAbggAAAAABgAAAAxBcHBsaWNhdGlvbnMH
-	AAAADlFTdGFuZGFyZFBhdGhzAQMAAAAgAFoAdwBpAHMAYwBoAGUAbgBzAHAAZQBpAGMAaABlAHII
-	AAAAAAYAAAAFQ2FjaGUHAAAADlFTdGFuZGFyZFBhdGhzAQMAAAAaAEsAbwBuAGYAaQBnAHUAcgBh
-	AHQAaQBvAG4IAAAAAAYAAAANQ29uZmlndXJhdGlvbgcAAAAOUVN0YW5kYXJkUGF0aHMBAwAAAA4A
-	RABlAHMAawB0AG8AcAgAAAAABgAAAAdEZXNrdG9wBwAAAA5RU3RhbmRhcmRQYXRocwEDAAAAEgBE
-	AG8AawB1AG0AZQBuAHQAZQgAAAAABgAAAAlEb2N1bWVudHMHAAAADlFTdGFuZGFyZFBhdGhzAQMA
-	AAAQAEQAbwB3AG4AbABvAGEAZAgAAAAABgAAAAhEb3dubG9hZAcAAAAOUVN0YW5kYXJkUGF0aHMB
-	AwAAABgAUwBjAGgAcgBpAGYAdABhAHIAdABlAG4IAAAAAAYAAAAFRm9udHMHAAAADlFTdGFuZGFy
-	ZFBhdGhzAQMAAAAmAEIAZQBuAHUAdAB6AGUAcgB2AGUAcgB6AGUAaQBjAGgAbgBpAHMIAAAAAAYA
-	AAAESG9tZQcAAAAOUVN0YW5kYXJkUGF0aHMBAwAAAAoARgBpAGwAbQBlCAAAAAAGAAAABk1vdmll
-	cwcAAAAOUVN0YW5kYXJkUGF0aHMBAwAAAAoATQB1AHMAaQBrCAAAAAAGAAAABU11c2ljBwAAAA5R
-	U3RhbmRhcmRQYXRocwEDAAAADABCAGkAbABkAGUAcggAAAAABgAAAAhQaWN0dXJlcwcAAAAOUVN0
-	YW5kYXJkUGF0aHMBAwAAABAATABhAHUAZgB6AGUAaQB0CAAAAAAGAAAAB1J1bnRpbWUHAAAADlFT
-	dGFuZGFyZFBhdGhzAQMAAAA4AEcAZQBtAGUAaQBuAHMAYQBtAGUAcgAgAFoAdwBpAHMAYwBoAGUA
-	bgBzAHAAZQBpAGMAaABlAHIIAAAAAAYAAAAMU2hhcmVkIENhY2hlBwAAAA5RU3RhbmRhcmRQYXRo
-	cwEDAAAAMABHAGUAbQBlAGkAbgBzAGEAbQBlACAASwBvAG4AZgBpAGcAdQByAGEAdABpAG8AbggA
-	AAAABgAAABRTaGFyZWQgQ29uZmlndXJhdGlvbgcAAAAOUVN0YW5kYXJkUGF0aHMBAwAAACAARwBl
-	AG0AZQBpAG4AcwBhAG0AZQAgAEQAYQB0AGUAbggAAAAABgAAAAtTaGFyZWQgRGF0YQcAAAAOUVN0
-	YW5kYXJkUGF0aHMBAwAAACwAVABlAG0AcABvAHIA5AByAGUAcwAgAFYAZQByAHoAZQBpAGMAaABu
-	AGkAcwgAAAAABgAAABNUZW1wb3JhcnkgRGlyZWN0b3J5BwAAAA5RU3RhbmRhcmRQYXRocwEDAAAA
-	aABEAGUAcgAgAEEAbgBmAGEAbgBnAHMAegB1AHMAdABhAG4AZAAgAGkAbQAgAFYAZQByAGwAYQB1
-	AGYAIABiAGUAaQAgAFoAdQBzAHQAYQBuAGQAIAAnACUAMQAnACAAZgBlAGgAbAB0CAAAAAAGAAAA
-	K01pc3NpbmcgZGVmYXVsdCBzdGF0ZSBpbiBoaXN0b3J5IHN0YXRlICclMScHAAAADVFTdGF0ZU1h
-	Y2hpbmUBAwAAAHgARABlAHIAIABBAG4AZgBhAG4AZwBzAHoAdQBzAHQAYQBuAGQAIABkAGUAcwAg
-	AHoAdQBzAGEAbQBtAGUAbgBnAGUAcwBlAHQAegB0AGUAbgAgAFoAdQBzAHQAYQBuAGQAcwAgACcA
-	JQAxACcAIABmAGUAaABsAHQIAAAAAAYAAAAsTWlzc2luZyBpbml0aWFsIHN0YXRlIGluIGNvbXBv
-	dW5kIHN0YXRlICclMScHAAAADVFTdGF0ZU1hY2hpbmUBAwAAALIARABpAGUAIABaAGkAZQBsAGUA
-	IAB1AG4AZAAgAGQAaQBlACAAUQB1AGUAbABsAGUAIABkAGUAcwAgANwAYgBlAHIAZwBhAG4AZwBz
-	ACAAdgBvAG0AIABaAHUAcwB0AGEAbgBkACAAJwAlADEAJwAgAGgAYQBiAGUAbgAgAGsAZQBpAG4A
-	ZQBuACAAZwBlAG0AZQBpAG4AcwBhAG0AZQBuACAAVQByAHMAcAByAHUAbgBnCAAAAAAGAAAAR05v
-	IGNvbW1vbiBhbmNlc3RvciBmb3IgdGFyZ2V0cyBhbmQgc291cmNlIG9mIHRyYW5zaXRpb24gZnJv
-	bSBzdGF0ZSAnJTEnBwAAAA1RU3RhdGVNYWNoaW5lAQMAAAAkAFUAbgBiAGUAawBhAG4AbgB0AGUA
-	cgAgAEYAZQBoAGwAZQByCAAAAAAGAAAADVVua25vd24gZXJyb3IHAAAADVFTdGF0ZU1hY2hpbmUB
-	AwAAACoAJQAxADoAIABFAHgAaQBzAHQAaQBlAHIAdAAgAGIAZQByAGUAaQB0AHMIAAAAAAYAAAAS
-	JTE6IGFscmVhZHkgZXhpc3RzBwAAABBRU3lzdGVtU2VtYXBob3JlAQMAAAAkACUAMQA6ACAATgBp
-	AGMAaAB0ACAAZQB4AGkAcwB0AGUAbgB0CAAAAAAGAAAAEiUxOiBkb2VzIG5vdCBleGlzdAcAAAAQ
-	UVN5c3RlbVNlbWFwaG9yZQEDAAAARgAlADEAOgAgAEsAZQBpAG4AZQAgAFIAZQBzAHMAbwB1AHIA
-	YwBlAG4AIABtAGUAaAByACAAdgBlAHIAZgD8AGcAYgBhAHIIAAAAAAYAAAAUJTE6IG91dCBvZiBy
-	ZXNvdXJjZXMHAAAAEFFTeXN0ZW1TZW1hcGhvcmUBAwAAACwAJQAxADoAIABaAHUAZwByAGkAZgBm
-	ACAAdgBlAHIAdwBlAGkAZwBlAHIAdAgAAAAABgAAABUlMTogcGVybWlzc2lvbiBkZW5pZWQHAAAA
-	EFFTeXN0ZW1TZW1hcGhvcmUBAwAAADIAJQAxADoAIABVAG4AYgBlAGsAYQBuAG4AdABlAHIAIABG
-	AGUAaABsAGUAcgAgACUAMggAAAAABgAAABQlMTogdW5rbm93biBlcnJvciAlMgcAAAAQUVN5c3Rl
-	bVNlbWFwaG9yZQEDAAAAZABEAGkAZQAgAEQAYQB0AGUAbgBiAGEAbgBrAHYAZQByAGIAaQBuAGQA
-	dQBuAGcAIABrAGEAbgBuACAAbgBpAGMAaAB0ACAAZwBlAPYAZgBmAG4AZQB0ACAAdwBlAHIAZABl
-	AG4IAAAAAAYAAAAZVW5hYmxlIHRvIG9wZW4gY29ubmVjdGlvbgcAAAAKUVREU0RyaXZlcgEDAAAA
-	UgBEAGkAZQAgAEQAYQB0AGUAbgBiAGEAbgBrACAAawBhAG4AbgAgAG4AaQBjAGgAdAAgAHYAZQBy
-	AHcAZQBuAGQAZQB0ACAAdwBlAHIAZABlAG4IAAAAAAYAAAAWVW5hYmxlIHRvIHVzZSBkYXRhYmFz
-	ZQcAAAAKUVREU0RyaXZlcgEDAAAAJgBOAGEAYwBoACAAbABpAG4AawBzACAAcwBjAHIAbwBsAGwA
-	ZQBuCAAAAAAGAAAAC1Njcm9sbCBMZWZ0BwAAAAdRVGFiQmFyAQMAAAAoAE4AYQBjAGgAIAByAGUA
-	YwBoAHQAcwAgAHMAYwByAG8AbABsAGUAbggAAAAABgAAAAxTY3JvbGwgUmlnaHQHAAAAB1FUYWJC
-	YXIBAwAAAFoARABpAGUAcwBlACAAUwBvAGMAawBlAHQALQBPAHAAZQByAGEAdABpAG8AbgAgAHcA
-	aQByAGQAIABuAGkAYwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQIAAAAAAYAAAAkT3BlcmF0
-	aW9uIG9uIHNvY2tldCBpcyBub3Qgc3VwcG9ydGVkBwAAAApRVGNwU2VydmVyAQMAAABUAEQAYQBz
-	ACAARQBuAGQAZQBsAGUAbQBlAG4AdAAgAGsAbwBuAG4AdABlACAAbgBpAGMAaAB0ACAAZwBlAGwA
-	ZQBzAGUAbgAgAHcAZQByAGQAZQBuCAAAAAAGAAAAFUNvdWxkIG5vdCByZWFkIGZvb3RlcgcAAAAI
-	UVRnYUZpbGUBAwAAAFQARABpAGUAIABCAGkAbABkAGQAYQB0AGUAbgAgAGsAbwBuAG4AdABlAG4A
-	IABuAGkAYwBoAHQAIABnAGUAbABlAHMAZQBuACAAdwBlAHIAZABlAG4IAAAAAAYAAAAZQ291bGQg
-	bm90IHJlYWQgaW1hZ2UgZGF0YQcAAAAIUVRnYUZpbGUBAwAAAGQARABpAGUAIABQAG8AcwBpAHQA
-	aQBvAG4AaQBlAHIAdQBuAGcAIAB6AHUAbQAgAEwAZQBzAGUAbgAgAGQAZQByACAARABhAHQAZQBu
-	ACAAcwBjAGgAbAB1AGcAIABmAGUAaABsCAAAAAAGAAAAHENvdWxkIG5vdCByZXNldCB0byByZWFk
-	IGRhdGEHAAAACFFUZ2FGaWxlAQMAAAB+AEQAaQBlACAAUABvAHMAaQB0AGkAbwBuAGkAZQByAHUA
-	bgBnACAAYQB1AGYAIABkAGUAbQAgAEUAbgBkAGUAbABlAG0AZQBuAHQAIABkAGUAcgAgAEIAaQBs
-	AGQAZABhAHQAZQBuACAAcwBjAGgAbAB1AGcAIABmAGUAaABsCAAAAAAGAAAAI0NvdWxkIG5vdCBz
-	ZWVrIHRvIGltYWdlIHJlYWQgZm9vdGVyBwAAAAhRVGdhRmlsZQEDAAAARgBVAG4AZwD8AGwAdABp
-	AGcAZQAgAFQAaQBlAGYAZQBuAGEAbgBnAGEAYgBlACAAaQBuACAAQgBpAGwAZABkAGEAdABlAG4I
-	AAAAAAYAAAAVSW1hZ2UgZGVwdGggbm90IHZhbGlkBwAAAAhRVGdhRmlsZQEDAAAAXABEAGEAcwAg
-	AEwAZQBzAGUAbgAgAGQAZQByACAASwBvAHAAZgBkAGEAdABlAG4AIABkAGUAcwAgAEIAaQBsAGQA
-	ZQBzACAAcwBjAGgAbAB1AGcAIABmAGUAaABsCAAAAAAGAAAAGEltYWdlIGhlYWRlciByZWFkIGZh
-	aWxlZAcAAAAIUVRnYUZpbGUBAwAAAIwARABpAGUAcwBlAHIAIABUAHkAcAAgAHYAbwBuACAAQgBp
-	AGwAZABkAGEAdABlAG4AIAAoAG4AaQBjAGgAdAAgAFQAcgB1AGUAVgBpAHMAaQBvAG4AIAAyAC4A
-	MAApACAAdwBpAHIAZAAgAG4AaQBjAGgAdAAgAHUAbgB0AGUAcgBzAHQA/AB0AHoAdAgAAAAABgAA
-	AC1JbWFnZSB0eXBlIChub24tVHJ1ZVZpc2lvbiAyLjApIG5vdCBzdXBwb3J0ZWQHAAAACFFUZ2FG
-	aWxlAQMAAABeAEQAaQBlAHMAZQByACAAVAB5AHAAIAB2AG8AbgAgAEIAaQBsAGQAZABhAHQAZQBu
-	ACAAdwBpAHIAZAAgAG4AaQBjAGgAdAAgAHUAbgB0AGUAcgBzAHQA/AB0AHoAdAgAAAAABgAAABhJ
-	bWFnZSB0eXBlIG5vdCBzdXBwb3J0ZWQHAAAACFFUZ2FGaWxlAQMAAAC0AEQAaQBlACAAUABvAHMA
-	aQB0AGkAbwBuAGkAZQByAHUAbgBnACAAZQBpAG4AZQByACAARABhAHQAZQBpAC8AZQBpAG4AZQBz
-	ACAARQBpAG4AZwBhAGIAZQBnAGUAcgDkAHQAcwAgAGYA/AByACAAZABhAHMAIABMAGUAcwBlAG4A
-	IABkAGUAcgAgAEIAaQBsAGQAZABhAHQAZQBuACAAcwBjAGgAbAB1AGcAIABmAGUAaABsCAAAAAAG
-	AAAAJlNlZWsgZmlsZS9kZXZpY2UgZm9yIGltYWdlIHJlYWQgZmFpbGVkBwAAAAhRVGdhRmlsZQED
-	AAAAvgBEAGEAcwAgAEwAZQBzAGUAbgAgAHYAbwBuACAAQgBpAGwAZABkAGEAdABlAG4AIAB2AG8A
-	bgAgAHMAZQBxAHUAZQBuAHQAaQBlAGwAbABlAG4AIABHAGUAcgDkAHQAZQBuACAAKAB6AHUAbQAg
-	AEIAZQBpAHMAcABpAGUAbAAgAFMAbwBjAGsAZQB0AHMAKQAgAHcAaQByAGQAIABuAGkAYwBoAHQA
-	IAB1AG4AdABlAHIAcwB0APwAdAB6AHQIAAAAAAYAAAA6U2VxdWVudGlhbCBkZXZpY2UgKGVnIHNv
-	Y2tldCkgZm9yIGltYWdlIHJlYWQgbm90IHN1cHBvcnRlZAcAAAAIUVRnYUZpbGUBAwAAAFAARQBz
-	ACAAcwB0AGUAaAB0ACAAawBlAGkAbgAgAEQAYQB0AGEAZwByAGEAbQBtACAAegB1AG0AIABMAGUA
-	cwBlAG4AIABiAGUAcgBlAGkAdAgAAAAABgAAACFObyBkYXRhZ3JhbSBhdmFpbGFibGUgZm9yIHJl
-	YWRpbmcHAAAAClFVZHBTb2NrZXQBAwAAAFAARQBzACAAawBvAG4AbgB0AGUAIABrAGUAaQBuACAA
-	RABhAHQAYQBnAHIAYQBtAG0AIABnAGUAcwBlAG4AZABlAHQAIAB3AGUAcgBkAGUAbggAAAAABgAA
-	ABlVbmFibGUgdG8gc2VuZCBhIGRhdGFncmFtBwAAAApRVWRwU29ja2V0AQMAAAAgAFcAaQBlAGQA
-	ZQByAGgAZQByAHMAdABlAGwAbABlAG4IAAAAAAYAAAAEUmVkbwcAAAAKUVVuZG9Hcm91cAEDAAAA
-	JgAlADEAIAB3AGkAZQBkAGUAcgBoAGUAcgBzAHQAZQBsAGwAZQBuCAAAAAAGAAAAB1JlZG8gJTEH
-	AAAAClFVbmRvR3JvdXABAwAAABQAUgD8AGMAawBnAOQAbgBnAGkAZwgAAAAABgAAAARVbmRvBwAA
-	AApRVW5kb0dyb3VwAQMAAAAoACUAMQAgAHIA/ABjAGsAZwDkAG4AZwBpAGcAIABtAGEAYwBoAGUA
-	bggAAAAABgAAAAdVbmRvICUxBwAAAApRVW5kb0dyb3VwAQMAAAAMADwAbABlAGUAcgA+CAAAAAAG
-	AAAABzxlbXB0eT4HAAAAClFVbmRvTW9kZWwBAwAAACAAVwBpAGUAZABlAHIAaABlAHIAcwB0AGUA
-	bABsAGUAbggAAAAABgAAAARSZWRvBwAAAApRVW5kb1N0YWNrAQMAAAAmACUAMQAgAHcAaQBlAGQA
-	ZQByAGgAZQByAHMAdABlAGwAbABlAG4IAAAAAAYAAAAHUmVkbyAlMQcAAAAKUVVuZG9TdGFjawED
-	AAAAFABSAPwAYwBrAGcA5ABuAGcAaQBnCAAAAAAGAAAABFVuZG8HAAAAClFVbmRvU3RhY2sBAwAA
-	ACgAJQAxACAAcgD8AGMAawBnAOQAbgBnAGkAZwAgAG0AYQBjAGgAZQBuCAAAAAAGAAAAB1VuZG8g
-	JTEHAAAAClFVbmRvU3RhY2sBAwAAADAARgBTAEkAIABGAGkAcgBzAHQAIABzAHQAcgBvAG4AZwAg
-	AGkAcwBvAGwAYQB0AGUIAAAAAAYAAAAYRlNJIEZpcnN0IHN0cm9uZyBpc29sYXRlBwAAABxRVW5p
-	Y29kZUNvbnRyb2xDaGFyYWN0ZXJNZW51AQMAAABAAFUAbgBpAGMAbwBkAGUALQBLAG8AbgB0AHIA
-	bwBsAGwAegBlAGkAYwBoAGUAbgAgAGUAaQBuAGYA/ABnAGUAbggAAAAABgAAACBJbnNlcnQgVW5p
-	Y29kZSBjb250cm9sIGNoYXJhY3RlcgcAAAAcUVVuaWNvZGVDb250cm9sQ2hhcmFjdGVyTWVudQED
-	AAAASABMAFIARQAgAFMAdABhAHIAdAAgAG8AZgAgAGwAZQBmAHQALQB0AG8ALQByAGkAZwBoAHQA
-	IABlAG0AYgBlAGQAZABpAG4AZwgAAAAABgAAACRMUkUgU3RhcnQgb2YgbGVmdC10by1yaWdodCBl
-	bWJlZGRpbmcHAAAAHFFVbmljb2RlQ29udHJvbENoYXJhY3Rlck1lbnUBAwAAADIATABSAEkAIABM
-	AGUAZgB0AC0AdABvAC0AcgBpAGcAaAB0ACAAaQBzAG8AbABhAHQAZQgAAAAABgAAABlMUkkgTGVm
-	dC10by1yaWdodCBpc29sYXRlBwAAABxRVW5pY29kZUNvbnRyb2xDaGFyYWN0ZXJNZW51AQMAAAAs
-	AEwAUgBNACAATABlAGYAdAAtAHQAbwAtAHIAaQBnAGgAdAAgAG0AYQByAGsIAAAAAAYAAAAWTFJN
-	IExlZnQtdG8tcmlnaHQgbWFyawcAAAAcUVVuaWNvZGVDb250cm9sQ2hhcmFjdGVyTWVudQEDAAAA
-	RgBMAFIATwAgAFMAdABhAHIAdAAgAG8AZgAgAGwAZQBmAHQALQB0AG8ALQByAGkAZwBoAHQAIABv
-	AHYAZQByAHIAaQBkAGUIAAAAAAYAAAAjTFJPIFN0YXJ0IG9mIGxlZnQtdG8tcmlnaHQgb3ZlcnJp
-	ZGUHAAAAHFFVbmljb2RlQ29udHJvbENoYXJhY3Rlck1lbnUBAwAAADwAUABEAEYAIABQAG8AcAAg
-	AGQAaQByAGUAYwB0AGkAbwBuAGEAbAAgAGYAbwByAG0AYQB0AHQAaQBuAGcIAAAAAAYAAAAeUERG
-	IFBvcCBkaXJlY3Rpb25hbCBmb3JtYXR0aW5nBwAAABxRVW5pY29kZUNvbnRyb2xDaGFyYWN0ZXJN
-	ZW51AQMAAAA2AFAARABJACAAUABvAHAAIABkAGkAcgBlAGMAdABpAG8AbgBhAGwAIABpAHMAbwBs
-	AGEAdABlCAAAAAAGAAAAG1BESSBQb3AgZGlyZWN0aW9uYWwgaXNvbGF0ZQcAAAAcUVVuaWNvZGVD
-	b250cm9sQ2hhcmFjdGVyTWVudQEDAAAASABSAEwARQAgAFMAdABhAHIAdAAgAG8AZgAgAHIAaQBn
-	AGgAdAAtAHQAbwAtAGwAZQBmAHQAIABlAG0AYgBlAGQAZABpAG4AZwgAAAAABgAAACRSTEUgU3Rh
-	cnQgb2YgcmlnaHQtdG8tbGVmdCBlbWJlZGRpbmcHAAAAHFFVbmljb2RlQ29udHJvbENoYXJhY3Rl
-	ck1lbnUBAwAAADIAUgBMAEkAIABSAGkAZwBoAHQALQB0AG8ALQBsAGUAZgB0ACAAaQBzAG8AbABh
-	AHQAZQgAAAAABgAAABlSTEkgUmlnaHQtdG8tbGVmdCBpc29sYXRlBwAAABxRVW5pY29kZUNvbnRy
-	b2xDaGFyYWN0ZXJNZW51AQMAAAAsAFIATABNACAAUgBpAGcAaAB0AC0AdABvAC0AbABlAGYAdAAg
-	AG0AYQByAGsIAAAAAAYAAAAWUkxNIFJpZ2h0LXRvLWxlZnQgbWFyawcAAAAcUVVuaWNvZGVDb250
-	cm9sQ2hhcmFjdGVyTWVudQEDAAAARgBSAEwATwAgAFMAdABhAHIAdAAgAG8AZgAgAHIAaQBnAGgA
-	dAAtAHQAbwAtAGwAZQBmAHQAIABvAHYAZQByAHIAaQBkAGUIAAAAAAYAAAAjUkxPIFN0YXJ0IG9m
-	IHJpZ2h0LXRvLWxlZnQgb3ZlcnJpZGUHAAAAHFFVbmljb2RlQ29udHJvbENoYXJhY3Rlck1lbnUB
-	AwAAACoAWgBXAEoAIABaAGUAcgBvACAAdwBpAGQAdABoACAAagBvAGkAbgBlAHIIAAAAAAYAAAAV
-	WldKIFplcm8gd2lkdGggam9pbmVyBwAAABxRVW5pY29kZUNvbnRyb2xDaGFyYWN0ZXJNZW51AQMA
-	AAA0AFoAVwBOAEoAIABaAGUAcgBvACAAdwBpAGQAdABoACAAbgBvAG4ALQBqAG8AaQBuAGUAcggA
-	AAAABgAAABpaV05KIFplcm8gd2lkdGggbm9uLWpvaW5lcgcAAAAcUVVuaWNvZGVDb250cm9sQ2hh
-	cmFjdGVyTWVudQEDAAAAKgBaAFcAUwBQACAAWgBlAHIAbwAgAHcAaQBkAHQAaAAgAHMAcABhAGMA
-	ZQgAAAAABgAAABVaV1NQIFplcm8gd2lkdGggc3BhY2UHAAAAHFFVbmljb2RlQ29udHJvbENoYXJh
-	Y3Rlck1lbnUBAwAAABYARABpAHIAZQBrAHQAaABpAGwAZgBlCAAAAAAGAAAADFdoYXQncyBUaGlz
-	PwcAAAAQUVdoYXRzVGhpc0FjdGlvbgEDAAAAAgAqCAAAAAAGAAAAASoHAAAAB1FXaWRnZXQBAwAA
-	ABIAJgBLAG8AcABpAGUAcgBlAG4IAAAAAAYAAAAFJkNvcHkHAAAAElFXaWRnZXRUZXh0Q29udHJv
-	bAEDAAAAEgBFAGkAbgBmACYA/ABnAGUAbggAAAAABgAAAAYmUGFzdGUHAAAAElFXaWRnZXRUZXh0
-	Q29udHJvbAEDAAAAIgBXAGkAZQBkAGUAcgAmAGgAZQByAHMAdABlAGwAbABlAG4IAAAAAAYAAAAF
-	JlJlZG8HAAAAElFXaWRnZXRUZXh0Q29udHJvbAEDAAAAFgAmAFIA/ABjAGsAZwDkAG4AZwBpAGcI
-	AAAAAAYAAAAFJlVuZG8HAAAAElFXaWRnZXRUZXh0Q29udHJvbAEDAAAALAAmAEwAaQBuAGsALQBB
-	AGQAcgBlAHMAcwBlACAAawBvAHAAaQBlAHIAZQBuCAAAAAAGAAAAE0NvcHkgJkxpbmsgTG9jYXRp
-	b24HAAAAElFXaWRnZXRUZXh0Q29udHJvbAEDAAAAGgAmAEEAdQBzAHMAYwBoAG4AZQBpAGQAZQBu
-	CAAAAAAGAAAABEN1JnQHAAAAElFXaWRnZXRUZXh0Q29udHJvbAEDAAAADgBMAPYAcwBjAGgAZQBu
-	CAAAAAAGAAAABkRlbGV0ZQcAAAASUVdpZGdldFRleHRDb250cm9sAQMAAAAeAEEAbABsAGUAcwAg
-	AGEAdQBzAHcA5ABoAGwAZQBuCAAAAAAGAAAAClNlbGVjdCBBbGwHAAAAElFXaWRnZXRUZXh0Q29u
-	dHJvbAEDAAAAZgBEAGkAcgBlAGMAdAAyAEQALQBQAGwAYQB0AHQAZgBvAHIAbQAtAFAAbAB1AGcA
-	aQBuACAAawBhAG4AbgAgAG4AaQBjAGgAdAAgAGcAZQBsAGEAZABlAG4AIAB3AGUAcgBkAGUAbggA
-	AAAABgAAACRDYW5ub3QgbG9hZCBkaXJlY3QyZCBwbGF0Zm9ybSBwbHVnaW4HAAAAG1FXaW5kb3dz
-	RGlyZWN0MkRJbnRlZ3JhdGlvbgEDAAACqgBRAHQAIABrAGEAbgBuACAAZABhAHMAIABEAGkAcgBl
-	AGMAdAAyAEQALQBQAGwAYQB0AHQAZgBvAHIAbQAtAFAAbAB1AGcAaQBuACAAbgBpAGMAaAB0ACAA
-	bABhAGQAZQBuACwAIAB3AGUAaQBsACAAZABpAGUAIABhAHUAZgAgAGQAZQBtACAAUwB5AHMAdABl
-	AG0AIABpAG4AcwB0AGEAbABsAGkAZQByAHQAZQAgAFYAZQByAHMAaQBvAG4AIAB2AG8AbgAgAEQA
-	aQByAGUAYwB0ADIARAAgAHYAZQByAGEAbAB0AGUAdAAgAGkAcwB0AC4AIABEAGkAZQBzAGUAcwAg
-	AFAAbABhAHQAdABmAG8AcgBtAC0AUABsAHUAZwBpAG4AIABlAHIAZgBvAHIAZABlAHIAdAAgAG0A
-	aQBuAGQAZQBzAHQAZQBuAHMAIABXAGkAbgBkAG8AdwBzACAANwAgAFMAUAAxACAAbQBpAHQAIABQ
-	AGwAYQB0AHQAZgBvAHIAbQAgAFUAcABkAGEAdABlAC4ACgAKAEQAaQBlACAAbQBpAG4AaQBtAGEA
-	bAAgAGUAcgBmAG8AcgBkAGUAcgBsAGkAYwBoAGUAIABWAGUAcgBzAGkAbwBuACAAdgBvAG4AIABE
-	AGkAcgBlAGMAdAAyAEQAIABpAHMAdAAgACUAMQAuACUAMgAuACUAMwAuACUANAAuACAARABpAGUA
-	IABhAHUAZgAgAGQAaQBlAHMAZQBtACAAUwB5AHMAdABlAG0AIABpAG4AcwB0AGEAbABsAGkAZQBy
-	AHQAZQAgAFYAZQByAHMAaQBvAG4AIAB2AG8AbgAgAEQAaQByAGUAYwB0ADIARAAgAGkAcwB0ACAA
-	JQA1AC4AJQA2AC4AJQA3AC4AJQA4AC4IAAAAAAYAAAEtUXQgY2Fubm90IGxvYWQgdGhlIGRpcmVj
-	dDJkIHBsYXRmb3JtIHBsdWdpbiBiZWNhdXNlIHRoZSBEaXJlY3QyRCB2ZXJzaW9uIG9uIHRoaXMg
-	c3lzdGVtIGlzIHRvbyBvbGQuIFRoZSBtaW5pbXVtIHN5c3RlbSByZXF1aXJlbWVudCBmb3IgdGhp
-	cyBwbGF0Zm9ybSBwbHVnaW4gaXMgV2luZG93cyA3IFNQMSB3aXRoIFBsYXRmb3JtIFVwZGF0ZS4K
-	ClRoZSBtaW5pbXVtIERpcmVjdDJEIHZlcnNpb24gcmVxdWlyZWQgaXMgJTEuJTIuJTMuJTQuIFRo
-	ZSBEaXJlY3QyRCB2ZXJzaW9uIG9uIHRoaXMgc3lzdGVtIGlzICU1LiU2LiU3LiU4LgcAAAAbUVdp
-	bmRvd3NEaXJlY3QyREludGVncmF0aW9uAQMAAAAYAEEAYgAmAHMAYwBoAGwAaQBlAN8AZQBuCAAA
-	AAAGAAAAByZGaW5pc2gHAAAAB1FXaXphcmQBAwAAAAwAJgBIAGkAbABmAGUIAAAAAAYAAAAFJkhl
-	bHAHAAAAB1FXaXphcmQBAwAAAA4AJgBXAGUAaQB0AGUAcggAAAAABgAAAAUmTmV4dAcAAAAHUVdp
-	emFyZAEDAAAAEgAmAFcAZQBpAHQAZQByACAAPggAAAAABgAAAAcmTmV4dCA+BwAAAAdRV2l6YXJk
-	AQMAAAASADwAIAAmAFoAdQByAPwAYwBrCAAAAAAGAAAABzwgJkJhY2sHAAAAB1FXaXphcmQBAwAA
-	ABIAQQBiAGIAcgBlAGMAaABlAG4IAAAAAAYAAAAGQ2FuY2VsBwAAAAdRV2l6YXJkAQMAAAAQAEEA
-	bgB3AGUAbgBkAGUAbggAAAAABgAAAAZDb21taXQHAAAAB1FXaXphcmQBAwAAAAwAVwBlAGkAdABl
-	AHIIAAAAAAYAAAAIQ29udGludWUHAAAAB1FXaXphcmQBAwAAAAwARgBlAHIAdABpAGcIAAAAAAYA
-	AAAERG9uZQcAAAAHUVdpemFyZAEDAAAADABaAHUAcgD8AGMAawgAAAAABgAAAAdHbyBCYWNrBwAA
-	AAdRV2l6YXJkAQMAAAAKAEgAaQBsAGYAZQgAAAAABgAAAARIZWxwBwAAAAdRV2l6YXJkAQMAAAC0
-	AGYAZQBoAGwAZQBuAGQAZQAgAEsAbwBkAGkAZQByAHUAbgBnAC0ARABlAGsAbABhAHIAYQB0AGkA
-	bwBuACAAbwBkAGUAcgAgAFMAdABhAG4AZABhAGwAbwBuAGUALQBEAGUAawBsAGEAcgBhAHQAaQBv
-	AG4AIABiAGUAaQBtACAAUABhAHIAcwBlAG4AIABkAGUAcgAgAFgATQBMAC0ARABlAGsAbABhAHIA
-	YQB0AGkAbwBuCAAAAAAGAAAAWWVuY29kaW5nIGRlY2xhcmF0aW9uIG9yIHN0YW5kYWxvbmUgZGVj
-	bGFyYXRpb24gZXhwZWN0ZWQgd2hpbGUgcmVhZGluZyB0aGUgWE1MIGRlY2xhcmF0aW9uBwAAAARR
-	WG1sAQMAAABoAEYAZQBoAGwAZQByACAAaQBuACAAZABlAHIAIABUAGUAeAB0AC0ARABlAGsAbABh
-	AHIAYQB0AGkAbwBuACAAZQBpAG4AZQByACAAZQB4AHQAZQByAG4AZQBuACAARQBuAHQAaQB0AHkI
-	AAAAAAYAAAAzZXJyb3IgaW4gdGhlIHRleHQgZGVjbGFyYXRpb24gb2YgYW4gZXh0ZXJuYWwgZW50
-	aXR5BwAAAARRWG1sAQMAAABGAEYAZQBoAGwAZQByACAAYgBlAGkAbQAgAFAAYQByAHMAZQBuACAA
-	ZQBpAG4AZQBzACAASwBvAG0AbQBlAG4AdABhAHIAcwgAAAAABgAAACRlcnJvciBvY2N1cnJlZCB3
-	aGlsZSBwYXJzaW5nIGNvbW1lbnQHAAAABFFYbWwBAwAAAFoARgBlAGgAbABlAHIAIABiAGUAaQBt
-	ACAAUABhAHIAcwBlAG4AIABkAGUAcwAgAEkAbgBoAGEAbAB0AHMAIABlAGkAbgBlAHMAIABFAGwA
-	ZQBtAGUAbgB0AHMIAAAAAAYAAAAkZXJyb3Igb2NjdXJyZWQgd2hpbGUgcGFyc2luZyBjb250ZW50
-	BwAAAARRWG1sAQMAAABYAEYAZQBoAGwAZQByACAAYgBlAGkAbQAgAFAAYQByAHMAZQBuACAAZABl
-	AHIAIABEAG8AawB1AG0AZQBuAHQAdAB5AHAAZABlAGYAaQBuAGkAdABpAG8AbggAAAAABgAAADVl
-	cnJvciBvY2N1cnJlZCB3aGlsZSBwYXJzaW5nIGRvY3VtZW50IHR5cGUgZGVmaW5pdGlvbgcAAAAE
-	UVhtbAEDAAAAQgBGAGUAaABsAGUAcgAgAGIAZQBpAG0AIABQAGEAcgBzAGUAbgAgAGUAaQBuAGUA
-	cwAgAEUAbABlAG0AZQBuAHQAcwgAAAAABgAAACRlcnJvciBvY2N1cnJlZCB3aGlsZSBwYXJzaW5n
-	IGVsZW1lbnQHAAAABFFYbWwBAwAAAEIARgBlAGgAbABlAHIAIABiAGUAaQBtACAAUABhAHIAcwBl
-	AG4AIABlAGkAbgBlAHIAIABSAGUAZgBlAHIAZQBuAHoIAAAAAAYAAAAmZXJyb3Igb2NjdXJyZWQg
-	d2hpbGUgcGFyc2luZyByZWZlcmVuY2UHAAAABFFYbWwBAwAAADQASwBvAG4AcwB1AG0AZQBuAHQA
-	IABsAPYAcwB0AGUAIABGAGUAaABsAGUAcgAgAGEAdQBzCAAAAAAGAAAAG2Vycm9yIHRyaWdnZXJl
-	ZCBieSBjb25zdW1lcgcAAAAEUVhtbAEDAAAAcgBpAG4AIABkAGUAcgAgAEQAVABEACAAcwBpAG4A
-	ZAAgAGsAZQBpAG4AZQAgAGUAeAB0AGUAcgBuAGUAbgAgAEUAbgB0AGkAdAB5AC0AUgBlAGYAZQBy
-	AGUAbgB6AGUAbgAgAGUAcgBsAGEAdQBiAHQAIAgAAAAABgAAADtleHRlcm5hbCBwYXJzZWQgZ2Vu
-	ZXJhbCBlbnRpdHkgcmVmZXJlbmNlIG5vdCBhbGxvd2VkIGluIERURAcAAAAEUVhtbAEDAAAAiABp
-	AG4AIABlAGkAbgBlAG0AIABBAHQAdAByAGkAYgB1AHQALQBXAGUAcgB0ACAAcwBpAG4AZAAgAGsA
-	ZQBpAG4AZQAgAGUAeAB0AGUAcgBuAGUAbgAgAEUAbgB0AGkAdAB5AC0AUgBlAGYAZQByAGUAbgB6
-	AGUAbgAgAGUAcgBsAGEAdQBiAHQIAAAAAAYAAABHZXh0ZXJuYWwgcGFyc2VkIGdlbmVyYWwgZW50
-	aXR5IHJlZmVyZW5jZSBub3QgYWxsb3dlZCBpbiBhdHRyaWJ1dGUgdmFsdWUHAAAABFFYbWwBAwAA
-	AIIAaQBuACAAZQBpAG4AZQByACAARABUAEQAIABpAHMAdAAgAGsAZQBpAG4AZQAgAGkAbgB0AGUA
-	cgBuAGUAIABhAGwAbABnAGUAbQBlAGkAbgBlACAARQBuAHQAaQB0AHkALQBSAGUAZgBlAHIAZQBu
-	AHoAIABlAHIAbABhAHUAYgB0CAAAAAAGAAAANGludGVybmFsIGdlbmVyYWwgZW50aXR5IHJlZmVy
-	ZW5jZSBub3QgYWxsb3dlZCBpbiBEVEQHAAAABFFYbWwBAwAAAGQAawBlAGkAbgAgAGcA/ABsAHQA
-	aQBnAGUAcgAgAE4AYQBtAGUAIABmAPwAcgAgAGUAaQBuAGUAIABQAHIAbwBjAGUAcwBzAGkAbgBn
-	AC0ASQBuAHMAdAByAHUAawB0AGkAbwBuCAAAAAAGAAAAJ2ludmFsaWQgbmFtZSBmb3IgcHJvY2Vz
-	c2luZyBpbnN0cnVjdGlvbgcAAAAEUVhtbAEDAAAAXgBlAGkAbgAgAEIAdQBjAGgAcwB0AGEAYgBl
-	ACAAaQBzAHQAIABhAG4AIABkAGkAZQBzAGUAcgAgAFMAdABlAGwAbABlACAAZQByAGYAbwByAGQA
-	ZQByAGwAaQBjAGgIAAAAAAYAAAASbGV0dGVyIGlzIGV4cGVjdGVkBwAAAARRWG1sAQMAAAA+AG0A
-	ZQBoAHIAZQByAGUAIABEAG8AawB1AG0AZQBuAHQAdAB5AHAAZABlAGYAaQBuAGkAdABpAG8AbgBl
-	AG4IAAAAAAYAAAAmbW9yZSB0aGFuIG9uZSBkb2N1bWVudCB0eXBlIGRlZmluaXRpb24HAAAABFFY
-	bWwBAwAAABYAawBlAGkAbgAgAEYAZQBoAGwAZQByCAAAAAAGAAAAEW5vIGVycm9yIG9jY3VycmVk
-	BwAAAARRWG1sAQMAAAAgAHIAZQBrAHUAcgBzAGkAdgBlACAARQBuAHQAaQB0AHkIAAAAAAYAAAAS
-	cmVjdXJzaXZlIGVudGl0aWVzBwAAAARRWG1sAQMAAAB+AGYAZQBoAGwAZQBuAGQAZQAgAFMAdABh
-	AG4AZABhAGwAbwBuAGUALQBEAGUAawBsAGEAcgBhAHQAaQBvAG4AIABiAGUAaQBtACAAUABhAHIA
-	cwBlAG4AIABkAGUAcgAgAFgATQBMACAARABlAGsAbABhAHIAYQB0AGkAbwBuCAAAAAAGAAAAQXN0
-	YW5kYWxvbmUgZGVjbGFyYXRpb24gZXhwZWN0ZWQgd2hpbGUgcmVhZGluZyB0aGUgWE1MIGRlY2xh
-	cmF0aW9uBwAAAARRWG1sAQMAAABYAEUAbABlAG0AZQBuAHQALQBUAGEAZwBzACAAcwBpAG4AZAAg
-	AG4AaQBjAGgAdAAgAHIAaQBjAGgAdABpAGcAIABnAGUAcwBjAGgAYQBjAGgAdABlAGwAdAgAAAAA
-	BgAAAAx0YWcgbWlzbWF0Y2gHAAAABFFYbWwBAwAAACgAdQBuAGUAcgB3AGEAcgB0AGUAdABlAHMA
-	IABaAGUAaQBjAGgAZQBuCAAAAAAGAAAAFHVuZXhwZWN0ZWQgY2hhcmFjdGVyBwAAAARRWG1sAQMA
-	AAA2AHUAbgBlAHIAdwBhAHIAdABlAHQAZQBzACAARQBuAGQAZQAgAGQAZQByACAARABhAHQAZQBp
-	CAAAAAAGAAAAFnVuZXhwZWN0ZWQgZW5kIG9mIGZpbGUHAAAABFFYbWwBAwAAAH4AbgBpAGMAaAB0
-	AC0AYQBuAGEAbAB5AHMAaQBlAHIAdABlACAARQBuAHQAaQB0AHkALQBSAGUAZgBlAHIAZQBuAHoA
-	IABpAG0AIABmAGEAbABzAGMAaABlAG4AIABLAG8AbgB0AGUAeAB0ACAAdgBlAHIAdwBlAG4AZABl
-	AHQIAAAAAAYAAAAqdW5wYXJzZWQgZW50aXR5IHJlZmVyZW5jZSBpbiB3cm9uZyBjb250ZXh0BwAA
-	AARRWG1sAQMAAABgAGYAZQBoAGwAZQBuAGQAZQAgAFYAZQByAHMAaQBvAG4AIABiAGUAaQBtACAA
-	UABhAHIAcwBlAG4AIABkAGUAcgAgAFgATQBMAC0ARABlAGsAbABhAHIAYQB0AGkAbwBuCAAAAAAG
-	AAAAMnZlcnNpb24gZXhwZWN0ZWQgd2hpbGUgcmVhZGluZyB0aGUgWE1MIGRlY2xhcmF0aW9uBwAA
-	AARRWG1sAQMAAABYAGYAYQBsAHMAYwBoAGUAcgAgAFcAZQByAHQAIABmAPwAcgAgAGQAaQBlACAA
-	UwB0AGEAbgBkAGEAbABvAG4AZQAtAEQAZQBrAGwAYQByAGEAdABpAG8AbggAAAAABgAAACZ3cm9u
-	ZyB2YWx1ZSBmb3Igc3RhbmRhbG9uZSBkZWNsYXJhdGlvbgcAAAAEUVhtbAEDAAAAXgAlADEAIABp
-	AHMAdAAgAGsAZQBpAG4AZQAgAGcA/ABsAHQAaQBnAGUAIABBAG4AZwBhAGIAZQAgAGYA/AByACAA
-	ZQBpAG4AZQAgAFAAVQBCAEwASQBDAC0ASQBkAC4IAAAAAAYAAAAjJTEgaXMgYW4gaW52YWxpZCBQ
-	VUJMSUMgaWRlbnRpZmllci4HAAAAClFYbWxTdHJlYW0BAwAAAFgAJQAxACAAaQBzAHQAIABrAGUA
-	aQBuACAAZwD8AGwAdABpAGcAZQByACAATgBhAG0AZQAgAGYA/AByACAAZABpAGUAIABLAG8AZABp
-	AGUAcgB1AG4AZwAuCAAAAAAGAAAAHyUxIGlzIGFuIGludmFsaWQgZW5jb2RpbmcgbmFtZS4HAAAA
-	ClFYbWxTdHJlYW0BAwAAAHQAJQAxACAAaQBzAHQAIABrAGUAaQBuACAAZwD8AGwAdABpAGcAZQBy
-	ACAATgBhAG0AZQAgAGYA/AByACAAZQBpAG4AZQAgAFAAcgBvAHoAZQBzAHMAaQBuAGcALQBJAG4A
-	cwB0AHIAdQBrAHQAaQBvAG4ALggAAAAABgAAAC0lMSBpcyBhbiBpbnZhbGlkIHByb2Nlc3Npbmcg
-	aW5zdHJ1Y3Rpb24gbmFtZS4HAAAAClFYbWxTdHJlYW0BAwAAABgAJQAxACAAbwBkAGUAcgAgACcA
-	JQAyACcIAAAAAAYAAAAKJTEgb3IgJyUyJwcAAAAKUVhtbFN0cmVhbQEDAAAAEAAlADEALAAgACcA
-	JQAyACcIAAAAAAYAAAAIJTEsICclMicHAAAAClFYbWxTdHJlYW0BAwAAABgAJQAxACAAbwBkAGUA
-	cgAgACcAJQAyACcIAAAAAAYAAAALJTEsIG9yICclMicHAAAAClFYbWxTdHJlYW0BAwAAAAgAJwAl
-	ADEAJwgAAAAABgAAAAQnJTEnBwAAAApRWG1sU3RyZWFtAQMAAABCAEEAdAB0AHIAaQBiAHUAdAAg
-	ACcAJQAxACcAIABtAGUAaAByAGYAYQBjAGgAIABkAGUAZgBpAG4AaQBlAHIAdAAuCAAAAAAGAAAA
-	GUF0dHJpYnV0ZSAnJTEnIHJlZGVmaW5lZC4HAAAAClFYbWxTdHJlYW0BAwAAAE4ARABpAGUAIABL
-	AG8AZABpAGUAcgB1AG4AZwAgACUAMQAgAHcAaQByAGQAIABuAGkAYwBoAHQAIAB1AG4AdABlAHIA
-	cwB0APwAdAB6AHQIAAAAAAYAAAAaRW5jb2RpbmcgJTEgaXMgdW5zdXBwb3J0ZWQHAAAAClFYbWxT
-	dHJlYW0BAwAAAHAARQBzACAAdwB1AHIAZABlACAASQBuAGgAYQBsAHQAIABtAGkAdAAgAGUAaQBu
-	AGUAcgAgAHUAbgBnAPwAbAB0AGkAZwBlAG4AIABLAG8AZABpAGUAcgB1AG4AZwAgAGcAZQBmAHUA
-	bgBkAGUAbgAuCAAAAAAGAAAAKEVuY291bnRlcmVkIGluY29ycmVjdGx5IGVuY29kZWQgY29udGVu
-	dC4HAAAAClFYbWxTdHJlYW0BAwAAAEoARABpAGUAIABFAG4AdABpAHQAeQAgACcAJQAxACcAIABp
-	AHMAdAAgAG4AaQBjAGgAdAAgAGQAZQBrAGwAYQByAGkAZQByAHQALggAAAAABgAAABlFbnRpdHkg
-	JyUxJyBub3QgZGVjbGFyZWQuBwAAAApRWG1sU3RyZWFtAQMAAABEACUAMQAgAGUAcgB3AGEAcgB0
-	AGUAdAAsACAAagBlAGQAbwBjAGgAIAAnACUAMgAnACAAZQByAGgAYQBsAHQAZQBuAC4IAAAAAAYA
-	AAAaRXhwZWN0ZWQgJTEsIGJ1dCBnb3QgJyUyJy4HAAAAClFYbWxTdHJlYW0BAwAAAEAARQBzACAA
-	dwB1AHIAZABlAG4AIABaAGUAaQBjAGgAZQBuAGQAYQB0AGUAbgAgAGUAcgB3AGEAcgB0AGUAdAAu
-	CAAAAAAGAAAAGEV4cGVjdGVkIGNoYXJhY3RlciBkYXRhLgcAAAAKUVhtbFN0cmVhbQEDAAAAWADc
-	AGIAZQByAHoA5ABoAGwAaQBnAGUAcgAgAEkAbgBoAGEAbAB0ACAAbgBhAGMAaAAgAEUAbgBkAGUA
-	IABkAGUAcwAgAEQAbwBrAHUAbQBlAG4AdABzAC4IAAAAAAYAAAAhRXh0cmEgY29udGVudCBhdCBl
-	bmQgb2YgZG9jdW1lbnQuBwAAAApRWG1sU3RyZWFtAQMAAABCAFUAbgBnAPwAbAB0AGkAZwBlACAA
-	TgBhAG0AZQBuAHMAcgBhAHUAbQAtAEQAZQBrAGwAYQByAGEAdABpAG8AbgAuCAAAAAAGAAAAHkls
-	bGVnYWwgbmFtZXNwYWNlIGRlY2xhcmF0aW9uLgcAAAAKUVhtbFN0cmVhbQEDAAAALgBVAG4AZwD8
-	AGwAdABpAGcAZQBzACAAWABNAEwALQBaAGUAaQBjAGgAZQBuAC4IAAAAAAYAAAAWSW52YWxpZCBY
-	TUwgY2hhcmFjdGVyLgcAAAAKUVhtbFN0cmVhbQEDAAAAKABVAG4AZwD8AGwAdABpAGcAZQByACAA
-	WABNAEwALQBOAGEAbQBlAC4IAAAAAAYAAAARSW52YWxpZCBYTUwgbmFtZS4HAAAAClFYbWxTdHJl
-	YW0BAwAAADoAVQBuAGcA/ABsAHQAaQBnAGUAIABYAE0ATAAtAFYAZQByAHMAaQBvAG4AcwBhAG4A
-	ZwBhAGIAZQAuCAAAAAAGAAAAG0ludmFsaWQgWE1MIHZlcnNpb24gc3RyaW5nLgcAAAAKUVhtbFN0
-	cmVhbQEDAAAAaABEAGkAZQAgAFgATQBMAC0ARABlAGsAbABhAHIAYQB0AGkAbwBuACAAZQBuAHQA
-	aADkAGwAdAAgAGUAaQBuACAAdQBuAGcA/ABsAHQAaQBnAGUAcwAgAEEAdAB0AHIAaQBiAHUAdAAu
-	CAAAAAAGAAAAJUludmFsaWQgYXR0cmlidXRlIGluIFhNTCBkZWNsYXJhdGlvbi4HAAAAClFYbWxT
-	dHJlYW0BAwAAADQAVQBuAGcA/ABsAHQAaQBnAGUAIABaAGUAaQBjAGgAZQBuAHIAZQBmAGUAcgBl
-	AG4AegAuCAAAAAAGAAAAHEludmFsaWQgY2hhcmFjdGVyIHJlZmVyZW5jZS4HAAAAClFYbWxTdHJl
-	YW0BAwAAACgAVQBuAGcA/ABsAHQAaQBnAGUAcwAgAEQAbwBrAHUAbQBlAG4AdAAuCAAAAAAGAAAA
-	EUludmFsaWQgZG9jdW1lbnQuBwAAAApRWG1sU3RyZWFtAQMAAAAuAFUAbgBnAPwAbAB0AGkAZwBl
-	AHIAIABFAG4AdABpAHQAeQAtAFcAZQByAHQALggAAAAABgAAABVJbnZhbGlkIGVudGl0eSB2YWx1
-	ZS4HAAAAClFYbWxTdHJlYW0BAwAAAGIARABlAHIAIABOAGEAbQBlACAAZABlAHIAIABQAHIAbwB6
-	AGUAcwBzAGkAbgBnAC0ASQBuAHMAdAByAHUAawB0AGkAbwBuACAAaQBzAHQAIAB1AG4AZwD8AGwA
-	dABpAGcALggAAAAABgAAACRJbnZhbGlkIHByb2Nlc3NpbmcgaW5zdHJ1Y3Rpb24gbmFtZS4HAAAA
-	ClFYbWxTdHJlYW0BAwAAAHgARQBpAG4AZQAgAFAAYQByAGEAbQBlAHQAZQByAC0ARQBuAHQAaQB0
-	AHkALQBEAGUAawBsAGEAcgBhAHQAaQBvAG4AIABkAGEAcgBmACAAawBlAGkAbgAgAE4ARABBAFQA
-	QQAgAGUAbgB0AGgAYQBsAHQAZQBuAC4IAAAAAAYAAAAmTkRBVEEgaW4gcGFyYW1ldGVyIGVudGl0
-	eSBkZWNsYXJhdGlvbi4HAAAAClFYbWxTdHJlYW0BAwAAAGIARABlAHIAIABOAGEAbQBlAG4AcwBy
-	AGEAdQBtAC0AUAByAOQAZgBpAHgAIAAnACUAMQAnACAAdwB1AHIAZABlACAAbgBpAGMAaAB0ACAA
-	ZABlAGsAbABhAHIAaQBlAHIAdAgAAAAABgAAACJOYW1lc3BhY2UgcHJlZml4ICclMScgbm90IGRl
-	Y2xhcmVkBwAAAApRWG1sU3RyZWFtAQMAAADAAEQAaQBlACAAQQBuAHoAYQBoAGwAIABkAGUAcgAg
-	APYAZgBmAG4AZQBuAGQAZQBuACAARQBsAGUAbQBlAG4AdABlACAAcwB0AGkAbQBtAHQAIABuAGkA
-	YwBoAHQAIABtAGkAdAAgAGQAZQByACAAQQBuAHoAYQBoAGwAIABkAGUAcgAgAHMAYwBoAGwAaQBl
-	AN8AZQBuAGQAZQBuACAARQBsAGUAbQBlAG4AdABlACAA/ABiAGUAcgBlAGkAbgAuCAAAAAAGAAAA
-	IE9wZW5pbmcgYW5kIGVuZGluZyB0YWcgbWlzbWF0Y2guBwAAAApRWG1sU3RyZWFtAQMAAAA+AFYA
-	bwByAHoAZQBpAHQAaQBnAGUAcwAgAEUAbgBkAGUAIABkAGUAcwAgAEQAbwBrAHUAbQBlAG4AdABz
-	AC4IAAAAAAYAAAAaUHJlbWF0dXJlIGVuZCBvZiBkb2N1bWVudC4HAAAAClFYbWxTdHJlYW0BAwAA
-	AFgARQBzACAAdwB1AHIAZABlACAAZQBpAG4AZQAgAHIAZQBrAHUAcgBzAGkAdgBlACAARQBuAHQA
-	aQB0AHkAIABmAGUAcwB0AGcAZQBzAHQAZQBsAGwAdAAuCAAAAAAGAAAAGlJlY3Vyc2l2ZSBlbnRp
-	dHkgZGV0ZWN0ZWQuBwAAAApRWG1sU3RyZWFtAQMAAAB2AEkAbQAgAEEAdAB0AHIAaQBiAHUAdAB3
-	AGUAcgB0ACAAdwB1AHIAZABlACAAZABpAGUAIABlAHgAdABlAHIAbgBlACAARQBuAHQAaQB0AHkA
-	IAAnACUAMQAnACAAcgBlAGYAZQByAGUAbgB6AGkAZQByAHQALggAAAAABgAAADVSZWZlcmVuY2Ug
-	dG8gZXh0ZXJuYWwgZW50aXR5ICclMScgaW4gYXR0cmlidXRlIHZhbHVlLgcAAAAKUVhtbFN0cmVh
-	bQEDAAAAYgBFAHMAIAB3AHUAcgBkAGUAIABkAGkAZQAgAHUAbgBnAGUAcABhAHIAcwB0AGUAIABF
-	AG4AdABpAHQAeQAgACcAJQAxACcAIAByAGUAZgBlAHIAZQBuAHoAaQBlAHIAdAAuCAAAAAAGAAAA
-	IlJlZmVyZW5jZSB0byB1bnBhcnNlZCBlbnRpdHkgJyUxJy4HAAAAClFYbWxTdHJlYW0BAwAAAGYA
-	SQBtACAASQBuAGgAYQBsAHQAIABpAHMAdAAgAGQAaQBlACAAWgBlAGkAYwBoAGUAbgBmAG8AbABn
-	AGUAIAAnAF0AXQA+ACcAIABuAGkAYwBoAHQAIABlAHIAbABhAHUAYgB0AC4IAAAAAAYAAAAmU2Vx
-	dWVuY2UgJ11dPicgbm90IGFsbG93ZWQgaW4gY29udGVudC4HAAAAClFYbWxTdHJlYW0BAwAAAIoA
-	RABlAHIAIABXAGUAcgB0ACAAZgD8AHIAIABkAGEAcwAgACcAUwB0AGEAbgBkAGEAbABvAG4AZQAn
-	AC0AQQB0AHQAcgBpAGIAdQB0ACAAawBhAG4AbgAgAG4AdQByACAAJwB5AGUAcwAnACAAbwBkAGUA
-	cgAgACcAbgBvACcAIABzAGUAaQBuAC4IAAAAAAYAAAAiU3RhbmRhbG9uZSBhY2NlcHRzIG9ubHkg
-	eWVzIG9yIG5vLgcAAAAKUVhtbFN0cmVhbQEDAAAANgDWAGYAZgBuAGUAbgBkAGUAcwAgAEUAbABl
-	AG0AZQBuAHQAIABlAHIAdwBhAHIAdABlAHQALggAAAAABgAAABNTdGFydCB0YWcgZXhwZWN0ZWQu
-	BwAAAApRWG1sU3RyZWFtAQMAAACIAEQAYQBzACAAUwB0AGEAbgBkAGEAbABvAG4AZQAtAFAAcwBl
-	AHUAZABvAGEAdAB0AHIAaQBiAHUAdAAgAG0AdQBzAHMAIABkAGUAcgAgAEsAbwBkAGkAZQByAHUA
-	bgBnACAAdQBuAG0AaQB0AHQAZQBsAGIAYQByACAAZgBvAGwAZwBlAG4ALggAAAAABgAAAD9UaGUg
-	c3RhbmRhbG9uZSBwc2V1ZG8gYXR0cmlidXRlIG11c3QgYXBwZWFyIGFmdGVyIHRoZSBlbmNvZGlu
-	Zy4HAAAAClFYbWxTdHJlYW0BAwAAACAAVQBuAGUAcgB3AGEAcgB0AGUAdAAgACcAJQAxACcALggA
-	AAAABgAAABBVbmV4cGVjdGVkICclMScuBwAAAApRWG1sU3RyZWFtAQMAAAByACcAJQAxACcAIABp
-	AHMAdAAgAGsAZQBpAG4AIABnAPwAbAB0AGkAZwBlAHMAIABaAGUAaQBjAGgAZQBuACAAaQBuACAA
-	ZQBpAG4AZQByACAAcAB1AGIAbABpAGMALQBpAGQALQBBAG4AZwBhAGIAZQAuCAAAAAAGAAAAL1Vu
-	ZXhwZWN0ZWQgY2hhcmFjdGVyICclMScgaW4gcHVibGljIGlkIGxpdGVyYWwuBwAAAApRWG1sU3Ry
-	ZWFtAQMAAABSAEQAaQBlAHMAZQAgAFgATQBMAC0AVgBlAHIAcwBpAG8AbgAgAHcAaQByAGQAIABu
-	AGkAYwBoAHQAIAB1AG4AdABlAHIAcwB0APwAdAB6AHQALggAAAAABgAAABhVbnN1cHBvcnRlZCBY
-	TUwgdmVyc2lvbi4HAAAAClFYbWxTdHJlYW0BAwAAAIAARABpAGUAIABYAE0ATAAtAEQAZQBrAGwA
-	YQByAGEAdABpAG8AbgAgAGIAZQBmAGkAbgBkAGUAdAAgAHMAaQBjAGgAIABuAGkAYwBoAHQAIABh
-	AG0AIABBAG4AZgBhAG4AZwAgAGQAZQBzACAARABvAGsAdQBtAGUAbgB0AHMALggAAAAABgAAAClY
-	TUwgZGVjbGFyYXRpb24gbm90IGF0IHN0YXJ0IG9mIGRvY3VtZW50LgcAAAAKUVhtbFN0cmVhbQGI
-	AAAAAgEB"""
-
-C_LISCRYPT_DEQMDATEI = base64.b64decode(lLiSCryptDeQMDateiBase64String)
-"""Deutschprachige Qt-Translation-Datei als Bytes"""
\ No newline at end of file
+	:param pNameString: Name der Konstante
+	:type pNameString: String
+	:return: Wert der Konstante
+	"""
+	if pNameString in C_VERZOEGERTE_RESSOURCEN:
+		from Modell import LiSRessourcen
+		lWert = base64.b64decode(getattr(LiSRessourcen, C_VERZOEGERTE_RESSOURCEN[pNameString]))
+	elif pNameString == 'C_SCHLUESSELARTMESSAGEBOX_SCHLUESSELARTEN':
+		from PyQt5 import QtWidgets
+		lWert = {'Passwort': QtWidgets.QMessageBox.ActionRole,
+				 'Schlüsseldatei': QtWidgets.QMessageBox.ActionRole,
+				 'Abbrechen': QtWidgets.QMessageBox.RejectRole}
+	else:
+		raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(pNameString))
+	globals()[pNameString] = lWert
+	return lWert
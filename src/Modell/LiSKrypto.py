@@ -16,38 +16,41 @@
 # You should have received a copy of the GNU General Public License
 # along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
 
-from Modell import LiSAusnahmen, LiSKonstanten
+from Modell import LiSAusnahmen, LiSBlockgroesse, LiSJournal, LiSKonstanten, LiSPipeline, LiSZeitmessung
 from Sonstiges import LiSWerkzeuge
 
 from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 from cryptography.hazmat.primitives import hashes, hmac
+from cryptography.hazmat.primitives.kdf import hkdf
 from cryptography.hazmat.backends import default_backend
 from cryptography import exceptions as cryptography_exceptions
 
-from PyQt5 import QtWidgets
-
 import datetime 
+import errno
+import fnmatch
+import io
 import logging
 import os
-import re
 import struct
+import time
 
 
 class QDatei:
 	"""
 	Modelliert eine Datei inkl. darauf definierter Operationen aus der Perspektive von LiSCrypt.
 	"""
-	def __init__(self, pQControllerWorkerThread, pErweiterterPfadZuDateiString):
+	def __init__(self, pFunktionsausfuehrer, pErweiterterPfadZuDateiString):
 		"""
 		Initialisiert ein zur Datei pErweiterterPfadZuDateiString gehöriges Objekt der Klasse QDatei.
 
-		:param pQControllerWorkerThread: QControllerWorkerThread, der das Objekt erzeugt hat.
-		:type pQControllerWorkerThread: QControllerWorkerThread
+		:param pFunktionsausfuehrer: Funktionsausfuehrer, der das Objekt erzeugt hat.
+		:type pFunktionsausfuehrer: LiSFunktionsausfuehrung.Funktionsausfuehrer
 		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zur Datei
 		:type pErweiterterPfadZuDateiString: String
 		"""
 		if os.path.isfile(pErweiterterPfadZuDateiString) and not os.path.islink(pErweiterterPfadZuDateiString):
-			self.sQControllerWorkerThread = pQControllerWorkerThread
+			self.sFunktionsausfuehrer = pFunktionsausfuehrer
 			self.sErweiterterPfadZuQuelldateiString = pErweiterterPfadZuDateiString
 		else:
 			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
@@ -64,7 +67,7 @@ class QDatei:
 		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zu Zieldatei
 		:type pErweiterterPfadZuZieldateiString: String
 		"""
-		if self.sQControllerWorkerThread.istFunktionsprozessAktiv() is True:
+		if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is True:
 			self._verschluesseln(pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString)
 		else:
 			raise LiSAusnahmen.QProcessStoppedByUserError()
@@ -80,158 +83,111 @@ class QDatei:
 		:type pErweiterterPfadZuZieldateiString: String
 		"""
 		lQuelldateiEndnameString = os.path.basename(self.sErweiterterPfadZuQuelldateiString)
+		lJournal = LiSJournal.Segmentjournal(LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL, self.sErweiterterPfadZuQuelldateiString)
 
 		try:
 			lQuelldateiStat = os.stat(self.sErweiterterPfadZuQuelldateiString, follow_symlinks=False)
 			lQuelldateigroesseInteger = lQuelldateiStat.st_size
 
-			if lQuelldateigroesseInteger <= LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIGROESSE: # Verwende Verschlüsselungsverfahren LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V3
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Verschlüsselung mit AES-GCM 256')
-				lAESGCMV3SchluesselDictionary = self.sQControllerWorkerThread.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=pSHA512HashwertBytes)
+			# Verwende Verschlüsselungsverfahren LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4 (segmentweise Authentifizierung,
+			# daher ohne Größenbeschränkung gemäß LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIGROESSE):
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Verschlüsselung mit AES-GCM 256 (segmentiert)')
+
+			# Unterbrochene Verschlüsselung fortsetzen, sofern Journal, Zieldatei und Quelldatei zueinander passen:
+			lJournalDictionary = lJournal.lies()
+			lFortsetzungDictionary = self._ermittleFortsetzungDerVerschluesselung(lJournal, lJournalDictionary, pSHA512HashwertBytes, lQuelldateiStat, pErweiterterPfadZuZieldateiString)
+			if lFortsetzungDictionary is None and lJournalDictionary is not None:
+				# Nicht fortsetzbare Teilverschlüsselung (Quelldatei verändert, anderer Schlüssel o.ä.) verwerfen:
+				if lJournalDictionary['Zieldatei'] == pErweiterterPfadZuZieldateiString \
+						and os.path.isfile(pErweiterterPfadZuZieldateiString) and not os.path.islink(pErweiterterPfadZuZieldateiString):
+					self.sFunktionsausfuehrer.vernichte(pErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=False, pIgnoriereFunktionsprozessAktivBoolean=True)
+				lJournal.entferne()
+
+			if lFortsetzungDictionary is not None:
+				lDateischluesselBytes = lFortsetzungDictionary['Dateischluessel']
+				lAESGCMV4NonceBytes = lFortsetzungDictionary['AESGCMV4NonceBytes']
+				lSegmentgroesseInteger = lFortsetzungDictionary['SegmentgroesseInteger']
+			else:
+				lAESGCMV3SchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=pSHA512HashwertBytes)
 				lAESGCMV3SchluesselBytes = lAESGCMV3SchluesselDictionary['AESGCMV3Schluessel']
 				lInitialesScryptSaltBytes = lAESGCMV3SchluesselDictionary['InitialesScryptSalt']
-				lAESGCMV3NonceBytes = self.sQControllerWorkerThread.gibNeueAESGCMNoncePerHKDF()
+				lAESGCMV4NonceBytes = self.sFunktionsausfuehrer.gibNeueAESGCMNoncePerHKDF()
 
 				# Testausgabe zur Funktionsüberprüfung
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln AES-GCM-V3-Schluessel:' + lAESGCMV3SchluesselBytes)
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln Scrypt Salt:' + lInitialesScryptSaltBytes)
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln AES-GCM-V3-Nonce:' + lAESGCMV3NonceBytes)
-
-				lEncryptor = Cipher(algorithms.AES(key=lAESGCMV3SchluesselBytes),
-									modes.GCM(initialization_vector=lAESGCMV3NonceBytes),
-									backend=default_backend()).encryptor()
+				if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+					LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln AES-GCM-V3-Schluessel:' + lAESGCMV3SchluesselBytes)
+					LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln Scrypt Salt:' + lInitialesScryptSaltBytes)
+					LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln AES-GCM-V4-Nonce:' + lAESGCMV4NonceBytes)
 
-				# Anzeige in Statusleiste anpassen:
-				self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Verschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+				lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESGCMV3SchluesselBytes, lAESGCMV4NonceBytes)
+				lSegmentgroesseInteger = Segmentwerkzeuge.gibSegmentgroesse(lQuelldateigroesseInteger,
+																			LiSBlockgroesse.Blockgroessenrichtlinie.gibBlockgroesse(self.sErweiterterPfadZuQuelldateiString))
+			lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(lQuelldateigroesseInteger, lSegmentgroesseInteger)
 
-				with open(self.sErweiterterPfadZuQuelldateiString, 'rb') as lQuelldatei:
-					with open(pErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+			# Anzeige in Statusleiste anpassen:
+			self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Verschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
 
-						# Headerdaten zusammenstellen:
-						lHeaderBytes = self._erstelleHeaderFuerAESGCM_V3(pQuelldateiStat=lQuelldateiStat,
+			with open(self.sErweiterterPfadZuQuelldateiString, 'rb') as lQuelldatei:
+				with open(pErweiterterPfadZuZieldateiString, 'rb+' if lFortsetzungDictionary is not None else 'wb') as lZieldatei:
+
+					if lFortsetzungDictionary is not None:
+						# Zieldatei hinter dem letzten abgeschlossenen Datensegment abschneiden und dort fortsetzen:
+						lHeaderBytes = lFortsetzungDictionary['HeaderBytes']
+						lAbgeschlosseneSegmenteInteger = lFortsetzungDictionary['AbgeschlosseneSegmenteInteger']
+						lZieldatei.truncate(lFortsetzungDictionary['FortsetzungspositionInteger'])
+						lZieldatei.seek(lFortsetzungDictionary['FortsetzungspositionInteger'])
+						lQuelldatei.seek(lAbgeschlosseneSegmenteInteger * lSegmentgroesseInteger)
+					else:
+						# Headerdaten zusammenstellen und schreiben (der Header wird in jedes Segment als AAD einbezogen):
+						lHeaderBytes = self._erstelleHeaderFuerAESGCM_V4(pQuelldateiStat=lQuelldateiStat,
 																		 pScryptSaltBytes=lInitialesScryptSaltBytes,
-																		 pAESNonceBytes=lAESGCMV3NonceBytes)
-
-						# Headerdaten schreiben und in MAC mit einbeziehen
+																		 pAESNonceBytes=lAESGCMV4NonceBytes,
+																		 pSegmentgroesseInteger=lSegmentgroesseInteger)
 						lZieldatei.write(lHeaderBytes)
-						lEncryptor.authenticate_additional_data(lHeaderBytes)
-
-						# Zehn \x00-Werte schreiben (vorangestellte 0-Folge zur frühzeitigen Kontrolle der Entschlüsselung)
-						lNullbytefolgeBytes = b'\x00\x00\x00\x00\x00'
-						lZieldatei.write(lEncryptor.update(lNullbytefolgeBytes))
-
-						# Dateinamen der Quelldatei verschlüsseln und schreiben
-						lQuelldateiEndnameBytes = lQuelldateiEndnameString.encode()
-						lZieldatei.write(lEncryptor.update(lQuelldateiEndnameBytes))
-
-						# Erforderliche LiSCrypt-Version (zur Entschlüsselung) verschlüsseln und schreiben
-						lErforderlicheLiSCryptVersionBytes = LiSKonstanten.C_ERFORDERLICHE_LISCRYPT_VERSION.encode()
-						lZieldatei.write(lEncryptor.update(lErforderlicheLiSCryptVersionBytes))
-
-						# Quelldatei chunkweise verschlüsseln:
-						lBlock = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-						while lBlock:
-							if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-								lZieldatei.write(lEncryptor.update(lBlock))  # Quelldatei blockweiseverschlüsseln
-								lBlock = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-							else:
-								raise LiSAusnahmen.QProcessStoppedByUserError()
-
-
-						# MAC-Tag aus Header + Daten ermitteln und schreiben
-						lEncryptor.finalize()
-						lMACTagBytes = lEncryptor.tag #MAC-Tag ermitteln
-						lZieldatei.write(struct.pack('>I', len(lMACTagBytes))) # Länge des MAC-Tags schreiben (default: 16 Bytes)
-						lZieldatei.write(lMACTagBytes) # MAC-Tag schreiben (default: 16 Bytes)
-
-			else: # Verwende Verschlüsselungsverfahren LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V3_1, weil Datei Größer als LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIGROESSE
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Verschlüsselung mit ChaCha20+HMAC')
-				lChaCha20V3SchluesselDictionary = self.sQControllerWorkerThread.ermittleChaCha20_V3Schluessel(
-					pSHA512HashwertBytes=pSHA512HashwertBytes)
-				lChaCha20V3SchluesselBytes = lChaCha20V3SchluesselDictionary['ChaCha20V3Schluessel']
-				lInitialesScryptSaltBytes = lChaCha20V3SchluesselDictionary['InitialesScryptSalt']
-				lChaCha20V3NonceBytes = self.sQControllerWorkerThread.gibNeueChaCha20NoncePerHKDF()
-
-				# Testausgabe zur Funktionsüberprüfung
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln ChaCha20-V3_1-Krypto-Schluessel:' + lChaCha20V3SchluesselBytes)
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln Scrypt Salt:' + lInitialesScryptSaltBytes)
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln ChaCha20-V3_1-Nonce:' + lChaCha20V3NonceBytes)
-
-				lEncryptor = Cipher(algorithms.ChaCha20(key=lChaCha20V3SchluesselBytes, nonce=lChaCha20V3NonceBytes),
-									mode=None,
-									backend=default_backend()).encryptor()
-
-				lHMACSchluesselDictionary = self.sQControllerWorkerThread.ermittleHMACSchluesselFuerChaCha20_V3_1()
-				lHMACSchluesselBytes = lHMACSchluesselDictionary['HMACSchluessel']
-
-				# Testausgabe zur Funktionsüberprüfung
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln ChaCha20-V3_1-HMAC-Schluessel:' + lHMACSchluesselBytes)
-
-				lHMACBuilder = hmac.HMAC(key=lHMACSchluesselBytes,
-										 algorithm=hashes.SHA512(),
-										 backend=default_backend())
 
-				# Anzeige in Statusleiste anpassen:
-				self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Verschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
-
-				with open(self.sErweiterterPfadZuQuelldateiString, 'rb') as lQuelldatei:
-					with open(pErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
-
-						# Headerdaten zusammenstellen:
-						lHeaderBytes = self._erstelleHeaderFuerChaCha20_V3_1(pQuelldateiStat=lQuelldateiStat,
-																			 pScryptSaltBytes=lInitialesScryptSaltBytes,
-																			 pChaCha20NonceBytes=lChaCha20V3NonceBytes)
-
-						# Headerdaten schreiben und in HMAC mit einbeziehen
-						lZieldatei.write(lHeaderBytes)
-						lHMACBuilder.update(lHeaderBytes)
-
-						# Fünf \x00-Werte schreiben (vorangestellte 0-Folge zur frühzeitigen Kontrolle der Entschlüsselung)
-						lNullbytefolgeBytes = b'\x00\x00\x00\x00\x00'
-						lNullbytefolgeVerschluesselBytes = lEncryptor.update(lNullbytefolgeBytes)
-						lZieldatei.write(lNullbytefolgeVerschluesselBytes)
-						lHMACBuilder.update(lNullbytefolgeVerschluesselBytes)
-
-						# Dateinamen der Quelldatei verschlüsseln, schreiben und das Chiffrat in HMAC mit einbeziehen
-						lQuelldateiEndnameBytes = lQuelldateiEndnameString.encode()
-						lQuelldateiEndnameVerschluesseltBytes = lEncryptor.update(lQuelldateiEndnameBytes)
-						lZieldatei.write(lQuelldateiEndnameVerschluesseltBytes)
-						lHMACBuilder.update(lQuelldateiEndnameVerschluesseltBytes)
-
-						# Erforderliche LiSCrypt-Version (zur Entschlüsselung) verschlüsseln, schreiben und das Chiffrat in HMAC mit einbeziehen
-						lErforderlicheLiSCryptVersionBytes = LiSKonstanten.C_ERFORDERLICHE_LISCRYPT_VERSION.encode()
-						lErforderlicheLiSCryptVersionVerschluesseltBytes = lEncryptor.update(lErforderlicheLiSCryptVersionBytes)
-						lZieldatei.write(lErforderlicheLiSCryptVersionVerschluesseltBytes)
-						lHMACBuilder.update(lErforderlicheLiSCryptVersionVerschluesseltBytes)
-
-						# Quelldatei chunkweise verschlüsseln:
-						lBlock = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-						while lBlock:
-							if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-								lEncryptedblockBytes = lEncryptor.update(lBlock)  # Quelldatei blockweise verschlüsseln
-								lZieldatei.write(lEncryptedblockBytes)  # Verschlüsselte Datei blockweise schreiben
-								lHMACBuilder.update(lEncryptedblockBytes)  # Chiffretext blockweise authentifizieren
-								lBlock = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-							else:
-								raise LiSAusnahmen.QProcessStoppedByUserError()
-
-						# HMAC-Tag aus Header + Daten ermitteln und schreiben
-						lHMACTagBytes = lHMACBuilder.finalize() #HMAC-Tag ermitteln
-						lZieldatei.write(struct.pack('>I', len(lHMACTagBytes))) # Länge des HMAC-Tags schreiben (64 Bytes bei HMAC-SHA512)
-						lZieldatei.write(lHMACTagBytes) #HMAC-Tag schreiben
+						# Metadatensegment (Index 0) schreiben: Fünf \x00-Werte (vorangestellte 0-Folge zur frühzeitigen Kontrolle
+						# der Entschlüsselung), Dateiname der Quelldatei und erforderliche LiSCrypt-Version (zur Entschlüsselung)
+						lMetadatenBytes = Segmentwerkzeuge.erstelleMetadaten(lQuelldateiEndnameString)
+						lZieldatei.write(Segmentwerkzeuge.verschluesseleSegment(lDateischluesselBytes, lAESGCMV4NonceBytes, 0, False, lHeaderBytes, lMetadatenBytes))
+						lAbgeschlosseneSegmenteInteger = 0
+
+					# Fortschritt großer Dateien im Journal sichern (ermöglicht Fortsetzung nach Abbruch oder Absturz):
+					lNachSchreibenFunktion = None
+					if lAnzahlDatensegmenteInteger > LiSKonstanten.C_JOURNAL_INTERVALL_SEGMENTE:
+						lJournal.beginne(pErweiterterPfadZuZieldateiString, lHeaderBytes, lAbgeschlosseneSegmenteInteger)
+						lNachSchreibenFunktion = lambda pSegmentIndexInteger: lJournal.vermerkeSegment(lZieldatei, pSegmentIndexInteger)
+
+					# Quelldatei segmentweise (ggf. parallel) verschlüsseln (Datensegmente ab Index 1, das letzte Segment wird markiert):
+					Segmentwerkzeuge.verschluesseleDatensegmente(lQuelldatei, lZieldatei, lDateischluesselBytes, lAESGCMV4NonceBytes, lHeaderBytes,
+																 lQuelldateigroesseInteger, lSegmentgroesseInteger, self.sFunktionsausfuehrer.istFunktionsprozessAktiv,
+																 pErsterSegmentIndexInteger=lAbgeschlosseneSegmenteInteger + 1, pNachSchreibenFunktion=lNachSchreibenFunktion,
+																 pFortschrittFunktion=self.sFunktionsausfuehrer.meldeFortschritt)
+					if lQuelldatei.read(1) != b'':
+						raise ValueError('Quelldatei wurde während der Verschlüsselung verändert.')
+			lJournal.entferne()
 		except LiSAusnahmen.QProcessStoppedByUserError:
 			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
-			self.sQControllerWorkerThread.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Verschlüsselung abgebrochen]',	pToolTipString=lDateinameReduziertString)
-			if os.path.isfile(pErweiterterPfadZuZieldateiString) and not os.path.islink(pErweiterterPfadZuZieldateiString):
-				try:
-					self.sQControllerWorkerThread.vernichte(pErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=True)
-				except:
-					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Abbruch von Verschlüsselung')
+			try:
+				lFortsetzbarBoolean = lJournal.sichere()
+			except OSError:
+				logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Sicherung des Journals nach Abbruch von Verschlüsselung')
+				lFortsetzbarBoolean = False
+			if lFortsetzbarBoolean is True:
+				self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Verschlüsselung abgebrochen: Fortsetzung möglich]', pToolTipString=lDateinameReduziertString)
+			else:
+				self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Verschlüsselung abgebrochen]',	pToolTipString=lDateinameReduziertString)
+				lJournal.entferne()
+				if os.path.isfile(pErweiterterPfadZuZieldateiString) and not os.path.islink(pErweiterterPfadZuZieldateiString):
+					try:
+						self.sFunktionsausfuehrer.vernichte(pErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=True)
+					except:
+						logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Abbruch von Verschlüsselung')
 			raise
 		except Exception as lException:
+			lJournal.entferne()
 			if os.path.isfile(pErweiterterPfadZuZieldateiString) and not os.path.islink(pErweiterterPfadZuZieldateiString):
 				try:
-					self.sQControllerWorkerThread.vernichte(pErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=True)
+					self.sFunktionsausfuehrer.vernichte(pErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=True)
 				except:
 					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Exception bei Verschlüsselung')
 			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
@@ -242,12 +198,183 @@ class QDatei:
 			# die maximale Anzahl an Verschlüsselungen pro Schlüssel nicht überschritten wird. Das Überschreiben geschieht dann in
 			# der jeweiligen Methode zur Übermittlung eines neuen Schlüsseln bzw. übergeordnet nach Ende des kompletten Funktionsdurchlaufs.
 			if 'lAESGCMV3SchluesselBytes' in locals():
-				if re.match(LiSKonstanten.C_REGEX_NULLBYTES, lAESGCMV3SchluesselBytes) is not None:
-					LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln: lAESGCMV3SchluesselBytes ist Nullbytefolge!')
-			elif 'lChaCha20V3SchluesselBytes' in locals():
-				if re.match(LiSKonstanten.C_REGEX_NULLBYTES, lChaCha20V3SchluesselBytes) is not None:
-					LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSKrypto.QDatei._verschluesseln: lChaCha20V3SchluesselBytes ist Nullbytefolge!')
+				LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(lAESGCMV3SchluesselBytes, b'LiSKrypto.QDatei._verschluesseln: lAESGCMV3SchluesselBytes ist Nullbytefolge!')
+			# Der Dateischlüssel wird nur für diese Datei verwendet und kann überschrieben werden:
+			if 'lDateischluesselBytes' in locals():
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateischluesselBytes)
+
+
+	def verschluesselnAmOrt(self, pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString):
+		"""
+		Veranlasst die Verschlüsselung der zu self.sErweiterterPfadZuDateiString gehörigen Datei am Ort (ohne Kopie)
+		und deren anschließende Umbenennung in pErweiterterPfadZuZieldateiString unter Verwendung eines mittels Scrypt
+		aus pSHA512HashwertBytes generierten Schlüssels. Das Original ist danach nicht mehr vorhanden.
+
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zu Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		"""
+		if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is True:
+			self._verschluesselnAmOrt(pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString)
+		else:
+			raise LiSAusnahmen.QProcessStoppedByUserError()
+
+	def _verschluesselnAmOrt(self, pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString):
+		"""
+		Verschlüsselt die zu self.sErweiterterPfadZuDateiString gehörige Datei im Verfahren
+		LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT in sich selbst und benennt sie anschließend in
+		pErweiterterPfadZuZieldateiString um. Jedes Byte wird einmal gelesen und einmal geschrieben, zusätzlicher
+		Speicherplatz wird nur für Header, MAC-Tags und die Nullbytefolge im Metadatensegment benötigt.
+
+		Die Datei wird zunächst auf ihre endgültige Größe verlängert. Anschließend werden die Datensegmente vom Dateiende
+		her verschlüsselt: Das Chiffrat eines Segments liegt um Header, Metadatensegment und die MAC-Tags der vorherigen
+		Segmente hinter seinem Klartext. Da Header und Metadatensegment zusammen mindestens
+		LiSKonstanten.C_AM_ORT_PUFFERSEGMENTE Datensegmente lang sind, überschreibt es nur Klartext von Segmenten, deren
+		Chiffrat bereits gesichert ist. Nach je LiSKonstanten.C_AM_ORT_PUFFERSEGMENTE Segmenten wird die Datei auf den
+		Datenträger übertragen und der Fortschritt im Journal (inkl. Header) vermerkt, so dass nach einem Absturz jedes
+		Segment entweder als Klartext oder als gesichertes Chiffrat vorliegt. Header und Metadatensegment überschreiben
+		zuletzt den Anfang der Datei.
+
+		Wird vor dem ersten gesicherten Segment abgebrochen, wird die Datei auf ihre Originalgröße zurückgesetzt und ist
+		unverändert. Danach kann die Verschlüsselung nur noch (mit demselben Schlüssel) fortgesetzt werden.
+
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zu Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		"""
+		lQuelldateiEndnameString = os.path.basename(self.sErweiterterPfadZuQuelldateiString)
+		lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
+		lJournal = LiSJournal.Segmentjournal(LiSKonstanten.C_AM_ORT_JOURNAL_LITERAL, self.sErweiterterPfadZuQuelldateiString)
+
+		try:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Verschlüsselung mit AES-GCM 256 (segmentiert, am Ort)')
+
+			# Unterbrochene Verschlüsselung am Ort fortsetzen (das Journal enthält den Header):
+			lFortsetzungDictionary = self._ermittleFortsetzungDerVerschluesselungAmOrt(lJournal, pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString)
+			if lFortsetzungDictionary is not None:
+				lHeaderBytes = lFortsetzungDictionary['HeaderBytes']
+				lHeaderDictionary = lFortsetzungDictionary['HeaderDictionary']
+				lDateischluesselBytes = lFortsetzungDictionary['Dateischluessel']
+				lAbgeschlosseneSegmenteInteger = lFortsetzungDictionary['AbgeschlosseneSegmenteInteger']
+			else:
+				lJournal.entferne()
+				lQuelldateiStat = os.stat(self.sErweiterterPfadZuQuelldateiString, follow_symlinks=False)
+				lAESGCMV3SchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=pSHA512HashwertBytes)
+				lAESGCMV4NonceBytes = self.sFunktionsausfuehrer.gibNeueAESGCMNoncePerHKDF()
+				lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESGCMV3SchluesselDictionary['AESGCMV3Schluessel'], lAESGCMV4NonceBytes)
+				# Segmentgröße unabhängig von der Chunkgröße wählen, damit die Nullbytefolge beschränkt bleibt (siehe C_AM_ORT_MINDESTGROESSE):
+				lHeaderargumenteDictionary = {'pQuelldateiStat': lQuelldateiStat,
+											  'pScryptSaltBytes': lAESGCMV3SchluesselDictionary['InitialesScryptSalt'],
+											  'pAESNonceBytes': lAESGCMV4NonceBytes,
+											  'pSegmentgroesseInteger': Segmentwerkzeuge.gibSegmentgroesse(lQuelldateiStat.st_size),
+											  'pVerfahrenKennungInteger': LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT}
+
+				# Nullbytefolge so bemessen, dass Header und Metadatensegment C_AM_ORT_PUFFERSEGMENTE Datensegmente umfassen:
+				lHeaderDictionary = QDatei._liesHeaderAusBytes(self._erstelleHeaderFuerAESGCM_V4(**lHeaderargumenteDictionary))
+				lMetadatenFuellmengeInteger = max(0, LiSKonstanten.C_AM_ORT_PUFFERSEGMENTE * lHeaderDictionary['SegmentgroesseInteger']
+												  - Segmentwerkzeuge.gibSegmentposition(lHeaderDictionary, len(self._erstelleHeaderFuerAESGCM_V4(**lHeaderargumenteDictionary)), 1))
+				lHeaderBytes = self._erstelleHeaderFuerAESGCM_V4(pMetadatenFuellmengeInteger=lMetadatenFuellmengeInteger, **lHeaderargumenteDictionary)
+				lHeaderDictionary = QDatei._liesHeaderAusBytes(lHeaderBytes)
+				lAbgeschlosseneSegmenteInteger = 0
+
+			# Journal vor der ersten Änderung der Datei anlegen (bzw. übernehmen):
+			lJournal.beginne(pErweiterterPfadZuZieldateiString, lHeaderBytes, lAbgeschlosseneSegmenteInteger)
+
+			lOriginalgroesseInteger = lHeaderDictionary['DateiOriginalgroesse']
+			lSegmentgroesseInteger = lHeaderDictionary['SegmentgroesseInteger']
+			lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(lOriginalgroesseInteger, lSegmentgroesseInteger)
+			lAESGCMV4NonceBytes = lHeaderDictionary['AESGCMV4NonceBytes']
+
+			# Anzeige in Statusleiste anpassen:
+			self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Verschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+
+			with open(self.sErweiterterPfadZuQuelldateiString, 'rb+') as lDatei:
+				if lAbgeschlosseneSegmenteInteger == 0:
+					if os.fstat(lDatei.fileno()).st_size not in (lOriginalgroesseInteger, Segmentwerkzeuge.gibErwarteteDateigroesse(lHeaderDictionary, len(lHeaderBytes))):
+						raise ValueError('Quelldatei wurde während der Verschlüsselung verändert.')
+					self._verlaengereDatei(lDatei, Segmentwerkzeuge.gibErwarteteDateigroesse(lHeaderDictionary, len(lHeaderBytes)))
+
+				# Datensegmente vom Dateiende her verschlüsseln und nach je C_AM_ORT_PUFFERSEGMENTE Segmenten sichern (der Klartext
+				# wird in einen Puffer gelesen, der wiederverwendet und am Schluss überschrieben wird):
+				with LiSWerkzeuge.SichererPuffer(min(lSegmentgroesseInteger, lOriginalgroesseInteger)) as lKlartextSichererPuffer:
+					lSegmentIndexInteger = lAnzahlDatensegmenteInteger - lAbgeschlosseneSegmenteInteger
+					while lSegmentIndexInteger >= 1:
+						lGrenzeIndexInteger = max(0, lSegmentIndexInteger - LiSKonstanten.C_AM_ORT_PUFFERSEGMENTE)
+						for lIndexInteger in range(lSegmentIndexInteger, lGrenzeIndexInteger, -1):
+							if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is not True:
+								raise LiSAusnahmen.QProcessStoppedByUserError()
+							lDatei.seek((lIndexInteger - 1) * lSegmentgroesseInteger)
+							lKlartextMemoryview = Segmentwerkzeuge._liesInPuffer(lDatei, lKlartextSichererPuffer.sMemoryview,
+																				 Segmentwerkzeuge.gibKlartextlaengeVonDatensegment(lOriginalgroesseInteger, lSegmentgroesseInteger, lIndexInteger))
+							lSegmentBytes = Segmentwerkzeuge.verschluesseleSegment(lDateischluesselBytes, lAESGCMV4NonceBytes, lIndexInteger, lIndexInteger == lAnzahlDatensegmenteInteger, lHeaderBytes, lKlartextMemoryview)
+							lDatei.seek(Segmentwerkzeuge.gibSegmentposition(lHeaderDictionary, len(lHeaderBytes), lIndexInteger))
+							lDatei.write(lSegmentBytes)
+							self.sFunktionsausfuehrer.meldeFortschritt(len(lKlartextMemoryview))
+						lJournal.sichereSegmente(lDatei, lAnzahlDatensegmenteInteger - lGrenzeIndexInteger)
+						lSegmentIndexInteger = lGrenzeIndexInteger
+
+				# Header und Metadatensegment (inkl. Nullbytefolge) an den Dateianfang schreiben:
+				lDatei.seek(0)
+				lDatei.write(lHeaderBytes)
+				lDatei.write(Segmentwerkzeuge.verschluesseleSegment(lDateischluesselBytes, lAESGCMV4NonceBytes, 0, False, lHeaderBytes,
+																	Segmentwerkzeuge.erstelleMetadaten(lQuelldateiEndnameString, lHeaderDictionary['MetadatenFuellmengeInteger'])))
+				lDatei.flush()
+				with LiSZeitmessung.Zeitmessung.abschnitt('fsync'):
+					os.fsync(lDatei.fileno())
+			with LiSZeitmessung.Zeitmessung.abschnitt('Umbenennen'):
+				os.replace(self.sErweiterterPfadZuQuelldateiString, pErweiterterPfadZuZieldateiString)
+			lJournal.entferne()
+		except LiSAusnahmen.QProcessStoppedByUserError:
+			if self._setzeVerschluesselungAmOrtZurueck(lJournal) is True:
+				self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Verschlüsselung abgebrochen]', pToolTipString=lDateinameReduziertString)
+			else:
+				self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Verschlüsselung am Ort abgebrochen: Fortsetzung erforderlich]', pToolTipString=lDateinameReduziertString)
+			raise
+		except LiSAusnahmen.QFileListDisplayError:
+			raise
+		except Exception as lException:
+			if self._setzeVerschluesselungAmOrtZurueck(lJournal) is True:
+				raise LiSAusnahmen.QFileListDisplayError(lQuelldateiEndnameString + ': [Verschlüsselung fehlgeschlagen]', lDateinameReduziertString) from lException
+			raise LiSAusnahmen.QFileListDisplayError(lQuelldateiEndnameString + ': [Verschlüsselung am Ort fehlgeschlagen: Fortsetzung erforderlich]', lDateinameReduziertString) from lException
+		finally:
+			if 'lDateischluesselBytes' in locals():
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateischluesselBytes)
 
+	def _setzeVerschluesselungAmOrtZurueck(self, pJournal):
+		"""
+		Interne Methode. Setzt eine abgebrochene Verschlüsselung am Ort zurück, sofern noch kein Datensegment gesichert
+		wurde (die bis dahin geschriebenen Segmente liegen vollständig hinter dem Original), und returniert True, wenn die
+		Datei wieder dem Original entspricht. Andernfalls bleibt das Journal zur Fortsetzung erhalten.
+		"""
+		if pJournal.istAktiv() is False:
+			return True # Datei wurde noch nicht verändert
+		if pJournal.sAbgeschlosseneSegmenteInteger > 0:
+			return False
+		try:
+			lHeaderDictionary = QDatei._liesHeaderAusBytes(pJournal.sHeaderBytes)
+			os.truncate(self.sErweiterterPfadZuQuelldateiString, lHeaderDictionary['DateiOriginalgroesse'])
+		except (OSError, TypeError, ValueError, struct.error):
+			logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception beim Zurücksetzen einer Verschlüsselung am Ort')
+			return False
+		pJournal.entferne()
+		return True
+
+	@staticmethod
+	def _verlaengereDatei(pDateiFile, pGroesseInteger):
+		"""
+		Interne Methode. Verlängert pDateiFile auf pGroesseInteger Bytes. Der Speicherplatz wird nach Möglichkeit vorab
+		reserviert (posix_fallocate), so dass ein voller Datenträger vor der ersten Änderung erkannt wird.
+		"""
+		if hasattr(os, 'posix_fallocate'):
+			try:
+				os.posix_fallocate(pDateiFile.fileno(), 0, pGroesseInteger)
+				return
+			except OSError as lException:
+				if lException.errno not in (errno.EINVAL, errno.EOPNOTSUPP): # Dateisystem unterstützt keine Reservierung
+					raise
+		pDateiFile.truncate(pGroesseInteger)
 
 	def entschluesseln(self, pSHA256HashwertBytes, pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString):
 		"""
@@ -261,7 +388,7 @@ class QDatei:
 		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zu Zieldatei
 		:type pErweiterterPfadZuZieldateiString: String
 		"""
-		if self.sQControllerWorkerThread.istFunktionsprozessAktiv() is True:
+		if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is True:
 			lErweiterterPfadZuZieldateiString = self._entschluesseln(pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=pErweiterterPfadZuZieldateiString)
 			return lErweiterterPfadZuZieldateiString
 		else:
@@ -282,13 +409,20 @@ class QDatei:
 		:rtype String
 		"""
 
-		lZuVernichtendeBytesequenzenListe_LOESCHEN = [] # Sammlung von Bytesequenzen, die am Schluss überschrieben werden müssen
+		lGeheimnisregister = LiSWerkzeuge.Geheimnisregister() # Geheime Werte zu dieser Datei, die am Schluss überschrieben werden müssen
 
 		lErweiterterPfadZuZieldateiString = pErweiterterPfadZuZieldateiString
 		lQuelldateiEndnameString = os.path.basename(self.sErweiterterPfadZuQuelldateiString)
+		lJournal = LiSJournal.Segmentjournal(LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL, self.sErweiterterPfadZuQuelldateiString)
+		# Eine bereits existierende Zieldatei (Teilentschlüsselung laut Journal) wird erst nach erfolgreicher Prüfung übernommen
+		# und ansonsten bei Fehlern (z.B. falsches Passwort) nicht vernichtet:
+		lZieldateiVernichtenBoolean = not os.path.lexists(pErweiterterPfadZuZieldateiString)
+		# Chunkgröße für die Verfahren bis V3_1 (V4 liest segmentweise):
+		lBlockgroesseInteger = LiSBlockgroesse.Blockgroessenrichtlinie.gibBlockgroesse(self.sErweiterterPfadZuQuelldateiString)
 		
 		try:
 			with open(self.sErweiterterPfadZuQuelldateiString, 'rb') as lQuelldatei:
+				lQuelldatei = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lQuelldatei, 'Lesen', 'read', 'readinto')
 				if(lQuelldatei.read(4).decode() != 'LiSX'):
 					lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
 					lNurEndnameString = os.path.basename(lDateinameReduziertString)
@@ -299,27 +433,33 @@ class QDatei:
 					lHeaderDictionary = self._liesHeaderAusDatei(lQuelldatei)
 
 					if lHeaderDictionary is not None:
+						if lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4\
+								and lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT:
+							lZieldateiVernichtenBoolean = True # Keine Fortsetzung möglich, die Zieldatei wird neu geschrieben
+
 						if lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V1:
-							lAESSchluesselDictionary = self.sQControllerWorkerThread.ermittleAESGCM_V1Schluessel(
+							lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V1Schluessel(
 								pSHA256HashwertBytes=pSHA256HashwertBytes,
 								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
 								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
 								pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
 								pScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'])
 
-							lZuVernichtendeBytesequenzenListe_LOESCHEN.append(lAESSchluesselDictionary['AESGCMV1Schluessel'])
+							lGeheimnisregister.registriere(lAESSchluesselDictionary['AESGCMV1Schluessel'])
 
 							lAESDecryptor_Authentifizierung = Cipher(
 								algorithms.AES(key=lAESSchluesselDictionary['AESGCMV1Schluessel']),
 								modes.GCM(initialization_vector=lHeaderDictionary['AESGCMV1NonceBytes']),
 								backend=default_backend()).decryptor()
+							lAESDecryptor_Authentifizierung = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lAESDecryptor_Authentifizierung, 'AES-GCM', 'update', 'update_into')
 							lAESDecryptor_Entschluesselung = Cipher(
 								algorithms.AES(key=lAESSchluesselDictionary['AESGCMV1Schluessel']),
 								modes.GCM(initialization_vector=lHeaderDictionary['AESGCMV1NonceBytes']),
 								backend=default_backend()).decryptor()
+							lAESDecryptor_Entschluesselung = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lAESDecryptor_Entschluesselung, 'AES-GCM', 'update', 'update_into')
 
 							# Anzeige in Statusleiste anpassen:
-							self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+							self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
 
 							# Header authentifizieren:
 							lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
@@ -334,21 +474,11 @@ class QDatei:
 							LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateiOriginaldateiEndnameBytes_LOESCHEN)
 							del lDateiOriginaldateiEndnameBytes_LOESCHEN
 
-							# Quelldatei chunkweise authentifizieren:
-							lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-							while lVerbleibendeBytesInteger > 0:
-								if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-									if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-										lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-									else:
-										lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-									lBlockEntschluesseltBytes_LOESCHEN = lAESDecryptor_Authentifizierung.update(lBlockBytes)
-									# Zwecks Authentifizierung entschlüsselten Block sofort überschreiben und Referenz entfernen:
-									LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockEntschluesseltBytes_LOESCHEN)
-									del lBlockEntschluesseltBytes_LOESCHEN
-									lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-								else:
-									raise LiSAusnahmen.QProcessStoppedByUserError()
+							# Quelldatei chunkweise authentifizieren (der dabei entstehende Klartext wird in einen Puffer geschrieben, der
+							# wiederverwendet und am Schluss überschrieben wird):
+							lKlartextSichererPuffer = lGeheimnisregister.registriere(LiSWerkzeuge.SichererPuffer(lBlockgroesseInteger + LiSKonstanten.C_UPDATE_INTO_ZUSATZBYTES))
+							for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+								lAESDecryptor_Authentifizierung.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
 
 							# AUTH-Tag lesen und Header + Daten authentifizieren:
 							lMACTagLaengeInteger = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
@@ -365,6 +495,7 @@ class QDatei:
 							# OK, verschlüsselte Datei ist authentifiziert - weiter mit der Entschlüsselung:
 							#Headerdaten müssen in Entschlüsselung einbezogen werden:
 							with open(lErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+								lZieldatei = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lZieldatei, 'Schreiben', 'write')
 								lAESDecryptor_Entschluesselung.authenticate_additional_data(lHeaderBytes)
 
 								# Ursprünglichen Dateinamen entschlüsseln:
@@ -372,22 +503,13 @@ class QDatei:
 
 								# Quelldatei chunkweise entschlüsseln:
 								lQuelldatei.seek(lPositionNachHeaderInQuelldateiInteger + lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'])
-								lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-								while lVerbleibendeBytesInteger > 0:
-									if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-										if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-											lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-										else:
-											lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-										lZieldatei.write(lAESDecryptor_Entschluesselung.update(lBlockBytes))
-										lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-									else:
-										lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
-										lNurEndnameString = os.path.basename(lDateinameReduziertString)
-										raise LiSAusnahmen.QProcessStoppedByUserError()
+								for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+									lKlartextlaengeInteger = lAESDecryptor_Entschluesselung.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
+									lZieldatei.write(lKlartextSichererPuffer.sMemoryview[:lKlartextlaengeInteger])
+									self.sFunktionsausfuehrer.meldeFortschritt(len(lBlockMemoryview))
 
 						elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V2:
-							lAESSchluesselDictionary = self.sQControllerWorkerThread.ermittleAESGCM_V2Schluessel(
+							lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V2Schluessel(
 								pSHA256HashwertBytes=pSHA256HashwertBytes,
 								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
 								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
@@ -395,19 +517,21 @@ class QDatei:
 								pInitialesScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'],
 								pHKDFSaltBytes=lHeaderDictionary['HKDFSaltFuerAESGCMV2Bytes'])
 
-							lZuVernichtendeBytesequenzenListe_LOESCHEN.append(lAESSchluesselDictionary['AESGCMV2Schluessel'])
+							lGeheimnisregister.registriere(lAESSchluesselDictionary['AESGCMV2Schluessel'])
 
 							lAESDecryptor_Authentifizierung = Cipher(
 								algorithms.AES(key=lAESSchluesselDictionary['AESGCMV2Schluessel']),
 								modes.GCM(initialization_vector=lHeaderDictionary['AESGCMV2NonceBytes']),
 								backend=default_backend()).decryptor()
+							lAESDecryptor_Authentifizierung = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lAESDecryptor_Authentifizierung, 'AES-GCM', 'update', 'update_into')
 							lAESDecryptor_Entschluesselung = Cipher(
 								algorithms.AES(key=lAESSchluesselDictionary['AESGCMV2Schluessel']),
 								modes.GCM(initialization_vector=lHeaderDictionary['AESGCMV2NonceBytes']),
 								backend=default_backend()).decryptor()
+							lAESDecryptor_Entschluesselung = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lAESDecryptor_Entschluesselung, 'AES-GCM', 'update', 'update_into')
 
 							# Anzeige in Statusleiste anpassen:
-							self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+							self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
 
 							# Header authentifizieren:
 							lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
@@ -426,23 +550,11 @@ class QDatei:
 							lErforderlicheLiSCryptVersionVerschluesseltBytes = lQuelldatei.read(lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'])
 							lAESDecryptor_Authentifizierung.update(lErforderlicheLiSCryptVersionVerschluesseltBytes)
 
-							# Quelldatei chunkweise authentifizieren:
-							lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-							while lVerbleibendeBytesInteger > 0:
-								if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-									if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-										lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-									else:
-										lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-									lBlockEntschluesseltBytes_LOESCHEN = lAESDecryptor_Authentifizierung.update(lBlockBytes)
-									# Zwecks Authentifizierung entschlüsselten Block sofort überschreiben und Referenz entfernen:
-									LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockEntschluesseltBytes_LOESCHEN)
-									del lBlockEntschluesseltBytes_LOESCHEN
-									lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-								else:
-									lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
-									lNurEndnameString = os.path.basename(lDateinameReduziertString)
-									raise LiSAusnahmen.QProcessStoppedByUserError()
+							# Quelldatei chunkweise authentifizieren (der dabei entstehende Klartext wird in einen Puffer geschrieben, der
+							# wiederverwendet und am Schluss überschrieben wird):
+							lKlartextSichererPuffer = lGeheimnisregister.registriere(LiSWerkzeuge.SichererPuffer(lBlockgroesseInteger + LiSKonstanten.C_UPDATE_INTO_ZUSATZBYTES))
+							for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+								lAESDecryptor_Authentifizierung.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
 
 							# AUTH-Tag lesen und Header + Daten authentifizieren:
 							lMACTagLaengeInteger = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
@@ -459,6 +571,7 @@ class QDatei:
 							# OK, verschlüsselte Datei ist authentifiziert - weiter mit der Entschlüsselung:
 							#Headerdaten müssen in Entschlüsselung einbezogen werden:
 							with open(lErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+								lZieldatei = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lZieldatei, 'Schreiben', 'write')
 								lAESDecryptor_Entschluesselung.authenticate_additional_data(lHeaderBytes)
 
 								# Ursprünglichen Dateinamen entschlüsseln:
@@ -473,20 +586,13 @@ class QDatei:
 
 								# Quelldatei chunkweise entschlüsseln:
 								lQuelldatei.seek(lPositionNachHeaderInQuelldateiInteger + lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'] + lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'])
-								lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-								while lVerbleibendeBytesInteger > 0:
-									if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-										if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-											lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-										else:
-											lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-										lZieldatei.write(lAESDecryptor_Entschluesselung.update(lBlockBytes))
-										lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-									else:
-										raise LiSAusnahmen.QProcessStoppedByUserError()
+								for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+									lKlartextlaengeInteger = lAESDecryptor_Entschluesselung.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
+									lZieldatei.write(lKlartextSichererPuffer.sMemoryview[:lKlartextlaengeInteger])
+									self.sFunktionsausfuehrer.meldeFortschritt(len(lBlockMemoryview))
 
 						elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V3:
-							lAESSchluesselDictionary = self.sQControllerWorkerThread.ermittleAESGCM_V3Schluessel(
+							lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(
 								pSHA512HashwertBytes=pSHA512HashwertBytes,
 								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
 								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
@@ -499,13 +605,15 @@ class QDatei:
 								algorithms.AES(key=lAESSchluesselDictionary['AESGCMV3Schluessel']),
 								modes.GCM(initialization_vector=lHeaderDictionary['AESGCMV3NonceBytes']),
 								backend=default_backend()).decryptor()
+							lAESDecryptor_Authentifizierung = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lAESDecryptor_Authentifizierung, 'AES-GCM', 'update', 'update_into')
 							lAESDecryptor_Entschluesselung = Cipher(
 								algorithms.AES(key=lAESSchluesselDictionary['AESGCMV3Schluessel']),
 								modes.GCM(initialization_vector=lHeaderDictionary['AESGCMV3NonceBytes']),
 								backend=default_backend()).decryptor()
+							lAESDecryptor_Entschluesselung = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lAESDecryptor_Entschluesselung, 'AES-GCM', 'update', 'update_into')
 
 							# Anzeige in Statusleiste anpassen:
-							self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+							self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
 
 							# Header authentifizieren:
 							lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
@@ -530,21 +638,11 @@ class QDatei:
 							lErforderlicheLiSCryptVersionVerschluesseltBytes = lQuelldatei.read(lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'])
 							lAESDecryptor_Authentifizierung.update(lErforderlicheLiSCryptVersionVerschluesseltBytes)
 
-							# Quelldatei chunkweise authentifizieren:
-							lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-							while lVerbleibendeBytesInteger > 0:
-								if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-									if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-										lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-									else:
-										lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-									lBlockEntschluesseltBytes_LOESCHEN = lAESDecryptor_Authentifizierung.update(lBlockBytes)
-									# lBlockEntschluesseltBytes_LOESCHEN sofort überschreiben und Referenz entfernen:
-									LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockEntschluesseltBytes_LOESCHEN)
-									del lBlockEntschluesseltBytes_LOESCHEN
-									lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-								else:
-									raise LiSAusnahmen.QProcessStoppedByUserError()
+							# Quelldatei chunkweise authentifizieren (der dabei entstehende Klartext wird in einen Puffer geschrieben, der
+							# wiederverwendet und am Schluss überschrieben wird):
+							lKlartextSichererPuffer = lGeheimnisregister.registriere(LiSWerkzeuge.SichererPuffer(lBlockgroesseInteger + LiSKonstanten.C_UPDATE_INTO_ZUSATZBYTES))
+							for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+								lAESDecryptor_Authentifizierung.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
 
 							# AUTH-Tag lesen und Header + Daten authentifizieren:
 							lMACTagLaengeInteger = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
@@ -561,6 +659,7 @@ class QDatei:
 							# OK, verschlüsselte Datei ist authentifiziert - weiter mit der Entschlüsselung:
 							#Headerdaten müssen in Entschlüsselung einbezogen werden:
 							with open(lErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+								lZieldatei = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lZieldatei, 'Schreiben', 'write')
 								lAESDecryptor_Entschluesselung.authenticate_additional_data(lHeaderBytes)
 
 								# Nullbytefolge durch Decryptor schicken, da dieser stateful ist:
@@ -578,49 +677,116 @@ class QDatei:
 
 								# Quelldatei chunkweise entschlüsseln:
 								lQuelldatei.seek(lPositionNachHeaderInQuelldateiInteger + len(lNullbytefolgeVerschluesseltBytes) + lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'] + lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'])
-								lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-								while lVerbleibendeBytesInteger > 0:
-									if self.sQControllerWorkerThread.istFunktionsprozessAktiv:
-										if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-											lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-										else:
-											lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-										lZieldatei.write(lAESDecryptor_Entschluesselung.update(lBlockBytes))
-										lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-									else:
-										raise LiSAusnahmen.QProcessStoppedByUserError()
+								for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+									lKlartextlaengeInteger = lAESDecryptor_Entschluesselung.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
+									lZieldatei.write(lKlartextSichererPuffer.sMemoryview[:lKlartextlaengeInteger])
+									self.sFunktionsausfuehrer.meldeFortschritt(len(lBlockMemoryview))
+
+
+						elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4\
+								or lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM\
+								or lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT:
+							lDatenstromBoolean = lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM
+							lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(
+								pSHA512HashwertBytes=pSHA512HashwertBytes,
+								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
+								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
+								pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
+								pInitialesScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'],)
+
+							# lAESSchluesselDictionary['AESGCMV3Schluessel'] darf nach Verwendung NICHT direkt überschrieben werden (Wiederverwendung mit neuer Nonce, global in LiSCrypt.py!)
+
+							lDateischluesselBytes = lGeheimnisregister.registriere(Segmentwerkzeuge.leiteDateischluesselAb(lAESSchluesselDictionary['AESGCMV3Schluessel'],
+																														   lHeaderDictionary['AESGCMV4NonceBytes']))
 
+							# Anzeige in Statusleiste anpassen:
+							self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+
+							# Header einlesen (wird in jedem Segment als AAD authentifiziert):
+							lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
+							lQuelldatei.seek(0)
+							lHeaderBytes = lQuelldatei.read(lPositionNachHeaderInQuelldateiInteger)
+
+							# Dateilänge vorab prüfen (Kürzungen werden zusätzlich über die Markierung des letzten Segments erkannt,
+							# bei Datenströmen ausschließlich über das Trailersegment):
+							if lDatenstromBoolean is False and os.fstat(lQuelldatei.fileno()).st_size != Segmentwerkzeuge.gibErwarteteDateigroesse(lHeaderDictionary, len(lHeaderBytes)):
+								raise ValueError('Dateigröße passt nicht zum Header.')
+
+							# Metadatensegment entschlüsseln und authentifizieren:
+							lMetadatenBytes_LOESCHEN = Segmentwerkzeuge.entschluesseleSegment(lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], 0, False, lHeaderBytes,
+																							 lQuelldatei.read(Segmentwerkzeuge.gibMetadatensegmentLaenge(lHeaderDictionary)))
+							lGeheimnisregister.registriere(lMetadatenBytes_LOESCHEN)
+							lDateiOriginaldateiEndnameBytes, lErforderlicheLiSCryptVersionString = Segmentwerkzeuge.zerlegeMetadaten(lHeaderDictionary, lMetadatenBytes_LOESCHEN)
+							if LiSWerkzeuge.Stringwerkzeuge.vergleicheVersionen(LiSKonstanten.__version__, lErforderlicheLiSCryptVersionString) < 0:
+								lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
+								lNurEndnameString = os.path.basename(lDateinameReduziertString)
+								raise LiSAusnahmen.QLiSCryptTooOldError(lNurEndnameString + ': [LiSCrypt-Update erforderlich]', lDateinameReduziertString)
+
+							if lDatenstromBoolean is True:
+								# Datenstrom sequentiell entschlüsseln (ohne Journal, da die Segmentanzahl erst am Ende feststeht):
+								lZieldateiVernichtenBoolean = True
+								with open(lErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+									Segmentwerkzeuge.entschluesseleDatenstrom(lQuelldatei, lZieldatei, lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], lHeaderBytes,
+																			  lHeaderDictionary['SegmentgroesseInteger'], self.sFunktionsausfuehrer.istFunktionsprozessAktiv)
+							else:
+								# Unterbrochene Entschlüsselung fortsetzen, sofern Journal und Teilentschlüsselung passen:
+								lAbgeschlosseneSegmenteInteger = self._ermittleFortsetzungDerEntschluesselung(lJournal, lQuelldatei, lHeaderDictionary, lHeaderBytes, lDateischluesselBytes, lErweiterterPfadZuZieldateiString)
+								lZieldateiVernichtenBoolean = True
+
+								# Datensegmente einzeln authentifizieren und entschlüsseln. Ein zweiter Durchlauf ist nicht erforderlich,
+								# da ausschließlich bereits authentifizierte Segmente geschrieben werden (bei Fehlern wird die Zieldatei vernichtet):
+								with open(lErweiterterPfadZuZieldateiString, 'rb+' if lAbgeschlosseneSegmenteInteger > 0 else 'wb') as lZieldatei:
+									if lAbgeschlosseneSegmenteInteger > 0:
+										lZieldatei.truncate(lAbgeschlosseneSegmenteInteger * lHeaderDictionary['SegmentgroesseInteger'])
+										lZieldatei.seek(lAbgeschlosseneSegmenteInteger * lHeaderDictionary['SegmentgroesseInteger'])
+									lQuelldatei.seek(Segmentwerkzeuge.gibSegmentposition(lHeaderDictionary, len(lHeaderBytes), lAbgeschlosseneSegmenteInteger + 1))
+
+									# Fortschritt großer Dateien im Journal sichern (ermöglicht Fortsetzung nach Abbruch oder Absturz):
+									lNachSchreibenFunktion = None
+									if Segmentwerkzeuge.gibAnzahlDatensegmente(lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger']) > LiSKonstanten.C_JOURNAL_INTERVALL_SEGMENTE:
+										lJournal.beginne(lErweiterterPfadZuZieldateiString, lHeaderBytes, lAbgeschlosseneSegmenteInteger)
+										lNachSchreibenFunktion = lambda pSegmentIndexInteger: lJournal.vermerkeSegment(lZieldatei, pSegmentIndexInteger)
+
+									Segmentwerkzeuge.entschluesseleDatensegmente(lQuelldatei, lZieldatei, lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], lHeaderBytes,
+																				 lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger'],
+																				 self.sFunktionsausfuehrer.istFunktionsprozessAktiv,
+																				 pErsterSegmentIndexInteger=lAbgeschlosseneSegmenteInteger + 1, pNachSchreibenFunktion=lNachSchreibenFunktion,
+																				 pFortschrittFunktion=self.sFunktionsausfuehrer.meldeFortschritt)
+									if lQuelldatei.read(1) != b'':
+										raise ValueError('Daten nach dem letzten Segment.')
 
 						elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V1:
-							lChaCha20SchluesselDictionary = self.sQControllerWorkerThread.ermittleChaCha20_V1Schluessel(
+							lChaCha20SchluesselDictionary = self.sFunktionsausfuehrer.ermittleChaCha20_V1Schluessel(
 								pSHA256HashwertBytes=pSHA256HashwertBytes,
 								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
 								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
 								pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
 								pScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'])
 
-							lZuVernichtendeBytesequenzenListe_LOESCHEN.append(lChaCha20SchluesselDictionary['ChaCha20V1Schluessel'])
+							lGeheimnisregister.registriere(lChaCha20SchluesselDictionary['ChaCha20V1Schluessel'])
 
 							lChaCha20Decryptor = Cipher(algorithms.ChaCha20(key=lChaCha20SchluesselDictionary['ChaCha20V1Schluessel'], nonce=lHeaderDictionary['ChaCha20V1NonceBytes']),
 												mode=None,
 												backend=default_backend()).decryptor()
+							lChaCha20Decryptor = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lChaCha20Decryptor, 'ChaCha20', 'update', 'update_into')
 
-							lHMACSchluesselDictionary = self.sQControllerWorkerThread.ermittleHMACSchluesselFuerChaCha20_V1(
+							lHMACSchluesselDictionary = self.sFunktionsausfuehrer.ermittleHMACSchluesselFuerChaCha20_V1(
 								pSHA256HashwertBytes=pSHA256HashwertBytes,
 								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
 								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
 								pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
 								pScryptSaltBytes=lHeaderDictionary['ScryptSaltHMACFuerChaCha20V1Bytes'])
 
-							lZuVernichtendeBytesequenzenListe_LOESCHEN.append(lHMACSchluesselDictionary['HMACSchluessel'])
+							lGeheimnisregister.registriere(lHMACSchluesselDictionary['HMACSchluessel'])
 
 							lHMACSchluesselBytes = lHMACSchluesselDictionary['HMACSchluessel']
 							lHMACBuilder = hmac.HMAC(key=lHMACSchluesselBytes,
 													 algorithm=hashes.SHA256(),
 													 backend=default_backend())
+							lHMACBuilder = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lHMACBuilder, 'HMAC', 'update')
 
 							# Anzeige in Statusleiste anpassen:
-							self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+							self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
 
 							# Header authentifizieren:
 							lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
@@ -635,20 +801,8 @@ class QDatei:
 							del lDateiOriginaldateiEndnameBytes_LOESCHEN
 
 							# Quelldatei chunkweise authentifizieren:
-							lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-							while lVerbleibendeBytesInteger > 0:
-								if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-									if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-										lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-									else:
-										lBlockEntschluesseltBytes_LOESCHEN = lQuelldatei.read(lVerbleibendeBytesInteger)
-									lHMACBuilder.update(lBlockBytes)
-									# lBlockEntschluesseltBytes_LOESCHEN sofort überschreiben und Referenz entfernen:
-									LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockEntschluesseltBytes_LOESCHEN)
-									del lBlockEntschluesseltBytes_LOESCHEN
-									lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-								else:
-									raise LiSAusnahmen.QProcessStoppedByUserError()
+							for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+								lHMACBuilder.update(lBlockMemoryview)
 
 							# AUTH-Tag (HMAC) lesen und Header + Daten authentifizieren:
 							lHMACTagLaengeInteger = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
@@ -665,25 +819,20 @@ class QDatei:
 							# OK, verschlüsselte Datei ist authentifiziert - weiter mit der Entschlüsselung:
 							# Ursprünglichen Dateinamen entschlüsseln:
 							with open(lErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+								lZieldatei = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lZieldatei, 'Schreiben', 'write')
 								# Ursprünglichen Dateinamen entschlüsseln:
 								lDateiOriginaldateiEndnameBytes = lChaCha20Decryptor.update(lDateiOriginaldateiEndnameVerschluesseltBytes)
 
 								# Quelldatei chunkweise entschlüsseln:
 								lQuelldatei.seek(lPositionNachHeaderInQuelldateiInteger + lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'])
-								lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-								while lVerbleibendeBytesInteger > 0:
-									if self.sQControllerWorkerThread.istFunktionsprozessAktiv:
-										if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-											lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-										else:
-											lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-										lZieldatei.write(lChaCha20Decryptor.update(lBlockBytes))
-										lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-									else:
-										raise LiSAusnahmen.QProcessStoppedByUserError()
+								lKlartextSichererPuffer = lGeheimnisregister.registriere(LiSWerkzeuge.SichererPuffer(lBlockgroesseInteger + LiSKonstanten.C_UPDATE_INTO_ZUSATZBYTES))
+								for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+									lKlartextlaengeInteger = lChaCha20Decryptor.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
+									lZieldatei.write(lKlartextSichererPuffer.sMemoryview[:lKlartextlaengeInteger])
+									self.sFunktionsausfuehrer.meldeFortschritt(len(lBlockMemoryview))
 
 						elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V2:
-							lChaCha20SchluesselDictionary = self.sQControllerWorkerThread.ermittleChaCha20_V2Schluessel(
+							lChaCha20SchluesselDictionary = self.sFunktionsausfuehrer.ermittleChaCha20_V2Schluessel(
 								pSHA256HashwertBytes=pSHA256HashwertBytes,
 								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
 								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
@@ -692,27 +841,29 @@ class QDatei:
 								pBase91Boolean=True,
 								pHKDFSaltBytes=lHeaderDictionary['HKDFSaltFuerChaCha20V2Bytes'])
 
-							lZuVernichtendeBytesequenzenListe_LOESCHEN.append(lChaCha20SchluesselDictionary['ChaCha20V2Schluessel'])
+							lGeheimnisregister.registriere(lChaCha20SchluesselDictionary['ChaCha20V2Schluessel'])
 
 							lChaCha20Decryptor = Cipher(
 								algorithms.ChaCha20(key=lChaCha20SchluesselDictionary['ChaCha20V2Schluessel'],
 								nonce=lHeaderDictionary['ChaCha20V2NonceBytes']),
 								mode=None,
 								backend=default_backend()).decryptor()
+							lChaCha20Decryptor = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lChaCha20Decryptor, 'ChaCha20', 'update', 'update_into')
 
 
-							lHMACSchluesselDictionary = self.sQControllerWorkerThread.ermittleHMACSchluesselFuerChaCha20_V2(
+							lHMACSchluesselDictionary = self.sFunktionsausfuehrer.ermittleHMACSchluesselFuerChaCha20_V2(
 								pHKDFSaltBytes=lHeaderDictionary['HKDFSaltFuerChaCha20V2Bytes']) # HMAC-Schlüssel unterscheidet sich von ChaCha20V2-Schlüssel nur durch anderen Kontext (info)
 
-							lZuVernichtendeBytesequenzenListe_LOESCHEN.append(lHMACSchluesselDictionary['HMACSchluessel'])
+							lGeheimnisregister.registriere(lHMACSchluesselDictionary['HMACSchluessel'])
 
 							lHMACSchluesselBytes = lHMACSchluesselDictionary['HMACSchluessel']
 							lHMACBuilder = hmac.HMAC(key=lHMACSchluesselBytes,
 													 algorithm=hashes.SHA256(),
 													 backend=default_backend())
+							lHMACBuilder = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lHMACBuilder, 'HMAC', 'update')
 
 							# Anzeige in Statusleiste anpassen:
-							self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+							self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
 
 							# Header authentifizieren:
 							lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
@@ -731,20 +882,8 @@ class QDatei:
 							lHMACBuilder.update(lErforderlicheLiSCryptVersionVerschluesseltBytes)
 
 							# Quelldatei chunkweise authentifizieren:
-							lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-							while lVerbleibendeBytesInteger > 0:
-								if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-									if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-										lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-									else:
-										lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-									lBlockEntschluesseltBytes_LOESCHEN = lHMACBuilder.update(lBlockBytes)
-									# lBlockEntschluesseltBytes_LOESCHEN sofort überschreiben und Referenz entfernen:
-									LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockEntschluesseltBytes_LOESCHEN)
-									del lBlockEntschluesseltBytes_LOESCHEN
-									lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-								else:
-									raise LiSAusnahmen.QProcessStoppedByUserError()
+							for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+								lHMACBuilder.update(lBlockMemoryview)
 
 							# AUTH-Tag (HMAC) lesen und Header + Daten authentifizieren:
 							lHMACTagLaengeInteger = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
@@ -761,6 +900,7 @@ class QDatei:
 							# OK, verschlüsselte Datei ist authentifiziert - weiter mit der Entschlüsselung:
 							# Ursprünglichen Dateinamen entschlüsseln:
 							with open(lErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+								lZieldatei = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lZieldatei, 'Schreiben', 'write')
 								# Ursprünglichen Dateinamen entschlüsseln:
 								lDateiOriginaldateiEndnameBytes = lChaCha20Decryptor.update(lDateiOriginaldateiEndnameVerschluesseltBytes)
 
@@ -773,21 +913,15 @@ class QDatei:
 
 								# Quelldatei chunkweise entschlüsseln:
 								lQuelldatei.seek(lPositionNachHeaderInQuelldateiInteger + lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'] + lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'])
-								lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-								while lVerbleibendeBytesInteger > 0:
-									if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-										if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-											lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-										else:
-											lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-										lZieldatei.write(lChaCha20Decryptor.update(lBlockBytes))
-										lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-									else:
-										raise LiSAusnahmen.QProcessStoppedByUserError()
+								lKlartextSichererPuffer = lGeheimnisregister.registriere(LiSWerkzeuge.SichererPuffer(lBlockgroesseInteger + LiSKonstanten.C_UPDATE_INTO_ZUSATZBYTES))
+								for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+									lKlartextlaengeInteger = lChaCha20Decryptor.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
+									lZieldatei.write(lKlartextSichererPuffer.sMemoryview[:lKlartextlaengeInteger])
+									self.sFunktionsausfuehrer.meldeFortschritt(len(lBlockMemoryview))
 
 						elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3 \
 								or lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3_1:
-							lChaCha20SchluesselDictionary = self.sQControllerWorkerThread.ermittleChaCha20_V3Schluessel(
+							lChaCha20SchluesselDictionary = self.sFunktionsausfuehrer.ermittleChaCha20_V3Schluessel(
 								pSHA512HashwertBytes=pSHA512HashwertBytes,
 								pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
 								pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
@@ -802,11 +936,12 @@ class QDatei:
 													nonce=lHeaderDictionary['ChaCha20V3NonceBytes']),
 													mode=None,
 													backend=default_backend()).decryptor()
+							lChaCha20Decryptor = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lChaCha20Decryptor, 'ChaCha20', 'update', 'update_into')
 
 							if lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3:
-								lHMACSchluesselDictionary = self.sQControllerWorkerThread.ermittleHMACSchluesselFuerChaCha20_V3()
+								lHMACSchluesselDictionary = self.sFunktionsausfuehrer.ermittleHMACSchluesselFuerChaCha20_V3()
 							else:
-								lHMACSchluesselDictionary = self.sQControllerWorkerThread.ermittleHMACSchluesselFuerChaCha20_V3_1()
+								lHMACSchluesselDictionary = self.sFunktionsausfuehrer.ermittleHMACSchluesselFuerChaCha20_V3_1()
 
 							# lHMACSchluesselDictionary['HMACSchluessel'] darf bei LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3
 							# und LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3_1 NICHT direkt überschrieben werden (Wiederverwendung mit neuer Nonce, global in LiSCrypt.py)
@@ -815,9 +950,10 @@ class QDatei:
 							lHMACBuilder = hmac.HMAC(key=lHMACSchluesselBytes,
 													 algorithm=hashes.SHA512(),
 													 backend=default_backend())
+							lHMACBuilder = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lHMACBuilder, 'HMAC', 'update')
 
 							# Anzeige in Statusleiste anpassen:
-							self.sQControllerWorkerThread.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
+							self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lQuelldateiEndnameString, pAbbrechenButtonAktivBoolean=True)
 
 							# Header authentifizieren:
 							lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
@@ -841,20 +977,8 @@ class QDatei:
 							lHMACBuilder.update(lErforderlicheLiSCryptVersionVerschluesseltBytes)
 
 							# Quelldatei chunkweise authentifizieren:
-							lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-							while lVerbleibendeBytesInteger > 0:
-								if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-									if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-										lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-									else:
-										lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-									lBlockEntschluesseltBytes_LOESCHEN = lHMACBuilder.update(lBlockBytes)
-									# lBlockEntschluesseltBytes_LOESCHEN sofort überschreiben und Referenz entfernen:
-									LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockEntschluesseltBytes_LOESCHEN)
-									del lBlockEntschluesseltBytes_LOESCHEN
-									lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-								else:
-									raise LiSAusnahmen.QProcessStoppedByUserError()
+							for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+								lHMACBuilder.update(lBlockMemoryview)
 
 							# AUTH-Tag (HMAC) lesen und Header + Daten authentifizieren:
 							lHMACTagLaengeInteger = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
@@ -873,6 +997,7 @@ class QDatei:
 							# OK, verschlüsselte Datei ist authentifiziert - weiter mit der Entschlüsselung:
 							# Ursprünglichen Dateinamen entschlüsseln:
 							with open(lErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+								lZieldatei = LiSZeitmessung.Zeitmessung.umschliesseMethoden(lZieldatei, 'Schreiben', 'write')
 								# Nullbytefolge entschlüsseln:
 								lNullbytefolgeBytes = lChaCha20Decryptor.update(
 									lNullbytefolgeVerschluesseltBytes)
@@ -893,18 +1018,11 @@ class QDatei:
 
 								# Quelldatei chunkweise entschlüsseln:
 								lQuelldatei.seek(lPositionNachHeaderInQuelldateiInteger + len(lNullbytefolgeVerschluesseltBytes) + lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'] + lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'])
-								lVerbleibendeBytesInteger = lHeaderDictionary['DateiOriginalgroesse']
-								while lVerbleibendeBytesInteger > 0:
-									if self.sQControllerWorkerThread.istFunktionsprozessAktiv():
-										if lVerbleibendeBytesInteger >= LiSKonstanten.C_DATEI_BLOCKGROESSE:
-											lBlockBytes = lQuelldatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-										else:
-											lBlockBytes = lQuelldatei.read(lVerbleibendeBytesInteger)
-										lZieldatei.write(lChaCha20Decryptor.update(lBlockBytes))
-										lVerbleibendeBytesInteger -= LiSKonstanten.C_DATEI_BLOCKGROESSE
-									else:
-										lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
-										raise LiSAusnahmen.QProcessStoppedByUserError('Abbruch durch Nutzer: ' + lDateinameReduziertString)
+								lKlartextSichererPuffer = lGeheimnisregister.registriere(LiSWerkzeuge.SichererPuffer(lBlockgroesseInteger + LiSKonstanten.C_UPDATE_INTO_ZUSATZBYTES))
+								for lBlockMemoryview in self._liesBloecke(lQuelldatei, lHeaderDictionary['DateiOriginalgroesse'], lBlockgroesseInteger):
+									lKlartextlaengeInteger = lChaCha20Decryptor.update_into(lBlockMemoryview, lKlartextSichererPuffer.sMemoryview)
+									lZieldatei.write(lKlartextSichererPuffer.sMemoryview[:lKlartextlaengeInteger])
+									self.sFunktionsausfuehrer.meldeFortschritt(len(lBlockMemoryview))
 
 						else:
 							# Wenn das Verfahren nicht erkannt wurde (Fehlermeldung: Entschlüsselung fehlgeschlagen):
@@ -915,13 +1033,15 @@ class QDatei:
 
 			lQuelldatei.close()
 			lZieldatei.close()
+			lJournal.entferne()
 
 			lZieldateinameVorEndnameString = os.path.split(lErweiterterPfadZuZieldateiString)[0]
 			lOriginaldateinameString = os.path.join(lZieldateinameVorEndnameString,lDateiOriginaldateiEndnameBytes.decode())
 
 			if not os.path.lexists(lOriginaldateinameString):
 				try:
-					os.rename(lErweiterterPfadZuZieldateiString, lOriginaldateinameString)
+					with LiSZeitmessung.Zeitmessung.abschnitt('Umbenennen'):
+						os.rename(lErweiterterPfadZuZieldateiString, lOriginaldateinameString)
 					lErweiterterPfadZuZieldateiString = lOriginaldateinameString
 				except OSError:
 					raise
@@ -930,14 +1050,15 @@ class QDatei:
 				except OSError:
 					pass
 			else:
-				lUeberschreibenInteger = self.sQControllerWorkerThread._zeigeUeberschreibenDialog(lOriginaldateinameString)
-				if lUeberschreibenInteger == QtWidgets.QMessageBox.Yes:
+				lUeberschreibenInteger = self.sFunktionsausfuehrer.erfrageUeberschreiben(lOriginaldateinameString)
+				if lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_JA:
 					try:
-						self.sQControllerWorkerThread.vernichte(lOriginaldateinameString, pAusgabeEintragsnameBoolean=True)
+						self.sFunktionsausfuehrer.vernichte(lOriginaldateinameString, pAusgabeEintragsnameBoolean=True)
 					except (LiSAusnahmen.QFileListDisplayError, LiSAusnahmen.QProcessStoppedByUserError):
 						raise
 					try:
-						os.rename(lErweiterterPfadZuZieldateiString, lOriginaldateinameString)
+						with LiSZeitmessung.Zeitmessung.abschnitt('Umbenennen'):
+							os.rename(lErweiterterPfadZuZieldateiString, lOriginaldateinameString)
 						lErweiterterPfadZuZieldateiString = lOriginaldateinameString
 					except OSError as lException:
 						raise
@@ -945,37 +1066,49 @@ class QDatei:
 						os.utime(lOriginaldateinameString, ns=(lHeaderDictionary['DateiOriginalZugriffsdatumInteger'], lHeaderDictionary['DateiOriginalAenderungsdatumInteger']))
 					except OSError:
 						pass
-				elif lUeberschreibenInteger == QtWidgets.QMessageBox.No:
+				elif lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_NEIN:
 					lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
 					lNurEndnameString = os.path.basename(lDateinameReduziertString)
 					raise LiSAusnahmen.QFileSkippedByUserError(lNurEndnameString + ': [Übersprungen: Nutzer-Auswahl]', lDateinameReduziertString)
 				else: #d.h. lUeberschreibenBoolean=None
-					self.sQControllerWorkerThread.stoppeFunktionsprozess()
+					self.sFunktionsausfuehrer.stoppeFunktionsprozess()
 					raise LiSAusnahmen.QProcessStoppedByUserError()
 
 		except LiSAusnahmen.QProcessStoppedByUserError:
 			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
-			self.sQControllerWorkerThread.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Entschlüsselung abgebrochen]',	pToolTipString=lDateinameReduziertString)
-			if os.path.isfile(lErweiterterPfadZuZieldateiString) and not os.path.islink(lErweiterterPfadZuZieldateiString):
-				try:
-					self.sQControllerWorkerThread.vernichte(lErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=False, pIgnoriereFunktionsprozessAktivBoolean=True)
-				except:
-					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Abbruch von Entschlüsselung')
+			try:
+				lFortsetzbarBoolean = lJournal.sichere()
+			except OSError:
+				logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Sicherung des Journals nach Abbruch von Entschlüsselung')
+				lFortsetzbarBoolean = False
+			if lFortsetzbarBoolean is True:
+				self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Entschlüsselung abgebrochen: Fortsetzung möglich]', pToolTipString=lDateinameReduziertString)
+			else:
+				self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lQuelldateiEndnameString + ': [Entschlüsselung abgebrochen]',	pToolTipString=lDateinameReduziertString)
+				if lZieldateiVernichtenBoolean is True:
+					lJournal.entferne()
+					if os.path.isfile(lErweiterterPfadZuZieldateiString) and not os.path.islink(lErweiterterPfadZuZieldateiString):
+						try:
+							self.sFunktionsausfuehrer.vernichte(lErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=False, pIgnoriereFunktionsprozessAktivBoolean=True)
+						except:
+							logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Abbruch von Entschlüsselung')
 			raise
 		except LiSAusnahmen.QFileSkippedByUserError:
 			# Exception-Nachricht wurde schon erstellt
 			if os.path.isfile(lErweiterterPfadZuZieldateiString) and not os.path.islink(lErweiterterPfadZuZieldateiString):
 				try:
-					self.sQControllerWorkerThread.vernichte(lErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=False, pIgnoriereFunktionsprozessAktivBoolean=True)
+					self.sFunktionsausfuehrer.vernichte(lErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=False, pIgnoriereFunktionsprozessAktivBoolean=True)
 				except:
 					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Auswahl \'Nein\' bei Namenskonflikt')
 			raise
 		except Exception as lException:
-			if os.path.isfile(lErweiterterPfadZuZieldateiString) and not os.path.islink(lErweiterterPfadZuZieldateiString):
-				try:
-					self.sQControllerWorkerThread.vernichte(lErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=True)
-				except:
-					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Exception bei Verschlüsselung')
+			if lZieldateiVernichtenBoolean is True:
+				lJournal.entferne()
+				if os.path.isfile(lErweiterterPfadZuZieldateiString) and not os.path.islink(lErweiterterPfadZuZieldateiString):
+					try:
+						self.sFunktionsausfuehrer.vernichte(lErweiterterPfadZuZieldateiString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=True)
+					except:
+						logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung nach Exception bei Verschlüsselung')
 			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
 			raise LiSAusnahmen.QFileListDisplayError(lQuelldateiEndnameString + ': [Entschlüsselung fehlgeschlagen]', lDateinameReduziertString) from lException
 		else:
@@ -988,100 +1121,355 @@ class QDatei:
 				except:
 					# Falls Überschreiben eines Objekts im Speicher fehlschlägt, nichts machen
 					pass
-			if 'lBlockEntschluesseltBytes_LOESCHEN' in locals():
-				try:
-					LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateiOriginaldateiEndnameBytes_LOESCHEN)
-					del lDateiOriginaldateiEndnameBytes_LOESCHEN
-				except:
-					# Falls Überschreiben eines Objekts im Speicher fehlschlägt, nichts machen
-					pass
-			for lEintragBytes_LOESCHEN in lZuVernichtendeBytesequenzenListe_LOESCHEN:
-				try:
-					LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lEintragBytes_LOESCHEN)
-					lZuVernichtendeBytesequenzenListe_LOESCHEN.remove(lEintragBytes_LOESCHEN)
-				except:
-					# Falls Überschreiben eines Objekts im Speicher fehlschlägt, nichts machen
-					pass
+			lGeheimnisregister.vernichteAlle()
 
-	# Interne Methoden zur Erstellung bzw. zum Auslesen des Headers verschlüsselter Dateien
+	def _liesBloecke(self, pQuelldateiFile, pLaengeInteger, pBlockgroesseInteger):
+		"""
+		Interne Methode. Liest pLaengeInteger Bytes ab der aktuellen Position aus pQuelldateiFile in Blöcken von bis zu
+		pBlockgroesseInteger Bytes und liefert diese nacheinander als memoryview. Gelesen wird mittels readinto(...) in
+		einen wiederverwendeten Puffer, d.h. ein Block ist nur bis zur Anforderung des nächsten gültig. Wird der
+		Funktionsprozess gestoppt, wird eine LiSAusnahmen.QProcessStoppedByUserError ausgelöst.
+
+		:param pQuelldateiFile: Zum Lesen geöffnete Quelldatei
+		:type pQuelldateiFile: File
+		:param pLaengeInteger: Anzahl zu lesender Bytes
+		:type pLaengeInteger: Integer
+		:param pBlockgroesseInteger: Maximale Blockgröße
+		:type pBlockgroesseInteger: Integer
+		:return: Blöcke
+		:rtype: Generator von memoryview
+		"""
+		lPufferMemoryview = memoryview(bytearray(pBlockgroesseInteger))
+		lVerbleibendeBytesInteger = pLaengeInteger
+		while lVerbleibendeBytesInteger > 0:
+			if not self.sFunktionsausfuehrer.istFunktionsprozessAktiv():
+				raise LiSAusnahmen.QProcessStoppedByUserError()
+			lGelesenInteger = pQuelldateiFile.readinto(lPufferMemoryview[:min(lVerbleibendeBytesInteger, pBlockgroesseInteger)])
+			if not lGelesenInteger:
+				break # Quelldatei kürzer als angegeben - die anschließende Authentifizierung schlägt fehl
+			yield lPufferMemoryview[:lGelesenInteger]
+			lVerbleibendeBytesInteger -= lGelesenInteger
+
+	def entschluesseleBereich(self, pSHA512HashwertBytes, pOffsetInteger, pLaengeInteger):
+		"""
+		Entschlüsselt den Klartextbereich [pOffsetInteger, pOffsetInteger + pLaengeInteger) der zu
+		self.sErweiterterPfadZuDateiString gehörigen Datei und returniert ihn. Es werden ausschließlich die betroffenen
+		Segmente gelesen und authentifiziert (nur bei LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4 und
+		C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT möglich).
 
-	def _erstelleHeaderFuerAESGCM_V3(self, *, pQuelldateiStat, pScryptSaltBytes, pAESNonceBytes):
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pOffsetInteger: Position des ersten Klartextbytes
+		:type pOffsetInteger: int
+		:param pLaengeInteger: Anzahl der Klartextbytes (wird am Dateiende gekappt)
+		:type pLaengeInteger: int
+		:return: Authentifizierter Klartext des Bereichs
+		:rtype: Bytesequenz
+		"""
+		lQuelldateiEndnameString = os.path.basename(self.sErweiterterPfadZuQuelldateiString)
+		try:
+			with open(self.sErweiterterPfadZuQuelldateiString, 'rb') as lQuelldatei:
+				if lQuelldatei.read(4) != b'LiSX':
+					raise ValueError('Keine LiSCrypt-Datei.')
+				lHeaderDictionary = self._liesHeaderAusDatei(lQuelldatei)
+				if lHeaderDictionary is None or (lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4
+												 and lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT):
+					raise ValueError('Verfahren unterstützt keinen wahlfreien Zugriff.')
+				lPositionNachHeaderInQuelldateiInteger = lQuelldatei.tell()
+				lQuelldatei.seek(0)
+				lHeaderBytes = lQuelldatei.read(lPositionNachHeaderInQuelldateiInteger)
+				lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(
+					pSHA512HashwertBytes=pSHA512HashwertBytes,
+					pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
+					pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
+					pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
+					pInitialesScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'], )
+				lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESSchluesselDictionary['AESGCMV3Schluessel'], lHeaderDictionary['AESGCMV4NonceBytes'])
+				return Segmentwerkzeuge.liesKlartextbereich(lQuelldatei, lHeaderDictionary, lHeaderBytes, lDateischluesselBytes, pOffsetInteger, pLaengeInteger)
+		except Exception as lException:
+			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
+			raise LiSAusnahmen.QFileListDisplayError(lQuelldateiEndnameString + ': [Entschlüsselung fehlgeschlagen]', lDateinameReduziertString) from lException
+		finally:
+			if 'lDateischluesselBytes' in locals():
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateischluesselBytes)
+
+	# Interne Methoden zur Fortsetzung unterbrochener Ver- und Entschlüsselungen
+
+	def _ermittleFortsetzungDerVerschluesselung(self, pJournal, pJournalDictionary, pSHA512HashwertBytes, pQuelldateiStat, pErweiterterPfadZuZieldateiString):
 		"""
-		Interne Methode. Erstellt einen Header für Verschlüsselung mit dem durch LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V3
-		beschriebenen Verfahren und returniert diesen.
+		Interne Methode. Prüft, ob eine unterbrochene Verschlüsselung in pErweiterterPfadZuZieldateiString fortgesetzt
+		werden kann: Journal und Header der Zieldatei müssen zueinander passen, Größe und Änderungsdatum der Quelldatei
+		dürfen sich nicht verändert haben, und Metadatensegment sowie alle im Journal vermerkten Datensegmente müssen
+		sich mit dem aus pSHA512HashwertBytes abgeleiteten Schlüssel authentifizieren lassen.
+
+		:param pJournal: Journal zur Quelldatei
+		:type pJournal: LiSJournal.Segmentjournal
+		:param pJournalDictionary: Journalinhalt (vgl. LiSJournal.Segmentjournal.lies()) oder None
+		:type pJournalDictionary: Dictionary
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
 		:param pQuelldateiStat: Stat-Objekt zur Quelldatei
 		:type pQuelldateiStat: Stat-Object
-		:param pScryptSaltBytes: Salt für Scrypt
-		:type pScryptSaltBytes: Bytesequenz
-		:param pAESNonceBytes: Nonce für AESGCM_V3
-		:type pAESNonceBytes: Bytesequenz
-		:return: Header
-		:rtype: Bytesequenz
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zu Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		:return: Daten zur Fortsetzung oder None, falls keine Fortsetzung möglich ist
+		:rtype: Dictionary
 		"""
-		lQuelldateiAenderungsdatumInteger = int(round(pQuelldateiStat.st_mtime_ns))
-		lQuelldateiZugriffsdatumInteger = int(round(pQuelldateiStat.st_atime_ns))
-		lQuelldateigroesseInteger = pQuelldateiStat.st_size
-		lQuelldateiEndnameString = os.path.basename(self.sErweiterterPfadZuQuelldateiString)
-		lQuelldateiEndnameLaengeInteger = len(lQuelldateiEndnameString.encode())
-
-		lHeaderBytes = b''
-		lHeaderBytes = lHeaderBytes.join(
-			['LiSX'.encode(),
-			 struct.pack('>H', LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V3),
-			 struct.pack('>Q', LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT),
-			 struct.pack('>I', LiSKonstanten.C_SCRYPT_BLOCK_GROESSE),
-			 struct.pack('>I', LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT),
-			 struct.pack('>I', LiSKonstanten.C_SCRYPT_SALT_LAENGE),
-			 pScryptSaltBytes,
-			 struct.pack('>I', LiSKonstanten.C_AES_GCM_NONCE_LAENGE),
-			 pAESNonceBytes,
-			 struct.pack('>Q', lQuelldateiAenderungsdatumInteger),
-			 struct.pack('>Q', lQuelldateiZugriffsdatumInteger),
-			 struct.pack('>Q', lQuelldateigroesseInteger),
-			 struct.pack('>Q', lQuelldateiEndnameLaengeInteger),
-			 struct.pack('>H', len(LiSKonstanten.C_ERFORDERLICHE_LISCRYPT_VERSION))])
-		return lHeaderBytes
+		if pJournalDictionary is None or pJournalDictionary['Zieldatei'] != pErweiterterPfadZuZieldateiString \
+				or not os.path.isfile(pErweiterterPfadZuZieldateiString) or os.path.islink(pErweiterterPfadZuZieldateiString):
+			return None
+		try:
+			with open(pErweiterterPfadZuZieldateiString, 'rb') as lZieldatei:
+				if lZieldatei.read(4) != b'LiSX':
+					return None
+				lHeaderDictionary = self._liesHeaderAusDatei(lZieldatei)
+				if lHeaderDictionary is None or lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4:
+					return None
+				lHeaderlaengeInteger = lZieldatei.tell()
+				lZieldatei.seek(0)
+				lHeaderBytes = lZieldatei.read(lHeaderlaengeInteger)
+				if not pJournal.stimmtUeberein(pJournalDictionary, pErweiterterPfadZuZieldateiString, lHeaderBytes) \
+						or lHeaderDictionary['DateiOriginalgroesse'] != pQuelldateiStat.st_size \
+						or lHeaderDictionary['DateiOriginalAenderungsdatumInteger'] != int(round(pQuelldateiStat.st_mtime_ns)):
+					return None
+
+				lAbgeschlosseneSegmenteInteger = min(pJournalDictionary['AbgeschlosseneSegmenteInteger'],
+													 Segmentwerkzeuge.gibAnzahlDatensegmente(lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger']))
+				lFortsetzungspositionInteger = Segmentwerkzeuge.gibSegmentposition(lHeaderDictionary, lHeaderlaengeInteger, lAbgeschlosseneSegmenteInteger + 1)
+				if os.fstat(lZieldatei.fileno()).st_size < lFortsetzungspositionInteger:
+					return None
+
+				lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(
+					pSHA512HashwertBytes=pSHA512HashwertBytes,
+					pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
+					pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
+					pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
+					pInitialesScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'])
+				lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESSchluesselDictionary['AESGCMV3Schluessel'], lHeaderDictionary['AESGCMV4NonceBytes'])
+
+				# Bereits geschriebenen Teil der Zieldatei authentifizieren:
+				self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Prüfe Teilverschlüsselung: ' + os.path.basename(self.sErweiterterPfadZuQuelldateiString), pAbbrechenButtonAktivBoolean=True)
+				lMetadatenBytes = Segmentwerkzeuge.entschluesseleSegment(lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], 0, False, lHeaderBytes,
+																	   lZieldatei.read(Segmentwerkzeuge.gibMetadatensegmentLaenge(lHeaderDictionary)))
+				if lMetadatenBytes != Segmentwerkzeuge.erstelleMetadaten(os.path.basename(self.sErweiterterPfadZuQuelldateiString)):
+					return None
+				Segmentwerkzeuge.entschluesseleDatensegmente(lZieldatei, None, lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], lHeaderBytes,
+															 lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger'],
+															 self.sFunktionsausfuehrer.istFunktionsprozessAktiv, pLetzterSegmentIndexInteger=lAbgeschlosseneSegmenteInteger)
+		except (OSError, ValueError, struct.error, cryptography_exceptions.InvalidTag):
+			return None
+
+		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Fortsetzung der Verschlüsselung nach Datensegment ' + str(lAbgeschlosseneSegmenteInteger))
+		return {'HeaderBytes': lHeaderBytes,
+				'Dateischluessel': lDateischluesselBytes,
+				'AESGCMV4NonceBytes': lHeaderDictionary['AESGCMV4NonceBytes'],
+				'SegmentgroesseInteger': lHeaderDictionary['SegmentgroesseInteger'],
+				'AbgeschlosseneSegmenteInteger': lAbgeschlosseneSegmenteInteger,
+				'FortsetzungspositionInteger': lFortsetzungspositionInteger}
+
+	def istVerschluesselungAmOrtFortzusetzen(self, pErweiterterPfadZuZieldateiString):
+		"""
+		Returniert, ob die zu self.sErweiterterPfadZuDateiString gehörige Datei laut Journal teilweise am Ort verschlüsselt
+		wurde (siehe _verschluesselnAmOrt(...)) und daher unabhängig von den gewählten Optionen am Ort fortgesetzt werden
+		muss. Ein Journal, das nicht (mehr) zur Datei passt, wird entfernt.
+
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zur Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		:rtype: Boolean
+		"""
+		lJournal = LiSJournal.Segmentjournal(LiSKonstanten.C_AM_ORT_JOURNAL_LITERAL, self.sErweiterterPfadZuQuelldateiString)
+		if lJournal.lies() is None:
+			return False
+		if self._liesJournalDerVerschluesselungAmOrt(lJournal, pErweiterterPfadZuZieldateiString) is None:
+			lJournal.entferne()
+			return False
+		return True
+
+	def _liesJournalDerVerschluesselungAmOrt(self, pJournal, pErweiterterPfadZuZieldateiString):
+		"""
+		Interne Methode. Liest das Journal einer Verschlüsselung am Ort und prüft (ohne Schlüssel), ob es zur Datei passt:
+		Der Header wird dem Journal entnommen und die Datei muss ihre endgültige Größe haben (bzw. vor dem ersten gesicherten
+		Datensegment auch noch ihre Originalgröße). Returniert Header, Headerdaten und Anzahl der (vom Dateiende her)
+		abgeschlossenen Datensegmente oder None.
+		"""
+		lJournalDictionary = pJournal.lies()
+		if lJournalDictionary is None or lJournalDictionary['Zieldatei'] != pErweiterterPfadZuZieldateiString:
+			return None
+		try:
+			lHeaderBytes = lJournalDictionary['HeaderBytes']
+			lHeaderDictionary = QDatei._liesHeaderAusBytes(lHeaderBytes)
+			if lHeaderDictionary is None or lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT:
+				return None
+			lAbgeschlosseneSegmenteInteger = min(lJournalDictionary['AbgeschlosseneSegmenteInteger'],
+												 Segmentwerkzeuge.gibAnzahlDatensegmente(lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger']))
+			lDateigroesseInteger = os.stat(self.sErweiterterPfadZuQuelldateiString, follow_symlinks=False).st_size
+			if lDateigroesseInteger != Segmentwerkzeuge.gibErwarteteDateigroesse(lHeaderDictionary, len(lHeaderBytes)) \
+					and (lAbgeschlosseneSegmenteInteger > 0 or lDateigroesseInteger != lHeaderDictionary['DateiOriginalgroesse']):
+				return None
+		except (OSError, ValueError, struct.error):
+			return None
+		return {'HeaderBytes': lHeaderBytes,
+				'HeaderDictionary': lHeaderDictionary,
+				'AbgeschlosseneSegmenteInteger': lAbgeschlosseneSegmenteInteger}
+
+	def _ermittleFortsetzungDerVerschluesselungAmOrt(self, pJournal, pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString):
+		"""
+		Interne Methode. Prüft, ob eine unterbrochene Verschlüsselung am Ort fortgesetzt werden kann (siehe
+		_liesJournalDerVerschluesselungAmOrt(...)), und authentifiziert das zuletzt gesicherte Datensegment mit dem aus
+		pSHA512HashwertBytes abgeleiteten Schlüssel. Passt der Schlüssel nicht, wird die Datei nicht verändert.
+
+		:param pJournal: Journal zur Datei
+		:type pJournal: LiSJournal.Segmentjournal
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zur Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		:return: Daten zur Fortsetzung oder None, falls keine Fortsetzung möglich ist
+		:rtype: Dictionary
+		"""
+		lFortsetzungDictionary = self._liesJournalDerVerschluesselungAmOrt(pJournal, pErweiterterPfadZuZieldateiString)
+		if lFortsetzungDictionary is None:
+			return None
+		lHeaderBytes = lFortsetzungDictionary['HeaderBytes']
+		lHeaderDictionary = lFortsetzungDictionary['HeaderDictionary']
+		lAbgeschlosseneSegmenteInteger = lFortsetzungDictionary['AbgeschlosseneSegmenteInteger']
+
+		lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(
+			pSHA512HashwertBytes=pSHA512HashwertBytes,
+			pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
+			pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
+			pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
+			pInitialesScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'])
+		lFortsetzungDictionary['Dateischluessel'] = Segmentwerkzeuge.leiteDateischluesselAb(lAESSchluesselDictionary['AESGCMV3Schluessel'], lHeaderDictionary['AESGCMV4NonceBytes'])
+
+		if lAbgeschlosseneSegmenteInteger > 0:
+			lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger'])
+			lSegmentIndexInteger = lAnzahlDatensegmenteInteger - lAbgeschlosseneSegmenteInteger + 1
+			lKlartextBytes_LOESCHEN = None
+			try:
+				with open(self.sErweiterterPfadZuQuelldateiString, 'rb') as lDatei:
+					lDatei.seek(Segmentwerkzeuge.gibSegmentposition(lHeaderDictionary, len(lHeaderBytes), lSegmentIndexInteger))
+					lKlartextBytes_LOESCHEN = Segmentwerkzeuge.entschluesseleSegment(lFortsetzungDictionary['Dateischluessel'], lHeaderDictionary['AESGCMV4NonceBytes'], lSegmentIndexInteger,
+																					lSegmentIndexInteger == lAnzahlDatensegmenteInteger, lHeaderBytes,
+																					lDatei.read(LiSKonstanten.C_AES_GCM_TAG_LAENGE + Segmentwerkzeuge.gibKlartextlaengeVonDatensegment(
+																						lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger'], lSegmentIndexInteger)))
+			except cryptography_exceptions.InvalidTag:
+				lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadZuQuelldateiString)
+				raise LiSAusnahmen.QFileListDisplayError(os.path.basename(lDateinameReduziertString) + ': [Verschlüsselung am Ort unterbrochen: Fortsetzung nur mit ursprünglichem Schlüssel]',
+														 lDateinameReduziertString)
+			finally:
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lKlartextBytes_LOESCHEN)
+
+		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Fortsetzung der Verschlüsselung am Ort nach ' + str(lAbgeschlosseneSegmenteInteger) + ' Datensegmenten')
+		return lFortsetzungDictionary
+
+	def _ermittleFortsetzungDerEntschluesselung(self, pJournal, pQuelldateiFile, pHeaderDictionary, pHeaderBytes, pDateischluesselBytes, pErweiterterPfadZuZieldateiString):
+		"""
+		Interne Methode. Prüft, ob eine unterbrochene Entschlüsselung in pErweiterterPfadZuZieldateiString fortgesetzt
+		werden kann, und returniert die Anzahl der bereits vollständig entschlüsselten Datensegmente (0: keine Fortsetzung).
+		Das Journal muss zu Zieldatei und Header passen, und das letzte im Journal vermerkte Datensegment muss mit dem
+		(authentifizierten) Segment der Quelldatei übereinstimmen.
 
-	def _erstelleHeaderFuerChaCha20_V3_1(self, *, pQuelldateiStat, pScryptSaltBytes, pChaCha20NonceBytes):
+		:param pJournal: Journal zur Quelldatei
+		:type pJournal: LiSJournal.Segmentjournal
+		:param pQuelldateiFile: Zum Lesen geöffnete verschlüsselte Datei
+		:type pQuelldateiFile: File-Objekt
+		:param pHeaderDictionary: Headerdaten der verschlüsselten Datei
+		:type pHeaderDictionary: Dictionary
+		:param pHeaderBytes: Vollständiger Header der verschlüsselten Datei
+		:type pHeaderBytes: Bytesequenz
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zu Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		:return: Anzahl abgeschlossener Datensegmente
+		:rtype: int
 		"""
-		Interne Methode. Erstellt einen Header für Verschlüsselung mit dem durch LiSKonstanten.C_VERFAHREN_CHACHA20_V3_1
-		beschriebenen Verfahren und returniert diesen.
+		lJournalDictionary = pJournal.lies()
+		if not pJournal.stimmtUeberein(lJournalDictionary, pErweiterterPfadZuZieldateiString, pHeaderBytes) \
+				or not os.path.isfile(pErweiterterPfadZuZieldateiString) or os.path.islink(pErweiterterPfadZuZieldateiString):
+			return 0
+		lSegmentgroesseInteger = pHeaderDictionary['SegmentgroesseInteger']
+		lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(pHeaderDictionary['DateiOriginalgroesse'], lSegmentgroesseInteger)
+		lAbgeschlosseneSegmenteInteger = min(lJournalDictionary['AbgeschlosseneSegmenteInteger'], lAnzahlDatensegmenteInteger)
+		if lAbgeschlosseneSegmenteInteger == 0:
+			return 0
+		lKlartextlaengeInteger = Segmentwerkzeuge.gibKlartextlaengeVonDatensegment(pHeaderDictionary['DateiOriginalgroesse'], lSegmentgroesseInteger, lAbgeschlosseneSegmenteInteger)
+		lKlartextInZieldateiBytes_LOESCHEN = None
+		lKlartextAusQuelldateiBytes_LOESCHEN = None
+		try:
+			with open(pErweiterterPfadZuZieldateiString, 'rb') as lZieldatei:
+				if os.fstat(lZieldatei.fileno()).st_size < (lAbgeschlosseneSegmenteInteger - 1) * lSegmentgroesseInteger + lKlartextlaengeInteger:
+					return 0
+				lZieldatei.seek((lAbgeschlosseneSegmenteInteger - 1) * lSegmentgroesseInteger)
+				lKlartextInZieldateiBytes_LOESCHEN = lZieldatei.read(lKlartextlaengeInteger)
+			pQuelldateiFile.seek(Segmentwerkzeuge.gibSegmentposition(pHeaderDictionary, len(pHeaderBytes), lAbgeschlosseneSegmenteInteger))
+			lKlartextAusQuelldateiBytes_LOESCHEN = Segmentwerkzeuge.entschluesseleSegment(pDateischluesselBytes, pHeaderDictionary['AESGCMV4NonceBytes'], lAbgeschlosseneSegmenteInteger,
+																						 lAbgeschlosseneSegmenteInteger == lAnzahlDatensegmenteInteger, pHeaderBytes,
+																						 pQuelldateiFile.read(LiSKonstanten.C_AES_GCM_TAG_LAENGE + lKlartextlaengeInteger))
+			if lKlartextInZieldateiBytes_LOESCHEN != lKlartextAusQuelldateiBytes_LOESCHEN:
+				return 0
+		except (OSError, cryptography_exceptions.InvalidTag):
+			return 0
+		finally:
+			for lEintragBytes_LOESCHEN in (lKlartextInZieldateiBytes_LOESCHEN, lKlartextAusQuelldateiBytes_LOESCHEN):
+				if lEintragBytes_LOESCHEN is not None:
+					LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lEintragBytes_LOESCHEN)
+
+		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Fortsetzung der Entschlüsselung nach Datensegment ' + str(lAbgeschlosseneSegmenteInteger))
+		return lAbgeschlosseneSegmenteInteger
+
+	# Interne Methoden zur Erstellung bzw. zum Auslesen des Headers verschlüsselter Dateien
+
+	def _erstelleHeaderFuerAESGCM_V4(self, *, pQuelldateiStat, pScryptSaltBytes, pAESNonceBytes, pSegmentgroesseInteger,
+									 pVerfahrenKennungInteger=LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4, pMetadatenFuellmengeInteger=0):
+		"""
+		Interne Methode. Erstellt einen Header für Verschlüsselung mit dem durch LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4
+		(bzw. C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT) beschriebenen Verfahren und returniert diesen.
 		:param pQuelldateiStat: Stat-Objekt zur Quelldatei
 		:type pQuelldateiStat: Stat-Object
 		:param pScryptSaltBytes: Salt für Scrypt
 		:type pScryptSaltBytes: Bytesequenz
-		:param pChaCha20NonceBytes: Nonce für CHACHA20_V3
-		:type pChaCha20NonceBytes: Bytesequenz
+		:param pAESNonceBytes: Dateinonce für AESGCM_V4 (Basis der Segmentnonces)
+		:type pAESNonceBytes: Bytesequenz
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:param pVerfahrenKennungInteger: Verfahrenskennung
+		:type pVerfahrenKennungInteger: int
+		:param pMetadatenFuellmengeInteger: Länge der Nullbytefolge am Ende des Metadatensegments (nur C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT)
+		:type pMetadatenFuellmengeInteger: int
 		:return: Header
 		:rtype: Bytesequenz
 		"""
-		lQuelldateiAenderungsdatumInteger = int(round(pQuelldateiStat.st_mtime_ns))
-		lQuelldateiZugriffsdatumInteger = int(round(pQuelldateiStat.st_atime_ns))
-		lQuelldateigroesseInteger = pQuelldateiStat.st_size
-		lQuelldateiEndnameString = os.path.basename(self.sErweiterterPfadZuQuelldateiString)
-		lQuelldateiEndnameLaengeInteger = len(lQuelldateiEndnameString.encode())
-
-		lHeaderBytes = b''
-		lHeaderBytes = lHeaderBytes.join(
-			['LiSX'.encode(),
-			 struct.pack('>H', LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V3_1),
-			 struct.pack('>Q', LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT),
-			 struct.pack('>I', LiSKonstanten.C_SCRYPT_BLOCK_GROESSE),
-			 struct.pack('>I', LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT),
-			 struct.pack('>I', LiSKonstanten.C_SCRYPT_SALT_LAENGE),
-			 pScryptSaltBytes,
-			 struct.pack('>I', LiSKonstanten.C_CHACHA20_NONCE_LAENGE),
-			 pChaCha20NonceBytes,
-			 struct.pack('>Q', lQuelldateiAenderungsdatumInteger),
-			 struct.pack('>Q', lQuelldateiZugriffsdatumInteger),
-			 struct.pack('>Q', lQuelldateigroesseInteger),
-			 struct.pack('>Q', lQuelldateiEndnameLaengeInteger),
-			 struct.pack('>H', len(LiSKonstanten.C_ERFORDERLICHE_LISCRYPT_VERSION))])
-		return lHeaderBytes
-
-	def _liesHeaderAusDatei(self, pQuelldateiFile):
+		return Segmentwerkzeuge.erstelleHeader(pVerfahrenKennungInteger=pVerfahrenKennungInteger,
+											   pScryptSaltBytes=pScryptSaltBytes,
+											   pAESNonceBytes=pAESNonceBytes,
+											   pAenderungsdatumInteger=int(round(pQuelldateiStat.st_mtime_ns)),
+											   pZugriffsdatumInteger=int(round(pQuelldateiStat.st_atime_ns)),
+											   pOriginalgroesseInteger=pQuelldateiStat.st_size,
+											   pOriginaldateiEndnameString=os.path.basename(self.sErweiterterPfadZuQuelldateiString),
+											   pSegmentgroesseInteger=pSegmentgroesseInteger,
+											   pMetadatenFuellmengeInteger=pMetadatenFuellmengeInteger)
+
+	@staticmethod
+	def _liesHeaderAusBytes(pHeaderBytes):
 		"""
-		Liest die Headerdaten aus einer verschlüsselten Datei aus und returniert diese.
+		Interne Methode. Liest die Headerdaten aus dem vollständigen Header pHeaderBytes (inkl. 'LiSX') und returniert
+		sie (siehe _liesHeaderAusDatei(...)), bzw. None, falls es sich nicht um einen LiSCrypt-Header handelt.
+		"""
+		lHeaderFile = io.BytesIO(pHeaderBytes)
+		if lHeaderFile.read(4) != b'LiSX':
+			return None
+		lHeaderDictionary = QDatei._liesHeaderAusDatei(lHeaderFile)
+		if lHeaderDictionary is not None and lHeaderFile.tell() != len(pHeaderBytes):
+			return None
+		return lHeaderDictionary
+
+	@staticmethod
+	def _liesHeaderAusDatei(pQuelldateiFile):
+		"""
+		Liest die Headerdaten aus einer verschlüsselten Datei aus und returniert diese. Die Methode benötigt weder
+		Schlüssel noch Funktionsausfuehrer und wird daher auch zur Headerinspektion (LiSInspektion) verwendet.
 
 		:param pQuelldateiFile: Zum Lesen geöffnete verschlüsselte Datei
 		:type pQuelldateiFile: File-Objekt
@@ -1137,6 +1525,29 @@ class QDatei:
 			lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
 			lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'] = struct.unpack('>H', lQuelldatei.read(struct.calcsize('H')))[0]
 
+		elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4\
+				or lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM\
+				or lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT\
+				or lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV:
+			lHeaderDictionary['ScryptAufwandsfaktorInteger'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
+			lHeaderDictionary['ScryptBlockgroesseInteger'] = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
+			lHeaderDictionary['ScryptParallelisierungInteger'] = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
+			lHeaderDictionary['ScryptSaltlaengeInteger'] = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
+			lHeaderDictionary['ScryptSaltBytes'] = lQuelldatei.read(lHeaderDictionary['ScryptSaltlaengeInteger'])
+			lHeaderDictionary['AESGCMV4NoncelaengeInteger'] = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
+			lHeaderDictionary['AESGCMV4NonceBytes'] = lQuelldatei.read(lHeaderDictionary['AESGCMV4NoncelaengeInteger'])
+			lHeaderDictionary['DateiOriginalAenderungsdatumInteger'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
+			lHeaderDictionary['DateiOriginalZugriffsdatumInteger'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
+			lHeaderDictionary['DateiOriginalgroesse'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
+			lHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
+			lHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger'] = struct.unpack('>H', lQuelldatei.read(struct.calcsize('H')))[0]
+			lHeaderDictionary['SegmentgroesseInteger'] = struct.unpack('>I', lQuelldatei.read(struct.calcsize('I')))[0]
+			lHeaderDictionary['MetadatenFuellmengeInteger'] = 0
+			if lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT:
+				lHeaderDictionary['MetadatenFuellmengeInteger'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
+			if lHeaderDictionary['SegmentgroesseInteger'] == 0 or lHeaderDictionary['AESGCMV4NoncelaengeInteger'] != LiSKonstanten.C_AES_GCM_NONCE_LAENGE:
+				raise ValueError('Ungültiger Header.')
+
 		elif lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_CHACHA20_KENNUNG_V1: # Kompatibilität zu < 0.3.15rc1-8.
 			lHeaderDictionary['DateiBlockgroesse'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
 			lHeaderDictionary['ScryptAufwandsfaktorInteger'] = struct.unpack('>Q', lQuelldatei.read(struct.calcsize('Q')))[0]
@@ -1187,4 +1598,1272 @@ class QDatei:
 		if len(lHeaderDictionary) < 2: # Wenn nichts oder nur die Verfahrenskennung im Header-Dictionary enthalten ist
 			lHeaderDictionary = None
 
-		return lHeaderDictionary
\ No newline at end of file
+		return lHeaderDictionary
+
+
+class QDatenstrom:
+	"""
+	Modelliert einen Datenstrom (z.B. Standardeingabe) inkl. darauf definierter Operationen aus der Perspektive von
+	LiSCrypt. Der Datenstrom wird ausschließlich sequentiell gelesen und das Ergebnis sequentiell in einen weiteren
+	Datenstrom (z.B. Standardausgabe) geschrieben. Verschlüsselt wird mit dem Verfahren
+	LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM, da die Länge vorab nicht bekannt ist. Entschlüsselt werden
+	außerdem Dateien der Verfahren LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4 und C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT.
+	"""
+
+	class Lesemitschnitt:
+		"""
+		Reicht read()-Aufrufe an einen Datenstrom weiter und merkt sich die gelesenen Bytes (zum Einlesen des Headers,
+		der als AAD benötigt wird, ohne seek()).
+		"""
+		def __init__(self, pQuelleFile):
+			self.sQuelleFile = pQuelleFile
+			self.sGelesenList = []
+
+		def read(self, pLaengeInteger):
+			lBytes = Segmentwerkzeuge._liesVollstaendig(self.sQuelleFile, pLaengeInteger)
+			self.sGelesenList.append(lBytes)
+			return lBytes
+
+		def gibGelesen(self):
+			return b''.join(self.sGelesenList)
+
+	def __init__(self, pFunktionsausfuehrer, pQuelleFile, pBezeichnungString):
+		"""
+		Initialisiert ein zum Datenstrom pQuelleFile gehöriges Objekt der Klasse QDatenstrom.
+
+		:param pFunktionsausfuehrer: Funktionsausfuehrer, der das Objekt erzeugt hat.
+		:type pFunktionsausfuehrer: LiSFunktionsausfuehrung.Funktionsausfuehrer
+		:param pQuelleFile: Zum binären Lesen geöffneter Datenstrom
+		:type pQuelleFile: File-Objekt
+		:param pBezeichnungString: Bezeichnung des Datenstroms für Status und Verlaufsprotokoll (z.B. 'Standardeingabe')
+		:type pBezeichnungString: String
+		"""
+		self.sFunktionsausfuehrer = pFunktionsausfuehrer
+		self.sQuelleFile = pQuelleFile
+		self.sBezeichnungString = pBezeichnungString
+
+	def verschluesseln(self, pSHA512HashwertBytes, pZielFile):
+		"""
+		Verschlüsselt den Datenstrom unter Verwendung eines mittels Scrypt aus pSHA512HashwertBytes generierten Schlüssels
+		und schreibt das Ergebnis in pZielFile.
+
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pZielFile: Zum binären Schreiben geöffneter Datenstrom
+		:type pZielFile: File-Objekt
+		"""
+		if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is not True:
+			raise LiSAusnahmen.QProcessStoppedByUserError()
+		try:
+			lAESGCMV3SchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=pSHA512HashwertBytes)
+			lAESGCMV4NonceBytes = self.sFunktionsausfuehrer.gibNeueAESGCMNoncePerHKDF()
+			lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESGCMV3SchluesselDictionary['AESGCMV3Schluessel'], lAESGCMV4NonceBytes)
+			lZeitpunktInteger = time.time_ns()
+			lHeaderBytes = Segmentwerkzeuge.erstelleHeader(pVerfahrenKennungInteger=LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM,
+														   pScryptSaltBytes=lAESGCMV3SchluesselDictionary['InitialesScryptSalt'],
+														   pAESNonceBytes=lAESGCMV4NonceBytes,
+														   pAenderungsdatumInteger=lZeitpunktInteger,
+														   pZugriffsdatumInteger=lZeitpunktInteger,
+														   pOriginalgroesseInteger=0,
+														   pOriginaldateiEndnameString=LiSKonstanten.C_DATENSTROM_ORIGINALDATEINAME,
+														   pSegmentgroesseInteger=LiSKonstanten.C_AES_GCM_SEGMENTGROESSE)
+
+			self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Verschlüsselung: ' + self.sBezeichnungString, pAbbrechenButtonAktivBoolean=True)
+			pZielFile.write(lHeaderBytes)
+			pZielFile.write(Segmentwerkzeuge.verschluesseleSegment(lDateischluesselBytes, lAESGCMV4NonceBytes, 0, False, lHeaderBytes,
+																   Segmentwerkzeuge.erstelleMetadaten(LiSKonstanten.C_DATENSTROM_ORIGINALDATEINAME)))
+			Segmentwerkzeuge.verschluesseleDatenstrom(self.sQuelleFile, pZielFile, lDateischluesselBytes, lAESGCMV4NonceBytes, lHeaderBytes,
+													  LiSKonstanten.C_AES_GCM_SEGMENTGROESSE, self.sFunktionsausfuehrer.istFunktionsprozessAktiv)
+			pZielFile.flush()
+		except LiSAusnahmen.QProcessStoppedByUserError:
+			self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=self.sBezeichnungString + ': [Verschlüsselung abgebrochen]')
+			raise
+		except Exception as lException:
+			raise LiSAusnahmen.QFileListDisplayError(self.sBezeichnungString + ': [Verschlüsselung fehlgeschlagen]', self.sBezeichnungString) from lException
+		finally:
+			if 'lDateischluesselBytes' in locals():
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateischluesselBytes)
+
+	def entschluesseln(self, pSHA256HashwertBytes, pSHA512HashwertBytes, pZielFile):
+		"""
+		Entschlüsselt den Datenstrom unter Verwendung eines mittels Scrypt aus pSHA512HashwertBytes generierten Schlüssels
+		und schreibt den Klartext in pZielFile. Es werden ausschließlich authentifizierte Segmente geschrieben; ein
+		gekürzter Datenstrom wird jedoch erst an dessen Ende erkannt (siehe Segmentwerkzeuge.entschluesseleDatenstrom).
+
+		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei; für spätere Verfahren ungenutzt)
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pZielFile: Zum binären Schreiben geöffneter Datenstrom
+		:type pZielFile: File-Objekt
+		"""
+		if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is not True:
+			raise LiSAusnahmen.QProcessStoppedByUserError()
+		lMetadatenBytes_LOESCHEN = None
+		try:
+			lLesemitschnitt = QDatenstrom.Lesemitschnitt(self.sQuelleFile)
+			if lLesemitschnitt.read(4) != b'LiSX':
+				raise LiSAusnahmen.QFileListDisplayError(self.sBezeichnungString + ': [Keine LiSCrypt-Datei]', self.sBezeichnungString)
+			lHeaderDictionary = QDatei._liesHeaderAusDatei(lLesemitschnitt)
+			if lHeaderDictionary is None or (lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4
+											 and lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM
+											 and lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT):
+				raise ValueError('Verfahren kann nicht als Datenstrom entschlüsselt werden.')
+			lHeaderBytes = lLesemitschnitt.gibGelesen()
+
+			lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(
+				pSHA512HashwertBytes=pSHA512HashwertBytes,
+				pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
+				pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
+				pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
+				pInitialesScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'])
+			lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESSchluesselDictionary['AESGCMV3Schluessel'], lHeaderDictionary['AESGCMV4NonceBytes'])
+
+			self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + self.sBezeichnungString, pAbbrechenButtonAktivBoolean=True)
+
+			# Metadatensegment entschlüsseln und authentifizieren (der Dateiname wird bei Datenströmen nicht verwendet):
+			lMetadatenBytes_LOESCHEN = Segmentwerkzeuge.entschluesseleSegment(lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], 0, False, lHeaderBytes,
+																			 Segmentwerkzeuge._liesVollstaendig(self.sQuelleFile, Segmentwerkzeuge.gibMetadatensegmentLaenge(lHeaderDictionary)))
+			lErforderlicheLiSCryptVersionString = Segmentwerkzeuge.zerlegeMetadaten(lHeaderDictionary, lMetadatenBytes_LOESCHEN)[1]
+			if LiSWerkzeuge.Stringwerkzeuge.vergleicheVersionen(LiSKonstanten.__version__, lErforderlicheLiSCryptVersionString) < 0:
+				raise LiSAusnahmen.QLiSCryptTooOldError(self.sBezeichnungString + ': [LiSCrypt-Update erforderlich]', self.sBezeichnungString)
+
+			if lHeaderDictionary['VerfahrenKennungInteger'] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM:
+				Segmentwerkzeuge.entschluesseleDatenstrom(self.sQuelleFile, pZielFile, lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], lHeaderBytes,
+														  lHeaderDictionary['SegmentgroesseInteger'], self.sFunktionsausfuehrer.istFunktionsprozessAktiv)
+			else:
+				Segmentwerkzeuge.entschluesseleDatensegmente(self.sQuelleFile, pZielFile, lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], lHeaderBytes,
+															 lHeaderDictionary['DateiOriginalgroesse'], lHeaderDictionary['SegmentgroesseInteger'],
+															 self.sFunktionsausfuehrer.istFunktionsprozessAktiv)
+				if self.sQuelleFile.read(1) != b'':
+					raise ValueError('Daten nach dem letzten Segment.')
+			pZielFile.flush()
+		except LiSAusnahmen.QProcessStoppedByUserError:
+			self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=self.sBezeichnungString + ': [Entschlüsselung abgebrochen]')
+			raise
+		except LiSAusnahmen.QFileListDisplayError:
+			raise
+		except Exception as lException:
+			raise LiSAusnahmen.QFileListDisplayError(self.sBezeichnungString + ': [Entschlüsselung fehlgeschlagen]', self.sBezeichnungString) from lException
+		finally:
+			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lMetadatenBytes_LOESCHEN)
+			if 'lDateischluesselBytes' in locals():
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateischluesselBytes)
+
+
+class QArchiv:
+	"""
+	Modelliert ein Archiv (LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV) inkl. darauf definierter Operationen aus
+	der Perspektive von LiSCrypt. Beim Verschlüsseln werden die Inhalte aller Dateien eines Verzeichnisbaums und
+	anschließend das Inhaltsverzeichnis als ein einziger Klartextstrom segmentweise verschlüsselt (ein Header, eine
+	Dateinonce und eine Schlüsselverwendung für alle Dateien, keine temporären Dateinamen und kein Journal je Datei).
+	Das abschließende, als letztes markierte Trailersegment enthält die Längen von Inhalt und Inhaltsverzeichnis. Beim
+	Entschlüsseln werden zunächst Trailer und Inhaltsverzeichnis und danach ausschließlich die Segmente der
+	ausgewählten Einträge gelesen und authentifiziert. Das Inhaltsverzeichnis enthält nur Dateien; leere
+	Unterverzeichnisse werden nicht archiviert, das Zielverzeichnis selbst wird beim Entpacken stets angelegt.
+	"""
+
+	C_TRAILER_STRUCT = struct.Struct('>QQ')
+	"""Klartext des Trailersegments: Länge des Inhalts und Länge des Inhaltsverzeichnisses in Bytes"""
+
+	C_INDEXEINTRAG_STRUCT = struct.Struct('>QQQQI')
+	"""Eintrag des Inhaltsverzeichnisses: Position und Länge im Inhalt, Änderungs- und Zugriffsdatum (ns) sowie Länge des
+	anschließend folgenden relativen Pfads (UTF-8, Trennzeichen '/') in Bytes"""
+
+	class Segmentschreiber:
+		"""
+		Nimmt Klartext beliebiger Länge entgegen und schreibt ihn als vollständige Datensegmente (ab Index 1)
+		verschlüsselt in eine Datei. abschliessen(...) schreibt das verbleibende Datensegment und das Trailersegment.
+		Der Klartext wird in einem LiSWerkzeuge.SichererPuffer gesammelt, den schliesse() überschreibt.
+		"""
+		def __init__(self, pZielFile, pDateischluesselBytes, pDateinonceBytes, pHeaderBytes, pSegmentgroesseInteger):
+			self.sZielFile = pZielFile
+			self.sDateischluesselBytes = pDateischluesselBytes
+			self.sDateinonceBytes = pDateinonceBytes
+			self.sHeaderBytes = pHeaderBytes
+			self.sSegmentgroesseInteger = pSegmentgroesseInteger
+			self.sSichererPuffer = LiSWerkzeuge.SichererPuffer(pSegmentgroesseInteger)
+			self.sFuellstandInteger = 0
+			self.sSegmentIndexInteger = 1
+			self.sKlartextlaengeInteger = 0
+
+		def schreibe(self, pKlartextBytes):
+			lPositionInteger = 0
+			while lPositionInteger < len(pKlartextBytes):
+				lAnzahlInteger = min(len(pKlartextBytes) - lPositionInteger, self.sSegmentgroesseInteger - self.sFuellstandInteger)
+				self.sSichererPuffer.sMemoryview[self.sFuellstandInteger:self.sFuellstandInteger + lAnzahlInteger] = pKlartextBytes[lPositionInteger:lPositionInteger + lAnzahlInteger]
+				self._vermerkeGelesen(lAnzahlInteger)
+				lPositionInteger += lAnzahlInteger
+
+		def schreibeAusDatei(self, pQuelleFile, pLeselaengeInteger):
+			"""
+			Liest pQuelleFile in Abschnitten von höchstens pLeselaengeInteger Bytes direkt in den Puffer, bis ein
+			Lesevorgang weniger Bytes als angefordert liefert (Dateiende).
+			"""
+			while True:
+				lAngefordertInteger = min(pLeselaengeInteger, self.sSegmentgroesseInteger - self.sFuellstandInteger)
+				lAnzahlInteger = pQuelleFile.readinto(self.sSichererPuffer.sMemoryview[self.sFuellstandInteger:self.sFuellstandInteger + lAngefordertInteger]) or 0
+				self._vermerkeGelesen(lAnzahlInteger)
+				if lAnzahlInteger < lAngefordertInteger:
+					break
+
+		def abschliessen(self, pTrailerBytes):
+			if self.sFuellstandInteger > 0:
+				self._schreibeSegment()
+			self.sZielFile.write(Segmentwerkzeuge.verschluesseleSegment(self.sDateischluesselBytes, self.sDateinonceBytes, self.sSegmentIndexInteger, True, self.sHeaderBytes, pTrailerBytes))
+
+		def schliesse(self):
+			self.sSichererPuffer.schliesse()
+
+		def _vermerkeGelesen(self, pAnzahlInteger):
+			self.sFuellstandInteger += pAnzahlInteger
+			self.sKlartextlaengeInteger += pAnzahlInteger
+			if self.sFuellstandInteger == self.sSegmentgroesseInteger:
+				self._schreibeSegment()
+
+		def _schreibeSegment(self):
+			self.sZielFile.write(Segmentwerkzeuge.verschluesseleSegment(self.sDateischluesselBytes, self.sDateinonceBytes, self.sSegmentIndexInteger, False, self.sHeaderBytes,
+																		 self.sSichererPuffer.sMemoryview[:self.sFuellstandInteger]))
+			self.sFuellstandInteger = 0
+			self.sSegmentIndexInteger += 1
+
+	class Segmentleser:
+		"""
+		Liest Klartextbereiche eines Archivs. Es werden ausschließlich die betroffenen Datensegmente gelesen,
+		authentifiziert und (am Ort in einem LiSWerkzeuge.SichererPuffer, den schliesse() überschreibt) entschlüsselt.
+		Das zuletzt entschlüsselte Segment wird vorgehalten, da aufeinanderfolgende kleine Einträge meist im selben
+		Segment liegen.
+		"""
+		def __init__(self, pQuelldateiFile, pHeaderDictionary, pHeaderBytes, pDateischluesselBytes, pKlartextlaengeInteger):
+			self.sQuelldateiFile = pQuelldateiFile
+			self.sHeaderDictionary = pHeaderDictionary
+			self.sHeaderBytes = pHeaderBytes
+			self.sDateischluesselBytes = pDateischluesselBytes
+			self.sKlartextlaengeInteger = pKlartextlaengeInteger
+			self.sSichererPuffer = LiSWerkzeuge.SichererPuffer(LiSKonstanten.C_AES_GCM_TAG_LAENGE + pHeaderDictionary['SegmentgroesseInteger'])
+			self.sSegmentIndexInteger = None
+			self.sSegmentMemoryview = None
+
+		def lies(self, pOffsetInteger, pLaengeInteger):
+			"""
+			Liefert den Klartextbereich [pOffsetInteger, pOffsetInteger + pLaengeInteger) in Teilen (höchstens einer je
+			Segment, jeweils nur bis zur Anforderung des nächsten Teils gültig).
+			"""
+			if pOffsetInteger < 0 or pLaengeInteger < 0 or pOffsetInteger + pLaengeInteger > self.sKlartextlaengeInteger:
+				raise ValueError('Bereich außerhalb des Archivs.')
+			lSegmentgroesseInteger = self.sHeaderDictionary['SegmentgroesseInteger']
+			lPositionInteger = pOffsetInteger
+			lEndeInteger = pOffsetInteger + pLaengeInteger
+			while lPositionInteger < lEndeInteger:
+				lSegmentIndexInteger = lPositionInteger // lSegmentgroesseInteger + 1
+				lSegmentstartInteger = (lSegmentIndexInteger - 1) * lSegmentgroesseInteger
+				lTeilMemoryview = self._gibSegment(lSegmentIndexInteger)[lPositionInteger - lSegmentstartInteger:lEndeInteger - lSegmentstartInteger]
+				yield lTeilMemoryview
+				lPositionInteger += len(lTeilMemoryview)
+
+		def _gibSegment(self, pSegmentIndexInteger):
+			if pSegmentIndexInteger != self.sSegmentIndexInteger:
+				self.sSegmentIndexInteger = None
+				self.sQuelldateiFile.seek(Segmentwerkzeuge.gibSegmentposition(self.sHeaderDictionary, len(self.sHeaderBytes), pSegmentIndexInteger))
+				lSegmentMemoryview = Segmentwerkzeuge._liesInPuffer(self.sQuelldateiFile, self.sSichererPuffer.sMemoryview, LiSKonstanten.C_AES_GCM_TAG_LAENGE
+																	+ Segmentwerkzeuge.gibKlartextlaengeVonDatensegment(self.sKlartextlaengeInteger, self.sHeaderDictionary['SegmentgroesseInteger'], pSegmentIndexInteger))
+				self.sSegmentMemoryview = Segmentwerkzeuge.entschluesseleSegmentAmOrt(self.sDateischluesselBytes, self.sHeaderDictionary['AESGCMV4NonceBytes'], pSegmentIndexInteger,
+																					  False, self.sHeaderBytes, lSegmentMemoryview)
+				self.sSegmentIndexInteger = pSegmentIndexInteger
+			return self.sSegmentMemoryview
+
+		def schliesse(self):
+			self.sSegmentIndexInteger = None
+			self.sSegmentMemoryview = None
+			self.sSichererPuffer.schliesse()
+
+	def __init__(self, pFunktionsausfuehrer, pErweiterterPfadString):
+		"""
+		Initialisiert ein zum Verzeichnis (Verschlüsselung) bzw. Archiv (Entschlüsselung) pErweiterterPfadString
+		gehöriges Objekt der Klasse QArchiv.
+
+		:param pFunktionsausfuehrer: Funktionsausfuehrer, der das Objekt erzeugt hat.
+		:type pFunktionsausfuehrer: LiSFunktionsausfuehrung.Funktionsausfuehrer
+		:param pErweiterterPfadString: Erweiterte Pfadangabe zum Verzeichnis bzw. Archiv
+		:type pErweiterterPfadString: String
+		"""
+		self.sFunktionsausfuehrer = pFunktionsausfuehrer
+		self.sErweiterterPfadString = pErweiterterPfadString
+
+	@staticmethod
+	def istArchiv(pErweiterterPfadZuDateiString):
+		"""
+		Returniert True, falls die Datei pErweiterterPfadZuDateiString laut Verfahrenskennung ein Archiv ist, sonst False.
+		Es werden nur Dateikennung und Verfahrenskennung gelesen (ohne Schlüssel).
+
+		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zur Datei
+		:type pErweiterterPfadZuDateiString: String
+		:return: Angabe, ob es sich um ein Archiv handelt
+		:rtype: Boolean
+		"""
+		try:
+			with open(pErweiterterPfadZuDateiString, 'rb') as lDatei:
+				lKennungBytes = lDatei.read(6)
+		except OSError:
+			return False
+		return len(lKennungBytes) == 6 and lKennungBytes[:4] == b'LiSX' \
+			and struct.unpack('>H', lKennungBytes[4:])[0] == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV
+
+	def verschluesseln(self, pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString, pAusgeschlossenerPfadString=None, pDauerhaftSichernBoolean=False):
+		"""
+		Verschlüsselt alle Dateien im Verzeichnisbaum self.sErweiterterPfadString (ohne Verknüpfungen, FIFOs, Dateien mit
+		Endung LiSKonstanten.C_DATEIENDUNG und pAusgeschlossenerPfadString) unter Verwendung eines mittels Scrypt aus
+		pSHA512HashwertBytes generierten Schlüssels in das Archiv pErweiterterPfadZuZieldateiString. Nicht lesbare
+		Dateien werden übersprungen und im Bericht vermerkt. Leere Unterverzeichnisse werden nicht archiviert.
+
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zum Archiv
+		:type pErweiterterPfadZuZieldateiString: String
+		:param pAusgeschlossenerPfadString: Erweiterte Pfadangabe zu einer nicht zu archivierenden Datei (Schlüsseldatei)
+		:type pAusgeschlossenerPfadString: String
+		:param pDauerhaftSichernBoolean: Angabe, ob das Archiv vor der Rückkehr per fsync gesichert werden soll (z.B. vor Vernichtung der Originale)
+		:type pDauerhaftSichernBoolean: Boolean
+		:return: Erweiterte Pfadangaben der archivierten Dateien und Anzahl übersprungener Dateien
+		:rtype: Tupel
+		"""
+		if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is not True:
+			raise LiSAusnahmen.QProcessStoppedByUserError()
+		lVerzeichnisEndnameString = os.path.basename(self.sErweiterterPfadString)
+		lArchivierteDateienList = []
+		lUebersprungenInteger = 0
+		lZieldateiErstelltBoolean = False
+		lSegmentschreiber = None
+		try:
+			lVerzeichnisStat = os.stat(self.sErweiterterPfadString)
+			lAESGCMV3SchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(pSHA512HashwertBytes=pSHA512HashwertBytes)
+			lAESGCMV4NonceBytes = self.sFunktionsausfuehrer.gibNeueAESGCMNoncePerHKDF()
+			lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESGCMV3SchluesselDictionary['AESGCMV3Schluessel'], lAESGCMV4NonceBytes)
+			lHeaderBytes = Segmentwerkzeuge.erstelleHeader(pVerfahrenKennungInteger=LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV,
+														   pScryptSaltBytes=lAESGCMV3SchluesselDictionary['InitialesScryptSalt'],
+														   pAESNonceBytes=lAESGCMV4NonceBytes,
+														   pAenderungsdatumInteger=lVerzeichnisStat.st_mtime_ns,
+														   pZugriffsdatumInteger=lVerzeichnisStat.st_atime_ns,
+														   pOriginalgroesseInteger=0,
+														   pOriginaldateiEndnameString=lVerzeichnisEndnameString,
+														   pSegmentgroesseInteger=LiSKonstanten.C_AES_GCM_SEGMENTGROESSE)
+
+			self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Verschlüsselung: ' + lVerzeichnisEndnameString, pAbbrechenButtonAktivBoolean=True)
+			with open(pErweiterterPfadZuZieldateiString, 'wb') as lZieldatei:
+				lZieldateiErstelltBoolean = True
+				lZieldatei.write(lHeaderBytes)
+				lZieldatei.write(Segmentwerkzeuge.verschluesseleSegment(lDateischluesselBytes, lAESGCMV4NonceBytes, 0, False, lHeaderBytes,
+																	   Segmentwerkzeuge.erstelleMetadaten(lVerzeichnisEndnameString)))
+				lSegmentschreiber = QArchiv.Segmentschreiber(lZieldatei, lDateischluesselBytes, lAESGCMV4NonceBytes, lHeaderBytes, LiSKonstanten.C_AES_GCM_SEGMENTGROESSE)
+
+				# Dateiinhalte nacheinander in den Klartextstrom schreiben (je Datei nur Öffnen, fstat, Lesen und Schließen):
+				lIndexTeileList = []
+				for lEintrag, lRelativerPfadString in QArchiv._durchlaufeVerzeichnis(self.sErweiterterPfadString, ''):
+					if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is not True:
+						raise LiSAusnahmen.QProcessStoppedByUserError()
+					if lEintrag.path == pAusgeschlossenerPfadString:
+						continue
+					try:
+						lQuelldatei = open(lEintrag.path, 'rb', buffering=0)
+					except OSError:
+						lUebersprungenInteger += 1
+						self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(lEintrag.name + ': [Übersprungen: Kein Lesezugriff]', LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(lEintrag.path))
+						continue
+					lOffsetInteger = lSegmentschreiber.sKlartextlaengeInteger
+					with lQuelldatei:
+						lQuelldateiStat = os.fstat(lQuelldatei.fileno())
+						# Ein kürzerer Lesevorgang markiert das Dateiende (bei kleinen Dateien genügt so ein einziger):
+						lSegmentschreiber.schreibeAusDatei(lQuelldatei, min(lQuelldateiStat.st_size + 1, LiSKonstanten.C_AES_GCM_SEGMENTGROESSE))
+					lLaengeInteger = lSegmentschreiber.sKlartextlaengeInteger - lOffsetInteger
+					lPfadBytes = lRelativerPfadString.encode('utf-8', 'surrogateescape')
+					lIndexTeileList.append(QArchiv.C_INDEXEINTRAG_STRUCT.pack(lOffsetInteger, lLaengeInteger, lQuelldateiStat.st_mtime_ns, lQuelldateiStat.st_atime_ns, len(lPfadBytes)))
+					lIndexTeileList.append(lPfadBytes)
+					lArchivierteDateienList.append(lEintrag.path)
+					self.sFunktionsausfuehrer.meldeFortschritt(lLaengeInteger)
+					self.sFunktionsausfuehrer.meldeDateiAbgeschlossen()
+
+				# Inhaltsverzeichnis im Anschluss an den Inhalt und Längen im Trailersegment schreiben:
+				lInhaltslaengeInteger = lSegmentschreiber.sKlartextlaengeInteger
+				lIndexBytes = b''.join(lIndexTeileList)
+				lSegmentschreiber.schreibe(lIndexBytes)
+				lSegmentschreiber.abschliessen(QArchiv.C_TRAILER_STRUCT.pack(lInhaltslaengeInteger, len(lIndexBytes)))
+				if pDauerhaftSichernBoolean is True:
+					lZieldatei.flush()
+					with LiSZeitmessung.Zeitmessung.abschnitt('fsync'):
+						os.fsync(lZieldatei.fileno())
+		except LiSAusnahmen.QProcessStoppedByUserError:
+			self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lVerzeichnisEndnameString + ': [Verschlüsselung abgebrochen]',
+															pToolTipString=LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadString))
+			if lZieldateiErstelltBoolean is True:
+				self._vernichteUnvollstaendigeDatei(pErweiterterPfadZuZieldateiString)
+			raise
+		except Exception as lException:
+			if lZieldateiErstelltBoolean is True:
+				self._vernichteUnvollstaendigeDatei(pErweiterterPfadZuZieldateiString)
+			lVerzeichnisnameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadString)
+			raise LiSAusnahmen.QFileListDisplayError(lVerzeichnisEndnameString + ': [Verschlüsselung fehlgeschlagen]', lVerzeichnisnameReduziertString) from lException
+		finally:
+			if lSegmentschreiber is not None:
+				lSegmentschreiber.schliesse()
+			if 'lDateischluesselBytes' in locals():
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateischluesselBytes)
+		return lArchivierteDateienList, lUebersprungenInteger
+
+	def entschluesseln(self, pSHA512HashwertBytes, pAuswahlList=None):
+		"""
+		Entschlüsselt die Einträge des Archivs self.sErweiterterPfadString unter Verwendung eines mittels Scrypt aus
+		pSHA512HashwertBytes generierten Schlüssels in das beim Verschlüsseln archivierte Verzeichnis (neben dem Archiv).
+		Mit pAuswahlList werden nur Einträge entschlüsselt, deren relativer Pfad zu mindestens einem der Muster passt
+		(fnmatch, z.B. 'texte/*.txt'); gelesen und authentifiziert werden dann nur Trailer, Inhaltsverzeichnis und die
+		Segmente dieser Einträge. Bestehende Dateien werden gemäß Funktionsausfuehrer.erfrageUeberschreiben(...)
+		behandelt.
+
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pAuswahlList: Muster für die zu entschlüsselnden Einträge (Default: alle Einträge)
+		:type pAuswahlList: Liste von Strings
+		:return: Erweiterte Pfadangabe zum Zielverzeichnis, Anzahl entschlüsselter und Anzahl übersprungener Einträge
+		:rtype: Tupel
+		"""
+		if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is not True:
+			raise LiSAusnahmen.QProcessStoppedByUserError()
+		lArchivEndnameString = os.path.basename(self.sErweiterterPfadString)
+		lArchivnameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(self.sErweiterterPfadString)
+		lMetadatenBytes_LOESCHEN = None
+		lSegmentleser = None
+		lErweiterterPfadZuZieldateiString = None # Nur während des Schreibens einer Zieldatei gesetzt (bei Fehlern zu vernichten)
+		try:
+			with open(self.sErweiterterPfadString, 'rb') as lQuelldatei:
+				if lQuelldatei.read(4) != b'LiSX':
+					raise LiSAusnahmen.QFileListDisplayError(lArchivEndnameString + ': [Keine LiSCrypt-Datei]', lArchivnameReduziertString)
+				lHeaderDictionary = QDatei._liesHeaderAusDatei(lQuelldatei)
+				if lHeaderDictionary is None or lHeaderDictionary['VerfahrenKennungInteger'] != LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV:
+					raise ValueError('Kein Archiv.')
+				lHeaderlaengeInteger = lQuelldatei.tell()
+				lQuelldatei.seek(0)
+				lHeaderBytes = lQuelldatei.read(lHeaderlaengeInteger)
+
+				lAESSchluesselDictionary = self.sFunktionsausfuehrer.ermittleAESGCM_V3Schluessel(
+					pSHA512HashwertBytes=pSHA512HashwertBytes,
+					pScryptAufwandsfaktorInteger=lHeaderDictionary['ScryptAufwandsfaktorInteger'],
+					pScryptBlockgroesseInteger=lHeaderDictionary['ScryptBlockgroesseInteger'],
+					pScryptParallelisierungInteger=lHeaderDictionary['ScryptParallelisierungInteger'],
+					pInitialesScryptSaltBytes=lHeaderDictionary['ScryptSaltBytes'])
+				lDateischluesselBytes = Segmentwerkzeuge.leiteDateischluesselAb(lAESSchluesselDictionary['AESGCMV3Schluessel'], lHeaderDictionary['AESGCMV4NonceBytes'])
+
+				self.sFunktionsausfuehrer.setzeStatusleisteUndGUIZustand(pTextString='Entschlüsselung: ' + lArchivEndnameString, pAbbrechenButtonAktivBoolean=True)
+
+				# Metadatensegment (Verzeichnisname) entschlüsseln und authentifizieren:
+				lMetadatenBytes_LOESCHEN = Segmentwerkzeuge.entschluesseleSegment(lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], 0, False, lHeaderBytes,
+																				 lQuelldatei.read(Segmentwerkzeuge.gibMetadatensegmentLaenge(lHeaderDictionary)))
+				lVerzeichnisEndnameBytes, lErforderlicheLiSCryptVersionString = Segmentwerkzeuge.zerlegeMetadaten(lHeaderDictionary, lMetadatenBytes_LOESCHEN)
+				if LiSWerkzeuge.Stringwerkzeuge.vergleicheVersionen(LiSKonstanten.__version__, lErforderlicheLiSCryptVersionString) < 0:
+					raise LiSAusnahmen.QLiSCryptTooOldError(lArchivEndnameString + ': [LiSCrypt-Update erforderlich]', lArchivnameReduziertString)
+				lVerzeichnisEndnameString = bytes(lVerzeichnisEndnameBytes).decode('utf-8', 'surrogateescape')
+				if not QArchiv._istZulaessigerPfadbestandteil(lVerzeichnisEndnameString):
+					raise ValueError('Ungültiger Verzeichnisname.')
+
+				# Trailersegment lesen (die Klartextlänge ergibt sich ohne Schlüssel aus der Dateigröße und wird durch das
+				# Trailersegment authentifiziert, eine Kürzung oder Verlängerung des Archivs fällt also vor dem Entpacken auf):
+				lDateigroesseInteger = os.fstat(lQuelldatei.fileno()).st_size
+				lKlartextlaengeInteger = Segmentwerkzeuge.gibOriginalgroesseVonDatenstrom(lHeaderDictionary, lHeaderlaengeInteger, lDateigroesseInteger, QArchiv.C_TRAILER_STRUCT.size)
+				lTrailerIndexInteger = -(-lKlartextlaengeInteger // lHeaderDictionary['SegmentgroesseInteger']) + 1
+				lQuelldatei.seek(lDateigroesseInteger - QArchiv.C_TRAILER_STRUCT.size - LiSKonstanten.C_AES_GCM_TAG_LAENGE)
+				lInhaltslaengeInteger, lIndexlaengeInteger = QArchiv.C_TRAILER_STRUCT.unpack(Segmentwerkzeuge.entschluesseleSegment(
+					lDateischluesselBytes, lHeaderDictionary['AESGCMV4NonceBytes'], lTrailerIndexInteger, True, lHeaderBytes,
+					lQuelldatei.read(QArchiv.C_TRAILER_STRUCT.size + LiSKonstanten.C_AES_GCM_TAG_LAENGE)))
+				if lInhaltslaengeInteger + lIndexlaengeInteger != lKlartextlaengeInteger:
+					raise ValueError('Klartextlänge passt nicht zum Trailersegment.')
+
+				# Inhaltsverzeichnis lesen und Einträge auswählen:
+				lSegmentleser = QArchiv.Segmentleser(lQuelldatei, lHeaderDictionary, lHeaderBytes, lDateischluesselBytes, lKlartextlaengeInteger)
+				lEintraegeList = QArchiv._zerlegeInhaltsverzeichnis(b''.join(lSegmentleser.lies(lInhaltslaengeInteger, lIndexlaengeInteger)), lInhaltslaengeInteger)
+				if pAuswahlList:
+					lEintraegeList = [lEintragDictionary for lEintragDictionary in lEintraegeList
+									  if any(fnmatch.fnmatchcase(lEintragDictionary['Pfad'], lMusterString) for lMusterString in pAuswahlList)]
+
+				# Einträge in Reihenfolge des Inhalts entschlüsseln (jedes Segment wird höchstens einmal gelesen). Zieldateien
+				# werden exklusiv angelegt und erhalten ausschließlich authentifizierten Klartext:
+				lErweiterterPfadZuVerzeichnisString = os.path.join(os.path.dirname(self.sErweiterterPfadString), lVerzeichnisEndnameString)
+				os.makedirs(lErweiterterPfadZuVerzeichnisString, exist_ok=True) # Auch bei leerem Archiv bzw. leerer Auswahl
+				lAngelegteVerzeichnisseSet = {lErweiterterPfadZuVerzeichnisString}
+				lEntschluesseltInteger = 0
+				lUebersprungenInteger = 0
+				for lEintragDictionary in lEintraegeList:
+					if self.sFunktionsausfuehrer.istFunktionsprozessAktiv() is not True:
+						raise LiSAusnahmen.QProcessStoppedByUserError()
+					lErweiterterPfadZuEintragString = os.path.join(lErweiterterPfadZuVerzeichnisString, *lEintragDictionary['Pfad'].split('/'))
+					lEintragsverzeichnisString = os.path.dirname(lErweiterterPfadZuEintragString)
+					if lEintragsverzeichnisString not in lAngelegteVerzeichnisseSet:
+						os.makedirs(lEintragsverzeichnisString, exist_ok=True)
+						lAngelegteVerzeichnisseSet.add(lEintragsverzeichnisString)
+					try:
+						lZieldatei = open(lErweiterterPfadZuEintragString, 'xb')
+					except FileExistsError:
+						lUeberschreibenInteger = self.sFunktionsausfuehrer.erfrageUeberschreiben(lErweiterterPfadZuEintragString)
+						if lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_JA:
+							self.sFunktionsausfuehrer.vernichte(lErweiterterPfadZuEintragString, pAusgabeEintragsnameBoolean=True)
+							lZieldatei = open(lErweiterterPfadZuEintragString, 'xb')
+						elif lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_NEIN:
+							lUebersprungenInteger += 1
+							self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(os.path.basename(lErweiterterPfadZuEintragString) + ': [Übersprungen: Nutzer-Auswahl]',
+																			LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(lErweiterterPfadZuEintragString))
+							continue
+						else: #d.h. lUeberschreibenInteger=None
+							self.sFunktionsausfuehrer.stoppeFunktionsprozess()
+							raise LiSAusnahmen.QProcessStoppedByUserError()
+					lErweiterterPfadZuZieldateiString = lErweiterterPfadZuEintragString
+					with lZieldatei:
+						for lTeilMemoryview in lSegmentleser.lies(lEintragDictionary['Offset'], lEintragDictionary['Laenge']):
+							lZieldatei.write(lTeilMemoryview)
+					lErweiterterPfadZuZieldateiString = None
+					try:
+						os.utime(lErweiterterPfadZuEintragString, ns=(lEintragDictionary['Zugriffsdatum'], lEintragDictionary['Aenderungsdatum']))
+					except OSError:
+						pass
+					lEntschluesseltInteger += 1
+					self.sFunktionsausfuehrer.meldeFortschritt(lEintragDictionary['Laenge'])
+		except LiSAusnahmen.QProcessStoppedByUserError:
+			self.sFunktionsausfuehrer.ergaenzeBerichtAusgabe(pZeileString=lArchivEndnameString + ': [Entschlüsselung abgebrochen]', pToolTipString=lArchivnameReduziertString)
+			if lErweiterterPfadZuZieldateiString is not None:
+				self._vernichteUnvollstaendigeDatei(lErweiterterPfadZuZieldateiString)
+			raise
+		except LiSAusnahmen.QFileListDisplayError:
+			if lErweiterterPfadZuZieldateiString is not None:
+				self._vernichteUnvollstaendigeDatei(lErweiterterPfadZuZieldateiString)
+			raise
+		except Exception as lException:
+			if lErweiterterPfadZuZieldateiString is not None:
+				self._vernichteUnvollstaendigeDatei(lErweiterterPfadZuZieldateiString)
+			raise LiSAusnahmen.QFileListDisplayError(lArchivEndnameString + ': [Entschlüsselung fehlgeschlagen]', lArchivnameReduziertString) from lException
+		finally:
+			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lMetadatenBytes_LOESCHEN)
+			if lSegmentleser is not None:
+				lSegmentleser.schliesse()
+			if 'lDateischluesselBytes' in locals():
+				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lDateischluesselBytes)
+		return lErweiterterPfadZuVerzeichnisString, lEntschluesseltInteger, lUebersprungenInteger
+
+	## --- Interne Methoden
+
+	def _vernichteUnvollstaendigeDatei(self, pErweiterterPfadZuDateiString):
+		"""
+		Interne Methode. Vernichtet die nach Abbruch oder Fehler unvollständige Datei pErweiterterPfadZuDateiString.
+		"""
+		if os.path.isfile(pErweiterterPfadZuDateiString) and not os.path.islink(pErweiterterPfadZuDateiString):
+			try:
+				self.sFunktionsausfuehrer.vernichte(pErweiterterPfadZuDateiString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=True)
+			except:
+				logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung einer unvollständigen Datei (Archiv)')
+
+	@staticmethod
+	def _durchlaufeVerzeichnis(pErweiterterPfadZuVerzeichnisString, pRelativerPfadString):
+		"""
+		Interne Methode. Liefert rekursiv und nach Namen sortiert alle regulären Dateien ohne Endung
+		LiSKonstanten.C_DATEIENDUNG im Verzeichnis pErweiterterPfadZuVerzeichnisString als os.DirEntry zusammen mit dem
+		relativen Pfad (pRelativerPfadString als Präfix, Trennzeichen '/'). Verknüpfungen und FIFOs werden anhand des
+		Verzeichniseintrags, d.h. ohne zusätzliche Systemaufrufe je Datei, ausgeschlossen. Verzeichnisse selbst werden
+		nicht geliefert (leere Unterverzeichnisse sind daher nicht Teil des Archivs).
+		"""
+		with os.scandir(pErweiterterPfadZuVerzeichnisString) as lEintraegeIterator:
+			lEintraegeList = sorted(lEintraegeIterator, key=lambda pEintrag: pEintrag.name)
+		for lEintrag in lEintraegeList:
+			if lEintrag.is_dir(follow_symlinks=False):
+				yield from QArchiv._durchlaufeVerzeichnis(lEintrag.path, pRelativerPfadString + lEintrag.name + '/')
+			elif lEintrag.is_file(follow_symlinks=False) and not str.lower(lEintrag.name).endswith(LiSKonstanten.C_DATEIENDUNG) \
+					and (not os.name == 'nt' or not str.lower(lEintrag.name).endswith('.lnk')):
+				yield lEintrag, pRelativerPfadString + lEintrag.name
+
+	@staticmethod
+	def _zerlegeInhaltsverzeichnis(pIndexBytes, pInhaltslaengeInteger):
+		"""
+		Interne Methode. Zerlegt das Inhaltsverzeichnis pIndexBytes und returniert die Einträge als Liste von
+		Dictionaries (Pfad, Offset, Laenge, Aenderungsdatum, Zugriffsdatum). Bereiche außerhalb des Inhalts und relative
+		Pfade, die aus dem Zielverzeichnis herausführen könnten, führen zu einem ValueError.
+		"""
+		lEintraegeList = []
+		lPositionInteger = 0
+		while lPositionInteger < len(pIndexBytes):
+			lOffsetInteger, lLaengeInteger, lAenderungsdatumInteger, lZugriffsdatumInteger, lPfadlaengeInteger = QArchiv.C_INDEXEINTRAG_STRUCT.unpack_from(pIndexBytes, lPositionInteger)
+			lPositionInteger += QArchiv.C_INDEXEINTRAG_STRUCT.size + lPfadlaengeInteger
+			lPfadString = pIndexBytes[lPositionInteger - lPfadlaengeInteger:lPositionInteger].decode('utf-8', 'surrogateescape')
+			if lPositionInteger > len(pIndexBytes) or lOffsetInteger + lLaengeInteger > pInhaltslaengeInteger \
+					or not all(QArchiv._istZulaessigerPfadbestandteil(lTeilString) for lTeilString in lPfadString.split('/')):
+				raise ValueError('Ungültiger Eintrag im Inhaltsverzeichnis.')
+			lEintraegeList.append({'Pfad': lPfadString, 'Offset': lOffsetInteger, 'Laenge': lLaengeInteger,
+								   'Aenderungsdatum': lAenderungsdatumInteger, 'Zugriffsdatum': lZugriffsdatumInteger})
+		return lEintraegeList
+
+	@staticmethod
+	def _istZulaessigerPfadbestandteil(pNameString):
+		"""
+		Interne Methode. Returniert True, falls pNameString ein einzelner Verzeichnis- oder Dateiname ist (kein leerer
+		Name, kein '.' oder '..', keine Trennzeichen oder Laufwerksangaben), sonst False.
+		"""
+		return pNameString not in ('', '.', '..') and '/' not in pNameString and os.sep not in pNameString \
+			and (os.altsep is None or os.altsep not in pNameString) and os.path.splitdrive(pNameString)[0] == ''
+
+class Segmentwerkzeuge:
+	"""
+	Stellt statische Methoden für das segmentierte Verfahren LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4 zur Verfügung.
+
+	Aufbau einer Datei: Header | Metadatensegment (Index 0) | Datensegmente (Index 1 bis n). Jedes Segment besteht aus
+	dem AES-GCM-Chiffrat und dem zugehörigen MAC-Tag, der vollständige Header wird in jedem Segment als AAD
+	authentifiziert. Die Nonce eines Segments ergibt sich aus der (per HKDF abgeleiteten) Dateinonce, die mit Segmentindex
+	und Markierung des letzten Segments verknüpft wird (vgl. STREAM-Konstruktion). Vertauschen, Entfernen oder Anhängen
+	von Segmenten wird dadurch bei der Authentifizierung erkannt, und jedes Segment kann einzeln entschlüsselt werden.
+	Verschlüsselt wird mit einem Dateischlüssel, der per HKDF aus dem AES-GCM-V3-Schlüssel und der Dateinonce abgeleitet
+	wird (siehe leiteDateischluesselAb(...)), so dass der gemeinsame Schlüssel nur einmal je Datei verwendet wird.
+	Die Segmentgröße wird je Datei anhand der Originalgröße gewählt (siehe gibSegmentgroesse(...)) und im Header abgelegt.
+
+	Bei LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM ist die Originalgröße beim Schreiben des Headers nicht
+	bekannt (Datenstrom). Alle Datensegmente außer dem letzten sind vollständig, keines ist als letztes markiert. Es folgt
+	ein Trailersegment (Index n + 1, als letztes markiert), das die Klartextlänge enthält. Ver- und Entschlüsselung lesen
+	und schreiben streng sequentiell mit konstantem Speicherbedarf.
+
+	Bei LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT endet das Metadatensegment mit einer Nullbytefolge, deren
+	Länge im Header steht (siehe QDatei.verschluesselnAmOrt(...)). Alles Übrige entspricht C_VERFAHREN_AES_GCM_KENNUNG_V4.
+	"""
+	C_HEADER_STRUCT = struct.Struct('>4sHQIII{}sI{}sQQQQHI'.format(LiSKonstanten.C_SCRYPT_SALT_LAENGE, LiSKonstanten.C_AES_GCM_NONCE_LAENGE))
+	"""Feste Felder des Headers (ohne Füllmenge bei C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT), siehe erstelleHeader(...)"""
+
+	def __init__(self):
+		if type(self) is Segmentwerkzeuge:
+			raise LiSAusnahmen.QAbstractClassError('Segmentwerkzeuge kann nicht instanziiert werden.')
+
+	@staticmethod
+	def berechneSegmentnonce(pDateinonceBytes, pSegmentIndexInteger, pLetztesSegmentBoolean):
+		"""
+		Returniert die Nonce für das Segment pSegmentIndexInteger (Dateinonce XOR (Segmentindex || Markierung letztes Segment)).
+
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pSegmentIndexInteger: Index des Segments (0: Metadatensegment)
+		:type pSegmentIndexInteger: int
+		:param pLetztesSegmentBoolean: Angabe, ob es sich um das letzte Segment der Datei handelt
+		:type pLetztesSegmentBoolean: Boolean
+		:return: Nonce des Segments
+		:rtype: Bytesequenz
+		"""
+		lMaskeInteger = (pSegmentIndexInteger << 8) | (1 if pLetztesSegmentBoolean is True else 0)
+		return (int.from_bytes(pDateinonceBytes, 'big') ^ lMaskeInteger).to_bytes(len(pDateinonceBytes), 'big')
+
+	@staticmethod
+	def leiteDateischluesselAb(pSchluesselBytes, pDateinonceBytes):
+		"""
+		Returniert den Dateischlüssel (HKDF-Expand des AES-GCM-V3-Schlüssels mit der Dateinonce als Kontext). Jede Datei
+		erhält dadurch einen eigenen Schlüssel, so dass die Segmente einer Datei nicht auf die Anzahl
+		LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL zulässiger Aufrufe des gemeinsamen Schlüssels
+		angerechnet werden müssen (NIST SP 800-38D section 8.3).
+
+		:param pSchluesselBytes: AES-GCM-V3-Schlüssel
+		:type pSchluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:return: Dateischlüssel
+		:rtype: Bytesequenz
+		"""
+		lKDFHKDFExpand = hkdf.HKDFExpand(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_AES_GCM_SCHLUESSEL_LAENGE,
+			info=b'AES-GCM-V4-key-' + pDateinonceBytes,
+			backend=default_backend())
+		return lKDFHKDFExpand.derive(pSchluesselBytes)
+
+	@staticmethod
+	def verschluesseleSegment(pDateischluesselBytes, pDateinonceBytes, pSegmentIndexInteger, pLetztesSegmentBoolean, pHeaderBytes, pKlartextBytes):
+		"""
+		Verschlüsselt pKlartextBytes als Segment pSegmentIndexInteger und returniert Chiffrat und MAC-Tag.
+
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pSegmentIndexInteger: Index des Segments
+		:type pSegmentIndexInteger: int
+		:param pLetztesSegmentBoolean: Angabe, ob es sich um das letzte Segment der Datei handelt
+		:type pLetztesSegmentBoolean: Boolean
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pKlartextBytes: Klartext des Segments
+		:type pKlartextBytes: Bytesequenz
+		:return: Chiffrat mit angehängtem MAC-Tag
+		:rtype: Bytesequenz
+		"""
+		return AESGCM(pDateischluesselBytes).encrypt(Segmentwerkzeuge.berechneSegmentnonce(pDateinonceBytes, pSegmentIndexInteger, pLetztesSegmentBoolean), pKlartextBytes, pHeaderBytes)
+
+	@staticmethod
+	def entschluesseleSegment(pDateischluesselBytes, pDateinonceBytes, pSegmentIndexInteger, pLetztesSegmentBoolean, pHeaderBytes, pSegmentBytes):
+		"""
+		Authentifiziert und entschlüsselt das Segment pSegmentBytes (Chiffrat mit angehängtem MAC-Tag). Schlägt die
+		Authentifizierung fehl, wird cryptography.exceptions.InvalidTag geworfen.
+
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pSegmentIndexInteger: Index des Segments
+		:type pSegmentIndexInteger: int
+		:param pLetztesSegmentBoolean: Angabe, ob es sich um das letzte Segment der Datei handelt
+		:type pLetztesSegmentBoolean: Boolean
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pSegmentBytes: Chiffrat mit angehängtem MAC-Tag
+		:type pSegmentBytes: Bytesequenz
+		:return: Klartext des Segments
+		:rtype: Bytesequenz
+		"""
+		return AESGCM(pDateischluesselBytes).decrypt(Segmentwerkzeuge.berechneSegmentnonce(pDateinonceBytes, pSegmentIndexInteger, pLetztesSegmentBoolean), pSegmentBytes, pHeaderBytes)
+
+	@staticmethod
+	def entschluesseleSegmentAmOrt(pDateischluesselBytes, pDateinonceBytes, pSegmentIndexInteger, pLetztesSegmentBoolean, pHeaderBytes, pSegmentMemoryview):
+		"""
+		Authentifiziert und entschlüsselt das Segment im beschreibbaren Puffer pSegmentMemoryview (Chiffrat mit
+		angehängtem MAC-Tag, z.B. in einem LiSWerkzeuge.SichererPuffer) per update_into(...). Der Klartext überschreibt
+		das Chiffrat, d.h. es entsteht keine weitere, nicht überschreibbare Kopie. Schlägt die Authentifizierung fehl,
+		wird cryptography.exceptions.InvalidTag geworfen (der Puffer enthält dann nicht authentifizierten Klartext und
+		darf nicht ausgegeben werden).
+
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pSegmentIndexInteger: Index des Segments
+		:type pSegmentIndexInteger: int
+		:param pLetztesSegmentBoolean: Angabe, ob es sich um das letzte Segment der Datei handelt
+		:type pLetztesSegmentBoolean: Boolean
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pSegmentMemoryview: Chiffrat mit angehängtem MAC-Tag (beschreibbar)
+		:type pSegmentMemoryview: memoryview
+		:return: Klartext des Segments (Anfang von pSegmentMemoryview)
+		:rtype: memoryview
+		"""
+		lChiffratlaengeInteger = len(pSegmentMemoryview) - LiSKonstanten.C_AES_GCM_TAG_LAENGE
+		if lChiffratlaengeInteger < 0:
+			raise cryptography_exceptions.InvalidTag()
+		lAESDecryptor = Cipher(algorithms.AES(key=pDateischluesselBytes),
+							   modes.GCM(initialization_vector=Segmentwerkzeuge.berechneSegmentnonce(pDateinonceBytes, pSegmentIndexInteger, pLetztesSegmentBoolean),
+										 tag=bytes(pSegmentMemoryview[lChiffratlaengeInteger:])),
+							   backend=default_backend()).decryptor()
+		lAESDecryptor.authenticate_additional_data(pHeaderBytes)
+		# Der MAC-Tag hinter dem Chiffrat deckt den Zusatzplatz ab, den update_into(...) im Ausgabepuffer verlangt:
+		lAESDecryptor.update_into(pSegmentMemoryview[:lChiffratlaengeInteger], pSegmentMemoryview)
+		lAESDecryptor.finalize()
+		return pSegmentMemoryview[:lChiffratlaengeInteger]
+
+	@staticmethod
+	def erstelleHeader(*, pVerfahrenKennungInteger, pScryptSaltBytes, pAESNonceBytes, pAenderungsdatumInteger, pZugriffsdatumInteger, pOriginalgroesseInteger,
+					   pOriginaldateiEndnameString, pSegmentgroesseInteger, pMetadatenFuellmengeInteger=0):
+		"""
+		Erstellt einen Header für LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4, C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM
+		bzw. C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT und returniert diesen.
+
+		:param pVerfahrenKennungInteger: Verfahrenskennung
+		:type pVerfahrenKennungInteger: int
+		:param pScryptSaltBytes: Salt für Scrypt
+		:type pScryptSaltBytes: Bytesequenz
+		:param pAESNonceBytes: Dateinonce (Basis der Segmentnonces)
+		:type pAESNonceBytes: Bytesequenz
+		:param pAenderungsdatumInteger: Änderungsdatum des Originals in Nanosekunden
+		:type pAenderungsdatumInteger: int
+		:param pZugriffsdatumInteger: Zugriffsdatum des Originals in Nanosekunden
+		:type pZugriffsdatumInteger: int
+		:param pOriginalgroesseInteger: Größe des Originals in Bytes (0 bei Datenströmen)
+		:type pOriginalgroesseInteger: int
+		:param pOriginaldateiEndnameString: Dateiname des Originals (wird im Metadatensegment abgelegt)
+		:type pOriginaldateiEndnameString: String
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:param pMetadatenFuellmengeInteger: Länge der Nullbytefolge am Ende des Metadatensegments (nur C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT)
+		:type pMetadatenFuellmengeInteger: int
+		:return: Header
+		:rtype: Bytesequenz
+		"""
+		# Salt und Nonce werden von struct nicht auf ihre Länge geprüft (sondern aufgefüllt bzw. gekürzt):
+		if len(pScryptSaltBytes) != LiSKonstanten.C_SCRYPT_SALT_LAENGE or len(pAESNonceBytes) != LiSKonstanten.C_AES_GCM_NONCE_LAENGE:
+			raise ValueError('Salt oder Nonce mit unzulässiger Länge.')
+		lHeaderBytes = Segmentwerkzeuge.C_HEADER_STRUCT.pack(b'LiSX', pVerfahrenKennungInteger, LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT,
+															 LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT,
+															 LiSKonstanten.C_SCRYPT_SALT_LAENGE, pScryptSaltBytes, LiSKonstanten.C_AES_GCM_NONCE_LAENGE,
+															 pAESNonceBytes, pAenderungsdatumInteger, pZugriffsdatumInteger, pOriginalgroesseInteger,
+															 len(pOriginaldateiEndnameString.encode()), len(LiSKonstanten.C_ERFORDERLICHE_LISCRYPT_VERSION),
+															 pSegmentgroesseInteger)
+		if pVerfahrenKennungInteger == LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT:
+			lHeaderBytes += struct.pack('>Q', pMetadatenFuellmengeInteger)
+		return lHeaderBytes
+
+	@staticmethod
+	def erstelleMetadaten(pOriginaldateiEndnameString, pFuellmengeInteger=0):
+		"""
+		Returniert den Klartext des Metadatensegments (Index 0): Fünf \\x00-Werte (vorangestellte 0-Folge zur frühzeitigen
+		Kontrolle der Entschlüsselung), Dateiname des Originals, erforderliche LiSCrypt-Version (zur Entschlüsselung) und
+		ggf. pFuellmengeInteger \\x00-Werte (LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_AM_ORT).
+
+		:param pOriginaldateiEndnameString: Dateiname des Originals
+		:type pOriginaldateiEndnameString: String
+		:param pFuellmengeInteger: Länge der abschließenden Nullbytefolge
+		:type pFuellmengeInteger: int
+		:return: Klartext des Metadatensegments
+		:rtype: Bytesequenz
+		"""
+		return b''.join([b'\x00\x00\x00\x00\x00', pOriginaldateiEndnameString.encode(), LiSKonstanten.C_ERFORDERLICHE_LISCRYPT_VERSION.encode(), bytes(pFuellmengeInteger)])
+
+	@staticmethod
+	def zerlegeMetadaten(pHeaderDictionary, pMetadatenBytes):
+		"""
+		Prüft die Nullbytefolge im Klartext des Metadatensegments und returniert Dateiname des Originals und
+		erforderliche LiSCrypt-Version.
+
+		:param pHeaderDictionary: Headerdaten (siehe QDatei._liesHeaderAusDatei)
+		:type pHeaderDictionary: Dictionary
+		:param pMetadatenBytes: Klartext des Metadatensegments
+		:type pMetadatenBytes: Bytesequenz
+		:return: Dateiname des Originals (Bytesequenz) und erforderliche LiSCrypt-Version (String)
+		:rtype: Tupel
+		"""
+		if pMetadatenBytes[:5] != b'\x00\x00\x00\x00\x00':
+			raise ValueError('Nullbytefolge nicht erkannt.')
+		lEndnameEndeInteger = 5 + pHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger']
+		return pMetadatenBytes[5:lEndnameEndeInteger],\
+			bytes(pMetadatenBytes[lEndnameEndeInteger:lEndnameEndeInteger + pHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger']]).decode()
+
+	@staticmethod
+	def gibSegmentgroesse(pOriginalgroesseInteger, pBlockgroesseInteger=LiSKonstanten.C_AES_GCM_MINIMALE_SEGMENTGROESSE):
+		"""
+		Returniert die Segmentgröße für eine Datei der Größe pOriginalgroesseInteger. Ausgehend von pBlockgroesseInteger
+		(Chunkgröße des Datenträgers, mindestens LiSKonstanten.C_AES_GCM_MINIMALE_SEGMENTGROESSE) wird die Segmentgröße
+		verdoppelt, solange die Datei mehr als LiSKonstanten.C_AES_GCM_ZIELANZAHL_DATENSEGMENTE Datensegmente umfassen
+		würde (höchstens bis LiSKonstanten.C_AES_GCM_MAXIMALE_SEGMENTGROESSE). Große Dateien werden so mit wenigen
+		Systemaufrufen je MiB gelesen und geschrieben.
+
+		:param pOriginalgroesseInteger: Größe der Originaldatei in Bytes
+		:type pOriginalgroesseInteger: int
+		:param pBlockgroesseInteger: Chunkgröße des Datenträgers (siehe LiSBlockgroesse.Blockgroessenrichtlinie)
+		:type pBlockgroesseInteger: int
+		:return: Klartextgröße eines Datensegments in Bytes
+		:rtype: int
+		"""
+		lSegmentgroesseInteger = min(max(LiSKonstanten.C_AES_GCM_MINIMALE_SEGMENTGROESSE, pBlockgroesseInteger), LiSKonstanten.C_AES_GCM_MAXIMALE_SEGMENTGROESSE)
+		while lSegmentgroesseInteger < LiSKonstanten.C_AES_GCM_MAXIMALE_SEGMENTGROESSE and pOriginalgroesseInteger > lSegmentgroesseInteger * LiSKonstanten.C_AES_GCM_ZIELANZAHL_DATENSEGMENTE:
+			lSegmentgroesseInteger *= 2
+		return lSegmentgroesseInteger
+
+	@staticmethod
+	def gibAnzahlDatensegmente(pOriginalgroesseInteger, pSegmentgroesseInteger):
+		"""
+		Returniert die Anzahl der Datensegmente zu einer Datei der Größe pOriginalgroesseInteger (mindestens 1, damit
+		auch bei leeren Dateien ein als letztes markiertes Segment existiert).
+
+		:param pOriginalgroesseInteger: Größe der Originaldatei in Bytes
+		:type pOriginalgroesseInteger: int
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:return: Anzahl der Datensegmente
+		:rtype: int
+		"""
+		return max(1, -(-pOriginalgroesseInteger // pSegmentgroesseInteger))
+
+	@staticmethod
+	def gibKlartextlaengeVonDatensegment(pOriginalgroesseInteger, pSegmentgroesseInteger, pSegmentIndexInteger):
+		"""
+		Returniert die Klartextlänge des Datensegments pSegmentIndexInteger (Index ab 1).
+
+		:param pOriginalgroesseInteger: Größe der Originaldatei in Bytes
+		:type pOriginalgroesseInteger: int
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:param pSegmentIndexInteger: Index des Datensegments
+		:type pSegmentIndexInteger: int
+		:return: Klartextlänge des Datensegments in Bytes
+		:rtype: int
+		"""
+		return max(0, min(pSegmentgroesseInteger, pOriginalgroesseInteger - (pSegmentIndexInteger - 1) * pSegmentgroesseInteger))
+
+	@staticmethod
+	def gibMetadatensegmentLaenge(pHeaderDictionary):
+		"""
+		Returniert die Länge des verschlüsselten Metadatensegments (Nullbytefolge, Dateiname, erforderliche Version, ggf.
+		abschließende Nullbytefolge, MAC-Tag).
+
+		:param pHeaderDictionary: Headerdaten (siehe QDatei._liesHeaderAusDatei)
+		:type pHeaderDictionary: Dictionary
+		:return: Länge des Metadatensegments in Bytes
+		:rtype: int
+		"""
+		return 5 + pHeaderDictionary['DateiOriginaldateiEndnameLaengeInteger'] + pHeaderDictionary['ErforderlicheLiSCryptVersionLaengeInteger']\
+			+ pHeaderDictionary['MetadatenFuellmengeInteger'] + LiSKonstanten.C_AES_GCM_TAG_LAENGE
+
+	@staticmethod
+	def gibSegmentposition(pHeaderDictionary, pHeaderlaengeInteger, pSegmentIndexInteger):
+		"""
+		Returniert die Position des Datensegments pSegmentIndexInteger (Index ab 1) in der verschlüsselten Datei.
+
+		:param pHeaderDictionary: Headerdaten (siehe QDatei._liesHeaderAusDatei)
+		:type pHeaderDictionary: Dictionary
+		:param pHeaderlaengeInteger: Länge des Headers in Bytes
+		:type pHeaderlaengeInteger: int
+		:param pSegmentIndexInteger: Index des Datensegments
+		:type pSegmentIndexInteger: int
+		:return: Position in Bytes
+		:rtype: int
+		"""
+		return pHeaderlaengeInteger + Segmentwerkzeuge.gibMetadatensegmentLaenge(pHeaderDictionary)\
+			+ (pSegmentIndexInteger - 1) * (pHeaderDictionary['SegmentgroesseInteger'] + LiSKonstanten.C_AES_GCM_TAG_LAENGE)
+
+	@staticmethod
+	def gibErwarteteDateigroesse(pHeaderDictionary, pHeaderlaengeInteger):
+		"""
+		Returniert die Größe, die die verschlüsselte Datei gemäß ihres Headers haben muss.
+
+		:param pHeaderDictionary: Headerdaten (siehe QDatei._liesHeaderAusDatei)
+		:type pHeaderDictionary: Dictionary
+		:param pHeaderlaengeInteger: Länge des Headers in Bytes
+		:type pHeaderlaengeInteger: int
+		:return: Erwartete Dateigröße in Bytes
+		:rtype: int
+		"""
+		lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(pHeaderDictionary['DateiOriginalgroesse'], pHeaderDictionary['SegmentgroesseInteger'])
+		return pHeaderlaengeInteger + Segmentwerkzeuge.gibMetadatensegmentLaenge(pHeaderDictionary)\
+			+ lAnzahlDatensegmenteInteger * LiSKonstanten.C_AES_GCM_TAG_LAENGE + pHeaderDictionary['DateiOriginalgroesse']
+
+	@staticmethod
+	def gibOriginalgroesseVonDatenstrom(pHeaderDictionary, pHeaderlaengeInteger, pDateigroesseInteger, pTrailerKlartextlaengeInteger=LiSKonstanten.C_AES_GCM_TRAILER_KLARTEXT_LAENGE):
+		"""
+		Returniert die Originalgröße, die sich bei LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM aus der Größe
+		der verschlüsselten Datei ergibt (ohne Schlüssel, authentifiziert wird sie erst durch das Trailersegment). Bei
+		LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_ARCHIV ergibt sich entsprechend die Länge von Inhalt und
+		Inhaltsverzeichnis (pTrailerKlartextlaengeInteger: QArchiv.C_TRAILER_STRUCT.size).
+
+		:param pHeaderDictionary: Headerdaten (siehe QDatei._liesHeaderAusDatei)
+		:type pHeaderDictionary: Dictionary
+		:param pHeaderlaengeInteger: Länge des Headers in Bytes
+		:type pHeaderlaengeInteger: int
+		:param pDateigroesseInteger: Größe der verschlüsselten Datei in Bytes
+		:type pDateigroesseInteger: int
+		:param pTrailerKlartextlaengeInteger: Klartextlänge des Trailersegments in Bytes
+		:type pTrailerKlartextlaengeInteger: int
+		:return: Originalgröße in Bytes
+		:rtype: int
+		"""
+		lDatensegmentbytesInteger = pDateigroesseInteger - pHeaderlaengeInteger - Segmentwerkzeuge.gibMetadatensegmentLaenge(pHeaderDictionary)\
+			- pTrailerKlartextlaengeInteger - LiSKonstanten.C_AES_GCM_TAG_LAENGE
+		if lDatensegmentbytesInteger < 0:
+			raise ValueError('Datei kürzer als Header und Trailer.')
+		lAnzahlVollstaendigeSegmenteInteger, lRestInteger = divmod(lDatensegmentbytesInteger, pHeaderDictionary['SegmentgroesseInteger'] + LiSKonstanten.C_AES_GCM_TAG_LAENGE)
+		return lAnzahlVollstaendigeSegmenteInteger * pHeaderDictionary['SegmentgroesseInteger'] + max(0, lRestInteger - LiSKonstanten.C_AES_GCM_TAG_LAENGE)
+
+	@staticmethod
+	def verschluesseleDatensegmente(pQuelldateiFile, pZieldateiFile, pDateischluesselBytes, pDateinonceBytes, pHeaderBytes, pOriginalgroesseInteger, pSegmentgroesseInteger, pIstAktivFunktion,
+									pErsterSegmentIndexInteger=1, pNachSchreibenFunktion=None, pFortschrittFunktion=None):
+		"""
+		Liest die Originaldaten ab der aktuellen Position von pQuelldateiFile, verschlüsselt sie segmentweise und schreibt
+		die Datensegmente ab Index pErsterSegmentIndexInteger in pZieldateiFile. Große Dateien werden per Segmentpipeline
+		(Lesen, Verschlüsseln und Schreiben überlappend) verschlüsselt. Der Klartext wird in wiederverwendete Puffer
+		(LiSWerkzeuge.SichererPuffer) gelesen, die am Ende überschrieben werden.
+
+		:param pQuelldateiFile: Zum Lesen geöffnete Originaldatei (Position am Anfang des Segments pErsterSegmentIndexInteger)
+		:type pQuelldateiFile: File-Objekt
+		:param pZieldateiFile: Zum Schreiben geöffnete verschlüsselte Datei (Position vor dem Segment pErsterSegmentIndexInteger)
+		:type pZieldateiFile: File-Objekt
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pOriginalgroesseInteger: Größe der Originaldatei in Bytes
+		:type pOriginalgroesseInteger: int
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:param pIstAktivFunktion: Funktion, die angibt, ob die Verarbeitung fortgesetzt werden soll
+		:type pIstAktivFunktion: Callable
+		:param pErsterSegmentIndexInteger: Index des ersten zu verschlüsselnden Datensegments (> 1 bei Fortsetzung)
+		:type pErsterSegmentIndexInteger: int
+		:param pNachSchreibenFunktion: Funktion, die nach dem Schreiben eines Segments mit dessen Index aufgerufen wird (z.B. Journal)
+		:type pNachSchreibenFunktion: Callable
+		:param pFortschrittFunktion: Funktion, die nach dem Schreiben eines Segments mit der Anzahl verarbeiteter Klartextbytes aufgerufen wird
+		:type pFortschrittFunktion: Callable
+		"""
+		lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(pOriginalgroesseInteger, pSegmentgroesseInteger)
+
+		def lLiesSegment(pSegmentIndexInteger, pPuffer):
+			# Es wird ggf. ein Byte mehr als erwartet gelesen, um eine nachträglich vergrößerte Quelldatei zu erkennen:
+			lBlockMemoryview = Segmentwerkzeuge._liesInPuffer(pQuelldateiFile, pPuffer, len(pPuffer))
+			if len(lBlockMemoryview) != Segmentwerkzeuge.gibKlartextlaengeVonDatensegment(pOriginalgroesseInteger, pSegmentgroesseInteger, pSegmentIndexInteger):
+				raise ValueError('Quelldatei wurde während der Verschlüsselung verändert.')
+			return lBlockMemoryview
+
+		def lVerschluesseleSegment(pSegmentIndexInteger, pKlartextBytes):
+			return Segmentwerkzeuge.verschluesseleSegment(pDateischluesselBytes, pDateinonceBytes, pSegmentIndexInteger, pSegmentIndexInteger == lAnzahlDatensegmenteInteger, pHeaderBytes, pKlartextBytes)
+
+		def lSchreibeSegment(pSegmentIndexInteger, pSegmentBytes):
+			pZieldateiFile.write(pSegmentBytes)
+			if pNachSchreibenFunktion is not None:
+				pNachSchreibenFunktion(pSegmentIndexInteger)
+			if pFortschrittFunktion is not None:
+				pFortschrittFunktion(len(pSegmentBytes) - LiSKonstanten.C_AES_GCM_TAG_LAENGE)
+
+		Segmentwerkzeuge._verarbeiteDatensegmente(LiSZeitmessung.Zeitmessung.umschliesse('Lesen', lLiesSegment),
+												  LiSZeitmessung.Zeitmessung.umschliesse('AES-GCM', lVerschluesseleSegment),
+												  LiSZeitmessung.Zeitmessung.umschliesse('Schreiben', lSchreibeSegment),
+												  lAnzahlDatensegmenteInteger - pErsterSegmentIndexInteger + 1, pIstAktivFunktion, pErsterSegmentIndexInteger,
+												  min(pSegmentgroesseInteger, pOriginalgroesseInteger + 1))
+
+	@staticmethod
+	def entschluesseleDatensegmente(pQuelldateiFile, pZieldateiFile, pDateischluesselBytes, pDateinonceBytes, pHeaderBytes, pOriginalgroesseInteger, pSegmentgroesseInteger, pIstAktivFunktion,
+									pErsterSegmentIndexInteger=1, pLetzterSegmentIndexInteger=None, pNachSchreibenFunktion=None, pFortschrittFunktion=None):
+		"""
+		Liest die Datensegmente pErsterSegmentIndexInteger bis pLetzterSegmentIndexInteger (Default: letztes Segment) ab
+		der aktuellen Position von pQuelldateiFile, authentifiziert und entschlüsselt sie und schreibt den Klartext in
+		pZieldateiFile (bei None werden die Segmente nur authentifiziert). Große Dateien werden per Segmentpipeline
+		(Lesen, Entschlüsseln und Schreiben überlappend) entschlüsselt. Entschlüsselt wird am Ort in den Lesepuffern
+		(LiSWerkzeuge.SichererPuffer), die am Ende überschrieben werden. Schlägt die Authentifizierung eines Segments
+		fehl, wird cryptography.exceptions.InvalidTag geworfen.
+
+		:param pQuelldateiFile: Zum Lesen geöffnete verschlüsselte Datei (Position am Anfang des Segments pErsterSegmentIndexInteger)
+		:type pQuelldateiFile: File-Objekt
+		:param pZieldateiFile: Zum Schreiben geöffnete Zieldatei oder None
+		:type pZieldateiFile: File-Objekt
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pOriginalgroesseInteger: Größe der Originaldatei in Bytes
+		:type pOriginalgroesseInteger: int
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:param pIstAktivFunktion: Funktion, die angibt, ob die Verarbeitung fortgesetzt werden soll
+		:type pIstAktivFunktion: Callable
+		:param pErsterSegmentIndexInteger: Index des ersten zu entschlüsselnden Datensegments (> 1 bei Fortsetzung)
+		:type pErsterSegmentIndexInteger: int
+		:param pLetzterSegmentIndexInteger: Index des letzten zu entschlüsselnden Datensegments (None: letztes Segment der Datei)
+		:type pLetzterSegmentIndexInteger: int
+		:param pNachSchreibenFunktion: Funktion, die nach dem Schreiben eines Segments mit dessen Index aufgerufen wird (z.B. Journal)
+		:type pNachSchreibenFunktion: Callable
+		:param pFortschrittFunktion: Funktion, die nach dem Schreiben eines Segments mit der Anzahl verarbeiteter Klartextbytes aufgerufen wird
+		:type pFortschrittFunktion: Callable
+		"""
+		lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(pOriginalgroesseInteger, pSegmentgroesseInteger)
+		lLetzterSegmentIndexInteger = lAnzahlDatensegmenteInteger if pLetzterSegmentIndexInteger is None else pLetzterSegmentIndexInteger
+
+		def lLiesSegment(pSegmentIndexInteger, pPuffer):
+			return Segmentwerkzeuge._liesInPuffer(pQuelldateiFile, pPuffer, LiSKonstanten.C_AES_GCM_TAG_LAENGE
+												  + Segmentwerkzeuge.gibKlartextlaengeVonDatensegment(pOriginalgroesseInteger, pSegmentgroesseInteger, pSegmentIndexInteger))
+
+		def lEntschluesseleSegment(pSegmentIndexInteger, pSegmentMemoryview):
+			return Segmentwerkzeuge.entschluesseleSegmentAmOrt(pDateischluesselBytes, pDateinonceBytes, pSegmentIndexInteger, pSegmentIndexInteger == lAnzahlDatensegmenteInteger,
+															   pHeaderBytes, pSegmentMemoryview)
+
+		def lSchreibeSegment(pSegmentIndexInteger, pKlartextBytes):
+			if pZieldateiFile is not None:
+				pZieldateiFile.write(pKlartextBytes)
+			if pNachSchreibenFunktion is not None:
+				pNachSchreibenFunktion(pSegmentIndexInteger)
+			if pFortschrittFunktion is not None:
+				pFortschrittFunktion(len(pKlartextBytes))
+
+		Segmentwerkzeuge._verarbeiteDatensegmente(LiSZeitmessung.Zeitmessung.umschliesse('Lesen', lLiesSegment),
+												  LiSZeitmessung.Zeitmessung.umschliesse('AES-GCM', lEntschluesseleSegment),
+												  LiSZeitmessung.Zeitmessung.umschliesse('Schreiben', lSchreibeSegment),
+												  lLetzterSegmentIndexInteger - pErsterSegmentIndexInteger + 1, pIstAktivFunktion, pErsterSegmentIndexInteger,
+												  LiSKonstanten.C_AES_GCM_TAG_LAENGE + min(pSegmentgroesseInteger, pOriginalgroesseInteger))
+
+	@staticmethod
+	def liesKlartextbereich(pQuelldateiFile, pHeaderDictionary, pHeaderBytes, pDateischluesselBytes, pOffsetInteger, pLaengeInteger):
+		"""
+		Liest, authentifiziert und entschlüsselt ausschließlich die Datensegmente, die den Klartextbereich
+		[pOffsetInteger, pOffsetInteger + pLaengeInteger) überdecken, und returniert den Bereich.
+
+		:param pQuelldateiFile: Zum Lesen geöffnete verschlüsselte Datei
+		:type pQuelldateiFile: File-Objekt
+		:param pHeaderDictionary: Headerdaten (siehe QDatei._liesHeaderAusDatei)
+		:type pHeaderDictionary: Dictionary
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pOffsetInteger: Position des ersten Klartextbytes
+		:type pOffsetInteger: int
+		:param pLaengeInteger: Anzahl der Klartextbytes (wird am Dateiende gekappt)
+		:type pLaengeInteger: int
+		:return: Klartext des Bereichs
+		:rtype: Bytesequenz
+		"""
+		if pOffsetInteger < 0 or pLaengeInteger < 0:
+			raise ValueError('Offset und Länge dürfen nicht negativ sein.')
+		lOriginalgroesseInteger = pHeaderDictionary['DateiOriginalgroesse']
+		lSegmentgroesseInteger = pHeaderDictionary['SegmentgroesseInteger']
+		lEndeInteger = min(pOffsetInteger + pLaengeInteger, lOriginalgroesseInteger)
+		if pOffsetInteger >= lEndeInteger:
+			return b''
+		lAnzahlDatensegmenteInteger = Segmentwerkzeuge.gibAnzahlDatensegmente(lOriginalgroesseInteger, lSegmentgroesseInteger)
+		lErstesSegmentInteger = pOffsetInteger // lSegmentgroesseInteger + 1
+		lLetztesSegmentInteger = (lEndeInteger - 1) // lSegmentgroesseInteger + 1
+		lTeileList = []
+		for lSegmentIndexInteger in range(lErstesSegmentInteger, lLetztesSegmentInteger + 1):
+			pQuelldateiFile.seek(Segmentwerkzeuge.gibSegmentposition(pHeaderDictionary, len(pHeaderBytes), lSegmentIndexInteger))
+			lSegmentBytes = pQuelldateiFile.read(LiSKonstanten.C_AES_GCM_TAG_LAENGE + Segmentwerkzeuge.gibKlartextlaengeVonDatensegment(lOriginalgroesseInteger, lSegmentgroesseInteger, lSegmentIndexInteger))
+			lTeileList.append(Segmentwerkzeuge.entschluesseleSegment(pDateischluesselBytes, pHeaderDictionary['AESGCMV4NonceBytes'], lSegmentIndexInteger,
+																	 lSegmentIndexInteger == lAnzahlDatensegmenteInteger, pHeaderBytes, lSegmentBytes))
+		lSegmentstartInteger = (lErstesSegmentInteger - 1) * lSegmentgroesseInteger
+		return b''.join(lTeileList)[pOffsetInteger - lSegmentstartInteger:lEndeInteger - lSegmentstartInteger]
+
+	@staticmethod
+	def verschluesseleDatenstrom(pQuelleFile, pZielFile, pDateischluesselBytes, pDateinonceBytes, pHeaderBytes, pSegmentgroesseInteger, pIstAktivFunktion):
+		"""
+		Liest den Datenstrom pQuelleFile bis zu dessen Ende, verschlüsselt ihn segmentweise (Datensegmente ab Index 1) und
+		schreibt die Datensegmente sowie das abschließende Trailersegment in pZielFile
+		(LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM). Es wird jeweils nur ein Segment in einem
+		LiSWerkzeuge.SichererPuffer gehalten, der am Ende überschrieben wird.
+
+		:param pQuelleFile: Zum Lesen geöffneter Datenstrom (z.B. Standardeingabe)
+		:type pQuelleFile: File-Objekt
+		:param pZielFile: Zum Schreiben geöffneter Datenstrom (Position hinter dem Metadatensegment)
+		:type pZielFile: File-Objekt
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:param pIstAktivFunktion: Funktion, die angibt, ob die Verarbeitung fortgesetzt werden soll
+		:type pIstAktivFunktion: Callable
+		:return: Klartextlänge in Bytes
+		:rtype: int
+		"""
+		lSegmentIndexInteger = 1
+		lKlartextlaengeInteger = 0
+		with LiSWerkzeuge.SichererPuffer(pSegmentgroesseInteger) as lKlartextSichererPuffer:
+			while True:
+				if pIstAktivFunktion() is not True:
+					raise LiSAusnahmen.QProcessStoppedByUserError()
+				lKlartextMemoryview = Segmentwerkzeuge._liesInPuffer(pQuelleFile, lKlartextSichererPuffer.sMemoryview, pSegmentgroesseInteger)
+				if len(lKlartextMemoryview) > 0:
+					pZielFile.write(Segmentwerkzeuge.verschluesseleSegment(pDateischluesselBytes, pDateinonceBytes, lSegmentIndexInteger, False, pHeaderBytes, lKlartextMemoryview))
+					lSegmentIndexInteger += 1
+					lKlartextlaengeInteger += len(lKlartextMemoryview)
+				if len(lKlartextMemoryview) < pSegmentgroesseInteger:
+					break
+		pZielFile.write(Segmentwerkzeuge.verschluesseleSegment(pDateischluesselBytes, pDateinonceBytes, lSegmentIndexInteger, True, pHeaderBytes, struct.pack('>Q', lKlartextlaengeInteger)))
+		return lKlartextlaengeInteger
+
+	@staticmethod
+	def entschluesseleDatenstrom(pQuelleFile, pZielFile, pDateischluesselBytes, pDateinonceBytes, pHeaderBytes, pSegmentgroesseInteger, pIstAktivFunktion):
+		"""
+		Liest die Datensegmente und das Trailersegment (LiSKonstanten.C_VERFAHREN_AES_GCM_KENNUNG_V4_DATENSTROM) aus dem
+		Datenstrom pQuelleFile bis zu dessen Ende, authentifiziert und entschlüsselt sie und schreibt den Klartext in
+		pZielFile. Entschlüsselt wird am Ort in einem LiSWerkzeuge.SichererPuffer, der am Ende überschrieben wird. Es
+		werden ausschließlich authentifizierte Segmente geschrieben. Ein gekürzter oder verlängerter
+		Datenstrom wird jedoch erst am Trailersegment erkannt (cryptography.exceptions.InvalidTag bzw. ValueError), d.h.
+		der bis dahin geschriebene Klartext ist dann unvollständig.
+
+		:param pQuelleFile: Zum Lesen geöffneter Datenstrom (Position hinter dem Metadatensegment)
+		:type pQuelleFile: File-Objekt
+		:param pZielFile: Zum Schreiben geöffneter Datenstrom (z.B. Standardausgabe)
+		:type pZielFile: File-Objekt
+		:param pDateischluesselBytes: Dateischlüssel
+		:type pDateischluesselBytes: Bytesequenz
+		:param pDateinonceBytes: Dateinonce aus dem Header
+		:type pDateinonceBytes: Bytesequenz
+		:param pHeaderBytes: Vollständiger Header (AAD)
+		:type pHeaderBytes: Bytesequenz
+		:param pSegmentgroesseInteger: Klartextgröße eines Datensegments in Bytes
+		:type pSegmentgroesseInteger: int
+		:param pIstAktivFunktion: Funktion, die angibt, ob die Verarbeitung fortgesetzt werden soll
+		:type pIstAktivFunktion: Callable
+		:return: Klartextlänge in Bytes
+		:rtype: int
+		"""
+		lSegmentlaengeInteger = pSegmentgroesseInteger + LiSKonstanten.C_AES_GCM_TAG_LAENGE
+		lTrailerlaengeInteger = LiSKonstanten.C_AES_GCM_TRAILER_KLARTEXT_LAENGE + LiSKonstanten.C_AES_GCM_TAG_LAENGE
+		lSegmentIndexInteger = 1
+		lKlartextlaengeInteger = 0
+
+		# Das Ende des Datenstroms ist erst nach dem Lesen erkennbar, daher wird stets ein vollständiges Segment und die
+		# Länge des Trailersegments im Voraus gelesen (der vorausgelesene Teil wird anschließend an den Pufferanfang verschoben):
+		with LiSWerkzeuge.SichererPuffer(lSegmentlaengeInteger + lTrailerlaengeInteger) as lSichererPuffer:
+			lPufferMemoryview = lSichererPuffer.sMemoryview
+			lFuellstandInteger = len(Segmentwerkzeuge._liesInPuffer(pQuelleFile, lPufferMemoryview, lSegmentlaengeInteger + lTrailerlaengeInteger))
+			while lFuellstandInteger == lSegmentlaengeInteger + lTrailerlaengeInteger:
+				if pIstAktivFunktion() is not True:
+					raise LiSAusnahmen.QProcessStoppedByUserError()
+				pZielFile.write(Segmentwerkzeuge.entschluesseleSegmentAmOrt(pDateischluesselBytes, pDateinonceBytes, lSegmentIndexInteger, False, pHeaderBytes,
+																			lPufferMemoryview[:lSegmentlaengeInteger]))
+				lSegmentIndexInteger += 1
+				lKlartextlaengeInteger += pSegmentgroesseInteger
+				lPufferMemoryview[:lTrailerlaengeInteger] = lPufferMemoryview[lSegmentlaengeInteger:]
+				lFuellstandInteger = lTrailerlaengeInteger + len(Segmentwerkzeuge._liesInPuffer(pQuelleFile, lPufferMemoryview[lTrailerlaengeInteger:], lSegmentlaengeInteger))
+
+			if lFuellstandInteger < lTrailerlaengeInteger:
+				raise ValueError('Datenstrom endet vor dem Trailersegment.')
+			lTrailerstartInteger = lFuellstandInteger - lTrailerlaengeInteger
+			if lTrailerstartInteger > 0:
+				lKlartextMemoryview = Segmentwerkzeuge.entschluesseleSegmentAmOrt(pDateischluesselBytes, pDateinonceBytes, lSegmentIndexInteger, False, pHeaderBytes,
+																				  lPufferMemoryview[:lTrailerstartInteger])
+				pZielFile.write(lKlartextMemoryview)
+				lSegmentIndexInteger += 1
+				lKlartextlaengeInteger += len(lKlartextMemoryview)
+			lTrailerBytes = Segmentwerkzeuge.entschluesseleSegment(pDateischluesselBytes, pDateinonceBytes, lSegmentIndexInteger, True, pHeaderBytes,
+																   lPufferMemoryview[lTrailerstartInteger:lFuellstandInteger])
+		if struct.unpack('>Q', lTrailerBytes)[0] != lKlartextlaengeInteger:
+			raise ValueError('Klartextlänge passt nicht zum Trailersegment.')
+		return lKlartextlaengeInteger
+
+	## --- Interne Hilfsmethoden
+
+	@staticmethod
+	def _liesVollstaendig(pQuelleFile, pLaengeInteger):
+		"""
+		Interne Methode. Liest pLaengeInteger Bytes aus pQuelleFile und returniert sie. Weniger Bytes werden nur am Ende
+		des Datenstroms returniert (read() kann bei Pipes auch vorher weniger Bytes liefern).
+		"""
+		lTeileList = []
+		lVerbleibendInteger = pLaengeInteger
+		while lVerbleibendInteger > 0:
+			lTeilBytes = pQuelleFile.read(lVerbleibendInteger)
+			if not lTeilBytes:
+				break
+			lTeileList.append(lTeilBytes)
+			lVerbleibendInteger -= len(lTeilBytes)
+		return lTeileList[0] if len(lTeileList) == 1 else b''.join(lTeileList)
+
+	@staticmethod
+	def _liesInPuffer(pQuelleFile, pPuffer, pLaengeInteger):
+		"""
+		Interne Methode. Liest bis zu pLaengeInteger Bytes aus pQuelleFile in pPuffer und returniert den gefüllten Teil
+		als memoryview. Weniger Bytes werden nur am Ende des Datenstroms returniert.
+		"""
+		lPufferMemoryview = memoryview(pPuffer)[:pLaengeInteger]
+		lGelesenInteger = 0
+		while lGelesenInteger < pLaengeInteger:
+			lAnzahlInteger = pQuelleFile.readinto(lPufferMemoryview[lGelesenInteger:])
+			if not lAnzahlInteger:
+				break
+			lGelesenInteger += lAnzahlInteger
+		return lPufferMemoryview[:lGelesenInteger]
+
+	@staticmethod
+	def _verarbeiteDatensegmente(pLeseFunktion, pVerarbeitungsFunktion, pSchreibFunktion, pAnzahlSegmenteInteger, pIstAktivFunktion, pErsterSegmentIndexInteger, pPuffergroesseInteger):
+		"""
+		Interne Methode. Verarbeitet die Datensegmente sequentiell oder - ab LiSKonstanten.C_SEGMENTPIPELINE_MINDESTANZAHL_SEGMENTE
+		Segmenten - per LiSPipeline.Segmentpipeline (auch bei nur einem Prozessorkern, damit Datenträger und Prozessor
+		gleichzeitig arbeiten). Eingelesen wird in wiederverwendete Puffer (LiSWerkzeuge.SichererPuffer) der Größe
+		pPuffergroesseInteger, die am Ende überschrieben werden. Siehe LiSPipeline.Segmentpipeline.verarbeite(...) zur
+		Bedeutung der Parameter.
+		"""
+		if pAnzahlSegmenteInteger >= LiSKonstanten.C_SEGMENTPIPELINE_MINDESTANZAHL_SEGMENTE:
+			lAnzahlThreadsInteger = min(LiSKonstanten.C_SEGMENTPIPELINE_ANZAHL_THREADS, pAnzahlSegmenteInteger // LiSKonstanten.C_SEGMENTPIPELINE_MINDESTANZAHL_SEGMENTE)
+			LiSPipeline.Segmentpipeline(lAnzahlThreadsInteger).verarbeite(pLeseFunktion, pVerarbeitungsFunktion, pSchreibFunktion, pAnzahlSegmenteInteger, pIstAktivFunktion,
+																		  pErsterSegmentIndexInteger=pErsterSegmentIndexInteger, pPuffergroesseInteger=pPuffergroesseInteger)
+		else:
+			with LiSWerkzeuge.SichererPuffer(pPuffergroesseInteger) as lSichererPuffer:
+				for lSegmentIndexInteger in range(pErsterSegmentIndexInteger, pErsterSegmentIndexInteger + pAnzahlSegmenteInteger):
+					if pIstAktivFunktion() is True:
+						pSchreibFunktion(lSegmentIndexInteger, pVerarbeitungsFunktion(lSegmentIndexInteger, pLeseFunktion(lSegmentIndexInteger, lSichererPuffer.sMemoryview)))
+					else:
+						raise LiSAusnahmen.QProcessStoppedByUserError()
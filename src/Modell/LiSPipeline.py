@@ -0,0 +1,205 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält eine Pipeline zur parallelen Verarbeitung unabhängig authentifizierter Segmente innerhalb einer Datei.
+"""
+
+from Modell import LiSAusnahmen, LiSKonstanten
+from Sonstiges import LiSWerkzeuge
+
+import collections
+import queue
+import threading
+
+class Segmentpipeline:
+	"""
+	Modelliert eine Pipeline aus einem Lese-Thread, pAnzahlThreadsInteger Verarbeitungs-Threads (z.B. Ver- oder
+	Entschlüsselung einzelner Segmente) und einem Schreiber, der die Ergebnisse in der ursprünglichen Reihenfolge
+	ausgibt. Die Anzahl gleichzeitig im Speicher befindlicher Segmente ist durch pWarteschlangenlaengeInteger begrenzt.
+	Der Schreiber läuft im aufrufenden Thread, so dass Exceptions (auch aus Lese- und Verarbeitungs-Threads) dort
+	wie bei sequentieller Verarbeitung ankommen. Lesen, Verarbeiten und Schreiben überlappen sich auch mit nur einem
+	Verarbeitungs-Thread (Datenträger und Prozessor arbeiten gleichzeitig).
+	"""
+	def __init__(self, pAnzahlThreadsInteger=LiSKonstanten.C_SEGMENTPIPELINE_ANZAHL_THREADS, pWarteschlangenlaengeInteger=None):
+		"""
+		Initialisiert ein Objekt der Klasse Segmentpipeline.
+
+		:param pAnzahlThreadsInteger: Anzahl der Verarbeitungs-Threads
+		:type pAnzahlThreadsInteger: int
+		:param pWarteschlangenlaengeInteger: Maximale Anzahl gelesener, aber noch nicht geschriebener Segmente (Default: 2 * pAnzahlThreadsInteger)
+		:type pWarteschlangenlaengeInteger: int
+		"""
+		self.sAnzahlThreadsInteger = max(1, pAnzahlThreadsInteger)
+		self.sWarteschlangenlaengeInteger = pWarteschlangenlaengeInteger if pWarteschlangenlaengeInteger is not None else 2 * self.sAnzahlThreadsInteger
+		self.sStoppEvent = threading.Event()
+		self.sFreiePlaetzeSemaphore = threading.BoundedSemaphore(self.sWarteschlangenlaengeInteger)
+		self.sEingabeQueue = queue.Queue(maxsize=self.sWarteschlangenlaengeInteger)
+		self.sErgebnisseDictionary = dict()
+		self.sErgebnisseCondition = threading.Condition()
+		self.sExceptionInThread = None
+		self.sPuffergroesseInteger = None
+		self.sFreiePufferDeque = collections.deque()
+		self.sPufferList = [] # Alle angelegten Eingabepuffer (werden am Ende von verarbeite(...) überschrieben)
+
+	def verarbeite(self, pLeseFunktion, pVerarbeitungsFunktion, pSchreibFunktion, pAnzahlSegmenteInteger, pIstAktivFunktion, pErsterSegmentIndexInteger=1, pPuffergroesseInteger=None):
+		"""
+		Verarbeitet die Segmente pErsterSegmentIndexInteger bis pErsterSegmentIndexInteger + pAnzahlSegmenteInteger - 1.
+		pLeseFunktion(Index) wird sequentiell im Lese-Thread, pVerarbeitungsFunktion(Index, Bytes) parallel in den
+		Verarbeitungs-Threads und pSchreibFunktion(Index, Bytes) sequentiell und geordnet im aufrufenden Thread ausgeführt.
+		Returniert pIstAktivFunktion() False, wird die Verarbeitung mit LiSAusnahmen.QProcessStoppedByUserError abgebrochen.
+
+		Ist pPuffergroesseInteger angegeben, werden höchstens pWarteschlangenlaengeInteger Eingabepuffer
+		(LiSWerkzeuge.SichererPuffer) angelegt und wiederverwendet: pLeseFunktion(Index, Puffer) liest in den Puffer
+		(memoryview) und returniert die gelesenen Daten. Ein Puffer wird erst nach pSchreibFunktion erneut vergeben, das
+		Ergebnis darf daher auf den Puffer verweisen (z.B. bei Entschlüsselung am Ort). Am Ende werden alle Puffer
+		überschrieben und freigegeben.
+
+		:param pLeseFunktion: Funktion, die die Eingabedaten eines Segments liefert
+		:type pLeseFunktion: Callable
+		:param pVerarbeitungsFunktion: Funktion, die die Eingabedaten eines Segments verarbeitet
+		:type pVerarbeitungsFunktion: Callable
+		:param pSchreibFunktion: Funktion, die das Ergebnis eines Segments ausgibt
+		:type pSchreibFunktion: Callable
+		:param pAnzahlSegmenteInteger: Anzahl der zu verarbeitenden Segmente
+		:type pAnzahlSegmenteInteger: int
+		:param pIstAktivFunktion: Funktion, die angibt, ob die Verarbeitung fortgesetzt werden soll
+		:type pIstAktivFunktion: Callable
+		:param pErsterSegmentIndexInteger: Index des ersten zu verarbeitenden Segments
+		:type pErsterSegmentIndexInteger: int
+		:param pPuffergroesseInteger: Größe der wiederverwendeten Eingabepuffer in Bytes (None: pLeseFunktion(Index) liefert neue Bytesequenzen)
+		:type pPuffergroesseInteger: int
+		"""
+		self.sPuffergroesseInteger = pPuffergroesseInteger
+		lEndeIndexInteger = pErsterSegmentIndexInteger + pAnzahlSegmenteInteger
+		lThreadsList = [threading.Thread(target=self._lese, args=(pLeseFunktion, pErsterSegmentIndexInteger, lEndeIndexInteger), daemon=True)]
+		lThreadsList.extend(threading.Thread(target=self._verarbeite, args=(pVerarbeitungsFunktion,), daemon=True) for lZaehlerInteger in range(self.sAnzahlThreadsInteger))
+		for lThread in lThreadsList:
+			lThread.start()
+		try:
+			for lSegmentIndexInteger in range(pErsterSegmentIndexInteger, lEndeIndexInteger):
+				if pIstAktivFunktion() is not True:
+					raise LiSAusnahmen.QProcessStoppedByUserError()
+				lErgebnisBytes, lPuffer = self._warteAufErgebnis(lSegmentIndexInteger)
+				pSchreibFunktion(lSegmentIndexInteger, lErgebnisBytes)
+				if lPuffer is not None:
+					self.sFreiePufferDeque.append(lPuffer)
+				self.sFreiePlaetzeSemaphore.release()
+		finally:
+			self.sStoppEvent.set()
+			with self.sErgebnisseCondition:
+				self.sErgebnisseCondition.notify_all()
+			for lThread in lThreadsList:
+				lThread.join()
+			self.sErgebnisseDictionary.clear()
+			self.sFreiePufferDeque.clear()
+			for lPuffer in self.sPufferList:
+				lPuffer.schliesse()
+			self.sPufferList.clear()
+
+	## --- Interne Methoden der Pipeline-Stufen
+
+	def _lese(self, pLeseFunktion, pErsterSegmentIndexInteger, pEndeIndexInteger):
+		"""
+		Interne Methode (Lese-Thread). Liest die Segmente sequentiell und übergibt sie an die Verarbeitungs-Threads.
+		"""
+		try:
+			for lSegmentIndexInteger in range(pErsterSegmentIndexInteger, pEndeIndexInteger):
+				while not self.sFreiePlaetzeSemaphore.acquire(timeout=0.1):
+					if self.sStoppEvent.is_set():
+						return
+				if self.sStoppEvent.is_set():
+					return
+				if self.sPuffergroesseInteger is None:
+					self._legeInEingabeQueue((lSegmentIndexInteger, pLeseFunktion(lSegmentIndexInteger), None))
+				else:
+					lPuffer = self._holePuffer()
+					self._legeInEingabeQueue((lSegmentIndexInteger, pLeseFunktion(lSegmentIndexInteger, lPuffer.sMemoryview), lPuffer))
+		except BaseException as lException:
+			self._merkeException(lException)
+		finally:
+			for lZaehlerInteger in range(self.sAnzahlThreadsInteger):
+				self._legeInEingabeQueue(None)
+
+	def _verarbeite(self, pVerarbeitungsFunktion):
+		"""
+		Interne Methode (Verarbeitungs-Thread). Verarbeitet Segmente, bis das Ende der Eingabe signalisiert wird.
+		"""
+		while not self.sStoppEvent.is_set():
+			try:
+				lEintragTuple = self.sEingabeQueue.get(timeout=0.1)
+			except queue.Empty:
+				continue
+			if lEintragTuple is None:
+				return
+			lSegmentIndexInteger, lEingabeBytes, lPuffer = lEintragTuple
+			try:
+				lErgebnisBytes = pVerarbeitungsFunktion(lSegmentIndexInteger, lEingabeBytes)
+			except BaseException as lException:
+				self._merkeException(lException)
+				return
+			with self.sErgebnisseCondition:
+				self.sErgebnisseDictionary[lSegmentIndexInteger] = (lErgebnisBytes, lPuffer)
+				self.sErgebnisseCondition.notify_all()
+
+	def _warteAufErgebnis(self, pSegmentIndexInteger):
+		"""
+		Interne Methode (Schreiber). Wartet auf das Ergebnis zu Segment pSegmentIndexInteger und returniert es zusammen
+		mit dem zugehörigen Eingabepuffer (oder None). Ist in einem anderen Thread eine Exception aufgetreten, wird diese
+		hier erneut geworfen.
+		"""
+		with self.sErgebnisseCondition:
+			while pSegmentIndexInteger not in self.sErgebnisseDictionary:
+				if self.sExceptionInThread is not None:
+					raise self.sExceptionInThread
+				self.sErgebnisseCondition.wait(timeout=0.1)
+			return self.sErgebnisseDictionary.pop(pSegmentIndexInteger)
+
+	def _holePuffer(self):
+		"""
+		Interne Methode (Lese-Thread). Returniert einen freien Eingabepuffer. Neue Puffer werden nur angelegt, solange
+		weniger als pWarteschlangenlaengeInteger Segmente gleichzeitig in Bearbeitung sind.
+		"""
+		try:
+			return self.sFreiePufferDeque.pop()
+		except IndexError:
+			lPuffer = LiSWerkzeuge.SichererPuffer(self.sPuffergroesseInteger)
+			self.sPufferList.append(lPuffer)
+			return lPuffer
+
+	def _legeInEingabeQueue(self, pEintragTuple):
+		"""
+		Interne Methode. Legt pEintragTuple in die Eingabe-Queue, ohne nach einem Stopp dauerhaft zu blockieren.
+		"""
+		while True:
+			try:
+				self.sEingabeQueue.put(pEintragTuple, timeout=0.1)
+				return
+			except queue.Full:
+				if self.sStoppEvent.is_set():
+					return
+
+	def _merkeException(self, pException):
+		"""
+		Interne Methode. Merkt sich die erste in einem Pipeline-Thread aufgetretene Exception und stoppt die Pipeline.
+		"""
+		with self.sErgebnisseCondition:
+			if self.sExceptionInThread is None:
+				self.sExceptionInThread = pException
+			self.sStoppEvent.set()
+			self.sErgebnisseCondition.notify_all()
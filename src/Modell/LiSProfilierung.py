@@ -0,0 +1,192 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält die Profilierung einer Programmfunktion (cProfile und optional tracemalloc) für die Diagnose
+von Laufzeit- und Speicherproblemen, auch bei paketierten Versionen.
+"""
+
+from Modell import LiSAusnahmen, LiSKonstanten
+
+import cProfile
+import datetime
+import logging
+import os
+import pstats
+import sys
+import sysconfig
+import tracemalloc
+
+class Profilierung:
+	"""
+	Stellt statische Methoden zur Profilierung einer Programmfunktion zur Verfügung. Bei aktivierter Profilierung wird
+	die Programmfunktion unter cProfile ausgeführt und das Profil als LiSKonstanten.C_PROFIL_DATEINAME (pstats-Format,
+	z.B. für snakeviz oder 'python -m pstats') geschrieben. Mit Art 'memory' werden zusätzlich per tracemalloc die
+	Programmstellen mit den größten Speicherallokationen in LiSKonstanten.C_PROFIL_SPEICHER_DATEINAME protokolliert.
+	Beide Dateien werden bei jedem Durchlauf überschrieben.
+
+	cProfile erfasst nur den Thread, der die Programmfunktion ausführt (nicht die Threads der Segmentpipeline, deren
+	Verarbeitung dort als Wartezeit erscheint); tracemalloc erfasst alle Threads.
+
+	Profile und Bericht enthalten ausschließlich Funktionsnamen, Zeilennummern, Zeiten und Speichergrößen, niemals
+	Aufrufparameter oder Speicherinhalte. Pfade zu Quelltextdateien werden auf den Teil unterhalb des Programm- bzw.
+	Python-Verzeichnisses gekürzt, damit keine Benutzer- oder Installationsverzeichnisse enthalten sind.
+	"""
+	C_ART_CPU = 'cpu'
+	C_ART_SPEICHER = 'memory'
+
+	_sArtString = None
+
+	def __init__(self):
+		if type(self) is Profilierung:
+			raise LiSAusnahmen.QAbstractClassError('Profilierung kann nicht instanziiert werden.')
+
+	@staticmethod
+	def aktiviere(pArtString=C_ART_CPU):
+		"""
+		Aktiviert die Profilierung.
+
+		:param pArtString: Profilierung.C_ART_CPU (nur cProfile) oder Profilierung.C_ART_SPEICHER (zusätzlich tracemalloc)
+		:type pArtString: String
+		"""
+		if pArtString not in (Profilierung.C_ART_CPU, Profilierung.C_ART_SPEICHER):
+			raise ValueError('Unbekannte Art der Profilierung: ' + str(pArtString))
+		Profilierung._sArtString = pArtString
+
+	@staticmethod
+	def istAktiv():
+		"""
+		Returniert True, falls die Profilierung aktiviert ist.
+
+		:return: Aktivierungszustand
+		:rtype: Boolean
+		"""
+		return Profilierung._sArtString is not None
+
+	@staticmethod
+	def fuehreAus(pFunktion):
+		"""
+		Ruft pFunktion auf - bei aktivierter Profilierung unter cProfile (und ggf. tracemalloc) - und schreibt
+		anschließend Profil und Speicherbericht. Fehler beim Schreiben werden protokolliert, aber nicht weitergereicht.
+
+		:param pFunktion: Auszuführende Funktion (ohne Parameter)
+		:type pFunktion: Callable
+		:return: Rückgabewert von pFunktion
+		"""
+		lArtString = Profilierung._sArtString
+		if lArtString is None:
+			return pFunktion()
+
+		lTracemallocGestartetBoolean = False
+		if lArtString == Profilierung.C_ART_SPEICHER and not tracemalloc.is_tracing():
+			tracemalloc.start(LiSKonstanten.C_PROFIL_TRACEMALLOC_RAHMEN)
+			lTracemallocGestartetBoolean = True
+		lProfil = cProfile.Profile()
+		try:
+			return lProfil.runcall(pFunktion)
+		finally:
+			try:
+				if lTracemallocGestartetBoolean is True: # Momentaufnahme vor der Aufbereitung des Profils
+					lSpitzeInteger = tracemalloc.get_traced_memory()[1]
+					lMomentaufnahme = tracemalloc.take_snapshot()
+					tracemalloc.stop()
+					Profilierung._schreibeSpeicherbericht(lMomentaufnahme, lSpitzeInteger, LiSKonstanten.C_PROFIL_SPEICHER_DATEINAME)
+				Profilierung._schreibeProfil(lProfil, LiSKonstanten.C_PROFIL_DATEINAME)
+			except OSError:
+				logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Fehler beim Schreiben des Profils')
+			finally:
+				if lTracemallocGestartetBoolean is True and tracemalloc.is_tracing():
+					tracemalloc.stop()
+
+	## --- Interne Methoden
+
+	@staticmethod
+	def _schreibeProfil(pProfil, pDateinameString):
+		"""
+		Interne Methode. Schreibt das Profil pProfil mit gekürzten Pfaden im pstats-Format in die Datei pDateinameString.
+		"""
+		lStatistik = pstats.Stats(pProfil)
+		lBereinigteStatistikDictionary = dict()
+		for lSchluesselTuple, (lPrimitiveAufrufeInteger, lAufrufeInteger, lEigenzeitFloat, lGesamtzeitFloat, lAufruferDictionary) in lStatistik.stats.items():
+			lBereinigteAufruferDictionary = dict()
+			for lAufruferTuple, lWerteTuple in lAufruferDictionary.items():
+				lAufruferTuple = Profilierung._bereinigeSchluessel(lAufruferTuple)
+				lBisherTuple = lBereinigteAufruferDictionary.get(lAufruferTuple)
+				lBereinigteAufruferDictionary[lAufruferTuple] = lWerteTuple if lBisherTuple is None else Profilierung._addiere(lBisherTuple, lWerteTuple)
+			lSchluesselTuple = Profilierung._bereinigeSchluessel(lSchluesselTuple)
+			lBisherTuple = lBereinigteStatistikDictionary.get(lSchluesselTuple)
+			if lBisherTuple is not None: # Gleichnamige Funktionen in gleichnamigen Dateien unterschiedlicher Verzeichnisse zusammenfassen
+				for lAufruferTuple, lWerteTuple in lBisherTuple[4].items():
+					lNeuTuple = lBereinigteAufruferDictionary.get(lAufruferTuple)
+					lBereinigteAufruferDictionary[lAufruferTuple] = lWerteTuple if lNeuTuple is None else Profilierung._addiere(lNeuTuple, lWerteTuple)
+				lPrimitiveAufrufeInteger += lBisherTuple[0]
+				lAufrufeInteger += lBisherTuple[1]
+				lEigenzeitFloat += lBisherTuple[2]
+				lGesamtzeitFloat += lBisherTuple[3]
+			lBereinigteStatistikDictionary[lSchluesselTuple] = (lPrimitiveAufrufeInteger, lAufrufeInteger, lEigenzeitFloat, lGesamtzeitFloat, lBereinigteAufruferDictionary)
+		lStatistik.stats = lBereinigteStatistikDictionary
+		lStatistik.dump_stats(pDateinameString)
+
+	@staticmethod
+	def _schreibeSpeicherbericht(pMomentaufnahme, pSpitzeInteger, pDateinameString):
+		"""
+		Interne Methode. Schreibt die LiSKonstanten.C_PROFIL_ANZAHL_ALLOKATIONSSTELLEN Aufrufketten mit den größten
+		(am Ende noch belegten) Speicherallokationen sowie die Spitzenbelegung in die Datei pDateinameString.
+		"""
+		lMomentaufnahme = pMomentaufnahme.filter_traces((tracemalloc.Filter(False, tracemalloc.__file__),))
+		lStatistikenList = lMomentaufnahme.statistics('traceback')
+		with open(pDateinameString, 'w', encoding='utf-8') as lBerichtsdatei:
+			lBerichtsdatei.write('LiSCrypt ' + LiSKonstanten.__version__ + ', ' + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + '\n')
+			lBerichtsdatei.write('Spitzenbelegung (tracemalloc): ' + str(pSpitzeInteger // 1024) + ' KiB\n')
+			lBerichtsdatei.write('Belegt am Ende: ' + str(sum(lStatistik.size for lStatistik in lStatistikenList) // 1024) + ' KiB\n')
+			for lRangInteger, lStatistik in enumerate(lStatistikenList[:LiSKonstanten.C_PROFIL_ANZAHL_ALLOKATIONSSTELLEN], 1):
+				lBerichtsdatei.write('\n#' + str(lRangInteger) + ': ' + str(lStatistik.size // 1024) + ' KiB in ' + str(lStatistik.count) + ' Blöcken\n')
+				for lRahmen in lStatistik.traceback:
+					lBerichtsdatei.write('    ' + Profilierung._bereinigePfad(lRahmen.filename) + ':' + str(lRahmen.lineno) + '\n')
+
+	@staticmethod
+	def _addiere(pErstesTuple, pZweitesTuple):
+		"""
+		Interne Methode. Returniert die elementweise Summe zweier Tupel von Aufrufzahlen und Zeiten.
+		"""
+		return tuple(lErsterWert + lZweiterWert for lErsterWert, lZweiterWert in zip(pErstesTuple, pZweitesTuple))
+
+	@staticmethod
+	def _bereinigeSchluessel(pSchluesselTuple):
+		"""
+		Interne Methode. Returniert den pstats-Schlüssel (Datei, Zeile, Funktion) mit gekürztem Pfad.
+		"""
+		return (Profilierung._bereinigePfad(pSchluesselTuple[0]),) + tuple(pSchluesselTuple[1:])
+
+	@staticmethod
+	def _bereinigePfad(pDateinameString):
+		"""
+		Interne Methode. Kürzt den Pfad pDateinameString auf den Teil unterhalb des Programmverzeichnisses bzw. der
+		Python-Bibliotheksverzeichnisse; andere Pfade werden auf den Dateinamen gekürzt. Pseudodateien wie '~' oder
+		'<frozen ...>' bleiben unverändert.
+		"""
+		if pDateinameString in ('~', '') or pDateinameString.startswith('<'):
+			return pDateinameString
+		lPfadString = os.path.normcase(os.path.abspath(pDateinameString))
+		lBasisverzeichnisseList = [os.path.dirname(os.path.dirname(os.path.abspath(__file__)))]
+		lBasisverzeichnisseList.extend(sysconfig.get_paths().get(lSchluesselString) for lSchluesselString in ('purelib', 'platlib', 'stdlib', 'platstdlib'))
+		lBasisverzeichnisseList.append(getattr(sys, '_MEIPASS', None))
+		for lBasisverzeichnisString in sorted((os.path.normcase(os.path.abspath(lVerzeichnisString)) for lVerzeichnisString in lBasisverzeichnisseList if lVerzeichnisString), key=len, reverse=True):
+			if lPfadString.startswith(lBasisverzeichnisString + os.sep):
+				return lPfadString[len(lBasisverzeichnisString) + 1:].replace(os.sep, '/')
+		return os.path.basename(lPfadString)
@@ -19,141 +19,161 @@
 """Dieses Modul enthält Klassen und statische Methoden zur Verhinderung eines Merhfachstarts von LiSCrypt."""
 
 from Modell import LiSKonfiguration, LiSKonstanten
+from Modell.LiSUebergabe import Nachrichtenprotokoll, Nachrichtenempfaenger # Auch als LiSSingleton.Nachrichtenprotokoll verwendet
 
 from PyQt5 import QtCore
 
-import psutil
+import os
+import selectors
 import socket
-import struct
 import yaml
 
-class LiSCryptProzesse:
+if LiSKonstanten.C_PLATTFORM == 'nt':
+	import msvcrt
+else:
+	import fcntl
+
+class Instanzsperre:
 	"""
-	Stellt eine statische Methode zur Identifikation aktiver LiSCrypt-Prozesse zur Verfügung
+	Modelliert die Sperre, deren Inhaber die Master-Instanz ist. Verwendet wird eine exklusive, nicht blockierende
+	Sperre auf die Datei LiSKonstanten.C_INSTANZSPERRE_DATEINAME (POSIX: fcntl.flock, Windows: msvcrt.locking). Das
+	Betriebssystem gibt die Sperre bei Prozessende (auch bei Absturz) frei, so dass keine verwaisten Sperren entstehen.
+	Der Aufwand ist unabhängig von der Anzahl laufender Prozesse.
 	"""
-	@staticmethod
-	def ermittleAnzahlLaufenderLiSCryptProzesse():
+	def __init__(self, pErweiterterPfadZuSperrdateiString=LiSKonstanten.C_INSTANZSPERRE_DATEINAME):
 		"""
-		Ermittelt die Anzahl aktiver Prozesse mit Namensbestandteil 'liscrypt' und ggf. 'iqb' (Vergleiche sind case
-		insensitive) in Abhängigkeit von LiSKonstanten.C_IQB_VERSION
+		Initialisiert ein Objekt der Klasse Instanzsperre.
 
-		:return: Anzahl aktiver Prozesse mit Namensbestandteil 'liscrypt' und ggf. 'iqb' (Vergleiche sind case
-		insensitive) in Abhängigkeit von LiSKonstanten.C_IQB_VERSION
-		:rtype: Integer
+		:param pErweiterterPfadZuSperrdateiString: Erweiterte Pfadangabe zur Sperrdatei
+		:type pErweiterterPfadZuSperrdateiString: String
+		"""
+		self.sErweiterterPfadZuSperrdateiString = pErweiterterPfadZuSperrdateiString
+		self.sSperrdatei = None
+
+	def erwirb(self):
 		"""
-		lAnzahlLiSCryptProzesseInteger = 0
-		for lProzess in psutil.process_iter(['name']):
-			if LiSKonstanten.C_IQB_VERSION is False:
-				if 'liscrypt' in str.lower(lProzess.info['name']) and 'iqb' not in str.lower(lProzess.info['name']):
-					lAnzahlLiSCryptProzesseInteger += 1
+		Versucht, die Sperre (ohne zu warten) zu erwerben.
+
+		:return: True, wenn die Sperre erworben wurde (bzw. bereits gehalten wird), False, wenn ein anderer Prozess sie hält
+		:rtype: Boolean
+		"""
+		if self.sSperrdatei is not None:
+			return True
+		os.makedirs(os.path.dirname(self.sErweiterterPfadZuSperrdateiString), exist_ok=True)
+		lSperrdatei = open(self.sErweiterterPfadZuSperrdateiString, 'a+b')
+		try:
+			if LiSKonstanten.C_PLATTFORM == 'nt':
+				lSperrdatei.seek(0)
+				msvcrt.locking(lSperrdatei.fileno(), msvcrt.LK_NBLCK, 1)
 			else:
-				if 'liscrypt' in str.lower(lProzess.info['name']) and 'iqb'  in str.lower(lProzess.info['name']):
-					lAnzahlLiSCryptProzesseInteger += 1
-		return lAnzahlLiSCryptProzesseInteger
+				fcntl.flock(lSperrdatei.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+		except OSError: # Sperre wird von einem anderen Prozess gehalten
+			lSperrdatei.close()
+			return False
+		self.sSperrdatei = lSperrdatei
+		return True
+
+	def gibFrei(self):
+		"""
+		Gibt eine erworbene Sperre frei.
+		"""
+		if self.sSperrdatei is not None:
+			try:
+				if LiSKonstanten.C_PLATTFORM == 'nt':
+					self.sSperrdatei.seek(0)
+					msvcrt.locking(self.sSperrdatei.fileno(), msvcrt.LK_UNLCK, 1)
+				else:
+					fcntl.flock(self.sSperrdatei.fileno(), fcntl.LOCK_UN)
+			finally:
+				self.sSperrdatei.close()
+				self.sSperrdatei = None
+
+	def istErworben(self):
+		"""
+		Returniert, ob die Sperre von dieser Instanz gehalten wird.
+
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return self.sSperrdatei is not None
+
+C_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+"""Sicherer YAML-Loader (LibYAML-Variante, falls verfügbar)"""
+C_YAML_DUMPER = getattr(yaml, 'CDumper', yaml.Dumper)
+"""YAML-Dumper (LibYAML-Variante, falls verfügbar)"""
 
 class QServer(QtCore.QThread):
 	"""
-	Ein lokaler Server, der Befehle zur Steuerung von LiSCrypt entgegennehmen kann.
+	Ein lokaler Server, der Befehle zur Steuerung von LiSCrypt entgegennehmen kann. Alle Verbindungen werden in einer
+	einzigen ereignisgesteuerten Schleife (selectors) im Serverthread bedient.
 	"""
 	C_LISTENEMPFANG_SIGNAL = QtCore.pyqtSignal(list)
 
-	class QVerbindungMitClient(QtCore.QThread):
+	class Clientverbindung:
 		"""
-		Eine nebenläufige Verbindung zu einem Client, die Befehle zur Steuerung von LiSCrypt von einem bestimmten Client
-		entgegennehmen kann.
+		Eine Verbindung zu einem Client, die Befehle zur Steuerung von LiSCrypt von einem bestimmten Client
+		entgegennehmen kann. Modelliert den Protokollablauf als Zustandsautomaten.
 		"""
-		# PyQt-Signale zur Interaktion mit QController
-		C_LISTENEMPFANG_SIGNAL = QtCore.pyqtSignal(list)
-
-		def __init__(self, pClientSocket, pClientVerbindungenVonServerList):
+		def __init__(self, pClientSocket):
 			"""
-			Initialisiert ein Objekt der Klasse QVerbindungMitClient.
+			Initialisiert ein Objekt der Klasse Clientverbindung und sendet die Identifikationskennung des Servers.
 
 			:param pClientSocket: Der Verbindung zum Client zugeordnete Socket
 			:type pClientSocket: Socket
-			:param pClientVerbindungenVonServerList: Liste aller Clientverbindungen des Servers
-			:type pClientVerbindungenVonServerList: Liste von Strings
 			"""
-			super(QServer.QVerbindungMitClient, self).__init__()
-			self.sAktivBoolean = False
 			self.sClientSocket = pClientSocket
-			self.sClientVerbindungenVonServerList = pClientVerbindungenVonServerList
-			self.sClientVerbindungenVonServerList.append(self)
+			self.sClientSocket.settimeout(LiSKonstanten.C_IPC_ZEITLIMIT) # Nur für das Senden relevant, da nur bei Empfangsbereitschaft gelesen wird
+			self.sNachrichtenempfaenger = Nachrichtenempfaenger()
 			self.sStatusString = 'verbunden'
+			Nachrichtenprotokoll.sendeNachricht(self.sClientSocket, b'+LISCRYPT_SERVER')
 
-		def run(self):
-			"""
-			Überschriebene Methode der Oberklasse QtCore.QThread. Wird durch QThread.start automatisch aufgerufen.
+		def verarbeiteEmpfangsbereitschaft(self):
 			"""
-			self.sAktivBoolean = True
-			self.sendeNachricht(b'+LISCRYPT_SERVER')
-			lIdentifikationVonClientBytes = self.empfangeNachricht()
+			Empfängt verfügbare Daten des Clients und führt ggf. den nächsten Protokollschritt aus.
 
-			if lIdentifikationVonClientBytes == b'+LISCRYPT_CLIENT':
+			:return: Aufrufparameterliste des Clients, falls diese vollständig und zulässig empfangen wurde, sonst None
+			:rtype: Liste von Strings
+			"""
+			lNachrichtBytes = self.sNachrichtenempfaenger.empfange(self.sClientSocket)
+			if lNachrichtBytes is None:
+				return None
+			lAufrufParameterlisteList = None
+			if self.sStatusString == 'verbunden' and lNachrichtBytes == b'+LISCRYPT_CLIENT':
 				self.sStatusString = 'legitimiert'
-				self.sendeNachricht(b'+LIST')
-				lAufrufParameterlisteBytes = self.empfangeNachricht()
-				lAufrufParameterlisteList = yaml.load(lAufrufParameterlisteBytes.decode(),Loader=yaml.SafeLoader)
-				# Whitelisting der ersten drei Aufrufparameter
-				if lAufrufParameterlisteList[0] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['logging'] \
-					and lAufrufParameterlisteList[1] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['action'] \
-					and lAufrufParameterlisteList[2] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['originals'] \
-					and	lAufrufParameterlisteList[3] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['keytype']:
-					self.C_LISTENEMPFANG_SIGNAL.emit(lAufrufParameterlisteList)
+				Nachrichtenprotokoll.sendeNachricht(self.sClientSocket, b'+LIST')
+				return None
+			elif self.sStatusString == 'legitimiert':
+				if Nachrichtenprotokoll.istArgumentnachricht(lNachrichtBytes) is True: # Unausgewertete Kommandozeilenargumente (LiSStarter)
+					lAufrufParameterlisteList = LiSKonfiguration.Konfiguration.ermittleAufrufparameterAusArgumenten(Nachrichtenprotokoll.dekodiereArgumente(lNachrichtBytes))
+				else:
+					lAufrufParameterlisteList = yaml.load(lNachrichtBytes, Loader=C_YAML_LOADER)
+				# Whitelisting der ersten vier Aufrufparameter
+				if not (isinstance(lAufrufParameterlisteList, list) and len(lAufrufParameterlisteList) >= 4
+						and lAufrufParameterlisteList[0] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['logging']
+						and lAufrufParameterlisteList[1] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['action']
+						and lAufrufParameterlisteList[2] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['originals']
+						and	lAufrufParameterlisteList[3] in LiSKonstanten.C_AUFRUFPARAMETER_WHITELISTS['keytype']
+						and all(isinstance(lEintragString, str) for lEintragString in lAufrufParameterlisteList[4:])):
+					lAufrufParameterlisteList = None
 			self.sStatusString = 'geschlossen'
-			self.sendeNachricht(b'+BYE')
-			self.sClientSocket.close()
-			self.stop()
+			Nachrichtenprotokoll.sendeNachricht(self.sClientSocket, b'+BYE' if lAufrufParameterlisteList is not None else b'+NAK')
+			return lAufrufParameterlisteList
 
-		def istAktiv(self):
+		def istGeschlossen(self):
 			"""
-			Returniert den Wert des Attributs sAktivBoolean, welches angibt, ob die nebenläufige Verbindung zu einem
-			Client noch aktiv ist.
+			Returniert, ob der Protokollablauf abgeschlossen ist.
 
-			:return: Wert des Attributs sAktivBoolean
+			:return: Ergebnis
 			:rtype: Boolean
 			"""
-			return self.sAktivBoolean
-
-		def stop(self):
-			"""
-			Veranlasst den Stopp der nebenläufigen Verbindung zu einem Client durch Setzen des Werts des Attributs
-			sAktivBoolean auf False und entfernt die Instanz aus der Liste der Client-Verbindungen des Servers.
-			"""
-			self.sAktivBoolean = False
-			if self in self.sClientVerbindungenVonServerList:
-				self.sClientVerbindungenVonServerList.remove(self)
-
-		def sendeNachricht(self, pNachrichtBytes):
-			"""
-			Sende pNachrichtBytes zum Client, der über diese Instanz von QClientVerbindung mit dem Server verbunden ist.
-
-			:param pNachrichtBytes: Zu sendende Nachricht
-			:type pNachrichtBytes: Bytesequenz
-			"""
-			lLaengeDerNachrichtInteger = len(pNachrichtBytes)
-			self.sClientSocket.sendall(struct.pack('>Q', lLaengeDerNachrichtInteger) + pNachrichtBytes)
+			return self.sStatusString == 'geschlossen'
 
-		def empfangeNachricht(self):
+		def schliesse(self):
 			"""
-			Blockierende Methode, die eine Nachricht des Servers empfängt, diese in Längenangabe und Inhaltsteil zerlegt
-			und den Inhaltsteil returniert. Wurde die Instanz von QVerbindungMitVlient zwischenzeitlich gestoppt,
-			liefert die Methode None zurück.
-
-			:return: Inhaltsteil der empfangenenen Nachricht
-			:rtype: Bytesequenz
+			Schließt die Verbindung zum Client.
 			"""
-			lLaengeDerNachrichtBytes = b''
-			while len(lLaengeDerNachrichtBytes) < 8 and self.sAktivBoolean is True:
-				lLaengeDerNachrichtBytes += self.sClientSocket.recv(1)
-			lLaengeDerNachrichtInteger = struct.unpack('>Q',lLaengeDerNachrichtBytes)[0]
-			lNachrichtBytes = b''
-			while len(lNachrichtBytes) < lLaengeDerNachrichtInteger and self.sAktivBoolean is True:
-				lNachrichtBytes += self.sClientSocket.recv(1)
-			if self.sAktivBoolean is True:
-				return lNachrichtBytes
-			else:
-				return None
+			self.sStatusString = 'geschlossen'
+			self.sClientSocket.close()
 
 	def __init__(self):
 		"""
@@ -161,29 +181,70 @@ class QServer(QtCore.QThread):
 		"""
 		super(QServer, self).__init__()
 		self.sAktivBoolean = False
-		self.sServerSocket = socket.socket()
-		self.sServerSocket.bind(('127.0.0.1', 0))
-		self.sPortInteger = self.sServerSocket.getsockname()[1]
-		self.sServerSocket.listen()
-		self.sClientVerbindungen = []
+		self.sServerSocket = Nachrichtenprotokoll.erzeugeServerSocket()
+		self.sPortInteger = self.sServerSocket.getsockname()[1] if Nachrichtenprotokoll.nutztUnixSocket() is False else None
 
 	def run(self):
 		"""
 		Überschriebene Methode der Oberklasse QtCore.QThread. Wird durch QThread.start automatisch aufgerufen.
 		"""
 		self.sAktivBoolean = True
-		while self.sAktivBoolean is True:
-			lClientSocket, lIPAdresse = self.sServerSocket.accept()  # Verbindung mit Client herstellen.
-			lVerbindungMitClient = QServer.QVerbindungMitClient(lClientSocket, self.sClientVerbindungen)
-			lVerbindungMitClient.start()
-			lVerbindungMitClient.C_LISTENEMPFANG_SIGNAL.connect(self._emittiereListenEmpfangssignal)
-
-		for lVerbindung in self.sClientVerbindungen:
-			lVerbindung.stop()
+		lSelektor = selectors.DefaultSelector()
+		lSelektor.register(self.sServerSocket, selectors.EVENT_READ, None)
+		try:
+			while self.sAktivBoolean is True:
+				for lSchluessel, lEreignisInteger in lSelektor.select(timeout=LiSKonstanten.C_IPC_SERVER_PRUEFINTERVALL):
+					if lSchluessel.data is None:
+						self._nimmVerbindungAn(lSelektor)
+					else:
+						self._bedieneVerbindung(lSelektor, lSchluessel.data)
+		finally:
+			for lSchluessel in list(lSelektor.get_map().values()):
+				if lSchluessel.data is not None:
+					lSchluessel.data.schliesse()
+			lSelektor.close()
+			self.sServerSocket.close()
+			if Nachrichtenprotokoll.nutztUnixSocket() is True and not LiSKonstanten.C_IPC_SOCKET_ADRESSE.startswith('\0'):
+				try:
+					os.unlink(LiSKonstanten.C_IPC_SOCKET_ADRESSE)
+				except OSError:
+					pass
+
+	def _nimmVerbindungAn(self, pSelektor):
+		"""
+		Interne Methode. Nimmt eine wartende Verbindung an und registriert sie beim Selektor.
+		"""
+		try:
+			lClientSocket, lAdresse = self.sServerSocket.accept()
+		except (BlockingIOError, InterruptedError):
+			return
+		try:
+			if Nachrichtenprotokoll.istGleicherBenutzer(lClientSocket) is False:
+				raise ConnectionError('Verbindung eines anderen Benutzers abgewiesen.')
+			lVerbindungMitClient = QServer.Clientverbindung(lClientSocket)
+		except OSError:
+			lClientSocket.close()
+			return
+		pSelektor.register(lClientSocket, selectors.EVENT_READ, lVerbindungMitClient)
+
+	def _bedieneVerbindung(self, pSelektor, pVerbindungMitClient):
+		"""
+		Interne Methode. Verarbeitet empfangsbereite Daten einer Verbindung und schließt diese nach Abschluss des
+		Protokollablaufs bzw. bei Fehlern.
+		"""
+		try:
+			lAufrufParameterlisteList = pVerbindungMitClient.verarbeiteEmpfangsbereitschaft()
+			if lAufrufParameterlisteList is not None:
+				self.C_LISTENEMPFANG_SIGNAL.emit(lAufrufParameterlisteList)
+		except (OSError, yaml.YAMLError): # Verbindung vorzeitig beendet, ungültige Längenangabe oder Nachricht
+			pVerbindungMitClient.schliesse()
+		if pVerbindungMitClient.istGeschlossen() is True:
+			pSelektor.unregister(pVerbindungMitClient.sClientSocket)
+			pVerbindungMitClient.schliesse()
 
 	def gibPort(self):
 		"""
-		Returniert den Port des Servers.
+		Returniert den Port des Servers (None bei Verwendung eines Unix-Domain-Sockets).
 
 		:return: Port des Servers
 		:rtype: Integer
@@ -196,16 +257,6 @@ class QServer(QtCore.QThread):
 		"""
 		self.sAktivBoolean = False
 
-	def _emittiereListenEmpfangssignal(self, pAufrufparameterList):
-		"""
-		Emittiert das Signal C_LISTENEMPFANG_SIGNAL mit der übergebenen Instanz einer Liste von Aufrufparametern einer
-		verbundenen Clientinstanz.
-
-		:param pAufrufparameterList: Aufrufparameter einer verbundenen Clientinstanz.
-		:return: Liste von Strings
-		"""
-		self.C_LISTENEMPFANG_SIGNAL.emit(pAufrufparameterList)
-
 
 
 class QClient():
@@ -216,12 +267,14 @@ class QClient():
 		"""
 		Initialisiert ein Objekt der Klasse QClient.
 		"""
-		self.sClientSocket = socket.socket()
+		self.sClientSocket = None
 		try:
-			self.sClientSocket.connect(('127.0.0.1',LiSKonfiguration.Konfiguration.G_SERVER_PORT))
+			self.sClientSocket = Nachrichtenprotokoll.erzeugeClientSocket(LiSKonfiguration.Konfiguration.G_SERVER_PORT)
 			self.sAktivBoolean = True
 			self._initialisiereVerbindung()
 		except Exception as lException:
+			if self.sClientSocket is not None:
+				self.sClientSocket.close()
 			raise RuntimeError from lException
 
 	def _initialisiereVerbindung(self):
@@ -245,7 +298,7 @@ class QClient():
 		:return:
 		"""
 		lAufrufparameterList = LiSKonfiguration.Konfiguration.gibAurufparameterAlsGeordneteListe()
-		lDatenZumSendenBytes = yaml.dump(lAufrufparameterList).encode()
+		lDatenZumSendenBytes = yaml.dump(lAufrufparameterList, Dumper=C_YAML_DUMPER).encode()
 		self._sendeNachricht(lDatenZumSendenBytes)
 		lByeBytes = self._empfangeNachricht()
 		if lByeBytes == b'+BYE':
@@ -260,8 +313,7 @@ class QClient():
 		der Nachricht).
 		:param pNachrichtBytes:
 		"""
-		lLaengeDerNachrichtInteger = len(pNachrichtBytes)
-		self.sClientSocket.sendall(struct.pack('>Q', lLaengeDerNachrichtInteger) + pNachrichtBytes)
+		Nachrichtenprotokoll.sendeNachricht(self.sClientSocket, pNachrichtBytes)
 
 	def _empfangeNachricht(self):
 		"""
@@ -272,23 +324,10 @@ class QClient():
 		:return: Inhaltsteil der empfangenen Nachricht oder None
 		:rtype: Bytesequenz
 		"""
-		lLaengeDerNachrichtBytes = b''
-		while len(lLaengeDerNachrichtBytes) < 8 and self.sAktivBoolean is True:
-			lLaengeDerNachrichtBytes += self.sClientSocket.recv(1)
-
-		lLaengeDerNachrichtInteger = struct.unpack('>Q',lLaengeDerNachrichtBytes)[0]
-		lNachrichtBytes = b''
-		while len(lNachrichtBytes) < lLaengeDerNachrichtInteger and self.sAktivBoolean is True:
-			lNachrichtBytes += self.sClientSocket.recv(1)
-
-		if self.sAktivBoolean is True:
-			return lNachrichtBytes
-		else:
-			return None
+		return Nachrichtenprotokoll.empfangeNachricht(self.sClientSocket, lambda: self.sAktivBoolean)
 
 	def stop(self):
 		"""
 		Veranlasst den Stopp der Verbindung zum Server durch Setzen des Werts des Attributs sAktivBoolean auf False.
 		"""
 		self.sAktivBoolean = False
-
@@ -0,0 +1,247 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält das Protokoll zur Übergabe von Aufrufparametern an eine bereits laufende LiSCrypt-Instanz. Es
+verwendet ausschließlich Module der Standardbibliothek, damit weitere Instanzen (LiSStarter) ihre Aufrufparameter ohne
+Import von GUI- und Kryptografiebibliotheken übergeben können.
+"""
+
+from Modell import LiSAusnahmen, LiSBasiskonstanten
+
+import os
+import socket
+import struct
+
+class Nachrichtenprotokoll:
+	"""
+	Stellt statische Methoden zum Senden und Empfangen von Nachrichten zwischen QServer und QClient sowie zum Aufbau
+	der Verbindungen zur Verfügung. Jede Nachricht besteht aus ihrer Länge (>Q) und dem Inhaltsteil.
+
+	Die Aufrufparameter werden entweder bereits ausgewertet als YAML-Liste (QClient) oder unausgewertet als
+	Kommandozeilenargumente (kodiereArgumente(...), Schnellstart ohne Drittbibliotheken) übergeben.
+
+	Unter POSIX-Systemen erfolgt die Verbindung über einen Unix-Domain-Socket mit der festen Adresse
+	LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE (unter Linux im abstrakten Namensraum), so dass weitere Instanzen die
+	Konfigurationsdatei nicht lesen müssen. Andernfalls (Windows) wird über TCP (127.0.0.1) mit dem in der
+	Konfigurationsdatei hinterlegten Port kommuniziert.
+	"""
+	C_LAENGENANGABE_STRUCT = struct.Struct('>Q')
+	C_ARGUMENTE_KENNUNG = b'+ARGV\0'
+
+	def __init__(self):
+		if type(self) is Nachrichtenprotokoll:
+			raise LiSAusnahmen.QAbstractClassError('Nachrichtenprotokoll kann nicht instanziiert werden.')
+
+	@staticmethod
+	def nutztUnixSocket():
+		"""
+		Returniert, ob die Kommunikation über einen Unix-Domain-Socket erfolgt (True) oder über TCP (False).
+
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE is not None and hasattr(socket, 'AF_UNIX')
+
+	@staticmethod
+	def erzeugeServerSocket():
+		"""
+		Erzeugt einen auf Verbindungen wartenden Socket für QServer.
+
+		:return: Server-Socket
+		:rtype: Socket
+		"""
+		if Nachrichtenprotokoll.nutztUnixSocket() is True:
+			lServerSocket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			if not LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE.startswith('\0'): # Socketdatei (nicht im abstrakten Namensraum)
+				if os.path.exists(LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE): # Verwaiste Socketdatei einer beendeten Instanz
+					os.unlink(LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE)
+				lUmaskInteger = os.umask(0o177)
+				try:
+					lServerSocket.bind(LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE)
+				finally:
+					os.umask(lUmaskInteger)
+			else:
+				lServerSocket.bind(LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE)
+		else:
+			lServerSocket = socket.socket()
+			lServerSocket.bind(('127.0.0.1', 0))
+		lServerSocket.listen()
+		lServerSocket.setblocking(False)
+		return lServerSocket
+
+	@staticmethod
+	def erzeugeClientSocket(pPortInteger=None):
+		"""
+		Erzeugt einen mit dem QServer der Master-Instanz verbundenen Socket. Wirft OSError, falls keine Master-Instanz
+		erreichbar ist oder der Server einem anderen Benutzer gehört (die Adresse im abstrakten Namensraum ist
+		vorhersagbar und könnte von einem anderen Benutzer zuerst belegt werden).
+
+		:param pPortInteger: Port des Servers (nur bei Kommunikation über TCP)
+		:type pPortInteger: Integer
+		:return: Client-Socket
+		:rtype: Socket
+		"""
+		if Nachrichtenprotokoll.nutztUnixSocket() is True:
+			lClientSocket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+			lClientSocket.settimeout(LiSBasiskonstanten.C_IPC_ZEITLIMIT)
+			try:
+				lClientSocket.connect(LiSBasiskonstanten.C_IPC_SOCKET_ADRESSE)
+				if Nachrichtenprotokoll.istGleicherBenutzer(lClientSocket) is False:
+					raise ConnectionError('Server eines anderen Benutzers abgewiesen.')
+			except:
+				lClientSocket.close()
+				raise
+		else:
+			lClientSocket = socket.create_connection(('127.0.0.1', pPortInteger), timeout=LiSBasiskonstanten.C_IPC_ZEITLIMIT)
+		return lClientSocket
+
+	@staticmethod
+	def istGleicherBenutzer(pSocket):
+		"""
+		Returniert, ob der über pSocket verbundene Prozess demselben Benutzer gehört (nur bei Unix-Domain-Sockets unter
+		Linux prüfbar; andernfalls True, da der Zugriff dort über Dateirechte bzw. die Bindung an 127.0.0.1 geregelt ist).
+
+		:param pSocket: Verbundener Socket
+		:type pSocket: Socket
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		if hasattr(socket, 'SO_PEERCRED') and pSocket.family == getattr(socket, 'AF_UNIX', None):
+			lProzessIDInteger, lBenutzerIDInteger, lGruppenIDInteger = struct.unpack('3i', pSocket.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize('3i')))
+			return lBenutzerIDInteger == os.getuid()
+		return True
+
+	@staticmethod
+	def kodiereArgumente(pArgumenteList):
+		"""
+		Returniert die Nachricht zur Übergabe der (unausgewerteten) Kommandozeilenargumente pArgumenteList an die
+		Master-Instanz, die diese selbst auswertet.
+
+		:param pArgumenteList: Kommandozeilenargumente (ohne Programmname)
+		:type pArgumenteList: Liste von Strings
+		:return: Nachricht
+		:rtype: Bytesequenz
+		"""
+		return Nachrichtenprotokoll.C_ARGUMENTE_KENNUNG + b'\0'.join(lArgumentString.encode('utf-8', 'surrogateescape') for lArgumentString in pArgumenteList)
+
+	@staticmethod
+	def istArgumentnachricht(pNachrichtBytes):
+		"""
+		Returniert, ob pNachrichtBytes mittels kodiereArgumente(...) erzeugt wurde.
+
+		:param pNachrichtBytes: Empfangene Nachricht
+		:type pNachrichtBytes: Bytesequenz
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return pNachrichtBytes.startswith(Nachrichtenprotokoll.C_ARGUMENTE_KENNUNG)
+
+	@staticmethod
+	def dekodiereArgumente(pNachrichtBytes):
+		"""
+		Returniert die mittels kodiereArgumente(...) übergebenen Kommandozeilenargumente.
+
+		:param pNachrichtBytes: Empfangene Nachricht
+		:type pNachrichtBytes: Bytesequenz
+		:return: Kommandozeilenargumente
+		:rtype: Liste von Strings
+		"""
+		lArgumenteBytes = pNachrichtBytes[len(Nachrichtenprotokoll.C_ARGUMENTE_KENNUNG):]
+		if not lArgumenteBytes:
+			return []
+		return [lArgumentBytes.decode('utf-8', 'surrogateescape') for lArgumentBytes in lArgumenteBytes.split(b'\0')]
+
+	@staticmethod
+	def sendeNachricht(pSocket, pNachrichtBytes):
+		"""
+		Sendet pNachrichtBytes (unter Voranstellung der Länge der Nachricht) über pSocket.
+
+		:param pSocket: Verbundener Socket
+		:type pSocket: Socket
+		:param pNachrichtBytes: Zu sendende Nachricht
+		:type pNachrichtBytes: Bytesequenz
+		"""
+		pSocket.sendall(Nachrichtenprotokoll.C_LAENGENANGABE_STRUCT.pack(len(pNachrichtBytes)) + pNachrichtBytes)
+
+	@staticmethod
+	def empfangeNachricht(pSocket, pIstAktivFunktion):
+		"""
+		Blockierende Methode, die eine Nachricht über pSocket empfängt und den Inhaltsteil returniert. Liefert
+		pIstAktivFunktion() zwischenzeitlich False, returniert die Methode None. Wird die Verbindung vorzeitig beendet
+		oder überschreitet die Längenangabe LiSBasiskonstanten.C_IPC_MAXIMALE_NACHRICHTENLAENGE, wird ConnectionError geworfen.
+
+		:param pSocket: Verbundener Socket
+		:type pSocket: Socket
+		:param pIstAktivFunktion: Funktion, die angibt, ob der Empfang fortgesetzt werden soll
+		:type pIstAktivFunktion: Callable
+		:return: Inhaltsteil der empfangenen Nachricht oder None
+		:rtype: Bytesequenz
+		"""
+		lNachrichtenempfaenger = Nachrichtenempfaenger()
+		while pIstAktivFunktion() is True:
+			lNachrichtBytes = lNachrichtenempfaenger.empfange(pSocket)
+			if lNachrichtBytes is not None:
+				return lNachrichtBytes
+		return None
+
+class Nachrichtenempfaenger:
+	"""
+	Setzt eine Nachricht aus beliebig vielen Empfangsvorgängen zusammen (für blockierende und ereignisgesteuerte
+	Sockets). Empfangen wird mittels recv_into in einen vorab in voller Länge angelegten Puffer.
+	"""
+	def __init__(self):
+		"""
+		Initialisiert ein Objekt der Klasse Nachrichtenempfaenger.
+		"""
+		self.sLaengenangabeBytearray = bytearray(Nachrichtenprotokoll.C_LAENGENANGABE_STRUCT.size)
+		self.sNachrichtBytearray = None
+		self.sEmpfangenInteger = 0
+
+	def empfange(self, pSocket):
+		"""
+		Führt einen Empfangsvorgang (recv_into) über pSocket aus. Ist die Nachricht danach vollständig, wird ihr
+		Inhaltsteil returniert und der Empfänger für die nächste Nachricht zurückgesetzt, andernfalls None. Wird die
+		Verbindung vorzeitig beendet oder überschreitet die Längenangabe LiSBasiskonstanten.C_IPC_MAXIMALE_NACHRICHTENLAENGE,
+		wird ConnectionError geworfen.
+
+		:param pSocket: Verbundener Socket
+		:type pSocket: Socket
+		:return: Inhaltsteil der empfangenen Nachricht oder None
+		:rtype: Bytesequenz
+		"""
+		lPufferBytearray = self.sLaengenangabeBytearray if self.sNachrichtBytearray is None else self.sNachrichtBytearray
+		if self.sEmpfangenInteger < len(lPufferBytearray):
+			lAnzahlInteger = pSocket.recv_into(memoryview(lPufferBytearray)[self.sEmpfangenInteger:], min(len(lPufferBytearray) - self.sEmpfangenInteger, LiSBasiskonstanten.C_IPC_EMPFANGSPUFFER_GROESSE))
+			if lAnzahlInteger == 0:
+				raise ConnectionError('Verbindung vorzeitig beendet.')
+			self.sEmpfangenInteger += lAnzahlInteger
+		if self.sEmpfangenInteger < len(lPufferBytearray):
+			return None
+		if self.sNachrichtBytearray is None: # Längenangabe vollständig
+			lLaengeDerNachrichtInteger = Nachrichtenprotokoll.C_LAENGENANGABE_STRUCT.unpack(self.sLaengenangabeBytearray)[0]
+			if lLaengeDerNachrichtInteger > LiSBasiskonstanten.C_IPC_MAXIMALE_NACHRICHTENLAENGE:
+				raise ConnectionError('Nachricht überschreitet die maximale Länge.')
+			self.sNachrichtBytearray = bytearray(lLaengeDerNachrichtInteger)
+			self.sEmpfangenInteger = 0
+			if lLaengeDerNachrichtInteger > 0:
+				return None
+		lNachrichtBytes = bytes(self.sNachrichtBytearray)
+		self.sNachrichtBytearray = None
+		self.sEmpfangenInteger = 0
+		return lNachrichtBytes
@@ -24,7 +24,8 @@
 # 2. Eingliederung in LiSCrypt, u.a. in objektorientiertes Paradigma und Verwendung LiSCrypt-eigener Exceptions
 # 3. Deutsche Übersetzung
 # 4. Modifikation des Überschreibens von Dateien im NTFS-Dateisystem (Berücksichtigung kleiner Dateien im MFT)
-# 5. Orientierung der Blockgröße beim "normalen" Überschreiben von Dateien an os.statvfs(...).f_bsize
+# 5. Orientierung der Blockgröße beim "normalen" Überschreiben von Dateien an os.statvfs(...).f_bsize (geschrieben wird in
+#    Chunks gemäß LiSBlockgroesse.Blockgroessenrichtlinie)
 # 6. Spezifika der Einbindung des Windows-spezifischen Vernichtens mit Administrationsrechten
 # 7. Exception-Generierung stark an Exception-Handling in LiSCrypt angepasst
 #
@@ -50,7 +51,7 @@
 
 """Diese Modul enthält die Klasse für die Vernichtung von Verzeichniseintträgen"""
 
-from Modell import LiSAusnahmen, LiSKonstanten
+from Modell import LiSAusnahmen, LiSBlockgroesse, LiSKonstanten, LiSZeitmessung
 from Sonstiges import LiSWerkzeuge
 
 import errno
@@ -133,13 +134,17 @@ class QVerzeichniseintrag:
 					# Keine weitere Differenzierung der Fehlercodes notwendig
 					raise LiSAusnahmen.QFileListDisplayError(self.sNurEndnameString + ': [Vernichtung: Verzeichnis nicht löschbar]',
 						self.sReduzierterPfadZuDateiOderVerzeichnisString) from e
-			raise LiSAusnahmen.QFileListDisplayError(
-				self.sNurEndnameString + ': [Vernichtung: Verzeichnis nicht leer]',	self.sReduzierterPfadZuDateiOderVerzeichnisString)
+			else:
+				raise LiSAusnahmen.QFileListDisplayError(
+					self.sNurEndnameString + ': [Vernichtung: Verzeichnis nicht leer]',	self.sReduzierterPfadZuDateiOderVerzeichnisString)
 
 		elif stat.S_ISREG(lErgebnisMode): # Verezichniseintrag ist reguläre Datei
 			# Exceptions bei den folgenden Aufrufen werden nach oben weitergereicht
-			self._ueberschreibeDateiinhalt()
-			os.remove(self._uberschreibeDateinameOderVerknuepfungsnameOderFIFOnameOderVerzeichnisname())
+			with LiSZeitmessung.Zeitmessung.abschnitt('Ueberschreiben'):
+				self._ueberschreibeDateiinhalt()
+			with LiSZeitmessung.Zeitmessung.abschnitt('Umbenennen'):
+				lNeuerErweiterterPfadZuDateiString = self._uberschreibeDateinameOderVerknuepfungsnameOderFIFOnameOderVerzeichnisname()
+			os.remove(lNeuerErweiterterPfadZuDateiString)
 
 		else: # Verzeichniseintrag ist unbekannten Typs
 			raise LiSAusnahmen.QFileListDisplayError(self.sNurEndnameString + ': [Vernichtung: Typ nicht löschbar]', self.sReduzierterPfadZuDateiOderVerzeichnisString)
@@ -194,12 +199,17 @@ class QVerzeichniseintrag:
 		lBlockgroesseInteger = LiSWerkzeuge.Dateisystemwerkzeuge.ermittleDateisystemBlockgroesse(self.sErweiterterPfadZuDateiOderVerzeichnisString)
 		if LiSWerkzeuge.Dateisystemwerkzeuge.ermittleDateisystemVonPfad(self.sErweiterterPfadZuDateiOderVerzeichnisString) != 'ntfs' or size > 1024: # Ist der Dateiinhalt sicher außerhalb des NTFS-MFT?
 			# Wichtig: 1024 mod 512 = 0 (wg. physikalischer Größenberechnung für Dateien in Sonstiges.LiSWerkzeuge)
-			blanks = (chr(0) * lBlockgroesseInteger).encode()
+			# Überschrieben wird bis zum Ende des letzten Dateisystemblocks, geschrieben in möglichst großen Chunks:
+			size = -(-size // lBlockgroesseInteger) * lBlockgroesseInteger
+			lChunkgroesseInteger = max(lBlockgroesseInteger, LiSBlockgroesse.Blockgroessenrichtlinie.gibBlockgroesse(self.sErweiterterPfadZuDateiOderVerzeichnisString) // lBlockgroesseInteger * lBlockgroesseInteger)
+			blanks = bytes(min(size, lChunkgroesseInteger))
 			while size > 0:
-				f.write(blanks)
-				size -= lBlockgroesseInteger
+				f.write(blanks if size >= len(blanks) else blanks[:size])
+				self.sControllerQController.meldeFortschritt(min(size, len(blanks)))
+				size -= len(blanks)
 			f.flush()  # flush to OS buffer
-			os.fsync(f.fileno())  # force write to disk
+			with LiSZeitmessung.Zeitmessung.abschnitt('fsync'):
+				os.fsync(f.fileno())  # force write to disk
 		else:
 			while size > 0:
 				for i in range(lBlockgroesseInteger):
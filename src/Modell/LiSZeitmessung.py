@@ -0,0 +1,335 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul enthält die Zeitmessung einzelner Abschnitte (Phasen) einer Programmfunktion (Scrypt, HKDF, Lesen,
+Ver- und Entschlüsselung, HMAC, Schreiben, fsync, Umbenennen, Rückmeldungen an die Oberfläche) mit Export als
+Chrome-Trace (JSON).
+"""
+
+from Modell import LiSAusnahmen, LiSKonstanten
+from Sonstiges import LiSWerkzeuge
+
+import contextlib
+import json
+import logging
+import os
+import threading
+import time
+
+_C_LEERER_ABSCHNITT = contextlib.nullcontext()
+
+class Zeitmessung:
+	"""
+	Stellt statische Methoden zur Messung von Abschnitten zur Verfügung. Ist die Zeitmessung nicht aktiviert (Default),
+	returnieren abschnitt(...) und datei(...) einen wiederverwendeten leeren Kontextmanager und umschliesse(...) bzw.
+	umschliesseMethoden(...) das übergebene Objekt selbst, d.h. es entstehen weder Messungen noch zusätzliche Aufrufe
+	je Block.
+
+	Je Programmfunktionsdurchlauf (beginneLauf() bis beendeLauf()) werden je Abschnitt Anzahl, Gesamt- und Höchstdauer
+	sowie ein Histogramm der Einzeldauern (Zweierpotenzen in Mikrosekunden) und je Datei Anzahl und Gesamtdauer der
+	Abschnitte gesammelt. Abschnitte in Threads der Segmentpipeline werden der gerade bearbeiteten Datei zugeordnet;
+	da sie sich überlappen, kann die Summe der Abschnittsdauern die Laufzeit übersteigen.
+
+	Erfasst werden ausschließlich Abschnittsnamen, Zeitpunkte, Thread-Kennungen und (reduzierte) Dateipfade, niemals
+	Aufrufparameter oder Rückgabewerte der gemessenen Funktionen (und damit keine Schlüssel, Hashwerte oder Klartexte).
+	"""
+	_sAktivBoolean = False
+	_sTraceDateinameString = None
+	_sLock = threading.Lock()
+	_sLaufStartInteger = None
+	_sAbschnitteDictionary = dict()
+	_sDateienDictionary = dict()
+	_sDateienList = []
+	_sTraceEreignisseList = []
+	_sVerworfeneEreignisseInteger = 0
+
+	def __init__(self):
+		if type(self) is Zeitmessung:
+			raise LiSAusnahmen.QAbstractClassError('Zeitmessung kann nicht instanziiert werden.')
+
+	@staticmethod
+	def aktiviere(pTraceDateinameString=None):
+		"""
+		Aktiviert die Zeitmessung. Ist pTraceDateinameString angegeben, wird jeder Programmfunktionsdurchlauf bei
+		beendeLauf() als Chrome-Trace (chrome://tracing, Perfetto) inkl. Zusammenfassung in diese Datei geschrieben
+		(ein weiterer Durchlauf überschreibt die Datei).
+
+		:param pTraceDateinameString: Pfad zur Trace-Datei oder None (nur Zusammenfassung)
+		:type pTraceDateinameString: String
+		"""
+		Zeitmessung._sTraceDateinameString = pTraceDateinameString
+		Zeitmessung._sAktivBoolean = True
+
+	@staticmethod
+	def deaktiviere():
+		"""
+		Deaktiviert die Zeitmessung.
+		"""
+		Zeitmessung._sAktivBoolean = False
+		Zeitmessung._sTraceDateinameString = None
+
+	@staticmethod
+	def istAktiv():
+		"""
+		Returniert True, falls die Zeitmessung aktiviert ist.
+
+		:return: Aktivierungszustand
+		:rtype: Boolean
+		"""
+		return Zeitmessung._sAktivBoolean
+
+	@staticmethod
+	def beginneLauf():
+		"""
+		Verwirft die Messungen eines vorherigen Durchlaufs und beginnt einen neuen Programmfunktionsdurchlauf.
+		"""
+		if Zeitmessung._sAktivBoolean is False:
+			return
+		with Zeitmessung._sLock:
+			Zeitmessung._sAbschnitteDictionary = dict()
+			Zeitmessung._sDateienDictionary = dict()
+			Zeitmessung._sDateienList = []
+			Zeitmessung._sTraceEreignisseList = []
+			Zeitmessung._sVerworfeneEreignisseInteger = 0
+			Zeitmessung._sLaufStartInteger = time.perf_counter_ns()
+
+	@staticmethod
+	def beendeLauf():
+		"""
+		Beendet den Programmfunktionsdurchlauf, protokolliert die Zusammenfassung (Log-Level Debug), schreibt ggf. die
+		Trace-Datei und returniert die Zusammenfassung.
+
+		:return: Zusammenfassung (siehe gibZusammenfassung()) oder None, falls die Zeitmessung nicht aktiviert ist
+		:rtype: Dictionary
+		"""
+		if Zeitmessung._sAktivBoolean is False or Zeitmessung._sLaufStartInteger is None:
+			return None
+		lZusammenfassungDictionary = Zeitmessung.gibZusammenfassung()
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert('Zeitmessung: ' + json.dumps(lZusammenfassungDictionary['Abschnitte'], ensure_ascii=False))
+		if Zeitmessung._sTraceDateinameString is not None:
+			try:
+				Zeitmessung.exportiere(Zeitmessung._sTraceDateinameString)
+			except OSError:
+				logging.exception('Trace-Datei ' + Zeitmessung._sTraceDateinameString + ' konnte nicht geschrieben werden')
+		return lZusammenfassungDictionary
+
+	@staticmethod
+	def abschnitt(pNameString):
+		"""
+		Returniert einen Kontextmanager, der die Dauer des umschlossenen Abschnitts unter pNameString erfasst.
+
+		:param pNameString: Name des Abschnitts (z.B. 'Scrypt')
+		:type pNameString: String
+		:return: Kontextmanager
+		"""
+		if Zeitmessung._sAktivBoolean is False:
+			return _C_LEERER_ABSCHNITT
+		return _Abschnitt(pNameString)
+
+	@staticmethod
+	def datei(pNameString, pErweiterterPfadString):
+		"""
+		Returniert einen Kontextmanager, der die Bearbeitung der Datei pErweiterterPfadString unter pNameString erfasst.
+		Alle währenddessen (auch in anderen Threads) gemessenen Abschnitte werden dieser Datei zugeordnet.
+
+		:param pNameString: Name des Abschnitts (z.B. 'Datei verschlüsseln')
+		:type pNameString: String
+		:param pErweiterterPfadString: Erweiterte Pfadangabe zur Datei
+		:type pErweiterterPfadString: String
+		:return: Kontextmanager
+		"""
+		if Zeitmessung._sAktivBoolean is False:
+			return _C_LEERER_ABSCHNITT
+		return _Abschnitt(pNameString, LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString))
+
+	@staticmethod
+	def umschliesse(pNameString, pFunktion):
+		"""
+		Returniert eine Funktion, die pFunktion aufruft und die Dauer jedes Aufrufs unter pNameString erfasst (bzw.
+		pFunktion selbst, falls die Zeitmessung nicht aktiviert ist).
+
+		:param pNameString: Name des Abschnitts
+		:type pNameString: String
+		:param pFunktion: Zu messende Funktion
+		:type pFunktion: Callable
+		:return: Gemessene Funktion
+		:rtype: Callable
+		"""
+		if Zeitmessung._sAktivBoolean is False:
+			return pFunktion
+
+		def lGemesseneFunktion(*args, **kwargs):
+			lStartInteger = time.perf_counter_ns()
+			try:
+				return pFunktion(*args, **kwargs)
+			finally:
+				Zeitmessung._vermerke(pNameString, lStartInteger, time.perf_counter_ns())
+		return lGemesseneFunktion
+
+	@staticmethod
+	def umschliesseMethoden(pObjekt, pNameString, *pMethodennamenTuple):
+		"""
+		Returniert ein Stellvertreterobjekt für pObjekt, dessen Methoden pMethodennamenTuple unter pNameString gemessen
+		werden (bzw. pObjekt selbst, falls die Zeitmessung nicht aktiviert ist). Alle übrigen Attribute werden an
+		pObjekt weitergereicht.
+
+		:param pObjekt: Objekt (z.B. Datei oder Decryptor)
+		:param pNameString: Name des Abschnitts
+		:type pNameString: String
+		:param pMethodennamenTuple: Namen der zu messenden Methoden (z.B. 'read')
+		:return: Stellvertreterobjekt oder pObjekt
+		"""
+		if Zeitmessung._sAktivBoolean is False:
+			return pObjekt
+		return _GemessenesObjekt(pObjekt, {lMethodennameString: Zeitmessung.umschliesse(pNameString, getattr(pObjekt, lMethodennameString)) for lMethodennameString in pMethodennamenTuple})
+
+	@staticmethod
+	def gibZusammenfassung():
+		"""
+		Returniert die Zusammenfassung des aktuellen Durchlaufs: Laufzeit in Sekunden, je Abschnitt Anzahl, Gesamt- und
+		Höchstdauer in Sekunden sowie das Histogramm der Einzeldauern (Schlüssel: obere Grenze in Mikrosekunden,
+		exklusive) und je Datei (reduzierter Pfad) Anzahl und Gesamtdauer der Abschnitte.
+
+		:return: Zusammenfassung
+		:rtype: Dictionary
+		"""
+		with Zeitmessung._sLock:
+			lAbschnitteDictionary = {lNameString: {'Anzahl': lWerteList[0],
+												   'Sekunden': lWerteList[1] / 1e9,
+												   'MaximumSekunden': lWerteList[2] / 1e9,
+												   'Histogramm': {str(1 << lKlasseInteger): lAnzahlInteger for lKlasseInteger, lAnzahlInteger in sorted(lWerteList[3].items())}}
+									 for lNameString, lWerteList in sorted(Zeitmessung._sAbschnitteDictionary.items())}
+			lDateienDictionary = {lDateiString: {lNameString: {'Anzahl': lWerteList[0], 'Sekunden': lWerteList[1] / 1e9} for lNameString, lWerteList in sorted(lAbschnitteNachDateiDictionary.items())}
+								  for lDateiString, lAbschnitteNachDateiDictionary in Zeitmessung._sDateienDictionary.items()}
+			return {'Sekunden': (time.perf_counter_ns() - Zeitmessung._sLaufStartInteger) / 1e9 if Zeitmessung._sLaufStartInteger is not None else 0.0,
+					'Abschnitte': lAbschnitteDictionary,
+					'Dateien': lDateienDictionary,
+					'VerworfeneTraceEreignisse': Zeitmessung._sVerworfeneEreignisseInteger}
+
+	@staticmethod
+	def exportiere(pDateinameString):
+		"""
+		Schreibt die Einzelereignisse des aktuellen Durchlaufs im JSON-Format von Chrome-Traces (Ereignisse vom Typ 'X')
+		sowie die Zusammenfassung (Schlüssel 'Zusammenfassung') in die Datei pDateinameString.
+
+		:param pDateinameString: Pfad zur Trace-Datei
+		:type pDateinameString: String
+		"""
+		lZusammenfassungDictionary = Zeitmessung.gibZusammenfassung()
+		with Zeitmessung._sLock:
+			lEreignisseList = list(Zeitmessung._sTraceEreignisseList)
+		with open(pDateinameString, 'w', encoding='utf-8') as lTraceDatei:
+			json.dump({'traceEvents': lEreignisseList,
+					   'displayTimeUnit': 'ms',
+					   'otherData': {'LiSCryptVersion': LiSKonstanten.__version__},
+					   'Zusammenfassung': lZusammenfassungDictionary}, lTraceDatei, ensure_ascii=False)
+
+	## --- Interne Methoden
+
+	@staticmethod
+	def _vermerke(pNameString, pStartInteger, pEndeInteger, pDateiString=None):
+		"""
+		Interne Methode. Vermerkt einen Abschnitt (Zeitpunkte in Nanosekunden gemäß time.perf_counter_ns()) in der
+		Zusammenfassung und - solange LiSKonstanten.C_ZEITMESSUNG_MAXIMALE_TRACE_EREIGNISSE nicht erreicht ist - als
+		Einzelereignis.
+		"""
+		lDauerInteger = pEndeInteger - pStartInteger
+		with Zeitmessung._sLock:
+			if Zeitmessung._sLaufStartInteger is None: # Abschnitte außerhalb eines Durchlaufs (z.B. Benchmarks) werden ab der ersten Messung erfasst
+				Zeitmessung._sLaufStartInteger = pStartInteger
+			lWerteList = Zeitmessung._sAbschnitteDictionary.get(pNameString)
+			if lWerteList is None:
+				lWerteList = Zeitmessung._sAbschnitteDictionary[pNameString] = [0, 0, 0, dict()]
+			lWerteList[0] += 1
+			lWerteList[1] += lDauerInteger
+			lWerteList[2] = max(lWerteList[2], lDauerInteger)
+			lKlasseInteger = (lDauerInteger // 1000).bit_length()
+			lWerteList[3][lKlasseInteger] = lWerteList[3].get(lKlasseInteger, 0) + 1
+
+			lDateiString = pDateiString if pDateiString is not None else (Zeitmessung._sDateienList[-1] if len(Zeitmessung._sDateienList) > 0 else None)
+			if lDateiString is not None:
+				lAbschnitteNachDateiDictionary = Zeitmessung._sDateienDictionary.setdefault(lDateiString, dict())
+				lDateiWerteList = lAbschnitteNachDateiDictionary.get(pNameString)
+				if lDateiWerteList is None:
+					lDateiWerteList = lAbschnitteNachDateiDictionary[pNameString] = [0, 0]
+				lDateiWerteList[0] += 1
+				lDateiWerteList[1] += lDauerInteger
+
+			if Zeitmessung._sTraceDateinameString is not None:
+				if len(Zeitmessung._sTraceEreignisseList) < LiSKonstanten.C_ZEITMESSUNG_MAXIMALE_TRACE_EREIGNISSE:
+					lEreignisDictionary = {'name': pNameString, 'ph': 'X', 'pid': os.getpid(), 'tid': threading.get_native_id(),
+										   'ts': (pStartInteger - Zeitmessung._sLaufStartInteger) / 1000, 'dur': lDauerInteger / 1000}
+					if pDateiString is not None:
+						lEreignisDictionary['args'] = {'Datei': pDateiString}
+					Zeitmessung._sTraceEreignisseList.append(lEreignisDictionary)
+				else:
+					Zeitmessung._sVerworfeneEreignisseInteger += 1
+
+	@staticmethod
+	def _betreteDatei(pDateiString):
+		"""
+		Interne Methode. Legt pDateiString als aktuell bearbeitete Datei fest.
+		"""
+		with Zeitmessung._sLock:
+			Zeitmessung._sDateienList.append(pDateiString)
+
+	@staticmethod
+	def _verlasseDatei():
+		"""
+		Interne Methode. Stellt die zuvor bearbeitete Datei wieder her.
+		"""
+		with Zeitmessung._sLock:
+			if len(Zeitmessung._sDateienList) > 0:
+				Zeitmessung._sDateienList.pop()
+
+class _Abschnitt:
+	"""
+	Kontextmanager für einen gemessenen Abschnitt (siehe Zeitmessung.abschnitt(...) und Zeitmessung.datei(...)).
+	"""
+	__slots__ = ('sNameString', 'sDateiString', 'sStartInteger')
+
+	def __init__(self, pNameString, pDateiString=None):
+		self.sNameString = pNameString
+		self.sDateiString = pDateiString
+		self.sStartInteger = None
+
+	def __enter__(self):
+		if self.sDateiString is not None:
+			Zeitmessung._betreteDatei(self.sDateiString)
+		self.sStartInteger = time.perf_counter_ns()
+		return self
+
+	def __exit__(self, pExceptionTyp, pException, pTraceback):
+		lEndeInteger = time.perf_counter_ns()
+		if self.sDateiString is not None:
+			Zeitmessung._verlasseDatei()
+		Zeitmessung._vermerke(self.sNameString, self.sStartInteger, lEndeInteger, self.sDateiString)
+		return False
+
+class _GemessenesObjekt:
+	"""
+	Stellvertreter für ein Objekt, dessen einzelne Methoden gemessen werden (siehe Zeitmessung.umschliesseMethoden(...)).
+	"""
+	def __init__(self, pObjekt, pMethodenDictionary):
+		self.__dict__.update(pMethodenDictionary)
+		self._sObjekt = pObjekt
+
+	def __getattr__(self, pNameString):
+		return getattr(self._sObjekt, pNameString)
@@ -17,19 +17,21 @@
 # along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
 
 """
-Dieses Modul enthält Klassen mit statischen Hilfsmethoden.
+Dieses Modul enthält Klassen mit statischen Hilfsmethoden sowie die Klassen SichererPuffer und Geheimnisregister.
 """
 
 from Modell import LiSAusnahmen, LiSKonstanten
 
 import ctypes
 import logging
+import mmap
 import os
 import psutil
 import random
 import stat
 import string
 import sys
+import threading
 import typing
 
 if str.lower(os.name) == 'posix':
@@ -63,12 +65,77 @@ class Dateiwerkzeuge:
 		return lIstBeschreibbarBoolean
 
 class Dateisystemwerkzeuge:
+	"""
+	Stellt statische Methoden zu Dateisystemen zur Verfügung. Dateisystemtyp und Dateisystemblockgröße werden je
+	Datenträger (st_dev) zwischengespeichert, da sie bei vielen kleinen Dateien sonst je Datei ermittelt würden.
+	"""
+	_sDateisystemDictionary = dict()
+	_sDateisystemBlockgroessenDictionary = dict()
+	_sLock = threading.Lock()
+
 	def __init__(self):
 		if type(self) is Dateisystemwerkzeuge:
 			raise LiSAusnahmen.QAbstractClassError('Dateisystemwerzeuge kann nicht instanziiert werden.')
 
 	@staticmethod
 	def ermittleDateisystemBlockgroesse(pErweiterterPfadString):
+		"""
+		Returniert die Blockgröße des Dateisystems, auf dem pErweiterterPfadString liegt (zwischengespeichert je Datenträger).
+
+		:param pErweiterterPfadString: Erweiterte Pfadangabe
+		:type pErweiterterPfadString: String
+		:return: Dateisystemblockgröße in Bytes
+		:rtype: int
+		"""
+		return Dateisystemwerkzeuge._gibZwischengespeichert(Dateisystemwerkzeuge._sDateisystemBlockgroessenDictionary,
+															Dateisystemwerkzeuge._ermittleDateisystemBlockgroesse, pErweiterterPfadString)
+
+	@staticmethod
+	def ermittleDateisystemVonPfad(pErweiterterPfadString):
+		"""
+		Returniert die Typbezeichnung (in Kleinschreibung) des Dateisystems, auf dem pErweiterterPfadString liegt, bzw.
+		None, falls diese nicht ermittelt werden kann (zwischengespeichert je Datenträger).
+
+		:param pErweiterterPfadString: Erweiterte Pfadangabe
+		:type pErweiterterPfadString: String
+		:return: Typbezeichnung des Dateisystems oder None
+		:rtype: String
+		"""
+		return Dateisystemwerkzeuge._gibZwischengespeichert(Dateisystemwerkzeuge._sDateisystemDictionary,
+															Dateisystemwerkzeuge._ermittleDateisystemVonPfad, pErweiterterPfadString)
+
+	@staticmethod
+	def leereZwischenspeicher():
+		"""
+		Verwirft alle zwischengespeicherten Dateisystemtypen und -blockgrößen (z.B. nach Einbinden anderer Datenträger).
+		"""
+		with Dateisystemwerkzeuge._sLock:
+			Dateisystemwerkzeuge._sDateisystemDictionary.clear()
+			Dateisystemwerkzeuge._sDateisystemBlockgroessenDictionary.clear()
+
+	## --- Interne Methoden
+
+	@staticmethod
+	def _gibZwischengespeichert(pZwischenspeicherDictionary, pErmittlungFunktion, pErweiterterPfadString):
+		"""
+		Interne Methode. Returniert den in pZwischenspeicherDictionary zum Datenträger von pErweiterterPfadString
+		vermerkten Wert bzw. ermittelt ihn mittels pErmittlungFunktion und vermerkt ihn. Kann der Datenträger nicht
+		ermittelt werden (z.B. Pfad existiert nicht), wird ohne Zwischenspeicher ermittelt.
+		"""
+		try:
+			lDatentraegerInteger = os.lstat(pErweiterterPfadString).st_dev
+		except OSError:
+			return pErmittlungFunktion(pErweiterterPfadString)
+		with Dateisystemwerkzeuge._sLock:
+			if lDatentraegerInteger in pZwischenspeicherDictionary:
+				return pZwischenspeicherDictionary[lDatentraegerInteger]
+		lWert = pErmittlungFunktion(pErweiterterPfadString)
+		with Dateisystemwerkzeuge._sLock:
+			pZwischenspeicherDictionary[lDatentraegerInteger] = lWert
+		return lWert
+
+	@staticmethod
+	def _ermittleDateisystemBlockgroesse(pErweiterterPfadString):
 		if str.lower(os.name) == 'nt':
 			# https://stackoverflow.com/questions/2493172/determine-cluster-size-of-file-system-in-python
 			lBytesPerSector = ctypes.c_ulonglong(0)
@@ -90,7 +157,7 @@ class Dateisystemwerkzeuge:
 		return lDateisystemBlockgroesseInteger
 
 	@staticmethod
-	def ermittleDateisystemVonPfad(pErweiterterPfadString):
+	def _ermittleDateisystemVonPfad(pErweiterterPfadString):
 		lBestePassungString = ''
 		lTypberzeichnungString = None
 		for lPartition in psutil.disk_partitions():
@@ -108,10 +175,23 @@ class Loggingwerkzeuge:
 	"""
 	Stellt statische Methoden zum Logging zur Verfügung, die die vorhandenen Funktionen des Moduls logging ergänzen
 	"""
+	_sPaketiertBoolean = bool(getattr(sys, 'frozen', False))
+
 	def __init__(self):
 		if type(self) is Loggingwerkzeuge:
 			raise LiSAusnahmen.QAbstractClassError('Loggingwerkzeuge kann nicht instanziiert werden.')
 
+	@staticmethod
+	def istDebugAktiv():
+		"""Returniert True, falls LiSCrypt nicht in paketierter Form (PyInstaller) läuft und Logging-Nachrichten im
+		Log-Level Debug ausgegeben werden. Diagnosen, deren Nachricht erst aufwändig zusammengesetzt werden muss (z.B.
+		Verkettung mit Schlüsselmaterial), sind vorab hiermit zu prüfen, damit sie ohne Debugging entfallen.
+
+		:return: Debug-Ausgaben aktiv
+		:rtype: Boolean
+		"""
+		return Loggingwerkzeuge._sPaketiertBoolean is False and logging.root.isEnabledFor(logging.DEBUG)
+
 	@staticmethod
 	def loggeMitLoglevelDebugWennNichtPaketiert(lNachrichtBytes, *args, **kwargs):
 		"""Gibt die Logging-Nachricht lNachrichtBytes mittelslogging.debug(...), falls LiSCrypt nicht in pakettierter
@@ -122,9 +202,23 @@ class Loggingwerkzeuge:
 		:param args: Siehe logging.debug
 		:param kwargs: Siehe logging.debug
 		"""
-		if not getattr(sys, 'frozen', False):
+		if Loggingwerkzeuge._sPaketiertBoolean is False:
 			logging.debug(lNachrichtBytes, *args, **kwargs)
 
+	@staticmethod
+	def loggeFallsNullbytefolge(pWertBytes, pNachrichtBytes):
+		"""Gibt die Logging-Nachricht pNachrichtBytes im Log-Level Debug aus, falls pWertBytes ausschließlich aus
+		Nullbytes besteht (Sicherheitskontrolle; der Wert kann real eine Nullbytefolge sein!). Ohne aktive Debug-Ausgaben
+		(siehe istDebugAktiv()) findet keine Prüfung statt.
+
+		:param pWertBytes: Zu prüfender Wert (None wird ignoriert)
+		:type pWertBytes: Bytesequenz
+		:param pNachrichtBytes: Logging-Nachricht
+		:type pNachrichtBytes: Bytesequenz
+		"""
+		if pWertBytes is not None and Loggingwerkzeuge.istDebugAktiv() is True and len(pWertBytes) > 0 and pWertBytes.count(0) == len(pWertBytes):
+			logging.debug(pNachrichtBytes)
+
 
 class Pfadwerkzeuge:
 	"""
@@ -259,6 +353,215 @@ class Prozessspeicherwerkzeuge:
 			else:
 				raise TypeError('Es können nur String- oder Byteobjekte überschrieben werden.')
 
+class SichererPuffer:
+	"""
+	Wiederverwendbarer, beschreibbarer Puffer für geheime Daten (z.B. entschlüsselte Blöcke oder Inhalte von
+	Schlüsseldateien). Anders als Bytesequenzen lässt er sich ohne Eingriff in die Objektstruktur des Interpreters
+	überschreiben. Der Speicher wird mittels mmap angefordert und - soweit das Betriebssystem es zulässt - gegen
+	Auslagerung gesperrt (mlock bzw. VirtualLock), andernfalls dient ein bytearray als Puffer. Befüllt wird der Puffer
+	über sMemoryview (z.B. mit readinto(...) oder update_into(...)). Nach Gebrauch ist schliesse() aufzurufen (oder der
+	Puffer als Kontextmanager zu verwenden).
+	"""
+	_sSperrfunktionenTuple = None
+
+	def __init__(self, pGroesseInteger):
+		"""
+		Fordert einen Puffer der Größe pGroesseInteger an.
+
+		:param pGroesseInteger: Größe des Puffers in Bytes
+		:type pGroesseInteger: Integer
+		"""
+		self.sGroesseInteger = pGroesseInteger
+		self.sGesperrtBoolean = False
+		try:
+			self._sPuffer = mmap.mmap(-1, max(pGroesseInteger, 1))
+		except (OSError, ValueError):
+			self._sPuffer = bytearray(pGroesseInteger)
+		else:
+			self.sGesperrtBoolean = self._sperre(True)
+		self.sMemoryview = memoryview(self._sPuffer)[:pGroesseInteger]
+
+	def __len__(self):
+		return self.sGroesseInteger
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, pTyp, pWert, pTraceback):
+		self.schliesse()
+
+	def ueberschreibe(self):
+		"""
+		Überschreibt den gesamten Puffer mit Nullbytes; der Puffer bleibt weiter verwendbar.
+		"""
+		if self.sGroesseInteger > 0 and self.sMemoryview is not None:
+			lCharArray = (ctypes.c_char * self.sGroesseInteger).from_buffer(self._sPuffer)
+			ctypes.memset(ctypes.addressof(lCharArray), 0, self.sGroesseInteger)
+			del lCharArray
+
+	def schliesse(self):
+		"""
+		Überschreibt den Puffer, hebt die Sperre gegen Auslagerung auf und gibt den Speicher frei. Mehrfacher Aufruf ist
+		zulässig.
+		"""
+		if self.sMemoryview is None:
+			return
+		self.ueberschreibe()
+		if self.sGesperrtBoolean is True:
+			self._sperre(False)
+			self.sGesperrtBoolean = False
+		self.sMemoryview.release()
+		self.sMemoryview = None
+		if isinstance(self._sPuffer, mmap.mmap):
+			try:
+				self._sPuffer.close()
+			except BufferError:
+				pass # Noch bestehende Ansichten des (bereits überschriebenen) Puffers, Freigabe durch Garbage Collection
+
+	## --- Interne Methoden
+
+	def _sperre(self, pSperrenBoolean):
+		"""
+		Interne Methode. Sperrt den mittels mmap angeforderten Puffer gegen Auslagerung (pSperrenBoolean=True) bzw. hebt
+		die Sperre auf (pSperrenBoolean=False).
+
+		:param pSperrenBoolean: Sperren (True) oder Sperre aufheben (False)
+		:type pSperrenBoolean: Boolean
+		:return: Erfolg (True: ja, False: nein)
+		:rtype: Boolean
+		"""
+		lSperrfunktionenTuple = SichererPuffer._gibSperrfunktionen()
+		if lSperrfunktionenTuple is None:
+			return False
+		try:
+			lCharArray = (ctypes.c_char * len(self._sPuffer)).from_buffer(self._sPuffer)
+			lAdresse = ctypes.c_void_p(ctypes.addressof(lCharArray))
+			del lCharArray
+			lErgebnisInteger = lSperrfunktionenTuple[0 if pSperrenBoolean is True else 1](lAdresse, ctypes.c_size_t(len(self._sPuffer)))
+		except Exception:
+			return False
+		if LiSKonstanten.C_PLATTFORM == 'nt':
+			return lErgebnisInteger != 0
+		return lErgebnisInteger == 0
+
+	@staticmethod
+	def _gibSperrfunktionen():
+		"""
+		Interne Methode. Returniert die Funktionen zum Sperren bzw. Entsperren von Speicherbereichen (mlock/munlock
+		bzw. VirtualLock/VirtualUnlock) oder None, falls nicht verfügbar.
+
+		:return: Sperr- und Entsperrfunktion
+		:rtype: Tupel oder None
+		"""
+		if SichererPuffer._sSperrfunktionenTuple is None:
+			try:
+				if LiSKonstanten.C_PLATTFORM == 'nt':
+					lBibliothek = ctypes.windll.kernel32
+					lSperrfunktionenTuple = (lBibliothek.VirtualLock, lBibliothek.VirtualUnlock)
+				else:
+					lBibliothek = ctypes.CDLL(None, use_errno=True)
+					lSperrfunktionenTuple = (lBibliothek.mlock, lBibliothek.munlock)
+				for lFunktion in lSperrfunktionenTuple:
+					lFunktion.argtypes = (ctypes.c_void_p, ctypes.c_size_t)
+				SichererPuffer._sSperrfunktionenTuple = lSperrfunktionenTuple
+			except (AttributeError, OSError):
+				SichererPuffer._sSperrfunktionenTuple = ()
+		return SichererPuffer._sSperrfunktionenTuple or None
+
+class Geheimnisregister:
+	"""
+	Sammelt die geheimen Werte (Bytesequenzen, bytearrays, SichererPuffer und - mit Bestätigung - Strings) eines
+	Geltungsbereichs, z.B. einer Programmfunktion oder einer Datei, und überschreibt sie beim Verlassen des Bereichs
+	gemeinsam in einem Durchlauf. Verwendung als Kontextmanager (with ...) oder über vernichteAlle(); das Register ist
+	danach wiederverwendbar. Registrierung und Vernichtung sind threadsicher.
+	"""
+	def __init__(self):
+		self._sGeheimnisseDictionary = dict() # id(Geheimnis) -> (Geheimnis, Bestätigung des Überschreibens von Strings)
+		self._sLock = threading.Lock()
+
+	def __len__(self):
+		return len(self._sGeheimnisseDictionary)
+
+	def __enter__(self):
+		return self
+
+	def __exit__(self, pTyp, pWert, pTraceback):
+		self.vernichteAlle()
+
+	def registriere(self, pGeheimnis, pStringBestaetigungBoolean=False):
+		"""
+		Registriert pGeheimnis zur späteren Vernichtung und returniert es (zur Verwendung in Zuweisungen). None wird
+		ignoriert, mehrfache Registrierung desselben Objekts ist unschädlich. Strings müssen über
+		pStringBestaetigungBoolean=True explizit zugelassen werden (vgl. Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(...)).
+
+		:param pGeheimnis: Geheimer Wert
+		:type pGeheimnis: Bytesequenz, bytearray, SichererPuffer oder String
+		:param pStringBestaetigungBoolean: Bestätigung des Überschreibens von Strings (True: ja, False: nein)
+		:type pStringBestaetigungBoolean: Boolean
+		:return: pGeheimnis
+		:rtype: wie pGeheimnis
+		"""
+		if pGeheimnis is not None:
+			if isinstance(pGeheimnis, str) and pStringBestaetigungBoolean is False:
+				raise ValueError('Strings können nur mit Bestätigung registriert werden.')
+			if not isinstance(pGeheimnis, (bytes, bytearray, str, SichererPuffer)):
+				raise TypeError('Es können nur Bytesequenzen, bytearrays, sichere Puffer oder Strings registriert werden.')
+			with self._sLock:
+				self._sGeheimnisseDictionary[id(pGeheimnis)] = (pGeheimnis, pStringBestaetigungBoolean)
+		return pGeheimnis
+
+	def vernichte(self, pGeheimnis):
+		"""
+		Überschreibt pGeheimnis sofort und entfernt es aus dem Register (z.B. bei Neuberechnung eines Schlüssels). None
+		wird ignoriert.
+
+		:param pGeheimnis: Geheimer Wert
+		:type pGeheimnis: Bytesequenz, bytearray, SichererPuffer oder String
+		"""
+		if pGeheimnis is not None:
+			with self._sLock:
+				lEintragTuple = self._sGeheimnisseDictionary.pop(id(pGeheimnis), None)
+			Geheimnisregister._ueberschreibe(pGeheimnis, lEintragTuple is not None and lEintragTuple[1])
+
+	def vernichteAlle(self):
+		"""
+		Überschreibt alle registrierten Werte und leert das Register. Strings werden nur überschrieben, wenn außerhalb
+		des Registers keine Verweise mehr auf sie bestehen.
+		"""
+		with self._sLock:
+			lEintraegeList = list(self._sGeheimnisseDictionary.values())
+			self._sGeheimnisseDictionary.clear()
+		while lEintraegeList:
+			lGeheimnis, lStringBestaetigungBoolean = lEintraegeList.pop()
+			if not isinstance(lGeheimnis, str) or sys.getrefcount(lGeheimnis) <= 2: # lGeheimnis und Argument von getrefcount
+				try:
+					Geheimnisregister._ueberschreibe(lGeheimnis, lStringBestaetigungBoolean)
+				except Exception:
+					pass # Überschreiben der übrigen Werte nicht verhindern
+			del lGeheimnis
+
+	## --- Interne Methoden
+
+	@staticmethod
+	def _ueberschreibe(pGeheimnis, pStringBestaetigungBoolean):
+		"""
+		Interne Methode. Überschreibt pGeheimnis abhängig von seinem Typ.
+
+		:param pGeheimnis: Geheimer Wert
+		:type pGeheimnis: Bytesequenz, bytearray, SichererPuffer oder String
+		:param pStringBestaetigungBoolean: Bestätigung des Überschreibens von Strings (True: ja, False: nein)
+		:type pStringBestaetigungBoolean: Boolean
+		"""
+		if isinstance(pGeheimnis, SichererPuffer):
+			pGeheimnis.schliesse()
+		elif isinstance(pGeheimnis, bytearray):
+			if len(pGeheimnis) > 0:
+				lCharArray = (ctypes.c_char * len(pGeheimnis)).from_buffer(pGeheimnis)
+				ctypes.memset(ctypes.addressof(lCharArray), 0, len(pGeheimnis))
+				del lCharArray
+		else:
+			Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(pGeheimnis, pStringBestaetigungBoolean)
+
 class Stringwerkzeuge:
 	"""
 	Stellt statische Methoden zur Stringverarbeitung zur Verfügung
@@ -294,8 +597,7 @@ class Stringwerkzeuge:
 		:rtype: String
 		"""
 		lLaengeInteger = SichereZufallswerkzeuge.erzeugeGanzeZufallszahlZwischen(1,pMaxLaengeInteger)
-		return ''.join(random.SystemRandom().choice(string.ascii_letters + '0123456789_')
-					   for i in range(lLaengeInteger))
+		return SichereZufallswerkzeuge.erzeugeZufaelligeZeichenfolge(string.ascii_letters + '0123456789_', lLaengeInteger)
 
 	@staticmethod
 	def erzeugeZufaelligenStringFuerSchluesseldatei(pLaengeInteger):
@@ -307,8 +609,7 @@ class Stringwerkzeuge:
 		:return: Zufällig Zeichenkombination aus Buchstaben in Groß- und Kleinschreibung, Ziffern, Interpunktionszeichen und Leerzeichen
 		:rtype: String
 		"""
-		return ''.join(random.SystemRandom().choice(string.ascii_letters + string.digits + string.punctuation + ' ')
-					   for i in range(pLaengeInteger))
+		return SichereZufallswerkzeuge.erzeugeZufaelligeZeichenfolge(string.ascii_letters + string.digits + string.punctuation + ' ', pLaengeInteger)
 
 	@staticmethod
 	def erzeugeZufaelligenStringFuerVernichtung(pLaengeInteger):
@@ -318,8 +619,7 @@ class Stringwerkzeuge:
 		:param pLaengeInteger: Avisierte Länge der zufälligen Zeichenkombination
 		:type pLaengeInteger: int
 		"""
-		return ''.join(random.SystemRandom().choice(string.ascii_letters + '0123456789_.-')
-					   for i in range(pLaengeInteger))
+		return SichereZufallswerkzeuge.erzeugeZufaelligeZeichenfolge(string.ascii_letters + '0123456789_.-', pLaengeInteger)
 
 	@staticmethod
 	def vergleicheVersionen(pVersion1String, pVersion2String):
@@ -368,6 +668,30 @@ class SichereZufallswerkzeuge:
 		"""
 		return os.urandom(pLaengeInteger)
 
+	@staticmethod
+	def erzeugeZufaelligeZeichenfolge(pZeichenString, pLaengeInteger):
+		"""
+		Returniert eine kryptografisch sichere zufällige Zeichenfolge der Länge pLaengeInteger aus den Zeichen von
+		pZeichenString (höchstens 256 Zeichen). Die Zufallsbytes werden gesammelt mittels os.urandom(...) angefordert
+		statt je Zeichen; Bytes oberhalb des größten Vielfachen der Zeichenanzahl werden verworfen, so dass alle Zeichen
+		gleich wahrscheinlich sind.
+
+		:param pZeichenString: Zulässige Zeichen
+		:type pZeichenString: String
+		:param pLaengeInteger: Länge der zu generierenden Zeichenfolge
+		:type pLaengeInteger: int
+		:return: Kryptografisch sichere zufällige Zeichenfolge
+		:rtype: String
+		"""
+		lAnzahlZeichenInteger = len(pZeichenString)
+		if not 0 < lAnzahlZeichenInteger <= 256:
+			raise ValueError('Zeichenvorrat muss 1 bis 256 Zeichen umfassen.')
+		lGrenzeInteger = 256 - 256 % lAnzahlZeichenInteger
+		lZeichenList = []
+		while len(lZeichenList) < pLaengeInteger:
+			lZeichenList.extend(pZeichenString[lByteInteger % lAnzahlZeichenInteger] for lByteInteger in os.urandom(pLaengeInteger - len(lZeichenList) + 8) if lByteInteger < lGrenzeInteger)
+		return ''.join(lZeichenList[:pLaengeInteger])
+
 	@staticmethod
 	def erzeugeGanzeZufallszahlZwischen(pUntergrenzeInteger, pObergrenzeInteger):
 		"""
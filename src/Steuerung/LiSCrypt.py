@@ -28,22 +28,16 @@ Landesintitut für Schule in Nordrhein-Westfalen entwickelt.
 """
 
 from Darstellung import LiSAnzeige
-from Modell import LiSAusnahmen, LiSKonfiguration, LiSKonstanten, LiSKrypto, LiSSingleton, LiSVernichtung
+from Modell import LiSAuftraege, LiSAusnahmen, LiSFortschritt, LiSInspektion, LiSKonfiguration, LiSKonstanten, LiSProfilierung, LiSSingleton, LiSZeitmessung
 from Sonstiges import LiSWerkzeuge
-
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf import scrypt, hkdf
-from cryptography.hazmat.backends import default_backend
+from Steuerung import LiSFunktionsausfuehrung, LiSKommandozeile
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 
-import base91
 import datetime
-import gc
 import logging
 import os
-import re
-import tempfile
+import time
 import traceback
 import sys
 
@@ -60,18 +54,26 @@ class QController:
 		# 1. Client oder Server starten:
 		self.sClientQClient = None
 		self.sServerQServer = None
-		try:
-			self.sClientQClient = LiSSingleton.QClient()
-		except:
+		self.sInstanzsperre = LiSSingleton.Instanzsperre()
+		lEndeDerWartezeitFloat = time.monotonic() + LiSKonstanten.C_INSTANZSPERRE_WARTEZEIT
+		while self.sClientQClient is None and self.sServerQServer is None:
 			try:
-				if LiSKonstanten.C_PLATTFORM != 'nt'\
-						or LiSSingleton.LiSCryptProzesse.ermittleAnzahlLaufenderLiSCryptProzesse() < 2: # Funktioniert nur sicher unter Windows
+				self.sClientQClient = LiSSingleton.QClient()
+			except RuntimeError:
+				if self.sInstanzsperre.erwirb() is True: # Master-Instanz ist, wer die Instanzsperre hält (bis Prozessende)
+					if LiSKonfiguration.Konfiguration.G_KONFIGURATION_EINGELESEN is False: # Nur die Master-Instanz benötigt die Konfigurationsdatei
+						LiSKonfiguration.Konfiguration.liesKonfigurationEin()
 					self.sServerQServer = LiSSingleton.QServer()
 					self.sServerQServer.start()
-					LiSKonfiguration.Konfiguration.G_SERVER_PORT = self.sServerQServer.gibPort()
-					LiSKonfiguration.Konfiguration.speichereKonfiguration()
-			except:
-				raise
+					if LiSSingleton.Nachrichtenprotokoll.nutztUnixSocket() is False: # Port für weitere Instanzen hinterlegen
+						LiSKonfiguration.Konfiguration.G_SERVER_PORT = self.sServerQServer.gibPort()
+						LiSKonfiguration.Konfiguration.speichereKonfiguration()
+				elif time.monotonic() < lEndeDerWartezeitFloat: # Eine gleichzeitig gestartete Instanz wird gerade Master-Instanz (oder beendet sich)
+					time.sleep(LiSKonstanten.C_INSTANZSPERRE_PRUEFINTERVALL)
+					if LiSSingleton.Nachrichtenprotokoll.nutztUnixSocket() is False: # Port wird erst nach dem Serverstart in die Konfigurationsdatei geschrieben
+						LiSKonfiguration.Konfiguration.liesKonfigurationEin()
+				else:
+					raise
 
 		if self.sServerQServer is not None:
 			self.sViewQView = LiSAnzeige.QView(self)
@@ -107,10 +109,19 @@ class QController:
 			# 7. Liste der Pfadangaben zu den zuletzt ggf. erzeugten Dateien zunächst mit None initialisieren:
 			self.sErweitertePfadeAllerZuletztErzeugtenDateienList = None
 
+			# 8. Auftragswarteschlange und Timer zu deren Abarbeitung erzeugen:
+			self.sAuftragswarteschlange = LiSAuftraege.Auftragswarteschlange()
+			self.sFunktionsstartAusstehendBoolean = False # True zwischen Start eines Funktionsstarterthreads und Aufruf von fuehreFunktionAus
+			self.sAuftragsQTimer = QtCore.QTimer()
+			self.sAuftragsQTimer.setSingleShot(True)
+			self.sAuftragsQTimer.timeout.connect(self._arbeiteAuftragswarteschlangeAb)
+
 	def starteFunktionAusParameterliste(self, pAufrufparameterList):
 		"""
-		Veranlasst den Start eines Funktionsstarterthreads anhand der Inhalte von pAufrufparameterList, sofern aktuell
-		keine Programmfunktion ausgeführt wird.
+		Reiht einen Auftrag anhand der Inhalte von pAufrufparameterList in die Auftragswarteschlange ein. Die
+		Abarbeitung beginnt nach Ablauf von LiSKonstanten.C_AUFTRAGSWARTESCHLANGE_SAMMELZEIT ohne weiteren Eingang, so
+		dass kurz nacheinander eingehende kombinierbare Aufträge (z.B. Start mehrerer Instanzen durch den Dateimanager)
+		mit einer einzigen Schlüsselabfrage ausgeführt werden.
 
 		:param pAufrufparameterList: Aufrufparameter
 		:type pAufrufparameterList: Liste von Strings
@@ -118,53 +129,69 @@ class QController:
 		lItemsAusgewaehltBoolean = True if len(pAufrufparameterList) > 4 else False
 		if lItemsAusgewaehltBoolean is True:
 			self.sViewQView.zeigeHauptfensterInNormalgroesseFallsMinimiert()
+			self.sAuftragswarteschlange.fuegeHinzu(pAufrufparameterList)
+			self.sAuftragsQTimer.start(LiSKonstanten.C_AUFTRAGSWARTESCHLANGE_SAMMELZEIT)
+
+	def _arbeiteAuftragswarteschlangeAb(self):
+		"""
+		Interne Methode. Startet den ältesten Auftrag der Auftragswarteschlange, sofern LiSCrypt weder beschäftigt noch
+		blockiert ist. Andernfalls (oder wenn danach noch Aufträge warten) erfolgt ein erneuter Versuch nach
+		LiSKonstanten.C_AUFTRAGSWARTESCHLANGE_PRUEFINTERVALL.
+		"""
+		if self.sAuftragswarteschlange.istLeer() is True:
+			return
+		if self._istLiSCryptBeschaeftigt() is False and self.istLiSCryptBlockiert() is False:
+			self._starteAuftrag(self.sAuftragswarteschlange.entnimm())
+		if self.sAuftragswarteschlange.istLeer() is False:
+			self.sAuftragsQTimer.start(LiSKonstanten.C_AUFTRAGSWARTESCHLANGE_PRUEFINTERVALL)
+
+	def _starteAuftrag(self, pAuftrag):
+		"""
+		Interne Methode. Veranlasst den Start eines Funktionsstarterthreads für pAuftrag.
+
+		:param pAuftrag: Auszuführender Auftrag
+		:type pAuftrag: LiSAuftraege.Auftrag
+		"""
+		self.sFunktionsStarterThread = QFunktionsstarterThread(pAuftrag.gibEintraege())
+
+		lFunktionBrauchtSchluesselBoolean = False
+		lStarteFunktionsstarterThreadBoolean = False
+
+		# pAuftrag.sLoggingString spezifiziert das Logging und wird an anderer Stelle ausgewertet
+		if pAuftrag.sFunktionString == 'encrypt':
+			self.sViewQView.aktiviereVerschluesseln()
+			lFunktionBrauchtSchluesselBoolean = True
+		elif pAuftrag.sFunktionString == 'decrypt':
+			self.sViewQView.aktiviereEntschluesseln()
+			lFunktionBrauchtSchluesselBoolean = True
+		else:
+			self.sViewQView.aktiviereVernichten()
+			lStarteFunktionsstarterThreadBoolean = True
+
+		if lFunktionBrauchtSchluesselBoolean is True: # Wurde LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL oder LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL gewählt?
+			if pAuftrag.sOriginaleString == 'wipeoriginals':
+				self.sViewQView.setzeOriginaleVernichten(True)
+			elif pAuftrag.sOriginaleString == 'keeporiginals':
+				self.sViewQView.setzeOriginaleVernichten(False)
 
-			if self._istLiSCryptBeschaeftigt() is True or self.istLiSCryptBlockiert() is True:
-				if self.istLiSCryptBlockiert() is False:
-					self.sViewQView.zeigeFehlerDialog('LiSCrypt ist gerade beschäftigt. Bitte wiederholen Sie Ihren Befehl später.')
+			if pAuftrag.sSchluesselartString == 'choose':
+				lSchluesselartString = self.sViewQView.zeigeSchluesselartwahlDialog()
 			else:
-				lItemsAusgewaehltBoolean = True if len(pAufrufparameterList) > 4 else False
-				if lItemsAusgewaehltBoolean is True:
-					lPfadeZuEintraegenList = pAufrufparameterList[3:]
-					self.sFunktionsStarterThread = QFunktionsstarterThread(lPfadeZuEintraegenList)
-
-					lFunktionBrauchtSchluesselBoolean = False
-					lStarteFunktionsstarterThreadBoolean = False
-
-					# pAufrufparameterList[0] spezifiziert das Logging und wird an anderer Stelle ausgewertet
-					if pAufrufparameterList[1] == 'encrypt':
-						self.sViewQView.aktiviereVerschluesseln()
-						lFunktionBrauchtSchluesselBoolean = True
-					elif pAufrufparameterList[1] == 'decrypt':
-						self.sViewQView.aktiviereEntschluesseln()
-						lFunktionBrauchtSchluesselBoolean = True
-					else:
-						self.sViewQView.aktiviereVernichten()
-						lStarteFunktionsstarterThreadBoolean = True
-
-					if lFunktionBrauchtSchluesselBoolean is True: # Wurde LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL oder LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL gewählt?
-						if pAufrufparameterList[2] == 'wipeoriginals':
-							self.sViewQView.setzeOriginaleVernichten(True)
-						elif pAufrufparameterList[2] == 'keeporiginals':
-							self.sViewQView.setzeOriginaleVernichten(False)
-
-						if pAufrufparameterList[3] == 'choose':
-							lSchluesselartString = self.sViewQView.zeigeSchluesselartwahlDialog()
-						else:
-							lSchluesselartString = pAufrufparameterList[3]
-						if lSchluesselartString == 'password':
-							self.sViewQView.waehleVerschluesselungMitPasswort_Kommandozeile()
-							lStarteFunktionsstarterThreadBoolean = True
-						elif lSchluesselartString == 'keyfile':
-							# Funktion nur ausführen, wenn tatsächlich eine Schlüsseldatei ausgewählt wurde
-							lStarteFunktionsstarterThreadBoolean = \
-								self.sViewQView.waehleVerschluesselungMitSchluesseldatei_Kommandozeile()
-
-					if lStarteFunktionsstarterThreadBoolean is True:
-						self._verbindeFunktionsStarterSlots()
-						self.sFunktionsStarterThread.start()
-					else:
-						self.sFunktionsStarterThread = None # Verweis FunktionsStarterThread löschen, falls dieser nicht gebraucht wird
+				lSchluesselartString = pAuftrag.sSchluesselartString
+			if lSchluesselartString == 'password':
+				self.sViewQView.waehleVerschluesselungMitPasswort_Kommandozeile()
+				lStarteFunktionsstarterThreadBoolean = True
+			elif lSchluesselartString == 'keyfile':
+				# Funktion nur ausführen, wenn tatsächlich eine Schlüsseldatei ausgewählt wurde
+				lStarteFunktionsstarterThreadBoolean = \
+					self.sViewQView.waehleVerschluesselungMitSchluesseldatei_Kommandozeile()
+
+		if lStarteFunktionsstarterThreadBoolean is True:
+			self._verbindeFunktionsStarterSlots()
+			self.sFunktionsstartAusstehendBoolean = True
+			self.sFunktionsStarterThread.start()
+		else:
+			self.sFunktionsStarterThread = None # Verweis FunktionsStarterThread löschen, falls dieser nicht gebraucht wird
 
 	def stoppeServerThread(self):
 		"""
@@ -172,16 +199,18 @@ class QController:
 		"""
 		if self.sServerQServer is not None:
 			self.sServerQServer.stop()
+			self.sServerQServer.wait(int(2000 * LiSKonstanten.C_IPC_SERVER_PRUEFINTERVALL)) # Schließen der Sockets abwarten
 
 	def warteAufViewEreignisse(self):
 		"""
 		Veranlasst die zentrale View-Komponente (self.sViewQView) den Qt-Event-Loop zu starten. Nach Abschluss oder bei Unterbrechung des
-		Qt-Event-Loops wird die Entfernung eines eventuell gemerkten Passworts aus dem Prozessspeicher veranlasst. Wird von der __main__-Umgebung aufgerufen.
+		Qt-Event-Loops wird die Entfernung eines eventuell gemerkten Passworts und gemerkter Schlüsseldatei-Hashwerte aus dem Prozessspeicher veranlasst. Wird von der __main__-Umgebung aufgerufen.
 		"""
 		try: # Auf die Nutzung des atexit-Moduls wird verzichtet, da die Funktionalität über try...finally vollständig abgedeckt wird.
 			self.sViewQView.warteAufEreignisse()
 		finally:
 			self.sViewQView.entferneGemerktesPasswortAusProzessspeicherFallsEinzigeReferenz() # falls noch gemerktes Passwort im Arbeitsspeicher
+			LiSFunktionsausfuehrung.Schluesseldateihashwerte.entferneAlle() # falls noch gemerkte Schlüsseldatei-Hashwerte im Arbeitsspeicher
 
 	def istMaster(self):
 		"""
@@ -211,6 +240,7 @@ class QController:
 		:param pSonderfunktionString: Angabe, ob eine Sonderfnuktionsbutton (Funktion wiederholen ('Wiederhoung"), Funktion umkehren ('Umkehrung')) betätigt wurde
 		:type pSonderfunktionString: String
 		"""
+		self.sFunktionsstartAusstehendBoolean = False # Ab hier ist LiSCrypt durch Dialoge blockiert bzw. durch den Funktionsausführer beschäftigt
 		lFunktionString = self.sViewQView.gibFunktion()
 		lOriginaleVernichtenStatusBoolean = self.sViewQView.gibOriginaleVernichtenStatus()
 		lSchluesselart = self.sViewQView.gibSchluesselart()
@@ -308,11 +338,11 @@ class QController:
 		:return: Ergebnis
 		:rtype Boolean
 		"""
-		lBeschaeftigtBoolean = False
-		if self.sFunktionsStarterThread is not None:
-			lBeschaeftigtBoolean = not self.sFunktionsStarterThread.isFinished()
-		elif self.sFunktionsausfuehrerThread is not None:
-				lBeschaeftigtBoolean = not self.sFunktionsausfuehrerThread.isFinished()
+		lBeschaeftigtBoolean = self.sFunktionsstartAusstehendBoolean
+		if self.sFunktionsStarterThread is not None and not self.sFunktionsStarterThread.isFinished():
+			lBeschaeftigtBoolean = True
+		if self.sFunktionsausfuehrerThread is not None and not self.sFunktionsausfuehrerThread.isFinished():
+			lBeschaeftigtBoolean = True
 		return lBeschaeftigtBoolean
 
 	# PyQt-Slots für QControllerWorker-Thread:
@@ -567,9 +597,11 @@ class QFunktionsstarterThread(QtCore.QThread):
 		lErweitertePfadeZuEintraegenlist = [LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lPfadString) for lPfadString in self.sPfadeZuEintraegenList]
 		self.C_FUNKTIONSSTART_SIGNAL.emit(lErweitertePfadeZuEintraegenlist)
 
-class QControllerWorkerThread(QtCore.QThread):
+class QControllerWorkerThread(QtCore.QThread, LiSFunktionsausfuehrung.Rueckmeldungen):
 	"""
-	Unterklasse von QtCore.QThread Thread zur die Ausführung von Programmfunktionen
+	Unterklasse von QtCore.QThread Thread zur die Ausführung von Programmfunktionen. Die Programmfunktion selbst wird
+	von einem LiSFunktionsausfuehrung.Funktionsausfuehrer ausgeführt, dessen Rückmeldungen und Rückfragen der Thread
+	als PyQt-Signale an die GUI weitergibt.
 	"""
 	# PyQt-Signale zur Interaktion mit der GUI definieren:
 	C_STATUSAENDERUNG_SIGNAL = QtCore.pyqtSignal(str, bool)
@@ -584,6 +616,10 @@ class QControllerWorkerThread(QtCore.QThread):
 	C_FUNKTION_UMKEHREN_BUTTON_SICHTBAR_SIGNAL = QtCore.pyqtSignal(list)
 	C_FUNKTION_WIEDERHOLEN_BUTTON_SICHTBAR_SIGNAL = QtCore.pyqtSignal(bool)
 
+	# Zuordnung der Buttons des Überschreiben-Dialogs zu den Antworten des Funktionsausfuehrers:
+	C_UEBERSCHREIBENDIALOG_ANTWORTEN = {QtWidgets.QMessageBox.Yes: LiSKonstanten.C_UEBERSCHREIBEN_JA,
+										QtWidgets.QMessageBox.No: LiSKonstanten.C_UEBERSCHREIBEN_NEIN}
+
 	def __init__(self, pSortierteBereinigteDragAndDropsErweitertePfadeList, pFunktionString, pOriginaleVernichtenStatusBoolean, pSchluesselartStrirng, pErweiterterPfadZuSchluesseldateiString):
 		"""
 		Initiallisiert ein Objekt der Klasse QControllerWorkerThread
@@ -601,1204 +637,73 @@ class QControllerWorkerThread(QtCore.QThread):
 		:type pErweiterterPfadZuSchluesseldateiString: String
 		"""
 		super(QControllerWorkerThread, self).__init__()
-
-		# Allgemeine globale Werte:
-		self.sSortierteBereinigteDragAndDropsList = pSortierteBereinigteDragAndDropsErweitertePfadeList
-		self.sFunktionString = pFunktionString
-		self.sOriginaleVernichtenStatusBoolean = pOriginaleVernichtenStatusBoolean
-		self.sSchluesselartString = pSchluesselartStrirng
-		self.sErweiterterPfadZuSchluesseldateiString = pErweiterterPfadZuSchluesseldateiString
-		self.sStartZeitpunktAusgegebenBoolean = False
-		self.sDateilistenAnzeigeFehlerImProzessBoolean = False
-		self.sErweitertePfadeAllerErzeugtenDateienList = []
-
-		# Globale Werte zur Schlüsselableitung:
-		self.sInitialesScryptSaltBytes = None
-		self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN = None # geheim
-		self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN = None # geheim
-		self.sAESGCMV3SchluesselBytes_LOESCHEN = None # geheim
-		self.sChaCha20V3SchluesselBytes_LOESCHEN = None # geheim
-		self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = None # geheim
-
-		# Zähler für die Obergrenze von Dateien, die bei Verwendung von AES-GCM mit demselben Schlüssel
-		# verschlüsselt werden dürfen:
-		self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger = 0
-
-		# Zähler für die Obergrenze von Dateien, die bei Verwendung von ChaCha20 mit demselben Schlüssel
-		# verschlüsselt werden dürfen:
-		self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger = 0
-
-		# Flag für Stopp des Threads:
-		self.sFunktionsprozessAktivBoolean = False
+		self._sStatusTextString = None
+		self._sAbbrechenButtonAktivBoolean = False
+		self._sFortschrittTextString = None
+		self.sFunktionsausfuehrer = LiSFunktionsausfuehrung.Funktionsausfuehrer(pSortierteBereinigteDragAndDropsErweitertePfadeList, pFunktionString,
+																				pOriginaleVernichtenStatusBoolean, pSchluesselartStrirng,
+																				pErweiterterPfadZuSchluesseldateiString, pRueckmeldungen=self)
 
 	def run(self):
 		"""
 		Überschriebene Methode der Oberklasse QtCore.QThread. Wird durch QThread.start automatisch aufgerufen.
 		"""
-		self.sFunktionsprozessAktivBoolean = True
 		try:
-			self.fuehreFunktionAus()
-		except Exception as lException:
-			self._zeigeFehlerDialogModal('Unbekannter schwerer Fehler.')
-			logging.exception(
-				datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Funktionsausführung')
+			LiSProfilierung.Profilierung.fuehreAus(self.sFunktionsausfuehrer.fuehreAus)
 		finally:
-			self.sFunktionsprozessAktivBoolean = False # Nur relevant, wenn Prozess nicht durch Nutzer ("Abbrechen"-Button) angehalten wurde
-			self.setzeStatusleisteUndGUIZustand()
-			self.C_FUNKTION_UMKEHREN_BUTTON_SICHTBAR_SIGNAL.emit(self.sErweitertePfadeAllerErzeugtenDateienList)
-			self.C_FUNKTION_WIEDERHOLEN_BUTTON_SICHTBAR_SIGNAL.emit(self.sDateilistenAnzeigeFehlerImProzessBoolean)
-
-	def fuehreFunktionAus(self):
-		"""
-		Führt die in in self.sFunktionString festgelegte Programmfunktion aus.
-		"""
-		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is not None or self.sInitialesScryptSaltBytes is not None: # Vermeidung einer Wiederholung des Scrypt-Hashes
-			raise AssertionError('Initialer Scrypt-Hash vor Funktionsausfühurng bereis vorhanden.')
-
-		lPasswortString_LOESCHEN = None
-		lSHA512HashwertBytes_LOESCHEN = None
-		lSHA256HashwertBytes_LOESCHEN = None
-		try: # Absicherung, damit Überschreiben sensibler Informationen auch bei Fehlern in Except-Blöcken stattfindet
-			# Entsprechende Funktionsmethode aufrufen:
-			if self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL:
-				for lDragAndDropElementString in self.sSortierteBereinigteDragAndDropsList:
-					try: #Durch try und except wird ausgeschlossen, dass Originaldateien ohne Verschlüsselung vernichtet werden
-						if self.sSchluesselartString == LiSKonstanten.C_SCHLUESSELART_PASSWORT_LITERAL:
-							if lPasswortString_LOESCHEN is None:
-								lPasswortString_LOESCHEN = self._zeigePasswortDialog()
-								lSHA512HashwertBytes_LOESCHEN = self._berechneSHA512(pPasswortString=lPasswortString_LOESCHEN)
-								self._gibStartzeitpunktAus()
-
-								lClipboard = QtWidgets.QApplication.clipboard()
-								if lClipboard.text() == lPasswortString_LOESCHEN:
-									self._zeigeWarnDialogModal(
-										'Die Zwischenablage enthält Ihr Passwort! Aus Sicherheitsgründen wird die Zwischenablage jetzt geleert.')
-									self._leereZwischenablage()
-									self.ergaenzeBerichtAusgabe('* Zwischenablage geleert')
-						else: #d.h. Schlüsseldatei:
-							if lSHA512HashwertBytes_LOESCHEN is None:
-								self.setzeStatusleisteUndGUIZustand('Schlüsseldatei verarbeiten...')
-								lSHA512HashwertBytes_LOESCHEN = self._berechneSHA512(
-									pErweiterterPfadZuSchluesseldateiString=self.sErweiterterPfadZuSchluesseldateiString)
-								self._gibStartzeitpunktAus()
-						self._verschluessle(lDragAndDropElementString, lSHA512HashwertBytes_LOESCHEN)
-
-					except LiSAusnahmen.QNoPasswordError:
-						break
-					except LiSAusnahmen.QFileListDisplayError as lException:
-						if not isinstance(lException, LiSAusnahmen.QFileSkippedByUserError):
-							self.sDateilistenAnzeigeFehlerImProzessBoolean = True
-						self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
-						logging.exception(
-							datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Verschlüsselung')
-					except LiSAusnahmen.QProcessStoppedByUserError as lException:
-						self.ergaenzeBerichtAusgabe('-- Abbruch durch Nutzer --')
-						break
-					except Exception as lException:
-						logging.exception(
-							datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Verschlüsselung')
-						self._zeigeFehlerDialogModal(str(lException))
-						break
-
-			elif self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL:
-				for lDragAndDropElementString in self.sSortierteBereinigteDragAndDropsList:
-					try: #Durch try und except wird ausgeschlossen, dass verschlüsselte Dateien ohne Entschlüsselung vernichtet werden
-						if self.sSchluesselartString == LiSKonstanten.C_SCHLUESSELART_PASSWORT_LITERAL:
-							if lPasswortString_LOESCHEN is None:
-								lPasswortString_LOESCHEN = self._zeigePasswortDialog(pMitBestaetigungBoolean=False)
-								lSHA256HashwertBytes_LOESCHEN = self._berechneSHA256(pPasswortString=lPasswortString_LOESCHEN)
-								lSHA512HashwertBytes_LOESCHEN = self._berechneSHA512(pPasswortString=lPasswortString_LOESCHEN)
-								self._gibStartzeitpunktAus()
-
-								lClipboard = QtWidgets.QApplication.clipboard()
-								if lClipboard.text() == lPasswortString_LOESCHEN:
-									self._zeigeWarnDialogModal(
-										'Die Zwischenablage enthält Ihr Passwort! Aus Sicherheitsgründen wird die Zwischenablage jetzt geleert.')
-									self._leereZwischenablage()
-									self.ergaenzeBerichtAusgabe('* Zwischenablage geleert')
-						else:
-							if lSHA512HashwertBytes_LOESCHEN is None: # Gedacht: 'or lSHA256Hashwert is None'
-								self.setzeStatusleisteUndGUIZustand('Schlüsseldatei verarbeiten...')
-								lSHA256HashwertBytes_LOESCHEN = self._berechneSHA256(
-									pErweiterterPfadZuSchluesseldateiString=self.sErweiterterPfadZuSchluesseldateiString)
-								lSHA512HashwertBytes_LOESCHEN = self._berechneSHA512(
-									pErweiterterPfadZuSchluesseldateiString=self.sErweiterterPfadZuSchluesseldateiString)
-								self._gibStartzeitpunktAus()
-						self._entschluessle(pErweiterterPfadString=lDragAndDropElementString, pSHA256HashwertBytes=lSHA256HashwertBytes_LOESCHEN, pSHA512HashwertBytes=lSHA512HashwertBytes_LOESCHEN)
-
-					except LiSAusnahmen.QNoPasswordError:
-						break
-					except LiSAusnahmen.QFileListDisplayError as lException:
-						if not isinstance(lException, LiSAusnahmen.QFileSkippedByUserError):
-							self.sDateilistenAnzeigeFehlerImProzessBoolean = True
-						self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
-						logging.exception(
-							datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Entschlüsselung')
-					except LiSAusnahmen.QProcessStoppedByUserError:
-						self.ergaenzeBerichtAusgabe('-- Abbruch durch Nutzer --')
-						break
-					except Exception as lException:
-						logging.exception(
-							datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Entschlüsselung')
-						self._zeigeFehlerDialogModal(str(lException))
-						break
-
-			else: # d.h. self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL
-				self._gibStartzeitpunktAus()
-				for lDragAndDropElementString in self.sSortierteBereinigteDragAndDropsList:
-					try:
-						self.vernichte(pErweiterterPfadString=lDragAndDropElementString)
-					except LiSAusnahmen.QFileListDisplayError as lException:
-						self.sDateilistenAnzeigeFehlerImProzessBoolean = True
-						self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
-						logging.exception(
-							datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung')
-					except LiSAusnahmen.QProcessStoppedByUserError:
-						self.ergaenzeBerichtAusgabe('-- Abbruch durch Nutzer --')
-						break
-					except Exception as lException:
-						logging.exception(
-							datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung')
-						self._zeigeFehlerDialogModal(str(lException))
-						break
-		except:
-			pass
-
-		finally:
-			# Überschreiben aller zuletzt (potentiell) erzeugten geheimen Werte (diese werden
-			# im Prozess ebenfalls zunächst mit 0-Bytes überschrieben, wenn es zu einer Neuberechnung kommt)
-			if sys.getrefcount(lPasswortString_LOESCHEN) <= 2: # lPasswortString_LOESCHEN und Interning-Verweis
-				LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lPasswortString_LOESCHEN, pStringBestaetigungBoolean=True)
-
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA512HashwertBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sAESGCMV3SchluesselBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sChaCha20V3SchluesselBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN)
-
-			# Globale Referenzen freigeben (diese werden im Prozess ebenfalls freigegeben, wenn es zu einer
-			# Neuberechnung kommt; lokale Variablen werden hier der Klarheit halber auch berücksichtigt,
-			# obwohl dies nicht erforderlich wäre, da die Methode hier endet.
-			try:
-				del lPasswortString_LOESCHEN
-			except AttributeError:
-				pass
-			finally:
-				try:
-					del lSHA256HashwertBytes_LOESCHEN
-				except AttributeError:
-					pass
-				finally:
-					try:
-						del lSHA512HashwertBytes_LOESCHEN
-					except AttributeError:
-						pass
-					finally:
-						try:
-							del self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN
-						except AttributeError:
-							pass
-						finally:
-							try:
-								del self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN
-							except AttributeError:
-								pass
-							finally:
-								try:
-									del self.sAESGCMV3SchluesselBytes_LOESCHEN
-								except AttributeError:
-									pass
-								finally:
-									try:
-										del self.sChaCha20V3SchluesselBytes_LOESCHEN
-									except AttributeError:
-										pass
-									finally:
-										try:
-											del self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN
-										except AttributeError:
-											pass
-										finally:
-											gc.collect() # Am Ende eine komplette Garbage Collection auslösen
-
-			#Ausgabe von Endzeitpunkt und Probleminformationen, falls erforderlich
-			self._gibEndzeitpunktAusFallsErforderlich()
-			self._zeigeProbleminfoFallsErforderlich()
-
-
-	def _verschluessle(self, pErweiterterPfadString, pSHA512HashwertBytes):
-		"""
-		Interne Methode. Analysiert das durch pErweiterterPfadString für die Verschlüsselung bestimmte Element des
-		Dateisystems (Datei oder Verzeichnis?) und veranlasst die weitere Verarbeitung.
-
-		:param pErweiterterPfadString: Erweiterte Pfadangabe zum durch pErweiterterPfadString gehörigen Verzeichniseintrag
-		:type pErweiterterPfadString: String
-		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA512HashwertBytes: Bytesequenz
-		"""
-		if not os.path.islink(pErweiterterPfadString) and not LiSWerkzeuge.Dateiwerkzeuge.istFIFO(pErweiterterPfadString) \
-				and (not os.name == 'nt' or (not os.path.isfile(pErweiterterPfadString) or not pErweiterterPfadString.lower().endswith('.lnk'))):
-			if os.path.exists(pErweiterterPfadString):
-				if os.path.isfile(pErweiterterPfadString):
-					# Alle Exceptions werden zum Aufrufer weitergereicht
-					if self.sSchluesselartString != LiSKonstanten.C_SCHLUESSELART_SCHLUESSELDATEI_LITERAL or self.sErweiterterPfadZuSchluesseldateiString != pErweiterterPfadString:
-						self._verschluessleDatei(pErweiterterPfadZuDateiString=pErweiterterPfadString, pSHA512HashwertBytes=pSHA512HashwertBytes)
-					else:
-						lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-						lNurEndnameString = os.path.basename(lNameReduziertString)
-						raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Schlüsseldatei]', lNameReduziertString)
-				elif os.path.isdir(pErweiterterPfadString):
-					# Alle Exceptions werden zum Aufrufer weitergereicht
-					self._verschluessleVerzeichnis(pErweiterterPfadZuVerzeichnisString=pErweiterterPfadString, pSHA512HashwertBytes=pSHA512HashwertBytes)
-				else:
-					lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-					lNurEndnameString = os.path.basename(lNameReduziertString)
-					raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Unbekannter Typ]', lNameReduziertString)
-			else:
-				lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-				lNurEndnameString = os.path.basename(lNameReduziertString)
-				raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Ver-/Entschlüsselung: Nicht gefunden]', lNameReduziertString)
-		else:
-			lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-			lNurEndnameString = os.path.basename(lNameReduziertString)
-			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Verknüpfung/FIFO]', lNameReduziertString)
-
-	def _verschluessleDatei(self, pErweiterterPfadZuDateiString, pSHA512HashwertBytes):
-		"""
-		Interne Methode. Veranlasst die Verschlüsselung der urch pErweitererPfadZuDateiString spezifizierten Datei unter
-		Verwendung des Hashes pSHA512HashwertBytes als Schlüsselausgangsmaterial.
-
-		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zu einer Datei
-		:type pErweiterterPfadZuDateiString: String
-		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA512HashwertBytes: Bytesequenz
-		"""
-		lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
-		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiString)
-
-		if self.sOriginaleVernichtenStatusBoolean is False or LiSWerkzeuge.Dateiwerkzeuge.istBeschreibbar(pErweiterterPfadZuDateiString):
-			lNurVorPfadString = os.path.dirname(pErweiterterPfadZuDateiString)
-			lNurEndnameMitErsetzungString = LiSWerkzeuge.Stringwerkzeuge.rreplace(lNurEndnameString, '.', '-', 1) + LiSKonstanten.C_DATEIENDUNG
-			lErweiterterPfadZuZieldateiString = os.path.join(lNurVorPfadString, lNurEndnameMitErsetzungString)
-
-			if not os.path.lexists(lErweiterterPfadZuZieldateiString):
-				# Alle Exceptions werden zum Aufrufer weitergereicht
-				LiSKrypto.QDatei(self, pErweiterterPfadZuDateiString).verschluesseln(pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=lErweiterterPfadZuZieldateiString)
-				self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Verschlüsselung OK]', lDateinameReduziertString)
-				self.sErweitertePfadeAllerErzeugtenDateienList.append(lErweiterterPfadZuZieldateiString)  # Wenn die Verschlüsselung gelungen ist, dann wurde auch eine Datei erzeugt
-				if self.sOriginaleVernichtenStatusBoolean is True:
-					self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiString)
-			else:
-				lUeberschreibenInteger = self._zeigeUeberschreibenDialog(lErweiterterPfadZuZieldateiString)
-				# Alle Exceptions werden zum Aufrufer weitergereicht
-				if lUeberschreibenInteger == QtWidgets.QMessageBox.Yes:
-					self.vernichte(lErweiterterPfadZuZieldateiString)
-					LiSKrypto.QDatei(self, pErweiterterPfadZuDateiString).verschluesseln(pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=lErweiterterPfadZuZieldateiString)
-					self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Verschlüsselung OK]', lDateinameReduziertString)
-					self.sErweitertePfadeAllerErzeugtenDateienList.append(lErweiterterPfadZuZieldateiString)  # Wenn die Verschlüsselung gelungen ist, dann wurde auch eine Datei erzeugt
-					if self.sOriginaleVernichtenStatusBoolean is True:
-						self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiString)
-				elif lUeberschreibenInteger == QtWidgets.QMessageBox.No:
-					raise LiSAusnahmen.QFileListDisplayError((lNurEndnameString + ': [Übersprungen: Nutzer-Auswahl]'), lDateinameReduziertString)
-				else: #d.h. lUeberschreibenBoolean=None -Auswahl von 'Abbrechen' im Dialogfenster
-					self.stoppeFunktionsprozess()
-					raise LiSAusnahmen.QProcessStoppedByUserError()
-		else:
-			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Kein Schreibzugriff]', lDateinameReduziertString)
-
-	def _verschluessleVerzeichnis(self, pErweiterterPfadZuVerzeichnisString, pSHA512HashwertBytes):
-		"""
-		Interne Methode. Durchläuft das durch pErweitererPfadZuVerzeichnisString spezifizierte Verzeichnis sowie dessen
-		Unterverzeichnisse und ruft für alle gefundenen Dateien ohne Endung LiSKonstanten.C_DATEIENDUNG die Methode self._verschluessle(...) auf
-
-		:param pErweiterterPfadZuVerzeichnisString: Erweiterte Pfadangabe zu einem Verzeichnis
-		:type pErweiterterPfadZuVerzeichnisString: String
-		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA512HashwertBytes: Bytesequenz
-		"""
-		for lWurzel, lVerzeichnisse, lDateien in os.walk(pErweiterterPfadZuVerzeichnisString):
-			for lDateiname in lDateien:
-				if not str.lower(lDateiname).endswith(LiSKonstanten.C_DATEIENDUNG):
-					lDateinameMitPfadString = os.path.join(lWurzel, lDateiname)
-					lDateinameMitPfadErweitertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lDateinameMitPfadString)
-					try:
-						self._verschluessle(lDateinameMitPfadErweitertString, pSHA512HashwertBytes)
-					except LiSAusnahmen.QFileListDisplayError as lException:
-						# Spezielle Behandlung von QFileListDisplayErrors
-						# Alle anderen Exceptions werden zum Aufrufer weitergereicht
-						self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
-						logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Verschlüsselung')
-
-	def _entschluessle(self, pErweiterterPfadString, pSHA256HashwertBytes, pSHA512HashwertBytes):
-		"""
-		Interne Methode. Analysiert das durch pErweiterterPfadString für die Entschlüsselung bestimmte Element des
-		Dateisystems (Datei oder Verzeichnis?) und veranlasst die weitere Verarbeitung.
-
-		:param pErweiterterPfadString: Erweiterte Pfadangabe zum Element des Dateisystems
-		:type pErweiterterPfadString: String
-		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA256HashwertBytes: Bytesequenz
-		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA512HashwertBytes: Bytesequenz
-		"""
-		if not os.path.islink(pErweiterterPfadString) \
-				and not LiSWerkzeuge.Dateiwerkzeuge.istFIFO(pErweiterterPfadString): # Keine Prüfung auf *.lnk, da hier nur Dateien mit Endung LiSKonstanten.C_DATEIENDUNG ankommen:
-			if os.path.exists(pErweiterterPfadString):
-				if os.path.isfile(pErweiterterPfadString) and str.lower(pErweiterterPfadString).endswith(LiSKonstanten.C_DATEIENDUNG):
-						try:
-							self._entschluessleDatei(pErweiterterPfadZuDateiString=pErweiterterPfadString, pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes)
-						except (LiSAusnahmen.QFileListDisplayError, LiSAusnahmen.QProcessStoppedByUserError):
-							raise
-				elif os.path.isdir(pErweiterterPfadString):
-					try:
-						self._entschluessleVerzeichnis(pErweiterterPfadZuVerzeichnisString=pErweiterterPfadString, pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes)
-					except (LiSAusnahmen.QFileListDisplayError, LiSAusnahmen.QProcessStoppedByUserError):
-						raise
-				else:
-					lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-					lNurEndnameString = os.path.basename(lNameReduziertString)
-					raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Unbekannter Typ]', lNameReduziertString)
-			else:
-				lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-				lNurEndnameString = os.path.basename(lNameReduziertString)
-				raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Ver-/Entschlüsselung: Nicht gefunden]', lNameReduziertString)
-		else:
-			lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-			lNurEndnameString = os.path.basename(lNameReduziertString)
-			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Verknüpfung/FIFO]', lNameReduziertString)
-
-	def _entschluessleDatei(self, pErweiterterPfadZuDateiString, pSHA256HashwertBytes, pSHA512HashwertBytes):
-		"""
-		Interne Methode. Veranlasst die Entschlüsselung der durch pErweitererPfadZuDateiString spezifizierten Datei unter
-		Verwendung des Hashes pSHA256HashwertBytes oder des Hashes pSHA512HashwertBytes als Schlüsselausgangsmaterial.
-
-		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zu einer Datei
-		:type pErweiterterPfadZuDateiString: String
-		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA256HashwertBytes: Bytesequenz
-		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA512HashwertBytes: Bytesequenz
-		"""
-		lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
-		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiString)
-		lReduzierterPfadZuDateiString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
-
-		erweiterterPfadZuTempCerzeichnisString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(tempfile.gettempdir())
-		if pErweiterterPfadZuDateiString.startswith(erweiterterPfadZuTempCerzeichnisString):
-			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Entschlüsselungsort nicht zulässig]',
-													 lReduzierterPfadZuDateiString)
-		else:
-			if self.sOriginaleVernichtenStatusBoolean is False or LiSWerkzeuge.Dateiwerkzeuge.istBeschreibbar(pErweiterterPfadZuDateiString):
-				# Alle Exceptions werden zum Aufrufer weitergereicht
-				lZieldateinameString = None
-				while lZieldateinameString is None or os.path.lexists(lZieldateinameString):
-					# Erzeuge zufälligen temporären Dateinamen für Entschlüsselung
-					lZielNurEndnameString = LiSWerkzeuge.Stringwerkzeuge.erzeugeZufaelligenBuchstabenUndZiffernStringMitMaximalerLaenge(len(lNurEndnameString)) # Wg. Endung 'LiSKonstanten.C_DATEIENDUNG' ist kleinste Maximallänge 5 (sollte im Regelfall ausreichen)
-					lZieldateinameVorEndnameString = os.path.split(pErweiterterPfadZuDateiString)[0]
-					lZieldateinameString = os.path.join(lZieldateinameVorEndnameString,lZielNurEndnameString)
-
-				lErweiterterPfadZuZieldateiString = LiSKrypto.QDatei(self, pErweiterterPfadZuDateiString).entschluesseln(pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=lZieldateinameString)
-				self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Entschlüsselung OK]', lDateinameReduziertString)
-				self.sErweitertePfadeAllerErzeugtenDateienList.append(lErweiterterPfadZuZieldateiString) # Wenn die Entschlüsselung gelungen ist, dann wurde auch eine Datei erzeugt
-				if self.sOriginaleVernichtenStatusBoolean is True:
-					self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiString)
-			else:
-				raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Kein Schreibzugriff]', lDateinameReduziertString)
-
-	def _entschluessleVerzeichnis(self, pErweiterterPfadZuVerzeichnisString, pSHA256HashwertBytes, pSHA512HashwertBytes):
-		"""
-		Interne Methode. Durchläuft das durch pErweitererPfadZuVerzeichnisString spezifizierte Verzeichnis sowie dessen
-		Unterverzeichnisse und ruft für alle gefundenen Dateien mit Endung LiSKonstanten.C_DATEIENDUNG die Methode self._entschluessle(...) auf
-
-		:param pErweiterterPfadZuVerzeichnisString: Erweiterte Pfadangabe zu einem Verzeichnis
-		:type pErweiterterPfadZuVerzeichnisString: String
-		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA256HashwertBytes: Bytesequenz
-		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
-		:type pSHA512HashwertBytes: Bytesequenz
-		"""
-		for lWurzel, lVerzeichnisse, lDateien in os.walk(pErweiterterPfadZuVerzeichnisString):
-			for lDateiname in lDateien:
-				if str.lower(lDateiname).endswith(LiSKonstanten.C_DATEIENDUNG):
-					lDateinameMitPfadString = os.path.join(lWurzel, lDateiname)
-					lDateinameMitPfadErweitertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lDateinameMitPfadString)
-					try:
-						self._entschluessle(pErweiterterPfadString=lDateinameMitPfadErweitertString, pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes)
-					except LiSAusnahmen.QFileListDisplayError as lException:
-						# Spezielle Behandlung von QFileListDisplayErrors
-						# Alle anderen Exceptions werden zum Aufrufer weitergereicht
-						self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
-						logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Entschlüsselung')
-
-	def vernichte(self, pErweiterterPfadString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=False):
-		"""
-		Analysiert das durch pErweiterterPfadString für die Vernichtung bestimmte Element des Dateisystems (Datei oder
-		Verzeichnis?) und veranlasst die weitere Verarbeitung. Wird intern und von LiSKrypto.Datei()-Instanzen verwendet.
-
-		:param pErweiterterPfadString: Erweiterte Pfadangabe
-		:type pErweiterterPfadString: String
-		:param pAusgabeEintragsnameBoolean: Angabe, ob die Vernichtung im Berichtsbereich angezeigt werden soll (true: ja, false: nein)
-		:type pAusgabeEintragsnameBoolean: Boolean
-		"""
-		# Alle Exceptions werden zum Aufrufer weitergereicht
-		#self.setzeStatusleisteZustand('Vernichtung läuft...', True)
-		if os.path.lexists(pErweiterterPfadString):
-			if os.path.isdir(pErweiterterPfadString):
-				self._vernichteVerzeichnis(pErweiterterPfadZuVerzeichnisString=pErweiterterPfadString,
-										   pAusgabeEintragsnameBoolean=pAusgabeEintragsnameBoolean,
-										   pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
-			else:
-				self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiOderVerweisOderFIFOString=pErweiterterPfadString,
-														pAusgabeEintragsnameBoolean=pAusgabeEintragsnameBoolean,
-														pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
-		else:
-			lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
-			lNurEndnameString = os.path.basename(lNameReduziertString)
-			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Vernichtung: Nicht gefunden]', lNameReduziertString)
-
-	def _vernichteDateiOderVerweisOderFIFO(self, pErweiterterPfadZuDateiOderVerweisOderFIFOString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=False):
-		"""
-		Interne Methode. Veranlasst die Vernichtung der/des durch pErweitererPfadZuDateiString spezifizierten
-		Datei/symbolischen Links
-
-		:param pErweiterterPfadZuDateiOderVerweisOderFIFOString: Erweiterte Pfadangabe zu einer Datei
-		:type pErweiterterPfadZuDateiOderVerweisOderFIFOString: String
-		:param pAusgabeEintragsnameBoolean: Angabe, ob die Vernichtung im Berichtsbereich angezeigt werden soll (true: ja, false: nein)
-		:type pAusgabeEintragsnameBoolean: Boolean
-		"""
-		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiOderVerweisOderFIFOString)
-		if pAusgabeEintragsnameBoolean is True:
-			self.setzeStatusleisteUndGUIZustand(pTextString='Vernichtung: ' + lNurEndnameString, pAbbrechenButtonAktivBoolean=True)
-		else:
-			self.setzeStatusleisteUndGUIZustand(pTextString='Vernichtung: Temporäre Datei', pAbbrechenButtonAktivBoolean=True)
-
-		# Alle Exceptions werden zum Aufrufer weitergereicht
-		lWindowsWipeBoolean = LiSVernichtung.QVerzeichniseintrag(self, pErweiterterPfadZuDateiOderVerweisOderFIFOString).vernichten(pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
-		if pAusgabeEintragsnameBoolean is True:
-			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiOderVerweisOderFIFOString)
-			self.ergaenzeBerichtAusgabe(lNurEndnameString + (': [Vernichtung OK]' if lWindowsWipeBoolean is False else ': [Vernichtung  OK]'), lDateinameReduziertString)
-		else:
-			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiOderVerweisOderFIFOString)
-			self.ergaenzeBerichtAusgabe('Temporäre Datei' + (': [Vernichtung OK]' if lWindowsWipeBoolean is False else ': [Vernichtung  OK]'), lDateinameReduziertString)
-
-	def _vernichteVerzeichnis(self, pErweiterterPfadZuVerzeichnisString, pAusgabeEintragsnameBoolean, pIgnoriereFunktionsprozessAktivBoolean):
-		"""
-		Interne Methode. Durchläuft das durch pErweitererPfadZuVerzeichnisString spezifizierte Verzeichnis sowie dessen
-		Unterverzeichnisse und ruft für alle gefundenen Verzeichnisse self._vernichteVerzeichnis(...) sowie
-		für alle gefundenen Dateien/Verweise self._vernichteDateiOderVerweis(...) auf
-
-		:param pErweiterterPfadZuVerzeichnisString: Erweiterte Pfadangabe zu einem Verzeichnis
-		:type pErweiterterPfadZuVerzeichnisString: String
-		:param pAusgabeEintragsnameBoolean: Festlegung, ob der Verzeichnisname und die Namen der im Verzeichnis enthaltenen Dateien bei der Vernichtung ausgegeben werden sollen (True: ja, False: nein)
-		:type pAusgabeEintragsnameBoolean: Boolean
-		:param pIgnoriereFunktionsprozessAktivBoolean: Festlegung, ob die Vernichtung auch durchgeführt werden soll, wenn bereits ein Funktionsprozess läuft (True: ja, False: nein)
-		:type pIgnoriereFunktionsprozessAktivBoolean: Boolean
-
-		"""
-		for lWurzel, lVerzeichnisse, lDateien in os.walk(pErweiterterPfadZuVerzeichnisString):
-			for lVerzeichnisnameString in lVerzeichnisse:
-				lVerzeichnisnameMitPfadString = os.path.join(lWurzel, lVerzeichnisnameString)
-				lVerzeichnisnameMitPfadErweitertString	= LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lVerzeichnisnameMitPfadString)
-				# Weitergabe einer potentiellen Exception des folgenden Befehls an den Aufrufer
-				self._vernichteVerzeichnis(lVerzeichnisnameMitPfadErweitertString, pAusgabeEintragsnameBoolean=pAusgabeEintragsnameBoolean, pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
-			for lDateinameString in lDateien:
-				lDateinameMitPfadString = os.path.join(lWurzel, lDateinameString)
-				lDateinameMitPfadErweitertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lDateinameMitPfadString)
-				try:
-					self._vernichteDateiOderVerweisOderFIFO(lDateinameMitPfadErweitertString, pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
-				except LiSAusnahmen.QFileListDisplayError as lException:
-					# Spezielle Behandlung von QFileListDisplayErrors
-					# Alle anderen Exceptions werden zum Aufrufer weitergereicht
-					self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
-					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung')
-
-		# Weitergabe einer potentiellen Exception des folgenden Befehls an den Aufrufer
-		LiSVernichtung.QVerzeichniseintrag(self, pErweiterterPfadZuVerzeichnisString).vernichten(pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
-		lVerzeichnisnameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuVerzeichnisString)
-		lNurEndnameString = os.path.basename(lVerzeichnisnameReduziertString)
-		if pAusgabeEintragsnameBoolean is True:
-			self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Vernichtung OK]', lVerzeichnisnameReduziertString)
-		else:
-			self.ergaenzeBerichtAusgabe('Temporäres Verzeichnis: [Vernichtung OK]', lVerzeichnisnameReduziertString)
-
-	# Methoden zur Berechnung eines SHA256-Hashwerts aus Passwort oder Schlüsseldatei:
+			self.C_FUNKTION_UMKEHREN_BUTTON_SICHTBAR_SIGNAL.emit(self.sFunktionsausfuehrer.gibErweitertePfadeAllerErzeugtenDateien())
+			self.C_FUNKTION_WIEDERHOLEN_BUTTON_SICHTBAR_SIGNAL.emit(self.sFunktionsausfuehrer.sindProblemeAufgetreten())
 
-	def _berechneSHA256(self, pPasswortString=None, pErweiterterPfadZuSchluesseldateiString=None):
+	def istFunktionsprozessAktiv(self):
 		"""
-		Interne Methode. Ermittelt und returniert den SHA256-Hashwert zum String pPasswortString oder durch Aufruf von
-		self._berechneSHA256VonDatei(...) der durch pErweiterterPfadZuSchluesseldateiString spezifizierten Datei.
-
-		:param pPasswortString: Passwort
-		:type pPasswortString: String
-		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
-		:type pErweiterterPfadZuSchluesseldateiString: String
-		:return: SHA256-Hashwert
-		:rtype: Bytesequenz
-		"""
-		if  pPasswortString == '':
-			raise ValueError('SHA256 von leerem Passwort nicht möglich.')
-		if pPasswortString is not None and pErweiterterPfadZuSchluesseldateiString is None:
-			lSHA256 = hashes.Hash(hashes.SHA256(), backend=default_backend())
-			lPasswortBytes_LOESCHEN = pPasswortString.encode()
-			lSHA256.update(lPasswortBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lPasswortBytes_LOESCHEN)
-		elif pPasswortString is None and pErweiterterPfadZuSchluesseldateiString is not None:
-			try:
-				lSHA256 = self._berechneSHA256VonDatei(pErweiterterPfadZuSchluesseldateiString)
-			except:
-				raise
-		else:
-			raise AssertionError('Unzulässige Kombination von Passwort und/oder Schlüsseldatei! Prozess abgebrochen.')
-		return lSHA256.finalize()
+		Returniert, ob aktuell eine Programmfunktion ausgeführt wird (Verschlüsseln, Entschlüsseln, Vernichten)
 
-	def _berechneSHA256VonDatei(self, pErweiterterPfadZuSchluesseldateiString):
+		:return: Status der Ausführung einer Programmfunktion (true: aktiv, false: nicht aktiv)
+		:rtype: Boolean
 		"""
-		Interne Methode. Veranlasst die Ermittlung von den Hashwert der durch pErweiterterPfadZuSchluesseldateiString
-		spezifizierten Datei und returniert diesen.
+		return self.sFunktionsausfuehrer.istFunktionsprozessAktiv()
 
-		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
-		:type pErweiterterPfadZuSchluesseldateiString: String
-		:return: SHA256-Hashobjekt
-		:rtype: Hashobjekt
+	def stoppeFunktionsprozess(self):
 		"""
-		lSHA256 = hashes.Hash(hashes.SHA256(), backend=default_backend())
-		try:
-			self.setzeStatusleisteUndGUIZustand('Verarbeite Schlüsseldatei...')
-			with open(pErweiterterPfadZuSchluesseldateiString, 'rb') as lDatei:
-				lBlockBytes_LOESCHEN = lDatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-				while lBlockBytes_LOESCHEN:
-					lSHA256.update(lBlockBytes_LOESCHEN)
-					LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockBytes_LOESCHEN)
-					lBlockBytes_LOESCHEN = lDatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-		except:
-			raise OSError('Schlüsseldatei nicht gefunden oder nicht lesbar! Prozess abgebrochen.')
-		return lSHA256
-
-	# Methoden zur Berechnung eines SHA512-Hashwerts aus Passwort oder Schlüsseldatei:
-
-	def _berechneSHA512(self, pPasswortString=None, pErweiterterPfadZuSchluesseldateiString=None):
+		Stoppt die aktuell ausgeführte Programmfunktion (Verschlüsseln, Entschlüsseln, Vernichten).
 		"""
-		Interne Methode. Ermittelt und returniert den SHA512-Hashwert zum String pPasswortString oder durch Aufruf von
-		self._berechneSHA512VonDatei(...) der durch pErweiterterPfadZuSchluesseldateiString spezifizierten Datei.
-
-		:param pPasswortString: Passwort
-		:type pPasswortString: String
-		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
-		:type pErweiterterPfadZuSchluesseldateiString: String
-		:return: SHA512-Hashwert
-		:rtype: Bytesequenz
-		"""
-		if  pPasswortString == '':
-			raise ValueError('SHA512 von leerem Passwort nicht möglich.')
-		if pPasswortString is not None and pErweiterterPfadZuSchluesseldateiString is None:
-			lSHA512 = hashes.Hash(hashes.SHA512(), backend=default_backend())
-			lPasswortBytes_LOESCHEN = pPasswortString.encode()
-			lSHA512.update(lPasswortBytes_LOESCHEN)
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lPasswortBytes_LOESCHEN)
-		elif pPasswortString is None and pErweiterterPfadZuSchluesseldateiString is not None:
-			try:
-				lSHA512 = self._berechneSHA512VonDatei(pErweiterterPfadZuSchluesseldateiString)
-			except:
-				raise
-		else:
-			raise AssertionError('Unzulässige Kombination von Passwort und/oder Schlüsseldatei! Prozess abgebrochen.')
-		return lSHA512.finalize()
+		self.sFunktionsausfuehrer.stoppeFunktionsprozess()
 
-	def _berechneSHA512VonDatei(self, pErweiterterPfadZuSchluesseldateiString):
-		"""
-		Interne Methode. Veranlasst die Ermittlung von den Hashwert der durch pErweiterterPfadZuSchluesseldateiString
-		spezifizierten Datei und returniert diesen.
+	# Überschriebene Methoden der Oberklasse LiSFunktionsausfuehrung.Rueckmeldungen (Signal-Emittierung zur Kommunikation mit der GUI):
 
-		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
-		:type pErweiterterPfadZuSchluesseldateiString: String
-		:return: SHA512-Hashobjekt
-		:rtype: Hashobjekt
+	def setzeStatus(self, pTextString=None, pAbbrechenButtonAktivBoolean=False):
 		"""
-		lSHA512 = hashes.Hash(hashes.SHA512(), backend=default_backend())
-		try:
-			self.setzeStatusleisteUndGUIZustand('Verarbeite Schlüsseldatei...')
-			with open(pErweiterterPfadZuSchluesseldateiString, 'rb') as lDatei:
-				lBlockBytes_LOESCHEN = lDatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-				while lBlockBytes_LOESCHEN:
-					lSHA512.update(lBlockBytes_LOESCHEN)
-					LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lBlockBytes_LOESCHEN)
-					lBlockBytes_LOESCHEN = lDatei.read(LiSKonstanten.C_DATEI_BLOCKGROESSE)
-		except:
-			raise OSError('Schlüsseldatei nicht gefunden oder nicht lesbar. Prozess abgebrochen.')
-		return lSHA512
-
-	# Methoden zur Ableitung eines Crypt-Schlüssels aus einem SHA-Hashwert:
-
-	def ermittleAESGCM_V1Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pScryptSaltBytes=None):
-		"""
-		DEPRECATED. Veranlasst die Berechnung eines frischen Schlüssels für AESGCM_V1 und ggf. zufällige Bestimmung eines Saltwerts
-		für Scrypt auf Basis der übergebenen Werte.
-
-		:param pSHA256HashwertBytes: SHA256-Hashwert von Passwort oder Schlüsseldatei
-		:type pSHA256HashwertBytes: Bytesequenz
-		:param pScryptAufwandsfaktorInteger: N-Wert für Scrypt
-		:type pScryptAufwandsfaktorInteger: Integer
-		:param pScryptBlockgroesseInteger: r-Wert für Scrypt
-		:type pScryptBlockgroesseInteger: Integer
-		:param pScryptParallelisierungInteger: p-Wert für Scrypt
-		:type pScryptParallelisierungInteger: Integer
-		:param pScryptSaltBytes: Salt für Scrypt
-		:type pScryptSaltBytes: Bytesquenz
-		:return: Schlüssel und Scrypt-Salt
-		:rtype: Dictionary
-		"""
-		lScryptSaltBytes = pScryptSaltBytes
-		if lScryptSaltBytes is None:
-			lScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
-		lAESGCMV1SchluesselBytes = self._berechneScryptHashVonStringFuerAESGCM_V1(
-			pSHA256HashwertBytes=pSHA256HashwertBytes,
-			pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
-			pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
-			pScryptParallelisierungInteger=pScryptParallelisierungInteger,
-			pScryptSaltBytes=pScryptSaltBytes)
-		return {'AESGCMV1Schluessel':lAESGCMV1SchluesselBytes, 'ScryptSaltFuerAESGCMV1':lScryptSaltBytes}
-
-	def ermittleAESGCM_V2Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None, pHKDFSaltBytes=None):
-		"""
-		DEPRECATED. Veranlasst die Berechnung eines frischen Schlüssels für AESGCM_V2 und ggf. zufällige Bestimmung eines Saltwerts
-		für HKDF und ggf. eines Saltwerts für Scrypt auf Basis der übergebenen Werte.
-
-		:param pSHA256HashwertBytes: SHA256-Hashwert von Passwort oder Schlüsseldatei
-		:type pSHA256HashwertBytes: Bytesequenz
-		:param pScryptAufwandsfaktorInteger: N-Wert für Scrypt
-		:type pScryptAufwandsfaktorInteger: Integer
-		:param pScryptBlockgroesseInteger: r-Wert für Scrypt
-		:type pScryptBlockgroesseInteger: Integer
-		:param pScryptParallelisierungInteger: p-Wert für Scrypt
-		:type pScryptParallelisierungInteger: Integer
-		:param pInitialesScryptSaltBytes: Salt für initiales Scrypt (für Masterschlüssel)
-		:type pInitialesScryptSaltBytes: Bytesquenz
-		:param pHKDFSaltBytes: Salt für HKDF (für Datenschutzschlüssel)
-		:type pHKDFSaltBytes: Bytesequenz
-		:return: Schlüssel, HKDF-Salt und Scrypt-Salt
-		:rtype: Dictionary
-		"""
-		lHKDFSaltBytes = pHKDFSaltBytes
-		# Einmal Scrypt als Master für HKDF:
-		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None or (lHKDFSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes):
-			if pInitialesScryptSaltBytes is None:
-				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
-			else:
-				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes
-			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
-
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
-			self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN = self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V2(
-				pSHAHashwertBytes=pSHA256HashwertBytes,
-				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
-				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
-				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
-				pScryptSaltBytes=self.sInitialesScryptSaltBytes)
-
-		if lHKDFSaltBytes is None: # D.h. Verschlüsselung
-			lHKDFSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_HKDF_SALT_FUER_AES_GCM_V2_LAENGE)
-
-		lAESGCMV2SchluesselBytes = self._berechneHKDFWertVonScryptWertFuerAESGCM_V2(lHKDFSaltBytes)
-		return {'AESGCMV2Schluessel':lAESGCMV2SchluesselBytes, 'HKDFSaltFuerAESGCMV2':lHKDFSaltBytes, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
-
-	def ermittleAESGCM_V3Schluessel(self, *, pSHA512HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None):
-		"""
-		Veranlasst die Berechnung eines Schlüssels für AESGCM_V3 und ggf. zufällige Bestimmung eines Saltwerts
-		für Scrypt auf Basis der übergebenen Werte.
-
-		:param pSHA512HashwertBytes: SHA512-Hashwert von Passwort oder Schlüsseldatei
-		:type pSHA512HashwertBytes: Bytesequenz
-		:param pScryptAufwandsfaktorInteger: N-Wert für Scrypt
-		:type pScryptAufwandsfaktorInteger: Integer
-		:param pScryptBlockgroesseInteger: r-Wert für Scrypt
-		:type pScryptBlockgroesseInteger: Integer
-		:param pScryptParallelisierungInteger: p-Wert für Scrypt
-		:type pScryptParallelisierungInteger: Integer
-		:param pInitialesScryptSaltBytes: Salt für initiales Scrypt (Masterschlüssel)
-		:type pInitialesScryptSaltBytes: Bytesquenz
-		:return: Schlüssel und Scrypt-Salt
-		:rtype: Dictionary
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is not None:
-			if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is not None:
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleAESGCM_V3Schluessel: Initialer Scrypt-Wert ist Nullbytefolge!')
-		# Einmal Scrypt als Master für HKDF:
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or (pInitialesScryptSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes)\
-				or self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger > LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL-1:
-			if pInitialesScryptSaltBytes is None: # d.h. Verschlüsselung
-				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
-				self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger = 0
-			else:
-				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes # d.h. Entschlüsselung
-			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
-
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-			self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN = self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3(
-				pSHAHashwertBytes=pSHA512HashwertBytes,
-				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
-				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
-				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
-				pScryptSaltBytes=self.sInitialesScryptSaltBytes)
-
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sAESGCMV3SchluesselBytes_LOESCHEN)
-			self.sAESGCMV3SchluesselBytes_LOESCHEN = self._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3()
-
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleAESGCM_V3Schluessel Scrypt: ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleAESGCM_V3Schluessel AES-Schluessel (vor Rueckgabe an Aufrufer): ' + self.sAESGCMV3SchluesselBytes_LOESCHEN)
-		return {'AESGCMV3Schluessel':self.sAESGCMV3SchluesselBytes_LOESCHEN, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
-
-	def ermittleChaCha20_V1Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pScryptSaltBytes=None):
-		"""
-		DEPRECATED.
-		:param pSHA256HashwertBytes:
-		:param pScryptAufwandsfaktorInteger:
-		:param pScryptBlockgroesseInteger:
-		:param pScryptParallelisierungInteger:
-		:param pScryptSaltBytes:
-		:return:
-		"""
-		lScryptSaltBytes = pScryptSaltBytes
-		if lScryptSaltBytes is None: # D.h. Verschlüsselung
-			lScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
-		lChaCha20V1SchluesselBytes = self._berechneScryptHashVonStringFuerChaCha20_V1(
-			pSHA256HashwertBytes=pSHA256HashwertBytes,
-			pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
-			pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
-			pScryptParallelisierungInteger=pScryptParallelisierungInteger,
-			pScryptSaltBytes=pScryptSaltBytes)
-		return {'ChaCha20V1Schluessel':lChaCha20V1SchluesselBytes, 'ScryptSaltFuerChaCha20V1':lScryptSaltBytes}
-
-	def ermittleChaCha20_V2Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None, pHKDFSaltBytes=None):
-		"""
-		DEPRECATED.
-		:param pSHA256HashwertBytes:
-		:param pScryptAufwandsfaktorInteger:
-		:param pScryptBlockgroesseInteger:
-		:param pScryptParallelisierungInteger:
-		:param pInitialesScryptSaltBytes:
-		:param pHKDFSaltBytes:
-		:return:
-		"""
-		lHKDFSaltBytes = pHKDFSaltBytes
-		# Einmal Scrypt als Master für HKDF:
-		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None or (lHKDFSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes):
-			if pInitialesScryptSaltBytes is None:
-				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
-			else:
-				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes
-			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
-
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
-			self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN = self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V2(
-				pSHAHashwertBytes=pSHA256HashwertBytes,
-				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
-				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
-				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
-				pScryptSaltBytes=self.sInitialesScryptSaltBytes)
-		if lHKDFSaltBytes is None: # D.h. Verschlüsselung
-			lHKDFSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_HKDF_SALT_FUER_CHACHA20_V2_LAENGE)
-		lChaCha20V2SchluesselBytes = self._berechneHKDFWertVonScryptWertFuerChaCha20_V2(lHKDFSaltBytes)
-		return {'ChaCha20V2Schluessel':lChaCha20V2SchluesselBytes, 'HKDFSaltFuerChaCha20V2':lHKDFSaltBytes, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
-
-	def ermittleChaCha20_V3Schluessel(self, *, pSHA512HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None):
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is not None:
-			if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is not None:
-				LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleChaCha20_V3Schluessel: Initialer Scrypt-Wert ist Nullbytefolge!')
-		# Einmal Scrypt als Master für HKDF:
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or (pInitialesScryptSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes)\
-				or self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger > LiSKonstanten.C_CHACHA20_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL-1:
-			if pInitialesScryptSaltBytes is None:
-				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
-				self.sChaCha20V3SchluesselBytes_LOESCHEN = None  # Überflüssig, aber der Sicherheit wegen
-				self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger = 0
-			else:
-				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes
-			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
-
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-			self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN = self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3(
-				pSHAHashwertBytes=pSHA512HashwertBytes,
-				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
-				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
-				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
-				pScryptSaltBytes=self.sInitialesScryptSaltBytes)
-
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sChaCha20V3SchluesselBytes_LOESCHEN)
-			self.sChaCha20V3SchluesselBytes_LOESCHEN = self._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3()
-
-			# Schlüssel für HMAC-Berechnung löschen und auf None setzen, da Neuberechnung des Krypto-Schlüssels auch Neuberechnung des HMAC-Schlüssels zur Folge hat
-			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN)
-			self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = None
-
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleChaCha20_V3Schluessel Scrypt-Wert: ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleChaCha20_V3Schluessel ChaCha20V3-Kryptoschluessel (vor Rueckgabe an Aufrufer): ' + self.sChaCha20V3SchluesselBytes_LOESCHEN)
-		return {'ChaCha20V3Schluessel':self.sChaCha20V3SchluesselBytes_LOESCHEN, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
-
-	# Methoden zur Ableitung eines Authentisierungsschlüssels aus einem SHA-Hashwert:
-
-	def ermittleHMACSchluesselFuerChaCha20_V1(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pScryptSaltBytes=None):
-		"""
-		DEPRECATED.
-		:param pSHA256HashwertBytes:
-		:param pScryptAufwandsfaktorInteger:
-		:param pScryptBlockgroesseInteger:
-		:param pScryptParallelisierungInteger:
-		:param pScryptSaltBytes:
-		:return:
-		"""
-		lScryptSaltBytes = pScryptSaltBytes
-		if lScryptSaltBytes is None: # D.h. Verschlüsselung
-			lScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
-		lHMACSchluesselBytes = self._berechneScryptHashVonStringFuerAESGCM_V1(pSHA256HashwertBytes=pSHA256HashwertBytes,
-			pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
-			pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
-			pScryptParallelisierungInteger=pScryptParallelisierungInteger,
-			pScryptSaltBytes=pScryptSaltBytes)
-		return {'HMACSchluessel':lHMACSchluesselBytes, 'ScryptSaltFuerHMAC':lScryptSaltBytes}
-
-	def ermittleHMACSchluesselFuerChaCha20_V2(self, *, pHKDFSaltBytes=None):
-		"""
-		DEPRECATED.
-		:param pHKDFSaltBytes:
-		:return:
-		"""
-		# Methode darf nie ohne erfolgte initiale Scrypt-Berechnung aufgerufen werden, da immer zweiter Schlüssel
-		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None or self.sInitialesScryptSaltBytes is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash für Berechnung von HMAC-Schlüssel ist None oder Salt für HKDF ist None.')
-		lHKDFSaltBytes = pHKDFSaltBytes
-		if lHKDFSaltBytes is None: # D.h. Verschlüsselung
-			lHKDFSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_HKDF_SALT_FUER_HMAC_LAENGE)
-		lHMACSchluesselBytes = self._berechneHKDFWertVonScryptWertFuerHMACBeiChaCha20_V1_V2(lHKDFSaltBytes)
-		return {'HMACSchluessel':lHMACSchluesselBytes, 'HKDFSaltFuerHMAC':lHKDFSaltBytes}
-
-	def ermittleHMACSchluesselFuerChaCha20_V3(self):
-		"""
-		DEPRECATED. Muss immer in Kombination mit und _nach_ ermittleChaCha20_V3Schluessel(...) ausgerufen werden.
-		:return:
-		"""
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or self.sInitialesScryptSaltBytes is None: # Wird nie ohne erfolgte initiale Scrypt-Berechnung aufgerufen, da immer zweiter Schlüssel
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash für Berechnung von HMAC-Schlüssel existiert nicht.')
-		if self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN is None: # wird von ermittleChaCha20_V3Schluessel(...) auf None gesetzt, wenn Neuberechnung des Scrypt-Wertes stattgefunden hat
-			self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = self._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3()
-		return {'HMACSchluessel':self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN}
-
-	def ermittleHMACSchluesselFuerChaCha20_V3_1(self):
-		"""
-		Muss immer in Kombination mit und _nach_ ermittleChaCha20_V3Schluessel(...) ausgerufen werden.
-		:return:
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is not None:
-			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleHMACSchluesselFuerChaCha20_V3_1: Initialer Scrypt-Wert ist Nullbytefolge!')
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or self.sInitialesScryptSaltBytes is None: # Wird nie ohne erfolgte initiale Scrypt-Berechnung aufgerufen, da immer zweiter Schlüssel
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash für Berechnung von HMAC-Schlüssel existiert nicht.')
-		if self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN is None: # wird von ermittleChaCha20_V3Schluessel(...) auf None gesetzt, wenn Neuberechnung des Scrypt-Wertes stattgefunden hat
-			self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = self._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1()
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread.ermittleHMACSchluesselFuerChaCha20_V3_1 ChaCha20V3-HMAC-Schluessel (vor Rueckgabe an Aufrufer): ' + self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN)
-		return {'HMACSchluessel':self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN}
-
-	# Methoden zur Schlüsselexpansion (key expansion) und Schlüsselableitung (key derivaton):
-
-	def _berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V2(self, *, pSHAHashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
-		"""
-		DEPERECATED. Interne Methode. Berechnet initialen Scrypt-Wert zu einem aus Passwort oder Schlüsseldatei abgeleiteten, base91-kodierten Hashwert.
-		:param pSHAHashwertBytes:
-		:param pScryptAufwandsfaktorInteger:
-		:param pScryptBlockgroesseInteger:
-		:param pScryptParallelisierungInteger:
-		:param pScryptSaltBytes:
-		:return:
-		"""
-		lSHAHashwertString_LOESCHEN = base91.encode(pSHAHashwertBytes)
-		lSHAHashwertBase91Bytes_LOESCHEN = lSHAHashwertString_LOESCHEN.encode()
-		lKDFScrypt = scrypt.Scrypt(
-			salt=pScryptSaltBytes,
-			length=LiSKonstanten.C_SCRYPT_INITIAL_AUSGABE_LAENGE_V1_V2,
-			n=pScryptAufwandsfaktorInteger,
-			r=pScryptBlockgroesseInteger,
-			p=pScryptParallelisierungInteger,
-			backend=default_backend())
-		lScryptHashwertBytes = lKDFScrypt.derive(lSHAHashwertBase91Bytes_LOESCHEN)
-		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHAHashwertString_LOESCHEN, pStringBestaetigungBoolean=True)
-		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHAHashwertBase91Bytes_LOESCHEN)
-		return lScryptHashwertBytes
-
-	def _berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3(self, *, pSHAHashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
-		"""
-		Interne Methode. Berechnet initialen Scrypt-Wert zu einem aus Passwort oder Schlüsseldatei abgeleiteten Hashwert.
-		:param pSHAHashwertBytes:
-		:param pScryptAufwandsfaktorInteger:
-		:param pScryptBlockgroesseInteger:
-		:param pScryptParallelisierungInteger:
-		:param pScryptSaltBytes:
-		:return:
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if re.match(LiSKonstanten.C_REGEX_NULLBYTES, pSHAHashwertBytes) is not None:
-			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3: Uebergebener SHA-Hashwert ist Nullbytefolge!')
-		lKDFScrypt = scrypt.Scrypt(
-			salt=pScryptSaltBytes,
-			length=LiSKonstanten.C_SCRYPT_INITIAL_AUSGABE_LAENGE_V3,
-			n=pScryptAufwandsfaktorInteger,
-			r=pScryptBlockgroesseInteger,
-			p=pScryptParallelisierungInteger,
-			backend=default_backend())
-		lScryptHashwertBytes = lKDFScrypt.derive(pSHAHashwertBytes)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3 Scrypt-Wert (Berechnung): ' + lScryptHashwertBytes)
-		return lScryptHashwertBytes
-
-	def _berechneScryptHashVonStringFuerAESGCM_V1(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
-		"""
-		DEPRECATED. Interne Methode. Ermittelt pLaengeInBytesInteger Bytes des Scrypt-Werts entsprechend der Parameter und returniert diesen.
-		"""
-		lSHA256HashwertString_LOESCHEN = base91.encode(pSHA256HashwertBytes)
-		lSHA256HashwertBase91Bytes_LOESCHEN = lSHA256HashwertString_LOESCHEN.encode()
-		lKDFScrypt = scrypt.Scrypt(
-			salt=pScryptSaltBytes,
-			length=LiSKonstanten.C_AES_GCM_SCHLUESSEL_LAENGE,
-			n=pScryptAufwandsfaktorInteger,
-			r=pScryptBlockgroesseInteger,
-			p=pScryptParallelisierungInteger,
-			backend=default_backend())
-		lScryptHashwertBytes = lKDFScrypt.derive(lSHA256HashwertBase91Bytes_LOESCHEN)
-		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertString_LOESCHEN, pStringBestaetigungBoolean=True)
-		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertBase91Bytes_LOESCHEN)
-		return lScryptHashwertBytes
-
-	def _berechneScryptHashVonStringFuerChaCha20_V1(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
-		"""
-		DEPRECATED. Interne Methode. Ermittelt pLaengeInBytesInteger Bytes des Scrypt-Werts entsprechend der Parameter und returniert diesen.
-		"""
-		lSHA256HashwertString_LOESCHEN = base91.encode(pSHA256HashwertBytes)
-		lSHA256HashwertBase91Bytes_LOESCHEN = lSHA256HashwertString_LOESCHEN.encode()
-		lKDFScrypt = scrypt.Scrypt(
-			salt=pScryptSaltBytes,
-			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
-			n=pScryptAufwandsfaktorInteger,
-			r=pScryptBlockgroesseInteger,
-			p=pScryptParallelisierungInteger,
-			backend=default_backend())
-		lScryptHashwertBytes = lKDFScrypt.derive(lSHA256HashwertBase91Bytes_LOESCHEN)
-		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertString_LOESCHEN, pStringBestaetigungBoolean=True)
-		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertBase91Bytes_LOESCHEN)
-		return lScryptHashwertBytes
-
-	def _berechneHKDFWertVonScryptWertFuerAESGCM_V2(self, pSaltBytes):
-		"""
-		DEPRECATED. Interne Methode. Berechnet den HKDF-Wert zum initialiem Scrypt-Wert (Masterschlüssel) für AESGCM_V2
-
-		:param pSaltBytes: Saltwert für HKDF
-		:type pSaltBytes: Bytesequenz
-		:return: HKDF-Wert
-		:rtype: Bytesequenz
-		"""
-		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash darf für Berechnung von HKDF nicht None sein.')
-		lKDFHKDF = hkdf.HKDF(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_AES_GCM_SCHLUESSEL_LAENGE,
-			salt=pSaltBytes,
-			info=None,
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDF.derive(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
-		return lHKDFWertBytes
-
-	def _berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3(self):
-		"""
-		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) als Daten-Schlüssel für AESGCM_V3
-
-		:return: HKDF-Expand-Wert
-		:rtype: Bytesequenz
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is not None:
-			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
-
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
-		lKDFHKDFExpand = hkdf.HKDFExpand(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_AES_GCM_SCHLUESSEL_LAENGE,
-			info=b'AES-GCM-V3-key',
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3 Scrypt-Wert (bei AES-GCM-V3-Schluesselberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3 AES-GCM-V3-Schluessel aus HKDF-Expand (vor Rueckgabe an Aurufer)' + lHKDFWertBytes)
-		return lHKDFWertBytes
-
-	def _berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3(self):
-		"""
-		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) als Nonce für AESGCM_V3
-
-		:return: HKDF-Expand-Wert
-		:rtype: Bytesequenz
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is not None:
-			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
-		lKDFHKDFExpand = hkdf.HKDFExpand(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_AES_GCM_NONCE_LAENGE,
-			info=b'AES-GCM-V3-nonce-' + str(self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger).encode(),
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3 Scrypt-Wert (bei AES-GCM-V3-Nonce-Berechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3 AES-GCM-V3-Nonce aus HKDF-Expand: ' + lHKDFWertBytes)
-		return lHKDFWertBytes
-
-	def _berechneHKDFWertVonScryptWertFuerChaCha20_V2(self, pSaltBytes):
-		"""
-		DEPRECATED. Interne Methode. Berechnet den HKDF-Wert zum initialien Scrypt-Wert (Masterschlüssel) für CHACHA20_V2
-
-		:param pSaltBytes: Saltwert für HKDF
-		:type pSaltBytes: Bytesequenz
-		:return: HKDF-Wert
-		:rtype: Bytesequenz
-		"""
-		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash darf für Berechnung von HKDF nicht None sein.')
-		lKDFHKDF = hkdf.HKDF(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
-			salt=pSaltBytes,
-			info=b'ChaCha20V2',
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDF.derive(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
-		return lHKDFWertBytes
-
-	def _berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3(self):
-		"""
-		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) als Daten-Schlüssel für CHACHA20_V3
-
-		:return: HKDF-Expand-Wert
-		:rtype: Bytesequenz
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is not None:
-			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
-		lKDFHKDFExpand = hkdf.HKDFExpand(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
-			info=b'ChaCha20-V3-key',
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3 Scrypt-Wert (bei ChaCha20-V3-Krypto-Schluesselberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3 ChaCha20-V3-Krypto-Schluessel aus HKDF-Expand: ' + lHKDFWertBytes)
-		return lHKDFWertBytes
-
-	def _berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3(self):
-		"""
-		Berechnet den HKDF-Expand-Wert zum initialiem Scrypt-Wert (Masterschlüssel) als Nonce für CHACHA20_V3
-
-		:return: HKDF-Expand-Wert
-		:rtype: Bytesequenz
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is None:
-			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
-		lKDFHKDFExpand = hkdf.HKDFExpand(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_CHACHA20_NONCE_LAENGE,
-			info=b'ChaCha20-V3-nonce-' + str(self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger).encode(),
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3 Scrypt-Wert (bei ChaCha20-V3-Nonceberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3 ChaCha20-V3-Nonce aus HKDF-Expand: ' + lHKDFWertBytes)
-		return lHKDFWertBytes
-
-	def _berechneHKDFWertVonScryptWertFuerHMACBeiChaCha20_V1_V2(self, pSaltBytes):
-		"""
-		DEPRECATED. Interne Methode. Berechnet den HKDF-Wert zum (bei ..._V2: initialen) Scrypt-Wert (Masterschlüssel) für HMAC bei CHACHA20_V1 oder ..._V2
-
-		:param pSaltBytes: Saltwert für HKDF
-		:type pSaltBytes: Bytesequenz
-		:return: HKDF-Wert
-		:rtype: Bytesequenz
-		"""
-		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash darf für Berechnung von HKDF nicht None sein.')
-		lKDFHKDF = hkdf.HKDF(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
-			salt=pSaltBytes,
-			info=b'HMAC',
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDF.derive(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
-		return lHKDFWertBytes
-
-	def _berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3(self):
-		"""
-		DEPRECATED. Interne Methode. Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) für HMAC bei CHACHA20_V3
-
-		:return: HKDF-Expand-Wert
-		:rtype: Bytesequenz
-		"""
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
-		lKDFHKDFExpand = hkdf.HKDFExpand(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_HMAC_SCHLUESSEL_LAENGE,
-			info=b'HMAC-ChaCha20-V3-key',
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		return lHKDFWertBytes
-
-	def _berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1(self):
-		"""
-		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) für HMAC bei CHACHA20_V3_1
-
-		:return: HKDF-Expand-Wert
-		:rtype: Bytesequenz
-		"""
-		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
-		if re.match(LiSKonstanten.C_REGEX_NULLBYTES, self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN) is not None:
-			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1: Initialer Scrypt-Wert ist Nullbytefolge!')
-		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
-			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
-		lKDFHKDFExpand = hkdf.HKDFExpand(
-			algorithm=hashes.SHA512(),
-			length=LiSKonstanten.C_HMAC_SHA512_SCHLUESSEL_LAENGE,
-			info=b'HMAC-ChaCha20-V3-key',
-			backend=default_backend())
-		lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		# Testausgabe zur Funktionsüberprüfung
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1 Scrypt-Wert (bei ChaCha20-V3_1-HMAC-Schluesselberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
-		LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSCrypt.QControllerWorkerThread._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1 ChaCha20-V3_1-HMAC-Schluessel aus HKDF-Expand: ' + lHKDFWertBytes)
-		return lHKDFWertBytes
-
-
-	# Signal-emmittierende Methoden zur Kommunikation mit der GUI:
-	def setzeStatusleisteUndGUIZustand(self, pTextString=None, pAbbrechenButtonAktivBoolean=False):
-		"""
-		Emittiert das Signal C_STATUSAENDERUNG_SIGNAL. Wird intern und auch von LiSKrypto.Datei()-Instanzen aufgerufen
+		Emittiert das Signal C_STATUSAENDERUNG_SIGNAL. Während der Programmfunktion wird der zuletzt gemeldete Fortschritt
+		an den Text angehängt.
 
 		:param pTextString: Text für Statusleiste
 		:type pTextString: String
 		:param pAbbrechenButtonAktivBoolean: Angabe, ob Abbrechen-Button in der Statusleiste auf aktiv gesetzt werden soll (true: ja, false: nein)
 		:type pAbbrechenButtonAktivBoolean: Boolean
 		"""
+		self._sStatusTextString = pTextString
+		self._sAbbrechenButtonAktivBoolean = pAbbrechenButtonAktivBoolean
+		if pTextString is None or pTextString == '':
+			self._sFortschrittTextString = None # 'Bereit.' ohne Fortschritt
+		elif self._sFortschrittTextString is not None:
+			pTextString = pTextString + ' (' + self._sFortschrittTextString + ')'
 		self.C_STATUSAENDERUNG_SIGNAL.emit(pTextString, pAbbrechenButtonAktivBoolean)
 
-	def ergaenzeBerichtAusgabe(self, pZeileString, pToolTipString=None):
+	def setzeFortschritt(self, pStandDictionary):
 		"""
-		Emittiert das Signal C_BERICHTERGAENZUNG_SIGNAL mit Übergabe der neuen Zeile. Wird intern und auch von LiSKrypto()-Instanzen aufgerufen
+		Emittiert das Signal C_STATUSAENDERUNG_SIGNAL mit dem aktuellen Statustext und dem Fortschritt (Anteil, Durchsatz,
+		Restzeit). Der Funktionsausfuehrer ruft die Methode höchstens alle LiSKonstanten.C_FORTSCHRITT_INTERVALL Sekunden auf.
+
+		:param pStandDictionary: Stand (siehe LiSFortschritt.Fortschritt.gibStand())
+		:type pStandDictionary: Dictionary
+		"""
+		self._sFortschrittTextString = LiSFortschritt.Fortschritt.formatiere(pStandDictionary) or None
+		if self._sStatusTextString is not None and self._sStatusTextString != '':
+			self.setzeStatus(self._sStatusTextString, self._sAbbrechenButtonAktivBoolean)
+
+	def ergaenzeBericht(self, pZeileString, pToolTipString=None):
+		"""
+		Emittiert das Signal C_BERICHTERGAENZUNG_SIGNAL mit Übergabe der neuen Zeile.
 
 		:param pZeileString: Text für neue Zeile im Berichtsbereich
 		:type pZeileString: String
@@ -1807,53 +712,37 @@ class QControllerWorkerThread(QtCore.QThread):
 		"""
 		self.C_BERICHTERGAENZUNG_SIGNAL.emit(pZeileString, pToolTipString)
 
-	def _gibStartzeitpunktAus(self):
+	def gibZwischenablageText(self):
 		"""
-		Interne Methode. Emittiert das Signal C_BERICHTERGAENZUNG_SIGNAL mit Übergabe des Startzeitpunkts.
-		"""
-		self.C_BERICHTERGAENZUNG_SIGNAL.emit('Start: ' + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), None)
-		self.C_BERICHTERGAENZUNG_SIGNAL.emit('---', None)
-		self.sStartZeitpunktAusgegebenBoolean = True
+		Returniert den Textinhalt der Zwischenablage.
 
-	def _gibEndzeitpunktAusFallsErforderlich(self):
-		"""
-		Interne Methode. Emittiert das Signal C_BERICHTERGAENZUNG_SIGNAL mit Übergabe des Endzeitpunkts, falls
-		zuvor programmatisch ein Startzeitpunkt ausgegeben wurde.
+		:return: Text der Zwischenablage
+		:rtype: String
 		"""
-		if self.sStartZeitpunktAusgegebenBoolean is True:
-			self.C_BERICHTERGAENZUNG_SIGNAL.emit('---', None)
-			self.C_BERICHTERGAENZUNG_SIGNAL.emit('Ende: ' + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"), None)
+		return QtWidgets.QApplication.clipboard().text()
 
-	def	_zeigeProbleminfoFallsErforderlich(self):
+	def leereZwischenablage(self):
 		"""
-		Interne Methode. Zeigt im Bedarfsfall einen Informationsdialog zu aufgetretenen Problemen bei Ausführung der
-		Programmfunktion an.
-		"""
-		if self.sDateilistenAnzeigeFehlerImProzessBoolean is True:
-			self._zeigeInfoDialogModal('Es sind Probleme aufgetreten. Bitte beachten Sie die Fehlermeldungen.')
-
-	def _leereZwischenablage(self):
-		"""
-		Interne Methode. Emittiert das Signal C_LEEREZWISCHENABLAGE_SIGNAL
+		Emittiert das Signal C_LEEREZWISCHENABLAGE_SIGNAL
 		"""
 		self.C_LEEREZWISCHENABLAGE_SIGNAL.emit()
 
-	def _zeigeInfoDialogModal(self, pInformationString):
+	def zeigeInfo(self, pInformationString):
 		"""
-		Interne Methode. Emittiert das Signal C_INFODIALOG_SIGNAL mit Übergabe einer Warnung.
+		Emittiert das Signal C_INFODIALOG_SIGNAL mit Übergabe einer Information und wartet auf deren Bestätigung.
 
-		:param pInformationString: Warnung
+		:param pInformationString: Information
 		:type pInformationString: String
 		"""
 		self._sInformationBestaetigtBoolean = False
 		self.C_INFODIALOG_SIGNAL.emit(pInformationString)
 		while self._sInformationBestaetigtBoolean is False:
 			pass
-		self.C_FUNKTION_WIEDERHOLEN_BUTTON_SICHTBAR_SIGNAL.emit(self.sDateilistenAnzeigeFehlerImProzessBoolean)
+		self.C_FUNKTION_WIEDERHOLEN_BUTTON_SICHTBAR_SIGNAL.emit(self.sFunktionsausfuehrer.sindProblemeAufgetreten())
 
-	def _zeigeWarnDialogModal(self, pWarnungString):
+	def zeigeWarnung(self, pWarnungString):
 		"""
-		Interne Methode. Emittiert das Signal C_WARNDIALOG_SIGNAL mit Übergabe einer Warnung.
+		Emittiert das Signal C_WARNDIALOG_SIGNAL mit Übergabe einer Warnung und wartet auf deren Bestätigung.
 
 		:param pWarnungString: Warnung
 		:type pWarnungString: String
@@ -1863,9 +752,9 @@ class QControllerWorkerThread(QtCore.QThread):
 		while self._sWarnungBestaetigtBoolean is False:
 			pass
 
-	def _zeigeFehlerDialogModal(self, pFehlermeldungString):
+	def zeigeFehler(self, pFehlermeldungString):
 		"""
-		Interne Methode. Emittiert das Signal C_FEHLERDIALOG_SIGNAL mit Übergabe einer Fehlermeldung.
+		Emittiert das Signal C_FEHLERDIALOG_SIGNAL mit Übergabe einer Fehlermeldung und wartet auf deren Bestätigung.
 
 		:param pFehlermeldungString: Fehlermeldung
 		:type pFehlermeldungString: String
@@ -1875,84 +764,41 @@ class QControllerWorkerThread(QtCore.QThread):
 		while self._sFehlerBestaetigtBoolean is False:
 			pass
 
-	def _zeigePasswortDialog(self, pMitBestaetigungBoolean=True):
+	def erfragePasswort(self, pMitBestaetigungBoolean=True):
 		"""
-		Interne Methode. Emittiert das Signal C_PASSWORTDIALOG_SIGNAL mit Übergabe, ob ein Bestätigungsfeld angezeigt
-		werden soll. Veranlasst dadurch das Öffnen eines Passwortsdialogs. Ist das in diesem Dialog eingegebene
-		Passwort None, ein Leerstring oder beginnt es mit einem 0-Byte, wird eine QNoPasswortd-Exception geworfen.
-		Anderenfalls wird dass Passwort returniert.
+		Emittiert das Signal C_PASSWORTDIALOG_SIGNAL mit Übergabe, ob ein Bestätigungsfeld angezeigt werden soll.
+		Veranlasst dadurch das Öffnen eines Passwortsdialogs und returniert das dort eingegebene Passwort.
 
 		:param pMitBestaetigungBoolean: Angabe, ob ein Bestätigungsfeld angezeigt werden soll
 		:type pMitBestaetigungBoolean: Boolean
+		:return: Passwort
+		:rtype: String
 		"""
 		self._sPasswortString = None
 		self.C_PASSWORTDIALOG_SIGNAL.emit(pMitBestaetigungBoolean)
 		while self._sPasswortString is None:
 			pass
-		if self._sPasswortString is None or self._sPasswortString == '' or self._sPasswortString[0] == '\x00':
-			raise LiSAusnahmen.QNoPasswordError('Passwortdialog lieferte leeren String.')
 		lPasswortString = self._sPasswortString
 		del self._sPasswortString # Löschen der globalen Referenz
 		return lPasswortString
 
-	def _zeigeUeberschreibenDialog(self, pDateinameErweitertString):
+	def erfrageUeberschreiben(self, pDateinameErweitertString):
 		"""
-		Interne Methode. Emittiert das Signal C_UEBERSCHREIBENDIALOG_SIGNAL mit Übergabe des erweiterten Pfads zu einer Datei
+		Emittiert das Signal C_UEBERSCHREIBENDIALOG_SIGNAL mit Übergabe des erweiterten Pfads zu einer Datei und
+		returniert die Nutzerauswahl.
 
 		:param pDateinameErweitertString: Erweiterter Pfad zu einer Datei
 		:type pDateinameErweitertString: String
+		:return: Antwort (LiSKonstanten.C_UEBERSCHREIBEN_JA, C_UEBERSCHREIBEN_NEIN oder C_UEBERSCHREIBEN_ABBRECHEN)
+		:rtype: Integer
 		"""
 		self._sUeberschreibenInteger = -1
 		self.C_UEBERSCHREIBENDIALOG_SIGNAL.emit(pDateinameErweitertString)
 		while self._sUeberschreibenInteger == -1:
 			pass
-		return self._sUeberschreibenInteger
-
-
-	# Weitere Hilfsmethoden
+		return self.C_UEBERSCHREIBENDIALOG_ANTWORTEN.get(self._sUeberschreibenInteger, LiSKonstanten.C_UEBERSCHREIBEN_ABBRECHEN)
 
-	def istFunktionsprozessAktiv(self):
-		"""
-		Returniert, ob aktuell eine Programmfunktion ausgeführt wird (Verschlüsseln, Entschlüsseln, Vernichten)
-
-		:return: Status der Ausführung einer Programmfunktion (true: aktiv, false: nicht aktiv)
-		:rtype: Boolean
-		"""
-		return self.sFunktionsprozessAktivBoolean
-
-	def stoppeFunktionsprozess(self):
-		"""
-		Stoppt die aktuell ausgeführte Programmfunktion (Verschlüsseln, Entschlüsseln, Vernichten) und setzt den
-		Inhalt der Statusleiste auf 'Abbruch durch Nutzer (bitte warten).'
-		"""
-		self.setzeStatusleisteUndGUIZustand('Abbruch durch Nutzer (bitte warten).')
-		self.sFunktionsprozessAktivBoolean = False
-
-	def gibNeueAESGCMNoncePerHKDF(self):
-		"""
-		Interne Methode. Veranlasst die Berechnung mittels HKDF des nächsten Nonce-Werts für die Verschlüsselung per AES-GCM.
-
-		:return: Nonce für AESGCM
-		:rtype: Bytesequenz
-		"""
-		if not self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger < LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL:
-			raise AssertionError('Maximal zulässige Aufrufe der AESGCM-Verschlüsselungsfunktion mit identischem Schlüssel überschritten.')
-		lNeueAESNonceBytes = self._berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3()
-		self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger+=1
-		return lNeueAESNonceBytes
-
-	def gibNeueChaCha20NoncePerHKDF(self):
-		"""
-		Interne Methode. Veranlasst die Berechnung mittels HKDF des nächsten Nonce-Werts für die Verschlüsselung per ChaCha-20
-
-		:return: Nonce für ChaCha-20
-		:rtype: Bytesequenz
-		"""
-		if not self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger < LiSKonstanten.C_CHACHA20_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL:
-			raise AssertionError('Maximal zulässige Aufrufe der ChaCha20-Verschlüsselungsfunktion mit identischem Schlüssel überschritten.')
-		lNeueChacha20NonceBytes = self._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3()
-		self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger+=1
-		return lNeueChacha20NonceBytes
+	# Setter für die Antworten der GUI:
 
 	def setzeInformationBestaetigt(self, pInformationBestaetigtBoolean):
 		"""
@@ -2010,12 +856,26 @@ if __name__ == '__main__':
 
 	QtWidgets.QApplication.setAttribute(QtCore.Qt.AA_EnableHighDpiScaling, False)
 	try:
-		LiSKonfiguration.Konfiguration.liesKonfigurationEin()
+		if LiSSingleton.Nachrichtenprotokoll.nutztUnixSocket() is True:
+			LiSKonfiguration.Konfiguration.parseAufrufparameter() # Konfigurationsdatei wird erst von der Master-Instanz gelesen
+		else:
+			LiSKonfiguration.Konfiguration.liesKonfigurationEin()
 	except OSError:
 		lFehlermeldungString = 'Fehler beim Zugriff auf Temporärverzeichnis ' + LiSKonstanten.C_KONFIG_UND_LOG_PFAD
 		print(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': ' + lFehlermeldungString)
 		traceback.print_exc()
 	else:
+		if LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.trace is not None: # Zeitmessung je Programmfunktionsdurchlauf (nur in dieser Instanz)
+			LiSZeitmessung.Zeitmessung.aktiviere(os.path.abspath(LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.trace))
+		if LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.profile is not None: # Profilierung je Programmfunktionsdurchlauf (nur in dieser Instanz)
+			LiSProfilierung.Profilierung.aktiviere(LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.profile)
+		if LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.action == 'inspect': # Headerinspektion ohne GUI und ohne Master-/Slave-Kommunikation
+			lErweitertePfadeList = [LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lEintragString) for lEintragString in LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.items]
+			sys.exit(1 if LiSInspektion.Headerinspektion.gibJSONZeilenAus(lErweitertePfadeList, LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.jobs) > 0 else 0)
+		if LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.headless is True \
+				or LiSKonstanten.C_DATENSTROM_PFADANGABE in LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.items: # Programmfunktion ohne GUI und ohne Master-/Slave-Kommunikation
+			LiSKommandozeile.Kommandozeilenausfuehrung.starteLogging()
+			sys.exit(LiSKommandozeile.Kommandozeilenausfuehrung.fuehreAus(LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER))
 		try:
 			lControllerQController = QController()
 			if lControllerQController.istMaster():
@@ -2034,5 +894,6 @@ if __name__ == '__main__':
 		else:
 			if lControllerQController is not None:
 				lControllerQController.stoppeServerThread()
-		LiSKonfiguration.Konfiguration.speichereKonfiguration()
+		if LiSKonfiguration.Konfiguration.G_KONFIGURATION_EINGELESEN is True: # Keine Defaultwerte über die Konfiguration der Master-Instanz schreiben
+			LiSKonfiguration.Konfiguration.speichereKonfiguration()
 
@@ -0,0 +1,1786 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Dieses Modul enthält die von der Benutzeroberfläche unabhängige Ausführung der Programmfunktionen (Verschlüsseln,
+Entschlüsseln, Vernichten) auf Dateien und Verzeichnissen. Rückmeldungen (Status, Verlaufsprotokoll) und Rückfragen
+(Passwort, Überschreiben) werden über ein Rueckmeldungen-Objekt abgewickelt, so dass das Modul sowohl von der GUI
+(QControllerWorkerThread) als auch ohne GUI (--headless) verwendet werden kann. Es importiert kein PyQt.
+"""
+
+from Modell import LiSAusnahmen, LiSBlockgroesse, LiSFortschritt, LiSJournal, LiSKonstanten, LiSKrypto, LiSVernichtung, LiSZeitmessung
+from Sonstiges import LiSWerkzeuge
+
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.kdf import scrypt, hkdf
+from cryptography.hazmat.backends import default_backend
+
+import base91
+import datetime
+import logging
+import os
+import tempfile
+import threading
+import sys
+
+class Rueckmeldungen:
+	"""
+	Schnittstelle, über die ein Funktionsausfuehrer Rückmeldungen ausgibt und Rückfragen stellt. Die Methoden dieser
+	Klasse verhalten sich nicht-interaktiv (Meldungen werden verworfen, es wird kein Passwort geliefert, bestehende
+	Zieldateien werden übersprungen). Unterklassen überschreiben die jeweils benötigten Methoden. Die Methoden werden
+	im Thread des Funktionsausfuehrers aufgerufen und kehren erst zurück, wenn die Rückmeldung verarbeitet bzw. die
+	Rückfrage beantwortet ist.
+	"""
+
+	def setzeStatus(self, pTextString=None, pAbbrechenButtonAktivBoolean=False):
+		"""
+		Gibt den aktuellen Status (z.B. 'Verschlüsselung: Dateiname') aus.
+
+		:param pTextString: Statustext (None: Bereit)
+		:type pTextString: String
+		:param pAbbrechenButtonAktivBoolean: Angabe, ob die Programmfunktion derzeit abgebrochen werden kann (true: ja, false: nein)
+		:type pAbbrechenButtonAktivBoolean: Boolean
+		"""
+		pass
+
+	def setzeFortschritt(self, pStandDictionary):
+		"""
+		Gibt den Fortschritt der Programmfunktion aus (höchstens alle LiSKonstanten.C_FORTSCHRITT_INTERVALL Sekunden).
+
+		:param pStandDictionary: Stand (siehe LiSFortschritt.Fortschritt.gibStand())
+		:type pStandDictionary: Dictionary
+		"""
+		pass
+
+	def ergaenzeBericht(self, pZeileString, pToolTipString=None):
+		"""
+		Ergänzt das Verlaufsprotokoll um die Zeile pZeileString.
+
+		:param pZeileString: Neue Zeile für das Verlaufsprotokoll
+		:type pZeileString: String
+		:param pToolTipString: Zusatzinformation zur Zeile (i.d.R. reduzierte Pfadangabe), ggf. None
+		:type pToolTipString: String
+		"""
+		pass
+
+	def zeigeInfo(self, pInformationString):
+		"""
+		Gibt die Information pInformationString aus.
+
+		:param pInformationString: Information
+		:type pInformationString: String
+		"""
+		pass
+
+	def zeigeWarnung(self, pWarnungString):
+		"""
+		Gibt die Warnung pWarnungString aus.
+
+		:param pWarnungString: Warnung
+		:type pWarnungString: String
+		"""
+		pass
+
+	def zeigeFehler(self, pFehlermeldungString):
+		"""
+		Gibt die Fehlermeldung pFehlermeldungString aus.
+
+		:param pFehlermeldungString: Fehlermeldung
+		:type pFehlermeldungString: String
+		"""
+		pass
+
+	def erfragePasswort(self, pMitBestaetigungBoolean=True):
+		"""
+		Erfragt das Passwort für die Programmfunktion.
+
+		:param pMitBestaetigungBoolean: Angabe, ob das Passwort bestätigt werden muss (true: ja, false: nein)
+		:type pMitBestaetigungBoolean: Boolean
+		:return: Passwort oder None, falls kein Passwort angegeben wurde
+		:rtype: String
+		"""
+		return None
+
+	def erfrageUeberschreiben(self, pDateinameErweitertString):
+		"""
+		Erfragt, ob die bereits bestehende Datei pDateinameErweitertString überschrieben werden soll.
+
+		:param pDateinameErweitertString: Erweiterter Pfad zur bestehenden Datei
+		:type pDateinameErweitertString: String
+		:return: Antwort (LiSKonstanten.C_UEBERSCHREIBEN_JA, C_UEBERSCHREIBEN_NEIN oder C_UEBERSCHREIBEN_ABBRECHEN)
+		:rtype: Integer
+		"""
+		return LiSKonstanten.C_UEBERSCHREIBEN_NEIN
+
+	def gibZwischenablageText(self):
+		"""
+		Returniert den Textinhalt der Zwischenablage (zur Warnung, falls diese das Passwort enthält).
+
+		:return: Text der Zwischenablage oder None, falls keine Zwischenablage verfügbar ist
+		:rtype: String
+		"""
+		return None
+
+	def leereZwischenablage(self):
+		"""
+		Leert die Zwischenablage.
+		"""
+		pass
+
+class Schluesseldateihashwerte:
+	"""
+	Merkt sich die SHA256- und SHA512-Hashwerte von Schlüsseldateien für die Dauer der Sitzung, so dass eine (ggf. große)
+	Schlüsseldatei nicht bei jeder Programmfunktion erneut gelesen wird. Schlüssel ist (Pfad, Größe, Änderungszeitpunkt,
+	Inode), eine veränderte oder ersetzte Schlüsseldatei wird also neu gelesen. Die Hashwerte werden als bytearray
+	vorgehalten und nur als Kopie herausgegeben; entferneAlle() überschreibt sie (bei Programmende, siehe
+	QController.warteAufViewEreignisse() und Kommandozeilenausfuehrung.fuehreAus(...)).
+	"""
+	_sHashwerteDictionary = dict()
+	_sLock = threading.Lock()
+
+	def __init__(self):
+		if type(self) is Schluesseldateihashwerte:
+			raise LiSAusnahmen.QAbstractClassError('Schluesseldateihashwerte kann nicht instanziiert werden.')
+
+	@staticmethod
+	def ermittleSchluessel(pErweiterterPfadZuSchluesseldateiString, pStat):
+		"""
+		Returniert den Schlüssel zur Schlüsseldatei pErweiterterPfadZuSchluesseldateiString mit den Metadaten pStat.
+
+		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
+		:type pErweiterterPfadZuSchluesseldateiString: String
+		:param pStat: Ergebnis von os.stat(...) bzw. os.fstat(...) zur Schlüsseldatei
+		:type pStat: os.stat_result
+		:return: Schlüssel
+		:rtype: Tupel
+		"""
+		return (os.path.normcase(os.path.abspath(pErweiterterPfadZuSchluesseldateiString)), pStat.st_size, pStat.st_mtime_ns, pStat.st_ino)
+
+	@staticmethod
+	def gib(pSchluesselTuple):
+		"""
+		Returniert Kopien der gemerkten Hashwerte zu pSchluesselTuple oder None.
+
+		:param pSchluesselTuple: Schlüssel (siehe ermittleSchluessel(...))
+		:type pSchluesselTuple: Tupel
+		:return: SHA256- und SHA512-Hashwert
+		:rtype: Tupel von Bytesequenzen
+		"""
+		with Schluesseldateihashwerte._sLock:
+			lHashwerteTuple = Schluesseldateihashwerte._sHashwerteDictionary.get(pSchluesselTuple)
+			if lHashwerteTuple is None:
+				return None
+			return bytes(lHashwerteTuple[0]), bytes(lHashwerteTuple[1])
+
+	@staticmethod
+	def merke(pSchluesselTuple, pSHA256HashwertBytes, pSHA512HashwertBytes):
+		"""
+		Merkt sich Kopien der Hashwerte zu pSchluesselTuple.
+
+		:param pSchluesselTuple: Schlüssel (siehe ermittleSchluessel(...))
+		:type pSchluesselTuple: Tupel
+		:param pSHA256HashwertBytes: SHA256-Hashwert der Schlüsseldatei
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pSHA512HashwertBytes: SHA512-Hashwert der Schlüsseldatei
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		with Schluesseldateihashwerte._sLock:
+			Schluesseldateihashwerte._sHashwerteDictionary[pSchluesselTuple] = (bytearray(pSHA256HashwertBytes), bytearray(pSHA512HashwertBytes))
+
+	@staticmethod
+	def entferneAlle():
+		"""
+		Überschreibt alle gemerkten Hashwerte im Arbeitsspeicher und vergisst sie.
+		"""
+		with Schluesseldateihashwerte._sLock:
+			for lHashwerteTuple in Schluesseldateihashwerte._sHashwerteDictionary.values():
+				for lHashwertBytearray_LOESCHEN in lHashwerteTuple:
+					lHashwertBytearray_LOESCHEN[:] = bytes(len(lHashwertBytearray_LOESCHEN))
+			Schluesseldateihashwerte._sHashwerteDictionary.clear()
+
+class Funktionsausfuehrer:
+	"""
+	Führt eine Programmfunktion (Verschlüsseln, Entschlüsseln, Vernichten) auf einer Liste von Dateien und
+	Verzeichnissen aus und leitet die dafür benötigten Schlüssel ab. Wird von LiSKrypto.QDatei()- und
+	LiSVernichtung.QVerzeichniseintrag()-Instanzen für Rückmeldungen, Schlüssel und Nonces verwendet.
+	"""
+
+	def __init__(self, pSortierteBereinigteDragAndDropsErweitertePfadeList, pFunktionString, pOriginaleVernichtenStatusBoolean, pSchluesselartStrirng, pErweiterterPfadZuSchluesseldateiString, pRueckmeldungen=None,
+				 pDatenstromQuelleFile=None, pDatenstromZielFile=None, pVerschluesselungAmOrtBoolean=False, pArchivBoolean=False, pArchivAuswahlList=None):
+		"""
+		Initiallisiert ein Objekt der Klasse Funktionsausfuehrer
+
+		:param pSortierteBereinigteDragAndDropsErweitertePfadeList: Erwieterte Pfadangaben zu namentlich zulässigen
+		Verzeichniseinträgen, nach Verzeichnissen und Dateien sortiert
+		:type pSortierteBereinigteDragAndDropsErweitertePfadeList: Liste von Strings
+		:param pFunktionString: avisierte Programmfunktion (LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL, LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL, LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL)
+		:type pFunktionString: String
+		:param pOriginaleVernichtenStatusBoolean: Angabe, ob die Originaldateien vernichtet werden sollen (true: ja, false: nein)
+		:type pOriginaleVernichtenStatusBoolean: Boolean
+		:param pSchluesselartStrirng: Angabe der Schlüsselart (C_SCHLUESSELART_PASSWORT_LITERAL, C_SCHLUESSELART_SCHLUESSELDATEI_LITERAL)
+		:type pSchluesselartStrirng: String
+		:param pErweiterterPfadZuSchluesseldateiString: Zur Schlüsseldatei gehörige erweiterte Pfadangabe
+		:type pErweiterterPfadZuSchluesseldateiString: String
+		:param pRueckmeldungen: Empfänger von Rückmeldungen und Rückfragen (Default: nicht-interaktive Rueckmeldungen)
+		:type pRueckmeldungen: Rueckmeldungen
+		:param pDatenstromQuelleFile: Quelle für den Eintrag LiSKonstanten.C_DATENSTROM_PFADANGABE (Default: Standardeingabe)
+		:type pDatenstromQuelleFile: File-Objekt (binär)
+		:param pDatenstromZielFile: Ziel für den Eintrag LiSKonstanten.C_DATENSTROM_PFADANGABE (Default: Standardausgabe)
+		:type pDatenstromZielFile: File-Objekt (binär)
+		:param pVerschluesselungAmOrtBoolean: Angabe, ob zu vernichtende Originale ab LiSKonstanten.C_AM_ORT_MINDESTGROESSE am Ort verschlüsselt werden sollen (true: ja, false: nein)
+		:type pVerschluesselungAmOrtBoolean: Boolean
+		:param pArchivBoolean: Angabe, ob Verzeichnisse jeweils als ein Archiv verschlüsselt werden sollen (siehe LiSKrypto.QArchiv; true: ja, false: nein)
+		:type pArchivBoolean: Boolean
+		:param pArchivAuswahlList: Muster für die aus Archiven zu entschlüsselnden Einträge (Default: alle Einträge)
+		:type pArchivAuswahlList: Liste von Strings
+		"""
+		# Allgemeine globale Werte:
+		self.sSortierteBereinigteDragAndDropsList = pSortierteBereinigteDragAndDropsErweitertePfadeList
+		self.sFunktionString = pFunktionString
+		self.sOriginaleVernichtenStatusBoolean = pOriginaleVernichtenStatusBoolean
+		self.sSchluesselartString = pSchluesselartStrirng
+		self.sErweiterterPfadZuSchluesseldateiString = pErweiterterPfadZuSchluesseldateiString
+		self.sRueckmeldungen = pRueckmeldungen if pRueckmeldungen is not None else Rueckmeldungen()
+		self.sDatenstromQuelleFile = pDatenstromQuelleFile
+		self.sDatenstromZielFile = pDatenstromZielFile
+		self.sVerschluesselungAmOrtBoolean = pVerschluesselungAmOrtBoolean
+		self.sArchivBoolean = pArchivBoolean
+		self.sArchivAuswahlList = pArchivAuswahlList
+		self.sStartZeitpunktAusgegebenBoolean = False
+		self.sDateilistenAnzeigeFehlerImProzessBoolean = False
+		self.sAbgebrochenBoolean = False
+		self.sSchwererFehlerBoolean = False
+		self.sErweitertePfadeAllerErzeugtenDateienList = []
+
+		# Globale Werte zur Schlüsselableitung:
+		self.sInitialesScryptSaltBytes = None
+		self.sMasterschluesselAusVorhandenerDateiBoolean = False # True, wenn der Masterschlüssel mit dem Salt einer vorhandenen Datei berechnet wurde
+		self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN = None # geheim
+		self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN = None # geheim
+		self.sAESGCMV3SchluesselBytes_LOESCHEN = None # geheim
+		self.sChaCha20V3SchluesselBytes_LOESCHEN = None # geheim
+		self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = None # geheim
+		self.sGeheimnisregister = LiSWerkzeuge.Geheimnisregister() # Überschreibt die geheimen Werte am Ende von fuehreFunktionAus()
+
+		# Zähler für die Obergrenze von Dateien, die bei Verwendung von AES-GCM mit demselben Schlüssel
+		# verschlüsselt werden dürfen:
+		self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger = 0
+
+		# Zähler für die Obergrenze von Dateien, die bei Verwendung von ChaCha20 mit demselben Schlüssel
+		# verschlüsselt werden dürfen:
+		self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger = 0
+
+		# Flag für Stopp der Programmfunktion:
+		self.sFunktionsprozessAktivBoolean = False
+
+		# Zusammenfassung der Zeitmessung (nur bei aktivierter Zeitmessung, siehe LiSZeitmessung):
+		self.sZeitmessungDictionary = None
+
+		# Fortschritt (verarbeitete Bytes und Dateien, Durchsatz, Restzeit):
+		self.sFortschritt = LiSFortschritt.Fortschritt(pFunktionString, pOriginaleVernichtenStatusBoolean, pVerschluesselungAmOrtBoolean)
+
+	def fuehreAus(self):
+		"""
+		Führt die Programmfunktion aus (inkl. Abfangen und Protokollieren unerwarteter Exceptions). Der Erfolg kann
+		anschließend über sindProblemeAufgetreten(), wurdeAbgebrochen() und istSchwererFehlerAufgetreten() abgefragt werden.
+		"""
+		self.sFunktionsprozessAktivBoolean = True
+		LiSZeitmessung.Zeitmessung.beginneLauf()
+		self.sFortschritt.beginne(self.sSortierteBereinigteDragAndDropsList)
+		try:
+			self.fuehreFunktionAus()
+		except Exception:
+			self._zeigeFehler('Unbekannter schwerer Fehler.')
+			logging.exception(
+				datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Funktionsausführung')
+		finally:
+			self.sFunktionsprozessAktivBoolean = False # Nur relevant, wenn Prozess nicht durch Nutzer ("Abbrechen"-Button) angehalten wurde
+			self.sFortschritt.beende()
+			self.setzeStatusleisteUndGUIZustand()
+			self.sZeitmessungDictionary = LiSZeitmessung.Zeitmessung.beendeLauf()
+
+	def fuehreFunktionAus(self):
+		"""
+		Führt die in in self.sFunktionString festgelegte Programmfunktion aus.
+		"""
+		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is not None or self.sInitialesScryptSaltBytes is not None: # Vermeidung einer Wiederholung des Scrypt-Hashes
+			raise AssertionError('Initialer Scrypt-Hash vor Funktionsausfühurng bereis vorhanden.')
+
+		# Dateisystemtypen je Funktionsdurchlauf neu ermitteln (zwischenzeitlich gewechselte Datenträger):
+		LiSWerkzeuge.Dateisystemwerkzeuge.leereZwischenspeicher()
+
+		lPasswortString_LOESCHEN = None
+		lSHA512HashwertBytes_LOESCHEN = None
+		lSHA256HashwertBytes_LOESCHEN = None
+		with self.sGeheimnisregister: # Überschreibt beim Verlassen alle registrierten geheimen Werte (auch bei Fehlern in Except-Blöcken)
+			try:
+				# Entsprechende Funktionsmethode aufrufen:
+				if self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL:
+					for lDragAndDropElementString in self.sSortierteBereinigteDragAndDropsList:
+						try: #Durch try und except wird ausgeschlossen, dass Originaldateien ohne Verschlüsselung vernichtet werden
+							if self.sSchluesselartString == LiSKonstanten.C_SCHLUESSELART_PASSWORT_LITERAL:
+								if lPasswortString_LOESCHEN is None:
+									lPasswortString_LOESCHEN = self.sGeheimnisregister.registriere(self._erfragePasswort(), pStringBestaetigungBoolean=True)
+									lSHA512HashwertBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneSHA512(pPasswortString=lPasswortString_LOESCHEN))
+									self._gibStartzeitpunktAus()
+
+									if self.sRueckmeldungen.gibZwischenablageText() == lPasswortString_LOESCHEN:
+										self._zeigeWarnung(
+											'Die Zwischenablage enthält Ihr Passwort! Aus Sicherheitsgründen wird die Zwischenablage jetzt geleert.')
+										self.sRueckmeldungen.leereZwischenablage()
+										self.ergaenzeBerichtAusgabe('* Zwischenablage geleert')
+							else: #d.h. Schlüsseldatei:
+								if lSHA512HashwertBytes_LOESCHEN is None:
+									self.setzeStatusleisteUndGUIZustand('Schlüsseldatei verarbeiten...')
+									lSHA512HashwertBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneSHA512(
+										pErweiterterPfadZuSchluesseldateiString=self.sErweiterterPfadZuSchluesseldateiString))
+									self._gibStartzeitpunktAus()
+							self._verschluessle(lDragAndDropElementString, lSHA512HashwertBytes_LOESCHEN)
+
+						except LiSAusnahmen.QNoPasswordError:
+							self.sAbgebrochenBoolean = True
+							break
+						except LiSAusnahmen.QFileListDisplayError as lException:
+							if not isinstance(lException, LiSAusnahmen.QFileSkippedByUserError):
+								self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+							self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
+							logging.exception(
+								datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Verschlüsselung')
+						except LiSAusnahmen.QProcessStoppedByUserError as lException:
+							self.ergaenzeBerichtAusgabe('-- Abbruch durch Nutzer --')
+							break
+						except Exception as lException:
+							logging.exception(
+								datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Verschlüsselung')
+							self._zeigeFehler(str(lException))
+							break
+
+				elif self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL:
+					for lDragAndDropElementString in self.sSortierteBereinigteDragAndDropsList:
+						try: #Durch try und except wird ausgeschlossen, dass verschlüsselte Dateien ohne Entschlüsselung vernichtet werden
+							if self.sSchluesselartString == LiSKonstanten.C_SCHLUESSELART_PASSWORT_LITERAL:
+								if lPasswortString_LOESCHEN is None:
+									lPasswortString_LOESCHEN = self.sGeheimnisregister.registriere(self._erfragePasswort(pMitBestaetigungBoolean=False), pStringBestaetigungBoolean=True)
+									lSHA256HashwertBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneSHA256(pPasswortString=lPasswortString_LOESCHEN))
+									lSHA512HashwertBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneSHA512(pPasswortString=lPasswortString_LOESCHEN))
+									self._gibStartzeitpunktAus()
+
+									if self.sRueckmeldungen.gibZwischenablageText() == lPasswortString_LOESCHEN:
+										self._zeigeWarnung(
+											'Die Zwischenablage enthält Ihr Passwort! Aus Sicherheitsgründen wird die Zwischenablage jetzt geleert.')
+										self.sRueckmeldungen.leereZwischenablage()
+										self.ergaenzeBerichtAusgabe('* Zwischenablage geleert')
+							else:
+								if lSHA512HashwertBytes_LOESCHEN is None: # Gedacht: 'or lSHA256Hashwert is None'
+									self.setzeStatusleisteUndGUIZustand('Schlüsseldatei verarbeiten...')
+									lSHA256HashwertBytes_LOESCHEN, lSHA512HashwertBytes_LOESCHEN = self._berechneSHA256UndSHA512VonDatei(self.sErweiterterPfadZuSchluesseldateiString)
+									self.sGeheimnisregister.registriere(lSHA256HashwertBytes_LOESCHEN)
+									self.sGeheimnisregister.registriere(lSHA512HashwertBytes_LOESCHEN)
+									self._gibStartzeitpunktAus()
+							self._entschluessle(pErweiterterPfadString=lDragAndDropElementString, pSHA256HashwertBytes=lSHA256HashwertBytes_LOESCHEN, pSHA512HashwertBytes=lSHA512HashwertBytes_LOESCHEN)
+
+						except LiSAusnahmen.QNoPasswordError:
+							self.sAbgebrochenBoolean = True
+							break
+						except LiSAusnahmen.QFileListDisplayError as lException:
+							if not isinstance(lException, LiSAusnahmen.QFileSkippedByUserError):
+								self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+							self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
+							logging.exception(
+								datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Entschlüsselung')
+						except LiSAusnahmen.QProcessStoppedByUserError:
+							self.ergaenzeBerichtAusgabe('-- Abbruch durch Nutzer --')
+							break
+						except Exception as lException:
+							logging.exception(
+								datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Entschlüsselung')
+							self._zeigeFehler(str(lException))
+							break
+
+				else: # d.h. self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL
+					self._gibStartzeitpunktAus()
+					for lDragAndDropElementString in self.sSortierteBereinigteDragAndDropsList:
+						try:
+							self.vernichte(pErweiterterPfadString=lDragAndDropElementString)
+						except LiSAusnahmen.QFileListDisplayError as lException:
+							self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+							self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
+							logging.exception(
+								datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung')
+						except LiSAusnahmen.QProcessStoppedByUserError:
+							self.ergaenzeBerichtAusgabe('-- Abbruch durch Nutzer --')
+							break
+						except Exception as lException:
+							logging.exception(
+								datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung')
+							self._zeigeFehler(str(lException))
+							break
+			except:
+				pass
+
+			finally:
+				# Verweise auf die geheimen Werte freigeben, damit das Register auch das Passwort überschreiben kann
+				# (die Werte der Schlüsselableitung werden bei einer Neuberechnung bereits im Prozess überschrieben):
+				lPasswortString_LOESCHEN = None
+				lSHA256HashwertBytes_LOESCHEN = None
+				lSHA512HashwertBytes_LOESCHEN = None
+				self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN = None
+				self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN = None
+				self.sAESGCMV3SchluesselBytes_LOESCHEN = None
+				self.sChaCha20V3SchluesselBytes_LOESCHEN = None
+				self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = None
+
+		#Ausgabe von Endzeitpunkt und Probleminformationen, falls erforderlich
+		self._gibEndzeitpunktAusFallsErforderlich()
+		self._zeigeProbleminfoFallsErforderlich()
+
+
+	def _verschluessle(self, pErweiterterPfadString, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Analysiert das durch pErweiterterPfadString für die Verschlüsselung bestimmte Element des
+		Dateisystems (Datei oder Verzeichnis?) und veranlasst die weitere Verarbeitung.
+
+		:param pErweiterterPfadString: Erweiterte Pfadangabe zum durch pErweiterterPfadString gehörigen Verzeichniseintrag
+		:type pErweiterterPfadString: String
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		if pErweiterterPfadString == LiSKonstanten.C_DATENSTROM_PFADANGABE:
+			self._verschluessleDatenstrom(pSHA512HashwertBytes=pSHA512HashwertBytes)
+		elif not os.path.islink(pErweiterterPfadString) and not LiSWerkzeuge.Dateiwerkzeuge.istFIFO(pErweiterterPfadString) \
+				and (not os.name == 'nt' or (not os.path.isfile(pErweiterterPfadString) or not pErweiterterPfadString.lower().endswith('.lnk'))):
+			if os.path.exists(pErweiterterPfadString):
+				if os.path.isfile(pErweiterterPfadString):
+					# Alle Exceptions werden zum Aufrufer weitergereicht
+					if self.sSchluesselartString != LiSKonstanten.C_SCHLUESSELART_SCHLUESSELDATEI_LITERAL or self.sErweiterterPfadZuSchluesseldateiString != pErweiterterPfadString:
+						with LiSZeitmessung.Zeitmessung.datei('Datei verschluesseln', pErweiterterPfadString):
+							self._verschluessleDatei(pErweiterterPfadZuDateiString=pErweiterterPfadString, pSHA512HashwertBytes=pSHA512HashwertBytes)
+						self.meldeDateiAbgeschlossen()
+					else:
+						lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+						lNurEndnameString = os.path.basename(lNameReduziertString)
+						raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Schlüsseldatei]', lNameReduziertString)
+				elif os.path.isdir(pErweiterterPfadString):
+					# Alle Exceptions werden zum Aufrufer weitergereicht
+					if self.sArchivBoolean is True:
+						self._verschluessleVerzeichnisAlsArchiv(pErweiterterPfadZuVerzeichnisString=pErweiterterPfadString, pSHA512HashwertBytes=pSHA512HashwertBytes)
+					else:
+						self._verschluessleVerzeichnis(pErweiterterPfadZuVerzeichnisString=pErweiterterPfadString, pSHA512HashwertBytes=pSHA512HashwertBytes)
+				else:
+					lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+					lNurEndnameString = os.path.basename(lNameReduziertString)
+					raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Unbekannter Typ]', lNameReduziertString)
+			else:
+				lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+				lNurEndnameString = os.path.basename(lNameReduziertString)
+				raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Ver-/Entschlüsselung: Nicht gefunden]', lNameReduziertString)
+		else:
+			lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+			lNurEndnameString = os.path.basename(lNameReduziertString)
+			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Verknüpfung/FIFO]', lNameReduziertString)
+
+	def _verschluessleDatei(self, pErweiterterPfadZuDateiString, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Veranlasst die Verschlüsselung der urch pErweitererPfadZuDateiString spezifizierten Datei unter
+		Verwendung des Hashes pSHA512HashwertBytes als Schlüsselausgangsmaterial.
+
+		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zu einer Datei
+		:type pErweiterterPfadZuDateiString: String
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
+		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiString)
+
+		if self.sOriginaleVernichtenStatusBoolean is False or LiSWerkzeuge.Dateiwerkzeuge.istBeschreibbar(pErweiterterPfadZuDateiString):
+			lNurVorPfadString = os.path.dirname(pErweiterterPfadZuDateiString)
+			lNurEndnameMitErsetzungString = LiSWerkzeuge.Stringwerkzeuge.rreplace(lNurEndnameString, '.', '-', 1) + LiSKonstanten.C_DATEIENDUNG
+			lErweiterterPfadZuZieldateiString = os.path.join(lNurVorPfadString, lNurEndnameMitErsetzungString)
+
+			# Eine laut Journal unterbrochene Verschlüsselung wird ohne Rückfrage fortgesetzt (bzw. verworfen, falls nicht fortsetzbar):
+			lFortsetzbareZieldateiString = LiSJournal.Segmentjournal(LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL, pErweiterterPfadZuDateiString).gibFortsetzbareZieldatei()
+
+			if not os.path.lexists(lErweiterterPfadZuZieldateiString) or lFortsetzbareZieldateiString == lErweiterterPfadZuZieldateiString:
+				# Alle Exceptions werden zum Aufrufer weitergereicht
+				self._verschluessleDateiMitOderOhneKopie(pErweiterterPfadZuDateiString, pSHA512HashwertBytes, lErweiterterPfadZuZieldateiString)
+			else:
+				lUeberschreibenInteger = self.erfrageUeberschreiben(lErweiterterPfadZuZieldateiString)
+				# Alle Exceptions werden zum Aufrufer weitergereicht
+				if lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_JA:
+					self.vernichte(lErweiterterPfadZuZieldateiString)
+					self._verschluessleDateiMitOderOhneKopie(pErweiterterPfadZuDateiString, pSHA512HashwertBytes, lErweiterterPfadZuZieldateiString)
+				elif lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_NEIN:
+					raise LiSAusnahmen.QFileSkippedByUserError(lNurEndnameString + ': [Übersprungen: Nutzer-Auswahl]', lDateinameReduziertString)
+				else: #d.h. lUeberschreibenBoolean=None -Auswahl von 'Abbrechen' im Dialogfenster
+					self.stoppeFunktionsprozess()
+					raise LiSAusnahmen.QProcessStoppedByUserError()
+		else:
+			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Kein Schreibzugriff]', lDateinameReduziertString)
+
+	def _verschluessleDateiMitOderOhneKopie(self, pErweiterterPfadZuDateiString, pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString):
+		"""
+		Interne Methode. Verschlüsselt die durch pErweitererPfadZuDateiString spezifizierte Datei als
+		pErweiterterPfadZuZieldateiString und vernichtet ggf. das Original. Ist die Verschlüsselung am Ort aktiviert und
+		soll das Original ohnehin vernichtet werden, werden Dateien ab LiSKonstanten.C_AM_ORT_MINDESTGROESSE ohne Kopie
+		am Ort verschlüsselt und anschließend umbenannt (halbe Schreibmenge, kein zusätzlicher Speicherplatz). Eine
+		unterbrochene Verschlüsselung am Ort wird unabhängig von den Optionen am Ort fortgesetzt.
+
+		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zu einer Datei
+		:type pErweiterterPfadZuDateiString: String
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pErweiterterPfadZuZieldateiString: Erweiterte Pfadangabe zur Zieldatei
+		:type pErweiterterPfadZuZieldateiString: String
+		"""
+		lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
+		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiString)
+		lQuelldatei = LiSKrypto.QDatei(self, pErweiterterPfadZuDateiString)
+
+		if lQuelldatei.istVerschluesselungAmOrtFortzusetzen(pErweiterterPfadZuZieldateiString) is True \
+				or (self.sVerschluesselungAmOrtBoolean is True and self.sOriginaleVernichtenStatusBoolean is True
+					and os.path.getsize(pErweiterterPfadZuDateiString) >= LiSKonstanten.C_AM_ORT_MINDESTGROESSE):
+			lQuelldatei.verschluesselnAmOrt(pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=pErweiterterPfadZuZieldateiString)
+			self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Verschlüsselung am Ort OK]', lDateinameReduziertString)
+			self.sErweitertePfadeAllerErzeugtenDateienList.append(pErweiterterPfadZuZieldateiString)
+		else:
+			lQuelldatei.verschluesseln(pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=pErweiterterPfadZuZieldateiString)
+			self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Verschlüsselung OK]', lDateinameReduziertString)
+			self.sErweitertePfadeAllerErzeugtenDateienList.append(pErweiterterPfadZuZieldateiString)  # Wenn die Verschlüsselung gelungen ist, dann wurde auch eine Datei erzeugt
+			if self.sOriginaleVernichtenStatusBoolean is True:
+				self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiString)
+
+	def _verschluessleVerzeichnis(self, pErweiterterPfadZuVerzeichnisString, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Durchläuft das durch pErweitererPfadZuVerzeichnisString spezifizierte Verzeichnis sowie dessen
+		Unterverzeichnisse und ruft für alle gefundenen Dateien ohne Endung LiSKonstanten.C_DATEIENDUNG die Methode self._verschluessle(...) auf
+
+		:param pErweiterterPfadZuVerzeichnisString: Erweiterte Pfadangabe zu einem Verzeichnis
+		:type pErweiterterPfadZuVerzeichnisString: String
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		for lWurzel, lVerzeichnisse, lDateien in os.walk(pErweiterterPfadZuVerzeichnisString):
+			for lDateiname in lDateien:
+				if not str.lower(lDateiname).endswith(LiSKonstanten.C_DATEIENDUNG):
+					lDateinameMitPfadString = os.path.join(lWurzel, lDateiname)
+					lDateinameMitPfadErweitertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lDateinameMitPfadString)
+					try:
+						self._verschluessle(lDateinameMitPfadErweitertString, pSHA512HashwertBytes)
+					except LiSAusnahmen.QFileListDisplayError as lException:
+						# Spezielle Behandlung von QFileListDisplayErrors
+						# Alle anderen Exceptions werden zum Aufrufer weitergereicht
+						if not isinstance(lException, LiSAusnahmen.QFileSkippedByUserError):
+							self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+						self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
+						logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Verschlüsselung')
+
+	def _verschluessleVerzeichnisAlsArchiv(self, pErweiterterPfadZuVerzeichnisString, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Verschlüsselt alle Dateien ohne Endung LiSKonstanten.C_DATEIENDUNG im durch
+		pErweitererPfadZuVerzeichnisString spezifizierten Verzeichnis sowie dessen Unterverzeichnissen als ein einziges
+		Archiv neben dem Verzeichnis (siehe LiSKrypto.QArchiv) und vernichtet ggf. anschließend die archivierten Originale.
+
+		:param pErweiterterPfadZuVerzeichnisString: Erweiterte Pfadangabe zu einem Verzeichnis
+		:type pErweiterterPfadZuVerzeichnisString: String
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		lVerzeichnisnameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuVerzeichnisString)
+		lNurEndnameString = os.path.basename(pErweiterterPfadZuVerzeichnisString)
+		lNurEndnameMitErsetzungString = LiSWerkzeuge.Stringwerkzeuge.rreplace(lNurEndnameString, '.', '-', 1) + LiSKonstanten.C_DATEIENDUNG
+		lErweiterterPfadZuZieldateiString = os.path.join(os.path.dirname(pErweiterterPfadZuVerzeichnisString), lNurEndnameMitErsetzungString)
+
+		if os.path.lexists(lErweiterterPfadZuZieldateiString):
+			lUeberschreibenInteger = self.erfrageUeberschreiben(lErweiterterPfadZuZieldateiString)
+			# Alle Exceptions werden zum Aufrufer weitergereicht
+			if lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_JA:
+				self.vernichte(lErweiterterPfadZuZieldateiString)
+			elif lUeberschreibenInteger == LiSKonstanten.C_UEBERSCHREIBEN_NEIN:
+				raise LiSAusnahmen.QFileSkippedByUserError(lNurEndnameString + ': [Übersprungen: Nutzer-Auswahl]', lVerzeichnisnameReduziertString)
+			else: #d.h. lUeberschreibenBoolean=None -Auswahl von 'Abbrechen' im Dialogfenster
+				self.stoppeFunktionsprozess()
+				raise LiSAusnahmen.QProcessStoppedByUserError()
+
+		lAusgeschlossenerPfadString = self.sErweiterterPfadZuSchluesseldateiString if self.sSchluesselartString == LiSKonstanten.C_SCHLUESSELART_SCHLUESSELDATEI_LITERAL else None
+		with LiSZeitmessung.Zeitmessung.datei('Archiv verschluesseln', pErweiterterPfadZuVerzeichnisString):
+			lArchivierteDateienList, lUebersprungenInteger = LiSKrypto.QArchiv(self, pErweiterterPfadZuVerzeichnisString).verschluesseln(
+				pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=lErweiterterPfadZuZieldateiString,
+				pAusgeschlossenerPfadString=lAusgeschlossenerPfadString, pDauerhaftSichernBoolean=self.sOriginaleVernichtenStatusBoolean)
+		self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Archivierung OK: ' + str(len(lArchivierteDateienList)) + ' Dateien]', lVerzeichnisnameReduziertString)
+		self.sErweitertePfadeAllerErzeugtenDateienList.append(lErweiterterPfadZuZieldateiString)
+		if lUebersprungenInteger > 0:
+			self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+
+		if self.sOriginaleVernichtenStatusBoolean is True:
+			for lErweiterterPfadZuDateiString in lArchivierteDateienList:
+				try:
+					self._vernichteDateiOderVerweisOderFIFO(lErweiterterPfadZuDateiString)
+				except LiSAusnahmen.QFileListDisplayError as lException:
+					# Spezielle Behandlung von QFileListDisplayErrors
+					# Alle anderen Exceptions werden zum Aufrufer weitergereicht
+					self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+					self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
+					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung (Archiv)')
+
+	def _verschluessleDatenstrom(self, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Veranlasst die Verschlüsselung des Datenstroms self.sDatenstromQuelleFile (Default:
+		Standardeingabe) nach self.sDatenstromZielFile (Default: Standardausgabe) unter Verwendung des Hashes
+		pSHA512HashwertBytes als Schlüsselausgangsmaterial.
+
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		# Alle Exceptions werden zum Aufrufer weitergereicht
+		LiSKrypto.QDatenstrom(self, self._gibDatenstromQuelle(), 'Standardeingabe').verschluesseln(pSHA512HashwertBytes=pSHA512HashwertBytes, pZielFile=self._gibDatenstromZiel())
+		self.ergaenzeBerichtAusgabe('Standardeingabe: [Verschlüsselung OK]')
+
+	def _entschluessle(self, pErweiterterPfadString, pSHA256HashwertBytes, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Analysiert das durch pErweiterterPfadString für die Entschlüsselung bestimmte Element des
+		Dateisystems (Datei oder Verzeichnis?) und veranlasst die weitere Verarbeitung.
+
+		:param pErweiterterPfadString: Erweiterte Pfadangabe zum Element des Dateisystems
+		:type pErweiterterPfadString: String
+		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		if pErweiterterPfadString == LiSKonstanten.C_DATENSTROM_PFADANGABE:
+			self._entschluessleDatenstrom(pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes)
+		elif not os.path.islink(pErweiterterPfadString) \
+				and not LiSWerkzeuge.Dateiwerkzeuge.istFIFO(pErweiterterPfadString): # Keine Prüfung auf *.lnk, da hier nur Dateien mit Endung LiSKonstanten.C_DATEIENDUNG ankommen:
+			if os.path.exists(pErweiterterPfadString):
+				if os.path.isfile(pErweiterterPfadString) and str.lower(pErweiterterPfadString).endswith(LiSKonstanten.C_DATEIENDUNG):
+						try:
+							with LiSZeitmessung.Zeitmessung.datei('Datei entschluesseln', pErweiterterPfadString):
+								self._entschluessleDatei(pErweiterterPfadZuDateiString=pErweiterterPfadString, pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes)
+							self.meldeDateiAbgeschlossen()
+						except (LiSAusnahmen.QFileListDisplayError, LiSAusnahmen.QProcessStoppedByUserError):
+							raise
+				elif os.path.isdir(pErweiterterPfadString):
+					try:
+						self._entschluessleVerzeichnis(pErweiterterPfadZuVerzeichnisString=pErweiterterPfadString, pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes)
+					except (LiSAusnahmen.QFileListDisplayError, LiSAusnahmen.QProcessStoppedByUserError):
+						raise
+				else:
+					lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+					lNurEndnameString = os.path.basename(lNameReduziertString)
+					raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Unbekannter Typ]', lNameReduziertString)
+			else:
+				lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+				lNurEndnameString = os.path.basename(lNameReduziertString)
+				raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Ver-/Entschlüsselung: Nicht gefunden]', lNameReduziertString)
+		else:
+			lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+			lNurEndnameString = os.path.basename(lNameReduziertString)
+			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Verknüpfung/FIFO]', lNameReduziertString)
+
+	def _entschluessleDatei(self, pErweiterterPfadZuDateiString, pSHA256HashwertBytes, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Veranlasst die Entschlüsselung der durch pErweitererPfadZuDateiString spezifizierten Datei unter
+		Verwendung des Hashes pSHA256HashwertBytes oder des Hashes pSHA512HashwertBytes als Schlüsselausgangsmaterial.
+
+		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zu einer Datei
+		:type pErweiterterPfadZuDateiString: String
+		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
+		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiString)
+		lReduzierterPfadZuDateiString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
+
+		erweiterterPfadZuTempCerzeichnisString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(tempfile.gettempdir())
+		if pErweiterterPfadZuDateiString.startswith(erweiterterPfadZuTempCerzeichnisString):
+			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Entschlüsselungsort nicht zulässig]',
+													 lReduzierterPfadZuDateiString)
+		else:
+			if self.sOriginaleVernichtenStatusBoolean is False or LiSWerkzeuge.Dateiwerkzeuge.istBeschreibbar(pErweiterterPfadZuDateiString):
+				# Alle Exceptions werden zum Aufrufer weitergereicht
+				if LiSKrypto.QArchiv.istArchiv(pErweiterterPfadZuDateiString) is True:
+					self._entschluessleArchiv(pErweiterterPfadZuDateiString, pSHA512HashwertBytes)
+					return
+				# Eine laut Journal unterbrochene Entschlüsselung wird in der bisherigen (temporären) Zieldatei fortgesetzt:
+				lZieldateinameString = LiSJournal.Segmentjournal(LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL, pErweiterterPfadZuDateiString).gibFortsetzbareZieldatei()
+				if lZieldateinameString is not None and os.path.dirname(lZieldateinameString) != os.path.dirname(pErweiterterPfadZuDateiString):
+					lZieldateinameString = None
+				if lZieldateinameString is None:
+					while lZieldateinameString is None or os.path.lexists(lZieldateinameString):
+						# Erzeuge zufälligen temporären Dateinamen für Entschlüsselung
+						lZielNurEndnameString = LiSWerkzeuge.Stringwerkzeuge.erzeugeZufaelligenBuchstabenUndZiffernStringMitMaximalerLaenge(len(lNurEndnameString)) # Wg. Endung 'LiSKonstanten.C_DATEIENDUNG' ist kleinste Maximallänge 5 (sollte im Regelfall ausreichen)
+						lZieldateinameVorEndnameString = os.path.split(pErweiterterPfadZuDateiString)[0]
+						lZieldateinameString = os.path.join(lZieldateinameVorEndnameString,lZielNurEndnameString)
+
+				lErweiterterPfadZuZieldateiString = LiSKrypto.QDatei(self, pErweiterterPfadZuDateiString).entschluesseln(pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes, pErweiterterPfadZuZieldateiString=lZieldateinameString)
+				self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Entschlüsselung OK]', lDateinameReduziertString)
+				self.sErweitertePfadeAllerErzeugtenDateienList.append(lErweiterterPfadZuZieldateiString) # Wenn die Entschlüsselung gelungen ist, dann wurde auch eine Datei erzeugt
+				if self.sOriginaleVernichtenStatusBoolean is True:
+					self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiString)
+			else:
+				raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Übersprungen: Kein Schreibzugriff]', lDateinameReduziertString)
+
+	def _entschluessleArchiv(self, pErweiterterPfadZuDateiString, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Entschlüsselt das durch pErweitererPfadZuDateiString spezifizierte Archiv (ggf. nur die Einträge
+		gemäß self.sArchivAuswahlList) und vernichtet ggf. anschließend das Archiv. Wurden nicht alle Einträge
+		entschlüsselt, bleibt das Archiv erhalten.
+
+		:param pErweiterterPfadZuDateiString: Erweiterte Pfadangabe zu einem Archiv
+		:type pErweiterterPfadZuDateiString: String
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiString)
+		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiString)
+
+		# Alle Exceptions werden zum Aufrufer weitergereicht
+		lErweiterterPfadZuVerzeichnisString, lEntschluesseltInteger, lUebersprungenInteger = LiSKrypto.QArchiv(self, pErweiterterPfadZuDateiString).entschluesseln(
+			pSHA512HashwertBytes=pSHA512HashwertBytes, pAuswahlList=self.sArchivAuswahlList)
+		self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Entschlüsselung OK: ' + str(lEntschluesseltInteger) + ' Dateien]', lDateinameReduziertString)
+		self.sErweitertePfadeAllerErzeugtenDateienList.append(lErweiterterPfadZuVerzeichnisString)
+		if self.sOriginaleVernichtenStatusBoolean is True and not self.sArchivAuswahlList and lUebersprungenInteger == 0:
+			self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiString)
+
+	def _entschluessleVerzeichnis(self, pErweiterterPfadZuVerzeichnisString, pSHA256HashwertBytes, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Durchläuft das durch pErweitererPfadZuVerzeichnisString spezifizierte Verzeichnis sowie dessen
+		Unterverzeichnisse und ruft für alle gefundenen Dateien mit Endung LiSKonstanten.C_DATEIENDUNG die Methode self._entschluessle(...) auf
+
+		:param pErweiterterPfadZuVerzeichnisString: Erweiterte Pfadangabe zu einem Verzeichnis
+		:type pErweiterterPfadZuVerzeichnisString: String
+		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		for lWurzel, lVerzeichnisse, lDateien in os.walk(pErweiterterPfadZuVerzeichnisString):
+			for lDateiname in lDateien:
+				if str.lower(lDateiname).endswith(LiSKonstanten.C_DATEIENDUNG):
+					lDateinameMitPfadString = os.path.join(lWurzel, lDateiname)
+					lDateinameMitPfadErweitertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lDateinameMitPfadString)
+					try:
+						self._entschluessle(pErweiterterPfadString=lDateinameMitPfadErweitertString, pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes)
+					except LiSAusnahmen.QFileListDisplayError as lException:
+						# Spezielle Behandlung von QFileListDisplayErrors
+						# Alle anderen Exceptions werden zum Aufrufer weitergereicht
+						if not isinstance(lException, LiSAusnahmen.QFileSkippedByUserError):
+							self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+						self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
+						logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Entschlüsselung')
+
+	def _entschluessleDatenstrom(self, pSHA256HashwertBytes, pSHA512HashwertBytes):
+		"""
+		Interne Methode. Veranlasst die Entschlüsselung des Datenstroms self.sDatenstromQuelleFile (Default:
+		Standardeingabe) nach self.sDatenstromZielFile (Default: Standardausgabe) unter Verwendung der Hashes
+		pSHA256HashwertBytes bzw. pSHA512HashwertBytes als Schlüsselausgangsmaterial.
+
+		:param pSHA256HashwertBytes: SHA256-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pSHA512HashwertBytes: SHA512-Hashwert (zu Passwort oder Schlüsseldatei)
+		:type pSHA512HashwertBytes: Bytesequenz
+		"""
+		# Alle Exceptions werden zum Aufrufer weitergereicht
+		LiSKrypto.QDatenstrom(self, self._gibDatenstromQuelle(), 'Standardeingabe').entschluesseln(pSHA256HashwertBytes=pSHA256HashwertBytes, pSHA512HashwertBytes=pSHA512HashwertBytes,
+																								   pZielFile=self._gibDatenstromZiel())
+		self.ergaenzeBerichtAusgabe('Standardeingabe: [Entschlüsselung OK]')
+
+	def _gibDatenstromQuelle(self):
+		"""
+		Interne Methode. Returniert die Quelle für den Eintrag LiSKonstanten.C_DATENSTROM_PFADANGABE.
+		"""
+		return self.sDatenstromQuelleFile if self.sDatenstromQuelleFile is not None else sys.stdin.buffer
+
+	def _gibDatenstromZiel(self):
+		"""
+		Interne Methode. Returniert das Ziel für den Eintrag LiSKonstanten.C_DATENSTROM_PFADANGABE.
+		"""
+		return self.sDatenstromZielFile if self.sDatenstromZielFile is not None else sys.stdout.buffer
+
+	def vernichte(self, pErweiterterPfadString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=False):
+		"""
+		Analysiert das durch pErweiterterPfadString für die Vernichtung bestimmte Element des Dateisystems (Datei oder
+		Verzeichnis?) und veranlasst die weitere Verarbeitung. Wird intern und von LiSKrypto.Datei()-Instanzen verwendet.
+
+		:param pErweiterterPfadString: Erweiterte Pfadangabe
+		:type pErweiterterPfadString: String
+		:param pAusgabeEintragsnameBoolean: Angabe, ob die Vernichtung im Berichtsbereich angezeigt werden soll (true: ja, false: nein)
+		:type pAusgabeEintragsnameBoolean: Boolean
+		"""
+		# Alle Exceptions werden zum Aufrufer weitergereicht
+		#self.setzeStatusleisteZustand('Vernichtung läuft...', True)
+		if os.path.lexists(pErweiterterPfadString):
+			if os.path.isdir(pErweiterterPfadString):
+				self._vernichteVerzeichnis(pErweiterterPfadZuVerzeichnisString=pErweiterterPfadString,
+										   pAusgabeEintragsnameBoolean=pAusgabeEintragsnameBoolean,
+										   pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
+			else:
+				self._vernichteDateiOderVerweisOderFIFO(pErweiterterPfadZuDateiOderVerweisOderFIFOString=pErweiterterPfadString,
+														pAusgabeEintragsnameBoolean=pAusgabeEintragsnameBoolean,
+														pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
+		else:
+			lNameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadString)
+			lNurEndnameString = os.path.basename(lNameReduziertString)
+			raise LiSAusnahmen.QFileListDisplayError(lNurEndnameString + ': [Vernichtung: Nicht gefunden]', lNameReduziertString)
+
+	def _vernichteDateiOderVerweisOderFIFO(self, pErweiterterPfadZuDateiOderVerweisOderFIFOString, pAusgabeEintragsnameBoolean=True, pIgnoriereFunktionsprozessAktivBoolean=False):
+		"""
+		Interne Methode. Veranlasst die Vernichtung der/des durch pErweitererPfadZuDateiString spezifizierten
+		Datei/symbolischen Links
+
+		:param pErweiterterPfadZuDateiOderVerweisOderFIFOString: Erweiterte Pfadangabe zu einer Datei
+		:type pErweiterterPfadZuDateiOderVerweisOderFIFOString: String
+		:param pAusgabeEintragsnameBoolean: Angabe, ob die Vernichtung im Berichtsbereich angezeigt werden soll (true: ja, false: nein)
+		:type pAusgabeEintragsnameBoolean: Boolean
+		"""
+		lNurEndnameString = os.path.basename(pErweiterterPfadZuDateiOderVerweisOderFIFOString)
+		if pAusgabeEintragsnameBoolean is True:
+			self.setzeStatusleisteUndGUIZustand(pTextString='Vernichtung: ' + lNurEndnameString, pAbbrechenButtonAktivBoolean=True)
+		else:
+			self.setzeStatusleisteUndGUIZustand(pTextString='Vernichtung: Temporäre Datei', pAbbrechenButtonAktivBoolean=True)
+
+		# Alle Exceptions werden zum Aufrufer weitergereicht
+		with LiSZeitmessung.Zeitmessung.datei('Datei vernichten', pErweiterterPfadZuDateiOderVerweisOderFIFOString):
+			lWindowsWipeBoolean = LiSVernichtung.QVerzeichniseintrag(self, pErweiterterPfadZuDateiOderVerweisOderFIFOString).vernichten(pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
+		if self.sFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL: # Vernichtete Originale zählen nicht als eigene Dateien
+			self.meldeDateiAbgeschlossen()
+		if pAusgabeEintragsnameBoolean is True:
+			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiOderVerweisOderFIFOString)
+			self.ergaenzeBerichtAusgabe(lNurEndnameString + (': [Vernichtung OK]' if lWindowsWipeBoolean is False else ': [Vernichtung  OK]'), lDateinameReduziertString)
+		else:
+			lDateinameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuDateiOderVerweisOderFIFOString)
+			self.ergaenzeBerichtAusgabe('Temporäre Datei' + (': [Vernichtung OK]' if lWindowsWipeBoolean is False else ': [Vernichtung  OK]'), lDateinameReduziertString)
+
+	def _vernichteVerzeichnis(self, pErweiterterPfadZuVerzeichnisString, pAusgabeEintragsnameBoolean, pIgnoriereFunktionsprozessAktivBoolean):
+		"""
+		Interne Methode. Durchläuft das durch pErweitererPfadZuVerzeichnisString spezifizierte Verzeichnis sowie dessen
+		Unterverzeichnisse und ruft für alle gefundenen Verzeichnisse self._vernichteVerzeichnis(...) sowie
+		für alle gefundenen Dateien/Verweise self._vernichteDateiOderVerweis(...) auf
+
+		:param pErweiterterPfadZuVerzeichnisString: Erweiterte Pfadangabe zu einem Verzeichnis
+		:type pErweiterterPfadZuVerzeichnisString: String
+		:param pAusgabeEintragsnameBoolean: Festlegung, ob der Verzeichnisname und die Namen der im Verzeichnis enthaltenen Dateien bei der Vernichtung ausgegeben werden sollen (True: ja, False: nein)
+		:type pAusgabeEintragsnameBoolean: Boolean
+		:param pIgnoriereFunktionsprozessAktivBoolean: Festlegung, ob die Vernichtung auch durchgeführt werden soll, wenn bereits ein Funktionsprozess läuft (True: ja, False: nein)
+		:type pIgnoriereFunktionsprozessAktivBoolean: Boolean
+
+		"""
+		for lWurzel, lVerzeichnisse, lDateien in os.walk(pErweiterterPfadZuVerzeichnisString):
+			for lVerzeichnisnameString in lVerzeichnisse:
+				lVerzeichnisnameMitPfadString = os.path.join(lWurzel, lVerzeichnisnameString)
+				lVerzeichnisnameMitPfadErweitertString	= LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lVerzeichnisnameMitPfadString)
+				# Weitergabe einer potentiellen Exception des folgenden Befehls an den Aufrufer
+				self._vernichteVerzeichnis(lVerzeichnisnameMitPfadErweitertString, pAusgabeEintragsnameBoolean=pAusgabeEintragsnameBoolean, pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
+			for lDateinameString in lDateien:
+				lDateinameMitPfadString = os.path.join(lWurzel, lDateinameString)
+				lDateinameMitPfadErweitertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(lDateinameMitPfadString)
+				try:
+					self._vernichteDateiOderVerweisOderFIFO(lDateinameMitPfadErweitertString, pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
+				except LiSAusnahmen.QFileListDisplayError as lException:
+					# Spezielle Behandlung von QFileListDisplayErrors
+					# Alle anderen Exceptions werden zum Aufrufer weitergereicht
+					if not isinstance(lException, LiSAusnahmen.QFileSkippedByUserError):
+						self.sDateilistenAnzeigeFehlerImProzessBoolean = True
+					self.ergaenzeBerichtAusgabe(str(lException), lException.gibToolTipString())
+					logging.exception(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S") + ': Exception während Vernichtung')
+
+		# Weitergabe einer potentiellen Exception des folgenden Befehls an den Aufrufer
+		LiSVernichtung.QVerzeichniseintrag(self, pErweiterterPfadZuVerzeichnisString).vernichten(pIgnoriereFunktionsprozessAktivBoolean=pIgnoriereFunktionsprozessAktivBoolean)
+		lVerzeichnisnameReduziertString = LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(pErweiterterPfadZuVerzeichnisString)
+		lNurEndnameString = os.path.basename(lVerzeichnisnameReduziertString)
+		if pAusgabeEintragsnameBoolean is True:
+			self.ergaenzeBerichtAusgabe(lNurEndnameString + ': [Vernichtung OK]', lVerzeichnisnameReduziertString)
+		else:
+			self.ergaenzeBerichtAusgabe('Temporäres Verzeichnis: [Vernichtung OK]', lVerzeichnisnameReduziertString)
+
+	# Methoden zur Berechnung eines SHA256-Hashwerts aus Passwort oder Schlüsseldatei:
+
+	def _berechneSHA256(self, pPasswortString=None, pErweiterterPfadZuSchluesseldateiString=None):
+		"""
+		Interne Methode. Ermittelt und returniert den SHA256-Hashwert zum String pPasswortString oder durch Aufruf von
+		self._berechneSHA256UndSHA512VonDatei(...) der durch pErweiterterPfadZuSchluesseldateiString spezifizierten Datei.
+
+		:param pPasswortString: Passwort
+		:type pPasswortString: String
+		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
+		:type pErweiterterPfadZuSchluesseldateiString: String
+		:return: SHA256-Hashwert
+		:rtype: Bytesequenz
+		"""
+		if  pPasswortString == '':
+			raise ValueError('SHA256 von leerem Passwort nicht möglich.')
+		if pPasswortString is not None and pErweiterterPfadZuSchluesseldateiString is None:
+			lSHA256 = hashes.Hash(hashes.SHA256(), backend=default_backend())
+			lPasswortBytes_LOESCHEN = pPasswortString.encode()
+			lSHA256.update(lPasswortBytes_LOESCHEN)
+			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lPasswortBytes_LOESCHEN)
+			return lSHA256.finalize()
+		elif pPasswortString is None and pErweiterterPfadZuSchluesseldateiString is not None:
+			lSHA256HashwertBytes, lSHA512HashwertBytes_LOESCHEN = self._berechneSHA256UndSHA512VonDatei(pErweiterterPfadZuSchluesseldateiString)
+			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA512HashwertBytes_LOESCHEN)
+			return lSHA256HashwertBytes
+		else:
+			raise AssertionError('Unzulässige Kombination von Passwort und/oder Schlüsseldatei! Prozess abgebrochen.')
+
+	# Methoden zur Berechnung eines SHA512-Hashwerts aus Passwort oder Schlüsseldatei:
+
+	def _berechneSHA512(self, pPasswortString=None, pErweiterterPfadZuSchluesseldateiString=None):
+		"""
+		Interne Methode. Ermittelt und returniert den SHA512-Hashwert zum String pPasswortString oder durch Aufruf von
+		self._berechneSHA256UndSHA512VonDatei(...) der durch pErweiterterPfadZuSchluesseldateiString spezifizierten Datei.
+
+		:param pPasswortString: Passwort
+		:type pPasswortString: String
+		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
+		:type pErweiterterPfadZuSchluesseldateiString: String
+		:return: SHA512-Hashwert
+		:rtype: Bytesequenz
+		"""
+		if  pPasswortString == '':
+			raise ValueError('SHA512 von leerem Passwort nicht möglich.')
+		if pPasswortString is not None and pErweiterterPfadZuSchluesseldateiString is None:
+			lSHA512 = hashes.Hash(hashes.SHA512(), backend=default_backend())
+			lPasswortBytes_LOESCHEN = pPasswortString.encode()
+			lSHA512.update(lPasswortBytes_LOESCHEN)
+			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lPasswortBytes_LOESCHEN)
+			return lSHA512.finalize()
+		elif pPasswortString is None and pErweiterterPfadZuSchluesseldateiString is not None:
+			lSHA256HashwertBytes_LOESCHEN, lSHA512HashwertBytes = self._berechneSHA256UndSHA512VonDatei(pErweiterterPfadZuSchluesseldateiString)
+			LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertBytes_LOESCHEN)
+			return lSHA512HashwertBytes
+		else:
+			raise AssertionError('Unzulässige Kombination von Passwort und/oder Schlüsseldatei! Prozess abgebrochen.')
+
+	def _berechneSHA256UndSHA512VonDatei(self, pErweiterterPfadZuSchluesseldateiString):
+		"""
+		Interne Methode. Ermittelt den SHA256- und den SHA512-Hashwert der durch pErweiterterPfadZuSchluesseldateiString
+		spezifizierten Datei in einem Durchlauf und returniert beide. Gelesen wird in einen wiederverwendeten
+		LiSWerkzeuge.SichererPuffer, der anschließend überschrieben wird. Die Hashwerte werden für die Sitzung gemerkt (siehe Schluesseldateihashwerte),
+		eine unveränderte Schlüsseldatei wird also nur einmal gelesen.
+
+		:param pErweiterterPfadZuSchluesseldateiString: Erweiterte Pfadangabe zur Schlüsseldatei
+		:type pErweiterterPfadZuSchluesseldateiString: String
+		:return: SHA256- und SHA512-Hashwert
+		:rtype: Tupel von Bytesequenzen
+		"""
+		try:
+			self.setzeStatusleisteUndGUIZustand('Verarbeite Schlüsseldatei...')
+			with open(pErweiterterPfadZuSchluesseldateiString, 'rb') as lDatei:
+				lSchluesselTuple = Schluesseldateihashwerte.ermittleSchluessel(pErweiterterPfadZuSchluesseldateiString, os.fstat(lDatei.fileno()))
+				lHashwerteTuple = Schluesseldateihashwerte.gib(lSchluesselTuple)
+				if lHashwerteTuple is not None:
+					return lHashwerteTuple
+
+				lSHA256 = hashes.Hash(hashes.SHA256(), backend=default_backend())
+				lSHA512 = hashes.Hash(hashes.SHA512(), backend=default_backend())
+				with LiSWerkzeuge.SichererPuffer(LiSBlockgroesse.Blockgroessenrichtlinie.gibBlockgroesse(pErweiterterPfadZuSchluesseldateiString)) as lSichererPuffer:
+					lAnzahlInteger = lDatei.readinto(lSichererPuffer.sMemoryview)
+					while lAnzahlInteger:
+						lSHA256.update(lSichererPuffer.sMemoryview[:lAnzahlInteger])
+						lSHA512.update(lSichererPuffer.sMemoryview[:lAnzahlInteger])
+						lAnzahlInteger = lDatei.readinto(lSichererPuffer.sMemoryview)
+		except:
+			raise OSError('Schlüsseldatei nicht gefunden oder nicht lesbar! Prozess abgebrochen.')
+		lSHA256HashwertBytes = lSHA256.finalize()
+		lSHA512HashwertBytes = lSHA512.finalize()
+		Schluesseldateihashwerte.merke(lSchluesselTuple, lSHA256HashwertBytes, lSHA512HashwertBytes)
+		return lSHA256HashwertBytes, lSHA512HashwertBytes
+
+	# Methoden zur Ableitung eines Crypt-Schlüssels aus einem SHA-Hashwert:
+
+	def ermittleAESGCM_V1Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pScryptSaltBytes=None):
+		"""
+		DEPRECATED. Veranlasst die Berechnung eines frischen Schlüssels für AESGCM_V1 und ggf. zufällige Bestimmung eines Saltwerts
+		für Scrypt auf Basis der übergebenen Werte.
+
+		:param pSHA256HashwertBytes: SHA256-Hashwert von Passwort oder Schlüsseldatei
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pScryptAufwandsfaktorInteger: N-Wert für Scrypt
+		:type pScryptAufwandsfaktorInteger: Integer
+		:param pScryptBlockgroesseInteger: r-Wert für Scrypt
+		:type pScryptBlockgroesseInteger: Integer
+		:param pScryptParallelisierungInteger: p-Wert für Scrypt
+		:type pScryptParallelisierungInteger: Integer
+		:param pScryptSaltBytes: Salt für Scrypt
+		:type pScryptSaltBytes: Bytesquenz
+		:return: Schlüssel und Scrypt-Salt
+		:rtype: Dictionary
+		"""
+		lScryptSaltBytes = pScryptSaltBytes
+		if lScryptSaltBytes is None:
+			lScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+		lAESGCMV1SchluesselBytes = self._berechneScryptHashVonStringFuerAESGCM_V1(
+			pSHA256HashwertBytes=pSHA256HashwertBytes,
+			pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
+			pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
+			pScryptParallelisierungInteger=pScryptParallelisierungInteger,
+			pScryptSaltBytes=pScryptSaltBytes)
+		return {'AESGCMV1Schluessel':lAESGCMV1SchluesselBytes, 'ScryptSaltFuerAESGCMV1':lScryptSaltBytes}
+
+	def ermittleAESGCM_V2Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None, pHKDFSaltBytes=None):
+		"""
+		DEPRECATED. Veranlasst die Berechnung eines frischen Schlüssels für AESGCM_V2 und ggf. zufällige Bestimmung eines Saltwerts
+		für HKDF und ggf. eines Saltwerts für Scrypt auf Basis der übergebenen Werte.
+
+		:param pSHA256HashwertBytes: SHA256-Hashwert von Passwort oder Schlüsseldatei
+		:type pSHA256HashwertBytes: Bytesequenz
+		:param pScryptAufwandsfaktorInteger: N-Wert für Scrypt
+		:type pScryptAufwandsfaktorInteger: Integer
+		:param pScryptBlockgroesseInteger: r-Wert für Scrypt
+		:type pScryptBlockgroesseInteger: Integer
+		:param pScryptParallelisierungInteger: p-Wert für Scrypt
+		:type pScryptParallelisierungInteger: Integer
+		:param pInitialesScryptSaltBytes: Salt für initiales Scrypt (für Masterschlüssel)
+		:type pInitialesScryptSaltBytes: Bytesquenz
+		:param pHKDFSaltBytes: Salt für HKDF (für Datenschutzschlüssel)
+		:type pHKDFSaltBytes: Bytesequenz
+		:return: Schlüssel, HKDF-Salt und Scrypt-Salt
+		:rtype: Dictionary
+		"""
+		lHKDFSaltBytes = pHKDFSaltBytes
+		# Einmal Scrypt als Master für HKDF:
+		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None or (lHKDFSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes):
+			if pInitialesScryptSaltBytes is None:
+				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+			else:
+				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes
+			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
+
+			self.sGeheimnisregister.vernichte(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
+			self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V2(
+				pSHAHashwertBytes=pSHA256HashwertBytes,
+				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
+				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
+				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
+				pScryptSaltBytes=self.sInitialesScryptSaltBytes))
+
+		if lHKDFSaltBytes is None: # D.h. Verschlüsselung
+			lHKDFSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_HKDF_SALT_FUER_AES_GCM_V2_LAENGE)
+
+		lAESGCMV2SchluesselBytes = self._berechneHKDFWertVonScryptWertFuerAESGCM_V2(lHKDFSaltBytes)
+		return {'AESGCMV2Schluessel':lAESGCMV2SchluesselBytes, 'HKDFSaltFuerAESGCMV2':lHKDFSaltBytes, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
+
+	def ermittleAESGCM_V3Schluessel(self, *, pSHA512HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None):
+		"""
+		Veranlasst die Berechnung eines Schlüssels für AESGCM_V3 und ggf. zufällige Bestimmung eines Saltwerts
+		für Scrypt auf Basis der übergebenen Werte.
+
+		:param pSHA512HashwertBytes: SHA512-Hashwert von Passwort oder Schlüsseldatei
+		:type pSHA512HashwertBytes: Bytesequenz
+		:param pScryptAufwandsfaktorInteger: N-Wert für Scrypt
+		:type pScryptAufwandsfaktorInteger: Integer
+		:param pScryptBlockgroesseInteger: r-Wert für Scrypt
+		:type pScryptBlockgroesseInteger: Integer
+		:param pScryptParallelisierungInteger: p-Wert für Scrypt
+		:type pScryptParallelisierungInteger: Integer
+		:param pInitialesScryptSaltBytes: Salt für initiales Scrypt (Masterschlüssel)
+		:type pInitialesScryptSaltBytes: Bytesquenz
+		:return: Schlüssel und Scrypt-Salt
+		:rtype: Dictionary
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleAESGCM_V3Schluessel: Initialer Scrypt-Wert ist Nullbytefolge!')
+		# Einmal Scrypt als Master für HKDF:
+		# Ein aus dem Salt einer vorhandenen Datei (Entschlüsselung, Fortsetzung einer Verschlüsselung) berechneter
+		# Masterschlüssel wird nicht für neue Verschlüsselungen verwendet, da die per HKDF abgeleiteten Nonces sonst erneut vergeben würden:
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or (pInitialesScryptSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes)\
+				or (pInitialesScryptSaltBytes is None and self.sMasterschluesselAusVorhandenerDateiBoolean is True)\
+				or self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger > LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL-1:
+			if pInitialesScryptSaltBytes is None: # d.h. Verschlüsselung
+				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+				self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger = 0
+			else:
+				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes # d.h. Entschlüsselung
+			self.sMasterschluesselAusVorhandenerDateiBoolean = pInitialesScryptSaltBytes is not None
+			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
+
+			self.sGeheimnisregister.vernichte(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3(
+				pSHAHashwertBytes=pSHA512HashwertBytes,
+				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
+				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
+				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
+				pScryptSaltBytes=self.sInitialesScryptSaltBytes))
+
+			self.sGeheimnisregister.vernichte(self.sAESGCMV3SchluesselBytes_LOESCHEN)
+			self.sAESGCMV3SchluesselBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3())
+
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleAESGCM_V3Schluessel Scrypt: ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleAESGCM_V3Schluessel AES-Schluessel (vor Rueckgabe an Aufrufer): ' + self.sAESGCMV3SchluesselBytes_LOESCHEN)
+		return {'AESGCMV3Schluessel':self.sAESGCMV3SchluesselBytes_LOESCHEN, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
+
+	def ermittleChaCha20_V1Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pScryptSaltBytes=None):
+		"""
+		DEPRECATED.
+		:param pSHA256HashwertBytes:
+		:param pScryptAufwandsfaktorInteger:
+		:param pScryptBlockgroesseInteger:
+		:param pScryptParallelisierungInteger:
+		:param pScryptSaltBytes:
+		:return:
+		"""
+		lScryptSaltBytes = pScryptSaltBytes
+		if lScryptSaltBytes is None: # D.h. Verschlüsselung
+			lScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+		lChaCha20V1SchluesselBytes = self._berechneScryptHashVonStringFuerChaCha20_V1(
+			pSHA256HashwertBytes=pSHA256HashwertBytes,
+			pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
+			pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
+			pScryptParallelisierungInteger=pScryptParallelisierungInteger,
+			pScryptSaltBytes=pScryptSaltBytes)
+		return {'ChaCha20V1Schluessel':lChaCha20V1SchluesselBytes, 'ScryptSaltFuerChaCha20V1':lScryptSaltBytes}
+
+	def ermittleChaCha20_V2Schluessel(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None, pHKDFSaltBytes=None):
+		"""
+		DEPRECATED.
+		:param pSHA256HashwertBytes:
+		:param pScryptAufwandsfaktorInteger:
+		:param pScryptBlockgroesseInteger:
+		:param pScryptParallelisierungInteger:
+		:param pInitialesScryptSaltBytes:
+		:param pHKDFSaltBytes:
+		:return:
+		"""
+		lHKDFSaltBytes = pHKDFSaltBytes
+		# Einmal Scrypt als Master für HKDF:
+		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None or (lHKDFSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes):
+			if pInitialesScryptSaltBytes is None:
+				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+			else:
+				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes
+			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
+
+			self.sGeheimnisregister.vernichte(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
+			self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V2(
+				pSHAHashwertBytes=pSHA256HashwertBytes,
+				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
+				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
+				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
+				pScryptSaltBytes=self.sInitialesScryptSaltBytes))
+		if lHKDFSaltBytes is None: # D.h. Verschlüsselung
+			lHKDFSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_HKDF_SALT_FUER_CHACHA20_V2_LAENGE)
+		lChaCha20V2SchluesselBytes = self._berechneHKDFWertVonScryptWertFuerChaCha20_V2(lHKDFSaltBytes)
+		return {'ChaCha20V2Schluessel':lChaCha20V2SchluesselBytes, 'HKDFSaltFuerChaCha20V2':lHKDFSaltBytes, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
+
+	def ermittleChaCha20_V3Schluessel(self, *, pSHA512HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pInitialesScryptSaltBytes=None):
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleChaCha20_V3Schluessel: Initialer Scrypt-Wert ist Nullbytefolge!')
+		# Einmal Scrypt als Master für HKDF:
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or (pInitialesScryptSaltBytes is not None and self.sInitialesScryptSaltBytes != pInitialesScryptSaltBytes)\
+				or self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger > LiSKonstanten.C_CHACHA20_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL-1:
+			if pInitialesScryptSaltBytes is None:
+				self.sInitialesScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+				self.sChaCha20V3SchluesselBytes_LOESCHEN = None  # Überflüssig, aber der Sicherheit wegen
+				self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger = 0
+			else:
+				self.sInitialesScryptSaltBytes = pInitialesScryptSaltBytes
+			self.setzeStatusleisteUndGUIZustand('Berechne Masterschlüssel (bitte warten)...', True)
+
+			self.sGeheimnisregister.vernichte(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3(
+				pSHAHashwertBytes=pSHA512HashwertBytes,
+				pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
+				pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
+				pScryptParallelisierungInteger=pScryptParallelisierungInteger,
+				pScryptSaltBytes=self.sInitialesScryptSaltBytes))
+
+			self.sGeheimnisregister.vernichte(self.sChaCha20V3SchluesselBytes_LOESCHEN)
+			self.sChaCha20V3SchluesselBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3())
+
+			# Schlüssel für HMAC-Berechnung löschen und auf None setzen, da Neuberechnung des Krypto-Schlüssels auch Neuberechnung des HMAC-Schlüssels zur Folge hat
+			self.sGeheimnisregister.vernichte(self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN)
+			self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = None
+
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleChaCha20_V3Schluessel Scrypt-Wert: ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleChaCha20_V3Schluessel ChaCha20V3-Kryptoschluessel (vor Rueckgabe an Aufrufer): ' + self.sChaCha20V3SchluesselBytes_LOESCHEN)
+		return {'ChaCha20V3Schluessel':self.sChaCha20V3SchluesselBytes_LOESCHEN, 'InitialesScryptSalt':self.sInitialesScryptSaltBytes}
+
+	# Methoden zur Ableitung eines Authentisierungsschlüssels aus einem SHA-Hashwert:
+
+	def ermittleHMACSchluesselFuerChaCha20_V1(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger=LiSKonstanten.C_SCRYPT_AUFWANDSFAKTOR_WERT, pScryptBlockgroesseInteger=LiSKonstanten.C_SCRYPT_BLOCK_GROESSE, pScryptParallelisierungInteger=LiSKonstanten.C_SCRYPT_PARALLELISIERUNG_WERT, pScryptSaltBytes=None):
+		"""
+		DEPRECATED.
+		:param pSHA256HashwertBytes:
+		:param pScryptAufwandsfaktorInteger:
+		:param pScryptBlockgroesseInteger:
+		:param pScryptParallelisierungInteger:
+		:param pScryptSaltBytes:
+		:return:
+		"""
+		lScryptSaltBytes = pScryptSaltBytes
+		if lScryptSaltBytes is None: # D.h. Verschlüsselung
+			lScryptSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_SCRYPT_SALT_LAENGE)
+		lHMACSchluesselBytes = self._berechneScryptHashVonStringFuerAESGCM_V1(pSHA256HashwertBytes=pSHA256HashwertBytes,
+			pScryptAufwandsfaktorInteger=pScryptAufwandsfaktorInteger,
+			pScryptBlockgroesseInteger=pScryptBlockgroesseInteger,
+			pScryptParallelisierungInteger=pScryptParallelisierungInteger,
+			pScryptSaltBytes=pScryptSaltBytes)
+		return {'HMACSchluessel':lHMACSchluesselBytes, 'ScryptSaltFuerHMAC':lScryptSaltBytes}
+
+	def ermittleHMACSchluesselFuerChaCha20_V2(self, *, pHKDFSaltBytes=None):
+		"""
+		DEPRECATED.
+		:param pHKDFSaltBytes:
+		:return:
+		"""
+		# Methode darf nie ohne erfolgte initiale Scrypt-Berechnung aufgerufen werden, da immer zweiter Schlüssel
+		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None or self.sInitialesScryptSaltBytes is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash für Berechnung von HMAC-Schlüssel ist None oder Salt für HKDF ist None.')
+		lHKDFSaltBytes = pHKDFSaltBytes
+		if lHKDFSaltBytes is None: # D.h. Verschlüsselung
+			lHKDFSaltBytes = LiSWerkzeuge.SichereZufallswerkzeuge.erzeugeZufaelligeBytefolge(LiSKonstanten.C_HKDF_SALT_FUER_HMAC_LAENGE)
+		lHMACSchluesselBytes = self._berechneHKDFWertVonScryptWertFuerHMACBeiChaCha20_V1_V2(lHKDFSaltBytes)
+		return {'HMACSchluessel':lHMACSchluesselBytes, 'HKDFSaltFuerHMAC':lHKDFSaltBytes}
+
+	def ermittleHMACSchluesselFuerChaCha20_V3(self):
+		"""
+		DEPRECATED. Muss immer in Kombination mit und _nach_ ermittleChaCha20_V3Schluessel(...) ausgerufen werden.
+		:return:
+		"""
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or self.sInitialesScryptSaltBytes is None: # Wird nie ohne erfolgte initiale Scrypt-Berechnung aufgerufen, da immer zweiter Schlüssel
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash für Berechnung von HMAC-Schlüssel existiert nicht.')
+		if self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN is None: # wird von ermittleChaCha20_V3Schluessel(...) auf None gesetzt, wenn Neuberechnung des Scrypt-Wertes stattgefunden hat
+			self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3())
+		return {'HMACSchluessel':self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN}
+
+	def ermittleHMACSchluesselFuerChaCha20_V3_1(self):
+		"""
+		Muss immer in Kombination mit und _nach_ ermittleChaCha20_V3Schluessel(...) ausgerufen werden.
+		:return:
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleHMACSchluesselFuerChaCha20_V3_1: Initialer Scrypt-Wert ist Nullbytefolge!')
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None or self.sInitialesScryptSaltBytes is None: # Wird nie ohne erfolgte initiale Scrypt-Berechnung aufgerufen, da immer zweiter Schlüssel
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash für Berechnung von HMAC-Schlüssel existiert nicht.')
+		if self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN is None: # wird von ermittleChaCha20_V3Schluessel(...) auf None gesetzt, wenn Neuberechnung des Scrypt-Wertes stattgefunden hat
+			self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN = self.sGeheimnisregister.registriere(self._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1())
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer.ermittleHMACSchluesselFuerChaCha20_V3_1 ChaCha20V3-HMAC-Schluessel (vor Rueckgabe an Aufrufer): ' + self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN)
+		return {'HMACSchluessel':self.sHMACFuerChaCha20V3SchluesselBytes_LOESCHEN}
+
+	# Methoden zur Schlüsselexpansion (key expansion) und Schlüsselableitung (key derivaton):
+
+	def _berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V2(self, *, pSHAHashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
+		"""
+		DEPERECATED. Interne Methode. Berechnet initialen Scrypt-Wert zu einem aus Passwort oder Schlüsseldatei abgeleiteten, base91-kodierten Hashwert.
+		:param pSHAHashwertBytes:
+		:param pScryptAufwandsfaktorInteger:
+		:param pScryptBlockgroesseInteger:
+		:param pScryptParallelisierungInteger:
+		:param pScryptSaltBytes:
+		:return:
+		"""
+		lSHAHashwertString_LOESCHEN = base91.encode(pSHAHashwertBytes)
+		lSHAHashwertBase91Bytes_LOESCHEN = lSHAHashwertString_LOESCHEN.encode()
+		lKDFScrypt = scrypt.Scrypt(
+			salt=pScryptSaltBytes,
+			length=LiSKonstanten.C_SCRYPT_INITIAL_AUSGABE_LAENGE_V1_V2,
+			n=pScryptAufwandsfaktorInteger,
+			r=pScryptBlockgroesseInteger,
+			p=pScryptParallelisierungInteger,
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('Scrypt'):
+			lScryptHashwertBytes = lKDFScrypt.derive(lSHAHashwertBase91Bytes_LOESCHEN)
+		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHAHashwertString_LOESCHEN, pStringBestaetigungBoolean=True)
+		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHAHashwertBase91Bytes_LOESCHEN)
+		return lScryptHashwertBytes
+
+	def _berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3(self, *, pSHAHashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
+		"""
+		Interne Methode. Berechnet initialen Scrypt-Wert zu einem aus Passwort oder Schlüsseldatei abgeleiteten Hashwert.
+		:param pSHAHashwertBytes:
+		:param pScryptAufwandsfaktorInteger:
+		:param pScryptBlockgroesseInteger:
+		:param pScryptParallelisierungInteger:
+		:param pScryptSaltBytes:
+		:return:
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(pSHAHashwertBytes, b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3: Uebergebener SHA-Hashwert ist Nullbytefolge!')
+		lKDFScrypt = scrypt.Scrypt(
+			salt=pScryptSaltBytes,
+			length=LiSKonstanten.C_SCRYPT_INITIAL_AUSGABE_LAENGE_V3,
+			n=pScryptAufwandsfaktorInteger,
+			r=pScryptBlockgroesseInteger,
+			p=pScryptParallelisierungInteger,
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('Scrypt'):
+			lScryptHashwertBytes = lKDFScrypt.derive(pSHAHashwertBytes)
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3 Scrypt-Wert (Berechnung): ' + lScryptHashwertBytes)
+		return lScryptHashwertBytes
+
+	def _berechneScryptHashVonStringFuerAESGCM_V1(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
+		"""
+		DEPRECATED. Interne Methode. Ermittelt pLaengeInBytesInteger Bytes des Scrypt-Werts entsprechend der Parameter und returniert diesen.
+		"""
+		lSHA256HashwertString_LOESCHEN = base91.encode(pSHA256HashwertBytes)
+		lSHA256HashwertBase91Bytes_LOESCHEN = lSHA256HashwertString_LOESCHEN.encode()
+		lKDFScrypt = scrypt.Scrypt(
+			salt=pScryptSaltBytes,
+			length=LiSKonstanten.C_AES_GCM_SCHLUESSEL_LAENGE,
+			n=pScryptAufwandsfaktorInteger,
+			r=pScryptBlockgroesseInteger,
+			p=pScryptParallelisierungInteger,
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('Scrypt'):
+			lScryptHashwertBytes = lKDFScrypt.derive(lSHA256HashwertBase91Bytes_LOESCHEN)
+		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertString_LOESCHEN, pStringBestaetigungBoolean=True)
+		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertBase91Bytes_LOESCHEN)
+		return lScryptHashwertBytes
+
+	def _berechneScryptHashVonStringFuerChaCha20_V1(self, *, pSHA256HashwertBytes, pScryptAufwandsfaktorInteger, pScryptBlockgroesseInteger, pScryptParallelisierungInteger, pScryptSaltBytes):
+		"""
+		DEPRECATED. Interne Methode. Ermittelt pLaengeInBytesInteger Bytes des Scrypt-Werts entsprechend der Parameter und returniert diesen.
+		"""
+		lSHA256HashwertString_LOESCHEN = base91.encode(pSHA256HashwertBytes)
+		lSHA256HashwertBase91Bytes_LOESCHEN = lSHA256HashwertString_LOESCHEN.encode()
+		lKDFScrypt = scrypt.Scrypt(
+			salt=pScryptSaltBytes,
+			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
+			n=pScryptAufwandsfaktorInteger,
+			r=pScryptBlockgroesseInteger,
+			p=pScryptParallelisierungInteger,
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('Scrypt'):
+			lScryptHashwertBytes = lKDFScrypt.derive(lSHA256HashwertBase91Bytes_LOESCHEN)
+		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertString_LOESCHEN, pStringBestaetigungBoolean=True)
+		LiSWerkzeuge.Prozessspeicherwerkzeuge.ueberschreibeBytesequenzOderString(lSHA256HashwertBase91Bytes_LOESCHEN)
+		return lScryptHashwertBytes
+
+	def _berechneHKDFWertVonScryptWertFuerAESGCM_V2(self, pSaltBytes):
+		"""
+		DEPRECATED. Interne Methode. Berechnet den HKDF-Wert zum initialiem Scrypt-Wert (Masterschlüssel) für AESGCM_V2
+
+		:param pSaltBytes: Saltwert für HKDF
+		:type pSaltBytes: Bytesequenz
+		:return: HKDF-Wert
+		:rtype: Bytesequenz
+		"""
+		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash darf für Berechnung von HKDF nicht None sein.')
+		lKDFHKDF = hkdf.HKDF(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_AES_GCM_SCHLUESSEL_LAENGE,
+			salt=pSaltBytes,
+			info=None,
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDF.derive(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
+		return lHKDFWertBytes
+
+	def _berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3(self):
+		"""
+		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) als Daten-Schlüssel für AESGCM_V3
+
+		:return: HKDF-Expand-Wert
+		:rtype: Bytesequenz
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
+
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
+		lKDFHKDFExpand = hkdf.HKDFExpand(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_AES_GCM_SCHLUESSEL_LAENGE,
+			info=b'AES-GCM-V3-key',
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3 Scrypt-Wert (bei AES-GCM-V3-Schluesselberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerAESGCM_V3 AES-GCM-V3-Schluessel aus HKDF-Expand (vor Rueckgabe an Aurufer)' + lHKDFWertBytes)
+		return lHKDFWertBytes
+
+	def _berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3(self):
+		"""
+		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) als Nonce für AESGCM_V3
+
+		:return: HKDF-Expand-Wert
+		:rtype: Bytesequenz
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneInitialenScryptHashFuerHKDFBeiAESGCMUndChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
+		lKDFHKDFExpand = hkdf.HKDFExpand(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_AES_GCM_NONCE_LAENGE,
+			info=b'AES-GCM-V3-nonce-' + str(self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger).encode(),
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3 Scrypt-Wert (bei AES-GCM-V3-Nonce-Berechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3 AES-GCM-V3-Nonce aus HKDF-Expand: ' + lHKDFWertBytes)
+		return lHKDFWertBytes
+
+	def _berechneHKDFWertVonScryptWertFuerChaCha20_V2(self, pSaltBytes):
+		"""
+		DEPRECATED. Interne Methode. Berechnet den HKDF-Wert zum initialien Scrypt-Wert (Masterschlüssel) für CHACHA20_V2
+
+		:param pSaltBytes: Saltwert für HKDF
+		:type pSaltBytes: Bytesequenz
+		:return: HKDF-Wert
+		:rtype: Bytesequenz
+		"""
+		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash darf für Berechnung von HKDF nicht None sein.')
+		lKDFHKDF = hkdf.HKDF(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
+			salt=pSaltBytes,
+			info=b'ChaCha20V2',
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDF.derive(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
+		return lHKDFWertBytes
+
+	def _berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3(self):
+		"""
+		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) als Daten-Schlüssel für CHACHA20_V3
+
+		:return: HKDF-Expand-Wert
+		:rtype: Bytesequenz
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
+		lKDFHKDFExpand = hkdf.HKDFExpand(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
+			info=b'ChaCha20-V3-key',
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3 Scrypt-Wert (bei ChaCha20-V3-Krypto-Schluesselberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsSchluesselFuerChaCha20_V3 ChaCha20-V3-Krypto-Schluessel aus HKDF-Expand: ' + lHKDFWertBytes)
+		return lHKDFWertBytes
+
+	def _berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3(self):
+		"""
+		Berechnet den HKDF-Expand-Wert zum initialiem Scrypt-Wert (Masterschlüssel) als Nonce für CHACHA20_V3
+
+		:return: HKDF-Expand-Wert
+		:rtype: Bytesequenz
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3: Initialer Scrypt-Wert ist Nullbytefolge!')
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
+		lKDFHKDFExpand = hkdf.HKDFExpand(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_CHACHA20_NONCE_LAENGE,
+			info=b'ChaCha20-V3-nonce-' + str(self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger).encode(),
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3 Scrypt-Wert (bei ChaCha20-V3-Nonceberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3 ChaCha20-V3-Nonce aus HKDF-Expand: ' + lHKDFWertBytes)
+		return lHKDFWertBytes
+
+	def _berechneHKDFWertVonScryptWertFuerHMACBeiChaCha20_V1_V2(self, pSaltBytes):
+		"""
+		DEPRECATED. Interne Methode. Berechnet den HKDF-Wert zum (bei ..._V2: initialen) Scrypt-Wert (Masterschlüssel) für HMAC bei CHACHA20_V1 oder ..._V2
+
+		:param pSaltBytes: Saltwert für HKDF
+		:type pSaltBytes: Bytesequenz
+		:return: HKDF-Wert
+		:rtype: Bytesequenz
+		"""
+		if self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA256-Hash darf für Berechnung von HKDF nicht None sein.')
+		lKDFHKDF = hkdf.HKDF(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_CHACHA20_SCHLUESSEL_LAENGE,
+			salt=pSaltBytes,
+			info=b'HMAC',
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDF.derive(self.sInitialerScryptWertVonSHA256HashBytes_LOESCHEN)
+		return lHKDFWertBytes
+
+	def _berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3(self):
+		"""
+		DEPRECATED. Interne Methode. Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) für HMAC bei CHACHA20_V3
+
+		:return: HKDF-Expand-Wert
+		:rtype: Bytesequenz
+		"""
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
+		lKDFHKDFExpand = hkdf.HKDFExpand(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_HMAC_SCHLUESSEL_LAENGE,
+			info=b'HMAC-ChaCha20-V3-key',
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+		return lHKDFWertBytes
+
+	def _berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1(self):
+		"""
+		Berechnet den HKDF-Expand-Wert zum initialien Scrypt-Wert (Masterschlüssel) für HMAC bei CHACHA20_V3_1
+
+		:return: HKDF-Expand-Wert
+		:rtype: Bytesequenz
+		"""
+		# Test auf 0-Byte-Folge mit Ausgabe im Log-Level Debug (Wert kann real 0-Byte-Folge sein!):
+		LiSWerkzeuge.Loggingwerkzeuge.loggeFallsNullbytefolge(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN, b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1: Initialer Scrypt-Wert ist Nullbytefolge!')
+		if self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN is None:
+			raise AssertionError('Initialer Scrypt-Wert von SHA512-Hash darf für Berechnung von HKDF-Expand nicht None sein.')
+		lKDFHKDFExpand = hkdf.HKDFExpand(
+			algorithm=hashes.SHA512(),
+			length=LiSKonstanten.C_HMAC_SHA512_SCHLUESSEL_LAENGE,
+			info=b'HMAC-ChaCha20-V3-key',
+			backend=default_backend())
+		with LiSZeitmessung.Zeitmessung.abschnitt('HKDF'):
+			lHKDFWertBytes = lKDFHKDFExpand.derive(self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+		# Testausgabe zur Funktionsüberprüfung
+		if LiSWerkzeuge.Loggingwerkzeuge.istDebugAktiv() is True:
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1 Scrypt-Wert (bei ChaCha20-V3_1-HMAC-Schluesselberechnung): ' + self.sInitialerScryptWertVonSHA512HashBytes_LOESCHEN)
+			LiSWerkzeuge.Loggingwerkzeuge.loggeMitLoglevelDebugWennNichtPaketiert(b'LiSFunktionsausfuehrung.Funktionsausfuehrer._berechneHKDFExpandWertVonScryptWertFuerHMACBeiChaCha20_V3_1 ChaCha20-V3_1-HMAC-Schluessel aus HKDF-Expand: ' + lHKDFWertBytes)
+		return lHKDFWertBytes
+
+
+	# Methoden zur Weitergabe von Rückmeldungen und Rückfragen an self.sRueckmeldungen:
+
+	def setzeStatusleisteUndGUIZustand(self, pTextString=None, pAbbrechenButtonAktivBoolean=False):
+		"""
+		Gibt den Status pTextString aus. Wird intern und auch von LiSKrypto.Datei()-Instanzen aufgerufen
+
+		:param pTextString: Text für Statusleiste
+		:type pTextString: String
+		:param pAbbrechenButtonAktivBoolean: Angabe, ob Abbrechen-Button in der Statusleiste auf aktiv gesetzt werden soll (true: ja, false: nein)
+		:type pAbbrechenButtonAktivBoolean: Boolean
+		"""
+		with LiSZeitmessung.Zeitmessung.abschnitt('Rueckmeldung'):
+			self.sRueckmeldungen.setzeStatus(pTextString, pAbbrechenButtonAktivBoolean)
+
+	def meldeFortschritt(self, pAnzahlBytesInteger):
+		"""
+		Vermerkt pAnzahlBytesInteger verarbeitete (ver- oder entschlüsselte bzw. überschriebene) Bytes und gibt den
+		Fortschritt ggf. (gedrosselt) aus. Wird von LiSKrypto.QDatei()- und LiSVernichtung.QVerzeichniseintrag()-Instanzen
+		je Block bzw. Segment aufgerufen.
+
+		:param pAnzahlBytesInteger: Anzahl verarbeiteter Bytes
+		:type pAnzahlBytesInteger: Integer
+		"""
+		lStandDictionary = self.sFortschritt.vermerkeBytes(pAnzahlBytesInteger)
+		if lStandDictionary is not None:
+			self.sRueckmeldungen.setzeFortschritt(lStandDictionary)
+
+	def meldeDateiAbgeschlossen(self):
+		"""
+		Vermerkt eine abgeschlossene Datei und gibt den Fortschritt ggf. (gedrosselt) aus.
+		"""
+		lStandDictionary = self.sFortschritt.vermerkeDatei()
+		if lStandDictionary is not None:
+			self.sRueckmeldungen.setzeFortschritt(lStandDictionary)
+
+	def ergaenzeBerichtAusgabe(self, pZeileString, pToolTipString=None):
+		"""
+		Ergänzt das Verlaufsprotokoll um die Zeile pZeileString. Wird intern und auch von LiSKrypto()-Instanzen aufgerufen
+
+		:param pZeileString: Text für neue Zeile im Berichtsbereich
+		:type pZeileString: String
+		:param pToolTipString: Text für Tooltip der neuen Zeile im Berichtsbereich
+		:type pToolTipString: String
+		"""
+		with LiSZeitmessung.Zeitmessung.abschnitt('Rueckmeldung'):
+			self.sRueckmeldungen.ergaenzeBericht(pZeileString, pToolTipString)
+
+	def _gibStartzeitpunktAus(self):
+		"""
+		Interne Methode. Ergänzt das Verlaufsprotokoll um den Startzeitpunkt.
+		"""
+		self.ergaenzeBerichtAusgabe('Start: ' + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+		self.ergaenzeBerichtAusgabe('---')
+		self.sStartZeitpunktAusgegebenBoolean = True
+
+	def _gibEndzeitpunktAusFallsErforderlich(self):
+		"""
+		Interne Methode. Ergänzt das Verlaufsprotokoll um den Endzeitpunkt, falls zuvor programmatisch ein
+		Startzeitpunkt ausgegeben wurde.
+		"""
+		if self.sStartZeitpunktAusgegebenBoolean is True:
+			self.ergaenzeBerichtAusgabe('---')
+			self.ergaenzeBerichtAusgabe('Ende: ' + datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
+
+	def _zeigeProbleminfoFallsErforderlich(self):
+		"""
+		Interne Methode. Zeigt im Bedarfsfall einen Informationsdialog zu aufgetretenen Problemen bei Ausführung der
+		Programmfunktion an.
+		"""
+		if self.sDateilistenAnzeigeFehlerImProzessBoolean is True:
+			self._zeigeInfo('Es sind Probleme aufgetreten. Bitte beachten Sie die Fehlermeldungen.')
+
+	def _zeigeInfo(self, pInformationString):
+		"""
+		Interne Methode. Gibt die Information pInformationString aus.
+
+		:param pInformationString: Information
+		:type pInformationString: String
+		"""
+		self.sRueckmeldungen.zeigeInfo(pInformationString)
+
+	def _zeigeWarnung(self, pWarnungString):
+		"""
+		Interne Methode. Gibt die Warnung pWarnungString aus.
+
+		:param pWarnungString: Warnung
+		:type pWarnungString: String
+		"""
+		self.sRueckmeldungen.zeigeWarnung(pWarnungString)
+
+	def _zeigeFehler(self, pFehlermeldungString):
+		"""
+		Interne Methode. Gibt die Fehlermeldung pFehlermeldungString aus und merkt sich, dass ein schwerer Fehler
+		aufgetreten ist.
+
+		:param pFehlermeldungString: Fehlermeldung
+		:type pFehlermeldungString: String
+		"""
+		self.sSchwererFehlerBoolean = True
+		self.sRueckmeldungen.zeigeFehler(pFehlermeldungString)
+
+	def _erfragePasswort(self, pMitBestaetigungBoolean=True):
+		"""
+		Interne Methode. Erfragt das Passwort. Ist das Passwort None, ein Leerstring oder beginnt es mit einem 0-Byte,
+		wird eine QNoPasswordError-Exception geworfen. Anderenfalls wird das Passwort returniert.
+
+		:param pMitBestaetigungBoolean: Angabe, ob ein Bestätigungsfeld angezeigt werden soll
+		:type pMitBestaetigungBoolean: Boolean
+		:return: Passwort
+		:rtype: String
+		"""
+		lPasswortString = self.sRueckmeldungen.erfragePasswort(pMitBestaetigungBoolean)
+		if lPasswortString is None or lPasswortString == '' or lPasswortString[0] == '\x00':
+			raise LiSAusnahmen.QNoPasswordError('Passwortdialog lieferte leeren String.')
+		return lPasswortString
+
+	def erfrageUeberschreiben(self, pDateinameErweitertString):
+		"""
+		Erfragt, ob die bestehende Datei pDateinameErweitertString überschrieben werden soll. Wird intern und auch von
+		LiSKrypto.Datei()-Instanzen aufgerufen
+
+		:param pDateinameErweitertString: Erweiterter Pfad zu einer Datei
+		:type pDateinameErweitertString: String
+		:return: Antwort (LiSKonstanten.C_UEBERSCHREIBEN_JA, C_UEBERSCHREIBEN_NEIN oder C_UEBERSCHREIBEN_ABBRECHEN)
+		:rtype: Integer
+		"""
+		return self.sRueckmeldungen.erfrageUeberschreiben(pDateinameErweitertString)
+
+	# Weitere Hilfsmethoden
+
+	def istFunktionsprozessAktiv(self):
+		"""
+		Returniert, ob aktuell eine Programmfunktion ausgeführt wird (Verschlüsseln, Entschlüsseln, Vernichten)
+
+		:return: Status der Ausführung einer Programmfunktion (true: aktiv, false: nicht aktiv)
+		:rtype: Boolean
+		"""
+		return self.sFunktionsprozessAktivBoolean
+
+	def stoppeFunktionsprozess(self):
+		"""
+		Stoppt die aktuell ausgeführte Programmfunktion (Verschlüsseln, Entschlüsseln, Vernichten) und setzt den
+		Inhalt der Statusleiste auf 'Abbruch durch Nutzer (bitte warten).'
+		"""
+		self.setzeStatusleisteUndGUIZustand('Abbruch durch Nutzer (bitte warten).')
+		self.sAbgebrochenBoolean = True
+		self.sFunktionsprozessAktivBoolean = False
+
+	def gibNeueAESGCMNoncePerHKDF(self):
+		"""
+		Interne Methode. Veranlasst die Berechnung mittels HKDF des nächsten Nonce-Werts für die Verschlüsselung per AES-GCM.
+
+		:return: Nonce für AESGCM
+		:rtype: Bytesequenz
+		"""
+		if not self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger < LiSKonstanten.C_AES_GCM_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL:
+			raise AssertionError('Maximal zulässige Aufrufe der AESGCM-Verschlüsselungsfunktion mit identischem Schlüssel überschritten.')
+		lNeueAESNonceBytes = self._berechneHKDFExpandWertVonScryptWertAlsNonceFuerAESGCM_V3()
+		self.sAESGCMVerschluesselungenMitAktuellemSchluesselInteger+=1
+		return lNeueAESNonceBytes
+
+	def gibNeueChaCha20NoncePerHKDF(self):
+		"""
+		Interne Methode. Veranlasst die Berechnung mittels HKDF des nächsten Nonce-Werts für die Verschlüsselung per ChaCha-20
+
+		:return: Nonce für ChaCha-20
+		:rtype: Bytesequenz
+		"""
+		if not self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger < LiSKonstanten.C_CHACHA20_MAXIMALE_DATEIANZAHL_PRO_SCHLUESSEL:
+			raise AssertionError('Maximal zulässige Aufrufe der ChaCha20-Verschlüsselungsfunktion mit identischem Schlüssel überschritten.')
+		lNeueChacha20NonceBytes = self._berechneHKDFExpandWertVonScryptWertAlsNonceFuerChaCha20_V3()
+		self.sChaCha20VerschluesselungenMitAktuellemSchluesselInteger+=1
+		return lNeueChacha20NonceBytes
+
+	def gibErweitertePfadeAllerErzeugtenDateien(self):
+		"""
+		Returniert die erweiterten Pfade aller bei der Ausführung erzeugten Dateien.
+
+		:return: Erweiterte Pfade
+		:rtype: Liste von Strings
+		"""
+		return self.sErweitertePfadeAllerErzeugtenDateienList
+
+	def sindProblemeAufgetreten(self):
+		"""
+		Returniert, ob mindestens ein Eintrag nicht verarbeitet werden konnte (true: ja, false: nein). Vom Nutzer
+		übersprungene Einträge zählen nicht als Problem.
+
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return self.sDateilistenAnzeigeFehlerImProzessBoolean
+
+	def wurdeAbgebrochen(self):
+		"""
+		Returniert, ob die Programmfunktion abgebrochen wurde (true: ja, false: nein)
+
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return self.sAbgebrochenBoolean
+
+	def istSchwererFehlerAufgetreten(self):
+		"""
+		Returniert, ob die Programmfunktion wegen eines schweren Fehlers beendet wurde (true: ja, false: nein)
+
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		return self.sSchwererFehlerBoolean
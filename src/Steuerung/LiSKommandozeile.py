@@ -0,0 +1,289 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+
+"""
+Dieses Modul führt die Programmfunktionen (Verschlüsseln, Entschlüsseln, Vernichten) ohne GUI aus (--headless). Der
+Schlüssel wird aus einem Dateideskriptor (Passwort) oder einer Schlüsseldatei gelesen, Rückfragen werden gemäß der
+Aufrufparameter ohne Interaktion beantwortet und der Fortschritt wird als JSON-Zeilen auf der Standardausgabe
+ausgegeben. Wird anstelle von Dateien - angegeben, wird die Standardeingabe in die Standardausgabe ver- bzw.
+entschlüsselt (Datenstrommodus, z.B. tar c Verzeichnis | liscrypt -e --key-file Pfad - > archiv.lisx), die
+JSON-Zeilen erscheinen dann auf der Standardfehlerausgabe. Mit --archive werden Verzeichnisse jeweils als ein Archiv
+verschlüsselt, mit --select werden beim Entschlüsseln nur passende Einträge aus Archiven entpackt (siehe
+LiSKrypto.QArchiv). Das Modul importiert kein PyQt.
+
+Aufruf: python -m Steuerung.LiSKommandozeile --headless [weitere Aufrufparameter wie Steuerung.LiSCrypt]
+"""
+
+from Modell import LiSAusnahmen, LiSKonfiguration, LiSKonstanten, LiSProfilierung, LiSZeitmessung
+from Sonstiges import LiSWerkzeuge
+from Steuerung import LiSFunktionsausfuehrung
+
+import json
+import logging
+import os
+import signal
+import sys
+
+class Kommandozeilenrueckmeldungen(LiSFunktionsausfuehrung.Rueckmeldungen):
+	"""
+	Gibt die Rückmeldungen eines Funktionsausfuehrers als JSON-Zeilen aus und beantwortet Rückfragen ohne Interaktion.
+	"""
+
+	def __init__(self, pPasswortString, pUeberschreibenInteger, pAusgabeFile=sys.stdout):
+		"""
+		Initialisiert ein Objekt der Klasse Kommandozeilenrueckmeldungen.
+
+		:param pPasswortString: Passwort für die Programmfunktion (None bei Schlüsseldatei oder Vernichtung)
+		:type pPasswortString: String
+		:param pUeberschreibenInteger: Antwort auf die Rückfrage, ob eine bestehende Zieldatei überschrieben werden soll
+		:type pUeberschreibenInteger: Integer
+		:param pAusgabeFile: Zum Schreiben geöffnete Textdatei (Default: Standardausgabe)
+		:type pAusgabeFile: File-Objekt
+		"""
+		self._sPasswortString = pPasswortString
+		self.sUeberschreibenInteger = pUeberschreibenInteger
+		self.sAusgabeFile = pAusgabeFile
+
+	def gibJSONZeileAus(self, pDatenDictionary):
+		"""
+		Gibt pDatenDictionary als JSON-Zeile aus.
+
+		:param pDatenDictionary: Auszugebende Daten
+		:type pDatenDictionary: Dictionary
+		"""
+		self.sAusgabeFile.write(json.dumps(pDatenDictionary, ensure_ascii=False) + '\n')
+		self.sAusgabeFile.flush()
+
+	def setzeStatus(self, pTextString=None, pAbbrechenButtonAktivBoolean=False):
+		"""
+		Gibt den Status als JSON-Zeile aus (ausgenommen 'Bereit').
+		"""
+		if pTextString is not None and pTextString != '':
+			self.gibJSONZeileAus({'Ereignis': 'Status', 'Text': pTextString})
+
+	def setzeFortschritt(self, pStandDictionary):
+		"""
+		Gibt den Fortschritt (Bytes, Dateien, MB/s, Dateien/s, Restzeit in Sekunden) als JSON-Zeile aus.
+		"""
+		lDatenDictionary = {'Ereignis': 'Fortschritt'}
+		lDatenDictionary.update(pStandDictionary)
+		self.gibJSONZeileAus(lDatenDictionary)
+
+	def ergaenzeBericht(self, pZeileString, pToolTipString=None):
+		"""
+		Gibt die Zeile des Verlaufsprotokolls als JSON-Zeile aus.
+		"""
+		self.gibJSONZeileAus({'Ereignis': 'Bericht', 'Text': pZeileString, 'Pfad': pToolTipString})
+
+	def zeigeInfo(self, pInformationString):
+		"""
+		Gibt die Information als JSON-Zeile aus.
+		"""
+		self.gibJSONZeileAus({'Ereignis': 'Information', 'Text': pInformationString})
+
+	def zeigeWarnung(self, pWarnungString):
+		"""
+		Gibt die Warnung als JSON-Zeile aus.
+		"""
+		self.gibJSONZeileAus({'Ereignis': 'Warnung', 'Text': pWarnungString})
+
+	def zeigeFehler(self, pFehlermeldungString):
+		"""
+		Gibt die Fehlermeldung als JSON-Zeile aus.
+		"""
+		self.gibJSONZeileAus({'Ereignis': 'Fehler', 'Text': pFehlermeldungString})
+
+	def erfragePasswort(self, pMitBestaetigungBoolean=True):
+		"""
+		Returniert das beim Aufruf übergebene Passwort (nur einmal möglich).
+		"""
+		lPasswortString = self._sPasswortString
+		del self._sPasswortString # Löschen der eigenen Referenz (ermöglicht das Überschreiben durch den Funktionsausfuehrer)
+		return lPasswortString
+
+	def erfrageUeberschreiben(self, pDateinameErweitertString):
+		"""
+		Returniert die per --overwrite festgelegte Antwort.
+		"""
+		return self.sUeberschreibenInteger
+
+class Kommandozeilenausfuehrung:
+	"""
+	Stellt statische Methoden zur Ausführung einer Programmfunktion ohne GUI zur Verfügung.
+	"""
+
+	def __init__(self):
+		if type(self) is Kommandozeilenausfuehrung:
+			raise LiSAusnahmen.QAbstractClassError('Kommandozeilenausfuehrung kann nicht instanziiert werden.')
+
+	@staticmethod
+	def fuehreAus(pAufrufparameterNamespace, pAusgabeFile=sys.stdout):
+		"""
+		Führt die durch pAufrufparameterNamespace festgelegte Programmfunktion ohne GUI aus und gibt den Fortschritt sowie
+		abschließend das Ergebnis als JSON-Zeilen aus. SIGINT und SIGTERM brechen die Programmfunktion (wie der
+		Abbrechen-Button der GUI) ab, so dass unterbrochene Dateien später fortgesetzt werden können.
+
+		:param pAufrufparameterNamespace: Aufrufparameter (siehe LiSKonfiguration.Konfiguration)
+		:type pAufrufparameterNamespace: argparse.Namespace
+		:param pAusgabeFile: Zum Schreiben geöffnete Textdatei (Default: Standardausgabe)
+		:type pAusgabeFile: File-Objekt
+		:return: Rückgabewert (LiSKonstanten.C_KOMMANDOZEILE_RUECKGABEWERT_*)
+		:rtype: Integer
+		"""
+		# Datenstrommodus: Die Standardausgabe ist dem Chiffrat bzw. Klartext vorbehalten:
+		lDatenstromBoolean = LiSKonstanten.C_DATENSTROM_PFADANGABE in pAufrufparameterNamespace.items
+		if lDatenstromBoolean is True and pAusgabeFile is sys.stdout:
+			pAusgabeFile = sys.stderr
+
+		lFunktionString = {'encrypt': LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL,
+						   'decrypt': LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL,
+						   'wipe': LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL}.get(pAufrufparameterNamespace.action)
+		if lFunktionString is None:
+			return Kommandozeilenausfuehrung._brichAbMitAufruffehler('Programmfunktion ' + str(pAufrufparameterNamespace.action) + ' ohne GUI nicht verfügbar.', pAusgabeFile)
+		if not pAufrufparameterNamespace.items:
+			return Kommandozeilenausfuehrung._brichAbMitAufruffehler('Keine Dateien oder Verzeichnisse angegeben.', pAusgabeFile)
+		if lDatenstromBoolean is True:
+			if len(pAufrufparameterNamespace.items) != 1 or lFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL:
+				return Kommandozeilenausfuehrung._brichAbMitAufruffehler('Datenstrom (' + LiSKonstanten.C_DATENSTROM_PFADANGABE + ') nur als einziger Eintrag beim Ver- oder Entschlüsseln zulässig.', pAusgabeFile)
+			if getattr(pAufrufparameterNamespace, 'keyfilepath', None) is None and pAufrufparameterNamespace.keyfd == 0:
+				return Kommandozeilenausfuehrung._brichAbMitAufruffehler('Die Standardeingabe enthält den Datenstrom, das Passwort muss über einen anderen Dateideskriptor übergeben werden.', pAusgabeFile)
+		if getattr(pAufrufparameterNamespace, 'archive', False) is True and lFunktionString != LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL:
+			return Kommandozeilenausfuehrung._brichAbMitAufruffehler('--archive nur beim Verschlüsseln zulässig.', pAusgabeFile)
+		if getattr(pAufrufparameterNamespace, 'select', None) and lFunktionString != LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL:
+			return Kommandozeilenausfuehrung._brichAbMitAufruffehler('--select nur beim Entschlüsseln zulässig.', pAusgabeFile)
+
+		# Schlüssel ermitteln:
+		lPasswortString_LOESCHEN = None
+		lSchluesselartString = LiSKonstanten.C_SCHLUESSELART_PASSWORT_LITERAL
+		lErweiterterPfadZuSchluesseldateiString = ''
+		lPfadZuSchluesseldateiString = getattr(pAufrufparameterNamespace, 'keyfilepath', None)
+		if lFunktionString != LiSKonstanten.C_PROGRAMMFUNKTION_VERNICHTEN_LITERAL:
+			try:
+				if lPfadZuSchluesseldateiString is not None:
+					lSchluesselartString = LiSKonstanten.C_SCHLUESSELART_SCHLUESSELDATEI_LITERAL
+					lErweiterterPfadZuSchluesseldateiString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(os.path.abspath(lPfadZuSchluesseldateiString))
+					lSchluessellaengeInteger = os.path.getsize(lErweiterterPfadZuSchluesseldateiString)
+				elif pAufrufparameterNamespace.keyfd is not None:
+					lPasswortString_LOESCHEN = Kommandozeilenausfuehrung._liesPasswortAusDateideskriptor(pAufrufparameterNamespace.keyfd)
+					lSchluessellaengeInteger = len(lPasswortString_LOESCHEN)
+				else:
+					return Kommandozeilenausfuehrung._brichAbMitAufruffehler('Kein Schlüssel angegeben (--key-fd oder --key-file).', pAusgabeFile)
+			except (OSError, UnicodeDecodeError) as lException:
+				return Kommandozeilenausfuehrung._brichAbMitAufruffehler('Schlüssel nicht lesbar: ' + str(lException), pAusgabeFile)
+			if lSchluessellaengeInteger == 0 or (lFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL
+												  and lSchluessellaengeInteger < LiSKonstanten.C_PASSWORT_SCHLUESSELDATEI_MINLAENGE):
+				return Kommandozeilenausfuehrung._brichAbMitAufruffehler('Passwörter und Schlüsseldateien müssen eine Mindestgröße von '
+																		 + str(LiSKonstanten.C_PASSWORT_SCHLUESSELDATEI_MINLAENGE) + ' Bytes haben.', pAusgabeFile)
+
+		# Einträge wie in der GUI filtern (Verschlüsselung: keine verschlüsselten Dateien, Entschlüsselung: nur verschlüsselte Dateien):
+		lErweitertePfadeList = []
+		for lEintragString in pAufrufparameterNamespace.items:
+			if lEintragString == LiSKonstanten.C_DATENSTROM_PFADANGABE:
+				lErweitertePfadeList.append(lEintragString)
+				continue
+			lErweiterterPfadString = LiSWerkzeuge.Pfadwerkzeuge.ermittleErweitertenPfad(os.path.abspath(lEintragString))
+			if os.path.lexists(lErweiterterPfadString) and not os.path.isdir(lErweiterterPfadString):
+				lVerschluesseltBoolean = str.lower(lErweiterterPfadString).endswith(LiSKonstanten.C_DATEIENDUNG)
+				if (lFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_VERSCHLUESSELN_LITERAL and lVerschluesseltBoolean is True) \
+						or (lFunktionString == LiSKonstanten.C_PROGRAMMFUNKTION_ENTSCHLUESSELN_LITERAL and lVerschluesseltBoolean is False):
+					continue
+			lErweitertePfadeList.append(lErweiterterPfadString)
+
+		lRueckmeldungen = Kommandozeilenrueckmeldungen(lPasswortString_LOESCHEN, LiSKonstanten.C_UEBERSCHREIBENKOMMANDOZEILE_ANTWORTEN[pAufrufparameterNamespace.overwrite], pAusgabeFile)
+		del lPasswortString_LOESCHEN # Einzige verbleibende Referenz hält lRueckmeldungen bis zur Passwortabfrage
+		lFunktionsausfuehrer = LiSFunktionsausfuehrung.Funktionsausfuehrer(LiSWerkzeuge.Pfadwerkzeuge.sortiereInVerzeichnissUndDateien(lErweitertePfadeList),
+																		   lFunktionString, pAufrufparameterNamespace.originals == 'wipeoriginals',
+																		   lSchluesselartString, lErweiterterPfadZuSchluesseldateiString, lRueckmeldungen,
+																		   pVerschluesselungAmOrtBoolean=getattr(pAufrufparameterNamespace, 'inplace', False),
+																		   pArchivBoolean=getattr(pAufrufparameterNamespace, 'archive', False),
+																		   pArchivAuswahlList=getattr(pAufrufparameterNamespace, 'select', None))
+
+		lSignalbehandlung = lambda pSignalInteger, pStackFrame: lFunktionsausfuehrer.stoppeFunktionsprozess()
+		lVorherigeSignalbehandlungenDictionary = {lSignalInteger: signal.signal(lSignalInteger, lSignalbehandlung) for lSignalInteger in (signal.SIGINT, signal.SIGTERM)}
+		try:
+			LiSProfilierung.Profilierung.fuehreAus(lFunktionsausfuehrer.fuehreAus)
+		finally:
+			for lSignalInteger, lVorherigeSignalbehandlung in lVorherigeSignalbehandlungenDictionary.items():
+				signal.signal(lSignalInteger, lVorherigeSignalbehandlung)
+			LiSFunktionsausfuehrung.Schluesseldateihashwerte.entferneAlle() # Ohne GUI endet die Sitzung mit dem Aufruf
+
+		if lFunktionsausfuehrer.istSchwererFehlerAufgetreten() is True:
+			lRueckgabewertInteger = LiSKonstanten.C_KOMMANDOZEILE_RUECKGABEWERT_FEHLER
+		elif lFunktionsausfuehrer.wurdeAbgebrochen() is True:
+			lRueckgabewertInteger = LiSKonstanten.C_KOMMANDOZEILE_RUECKGABEWERT_ABBRUCH
+		elif lFunktionsausfuehrer.sindProblemeAufgetreten() is True:
+			lRueckgabewertInteger = LiSKonstanten.C_KOMMANDOZEILE_RUECKGABEWERT_PROBLEME
+		else:
+			lRueckgabewertInteger = LiSKonstanten.C_KOMMANDOZEILE_RUECKGABEWERT_OK
+		lErgebnisDictionary = {'Rueckgabewert': lRueckgabewertInteger,
+							   'ErzeugteDateien': [LiSWerkzeuge.Pfadwerkzeuge.ermittleReduziertenPfad(lPfadString) for lPfadString in lFunktionsausfuehrer.gibErweitertePfadeAllerErzeugtenDateien()]}
+		if lFunktionsausfuehrer.sZeitmessungDictionary is not None: # Nur bei --trace
+			lErgebnisDictionary['Zeitmessung'] = lFunktionsausfuehrer.sZeitmessungDictionary
+		lRueckmeldungen.gibJSONZeileAus({'Ergebnis': lErgebnisDictionary})
+		return lRueckgabewertInteger
+
+	@staticmethod
+	def starteLogging():
+		"""
+		Startet das Logging (Logdatei bei -f, sonst Standardfehlerausgabe).
+		"""
+		if LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.logging == 'file':
+			try:
+				logging.basicConfig(filename=LiSKonstanten.C_LOG_DATEINAME, filemode='w', level=LiSKonstanten.C_LOGGING_LEVEL)
+				return
+			except OSError:
+				pass
+		logging.basicConfig(level=LiSKonstanten.C_LOGGING_LEVEL)
+
+	## --- Interne Hilfsmethoden
+
+	@staticmethod
+	def _liesPasswortAusDateideskriptor(pDateideskriptorInteger):
+		"""
+		Interne Methode. Liest die erste Zeile (ohne Zeilenumbruch) aus dem Dateideskriptor pDateideskriptorInteger und
+		returniert sie als Passwort. Der Dateideskriptor wird nicht geschlossen.
+
+		:param pDateideskriptorInteger: Dateideskriptor (z.B. 0 für die Standardeingabe)
+		:type pDateideskriptorInteger: Integer
+		:return: Passwort
+		:rtype: String
+		"""
+		with open(pDateideskriptorInteger, 'rb', closefd=False) as lEingabeFile:
+			lZeileBytes = lEingabeFile.readline()
+		return lZeileBytes.rstrip(b'\r\n').decode('utf-8')
+
+	@staticmethod
+	def _brichAbMitAufruffehler(pFehlermeldungString, pAusgabeFile):
+		"""
+		Interne Methode. Gibt pFehlermeldungString als JSON-Zeile aus und returniert C_KOMMANDOZEILE_RUECKGABEWERT_AUFRUFFEHLER.
+		"""
+		pAusgabeFile.write(json.dumps({'Ereignis': 'Fehler', 'Text': pFehlermeldungString}, ensure_ascii=False) + '\n')
+		pAusgabeFile.write(json.dumps({'Ergebnis': {'Rueckgabewert': LiSKonstanten.C_KOMMANDOZEILE_RUECKGABEWERT_AUFRUFFEHLER, 'ErzeugteDateien': []}}, ensure_ascii=False) + '\n')
+		pAusgabeFile.flush()
+		return LiSKonstanten.C_KOMMANDOZEILE_RUECKGABEWERT_AUFRUFFEHLER
+
+# Top-level Skript-Umgebung ("Hauptprogramm"):
+if __name__ == '__main__':
+	LiSKonfiguration.Konfiguration.parseAufrufparameter()
+	if LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.trace is not None: # Zeitmessung je Programmfunktionsdurchlauf (nur in dieser Instanz)
+		LiSZeitmessung.Zeitmessung.aktiviere(os.path.abspath(LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.trace))
+	if LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.profile is not None: # Profilierung je Programmfunktionsdurchlauf (nur in dieser Instanz)
+		LiSProfilierung.Profilierung.aktiviere(LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER.profile)
+	Kommandozeilenausfuehrung.starteLogging()
+	sys.exit(Kommandozeilenausfuehrung.fuehreAus(LiSKonfiguration.Konfiguration.G_AUFRUF_PARAMETER))
@@ -0,0 +1,124 @@
+# LiSCrypt - File encryption program using AES-GCM-256 or ChaCha20+HMAC (the latter for particularly large files)
+# Copyright(C) 2018-2022 QUA-LiS NRW
+#
+# This file is part of LiSCrypt.
+#
+# LiSCrypt is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# LiSCrypt is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with LiSCrypt.  If not, see <https://www.gnu.org/licenses/>.
+
+"""
+Dieses Modul ist der Schnellstart von LiSCrypt. Läuft bereits eine Master-Instanz, werden die Kommandozeilenargumente
+ausschließlich mit Modulen der Standardbibliothek (ohne GUI-, Kryptografie- und Konfigurationsmodule) an diese
+übergeben. Andernfalls (oder wenn die Argumente lokal ausgewertet werden müssen, z.B. -h oder -i) wird LiSCrypt
+vollständig gestartet (Steuerung.LiSCrypt). Mit --headless oder - (Datenstrom) wird die Programmfunktion ohne GUI und
+ohne PyQt ausgeführt (Steuerung.LiSKommandozeile).
+
+Aufruf: python -m Steuerung.LiSStarter [Aufrufparameter wie Steuerung.LiSCrypt]
+"""
+
+from Modell import LiSAusnahmen, LiSBasiskonstanten
+from Modell.LiSUebergabe import Nachrichtenprotokoll
+
+import os
+import runpy
+import sys
+
+class Schnellstart:
+	"""
+	Stellt statische Methoden zur Übergabe von Kommandozeilenargumenten an eine laufende Master-Instanz zur Verfügung.
+	"""
+	C_WEITERGEBBARE_OPTIONEN = {'-f', '--logfile', '-e', '--encrypt', '-d', '--decrypt'} | \
+							   ({'-w', '--wipe', '-o', '--originals', '-l', '--leave', '-p', '--password', '-k', '--keyfile', '-c', '--choose'}
+								if LiSBasiskonstanten.C_IQB_VERSION is False else set())
+	"""Optionen, die von der Master-Instanz ausgewertet werden können (alle übrigen erfordern einen vollständigen Start)"""
+
+	def __init__(self):
+		if type(self) is Schnellstart:
+			raise LiSAusnahmen.QAbstractClassError('Schnellstart kann nicht instanziiert werden.')
+
+	@staticmethod
+	def ermittleWeitergebbareArgumente(pArgumenteList):
+		"""
+		Returniert pArgumenteList mit absoluten Pfadangaben (die Master-Instanz hat ein anderes Arbeitsverzeichnis) oder
+		None, falls die Argumente nicht an die Master-Instanz übergeben werden können.
+
+		:param pArgumenteList: Kommandozeilenargumente (ohne Programmname)
+		:type pArgumenteList: Liste von Strings
+		:return: Weitergebbare Argumente oder None
+		:rtype: Liste von Strings
+		"""
+		lArgumenteList = []
+		lNurEintraegeBoolean = False
+		for lArgumentString in pArgumenteList:
+			if lNurEintraegeBoolean is False and lArgumentString == '--':
+				lNurEintraegeBoolean = True
+				lArgumenteList.append(lArgumentString)
+			elif lNurEintraegeBoolean is False and lArgumentString.startswith('-'):
+				if lArgumentString not in Schnellstart.C_WEITERGEBBARE_OPTIONEN:
+					return None
+				lArgumenteList.append(lArgumentString)
+			else:
+				lArgumenteList.append(os.path.abspath(lArgumentString))
+		return lArgumenteList
+
+	@staticmethod
+	def istOhneGUI(pArgumenteList):
+		"""
+		Returniert, ob pArgumenteList die Ausführung ohne GUI verlangt (--headless oder Datenstrom -) (true: ja, false: nein).
+
+		:param pArgumenteList: Kommandozeilenargumente (ohne Programmname)
+		:type pArgumenteList: Liste von Strings
+		:return: Ergebnis
+		:rtype: Boolean
+		"""
+		lOptionenList = pArgumenteList[:pArgumenteList.index('--')] if '--' in pArgumenteList else pArgumenteList
+		return '--headless' in lOptionenList or LiSBasiskonstanten.C_DATENSTROM_PFADANGABE in pArgumenteList
+
+	@staticmethod
+	def uebergibArgumenteAnMaster(pArgumenteList):
+		"""
+		Übergibt pArgumenteList an eine laufende Master-Instanz.
+
+		:param pArgumenteList: Kommandozeilenargumente (ohne Programmname)
+		:type pArgumenteList: Liste von Strings
+		:return: True, wenn die Master-Instanz die Argumente angenommen hat, sonst False
+		:rtype: Boolean
+		"""
+		if Nachrichtenprotokoll.nutztUnixSocket() is False: # Port der Master-Instanz nur über die Konfigurationsdatei ermittelbar
+			return False
+		lArgumenteList = Schnellstart.ermittleWeitergebbareArgumente(pArgumenteList)
+		if lArgumenteList is None:
+			return False
+		try:
+			lClientSocket = Nachrichtenprotokoll.erzeugeClientSocket()
+		except OSError: # Keine Master-Instanz
+			return False
+		lIstAktivFunktion = lambda: True
+		try:
+			with lClientSocket:
+				if Nachrichtenprotokoll.empfangeNachricht(lClientSocket, lIstAktivFunktion) != b'+LISCRYPT_SERVER':
+					return False
+				Nachrichtenprotokoll.sendeNachricht(lClientSocket, b'+LISCRYPT_CLIENT')
+				if Nachrichtenprotokoll.empfangeNachricht(lClientSocket, lIstAktivFunktion) != b'+LIST':
+					return False
+				Nachrichtenprotokoll.sendeNachricht(lClientSocket, Nachrichtenprotokoll.kodiereArgumente(lArgumenteList))
+				return Nachrichtenprotokoll.empfangeNachricht(lClientSocket, lIstAktivFunktion) == b'+BYE'
+		except OSError:
+			return False
+
+# Top-level Skript-Umgebung ("Hauptprogramm"):
+if __name__ == '__main__':
+	if Schnellstart.istOhneGUI(sys.argv[1:]) is True:
+		runpy.run_module('Steuerung.LiSKommandozeile', run_name='__main__', alter_sys=True)
+	elif Schnellstart.uebergibArgumenteAnMaster(sys.argv[1:]) is False:
+		runpy.run_module('Steuerung.LiSCrypt', run_name='__main__', alter_sys=True)